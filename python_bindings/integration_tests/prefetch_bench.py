@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# vim: tabstop=8 expandtab shiftwidth=4 softtabstop=4
+
+# Measures the effect of the HNSW query-time parameters prefetchDepth and prefetchLines
+# on the search throughput (QPS) of the optimized index for data of different dimensionality.
+
+import argparse
+import time
+import numpy as np
+import nmslib
+
+
+def bench_prefetch(dim, data_qty, query_qty, space, depths, lines, ef, thread_qty):
+    # clustered data, so that the graph isn't a random expander
+    centers = np.random.randn(data_qty // 100 + 1, dim) * 3
+    dataset = (centers[np.random.randint(0, len(centers), data_qty)] +
+               np.random.randn(data_qty, dim)).astype(np.float32)
+    queryset = (centers[np.random.randint(0, len(centers), query_qty)] +
+                np.random.randn(query_qty, dim)).astype(np.float32)
+
+    index = nmslib.init(method='hnsw', space=space)
+    index.addDataPointBatch(dataset)
+    t = time.time()
+    index.createIndex({'M': 16, 'efConstruction': 100})
+    print('dim=%d: building the index of %d points took %.2f seconds' % (dim, data_qty, time.time() - t))
+
+    baseline = None
+    for depth in depths:
+        for line_qty in lines:
+            index.setQueryTimeParams({'efSearch': ef, 'prefetchDepth': depth, 'prefetchLines': line_qty})
+            # the first run warms up the caches
+            index.knnQueryBatch(queryset, k=10, num_threads=thread_qty)
+            t = time.time()
+            index.knnQueryBatch(queryset, k=10, num_threads=thread_qty)
+            qps = query_qty / (time.time() - t)
+            if baseline is None:
+                baseline = qps
+            print('dim=%d prefetchDepth=%d prefetchLines=%d: %.0f QPS (%.2fx)' %
+                  (dim, depth, line_qty, qps, qps / baseline))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of prefetching in the HNSW search')
+    parser.add_argument('--dims', type=int, nargs='+', default=[100, 256, 960])
+    parser.add_argument('--data_qty', type=int, default=200000)
+    parser.add_argument('--query_qty', type=int, default=2000)
+    parser.add_argument('--space', default='l2')
+    parser.add_argument('--depths', type=int, nargs='+', default=[0, 1, 2, 4, 8])
+    parser.add_argument('--lines', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--ef', type=int, default=100)
+    parser.add_argument('--thread_qty', type=int, default=1)
+    args = parser.parse_args()
+
+    np.random.seed(17)
+    for dim in args.dims:
+        bench_prefetch(dim, args.data_qty, args.query_qty, args.space,
+                       args.depths, args.lines, args.ef, args.thread_qty)
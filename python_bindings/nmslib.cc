@@ -18,7 +18,13 @@
 #include <pybind11/stl.h>
 
 #include <algorithm>
+#include <atomic>
+#include <functional>
+#include <iterator>
+#include <limits>
 #include <memory>
+#include <mutex>
+#include <shared_mutex>
 #include <sstream>
 #include <stdexcept>
 #include <string>
@@ -34,7 +40,10 @@
 #include "spacefactory.h"
 #include "space/space_sparse_vector.h"
 #include "space/space_l2sqr_sift.h"
+#include "space/space_vector_lowprec.h"
+#include "simd_dispatch.h"
 #include "thread_pool.h"
+#include "ztimer.h"
 
 namespace py = pybind11;
 
@@ -53,14 +62,24 @@ enum DataType {
   DATATYPE_DENSE_UINT8_VECTOR,
   DATATYPE_SPARSE_VECTOR,
   DATATYPE_OBJECT_AS_STRING,
+  DATATYPE_DENSE_FLOAT16_VECTOR,
+  DATATYPE_DENSE_INT8_VECTOR,
 };
 
+// Arenas holding objects created in bulk by addDataPointBatch/knnQueryBatch
+typedef std::vector<std::unique_ptr<ObjectArena>> ObjectArenaList;
+
+// Batches smaller than this are converted to objects in a single thread
+const size_t MIN_PARALLEL_CONVERSION_QTY = 4096;
+
 // forward references
 template <typename dist_t> void exportIndex(py::module * m);
 template <typename dist_t> std::string distName();
 AnyParams loadParams(py::object o);
 void exportLegacyAPI(py::module * m);
 void freeAndClearObjectVector(ObjectVector& data);
+void freeAndClearObjectVector(ObjectVector& data, ObjectArenaList& arenas);
+py::array toContiguousArray(py::object input, const char * dtype);
 
 // Wrap a space/objectvector/index together for ease of use
 template <typename dist_t>
@@ -74,10 +93,20 @@ struct IndexWrapper {
         space(SpaceFactoryRegistry<dist_t>::Instance().CreateSpace(space_type,
                                                                    loadParams(space_params))) {
     auto vectSpacePtr = dynamic_cast<VectorSpace<dist_t>*>(space.get());
-    if (data_type == DATATYPE_DENSE_VECTOR && vectSpacePtr == nullptr) {
+    bool isFloat16Space = dynamic_cast<SpaceLowPrecVector<Float16>*>(space.get()) != nullptr;
+    bool isInt8Space = dynamic_cast<SpaceLowPrecVector<int8_t>*>(space.get()) != nullptr;
+    if (data_type == DATATYPE_DENSE_VECTOR && (vectSpacePtr == nullptr || isFloat16Space || isInt8Space)) {
       throw std::invalid_argument("The space type " + space_type +
                                   " is not compatible with the type DENSE_VECTOR, only dense vector spaces are allowed!");
     }
+    if (data_type == DATATYPE_DENSE_FLOAT16_VECTOR && !isFloat16Space) {
+      throw std::invalid_argument("The space type " + space_type +
+                                  " is not compatible with the type DENSE_FLOAT16_VECTOR!");
+    }
+    if (data_type == DATATYPE_DENSE_INT8_VECTOR && !isInt8Space) {
+      throw std::invalid_argument("The space type " + space_type +
+                                  " is not compatible with the type DENSE_INT8_VECTOR!");
+    }
     auto vectSiftPtr = dynamic_cast<SpaceL2SqrSift*>(space.get());
     if (data_type == DATATYPE_DENSE_UINT8_VECTOR && vectSiftPtr == nullptr) {
       throw std::invalid_argument("The space type " + space_type +
@@ -85,26 +114,43 @@ struct IndexWrapper {
     }
   }
 
-  void createIndex(py::object index_params, bool print_progress = false) {
+  void createIndex(py::object index_params, bool print_progress = false, bool release_data = false) {
+    checkDataNotReleased();
     AnyParams params = loadParams(index_params);
 
     py::gil_scoped_release l;
+    WriteLock lock(index_mutex);
     auto factory = MethodFactoryRegistry<dist_t>::Instance();
     index.reset(factory.CreateMethod(print_progress, method, space_type, *space, data));
     index->CreateIndex(params);
+    if (release_data) {
+      if (index->ReleaseData()) {
+        // from now on, data points are obtained from the index
+        freeAndClearObjectVector(data, data_arenas);
+        data_released = true;
+      } else {
+        LOG(LIB_WARNING) << "The index doesn't keep a copy of the data, the data points aren't released";
+      }
+    }
   }
 
-  void loadIndex(const std::string & filename, bool load_data = false) {
+  void loadIndex(const std::string & filename, bool load_data = false, bool mmap = false) {
     py::gil_scoped_release l;
+    WriteLock lock(index_mutex);
     auto factory = MethodFactoryRegistry<dist_t>::Instance();
     bool print_progress=false; // We are not going to creat the index anyways, only to load an existing one
     index.reset(factory.CreateMethod(print_progress, method, space_type, *space, data));
+    data_released = false;
     if (load_data) {
       vector<string> dummy;
-      freeAndClearObjectVector(data);
+      freeAndClearObjectVector(data, data_arenas);
       space->ReadObjectVectorFromBinData(data, dummy, filename + data_suff);
     }
-    index->LoadIndex(filename);
+    if (mmap) {
+      index->LoadIndexMapped(filename);
+    } else {
+      index->LoadIndex(filename);
+    }
 
     // querying reloaded indices don't seem to work correctly (at least hnsw ones) until
     // SetQueryTimeParams is called
@@ -116,69 +162,244 @@ struct IndexWrapper {
       throw std::invalid_argument("Must call createIndex or loadIndex before this method");
     }
     py::gil_scoped_release l;
+    ReadLock lock(index_mutex);
     if (save_data) {
       vector<string> dummy;
-      space->WriteObjectVectorBinData(data, dummy, filename + data_suff);
+      if (data_released) {
+        // the copies stored by the index are saved instead
+        ObjectVector stored(index->GetSize());
+        for (size_t pos = 0; pos < stored.size(); ++pos) {
+          stored[pos] = index->GetStoredObject(pos);
+        }
+        space->WriteObjectVectorBinData(stored, dummy, filename + data_suff);
+      } else {
+        space->WriteObjectVectorBinData(data, dummy, filename + data_suff);
+      }
     }
     index->SaveIndex(filename);
   }
 
-  py::object knnQuery(py::object input, size_t k) {
+  py::object knnQuery(py::object input, size_t k, bool return_stats = false,
+                      py::object query_params = py::none(), py::object filter = py::none()) {
     if (!index) {
       throw std::invalid_argument("Must call createIndex or loadIndex before this method");
     }
 
+    QueryTimeParams params = QueryTimeParams::FromAnyParams(loadParams(query_params));
+    py::array filter_data;
+    std::unique_ptr<QueryFilter> pFilter(loadFilter(filter, filter_data));
     std::unique_ptr<const Object> query(readObject(input));
     KNNQuery<dist_t> knn(*space, query.get(), k);
+    QueryStats stats;
     {
       py::gil_scoped_release l;
-      index->Search(&knn, -1);
+      ReadLock lock(index_mutex);
+      search(&knn, return_stats ? &stats : nullptr, params.empty() ? nullptr : &params,
+             pFilter.get());
     }
     std::unique_ptr<KNNQueue<dist_t>> res(knn.Result()->Clone());
-    return convertResult(res.get());
+    py::tuple ret = convertResult(res.get());
+    if (return_stats) {
+      return py::make_tuple(ret[0], ret[1], convertStats(stats));
+    }
+    return ret;
   }
 
-  py::object knnQueryBatch(py::object input, size_t k, int num_threads) {
+  py::object knnQueryBatch(py::object input, size_t k, int num_threads, bool dense = false,
+                           bool return_stats = false, py::object query_params = py::none(),
+                           py::object filter = py::none()) {
     if (!index) {
       throw std::invalid_argument("Must call createIndex or loadIndex before this method");
     }
 
+    QueryTimeParams params = QueryTimeParams::FromAnyParams(loadParams(query_params));
+    const QueryTimeParams * pParams = params.empty() ? nullptr : &params;
+    py::array filter_data;
+    std::unique_ptr<QueryFilter> pFilter(loadFilter(filter, filter_data));
     ObjectVector queries;
-    readObjectVector(input, &queries);
+    ObjectArenaList query_arenas;
+    readObjectVector(input, &queries, &query_arenas);
+    std::vector<QueryStats> stats(return_stats ? queries.size() : 0);
+    if (dense) {
+      py::tuple ret = knnQueryBatchDense(queries, query_arenas, k, num_threads, stats, pParams,
+                                         pFilter.get());
+      if (return_stats) {
+        return py::make_tuple(ret[0], ret[1], convertStats(stats));
+      }
+      return ret;
+    }
     std::vector<std::unique_ptr<KNNQueue<dist_t>>> results(queries.size());
     {
       py::gil_scoped_release l;
+      ReadLock lock(index_mutex);
 
       ParallelFor(0, queries.size(), num_threads, [&](size_t query_index, size_t threadId) {
         KNNQuery<dist_t> knn(*space, queries[query_index], k);
-        index->Search(&knn, -1);
+        search(&knn, return_stats ? &stats[query_index] : nullptr, pParams, pFilter.get());
         results[query_index].reset(knn.Result()->Clone());
       });
 
       // TODO(@benfred): some sort of RAII auto-destroy for this
-      freeAndClearObjectVector(queries);
+      freeAndClearObjectVector(queries, query_arenas);
     }
 
     py::list ret;
     for (auto & result : results) {
       ret.append(convertResult(result.get()));
     }
+    if (return_stats) {
+      return py::make_tuple(ret, convertStats(stats));
+    }
     return ret;
   }
 
-  py::object convertResult(KNNQueue<dist_t> * res) {
-    // Create numpy arrays for the output
-    size_t size = res->Size();
-    py::array_t<int> ids(size);
-    py::array_t<dist_t> distances(size);
+  // returns a pair of (n_queries, k) matrices: rows of queries with fewer than k
+  // neighbours are padded with -1 ids and infinite (or maximum) distances.
+  // If stats isn't empty, statistics are collected for every query.
+  py::tuple knnQueryBatchDense(ObjectVector & queries, ObjectArenaList & query_arenas,
+                               size_t k, int num_threads, std::vector<QueryStats> & stats,
+                               const QueryTimeParams * params, const QueryFilter * filter) {
+    size_t qty = queries.size();
+    py::array_t<int> ids({qty, k});
+    py::array_t<dist_t> distances({qty, k});
+    int * ids_data = ids.mutable_data();
+    dist_t * distances_data = distances.mutable_data();
+    {
+      py::gil_scoped_release l;
+      ReadLock lock(index_mutex);
 
+      // worker threads write their results straight into the output rows
+      ParallelFor(0, qty, num_threads, [&](size_t query_index, size_t threadId) {
+        KNNQuery<dist_t> knn(*space, queries[query_index], k);
+        search(&knn, stats.empty() ? nullptr : &stats[query_index], params, filter);
+        std::unique_ptr<KNNQueue<dist_t>> res(knn.Result()->Clone());
+
+        int * row_ids = ids_data + query_index * k;
+        dist_t * row_distances = distances_data + query_index * k;
+        size_t size = writeResult(res.get(), row_ids, row_distances);
+        std::fill(row_ids + size, row_ids + k, -1);
+        std::fill(row_distances + size, row_distances + k,
+                  std::numeric_limits<dist_t>::has_infinity ? std::numeric_limits<dist_t>::infinity()
+                                                           : std::numeric_limits<dist_t>::max());
+      });
+
+      freeAndClearObjectVector(queries, query_arenas);
+    }
+    return py::make_tuple(ids, distances);
+  }
+
+  // moves the content of the queue to the output arrays (closest first),
+  // returns the number of neighbours written
+  size_t writeResult(KNNQueue<dist_t> * res, int * ids, dist_t * distances) {
+    size_t size = res->Size(), ret = size;
     while (!res->Empty() && size > 0) {
       // iterating here in reversed order, undo that
       size -= 1;
-      ids.mutable_at(size) = res->TopObject()->id();
-      distances.mutable_at(size) = res->TopDistance();
+      ids[size] = res->TopObject()->id();
+      distances[size] = res->TopDistance();
       res->Pop();
     }
+    return ret;
+  }
+
+  // searches the index, collecting statistics if stats isn't null,
+  // overriding index-wide query-time parameters if params isn't null and
+  // returning only the objects accepted by the filter if filter isn't null.
+  // Can be called without holding the GIL.
+  void search(KNNQuery<dist_t> * knn, QueryStats * stats, const QueryTimeParams * params,
+              const QueryFilter * filter = nullptr) {
+    knn->SetQueryParams(params);
+    knn->SetFilter(filter);
+    if (!stats) {
+      index->Search(knn, -1);
+      return;
+    }
+    knn->SetStats(stats);
+    WallClockTimer timer;
+    timer.reset();
+    index->Search(knn, -1);
+    stats->search_time = timer.split();
+    stats->distance_computations = knn->DistanceComputations();
+    knn->SetStats(nullptr);
+
+    uint64_t hops = 0;
+    for (uint64_t qty : stats->hops_per_level) hops += qty;
+    total_stats.query_qty += 1;
+    total_stats.distance_computations += stats->distance_computations;
+    total_stats.hops += hops;
+    total_stats.visited += stats->visited_qty;
+    total_stats.search_time += stats->search_time;
+  }
+
+  py::dict convertStats(const QueryStats & stats) {
+    py::dict ret;
+    ret["distance_computations"] = stats.distance_computations;
+    ret["hops_per_level"] = stats.hops_per_level;
+    ret["visited"] = stats.visited_qty;
+    ret["search_time_us"] = stats.search_time;
+    return ret;
+  }
+
+  py::list convertStats(const std::vector<QueryStats> & stats) {
+    py::list ret;
+    for (const auto & elem : stats) {
+      ret.append(convertStats(elem));
+    }
+    return ret;
+  }
+
+  py::dict getSearchStats() {
+    py::dict ret;
+    ret["query_qty"] = total_stats.query_qty.load();
+    ret["distance_computations"] = total_stats.distance_computations.load();
+    ret["hops"] = total_stats.hops.load();
+    ret["visited"] = total_stats.visited.load();
+    ret["search_time_us"] = total_stats.search_time.load();
+    ret["visited_list_memory"] = index ? index->GetVisitedListMemory() : 0;
+    return ret;
+  }
+
+  void resetSearchStats() {
+    total_stats.query_qty = 0;
+    total_stats.distance_computations = 0;
+    total_stats.hops = 0;
+    total_stats.visited = 0;
+    total_stats.search_time = 0;
+  }
+
+  // converts either a boolean mask indexed by ids or a sorted array of ids into
+  // a filter (nullptr for None). The filter refers to the memory of the array
+  // stored in data, which must be kept alive while the filter is in use.
+  QueryFilter * loadFilter(py::object input, py::array & data) {
+    if (input.is_none()) {
+      return nullptr;
+    }
+    py::array arr = py::array::ensure(input);
+    if (!arr || arr.ndim() != 1) {
+      throw std::invalid_argument("filter must be a 1d array of booleans or ids");
+    }
+    if (arr.dtype().kind() == 'b') {
+      py::array_t<bool, py::array::c_style | py::array::forcecast> mask(arr);
+      data = mask;
+      return new QueryFilter(QueryFilter::FromMask(mask.data(), mask.size()));
+    }
+    if (arr.dtype().kind() != 'i' && arr.dtype().kind() != 'u') {
+      throw std::invalid_argument("filter must be a 1d array of booleans or ids");
+    }
+    py::array_t<IdType, py::array::c_style | py::array::forcecast> ids(arr);
+    if (!std::is_sorted(ids.data(), ids.data() + ids.size())) {
+      throw std::invalid_argument("filter ids must be sorted in ascending order");
+    }
+    data = ids;
+    return new QueryFilter(QueryFilter::FromSortedIds(ids.data(), ids.size()));
+  }
+
+  py::tuple convertResult(KNNQueue<dist_t> * res) {
+    // Create numpy arrays for the output
+    size_t size = res->Size();
+    py::array_t<int> ids(size);
+    py::array_t<dist_t> distances(size);
+    writeResult(res, ids.mutable_data(), distances.mutable_data());
     return py::make_tuple(ids, distances);
   }
 
@@ -186,11 +407,12 @@ struct IndexWrapper {
     switch (data_type) {
       case DATATYPE_DENSE_VECTOR: {
         py::array_t<dist_t, py::array::c_style | py::array::forcecast> temp(input);
-        std::vector<dist_t> tempVect(temp.data(0), temp.data(0) + temp.size());
         auto vectSpacePtr = reinterpret_cast<VectorSpace<dist_t>*>(space.get());
-        return vectSpacePtr->CreateObjFromVect(id, -1, tempVect);
-        // This way it will not always work properly
-        //return new Object(id, -1, temp.size() * sizeof(dist_t), temp.data(0));
+        size_t elemQty = temp.size();
+        // The object is filled out directly from the numpy buffer (no temporary copy)
+        std::unique_ptr<Object> res(new Object(id, -1, vectSpacePtr->GetObjDataLength(elemQty), NULL));
+        vectSpacePtr->CreateObjDataFromVect(temp.data(0), elemQty, res->data());
+        return res.release();
       }
       case DATATYPE_DENSE_UINT8_VECTOR: {
         py::array_t<uint8_t> temp(input);
@@ -198,6 +420,10 @@ struct IndexWrapper {
         auto vectSiftPtr = reinterpret_cast<SpaceL2SqrSift*>(space.get());
         return vectSiftPtr->CreateObjFromUint8Vect(id, -1, tempVect);
       }
+      case DATATYPE_DENSE_FLOAT16_VECTOR:
+        return readLowPrecObject<Float16>(input, id, "float16");
+      case DATATYPE_DENSE_INT8_VECTOR:
+        return readLowPrecObject<int8_t>(input, id, "int8");
       case DATATYPE_OBJECT_AS_STRING: {
         std::string temp = py::cast<std::string>(input);
         return space->CreateObjFromStr(id, -1, temp.c_str(), NULL).release();
@@ -220,10 +446,67 @@ struct IndexWrapper {
     }
   }
 
+  // creates objects for all rows of a dense C-contiguous matrix in one contiguous arena
+  // (stored in arenas). Rows are converted in parallel with the GIL released:
+  // fill(row_data, obj_data) must be thread-safe. Without ids, rows get ids from first_id on.
+  template <typename elem_t, typename FillFunc>
+  size_t readDenseMatrix(const elem_t * items, size_t rows, size_t features, size_t datalength,
+                         const std::vector<int> & ids, int first_id, ObjectVector * output,
+                         ObjectArenaList * arenas, FillFunc fill) {
+    if (!ids.empty() && ids.size() < rows) {
+      throw std::invalid_argument("The number of ids is smaller than the number of data points");
+    }
+    std::unique_ptr<ObjectArena> arena(new ObjectArena(rows, datalength));
+    {
+      py::gil_scoped_release l;
+      size_t num_threads = rows < MIN_PARALLEL_CONVERSION_QTY ? 1 : 0;
+      ParallelFor(0, rows, num_threads, [&](size_t row, size_t threadId) {
+        int id = ids.size() ? ids[row] : first_id + row;
+        fill(items + row * features, arena->InitObject(row, id, -1));
+      });
+    }
+    output->reserve(output->size() + rows);
+    for (size_t row = 0; row < rows; ++row) {
+      output->push_back(arena->GetObject(row));
+    }
+    arenas->push_back(std::move(arena));
+    return rows;
+  }
+
+  // Low-precision elements are copied as they are (numpy converts other types)
+  template <typename ElemType>
+  const Object * readLowPrecObject(py::object input, int id, const char * dtype) {
+    py::array temp = toContiguousArray(input, dtype);
+    auto lowPrecSpacePtr = reinterpret_cast<SpaceLowPrecVector<ElemType>*>(space.get());
+    size_t elemQty = temp.size();
+    std::unique_ptr<Object> res(new Object(id, -1, lowPrecSpacePtr->GetObjDataLength(elemQty), NULL));
+    lowPrecSpacePtr->CreateObjDataFromElems(static_cast<const ElemType*>(temp.data()), elemQty, res->data());
+    return res.release();
+  }
+
+  template <typename ElemType>
+  size_t readLowPrecMatrix(py::object input, const char * dtype, const std::vector<int> & ids,
+                           int first_id, ObjectVector * output, ObjectArenaList * arenas) {
+    py::array items = toContiguousArray(input, dtype);
+    auto buffer = items.request();
+    if (buffer.ndim != 2) throw std::runtime_error("data must be a 2d array");
+
+    size_t rows = buffer.shape[0], features = buffer.shape[1];
+    auto lowPrecSpacePtr = reinterpret_cast<SpaceLowPrecVector<ElemType>*>(space.get());
+    return readDenseMatrix(static_cast<const ElemType*>(buffer.ptr), rows, features,
+                           lowPrecSpacePtr->GetObjDataLength(features), ids, first_id, output,
+                           arenas,
+                           [&](const ElemType * vect, char * objData) {
+                             lowPrecSpacePtr->CreateObjDataFromElems(vect, features, objData);
+                           });
+  }
+
   // reads multiple items from a python object and inserts onto a similarity::ObjectVector
-  // returns the number of elements inserted
-  size_t readObjectVector(py::object input, ObjectVector * output,
-                          py::object ids_ = py::none()) {
+  // returns the number of elements inserted. Dense matrices are stored in arenas, which
+  // must outlive the objects in the output vector. If ids_ is None, items get ids
+  // from first_id on.
+  size_t readObjectVector(py::object input, ObjectVector * output, ObjectArenaList * arenas,
+                          py::object ids_ = py::none(), int first_id = 0) {
     std::vector<int> ids;
     if (!ids_.is_none()) {
       ids = py::cast<std::vector<int>>(ids_);
@@ -232,7 +515,7 @@ struct IndexWrapper {
     if (py::isinstance<py::list>(input)) {
       py::list items(input);
       for (size_t i = 0; i < items.size(); ++i) {
-        output->push_back(readObject(items[i], ids.size() ? ids.at(i) : i));
+        output->push_back(readObject(items[i], ids.size() ? ids.at(i) : first_id + i));
       }
       return items.size();
 
@@ -243,17 +526,13 @@ struct IndexWrapper {
       if (buffer.ndim != 2) throw std::runtime_error("data must be a 2d array");
 
       size_t rows = buffer.shape[0], features = buffer.shape[1];
-      std::vector<dist_t> tempVect(features);
       auto vectSpacePtr = reinterpret_cast<VectorSpace<dist_t>*>(space.get());
-      for (size_t row = 0; row < rows; ++row) {
-        int id = ids.size() ? ids.at(row) : row;
-        const dist_t* elemVecStart = items.data(row);
-        std::copy(elemVecStart, elemVecStart + features, tempVect.begin());
-        output->push_back(vectSpacePtr->CreateObjFromVect(id, -1, tempVect));
-        //this way it won't always work properly
-        //output->push_back(new Object(id, -1, features * sizeof(dist_t), items.data(row)));
-      }
-      return rows;
+      return readDenseMatrix(static_cast<const dist_t*>(buffer.ptr), rows, features,
+                             vectSpacePtr->GetObjDataLength(features), ids, first_id, output,
+                             arenas,
+                             [&](const dist_t * vect, char * objData) {
+                               vectSpacePtr->CreateObjDataFromVect(vect, features, objData);
+                             });
     } else if (data_type == DATATYPE_DENSE_UINT8_VECTOR) {
       // allow numpy arrays to be returned here too
       py::array_t<uint8_t, py::array::c_style | py::array::forcecast> items(input);
@@ -261,15 +540,22 @@ struct IndexWrapper {
       if (buffer.ndim != 2) throw std::runtime_error("data must be a 2d array");
 
       size_t rows = buffer.shape[0], features = buffer.shape[1];
-      std::vector<uint8_t> tempVect(features);
-      auto vectSiftPtr = reinterpret_cast<SpaceL2SqrSift*>(space.get());
-      for (size_t row = 0; row < rows; ++row) {
-        int id = ids.size() ? ids.at(row) : row;
-        const uint8_t* elemVecStart = items.data(row);
-        std::copy(elemVecStart, elemVecStart + features, tempVect.begin());
-        output->push_back(vectSiftPtr->CreateObjFromUint8Vect(id, -1, tempVect));
+      if (features != SIFT_DIM) {
+        throw std::invalid_argument("DENSE_UINT8_VECTOR data must have " +
+                                    std::to_string(SIFT_DIM) + " columns");
       }
-      return rows;
+      auto vectSiftPtr = reinterpret_cast<SpaceL2SqrSift*>(space.get());
+      return readDenseMatrix(static_cast<const uint8_t*>(buffer.ptr), rows, features,
+                             vectSiftPtr->GetObjDataLength(), ids, first_id, output, arenas,
+                             [&](const uint8_t * vect, char * objData) {
+                               vectSiftPtr->CreateObjDataFromUint8Vect(vect, objData);
+                             });
+
+    } else if (data_type == DATATYPE_DENSE_FLOAT16_VECTOR) {
+      return readLowPrecMatrix<Float16>(input, "float16", ids, first_id, output, arenas);
+
+    } else if (data_type == DATATYPE_DENSE_INT8_VECTOR) {
+      return readLowPrecMatrix<int8_t>(input, "int8", ids, first_id, output, arenas);
 
     } else if (data_type == DATATYPE_SPARSE_VECTOR) {
       // the attr calls will fail with an attribute error, but this fixes the legacy
@@ -295,7 +581,7 @@ struct IndexWrapper {
         }
         std::sort(sparse_items.begin(), sparse_items.end());
 
-        int id = ids.size() ? ids.at(rowid) : rowid;
+        int id = ids.size() ? ids.at(rowid) : first_id + rowid;
         output->push_back(sparse_space->CreateObjFromVect(id, -1, sparse_items));
       }
       return indptr.size() - 1;
@@ -316,6 +602,19 @@ struct IndexWrapper {
         }
         return ret;
       }
+      case DATATYPE_DENSE_FLOAT16_VECTOR:
+      case DATATYPE_DENSE_INT8_VECTOR: {
+        // Elements are converted to float
+        auto vectSpacePtr = reinterpret_cast<VectorSpace<dist_t>*>(space.get());
+        size_t elemQty = vectSpacePtr->GetElemQty(obj);
+        std::vector<dist_t> values(elemQty);
+        vectSpacePtr->CreateDenseVectFromObj(obj, values.data(), elemQty);
+        py::list ret;
+        for (size_t i = 0; i < elemQty; ++i) {
+          ret.append(py::cast(values[i]));
+        }
+        return ret;
+      }
       case DATATYPE_OBJECT_AS_STRING: {
         return py::cast(space->CreateStrFromObj(obj, ""));
       }
@@ -334,27 +633,103 @@ struct IndexWrapper {
   }
 
   size_t addDataPoint(int id, py::object input) {
-    data.push_back(readObject(input, id));
-    return data.size() - 1;
+    checkDataNotReleased();
+    ObjectVector batch(1, readObject(input, id));
+    ObjectArenaList batch_arenas;
+    return appendData(batch, batch_arenas);
   }
 
   size_t addDataPointBatch(py::object input, py::object ids = py::none()) {
-    return readObjectVector(input, &data, ids);
+    checkDataNotReleased();
+    // the points are read before taking the lock, so that searches aren't blocked meanwhile
+    ObjectVector batch;
+    ObjectArenaList batch_arenas;
+    // ids of points added to a created index continue after the existing ones
+    int first_id = 0;
+    if (ids.is_none()) {
+      py::gil_scoped_release l;
+      ReadLock lock(index_mutex);
+      if (index) first_id = data.size();
+    }
+    size_t ret;
+    try {
+      ret = readObjectVector(input, &batch, &batch_arenas, ids, first_id);
+    } catch (...) {
+      freeAndClearObjectVector(batch, batch_arenas);
+      throw;
+    }
+    appendData(batch, batch_arenas);
+    return ret;
+  }
+
+  // inserts data points into the index, if it was already created (or loaded) and it
+  // supports this, and then appends them to the data points. If the insertion fails,
+  // the data points are freed instead. Returns the position of the first appended point.
+  size_t appendData(ObjectVector & batch, ObjectArenaList & batch_arenas) {
+    py::gil_scoped_release l;
+    WriteLock lock(index_mutex);
+    if (index && index->SupportsAddBatch()) {
+      try {
+        index->AddBatch(batch, false);
+      } catch (...) {
+        freeAndClearObjectVector(batch, batch_arenas);
+        throw;
+      }
+    }
+    size_t start = data.size();
+    data.insert(data.end(), batch.begin(), batch.end());
+    std::move(batch_arenas.begin(), batch_arenas.end(), std::back_inserter(data_arenas));
+    return start;
+  }
+
+  void deleteDataPointBatch(py::object ids, bool repair = false) {
+    if (!index) {
+      throw std::invalid_argument("Must call createIndex or loadIndex before this method");
+    }
+    py::array_t<IdType, py::array::c_style | py::array::forcecast> items(ids);
+    std::vector<IdType> batch(items.data(), items.data() + items.size());
+    py::gil_scoped_release l;
+    WriteLock lock(index_mutex);
+    index->DeleteBatch(batch, repair ? 1 : 0);
   }
 
-  inline size_t size() const { return data.size(); }
+  void repairIndex() {
+    deleteDataPointBatch(py::array_t<IdType>(0), true);
+  }
+
+  inline size_t size() const { return data_released ? index->GetSize() : data.size(); }
 
-  py::object at(size_t pos) { return writeObject(data.at(pos)); }
+  // the data point at the given position (stored by the index if the data points were released)
+  const Object * getObject(size_t pos) const {
+    return data_released ? index->GetStoredObject(pos) : data.at(pos);
+  }
+
+  void checkDataNotReleased() const {
+    if (data_released) {
+      throw std::invalid_argument("The data points were released by createIndex, "
+                                  "data can't be added and the index can't be recreated");
+    }
+  }
+
+  py::object at(size_t pos) {
+    py::gil_scoped_release l;
+    ReadLock lock(index_mutex);
+    const Object * obj = getObject(pos);
+    py::gil_scoped_acquire acquire;
+    return writeObject(obj);
+  }
 
   dist_t getDistance(size_t pos1, size_t pos2) const {
     py::gil_scoped_release l;
-    return space->IndexTimeDistance(data.at(pos1), data.at(pos2));
+    ReadLock lock(index_mutex);
+    return space->IndexTimeDistance(getObject(pos1), getObject(pos2));
   }
 
   std::string repr() const {
     std::stringstream ret;
     ret << "<" << module_name << "." << distName<dist_t>() << "Index method='" << method
-        << "' space='" << space_type <<  "' at " << this << ">";
+        << "' space='" << space_type << "' simd='" << GetSIMDLevelName(GetDistKernels().level)
+        << "' at " << this << ">";
     return ret.str();
   }
 
@@ -362,7 +737,7 @@ struct IndexWrapper {
     // In cases when the interpreter was shutting down, attempting to log in python
     // could throw an exception (https://github.com/nmslib/nmslib/issues/327).
     //LOG(LIB_DEBUG) << "Destroying Index";
-    freeAndClearObjectVector(data);
+    freeAndClearObjectVector(data, data_arenas);
   }
 
   std::string method;
@@ -372,6 +747,29 @@ struct IndexWrapper {
   std::unique_ptr<Space<dist_t>> space;
   std::unique_ptr<Index<dist_t>> index;
   ObjectVector data;
+  // Objects added in bulk live in these arenas rather than being allocated one by one
+  ObjectArenaList data_arenas;
+  // Set if the data points were freed after creating an index that keeps its own copy of them
+  bool data_released = false;
+
+  /*
+   * Searches share this lock, while calls that change the index or the data points
+   * (insertion, deletion, creating or loading the index) hold it exclusively.
+   * It is always taken with the GIL released, so that a thread waiting for it
+   * doesn't block threads that hold it and need the GIL (e.g., to log).
+   */
+  typedef std::shared_lock<std::shared_timed_mutex> ReadLock;
+  typedef std::unique_lock<std::shared_timed_mutex> WriteLock;
+  mutable std::shared_timed_mutex index_mutex;
+
+  // Search statistics aggregated over all queries that collected statistics
+  struct {
+    std::atomic<uint64_t> query_qty{0};
+    std::atomic<uint64_t> distance_computations{0};
+    std::atomic<uint64_t> hops{0};
+    std::atomic<uint64_t> visited{0};
+    std::atomic<uint64_t> search_time{0};
+  } total_stats;
 };
 
 // pybind11::gil_scoped_acquire can deadlock when acquiring the GIL on threads
@@ -463,7 +861,25 @@ PYBIND11_PLUGIN(nmslib) {
     .value("DENSE_VECTOR", DATATYPE_DENSE_VECTOR)
     .value("DENSE_UINT8_VECTOR", DATATYPE_DENSE_UINT8_VECTOR)
     .value("SPARSE_VECTOR", DATATYPE_SPARSE_VECTOR)
-    .value("OBJECT_AS_STRING", DATATYPE_OBJECT_AS_STRING);
+    .value("OBJECT_AS_STRING", DATATYPE_OBJECT_AS_STRING)
+    .value("DENSE_FLOAT16_VECTOR", DATATYPE_DENSE_FLOAT16_VECTOR)
+    .value("DENSE_INT8_VECTOR", DATATYPE_DENSE_INT8_VECTOR);
+
+  m.def("setThreadPoolSize", &SetThreadPoolSize, py::arg("num_threads"),
+    py::call_guard<py::gil_scoped_release>(),
+    "Sets the number of threads in the process-wide thread pool, which is\n"
+    "shared by all indices for both indexing and batch querying. This also\n"
+    "limits the number of threads any single call can use: a larger\n"
+    "indexThreadQty or num_threads is reduced to the pool size, so\n"
+    "increase the pool size to use more threads than there are cores.\n\n"
+    "Parameters\n"
+    "----------\n"
+    "num_threads: int\n"
+    "    The number of threads in the pool. By default, the pool has one thread\n"
+    "    per CPU core.\n");
+
+  m.def("getThreadPoolSize", &GetThreadPoolSize,
+    "Returns the number of threads in the process-wide thread pool\n");
 
   // Initializes a new index. Param ordering here is set to be consistent with the previous
   // version of the bindings
@@ -539,16 +955,23 @@ void exportIndex(py::module * m) {
     .def("createIndex", &IndexWrapper<dist_t>::createIndex,
       py::arg("index_params") = py::none(),
       py::arg("print_progress") = false,
+      py::arg("release_data") = false,
       "Creates the index, and makes it available for querying\n\n"
       "Parameters\n"
       "----------\n"
       "index_params: dict optional\n"
       "    Dictionary of optional parameters to use in indexing\n"
       "print_progress: bool optional\n"
-      "    Whether or not to display progress bar when creating index\n")
+      "    Whether or not to display progress bar when creating index\n"
+      "release_data: bool optional\n"
+      "    Whether to free the data points (and the structures used only to build the index)\n"
+      "    if the index keeps its own copy of them (optimized hnsw indices do). Data points are\n"
+      "    then read from the index (normalized in the space cosinesimil), but no data can be\n"
+      "    added to the index and deleted elements can't be repaired.\n")
 
     .def("knnQuery", &IndexWrapper<dist_t>::knnQuery,
-      py::arg("vector"), py::arg("k") = 10,
+      py::arg("vector"), py::arg("k") = 10, py::arg("return_stats") = false,
+      py::arg("query_params") = py::none(), py::arg("filter") = py::none(),
       "Finds the approximate K nearest neighbours of a vector in the index \n\n"
       "Parameters\n"
       "----------\n"
@@ -556,16 +979,40 @@ void exportIndex(py::module * m) {
       "    A 1D vector to query for.\n"
       "k: int optional\n"
       "    The number of neighbours to return\n"
+      "return_stats: bool optional\n"
+      "    Also return search statistics (see below)\n"
+      "query_params: dict optional\n"
+      "    Query-time parameters overriding the ones set by setQueryTimeParams\n"
+      "    for this call only, e.g., {'efSearch': 100}. Supported parameters are\n"
+      "    efSearch (ef) and algoType of graph-based methods (hnsw, sw-graph).\n"
+      "    Unlike setQueryTimeParams, this is safe to use in concurrent searches.\n"
+      "filter: array_like optional\n"
+      "    Restricts the result to a subset of the indexed points: either a boolean\n"
+      "    mask indexed by ids (ids past its end are excluded) or a sorted array\n"
+      "    of the ids that can be returned. Graph-based methods still traverse\n"
+      "    the excluded points, so that they don't cut the search short.\n"
+      "    HNSW compares the query with all allowed points if there are at most\n"
+      "    efSearch * 2 * M of them, or if the graph search finds fewer than k\n"
+      "    allowed points, so that k results are returned whenever k (non-deleted)\n"
+      "    points are allowed. If the ids differ from the positions of points in\n"
+      "    the index, finding the allowed points requires a scan over all points.\n"
       "\n"
       "Returns\n"
       "----------\n"
       "ids: array_like.\n"
       "    A 1D vector of the ids of each nearest neighbour.\n"
       "distances: array_like.\n"
-      "    A 1D vector of the distance to each nearest neigbhour.\n")
+      "    A 1D vector of the distance to each nearest neigbhour.\n"
+      "stats: dict\n"
+      "    Only if return_stats is True: the number of distance computations,\n"
+      "    the number of graph/tree nodes expanded at each level (hops_per_level),\n"
+      "    the number of visited data points and the search time in microseconds.\n"
+      "    Hops and visited points are reported by hnsw, sw-graph and vptree only.\n")
 
     .def("knnQueryBatch", &IndexWrapper<dist_t>::knnQueryBatch,
       py::arg("queries"), py::arg("k") = 10, py::arg("num_threads") = 0,
+      py::arg("dense") = false, py::arg("return_stats") = false,
+      py::arg("query_params") = py::none(), py::arg("filter") = py::none(),
       "Performs multiple queries on the index, distributing the work over \n"
       "a thread pool\n\n"
       "Parameters\n"
@@ -575,23 +1022,64 @@ void exportIndex(py::module * m) {
       "k: int optional\n"
       "    The number of neighbours to return\n"
       "num_threads: int optional\n"
-      "    The number of threads to use\n"
+      "    The number of threads to use (0 means all threads of the pool,\n"
+      "    larger values are reduced to the pool size, see setThreadPoolSize)\n"
+      "dense: bool optional\n"
+      "    Return the results as two (n_queries, k) matrices instead of a list\n"
+      "    of tuples. This avoids creating a pair of arrays per query.\n"
+      "return_stats: bool optional\n"
+      "    Also return search statistics (see below)\n"
+      "query_params: dict optional\n"
+      "    Query-time parameters overriding the ones set by setQueryTimeParams\n"
+      "    for this call only, e.g., {'efSearch': 100}. Supported parameters are\n"
+      "    efSearch (ef) and algoType of graph-based methods (hnsw, sw-graph).\n"
+      "    Unlike setQueryTimeParams, this is safe to use in concurrent searches.\n"
+      "filter: array_like optional\n"
+      "    Restricts the result to a subset of the indexed points: either a boolean\n"
+      "    mask indexed by ids (ids past its end are excluded) or a sorted array\n"
+      "    of the ids that can be returned. Graph-based methods still traverse\n"
+      "    the excluded points, so that they don't cut the search short.\n"
+      "    HNSW compares the query with all allowed points if there are at most\n"
+      "    efSearch * 2 * M of them, or if the graph search finds fewer than k\n"
+      "    allowed points, so that k results are returned whenever k (non-deleted)\n"
+      "    points are allowed. If the ids differ from the positions of points in\n"
+      "    the index, finding the allowed points requires a scan over all points.\n"
       "\n"
       "Returns\n"
       "----------\n"
       "list:\n"
-      "   A list of tuples of (ids, distances)\n ")
+      "   A list of tuples of (ids, distances). If dense is True, a tuple of\n"
+      "   (ids, distances) matrices is returned instead: rows of queries\n"
+      "   that have fewer than k neighbours are padded with -1 ids and\n"
+      "   infinite distances (maximum values for integer distances).\n"
+      "   If return_stats is True, a list with statistics of each query\n"
+      "   (see knnQuery) is added to the returned tuple.\n ")
+
+    .def("getSearchStats", &IndexWrapper<dist_t>::getSearchStats,
+      "Returns search statistics (the number of queries, distance computations,\n"
+      "hops, visited points and the total search time in microseconds)\n"
+      "aggregated over all queries that were run with return_stats=True.\n"
+      "visited_list_memory is the memory (in bytes) currently used by lists of\n"
+      "visited points that the index keeps for reuse across searches\n")
+
+    .def("resetSearchStats", &IndexWrapper<dist_t>::resetSearchStats,
+      "Resets aggregated search statistics\n")
 
     .def("loadIndex", &IndexWrapper<dist_t>::loadIndex,
       py::arg("filename"),
       py::arg("load_data") = false,
+      py::arg("mmap") = false,
       "Loads the index from disk\n\n"
       "Parameters\n"
       "----------\n"
       "filename: str\n"
       "    The filename to read from\n"
       "load_data: bool optional\n"
-      "    Whether or not to load previously saved data.\n")
+      "    Whether or not to load previously saved data.\n"
+      "mmap: bool optional\n"
+      "    Whether to memory-map the index file read-only instead of reading it (supported by\n"
+      "    optimized hnsw indices). The mapped index is shared by all processes that map the\n"
+      "    same file, but data can't be added to it and deleted elements can't be repaired.\n")
 
     .def("saveIndex", &IndexWrapper<dist_t>::saveIndex,
       py::arg("filename"),
@@ -608,7 +1096,9 @@ void exportIndex(py::module * m) {
       [](IndexWrapper<dist_t> * self, py::object params) {
         self->index->SetQueryTimeParams(loadParams(params));
       }, py::arg("params") = py::none(),
-      "Sets parameters used in knnQuery.\n\n"
+      "Sets parameters used in knnQuery. These settings are global for the index:\n"
+      "to use different settings in concurrent searches, pass query_params\n"
+      "to knnQuery/knnQueryBatch instead.\n\n"
       "Parameters\n"
       "----------\n"
       "params: dict\n"
@@ -617,7 +1107,10 @@ void exportIndex(py::module * m) {
     .def("addDataPoint", &IndexWrapper<dist_t>::addDataPoint,
       py::arg("id"),
       py::arg("data"),
-      "Adds a single datapoint to the index\n\n"
+      "Adds a single datapoint to the index. If the index was already created\n"
+      "and its method supports incremental insertion (e.g., hnsw), the\n"
+      "datapoint is inserted into it right away. Queries of the index run by\n"
+      "other threads are paused until the insertion finishes.\n\n"
       "Parameters\n"
       "----------\n"
       "id: int\n"
@@ -632,19 +1125,46 @@ void exportIndex(py::module * m) {
     .def("addDataPointBatch", &IndexWrapper<dist_t>::addDataPointBatch,
       py::arg("data"),
       py::arg("ids") = py::none(),
-      "Adds multiple datapoints to the index\n\n"
+      "Adds multiple datapoints to the index. If the index was already created\n"
+      "and its method supports incremental insertion (e.g., hnsw), the\n"
+      "datapoints are inserted into it right away. Queries of the index run by\n"
+      "other threads are paused until the insertion finishes.\n\n"
       "Parameters\n"
       "----------\n"
       "data: object\n"
       "    The objects to add to the index.\n"
       "ids: array_like optional\n"
       "    The ids of the object being inserted. If not set will default to the \n"
-      "    row id of each object in the dataset\n"
+      "    row id of each object in the dataset. Once the index is created (or\n"
+      "    loaded), the default ids start at len(index) instead, so that they\n"
+      "    don't collide with the ids of the indexed objects\n"
       "Returns\n"
       "----------\n"
       "int\n"
       "    The number of items added\n")
 
+    .def("deleteDataPointBatch", &IndexWrapper<dist_t>::deleteDataPointBatch,
+      py::arg("ids"),
+      py::arg("repair") = false,
+      "Deletes multiple datapoints from the index (hnsw, sw-graph). The hnsw method\n"
+      "keeps deleted datapoints as tombstones: they are never returned by queries\n"
+      "but they are still used for routing, until repairIndex is called. The memory\n"
+      "of deleted datapoints is reclaimed only by creating the index anew.\n"
+      "Queries run by other threads are paused until the deletion finishes.\n\n"
+      "Parameters\n"
+      "----------\n"
+      "ids: array_like\n"
+      "    The ids of the objects to delete\n"
+      "repair: bool optional\n"
+      "    Also run repairIndex after the deletion\n")
+
+    .def("repairIndex", &IndexWrapper<dist_t>::repairIndex,
+      "Relinks neighbors of the datapoints deleted from the index (hnsw) since\n"
+      "the last repair, so that these neighbors don't link to deleted ones.\n"
+      "This is done in parallel: finding the neighbors takes a scan of all\n"
+      "links, while the cost of relinking is proportional to the number of\n"
+      "neighbors. Thus, it's cheaper to repair after deleting many datapoints.\n")
+
     .def_readonly("dataType", &IndexWrapper<dist_t>::data_type)
     .def_readonly("distType", &IndexWrapper<dist_t>::dist_type)
     .def("__len__", &IndexWrapper<dist_t>::size)
@@ -664,6 +1184,39 @@ void freeAndClearObjectVector(ObjectVector& data) {
   data.clear();
 }
 
+void freeAndClearObjectVector(ObjectVector& data, ObjectArenaList& arenas) {
+  if (arenas.empty()) {
+    freeAndClearObjectVector(data);
+    return;
+  }
+  // Objects that belong to arenas are released together with their arenas,
+  // only the remaining ones should be deleted individually.
+  std::less<const Object*> before;
+  std::vector<const ObjectArena*> sorted;
+  for (const auto & arena : arenas) {
+    if (arena->size()) sorted.push_back(arena.get());
+  }
+  std::sort(sorted.begin(), sorted.end(), [&](const ObjectArena * a, const ObjectArena * b) {
+    return before(a->GetObject(0), b->GetObject(0));
+  });
+  for (auto datum : data) {
+    auto it = std::upper_bound(sorted.begin(), sorted.end(), datum,
+                               [&](const Object * obj, const ObjectArena * arena) {
+                                 return before(obj, arena->GetObject(0));
+                               });
+    if (it == sorted.begin() || !(*(it - 1))->Contains(datum)) {
+      delete datum;
+    }
+  }
+  data.clear();
+  arenas.clear();
+}
+
+// pybind11 doesn't support float16, so numpy converts the input (if needed)
+py::array toContiguousArray(py::object input, const char * dtype) {
+  return py::module::import("numpy").attr("ascontiguousarray")(input, dtype);
+}
+
 AnyParams loadParams(py::object o) {
   if (o.is_none()) {
     return AnyParams();
@@ -1,4 +1,5 @@
 import os
+import platform
 from setuptools import setup, Extension
 from setuptools.command.build_ext import build_ext
 import sys
@@ -124,7 +125,13 @@ class BuildExt(build_ext):
         # See https://docs.microsoft.com/en-us/cpp/build/reference/arch-x86
         c_opts['msvc'].append("/arch:{}".format(os.environ['ARCH']))  # bugfix
     if 'CFLAGS' not in os.environ or "-march" not in os.environ["CFLAGS"]:
-        c_opts['unix'].append('-march=native')
+        # The most frequently used distance functions select SIMD instructions at runtime,
+        # so on x86 we build for a baseline CPU: the module then runs on any machine.
+        # Set CFLAGS=-march=native to build for the host CPU instead.
+        if platform.machine().lower() in ('x86_64', 'amd64', 'i386', 'i686'):
+            c_opts['unix'].append('-msse4.2')
+        else:
+            c_opts['unix'].append('-march=native')
     link_opts = {
         'unix': [],
         'msvc': [],
@@ -1,7 +1,10 @@
 import itertools
 import tempfile
+import threading
 import unittest
 import shutil
+import subprocess
+import sys
 
 import numpy as np
 import numpy.testing as npt
@@ -35,6 +38,31 @@ def get_hitrate(ground_truth, ids):
     return len(set(i for i, _ in ground_truth).intersection(ids))
 
 
+def read_regular_index_links(file_name):
+    """Reads links of a saved regular (non-optimized) HNSW index:
+       returns a list of (element id, friend ids) for all levels."""
+    with open(file_name, 'rb') as f:
+        buf = f.read()
+    flag, total_qty, max_level, enterpoint = np.frombuffer(buf, dtype=np.uint32, count=4)
+    assert flag == 5  # HNSW_REGULAR_INDEX_CSR
+    offset = 4 * 4 + 3 * 8  # M, maxM, maxM0 are 64-bit
+    levels = np.frombuffer(buf, dtype=np.uint32, count=total_qty, offset=offset)
+    offset += 4 * total_qty
+    level_qty = int(np.frombuffer(buf, dtype=np.uint32, count=1, offset=offset)[0])
+    offset += 4
+    links = []
+    for level in range(level_qty):
+        row_qty = int(np.frombuffer(buf, dtype=np.uint64, count=1, offset=offset)[0])
+        offset += 8
+        row_offsets = np.frombuffer(buf, dtype=np.uint64, count=row_qty + 1, offset=offset)
+        offset += 8 * (row_qty + 1)
+        friends = np.frombuffer(buf, dtype=np.int32, count=int(row_offsets[-1]), offset=offset)
+        offset += 4 * int(row_offsets[-1])
+        for row, elem_id in enumerate(np.where(levels >= level)[0]):
+            links.append((elem_id, friends[row_offsets[row]:row_offsets[row + 1]]))
+    return links
+
+
 def bit_vector_to_str(bit_vect):
     return " ".join(["1" if e else "0" for e in bit_vect])
 
@@ -121,6 +149,91 @@ class DenseIndexTestMixin(object):
             ids = np.sqrt(ids).astype(int)
             self.assertTrue(get_hitrate(get_exact_cosine(query, data), ids) >= 5)
 
+    def testKnnQueryBatchDense(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 10).astype(np.float32)
+
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        index.createIndex()
+
+        queries = data[:10]
+        results = index.knnQueryBatch(queries, k=10)
+        ids, distances = index.knnQueryBatch(queries, k=10, dense=True)
+        self.assertEqual(ids.shape, (10, 10))
+        self.assertEqual(distances.shape, (10, 10))
+        for i in range(len(queries)):
+            self.assert_allclose(results[i], (ids[i], distances[i]))
+
+        # missing neighbours are padded
+        ids, distances = index.knnQueryBatch(queries, k=len(data) + 5, dense=True)
+        self.assertTrue(np.all(ids[:, len(data):] == -1))
+        self.assertTrue(np.all(np.isinf(distances[:, len(data):])))
+
+    def testSearchStats(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 10).astype(np.float32)
+
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        index.createIndex()
+
+        ids, distances, stats = index.knnQuery(data[0], k=10, return_stats=True)
+        npt.assert_array_equal(ids, index.knnQuery(data[0], k=10)[0])
+        self.assertTrue(stats['distance_computations'] > 0)
+        self.assertTrue(stats['visited'] > 0)
+        self.assertTrue(sum(stats['hops_per_level']) > 0)
+
+        results, batch_stats = index.knnQueryBatch(data[:10], k=10, return_stats=True)
+        self.assertEqual(len(results), 10)
+        self.assertEqual(len(batch_stats), 10)
+        ids, distances, dense_stats = index.knnQueryBatch(data[:10], k=10, dense=True,
+                                                          return_stats=True)
+        self.assertEqual(ids.shape, (10, 10))
+        self.assertEqual(len(dense_stats), 10)
+
+        # only queries with return_stats=True are accounted for
+        index.knnQuery(data[0], k=10)
+        total = index.getSearchStats()
+        self.assertEqual(total['query_qty'], 21)
+        all_stats = [stats] + batch_stats + dense_stats
+        self.assertEqual(total['distance_computations'],
+                         sum(s['distance_computations'] for s in all_stats))
+        index.resetSearchStats()
+        self.assertEqual(index.getSearchStats()['query_qty'], 0)
+
+    def testFilter(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 10).astype(np.float32)
+
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        index.createIndex()
+
+        mask = np.arange(len(data)) % 3 == 0
+        allowed = np.flatnonzero(mask)
+        normed = data / np.linalg.norm(data, axis=1)[:, None]
+        recall = 0
+        for query in data[:10]:
+            ids, distances = index.knnQuery(query, k=10, filter=mask)
+            self.assertTrue(mask[ids].all())
+            # a sorted array of ids is equivalent to a mask
+            npt.assert_array_equal(ids, index.knnQuery(query, k=10, filter=allowed)[0])
+
+            expected = allowed[np.argsort(-normed[allowed].dot(query))[:10]]
+            recall += len(set(ids) & set(expected)) / 10.0
+        self.assertTrue(recall / 10 >= 0.8)
+
+        ids, distances = index.knnQueryBatch(data[:10], k=10, dense=True, filter=allowed)
+        self.assertTrue(mask[ids].all())
+        for ids, distances in index.knnQueryBatch(data[:10], k=10, filter=mask):
+            self.assertTrue(mask[ids].all())
+
+        # nothing can be returned if everything is filtered out
+        ids, distances = index.knnQuery(data[0], k=10, filter=np.zeros(len(data), dtype=bool))
+        self.assertEqual(len(ids), 0)
+        self.assertRaises(ValueError, index.knnQuery, data[0], filter=allowed[::-1])
+
     def testReloadIndex(self):
         np.random.seed(23)
         data = np.random.randn(1000, 10).astype(np.float32)
@@ -148,6 +261,24 @@ class DenseIndexTestMixin(object):
 
         shutil.rmtree(temp_dir)
 
+    def testAddDataPointBatch(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 10).astype(np.float32)
+
+        # mix batches (of different layouts and dtypes) with single data points
+        index = self._get_index()
+        index.addDataPointBatch(data[:500])
+        index.addDataPoint(500, data[500])
+        index.addDataPointBatch(np.asfortranarray(data[501:]).astype(np.float64),
+                                ids=np.arange(501, 1000))
+        self.assertEqual(len(index), len(data))
+        for i in [0, 499, 500, 501, 999]:
+            npt.assert_allclose(index[i], data[i])
+        index.createIndex()
+
+        ids, distances = index.knnQuery(data[700], k=10)
+        self.assertTrue(get_hitrate(get_exact_cosine(data[700], data), ids) >= 5)
+
 
 class BitVectorIndexTestMixin(object):
     def _get_index(self, space='bit_jaccard'):
@@ -212,10 +343,738 @@ class BitVectorIndexTestMixin(object):
         shutil.rmtree(temp_dir)
 
 
-class HNSWTestCase(TestCaseBase, DenseIndexTestMixin):
+class GraphQueryParamsTestMixin(object):
+    def testQueryParams(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 10).astype(np.float32)
+
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        index.createIndex()
+        index.setQueryTimeParams({'efSearch': 10})
+
+        # per-call overrides are equivalent to setting query-time parameters
+        results = index.knnQueryBatch(data[:10], k=10, query_params={'efSearch': 200})
+        stats = index.knnQuery(data[0], k=10, return_stats=True, query_params={'efSearch': 200})[2]
+        index.setQueryTimeParams({'efSearch': 200})
+        for query, result in zip(data[:10], results):
+            self.assert_allclose(index.knnQuery(query, k=10), result)
+        new_stats = index.knnQuery(data[0], k=10, return_stats=True)[2]
+        self.assertEqual(new_stats['distance_computations'], stats['distance_computations'])
+
+        # ... but they don't change the index-wide settings
+        index.setQueryTimeParams({'efSearch': 10})
+        index.knnQuery(data[0], k=10, query_params={'efSearch': 200, 'algoType': 'v1merge'})
+        new_stats = index.knnQuery(data[0], k=10, return_stats=True)[2]
+        self.assertTrue(new_stats['distance_computations'] < stats['distance_computations'])
+
+        # efSearch overrides are used by every search algorithm
+        for algo_type in ['old', 'v1merge']:
+            index.setQueryTimeParams({'efSearch': 10, 'algoType': algo_type})
+            small = index.knnQuery(data[0], k=10, return_stats=True)[2]
+            large = index.knnQuery(data[0], k=10, return_stats=True,
+                                   query_params={'efSearch': 200})[2]
+            self.assertTrue(small['distance_computations'] < large['distance_computations'])
+
+        with self.assertRaises(Exception):
+            index.knnQuery(data[0], k=10, query_params={'efConstruction': 100})
+
+    def testVisitedListMemory(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 10).astype(np.float32)
+
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        index.createIndex()
+        # visited lists are created by the first search and kept for reuse
+        index.knnQuery(data[0], k=10)
+        memory = index.getSearchStats()['visited_list_memory']
+        self.assertTrue(memory >= len(data))
+        index.knnQuery(data[1], k=10)
+        self.assertEqual(index.getSearchStats()['visited_list_memory'], memory)
+
+
+class HNSWTestCase(TestCaseBase, DenseIndexTestMixin, GraphQueryParamsTestMixin):
     def _get_index(self, space='cosinesimil'):
         return nmslib.init(method='hnsw', space=space)
 
+    def testIncrementalInsertion(self):
+        np.random.seed(23)
+        data = np.random.randn(1500, 16).astype(np.float32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for space, skip_optimized_index in [('cosinesimil', 0), ('l2', 0), ('cosinesimil', 1)]:
+            index = self._get_index(space)
+            index.addDataPointBatch(data[:500])
+            index.createIndex({'skip_optimized_index': skip_optimized_index})
+
+            # new points go straight into the created index
+            index.addDataPointBatch(data[500:1000], ids=np.arange(500, 1000))
+            index.addDataPoint(1000, data[1000])
+            self.assertEqual(len(index), 1001)
+            for i in [0, 499, 500, 999, 1000]:
+                self.assertEqual(index.knnQuery(data[i], k=1)[0][0], i)
+
+            # as well as into a reloaded one
+            index.saveIndex(temp_file_pref, save_data=True)
+            reloaded = self._get_index(space)
+            reloaded.loadIndex(temp_file_pref, load_data=True)
+            reloaded.addDataPointBatch(data[1001:], ids=np.arange(1001, len(data)))
+            for i in [0, 500, 1000, 1001, 1499]:
+                self.assertEqual(reloaded.knnQuery(data[i], k=1)[0][0], i)
+
+            if space == 'cosinesimil':
+                ids, distances = reloaded.knnQuery(data[1200], k=10)
+                self.assertTrue(get_hitrate(get_exact_cosine(data[1200], data), ids) >= 5)
+
+        shutil.rmtree(temp_dir)
+
+    def testSelectiveFilter(self):
+        np.random.seed(23)
+        data = np.random.randn(3000, 16).astype(np.float32)
+        mask = np.random.rand(len(data)) < 0.05
+        allowed = np.flatnonzero(mask)
+
+        for skip_optimized_index, offset, delete in [(0, 0, False), (1, 0, True),
+                                                     (0, 10000, False)]:
+            index = self._get_index('l2')
+            # ids that differ from positions are found by scanning all points
+            index.addDataPointBatch(data, ids=np.arange(len(data)) + offset)
+            index.createIndex({'M': 8, 'skip_optimized_index': skip_optimized_index})
+            candidates = allowed
+            if delete:
+                index.deleteDataPointBatch([allowed[0]])
+                candidates = allowed[1:]
+
+            for query in data[:5]:
+                expected = candidates[np.argsort(np.linalg.norm(data[candidates] - query,
+                                                                axis=1))[:10]] + offset
+                # few allowed points are compared with the query exhaustively, and so are
+                # all of them if the graph search finds fewer than k
+                for params in [{}, {'efSearch': 1}]:
+                    ids, _ = index.knnQuery(query, k=10, query_params=params,
+                                            filter=np.append(allowed, len(data)) + offset)
+                    npt.assert_array_equal(ids, expected)
+
+            ids, _ = index.knnQuery(data[0], k=3, filter=np.array([3, 10, 2001]) + offset)
+            self.assertEqual(sorted(ids), [3 + offset, 10 + offset, 2001 + offset])
+
+    def testDefaultInsertionIds(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 16).astype(np.float32)
+
+        for space in ['l2', 'cosinesimil', 'negdotprod', 'l1']:
+            index = self._get_index(space)
+            index.addDataPointBatch(data[:500])
+            index.createIndex()
+            # without ids, new points get ids that follow the existing ones
+            index.addDataPointBatch(data[500:])
+            ids = index.knnQuery(data[0], k=100)[0]
+            self.assertEqual(len(np.unique(ids)), len(ids))
+            self.assertTrue(np.all(ids < len(data)))
+            index.deleteDataPointBatch([0], repair=True)
+            self.assertNotIn(0, index.knnQuery(data[0], k=100)[0])
+            if space != 'negdotprod':
+                for i in [500, 999]:
+                    self.assertEqual(index.knnQuery(data[i], k=1)[0][0], i)
+
+    def testFailedInsertion(self):
+        np.random.seed(23)
+        data = np.random.randn(500, 16).astype(np.float32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        index.createIndex()
+        index.saveIndex(temp_file_pref)
+
+        # data can't be added without data points or to a mapped index,
+        # failed calls don't leave the data points behind
+        for mmap in [False, True]:
+            reloaded = self._get_index()
+            reloaded.loadIndex(temp_file_pref, mmap=mmap)
+            for _ in range(2):
+                self.assertRaises(Exception, reloaded.addDataPointBatch, data[:3],
+                                  ids=np.arange(500, 503))
+                self.assertRaises(Exception, reloaded.addDataPoint, 503, data[3])
+                self.assertEqual(len(reloaded), 0)
+            del reloaded
+
+        shutil.rmtree(temp_dir)
+
+    def testConcurrentInsertion(self):
+        np.random.seed(23)
+        data = np.random.randn(3000, 16).astype(np.float32)
+
+        index = self._get_index()
+        index.addDataPointBatch(data[:500])
+        index.createIndex()
+
+        # queries run while other threads insert data points
+        errors = []
+
+        def query():
+            try:
+                for i in range(200):
+                    ids, _ = index.knnQueryBatch(data[i % 500:i % 500 + 10], k=1, dense=True)
+                    npt.assert_array_equal(ids[:, 0], np.arange(i % 500, i % 500 + 10))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=query) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for start in range(500, len(data), 100):
+            index.addDataPointBatch(data[start:start + 100], ids=np.arange(start, start + 100))
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(index), len(data))
+        for i in [0, 1000, 2999]:
+            self.assertEqual(index.knnQuery(data[i], k=1)[0][0], i)
+
+    def testDeletion(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 16).astype(np.float32)
+        # with a random choice, some elements link to deleted ones that don't link back
+        deleted = np.sort(np.random.choice(1000, 250, replace=False))
+        remaining = np.setdiff1d(np.arange(1000), deleted)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for skip_optimized_index in [0, 1]:
+            index = self._get_index()
+            index.addDataPointBatch(data)
+            index.createIndex({'skip_optimized_index': skip_optimized_index})
+            index.deleteDataPointBatch(deleted[:100])
+            index.deleteDataPointBatch(deleted[100:])
+            self.assertRaises(Exception, index.deleteDataPointBatch, deleted[:1])
+
+            for repair in [False, True]:
+                if repair:
+                    index.repairIndex()
+                hitrate = 0
+                for i in range(10):
+                    ids, distances = index.knnQuery(data[i], k=10)
+                    self.assertEqual(len(ids), 10)
+                    self.assertEqual(len(np.intersect1d(ids, deleted)), 0)
+                    expected = [(remaining[j], score)
+                                for j, score in get_exact_cosine(data[i], data[remaining])]
+                    hitrate += get_hitrate(expected, ids)
+                self.assertTrue(hitrate >= 50)
+
+            # deletions are saved along with the index
+            index.saveIndex(temp_file_pref, save_data=True)
+            if skip_optimized_index:
+                # after the repair, no (remaining) element links to a deleted one
+                for elem_id, friend_ids in read_regular_index_links(temp_file_pref):
+                    if elem_id not in deleted:
+                        self.assertEqual(len(np.intersect1d(friend_ids, deleted)), 0)
+            reloaded = self._get_index()
+            reloaded.loadIndex(temp_file_pref, load_data=True)
+            for i in range(10):
+                ids, distances = reloaded.knnQuery(data[i], k=10)
+                self.assertEqual(len(np.intersect1d(ids, deleted)), 0)
+
+        shutil.rmtree(temp_dir)
+
+    def testDeletionIds(self):
+        np.random.seed(23)
+        data = np.random.randn(100, 16).astype(np.float32)
+
+        # the memory used to map ids doesn't depend on their values
+        ids = np.arange(300000000, 300000100)
+        index = self._get_index()
+        index.addDataPointBatch(data, ids=ids)
+        index.createIndex()
+        rss = psutil.Process().memory_info().rss
+        index.deleteDataPointBatch(ids[:1])
+        self.assertTrue(psutil.Process().memory_info().rss - rss < 100 * 1024 * 1024)
+        self.assertNotIn(ids[0], index.knnQuery(data[0], k=10)[0])
+
+        # ids of deleted objects must be unique
+        index = self._get_index()
+        index.addDataPointBatch(data, ids=np.arange(len(data)) % 50)
+        index.createIndex()
+        self.assertRaises(Exception, index.deleteDataPointBatch, [0])
+
+    def testRegularIndexReload(self):
+        np.random.seed(23)
+        data = np.random.randn(2000, 16).astype(np.float32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        # a small M produces several levels, each of which is saved as a separate block of links
+        original = self._get_index()
+        original.addDataPointBatch(data)
+        original.createIndex({'skip_optimized_index': 1, 'M': 4})
+        original.saveIndex(temp_file_pref, save_data=True)
+
+        reloaded = self._get_index()
+        reloaded.loadIndex(temp_file_pref, load_data=True)
+        for i in range(0, 2000, 100):
+            original_ids, original_distances = original.knnQuery(data[i], k=10)
+            ids, distances = reloaded.knnQuery(data[i], k=10)
+            npt.assert_array_equal(original_ids, ids)
+            npt.assert_allclose(original_distances, distances)
+
+        shutil.rmtree(temp_dir)
+
+    def testReleaseData(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 16).astype(np.float32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for space, index_params in [('l2', {}), ('l2', {'reorder': 'bfs'}), ('cosinesimil', {})]:
+            original = self._get_index(space)
+            original.addDataPointBatch(data)
+            original.createIndex(index_params)
+            released = self._get_index(space)
+            released.addDataPointBatch(data)
+            released.createIndex(index_params, release_data=True)
+
+            self.assertEqual(len(released), len(data))
+            for i in [0, 1, 999]:
+                expected = data[i] / np.linalg.norm(data[i]) if space == 'cosinesimil' else data[i]
+                npt.assert_allclose(released[i], expected, rtol=1e-5)
+                self.assertAlmostEqual(released.getDistance(i, 500), original.getDistance(i, 500),
+                                       places=5)
+                npt.assert_array_equal(released.knnQuery(data[i], k=10)[0],
+                                       original.knnQuery(data[i], k=10)[0])
+            self.assertRaises(IndexError, released.__getitem__, len(data))
+
+            # the graph can't be extended without the data points
+            self.assertRaises(ValueError, released.addDataPointBatch, data[:10])
+            released.deleteDataPointBatch([1])
+            self.assertRaises(Exception, released.repairIndex)
+
+            # stored copies of data points are saved instead
+            released.saveIndex(temp_file_pref, save_data=True)
+            reloaded = self._get_index(space)
+            reloaded.loadIndex(temp_file_pref, load_data=True)
+            npt.assert_array_equal(reloaded.knnQuery(data[0], k=10)[0],
+                                   released.knnQuery(data[0], k=10)[0])
+            npt.assert_allclose(reloaded[2], released[2])
+
+        # data points are kept if the index doesn't store them
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        index.createIndex({'skip_optimized_index': 1}, release_data=True)
+        npt.assert_allclose(index[0], data[0])
+        index.addDataPointBatch(data[:10], ids=np.arange(1000, 1010))
+        self.assertEqual(len(index), 1010)
+
+        shutil.rmtree(temp_dir)
+
+    def testMappedIndex(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 16).astype(np.float32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for space in ['cosinesimil', 'l2']:
+            original = self._get_index(space)
+            original.addDataPointBatch(data)
+            original.createIndex()
+            original.deleteDataPointBatch([1, 2, 3])
+            original.saveIndex(temp_file_pref)
+
+            mapped = self._get_index(space)
+            mapped.loadIndex(temp_file_pref, mmap=True)
+            reloaded = self._get_index(space)
+            reloaded.loadIndex(temp_file_pref)
+            for i in range(0, 1000, 50):
+                original_ids, original_distances = original.knnQuery(data[i], k=10)
+                for index in [mapped, reloaded]:
+                    ids, distances = index.knnQuery(data[i], k=10)
+                    npt.assert_array_equal(original_ids, ids)
+                    npt.assert_allclose(original_distances, distances)
+
+            # the mapped index is read-only
+            self.assertRaises(Exception, mapped.addDataPointBatch, data[:10],
+                              ids=np.arange(1000, 1010))
+            self.assertRaises(Exception, mapped.repairIndex)
+            mapped.deleteDataPointBatch([4])
+            self.assertNotIn(4, mapped.knnQuery(data[4], k=10)[0])
+
+        # an index that isn't optimized is simply loaded
+        original = self._get_index()
+        original.addDataPointBatch(data)
+        original.createIndex({'skip_optimized_index': 1})
+        original.saveIndex(temp_file_pref, save_data=True)
+        mapped = self._get_index()
+        mapped.loadIndex(temp_file_pref, load_data=True, mmap=True)
+        npt.assert_array_equal(original.knnQuery(data[0], k=10)[0],
+                               mapped.knnQuery(data[0], k=10)[0])
+
+        shutil.rmtree(temp_dir)
+
+    def testOptimizedIndexSpaces(self):
+        np.random.seed(23)
+        float_data = np.random.randn(1000, 16).astype(np.float32)
+        sift_data = np.random.randint(0, 256, size=(1000, 128)).astype(np.int32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for space, data, kwargs in [('negdotprod', float_data, {}),
+                                    ('l1', float_data, {}),
+                                    ('linf', float_data, {}),
+                                    ('l2sqr_sift', sift_data,
+                                     {'data_type': nmslib.DataType.DENSE_UINT8_VECTOR,
+                                      'dtype': nmslib.DistType.INT})]:
+            index = nmslib.init(method='hnsw', space=space, **kwargs)
+            index.addDataPointBatch(data)
+            index.createIndex()
+            index.setQueryTimeParams({'ef': 100})
+            brute_force = nmslib.init(method='brute_force', space=space, **kwargs)
+            brute_force.addDataPointBatch(data)
+            brute_force.createIndex()
+
+            recall = 0.0
+            queries = range(0, 1000, 50)
+            for i in queries:
+                ids, distances = index.knnQuery(data[i], k=10)
+                expected_ids, expected_distances = brute_force.knnQuery(data[i], k=10)
+                recall += len(set(ids) & set(expected_ids)) / 10.0
+                # distances computed using the optimized index are the same
+                # as distances computed by the space
+                for id, distance in zip(ids, distances):
+                    npt.assert_allclose(distance, index.getDistance(i, id), rtol=1e-5)
+            self.assertGreater(recall / len(queries), 0.9)
+
+            # the optimized index is saved and loaded
+            index.saveIndex(temp_file_pref)
+            reloaded = nmslib.init(method='hnsw', space=space, **kwargs)
+            reloaded.loadIndex(temp_file_pref)
+            reloaded.setQueryTimeParams({'ef': 100})
+            for i in queries:
+                original_ids, original_distances = index.knnQuery(data[i], k=10)
+                ids, distances = reloaded.knnQuery(data[i], k=10)
+                npt.assert_array_equal(original_ids, ids)
+                npt.assert_allclose(original_distances, distances)
+
+        # the optimized index can't be loaded for a different space
+        other = nmslib.init(method='hnsw', space='l1')
+        self.assertRaises(Exception, other.loadIndex, temp_file_pref)
+
+        shutil.rmtree(temp_dir)
+
+    def testQuantizedIndex(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 20).astype(np.float32)
+        added = np.random.randn(100, 20).astype(np.float32)
+        queries = np.random.randn(20, 20).astype(np.float32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for space in ['cosinesimil', 'l2']:
+            exact = self._get_index(space)
+            exact.addDataPointBatch(data)
+            exact.createIndex()
+            index = self._get_index(space)
+            index.addDataPointBatch(data)
+            index.createIndex({'quantize': 1})
+            for q in [exact, index]:
+                q.setQueryTimeParams({'ef': 100})
+
+            recall = 0.0
+            for query in queries:
+                ids, distances = index.knnQuery(query, k=10)
+                expected_ids, expected_distances = exact.knnQuery(query, k=10)
+                recall += len(set(ids) & set(expected_ids)) / 10.0
+                # candidates are re-ranked using exact distances
+                expected = dict(zip(expected_ids, expected_distances))
+                for id, distance in zip(ids, distances):
+                    if id in expected:
+                        npt.assert_allclose(distance, expected[id], rtol=1e-5)
+            self.assertGreater(recall / len(queries), 0.9)
+
+            index.deleteDataPointBatch([0])
+            self.assertNotIn(0, index.knnQuery(data[0], k=10)[0])
+            index.addDataPointBatch(added, ids=np.arange(1000, 1100))
+            self.assertEqual(1000, index.knnQuery(added[0], k=1)[0][0])
+
+            index.saveIndex(temp_file_pref)
+            for mmap in [False, True]:
+                reloaded = self._get_index(space)
+                reloaded.loadIndex(temp_file_pref, mmap=mmap)
+                reloaded.setQueryTimeParams({'ef': 100})
+                for query in queries:
+                    original_ids, original_distances = index.knnQuery(query, k=10)
+                    ids, distances = reloaded.knnQuery(query, k=10)
+                    npt.assert_array_equal(original_ids, ids)
+                    npt.assert_allclose(original_distances, distances)
+
+        shutil.rmtree(temp_dir)
+
+    def testReorderedIndex(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 16).astype(np.float32)
+        added = np.random.randn(100, 16).astype(np.float32)
+        queries = np.random.randn(20, 16).astype(np.float32)
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for space, reorder in [('l2', 'bfs'), ('l2', 'rcm'), ('cosinesimil', 'degree')]:
+            brute_force = nmslib.init(method='brute_force', space=space)
+            brute_force.addDataPointBatch(data)
+            brute_force.createIndex()
+            index = self._get_index(space)
+            index.addDataPointBatch(data)
+            index.createIndex({'reorder': reorder})
+            index.setQueryTimeParams({'ef': 100})
+
+            # objects keep their IDs, so reordering doesn't change results
+            recall = 0.0
+            for query in queries:
+                ids, distances = index.knnQuery(query, k=10)
+                expected_ids, expected_distances = brute_force.knnQuery(query, k=10)
+                recall += len(set(ids) & set(expected_ids)) / 10.0
+            self.assertGreater(recall / len(queries), 0.9)
+            for i in [0, 1, 500, 999]:
+                self.assertEqual(index.knnQuery(data[i], k=1)[0][0], i)
+
+            # the reordered layout is saved and loaded
+            index.saveIndex(temp_file_pref, save_data=True)
+            for mmap in [False, True]:
+                reloaded = self._get_index(space)
+                reloaded.loadIndex(temp_file_pref, mmap=mmap)
+                reloaded.setQueryTimeParams({'ef': 100})
+                for query in queries:
+                    original_ids, original_distances = index.knnQuery(query, k=10)
+                    ids, distances = reloaded.knnQuery(query, k=10)
+                    npt.assert_array_equal(original_ids, ids)
+                    npt.assert_allclose(original_distances, distances)
+
+            # the graph is restored using original positions of elements to add new data
+            reloaded = self._get_index(space)
+            reloaded.loadIndex(temp_file_pref, load_data=True)
+            reloaded.addDataPointBatch(added, ids=np.arange(1000, 1100))
+            for i in [0, 500, 999]:
+                self.assertEqual(reloaded.knnQuery(data[i], k=1)[0][0], i)
+            for i in [0, 99]:
+                self.assertEqual(reloaded.knnQuery(added[i], k=1)[0][0], 1000 + i)
+
+        index = self._get_index()
+        index.addDataPointBatch(data)
+        self.assertRaises(Exception, index.createIndex, {'reorder': 'random'})
+
+        shutil.rmtree(temp_dir)
+
+    def testPrefetchParams(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 16).astype(np.float32)
+
+        for space in ['l2', 'cosinesimil']:
+            index = self._get_index(space)
+            index.addDataPointBatch(data)
+            index.createIndex()
+            index.setQueryTimeParams({'efSearch': 50})
+            expected = index.knnQueryBatch(data[:20], k=10)
+            # prefetching affects only the speed of the search
+            for depth, lines in [(0, 1), (4, 1), (8, 4)]:
+                index.setQueryTimeParams({'efSearch': 50, 'prefetchDepth': depth,
+                                          'prefetchLines': lines})
+                for result, expected_result in zip(index.knnQueryBatch(data[:20], k=10), expected):
+                    npt.assert_array_equal(result[0], expected_result[0])
+                    npt.assert_allclose(result[1], expected_result[1])
+
+    def testVisitedSet(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 16).astype(np.float32)
+
+        for index_params in [{}, {'skip_optimized_index': 1}]:
+            index = self._get_index('l2')
+            index.addDataPointBatch(data)
+            index.createIndex(index_params)
+            for algo_type in ['old', 'v1merge']:
+                index.setQueryTimeParams({'efSearch': 50, 'algoType': algo_type,
+                                          'visitedSet': 'array'})
+                expected = index.knnQueryBatch(data[:20], k=10)
+                # the kind of the visited set affects only the speed and the memory of the search
+                for visited_set in ['hash', 'auto']:
+                    index.setQueryTimeParams({'efSearch': 50, 'algoType': algo_type,
+                                              'visitedSet': visited_set})
+                    results = index.knnQueryBatch(data[:20], k=10)
+                    for result, expected_result in zip(results, expected):
+                        npt.assert_array_equal(result[0], expected_result[0])
+                        npt.assert_allclose(result[1], expected_result[1])
+
+        self.assertRaises(Exception, index.setQueryTimeParams, {'visitedSet': 'bitmap'})
+
+    def testNNDescentLevel0(self):
+        np.random.seed(23)
+        data = np.random.randn(2000, 16).astype(np.float32)
+        queries = np.random.randn(50, 16).astype(np.float32)
+
+        exact = nmslib.init(method='brute_force', space='l2')
+        exact.addDataPointBatch(data)
+        exact.createIndex()
+
+        index = self._get_index('l2')
+        index.addDataPointBatch(data)
+        index.createIndex({'level0Builder': 'nndescent'})
+        index.setQueryTimeParams({'efSearch': 100})
+        recall = 0.0
+        results = zip(index.knnQueryBatch(queries, k=10), exact.knnQueryBatch(queries, k=10))
+        for (ids, _), (expected_ids, _) in results:
+            recall += len(set(ids) & set(expected_ids)) / 10.0
+        self.assertTrue(recall / len(queries) >= 0.9)
+
+        # k-NN lists of tiny data sets contain all elements
+        index = self._get_index('l2')
+        index.addDataPointBatch(data[:20])
+        index.createIndex({'level0Builder': 'nndescent'})
+        expected_ids = np.argsort(np.linalg.norm(data[:20] - queries[0], axis=1))[:5]
+        npt.assert_array_equal(index.knnQuery(queries[0], k=5)[0], expected_ids)
+
+        index = self._get_index('l2')
+        index.addDataPointBatch(data)
+        self.assertRaises(Exception, index.createIndex, {'level0Builder': 'kgraph'})
+
+    def testProductQuantization(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 32).astype(np.float32)
+        queries = np.random.randn(20, 32).astype(np.float32)
+
+        exact = nmslib.init(method='brute_force', space='l2')
+        exact.addDataPointBatch(data)
+        exact.createIndex()
+        # without PQ, the brute-force search still ignores query-time parameters
+        exact.setQueryTimeParams({'efSearch': 10})
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for method in ['brute_force', 'hnsw']:
+            index = nmslib.init(method=method, space='pq', space_params={'m': 8})
+            index.addDataPointBatch(data)
+            index.createIndex()
+            index.setQueryTimeParams({'ef': 100} if method == 'hnsw' else {'rerankQty': 100})
+
+            recall = 0.0
+            for query in queries:
+                ids, distances = index.knnQuery(query, k=10)
+                expected_ids, expected_distances = exact.knnQuery(query, k=10)
+                recall += len(set(ids) & set(expected_ids)) / 10.0
+                # candidates are re-ranked using exact distances
+                # (squared ones for hnsw, just like in the optimized l2 index)
+                if method == 'hnsw':
+                    expected_distances = expected_distances ** 2
+                expected = dict(zip(expected_ids, expected_distances))
+                for id, distance in zip(ids, distances):
+                    if id in expected:
+                        npt.assert_allclose(distance, expected[id], rtol=1e-5)
+            self.assertGreater(recall / len(queries), 0.9)
+
+        # PQ codes are saved along with the optimized index
+        index.saveIndex(temp_file_pref)
+        reloaded = nmslib.init(method='hnsw', space='pq', space_params={'m': 8})
+        reloaded.loadIndex(temp_file_pref)
+        reloaded.setQueryTimeParams({'ef': 100})
+        for query in queries:
+            original_ids, original_distances = index.knnQuery(query, k=10)
+            ids, distances = reloaded.knnQuery(query, k=10)
+            npt.assert_array_equal(original_ids, ids)
+            npt.assert_allclose(original_distances, distances)
+
+        shutil.rmtree(temp_dir)
+
+    def testLowPrecisionDataTypes(self):
+        np.random.seed(23)
+        datasets = [
+            (nmslib.DataType.DENSE_FLOAT16_VECTOR, 'float16',
+             np.random.randn(1000, 20).astype(np.float16),
+             np.random.randn(20, 20).astype(np.float16)),
+            (nmslib.DataType.DENSE_INT8_VECTOR, 'int8',
+             np.random.randint(-128, 128, (1000, 20)).astype(np.int8),
+             np.random.randint(-128, 128, (20, 20)).astype(np.int8)),
+        ]
+
+        temp_dir = tempfile.mkdtemp()
+        temp_file_pref = os.path.join(temp_dir, 'index')
+
+        for data_type, suffix, data, queries in datasets:
+            for space in ['l2', 'cosinesimil', 'negdotprod']:
+                exact = nmslib.init(method='brute_force', space=space)
+                exact.addDataPointBatch(data.astype(np.float32))
+                exact.createIndex()
+                expected = exact.knnQueryBatch(queries.astype(np.float32), k=10)
+
+                for method in ['brute_force', 'hnsw']:
+                    index = nmslib.init(method=method, space=space + '_' + suffix,
+                                        data_type=data_type)
+                    index.addDataPointBatch(data)
+                    index.createIndex()
+                    if method == 'hnsw':
+                        index.setQueryTimeParams({'ef': 100})
+                    npt.assert_allclose(index[3], data[3].astype(np.float32))
+
+                    recall = 0.0
+                    for (ids, distances), (expected_ids, expected_distances) in zip(
+                            index.knnQueryBatch(queries, k=10), expected):
+                        recall += len(set(ids) & set(expected_ids)) / 10.0
+                        expected_dict = dict(zip(expected_ids, expected_distances))
+                        for id, distance in zip(ids, distances):
+                            if id in expected_dict:
+                                npt.assert_allclose(distance, expected_dict[id],
+                                                    rtol=1e-4, atol=1e-4)
+                    self.assertGreater(recall / len(queries), 0.9)
+
+                # float queries are converted to the type of the data
+                npt.assert_array_equal(index.knnQuery(queries[0], k=10)[0],
+                                       index.knnQuery(queries[0].astype(np.float32), k=10)[0])
+
+                # the optimized index stores low-precision data
+                index.saveIndex(temp_file_pref)
+                reloaded = nmslib.init(method='hnsw', space=space + '_' + suffix,
+                                       data_type=data_type)
+                reloaded.loadIndex(temp_file_pref)
+                reloaded.setQueryTimeParams({'ef': 100})
+                for query in queries:
+                    npt.assert_array_equal(index.knnQuery(query, k=10)[0],
+                                           reloaded.knnQuery(query, k=10)[0])
+
+            with self.assertRaises(ValueError):
+                nmslib.init(method='hnsw', space='l2_' + suffix)
+
+        shutil.rmtree(temp_dir)
+
+    def testSIMDDispatch(self):
+        index = self._get_index()
+        self.assertRegex(repr(index), "simd='(generic|sse4.2|avx2|avx512)'")
+
+        # all kernels should produce the same distances
+        script = ("import numpy as np, nmslib\n"
+                  "np.random.seed(23)\n"
+                  "data = np.random.randn(100, 37).astype(np.float32)\n"
+                  "for space in ['l2', 'l1', 'cosinesimil', 'negdotprod']:\n"
+                  "    index = nmslib.init(method='hnsw', space=space)\n"
+                  "    index.addDataPointBatch(data)\n"
+                  "    print(repr(index).split(\"simd='\")[1].split(\"'\")[0], "
+                  "          ' '.join(repr(float(index.getDistance(0, i))) for i in range(100)))\n")
+        outputs = {}
+        for level in ['generic', 'sse4.2', 'avx2', 'avx512']:
+            env = dict(os.environ, NMSLIB_SIMD=level)
+            output = subprocess.check_output([sys.executable, '-c', script], env=env).decode()
+            lines = [line.split(' ', 1) for line in output.strip().split('\n')]
+            outputs[lines[0][0]] = [np.array(dists.split(), dtype=np.float64) for _, dists in lines]
+        self.assertIn('generic', outputs)
+        for level, dists in outputs.items():
+            for expected, actual in zip(outputs['generic'], dists):
+                npt.assert_allclose(expected, actual, rtol=1e-4, atol=1e-5)
+
 
 class BitJaccardTestCase(TestCaseBase, BitVectorIndexTestMixin):
     def _get_index(self, space='bit_jaccard'):
@@ -235,7 +1094,7 @@ class BitHammingTestCase(TestCaseBase, BitVectorIndexTestMixin):
                            dtype=nmslib.DistType.INT)
 
 
-class SWGraphTestCase(TestCaseBase, DenseIndexTestMixin):
+class SWGraphTestCase(TestCaseBase, DenseIndexTestMixin, GraphQueryParamsTestMixin):
     def _get_index(self, space='cosinesimil'):
         return nmslib.init(method='sw-graph', space=space)
 
@@ -478,6 +1337,30 @@ class GlobalTestCase(TestCaseBase):
         # this is a one line reproduction of https://github.com/nmslib/nmslib/issues/327
         GlobalTestCase.index = nmslib.init()
 
+    @unittest.skipIf(not hasattr(os, 'fork'), 'fork is not supported')
+    def testThreadPoolAfterFork(self):
+        np.random.seed(23)
+        data = np.random.randn(1000, 10).astype(np.float32)
+        pool_size = nmslib.getThreadPoolSize()
+        nmslib.setThreadPoolSize(4)
+        try:
+            index = nmslib.init(method='hnsw', space='l2')
+            index.addDataPointBatch(data)
+            index.createIndex()
+            expected = index.knnQueryBatch(data[:100], k=10, num_threads=4)
+
+            pid = os.fork()
+            if pid == 0:
+                # workers of the parent don't exist in the child, new ones should be started
+                results = index.knnQueryBatch(data[:100], k=10, num_threads=4)
+                ok = psutil.Process().num_threads() > 1 and all(
+                    np.array_equal(r[0], e[0]) for r, e in zip(results, expected))
+                os._exit(0 if ok else 1)
+            _, status = os.waitpid(pid, 0)
+            self.assertEqual(os.WEXITSTATUS(status), 0)
+        finally:
+            nmslib.setThreadPoolSize(pool_size)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,8 @@
 #include <iostream>
 #include <sstream>
 #include <stdexcept>
+#include <algorithm>
+#include <cstdint>
 
 #include <thrift/protocol/TBinaryProtocol.h>
 #include <thrift/transport/TSocket.h>
@@ -38,6 +40,7 @@ using std::cout;
 using std::cin;
 using std::endl;
 using std::unique_ptr;
+using std::vector;
 
 using namespace  ::similarity;
 
@@ -51,6 +54,46 @@ enum SearchType {
   kNoSearch, kKNNSearch, kRangeSearch
 };
 
+const string BINARY_DENSE  = "dense";
+const string BINARY_SPARSE = "sparse";
+const string BINARY_UINT8  = "uint8";
+
+/*
+ * Converts a string representation of a query vector into the binary
+ * encoding described in protocol.thrift: an array of float32 values (dense),
+ * of (uint32 id, float32 value) pairs (sparse), or of uint8 values (uint8).
+ */
+string EncodeQueryBinary(const string& queryStr, const string& binaryType) {
+  string line = queryStr;
+  // sparse vectors are written as id:value pairs
+  std::replace(line.begin(), line.end(), ':', ' ');
+  std::replace(line.begin(), line.end(), ',', ' ');
+  stringstream str(line);
+  string res;
+
+  if (binaryType == BINARY_DENSE) {
+    float val;
+    while (str >> val) {
+      res.append(reinterpret_cast<const char*>(&val), sizeof(val));
+    }
+  } else if (binaryType == BINARY_SPARSE) {
+    uint32_t id;
+    float    val;
+    while (str >> id >> val) {
+      res.append(reinterpret_cast<const char*>(&id), sizeof(id));
+      res.append(reinterpret_cast<const char*>(&val), sizeof(val));
+    }
+  } else if (binaryType == BINARY_UINT8) {
+    unsigned val;
+    while (str >> val) {
+      res.push_back(static_cast<char>(static_cast<uint8_t>(val)));
+    }
+  } else {
+    throw std::runtime_error("Unknown binary query type: " + binaryType);
+  }
+  return res;
+}
+
 static void Usage(const char *prog,
                   const po::options_description& desc) {
     std::cout << prog << std::endl
@@ -65,6 +108,13 @@ void ParseCommandLineForClient(int argc, char*argv[],
                       double&                 r,
                       bool&                   retExternId,
                       bool&                   retObj,
+                      bool&                   batch,
+                      string&                 binaryType,
+                      bool&                   cacheStats,
+                      bool&                   serverStats,
+                      string&                 reloadDataFile,
+                      string&                 reloadIndexLoc,
+                      bool&                   reloadCacheData,
                       string&                 queryTimeParams
                       ) {
   po::options_description ProgOptDesc("Allowed options");
@@ -77,6 +127,14 @@ void ParseCommandLineForClient(int argc, char*argv[],
     (QUERY_TIME_PARAMS_PARAM_OPT.c_str(), po::value<string>(&queryTimeParams)->default_value(""), QUERY_TIME_PARAMS_PARAM_MSG.c_str())
     (RET_EXT_ID_PARAM_OPT.c_str(),   RET_EXT_ID_PARAM_MSG.c_str())
     (RET_OBJ_PARAM_OPT.c_str(), RET_EXT_ID_PARAM_MSG.c_str())
+    ("batch",                   "each input line is a separate query, all queries are sent in one batch")
+    ("binary",                  po::value<string>(&binaryType)->default_value(""),
+                                "send queries in the binary form: dense (float32 vectors), sparse (sparse float32 vectors), uint8 (SIFT vectors)")
+    ("cacheStats",              "print statistics of the server query result cache")
+    ("stats",                   "print server request statistics")
+    ("reloadDataFile",          po::value<string>(&reloadDataFile)->default_value(""), "make the server load a new data file (and an index)")
+    ("reloadIndexLoc",          po::value<string>(&reloadIndexLoc)->default_value(""), "make the server load a new index from this location")
+    ("reloadCacheData",         "the server should load new data from the index location (see --cacheData of the server)")
     ;
 
   po::variables_map vm;
@@ -111,6 +169,21 @@ void ParseCommandLineForClient(int argc, char*argv[],
 
   retObj = vm.count("retObj") != 0;
 
+  batch = vm.count("batch") != 0;
+
+  cacheStats = vm.count("cacheStats") != 0;
+
+  serverStats = vm.count("stats") != 0;
+
+  reloadCacheData = vm.count("reloadCacheData") != 0;
+
+  if (!binaryType.empty() && binaryType != BINARY_DENSE &&
+      binaryType != BINARY_SPARSE && binaryType != BINARY_UINT8) {
+    cerr << "Unknown binary query type: " << binaryType << endl;
+    Usage(argv[0], ProgOptDesc);
+    exit(1);
+  }
+
   if (vm.count("help")  ) {
     Usage(argv[0], ProgOptDesc);
     exit(0);
@@ -124,6 +197,13 @@ int main(int argc, char *argv[]) {
   double      r;
   bool        retExternId;
   bool        retObj;
+  bool        batch;
+  string      binaryType;
+  bool        cacheStats;
+  bool        serverStats;
+  string      reloadDataFile;
+  string      reloadIndexLoc;
+  bool        reloadCacheData;
   SearchType  searchType;
   string      queryTimeParams;
 
@@ -134,19 +214,31 @@ int main(int argc, char *argv[]) {
                       k, r,
                       retExternId,
                       retObj,
+                      batch,
+                      binaryType,
+                      cacheStats,
+                      serverStats,
+                      reloadDataFile,
+                      reloadIndexLoc,
+                      reloadCacheData,
                       queryTimeParams);
 
   // Let's read the query from the input stream
-  string        s;
-  stringstream  ss;
+  string          s;
+  stringstream    ss;
+  vector<string>  queryObjStrs;
+  bool            binaryQuery = !binaryType.empty();
 
   if (kNoSearch != searchType) {
     while (getline(cin, s)) {
       ss << s << endl;
+      if (batch && !s.empty()) {
+        queryObjStrs.push_back(binaryQuery ? EncodeQueryBinary(s, binaryType) : s);
+      }
     }
   }
 
-  string queryObjStr = ss.str();
+  string queryObjStr = binaryQuery ? EncodeQueryBinary(ss.str(), binaryType) : ss.str();
 
   ::apache::thrift::stdcxx::shared_ptr<TTransport>   socket(new TSocket(host, port));
   ::apache::thrift::stdcxx::shared_ptr<TTransport>   transport(new TBufferedTransport(socket));
@@ -158,6 +250,12 @@ int main(int argc, char *argv[]) {
 
     try {
 
+      if (!reloadDataFile.empty() || !reloadIndexLoc.empty()) {
+        cout << "Reloading the index" << endl;
+        client.reloadIndex(reloadDataFile, reloadIndexLoc, reloadCacheData);
+        cout << "The index is reloaded" << endl;
+      }
+
       if (!queryTimeParams.empty()) {
         client.setQueryTimeParams(queryTimeParams);
       }
@@ -165,24 +263,62 @@ int main(int argc, char *argv[]) {
       WallClockTimer wtm;
       wtm.reset();
 
-      ReplyEntryList res;
-
-      if (kKNNSearch == searchType) {
-        cout << "Running a " << k << "-NN query" << endl;;
-        client.knnQuery(res, k, queryObjStr, retExternId, retObj);
-      } 
-      if (kRangeSearch == searchType) {
-        cout << "Running a range query with radius = " << r << endl;
-        client.rangeQuery(res, r, queryObjStr, retExternId, retObj);
+      ReplyEntryListList res;
+
+      if (batch) {
+        if (kKNNSearch == searchType) {
+          cout << "Running a batch of " << queryObjStrs.size() << " " << k << "-NN queries" << endl;
+          client.knnQueryBatch(res, k, queryObjStrs, retExternId, retObj, binaryQuery);
+        }
+        if (kRangeSearch == searchType) {
+          cout << "Running a batch of " << queryObjStrs.size() << " range queries with radius = " << r << endl;
+          client.rangeQueryBatch(res, r, queryObjStrs, retExternId, retObj, binaryQuery);
+        }
+      } else {
+        res.resize(1);
+        if (kKNNSearch == searchType) {
+          cout << "Running a " << k << "-NN query" << endl;;
+          client.knnQuery(res[0], k, queryObjStr, retExternId, retObj, binaryQuery);
+        } 
+        if (kRangeSearch == searchType) {
+          cout << "Running a range query with radius = " << r << endl;
+          client.rangeQuery(res[0], r, queryObjStr, retExternId, retObj, binaryQuery);
+        }
       }
 
       wtm.split();
 
       cout << "Finished in: " << wtm.elapsed() / 1e3f << " ms" << endl;
 
-      for (auto e: res) {
-        cout << "id=" << e.id << " dist=" << e.dist << ( retExternId ? " externId=" + e.externId : string("")) << endl; 
-        if (retObj) cout << e.obj << endl;
+      for (size_t qid = 0; qid < res.size(); ++qid) {
+        if (batch) cout << "Query #" << qid << endl;
+        for (auto e: res[qid]) {
+          cout << "id=" << e.id << " dist=" << e.dist << ( retExternId ? " externId=" + e.externId : string("")) << endl; 
+          if (retObj) cout << e.obj << endl;
+        }
+      }
+
+      if (cacheStats) {
+        CacheStats stats;
+        client.getCacheStats(stats);
+        cout << "Cache: hits=" << stats.hitQty << " misses=" << stats.missQty
+             << " entries=" << stats.entryQty << " memory used=" << stats.memUsed
+             << " budget=" << stats.memBudget << endl;
+      }
+
+      if (serverStats) {
+        ServerStats stats;
+        client.getStats(stats);
+        cout << "Uptime: " << stats.uptime << " sec pending connections: " << stats.pendingTaskQty
+             << " idle workers: " << stats.idleWorkerQty << " workers: " << stats.workerQty << endl;
+        vector<MethodStats> methods = stats.methods;
+        methods.push_back(stats.queueWait);
+        for (const MethodStats& m : methods) {
+          cout << m.name << ": requests=" << m.requestQty << " errors=" << m.errorQty
+               << " inFlight=" << m.inFlightQty << " qps=" << m.qps
+               << " p50=" << m.p50 << " p90=" << m.p90 << " p99=" << m.p99 << " p999=" << m.p999
+               << " max=" << m.maxLatency << " ms" << endl;
+        }
       }
     } catch (const QueryException& e) {
       cerr << "Query execution error: " << e.message << endl;
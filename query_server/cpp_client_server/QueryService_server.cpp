@@ -18,6 +18,13 @@
 #include <thread>
 #include <chrono>
 #include <iostream>
+#include <algorithm>
+#include <cstring>
+#include <list>
+#include <unordered_map>
+#include <condition_variable>
+#include <fstream>
+#include <ctime>
 
 #include "QueryService.h"
 #include <thrift/protocol/TBinaryProtocol.h>
@@ -44,6 +51,11 @@
 #include "init.h"
 #include "logging.h"
 #include "ztimer.h"
+#include "thread_pool.h"
+#include "read_data.h"
+#include "space/space_vector.h"
+#include "space/space_sparse_vector.h"
+#include "space/space_l2sqr_sift.h"
 
 #define MAX_SPIN_LOCK_QTY 1000000
 #define SLEEP_DURATION    10
@@ -63,6 +75,9 @@ using std::unique_ptr;
 using std::exception;
 using std::mutex;
 using std::unique_lock;
+using std::runtime_error;
+using std::shared_ptr;
+using std::condition_variable;
 
 using namespace  ::similarity;
 
@@ -84,26 +99,460 @@ private:
   mutex&   mtx_;
 };
 
+/*
+ * Creates a query object from its binary encoding (see protocol.thrift):
+ * a dense vector is an array of float32 values (uint8 values for the space l2sqr_sift),
+ * a sparse vector is an array of (uint32 id, float32 value) pairs. Values are
+ * little-endian, i.e., they are in the native byte order of supported platforms.
+ */
 template <class dist_t>
-class QueryServiceHandler : virtual public QueryServiceIf {
- public:
-  QueryServiceHandler(
-                      bool                               debugPrint,
-                      const string&                      SpaceType,
-                      const AnyParams&                   SpaceParams,
-                      const string&                      DataFile,
-                      unsigned                           MaxNumData,
-                      const string&                      MethodName,
-                      const string&                      LoadIndexLoc,
-                      const string&                      SaveIndexLoc,
-                      bool&                              CacheData,
-                      const AnyParams&                   IndexParams,
-                      const AnyParams&                   QueryTimeParams) :
-    debugPrint_(debugPrint),
-    methName_(MethodName),
-    space_(SpaceFactoryRegistry<dist_t>::Instance().CreateSpace(SpaceType, SpaceParams)),
-    counter_(0)
+unique_ptr<Object> CreateObjFromBinary(const Space<dist_t>& space, const string& buf) {
+  const SpaceL2SqrSift* pSiftSpace = dynamic_cast<const SpaceL2SqrSift*>(&space);
+  if (pSiftSpace != nullptr) {
+    if (buf.size() != SIFT_DIM) {
+      throw runtime_error("A binary SIFT query should have exactly " + ConvertToString(SIFT_DIM) + " bytes");
+    }
+    vector<uint8_t> vect(buf.begin(), buf.end());
+    return unique_ptr<Object>(pSiftSpace->CreateObjFromUint8Vect(0, -1, vect));
+  }
+
+  const VectorSpace<dist_t>* pVectSpace = dynamic_cast<const VectorSpace<dist_t>*>(&space);
+  if (pVectSpace != nullptr) {
+    if (buf.size() % sizeof(float)) {
+      throw runtime_error("The size of a binary dense query should be a multiple of " + ConvertToString(sizeof(float)));
+    }
+    size_t elemQty = buf.size() / sizeof(float);
+    vector<dist_t> vect(elemQty);
+    for (size_t i = 0; i < elemQty; ++i) {
+      float val;
+      memcpy(&val, buf.data() + i * sizeof(float), sizeof(float));
+      vect[i] = static_cast<dist_t>(val);
+    }
+    unique_ptr<Object> res(new Object(0, -1, pVectSpace->GetObjDataLength(elemQty), NULL));
+    pVectSpace->CreateObjDataFromVect(vect.data(), elemQty, res->data());
+    return res;
+  }
+
+  const SpaceSparseVector<dist_t>* pSparseSpace = dynamic_cast<const SpaceSparseVector<dist_t>*>(&space);
+  if (pSparseSpace != nullptr) {
+    const size_t elemSize = sizeof(uint32_t) + sizeof(float);
+    if (buf.size() % elemSize) {
+      throw runtime_error("The size of a binary sparse query should be a multiple of " + ConvertToString(elemSize));
+    }
+    size_t elemQty = buf.size() / elemSize;
+    vector<SparseVectElem<dist_t>> vect(elemQty);
+    for (size_t i = 0; i < elemQty; ++i) {
+      uint32_t id;
+      float    val;
+      memcpy(&id, buf.data() + i * elemSize, sizeof(uint32_t));
+      memcpy(&val, buf.data() + i * elemSize + sizeof(uint32_t), sizeof(float));
+      vect[i] = SparseVectElem<dist_t>(id, static_cast<dist_t>(val));
+    }
+    std::sort(vect.begin(), vect.end());
+    return unique_ptr<Object>(pSparseSpace->CreateObjFromVect(0, -1, vect));
+  }
+
+  throw runtime_error("The space " + space.StrDesc() + " doesn't support binary queries");
+}
+
+/*
+ * A thread-safe LRU cache of query results. The amount of memory
+ * used by the cache is estimated and kept within a given budget (in bytes).
+ * A zero budget disables caching.
+ */
+class QueryResultCache {
+public:
+  explicit QueryResultCache(size_t memBudget) :
+    memBudget_(memBudget), memUsed_(0), hitQty_(0), missQty_(0) {}
+
+  bool enabled() const { return memBudget_ > 0; }
+
+  /*
+   * A cache key is built from all the parameters that affect the answer.
+   * The index generation number is a part of the key, so that queries still
+   * running against a replaced index cannot add stale results. Query-time
+   * parameters are not a part of the key: instead, the cache is cleared
+   * every time they change.
+   */
+  static string MakeKey(char queryType, double param, size_t indexGen, const string& queryObjStr,
+                        bool retExternId, bool retObj, bool binaryQuery) {
+    string key;
+    key.reserve(queryObjStr.size() + sizeof(param) + sizeof(indexGen) + 4);
+    key.push_back(queryType);
+    key.append(reinterpret_cast<const char*>(&param), sizeof(param));
+    key.append(reinterpret_cast<const char*>(&indexGen), sizeof(indexGen));
+    key.push_back(retExternId ? '1' : '0');
+    key.push_back(retObj ? '1' : '0');
+    key.push_back(binaryQuery ? '1' : '0');
+    key.append(queryObjStr);
+    return key;
+  }
+
+  bool get(const string& key, ReplyEntryList& res) {
+    unique_lock<mutex> lock(mtx_);
+    auto it = index_.find(key);
+    if (it == index_.end()) {
+      ++missQty_;
+      return false;
+    }
+    ++hitQty_;
+    // Move the entry to the head of the LRU list
+    lru_.splice(lru_.begin(), lru_, it->second);
+    res = it->second->res_;
+    return true;
+  }
+
+  void put(const string& key, const ReplyEntryList& res) {
+    size_t memSize = EntryMemSize(key, res);
+    if (memSize > memBudget_) return;
+
+    unique_lock<mutex> lock(mtx_);
+    // Another thread could have computed the same result in the meantime
+    if (index_.find(key) != index_.end()) return;
+
+    lru_.push_front(Entry(key, res, memSize));
+    index_[key] = lru_.begin();
+    memUsed_ += memSize;
+
+    while (memUsed_ > memBudget_) {
+      const Entry& e = lru_.back();
+      memUsed_ -= e.memSize_;
+      index_.erase(e.key_);
+      lru_.pop_back();
+    }
+  }
+
+  void clear() {
+    unique_lock<mutex> lock(mtx_);
+    index_.clear();
+    lru_.clear();
+    memUsed_ = 0;
+  }
+
+  void getStats(CacheStats& stats) {
+    unique_lock<mutex> lock(mtx_);
+    stats.__set_hitQty(hitQty_);
+    stats.__set_missQty(missQty_);
+    stats.__set_entryQty(lru_.size());
+    stats.__set_memUsed(memUsed_);
+    stats.__set_memBudget(memBudget_);
+  }
+
+private:
+  struct Entry {
+    Entry(const string& key, const ReplyEntryList& res, size_t memSize) :
+      key_(key), res_(res), memSize_(memSize) {}
+    string          key_;
+    ReplyEntryList  res_;
+    size_t          memSize_;
+  };
+
+  // The key is stored twice: in the LRU list and in the hash index
+  static size_t EntryMemSize(const string& key, const ReplyEntryList& res) {
+    size_t memSize = sizeof(Entry) + 2 * key.size() + 4 * sizeof(void*);
+    for (const ReplyEntry& e : res) {
+      memSize += sizeof(ReplyEntry) + e.externId.size() + e.obj.size();
+    }
+    return memSize;
+  }
+
+  size_t                                                    memBudget_;
+  size_t                                                    memUsed_;
+  size_t                                                    hitQty_;
+  size_t                                                    missQty_;
+  std::list<Entry>                                          lru_;
+  std::unordered_map<string, std::list<Entry>::iterator>    index_;
+  mutex                                                     mtx_;
+};
+
+/*
+ * An HDR-style histogram of latencies in microseconds: values below 64
+ * are counted exactly, larger values are grouped into 32 buckets per
+ * power of two. Thus, the relative precision is about 3%.
+ * The histogram isn't thread-safe.
+ */
+class LatencyHistogram {
+public:
+  LatencyHistogram() : counts_(BUCKET_QTY), totalQty_(0), maxVal_(0) {}
+
+  void add(uint64_t val) {
+    ++counts_[BucketId(val)];
+    ++totalQty_;
+    maxVal_ = std::max(maxVal_, val);
+  }
+
+  uint64_t maxVal() const { return maxVal_; }
+
+  // Returns the largest value that falls into the same bucket as the q-quantile
+  uint64_t quantile(double q) const {
+    if (totalQty_ == 0) return 0;
+    uint64_t rank = std::max<uint64_t>(1, static_cast<uint64_t>(ceil(q * totalQty_)));
+    uint64_t sum = 0;
+    for (size_t i = 0; i < BUCKET_QTY; ++i) {
+      sum += counts_[i];
+      if (sum >= rank) return std::min(BucketMaxVal(i), maxVal_);
+    }
+    return maxVal_;
+  }
+
+private:
+  static const unsigned SUB_BITS   = 6;
+  static const uint64_t SUB_QTY    = 1ULL << SUB_BITS;
+  static const uint64_t HALF_QTY   = SUB_QTY / 2;
+  static const size_t   BUCKET_QTY = SUB_QTY + (64 - SUB_BITS) * HALF_QTY;
+
+  static size_t BucketId(uint64_t val) {
+    if (val < SUB_QTY) return val;
+    unsigned shift = 0;
+    while ((val >> shift) >= SUB_QTY) ++shift;
+    // Now, val >> shift is in [HALF_QTY, SUB_QTY)
+    return SUB_QTY + (shift - 1) * HALF_QTY + ((val >> shift) - HALF_QTY);
+  }
+
+  static uint64_t BucketMaxVal(size_t bucketId) {
+    if (bucketId < SUB_QTY) return bucketId;
+    unsigned shift = (bucketId - SUB_QTY) / HALF_QTY + 1;
+    uint64_t top   = (bucketId - SUB_QTY) % HALF_QTY + HALF_QTY;
+    return ((top + 1) << shift) - 1;
+  }
+
+  vector<uint64_t>  counts_;
+  uint64_t          totalQty_;
+  uint64_t          maxVal_;
+};
+
+// The throughput is computed over this number of seconds
+const unsigned QPS_WINDOW = 60;
+
+inline uint64_t CurrSecond() {
+  return std::chrono::duration_cast<std::chrono::seconds>(
+            std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+/*
+ * Thread-safe statistics of requests of one type: counts, throughput,
+ * and latencies.
+ */
+class RequestStats {
+public:
+  explicit RequestStats(const string& name) :
+    name_(name), requestQty_(0), errorQty_(0), inFlightQty_(0),
+    secCounts_(QPS_WINDOW, std::make_pair(uint64_t(0), uint64_t(0))) {}
+
+  void startRequest() {
+    unique_lock<mutex> lock(mtx_);
+    ++inFlightQty_;
+  }
+
+  void finishRequest(uint64_t latency, bool isError) {
+    uint64_t sec = CurrSecond();
+    unique_lock<mutex> lock(mtx_);
+    --inFlightQty_;
+    ++requestQty_;
+    if (isError) ++errorQty_;
+    latencies_.add(latency);
+
+    std::pair<uint64_t, uint64_t>& slot = secCounts_[sec % QPS_WINDOW];
+    if (slot.first != sec) {
+      slot.first = sec;
+      slot.second = 0;
+    }
+    ++slot.second;
+  }
+
+  void getStats(MethodStats& stats, double uptime) {
+    uint64_t sec = CurrSecond();
+    unique_lock<mutex> lock(mtx_);
+    stats.__set_name(name_);
+    stats.__set_requestQty(requestQty_);
+    stats.__set_errorQty(errorQty_);
+    stats.__set_inFlightQty(inFlightQty_);
+
+    uint64_t recentQty = 0;
+    for (const auto& slot : secCounts_) {
+      if (slot.first + QPS_WINDOW > sec) recentQty += slot.second;
+    }
+    double period = std::min<double>(QPS_WINDOW, uptime);
+    stats.__set_qps(period > 0 ? recentQty / period : 0);
+
+    stats.__set_p50(latencies_.quantile(0.5) / 1e3);
+    stats.__set_p90(latencies_.quantile(0.9) / 1e3);
+    stats.__set_p99(latencies_.quantile(0.99) / 1e3);
+    stats.__set_p999(latencies_.quantile(0.999) / 1e3);
+    stats.__set_maxLatency(latencies_.maxVal() / 1e3);
+  }
+
+private:
+  string            name_;
+  uint64_t          requestQty_;
+  uint64_t          errorQty_;
+  int64_t           inFlightQty_;
+  LatencyHistogram  latencies_;
+  // (second, the number of requests finished during this second)
+  vector<std::pair<uint64_t, uint64_t>> secCounts_;
+  mutex             mtx_;
+};
 
+enum RequestType {
+  kSetQueryTimeParams,
+  kKnnQuery,
+  kKnnQueryBatch,
+  kRangeQuery,
+  kRangeQueryBatch,
+  kGetDistance,
+  kReloadIndex,
+  kRequestTypeQty
+};
+
+const char* const REQUEST_TYPE_NAMES[kRequestTypeQty] = {
+  "setQueryTimeParams",
+  "knnQuery",
+  "knnQueryBatch",
+  "rangeQuery",
+  "rangeQueryBatch",
+  "getDistance",
+  "reloadIndex"
+};
+
+/*
+ * Collects statistics of all server requests as well as the time
+ * client connections wait for a worker thread. Optionally, the statistics
+ * is periodically appended to a file.
+ */
+class StatsCollector {
+public:
+  StatsCollector() : queueWait_("queueWait"), startTime_(std::chrono::steady_clock::now()), stopDump_(false) {
+    for (unsigned i = 0; i < kRequestTypeQty; ++i) {
+      requests_.emplace_back(new RequestStats(REQUEST_TYPE_NAMES[i]));
+    }
+  }
+
+  ~StatsCollector() {
+    {
+      unique_lock<mutex> lock(dumpMtx_);
+      stopDump_ = true;
+    }
+    dumpCond_.notify_all();
+    if (dumpThread_.joinable()) dumpThread_.join();
+  }
+
+  RequestStats& request(RequestType type) { return *requests_[type]; }
+
+  RequestStats& queueWait() { return queueWait_; }
+
+  void setThreadManager(::apache::thrift::stdcxx::shared_ptr<ThreadManager> threadManager) {
+    threadManager_ = threadManager;
+  }
+
+  void getStats(ServerStats& stats) {
+    // startTime_ is immutable: getStats is called concurrently by RPC threads and the dump thread
+    double uptime = std::chrono::duration<double>(std::chrono::steady_clock::now() - startTime_).count();
+
+    stats.__set_uptime(uptime);
+    stats.methods.resize(requests_.size());
+    for (size_t i = 0; i < requests_.size(); ++i) {
+      requests_[i]->getStats(stats.methods[i], uptime);
+    }
+    queueWait_.getStats(stats.queueWait, uptime);
+
+    if (threadManager_) {
+      stats.__set_pendingTaskQty(threadManager_->pendingTaskCount());
+      stats.__set_idleWorkerQty(threadManager_->idleWorkerCount());
+      stats.__set_workerQty(threadManager_->workerCount());
+    }
+  }
+
+  void startDump(const string& fileName, unsigned intervalSec) {
+    dumpThread_ = std::thread([this, fileName, intervalSec]() {
+      unique_lock<mutex> lock(dumpMtx_);
+      while (!dumpCond_.wait_for(lock, std::chrono::seconds(intervalSec), [this]() { return stopDump_; })) {
+        ServerStats stats;
+        getStats(stats);
+
+        std::ofstream out(fileName, std::ios::app);
+        if (!out) {
+          LOG(LIB_ERROR) << "Cannot open the statistics file: " << fileName;
+          continue;
+        }
+        WriteStats(out, stats);
+      }
+    });
+  }
+
+private:
+  static void WriteMethodStats(std::ostream& out, const MethodStats& m) {
+    out << m.name << " requests=" << m.requestQty << " errors=" << m.errorQty
+        << " inFlight=" << m.inFlightQty << " qps=" << m.qps
+        << " p50=" << m.p50 << " p90=" << m.p90 << " p99=" << m.p99 << " p999=" << m.p999
+        << " max=" << m.maxLatency << std::endl;
+  }
+
+  static void WriteStats(std::ostream& out, const ServerStats& stats) {
+    std::time_t t = std::time(nullptr);
+    char        timeStr[64];
+    std::strftime(timeStr, sizeof(timeStr), "%Y-%m-%d %H:%M:%S", std::localtime(&t));
+
+    out << timeStr << " uptime=" << stats.uptime << " pendingTasks=" << stats.pendingTaskQty
+        << " idleWorkers=" << stats.idleWorkerQty << " workers=" << stats.workerQty << std::endl;
+    for (const MethodStats& m : stats.methods) {
+      WriteMethodStats(out, m);
+    }
+    WriteMethodStats(out, stats.queueWait);
+  }
+
+  vector<unique_ptr<RequestStats>>                      requests_;
+  RequestStats                                          queueWait_;
+  const std::chrono::steady_clock::time_point           startTime_;
+  ::apache::thrift::stdcxx::shared_ptr<ThreadManager>   threadManager_;
+
+  std::thread                                           dumpThread_;
+  mutex                                                 dumpMtx_;
+  condition_variable                                    dumpCond_;
+  bool                                                  stopDump_;
+};
+
+/*
+ * Registers a request in statistics for the lifetime of the object.
+ * A request that ends with an exception is counted as an error.
+ */
+class RequestStatsRecorder {
+public:
+  explicit RequestStatsRecorder(RequestStats& stats) : stats_(stats) {
+    stats_.startRequest();
+    wtm_.reset();
+  }
+
+  ~RequestStatsRecorder() {
+    wtm_.split();
+    stats_.finishRequest(wtm_.elapsed(), std::uncaught_exception());
+  }
+
+private:
+  RequestStats&   stats_;
+  WallClockTimer  wtm_;
+};
+
+/*
+ * A data set together with the space and the index created for it.
+ * Queries hold a shared pointer to the state: when the index is reloaded,
+ * queries that are still running finish using the old state,
+ * which is freed afterwards.
+ */
+template <class dist_t>
+struct IndexState {
+  IndexState(
+             const string&                      SpaceType,
+             const AnyParams&                   SpaceParams,
+             const string&                      DataFile,
+             unsigned                           MaxNumData,
+             const string&                      MethodName,
+             const string&                      LoadIndexLoc,
+             const string&                      SaveIndexLoc,
+             bool                               CacheData,
+             const AnyParams&                   IndexParams,
+             size_t                             Gen) :
+    space_(SpaceFactoryRegistry<dist_t>::Instance().CreateSpace(SpaceType, SpaceParams)),
+    gen_(Gen)
   {
     unique_ptr<DataFileInputState> inpState;
 
@@ -132,7 +581,7 @@ class QueryServiceHandler : virtual public QueryServiceIf {
 
     index_.reset(MethodFactoryRegistry<dist_t>::Instance().
                                 CreateMethod(true /* print progress */,
-                                        methName_,
+                                        MethodName,
                                         SpaceType,
                                         *space_.get(),
                                         dataSet_));
@@ -152,16 +601,62 @@ class QueryServiceHandler : virtual public QueryServiceIf {
       index_->SaveIndex(SaveIndexLoc);
       LOG(LIB_INFO) << "The index is saved!";
     }
-
-    LOG(LIB_INFO) << "Setting query-time parameters";
-    index_->SetQueryTimeParams(QueryTimeParams);
   }
 
-  ~QueryServiceHandler() {
+  ~IndexState() {
+    // The index may reference data points, so it is deleted first
+    index_.reset();
     for (auto e: dataSet_) delete e;
   }
 
+  unique_ptr<Space<dist_t>>   space_;
+  vector<string>              externIds_;
+  ObjectVector                dataSet_; 
+  unique_ptr<Index<dist_t>>   index_;
+  // The generation number distinguishes (cached) results of different index copies
+  size_t                      gen_;
+};
+
+template <class dist_t>
+class QueryServiceHandler : virtual public QueryServiceIf {
+ public:
+  QueryServiceHandler(
+                      bool                               debugPrint,
+                      const string&                      SpaceType,
+                      const AnyParams&                   SpaceParams,
+                      const string&                      DataFile,
+                      unsigned                           MaxNumData,
+                      const string&                      MethodName,
+                      const string&                      LoadIndexLoc,
+                      const string&                      SaveIndexLoc,
+                      bool&                              CacheData,
+                      const AnyParams&                   IndexParams,
+                      const AnyParams&                   QueryTimeParams,
+                      size_t                             BatchThreadQty,
+                      size_t                             CacheMemBudget,
+                      StatsCollector&                    Stats) :
+    debugPrint_(debugPrint),
+    methName_(MethodName),
+    spaceType_(SpaceType),
+    spaceParams_(SpaceParams),
+    maxNumData_(MaxNumData),
+    indexParams_(IndexParams),
+    queryTimeParams_(QueryTimeParams),
+    state_(new IndexState<dist_t>(SpaceType, SpaceParams, DataFile, MaxNumData, MethodName,
+                                  LoadIndexLoc, SaveIndexLoc, CacheData, IndexParams, 0)),
+    batchThreadQty_(BatchThreadQty),
+    cache_(CacheMemBudget),
+    stats_(Stats),
+    counter_(0)
+
+  {
+    LOG(LIB_INFO) << "Setting query-time parameters";
+    state_->index_->SetQueryTimeParams(QueryTimeParams);
+  }
+
   void setQueryTimeParams(const string& queryTimeParamStr) {
+    RequestStatsRecorder  rec(stats_.request(kSetQueryTimeParams));
+
     try {
       // Query time parameters are essentially spin-locked
       while (true) {
@@ -176,7 +671,10 @@ class QueryServiceHandler : virtual public QueryServiceIf {
                 LOG(LIB_INFO) << s;
               }
             }
-            index_->SetQueryTimeParams(AnyParams(desc));
+            queryTimeParams_ = AnyParams(desc);
+            state_->index_->SetQueryTimeParams(queryTimeParams_);
+            // Cached results may be different under new parameters
+            cache_.clear();
             return;
           }
         } // the lock will be released in the end of the block
@@ -194,82 +692,100 @@ class QueryServiceHandler : virtual public QueryServiceIf {
     }
   }
 
-  void rangeQuery(ReplyEntryList& _return, const double r, const string& queryObjStr, 
-                  const bool retExternId, const bool retObj) {
-    // This will increase the counter and prevent modification of query time parameters.
-    LockedCounterManager  mngr(counter_, mtx_);
+  void reloadIndex(const string& dataFile, const string& loadIndexLoc, const bool cacheData) {
+    RequestStatsRecorder  rec(stats_.request(kReloadIndex));
+
+    // Only one index copy is loaded at a time
+    unique_lock<mutex> reloadLock(reloadMtx_, std::try_to_lock);
 
     try {
-      if (debugPrint_) {
-        LOG(LIB_INFO) << "Running a range query, r=" << r << " retExternId=" << retExternId << " retObj=" << retObj;
+      if (!reloadLock.owns_lock()) {
+        throw runtime_error("Another index reload is in progress");
       }
+      if (!cacheData && !DoesFileExist(dataFile)) {
+        throw runtime_error("data file " + dataFile + " doesn't exist");
+      }
+      LOG(LIB_INFO) << "Reloading the index, data file: '" << dataFile << "' index location: '" << loadIndexLoc << "'";
+
       WallClockTimer wtm;
 
       wtm.reset();
 
-      unique_ptr<Object>  queryObj(space_->CreateObjFromStr(0, -1, queryObjStr, NULL));
+      // Queries keep running against the current index while the new one is loaded
+      shared_ptr<IndexState<dist_t>> newState(new IndexState<dist_t>(spaceType_, spaceParams_, dataFile, maxNumData_,
+                                                                     methName_, loadIndexLoc, "" /* don't save */,
+                                                                     cacheData, indexParams_, ++indexGen_));
+      {
+        unique_lock<mutex> lock(mtx_);
+        newState->index_->SetQueryTimeParams(queryTimeParams_);
+        state_.swap(newState);
+        cache_.clear();
+      }
+      // newState now points to the old index: it is deleted here, unless
+      // it is still used by some queries. Then, the last of them deletes it.
+      newState.reset();
 
-      RangeQuery<dist_t> range(*space_, queryObj.get(), r);
-      index_->Search(&range, -1);
+      wtm.split();
 
-      _return.clear();
+      LOG(LIB_INFO) << "The index is reloaded in: " << wtm.elapsed() / 1e6f << " sec";
+    } catch (const exception& e) {
+        QueryException qe;
+        qe.__set_message(e.what());
+        throw qe;
+    } catch (...) {
+        QueryException qe;
+        qe.__set_message("Unknown exception");
+        throw qe;
+    }
+  }
 
-      wtm.split();
+  void rangeQuery(ReplyEntryList& _return, const double r, const string& queryObjStr, 
+                  const bool retExternId, const bool retObj, const bool binaryQuery) {
+    RequestStatsRecorder  rec(stats_.request(kRangeQuery));
+    // This will increase the counter and prevent modification of query time parameters.
+    LockedCounterManager  mngr(counter_, mtx_);
 
-      if (debugPrint_) {
-        LOG(LIB_INFO) << "Finished in: " << wtm.elapsed() / 1e3f << " ms";
-      }
+    try {
+      execRangeQuery(*getState(), _return, r, queryObjStr, retExternId, retObj, binaryQuery);
+    } catch (const exception& e) {
+        QueryException qe;
+        qe.__set_message(e.what());
+        throw qe;
+    } catch (...) {
+        QueryException qe;
+        qe.__set_message("Unknown exception");
+        throw qe;
+    }
+  }
 
-      vector<IdType> ids;
-      vector<double> dists;
-      vector<string> externIds;
-      vector<string> objs;
+  void rangeQueryBatch(ReplyEntryListList& _return, const double r, const vector<string>& queryObjStrs,
+                       const bool retExternId, const bool retObj, const bool binaryQuery) {
+    RequestStatsRecorder  rec(stats_.request(kRangeQueryBatch));
+    // This will increase the counter and prevent modification of query time parameters.
+    LockedCounterManager  mngr(counter_, mtx_);
 
-     
-      if (debugPrint_) { 
-        LOG(LIB_INFO) << "Results: ";
+    try {
+      if (debugPrint_) {
+        LOG(LIB_INFO) << "Running a batch of " << queryObjStrs.size() << " range queries";
       }
-      
-      const ObjectVector&     vResObjs  = *range.Result(); 
-      const vector<dist_t>&   vResDists = *range.ResultDists();
-
-      for (size_t i = 0; i < vResObjs.size(); ++i) {
-        const Object* pObj = vResObjs[i];
-        dist_t dist        = vResDists[i];
+      WallClockTimer wtm;
 
-        ReplyEntry e;
+      wtm.reset();
 
-        e.__set_id(pObj->id());
-        e.__set_dist(dist);
+      // All queries of a batch use the same index copy
+      shared_ptr<IndexState<dist_t>> state = getState();
 
-        if (debugPrint_) {
-          ids.insert(ids.begin(), e.id);
-          dists.insert(dists.begin(), e.dist);
-        }
+      _return.clear();
+      _return.resize(queryObjStrs.size());
 
-        string externId;
+      ParallelFor(0, queryObjStrs.size(), batchThreadQty_, [&](size_t qid, size_t threadId) {
+        execRangeQuery(*state, _return[qid], r, queryObjStrs[qid], retExternId, retObj, binaryQuery);
+      });
 
-        if (retExternId || retObj) {
-          CHECK(e.id < externIds_.size());
-          externId = externIds_[e.id];
-          e.__set_externId(externId);
-          externIds.insert(externIds.begin(), e.externId);
-        }
+      wtm.split();
 
-        if (retObj) {
-          const string& s = space_->CreateStrFromObj(pObj, externId);
-          e.__set_obj(s);
-          if (debugPrint_) {
-            objs.insert(objs.begin(), s);
-          }
-        }
-        _return.insert(_return.begin(), e);
-      }
       if (debugPrint_) {
-        for (size_t i = 0; i < ids.size(); ++i) {
-          LOG(LIB_INFO) << "id=" << ids[i] << " dist=" << dists[i] << ( retExternId ? " " + externIds[i] : string(""));
-          if (retObj) LOG(LIB_INFO) << objs[i]; 
-        }
+        LOG(LIB_INFO) << "The batch is finished in: " << wtm.elapsed() / 1e3f << " ms";
       }
     } catch (const exception& e) {
         QueryException qe;
@@ -283,6 +799,8 @@ class QueryServiceHandler : virtual public QueryServiceIf {
   }
 
   double getDistance(const std::string& objStr1, const std::string& objStr2) {
+    RequestStatsRecorder  rec(stats_.request(kGetDistance));
+
     try {
       if (debugPrint_) {
         LOG(LIB_INFO) << "Computing the distance between two objects";
@@ -292,10 +810,13 @@ class QueryServiceHandler : virtual public QueryServiceIf {
 
       wtm.reset();
 
-      unique_ptr<Object>  obj1(space_->CreateObjFromStr(0, -1, objStr1, NULL));
-      unique_ptr<Object>  obj2(space_->CreateObjFromStr(0, -1, objStr2, NULL));
+      shared_ptr<IndexState<dist_t>> state = getState();
+      const Space<dist_t>& space = *state->space_;
+
+      unique_ptr<Object>  obj1(space.CreateObjFromStr(0, -1, objStr1, NULL));
+      unique_ptr<Object>  obj2(space.CreateObjFromStr(0, -1, objStr2, NULL));
 
-      double res = space_->IndexTimeDistance(obj1.get(), obj2.get());
+      double res = space.IndexTimeDistance(obj1.get(), obj2.get());
 
       wtm.split();
 
@@ -315,105 +836,339 @@ class QueryServiceHandler : virtual public QueryServiceIf {
     }
   }
 
+  void getStats(ServerStats& _return) {
+    stats_.getStats(_return);
+  }
+
+  void getCacheStats(CacheStats& _return) {
+    cache_.getStats(_return);
+    if (debugPrint_) {
+      LOG(LIB_INFO) << "Cache stats: hits=" << _return.hitQty << " misses=" << _return.missQty
+                    << " entries=" << _return.entryQty << " memory used=" << _return.memUsed;
+    }
+  }
+
   void knnQuery(ReplyEntryList& _return, const int32_t k, 
-                const std::string& queryObjStr, const bool retExternId, const bool retObj) {
+                const std::string& queryObjStr, const bool retExternId, const bool retObj,
+                const bool binaryQuery) {
+    RequestStatsRecorder  rec(stats_.request(kKnnQuery));
+    // This will increase the counter and prevent modification of query time parameters.
+    LockedCounterManager  mngr(counter_, mtx_);
+
+    try {
+      execKnnQuery(*getState(), _return, k, queryObjStr, retExternId, retObj, binaryQuery);
+    } catch (const exception& e) {
+        QueryException qe;
+        qe.__set_message(e.what());
+        throw qe;
+    } catch (...) {
+        QueryException qe;
+        qe.__set_message("Unknown exception");
+        throw qe;
+    }
+  }
+
+  void knnQueryBatch(ReplyEntryListList& _return, const int32_t k,
+                     const vector<string>& queryObjStrs, const bool retExternId, const bool retObj,
+                     const bool binaryQuery) {
+    RequestStatsRecorder  rec(stats_.request(kKnnQueryBatch));
     // This will increase the counter and prevent modification of query time parameters.
     LockedCounterManager  mngr(counter_, mtx_);
 
     try {
       if (debugPrint_) {
-        LOG(LIB_INFO) << "Running a " << k << "-NN query" << " retExternId=" << retExternId << " retObj=" << retObj;
+        LOG(LIB_INFO) << "Running a batch of " << queryObjStrs.size() << " " << k << "-NN queries";
       }
       WallClockTimer wtm;
 
       wtm.reset();
 
-      unique_ptr<Object>  queryObj(space_->CreateObjFromStr(0, -1, queryObjStr, NULL));
-
-      KNNQuery<dist_t> knn(*space_, queryObj.get(), k);
-      index_->Search(&knn, -1);
-      unique_ptr<KNNQueue<dist_t>> res(knn.Result()->Clone());
+      // All queries of a batch use the same index copy
+      shared_ptr<IndexState<dist_t>> state = getState();
 
       _return.clear();
+      _return.resize(queryObjStrs.size());
+
+      ParallelFor(0, queryObjStrs.size(), batchThreadQty_, [&](size_t qid, size_t threadId) {
+        execKnnQuery(*state, _return[qid], k, queryObjStrs[qid], retExternId, retObj, binaryQuery);
+      });
 
       wtm.split();
 
       if (debugPrint_) {
-        LOG(LIB_INFO) << "Finished in: " << wtm.elapsed() / 1e3f << " ms";
+        LOG(LIB_INFO) << "The batch is finished in: " << wtm.elapsed() / 1e3f << " ms";
       }
+    } catch (const exception& e) {
+        QueryException qe;
+        qe.__set_message(e.what());
+        throw qe;
+    } catch (...) {
+        QueryException qe;
+        qe.__set_message("Unknown exception");
+        throw qe;
+    }
+  }
+
+ private:
+  shared_ptr<IndexState<dist_t>> getState() {
+    unique_lock<mutex> lock(mtx_);
+    return state_;
+  }
 
-      vector<IdType> ids;
-      vector<double> dists;
-      vector<string> objs;
-      vector<string> externIds;
+  // Executes a single range query: the caller must hold the query counter
+  void execRangeQuery(const IndexState<dist_t>& state, ReplyEntryList& _return, const double r, const string& queryObjStr,
+                      const bool retExternId, const bool retObj, const bool binaryQuery) {
+    if (debugPrint_) {
+      LOG(LIB_INFO) << "Running a range query, r=" << r << " retExternId=" << retExternId << " retObj=" << retObj;
+    }
 
-     
-      if (debugPrint_) { 
-        LOG(LIB_INFO) << "Results: ";
+    string cacheKey;
+    if (cache_.enabled()) {
+      cacheKey = QueryResultCache::MakeKey('r', r, state.gen_, queryObjStr, retExternId, retObj, binaryQuery);
+      if (cache_.get(cacheKey, _return)) {
+        if (debugPrint_) {
+          LOG(LIB_INFO) << "The result is found in the cache";
+        }
+        return;
       }
+    }
 
-      while (!res->Empty()) {
-        const Object* topObj = res->TopObject();
-        dist_t topDist = res->TopDistance();
+    WallClockTimer wtm;
 
-        ReplyEntry e;
+    wtm.reset();
 
-        e.__set_id(topObj->id());
-        e.__set_dist(topDist);
+    unique_ptr<Object>  queryObj(binaryQuery ? CreateObjFromBinary(*state.space_, queryObjStr) :
+                                               state.space_->CreateObjFromStr(0, -1, queryObjStr, NULL));
 
-        if (debugPrint_) {
-          ids.insert(ids.begin(), e.id);
-          dists.insert(dists.begin(), e.dist);
-        }
+    RangeQuery<dist_t> range(*state.space_, queryObj.get(), r);
+    state.index_->Search(&range, -1);
 
-        string externId;
+    _return.clear();
 
-        if (retExternId || retObj) {
-          CHECK(e.id < externIds_.size());
-          externId = externIds_[e.id];
-          e.__set_externId(externId);
-          externIds.insert(externIds.begin(), e.externId);
-        }
+    wtm.split();
 
-        if (retObj) {
-          const string& s = space_->CreateStrFromObj(topObj, externId);
-          e.__set_obj(s);
-          if (debugPrint_) {
-            objs.insert(objs.begin(), s);
-          }
+    if (debugPrint_) {
+      LOG(LIB_INFO) << "Finished in: " << wtm.elapsed() / 1e3f << " ms";
+    }
+
+    vector<IdType> ids;
+    vector<double> dists;
+    vector<string> externIds;
+    vector<string> objs;
+
+   
+    if (debugPrint_) { 
+      LOG(LIB_INFO) << "Results: ";
+    }
+    
+    const ObjectVector&     vResObjs  = *range.Result(); 
+    const vector<dist_t>&   vResDists = *range.ResultDists();
+
+    for (size_t i = 0; i < vResObjs.size(); ++i) {
+      const Object* pObj = vResObjs[i];
+      dist_t dist        = vResDists[i];
+
+      ReplyEntry e;
+
+      e.__set_id(pObj->id());
+      e.__set_dist(dist);
+
+      if (debugPrint_) {
+        ids.insert(ids.begin(), e.id);
+        dists.insert(dists.begin(), e.dist);
+      }
+
+      string externId;
+
+      if (retExternId || retObj) {
+        CHECK(e.id < state.externIds_.size());
+        externId = state.externIds_[e.id];
+        e.__set_externId(externId);
+        externIds.insert(externIds.begin(), e.externId);
+      }
+
+      if (retObj) {
+        const string& s = state.space_->CreateStrFromObj(pObj, externId);
+        e.__set_obj(s);
+        if (debugPrint_) {
+          objs.insert(objs.begin(), s);
         }
-        _return.insert(_return.begin(), e);
-        res->Pop();
       }
-      if (debugPrint_) {
-        for (size_t i = 0; i < ids.size(); ++i) {
-          LOG(LIB_INFO) << "id=" << ids[i] << " dist=" << dists[i] << ( retExternId ? " " + externIds[i] : string(""));
-          if (retObj) LOG(LIB_INFO) << objs[i]; 
+      _return.insert(_return.begin(), e);
+    }
+    if (debugPrint_) {
+      for (size_t i = 0; i < ids.size(); ++i) {
+        LOG(LIB_INFO) << "id=" << ids[i] << " dist=" << dists[i] << ( retExternId ? " " + externIds[i] : string(""));
+        if (retObj) LOG(LIB_INFO) << objs[i]; 
+      }
+    }
+    if (cache_.enabled()) {
+      cache_.put(cacheKey, _return);
+    }
+  }
+
+  // Executes a single k-NN query: the caller must hold the query counter
+  void execKnnQuery(const IndexState<dist_t>& state, ReplyEntryList& _return, const int32_t k,
+                    const std::string& queryObjStr, const bool retExternId, const bool retObj,
+                    const bool binaryQuery) {
+    if (debugPrint_) {
+      LOG(LIB_INFO) << "Running a " << k << "-NN query" << " retExternId=" << retExternId << " retObj=" << retObj;
+    }
+
+    string cacheKey;
+    if (cache_.enabled()) {
+      cacheKey = QueryResultCache::MakeKey('k', k, state.gen_, queryObjStr, retExternId, retObj, binaryQuery);
+      if (cache_.get(cacheKey, _return)) {
+        if (debugPrint_) {
+          LOG(LIB_INFO) << "The result is found in the cache";
         }
+        return;
       }
-    } catch (const exception& e) {
-        QueryException qe;
-        qe.__set_message(e.what());
-        throw qe;
-    } catch (...) {
-        QueryException qe;
-        qe.__set_message("Unknown exception");
-        throw qe;
     }
 
+    WallClockTimer wtm;
+
+    wtm.reset();
+
+    unique_ptr<Object>  queryObj(binaryQuery ? CreateObjFromBinary(*state.space_, queryObjStr) :
+                                               state.space_->CreateObjFromStr(0, -1, queryObjStr, NULL));
+
+    KNNQuery<dist_t> knn(*state.space_, queryObj.get(), k);
+    state.index_->Search(&knn, -1);
+    unique_ptr<KNNQueue<dist_t>> res(knn.Result()->Clone());
+
+    _return.clear();
+
+    wtm.split();
+
+    if (debugPrint_) {
+      LOG(LIB_INFO) << "Finished in: " << wtm.elapsed() / 1e3f << " ms";
+    }
+
+    vector<IdType> ids;
+    vector<double> dists;
+    vector<string> objs;
+    vector<string> externIds;
+
+   
+    if (debugPrint_) { 
+      LOG(LIB_INFO) << "Results: ";
+    }
+
+    while (!res->Empty()) {
+      const Object* topObj = res->TopObject();
+      dist_t topDist = res->TopDistance();
+
+      ReplyEntry e;
 
+      e.__set_id(topObj->id());
+      e.__set_dist(topDist);
+
+      if (debugPrint_) {
+        ids.insert(ids.begin(), e.id);
+        dists.insert(dists.begin(), e.dist);
+      }
+
+      string externId;
+
+      if (retExternId || retObj) {
+        CHECK(e.id < state.externIds_.size());
+        externId = state.externIds_[e.id];
+        e.__set_externId(externId);
+        externIds.insert(externIds.begin(), e.externId);
+      }
+
+      if (retObj) {
+        const string& s = state.space_->CreateStrFromObj(topObj, externId);
+        e.__set_obj(s);
+        if (debugPrint_) {
+          objs.insert(objs.begin(), s);
+        }
+      }
+      _return.insert(_return.begin(), e);
+      res->Pop();
+    }
+    if (debugPrint_) {
+      for (size_t i = 0; i < ids.size(); ++i) {
+        LOG(LIB_INFO) << "id=" << ids[i] << " dist=" << dists[i] << ( retExternId ? " " + externIds[i] : string(""));
+        if (retObj) LOG(LIB_INFO) << objs[i]; 
+      }
+    }
+    if (cache_.enabled()) {
+      cache_.put(cacheKey, _return);
+    }
   }
 
- private:
   bool                        debugPrint_;
   string                      methName_;
-  unique_ptr<Space<dist_t>>   space_;
-  unique_ptr<Index<dist_t>>   index_;
-  vector<string>              externIds_;
-  ObjectVector                dataSet_; 
+  string                      spaceType_;
+  AnyParams                   spaceParams_;
+  unsigned                    maxNumData_;
+  AnyParams                   indexParams_;
+  AnyParams                   queryTimeParams_;
+  // The state is modified only while holding mtx_
+  shared_ptr<IndexState<dist_t>> state_;
+  size_t                      batchThreadQty_;
+  QueryResultCache            cache_;
+  StatsCollector&             stats_;
 
   int                         counter_; 
   mutex                       mtx_;
+  mutex                       reloadMtx_;
+  size_t                      indexGen_ = 0;
+};
+
+/*
+ * Wraps a task (a client connection) to measure how long it waits for a worker thread.
+ */
+class QueueTimedTask : public Runnable {
+public:
+  QueueTimedTask(const ::apache::thrift::stdcxx::shared_ptr<Runnable>& task, RequestStats& waitStats) :
+    task_(task), waitStats_(waitStats), started_(false) {
+    waitStats_.startRequest();
+    wtm_.reset();
+  }
+
+  ~QueueTimedTask() {
+    // The task has expired or was removed without running
+    if (!started_) {
+      wtm_.split();
+      waitStats_.finishRequest(wtm_.elapsed(), true);
+    }
+  }
+
+  void run() {
+    wtm_.split();
+    started_ = true;
+    waitStats_.finishRequest(wtm_.elapsed(), false);
+    task_->run();
+  }
+
+private:
+  ::apache::thrift::stdcxx::shared_ptr<Runnable>  task_;
+  RequestStats&                                   waitStats_;
+  WallClockTimer                                  wtm_;
+  bool                                            started_;
+};
+
+class TimedThreadPoolServer : public TThreadPoolServer {
+public:
+  using TThreadPoolServer::TThreadPoolServer;
+
+  void setStats(StatsCollector* stats) { stats_ = stats; }
+
+protected:
+  void onClientConnected(const ::apache::thrift::stdcxx::shared_ptr<TConnectedClient>& pClient) {
+    if (stats_ == nullptr) {
+      TThreadPoolServer::onClientConnected(pClient);
+      return;
+    }
+    getThreadManager()->add(::apache::thrift::stdcxx::shared_ptr<Runnable>(new QueueTimedTask(pClient, stats_->queueWait())),
+                            getTimeout(), getTaskExpiration());
+  }
+
+private:
+  StatsCollector* stats_ = nullptr;
 };
 
 namespace po = boost::program_options;
@@ -431,6 +1186,10 @@ void ParseCommandLineForServer(int argc, char*argv[],
                       bool&                   CacheData,
                       int&                    port,
                       size_t&                 threadQty,
+                      size_t&                 batchThreadQty,
+                      size_t&                 cacheSizeMB,
+                      string&                 StatsFile,
+                      unsigned&               StatsInterval,
                       string&                 LogFile,
                       string&                 DistType,
                       string&                 SpaceType,
@@ -453,6 +1212,10 @@ void ParseCommandLineForServer(int argc, char*argv[],
     (DEBUG_PARAM_OPT.c_str(),         po::bool_switch(&debugPrint), DEBUG_PARAM_MSG.c_str())
     (PORT_PARAM_OPT.c_str(),          po::value<int>(&port)->required(), PORT_PARAM_MSG.c_str())
     (THREAD_PARAM_OPT.c_str(),        po::value<size_t>(&threadQty)->default_value(defaultThreadQty), THREAD_PARAM_MSG.c_str())
+    ("batchThreadQty",                po::value<size_t>(&batchThreadQty)->default_value(0), "a number of threads to process a batch of queries (0 means one thread per core)")
+    ("cacheSizeMB",                   po::value<size_t>(&cacheSizeMB)->default_value(0), "a memory budget (in MB) of the query result cache (0 disables the cache)")
+    ("statsFile",                     po::value<string>(&StatsFile)->default_value(""), "periodically append request statistics to this file")
+    ("statsInterval",                 po::value<unsigned>(&StatsInterval)->default_value(60), "an interval (in seconds) between two statistics dumps")
     (LOG_FILE_PARAM_OPT.c_str(),      po::value<string>(&LogFile)->default_value(LOG_FILE_PARAM_DEFAULT), LOG_FILE_PARAM_MSG.c_str())
     (SPACE_TYPE_PARAM_OPT.c_str(),    po::value<string>(&spaceParamStr)->required(),                SPACE_TYPE_PARAM_MSG.c_str())
     (DIST_TYPE_PARAM_OPT.c_str(),     po::value<string>(&DistType)->default_value(DIST_TYPE_FLOAT), DIST_TYPE_PARAM_MSG.c_str())
@@ -485,6 +1248,11 @@ void ParseCommandLineForServer(int argc, char*argv[],
     LOG(LIB_FATAL) << "There should be exactly one method specified!";
   }
 
+  if (StatsInterval == 0) {
+    Usage(argv[0], ProgOptDesc);
+    LOG(LIB_FATAL) << "The statistics dump interval should be positive!";
+  }
+
   ToLower(DistType);
   ToLower(spaceParamStr);
   ToLower(MethodName);
@@ -525,6 +1293,10 @@ int main(int argc, char *argv[]) {
   bool        debugPrint = 0;
   int         port = 0;
   size_t      threadQty = 0;
+  size_t      batchThreadQty = 0;
+  size_t      cacheSizeMB = 0;
+  string      StatsFile;
+  unsigned    StatsInterval = 0;
   string      LogFile;
   string      DistType;
   string      SpaceType;
@@ -547,6 +1319,10 @@ int main(int argc, char *argv[]) {
                       CacheData,
                       port,
                       threadQty,
+                      batchThreadQty,
+                      cacheSizeMB,
+                      StatsFile,
+                      StatsInterval,
                       LogFile,
                       DistType,
                       SpaceType,
@@ -562,6 +1338,12 @@ int main(int argc, char *argv[]) {
 
   ToLower(DistType);
 
+  StatsCollector               stats;
+  if (!StatsFile.empty()) {
+    LOG(LIB_INFO) << "Statistics is saved to " << StatsFile << " every " << StatsInterval << " sec";
+    stats.startDump(StatsFile, StatsInterval);
+  }
+
   unique_ptr<QueryServiceIf>   queryHandler;
 
   if (DIST_TYPE_INT == DistType) {
@@ -575,7 +1357,10 @@ int main(int argc, char *argv[]) {
                                                     SaveIndexLoc,
                                                     CacheData,
                                                     *IndexParams,
-                                                    *QueryTimeParams));
+                                                    *QueryTimeParams,
+                                                    batchThreadQty,
+                                                    cacheSizeMB * 1024 * 1024,
+                                                    stats));
   } else if (DIST_TYPE_FLOAT == DistType) {
     queryHandler.reset(new QueryServiceHandler<float>(debugPrint,
                                                     SpaceType,
@@ -587,7 +1372,10 @@ int main(int argc, char *argv[]) {
                                                     SaveIndexLoc,
                                                     CacheData,
                                                     *IndexParams,
-                                                    *QueryTimeParams));
+                                                    *QueryTimeParams,
+                                                    batchThreadQty,
+                                                    cacheSizeMB * 1024 * 1024,
+                                                    stats));
   } else if (DIST_TYPE_DOUBLE == DistType) {
     queryHandler.reset(new QueryServiceHandler<double>(debugPrint,
                                                     SpaceType,
@@ -599,7 +1387,10 @@ int main(int argc, char *argv[]) {
                                                     SaveIndexLoc,
                                                     CacheData,
                                                     *IndexParams,
-                                                    *QueryTimeParams));
+                                                    *QueryTimeParams,
+                                                    batchThreadQty,
+                                                    cacheSizeMB * 1024 * 1024,
+                                                    stats));
   
   } else {
     LOG(LIB_FATAL) << "Unknown distance value type: " << DistType;
@@ -619,11 +1410,13 @@ int main(int argc, char *argv[]) {
   ::apache::thrift::stdcxx::shared_ptr<PosixThreadFactory> threadFactory = ::apache::thrift::stdcxx::shared_ptr<PosixThreadFactory>(new PosixThreadFactory());
   threadManager->threadFactory(threadFactory);
   threadManager->start();
-  TThreadPoolServer server(processor,
-                           serverTransport,
-                           transportFactory,
-                           protocolFactory,
-                           threadManager);
+  stats.setThreadManager(threadManager);
+  TimedThreadPoolServer server(processor,
+                               serverTransport,
+                               transportFactory,
+                               protocolFactory,
+                               threadManager);
+  server.setStats(&stats);
   LOG(LIB_INFO) << "Started a server with a " << threadQty << " thread-pool.";
 #endif
   server.serve();
@@ -260,6 +260,14 @@ uint32_t QueryService_knnQuery_args::read(::apache::thrift::protocol::TProtocol*
           xfer += iprot->skip(ftype);
         }
         break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->binaryQuery);
+          this->__isset.binaryQuery = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -301,6 +309,10 @@ uint32_t QueryService_knnQuery_args::write(::apache::thrift::protocol::TProtocol
   xfer += oprot->writeBool(this->retObj);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool(this->binaryQuery);
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -332,6 +344,10 @@ uint32_t QueryService_knnQuery_pargs::write(::apache::thrift::protocol::TProtoco
   xfer += oprot->writeBool((*(this->retObj)));
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool((*(this->binaryQuery)));
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -367,14 +383,14 @@ uint32_t QueryService_knnQuery_result::read(::apache::thrift::protocol::TProtoco
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->success.clear();
-            uint32_t _size4;
-            ::apache::thrift::protocol::TType _etype7;
-            xfer += iprot->readListBegin(_etype7, _size4);
-            this->success.resize(_size4);
-            uint32_t _i8;
-            for (_i8 = 0; _i8 < _size4; ++_i8)
+            uint32_t _size16;
+            ::apache::thrift::protocol::TType _etype19;
+            xfer += iprot->readListBegin(_etype19, _size16);
+            this->success.resize(_size16);
+            uint32_t _i20;
+            for (_i20 = 0; _i20 < _size16; ++_i20)
             {
-              xfer += this->success[_i8].read(iprot);
+              xfer += this->success[_i20].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -413,10 +429,10 @@ uint32_t QueryService_knnQuery_result::write(::apache::thrift::protocol::TProtoc
     xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_LIST, 0);
     {
       xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->success.size()));
-      std::vector<ReplyEntry> ::const_iterator _iter9;
-      for (_iter9 = this->success.begin(); _iter9 != this->success.end(); ++_iter9)
+      std::vector<ReplyEntry> ::const_iterator _iter21;
+      for (_iter21 = this->success.begin(); _iter21 != this->success.end(); ++_iter21)
       {
-        xfer += (*_iter9).write(oprot);
+        xfer += (*_iter21).write(oprot);
       }
       xfer += oprot->writeListEnd();
     }
@@ -461,14 +477,14 @@ uint32_t QueryService_knnQuery_presult::read(::apache::thrift::protocol::TProtoc
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             (*(this->success)).clear();
-            uint32_t _size10;
-            ::apache::thrift::protocol::TType _etype13;
-            xfer += iprot->readListBegin(_etype13, _size10);
-            (*(this->success)).resize(_size10);
-            uint32_t _i14;
-            for (_i14 = 0; _i14 < _size10; ++_i14)
+            uint32_t _size22;
+            ::apache::thrift::protocol::TType _etype25;
+            xfer += iprot->readListBegin(_etype25, _size22);
+            (*(this->success)).resize(_size22);
+            uint32_t _i26;
+            for (_i26 = 0; _i26 < _size22; ++_i26)
             {
-              xfer += (*(this->success))[_i14].read(iprot);
+              xfer += (*(this->success))[_i26].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -559,6 +575,14 @@ uint32_t QueryService_rangeQuery_args::read(::apache::thrift::protocol::TProtoco
           xfer += iprot->skip(ftype);
         }
         break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->binaryQuery);
+          this->__isset.binaryQuery = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -600,6 +624,10 @@ uint32_t QueryService_rangeQuery_args::write(::apache::thrift::protocol::TProtoc
   xfer += oprot->writeBool(this->retObj);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool(this->binaryQuery);
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -631,6 +659,10 @@ uint32_t QueryService_rangeQuery_pargs::write(::apache::thrift::protocol::TProto
   xfer += oprot->writeBool((*(this->retObj)));
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool((*(this->binaryQuery)));
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -666,14 +698,14 @@ uint32_t QueryService_rangeQuery_result::read(::apache::thrift::protocol::TProto
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->success.clear();
-            uint32_t _size15;
-            ::apache::thrift::protocol::TType _etype18;
-            xfer += iprot->readListBegin(_etype18, _size15);
-            this->success.resize(_size15);
-            uint32_t _i19;
-            for (_i19 = 0; _i19 < _size15; ++_i19)
+            uint32_t _size27;
+            ::apache::thrift::protocol::TType _etype30;
+            xfer += iprot->readListBegin(_etype30, _size27);
+            this->success.resize(_size27);
+            uint32_t _i31;
+            for (_i31 = 0; _i31 < _size27; ++_i31)
             {
-              xfer += this->success[_i19].read(iprot);
+              xfer += this->success[_i31].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -712,10 +744,10 @@ uint32_t QueryService_rangeQuery_result::write(::apache::thrift::protocol::TProt
     xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_LIST, 0);
     {
       xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->success.size()));
-      std::vector<ReplyEntry> ::const_iterator _iter20;
-      for (_iter20 = this->success.begin(); _iter20 != this->success.end(); ++_iter20)
+      std::vector<ReplyEntry> ::const_iterator _iter32;
+      for (_iter32 = this->success.begin(); _iter32 != this->success.end(); ++_iter32)
       {
-        xfer += (*_iter20).write(oprot);
+        xfer += (*_iter32).write(oprot);
       }
       xfer += oprot->writeListEnd();
     }
@@ -760,14 +792,14 @@ uint32_t QueryService_rangeQuery_presult::read(::apache::thrift::protocol::TProt
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             (*(this->success)).clear();
-            uint32_t _size21;
-            ::apache::thrift::protocol::TType _etype24;
-            xfer += iprot->readListBegin(_etype24, _size21);
-            (*(this->success)).resize(_size21);
-            uint32_t _i25;
-            for (_i25 = 0; _i25 < _size21; ++_i25)
+            uint32_t _size33;
+            ::apache::thrift::protocol::TType _etype36;
+            xfer += iprot->readListBegin(_etype36, _size33);
+            (*(this->success)).resize(_size33);
+            uint32_t _i37;
+            for (_i37 = 0; _i37 < _size33; ++_i37)
             {
-              xfer += (*(this->success))[_i25].read(iprot);
+              xfer += (*(this->success))[_i37].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -797,11 +829,11 @@ uint32_t QueryService_rangeQuery_presult::read(::apache::thrift::protocol::TProt
 }
 
 
-QueryService_getDistance_args::~QueryService_getDistance_args() throw() {
+QueryService_knnQueryBatch_args::~QueryService_knnQueryBatch_args() throw() {
 }
 
 
-uint32_t QueryService_getDistance_args::read(::apache::thrift::protocol::TProtocol* iprot) {
+uint32_t QueryService_knnQueryBatch_args::read(::apache::thrift::protocol::TProtocol* iprot) {
 
   ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
   uint32_t xfer = 0;
@@ -813,8 +845,10 @@ uint32_t QueryService_getDistance_args::read(::apache::thrift::protocol::TProtoc
 
   using ::apache::thrift::protocol::TProtocolException;
 
-  bool isset_obj1 = false;
-  bool isset_obj2 = false;
+  bool isset_k = false;
+  bool isset_queryObjs = false;
+  bool isset_retExternId = false;
+  bool isset_retObj = false;
 
   while (true)
   {
@@ -825,17 +859,53 @@ uint32_t QueryService_getDistance_args::read(::apache::thrift::protocol::TProtoc
     switch (fid)
     {
       case 1:
-        if (ftype == ::apache::thrift::protocol::T_STRING) {
-          xfer += iprot->readBinary(this->obj1);
-          isset_obj1 = true;
+        if (ftype == ::apache::thrift::protocol::T_I32) {
+          xfer += iprot->readI32(this->k);
+          isset_k = true;
         } else {
           xfer += iprot->skip(ftype);
         }
         break;
       case 2:
-        if (ftype == ::apache::thrift::protocol::T_STRING) {
-          xfer += iprot->readBinary(this->obj2);
-          isset_obj2 = true;
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->queryObjs.clear();
+            uint32_t _size38;
+            ::apache::thrift::protocol::TType _etype41;
+            xfer += iprot->readListBegin(_etype41, _size38);
+            this->queryObjs.resize(_size38);
+            uint32_t _i42;
+            for (_i42 = 0; _i42 < _size38; ++_i42)
+            {
+              xfer += iprot->readBinary(this->queryObjs[_i42]);
+            }
+            xfer += iprot->readListEnd();
+          }
+          isset_queryObjs = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->retExternId);
+          isset_retExternId = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->retObj);
+          isset_retObj = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->binaryQuery);
+          this->__isset.binaryQuery = true;
         } else {
           xfer += iprot->skip(ftype);
         }
@@ -849,24 +919,48 @@ uint32_t QueryService_getDistance_args::read(::apache::thrift::protocol::TProtoc
 
   xfer += iprot->readStructEnd();
 
-  if (!isset_obj1)
+  if (!isset_k)
     throw TProtocolException(TProtocolException::INVALID_DATA);
-  if (!isset_obj2)
+  if (!isset_queryObjs)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_retExternId)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_retObj)
     throw TProtocolException(TProtocolException::INVALID_DATA);
   return xfer;
 }
 
-uint32_t QueryService_getDistance_args::write(::apache::thrift::protocol::TProtocol* oprot) const {
+uint32_t QueryService_knnQueryBatch_args::write(::apache::thrift::protocol::TProtocol* oprot) const {
   uint32_t xfer = 0;
   ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
-  xfer += oprot->writeStructBegin("QueryService_getDistance_args");
+  xfer += oprot->writeStructBegin("QueryService_knnQueryBatch_args");
 
-  xfer += oprot->writeFieldBegin("obj1", ::apache::thrift::protocol::T_STRING, 1);
-  xfer += oprot->writeBinary(this->obj1);
+  xfer += oprot->writeFieldBegin("k", ::apache::thrift::protocol::T_I32, 1);
+  xfer += oprot->writeI32(this->k);
   xfer += oprot->writeFieldEnd();
 
-  xfer += oprot->writeFieldBegin("obj2", ::apache::thrift::protocol::T_STRING, 2);
-  xfer += oprot->writeBinary(this->obj2);
+  xfer += oprot->writeFieldBegin("queryObjs", ::apache::thrift::protocol::T_LIST, 2);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>(this->queryObjs.size()));
+    std::vector<std::string> ::const_iterator _iter43;
+    for (_iter43 = this->queryObjs.begin(); _iter43 != this->queryObjs.end(); ++_iter43)
+    {
+      xfer += oprot->writeBinary((*_iter43));
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retExternId", ::apache::thrift::protocol::T_BOOL, 3);
+  xfer += oprot->writeBool(this->retExternId);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retObj", ::apache::thrift::protocol::T_BOOL, 4);
+  xfer += oprot->writeBool(this->retObj);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool(this->binaryQuery);
   xfer += oprot->writeFieldEnd();
 
   xfer += oprot->writeFieldStop();
@@ -875,21 +969,41 @@ uint32_t QueryService_getDistance_args::write(::apache::thrift::protocol::TProto
 }
 
 
-QueryService_getDistance_pargs::~QueryService_getDistance_pargs() throw() {
+QueryService_knnQueryBatch_pargs::~QueryService_knnQueryBatch_pargs() throw() {
 }
 
 
-uint32_t QueryService_getDistance_pargs::write(::apache::thrift::protocol::TProtocol* oprot) const {
+uint32_t QueryService_knnQueryBatch_pargs::write(::apache::thrift::protocol::TProtocol* oprot) const {
   uint32_t xfer = 0;
   ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
-  xfer += oprot->writeStructBegin("QueryService_getDistance_pargs");
+  xfer += oprot->writeStructBegin("QueryService_knnQueryBatch_pargs");
 
-  xfer += oprot->writeFieldBegin("obj1", ::apache::thrift::protocol::T_STRING, 1);
-  xfer += oprot->writeBinary((*(this->obj1)));
+  xfer += oprot->writeFieldBegin("k", ::apache::thrift::protocol::T_I32, 1);
+  xfer += oprot->writeI32((*(this->k)));
   xfer += oprot->writeFieldEnd();
 
-  xfer += oprot->writeFieldBegin("obj2", ::apache::thrift::protocol::T_STRING, 2);
-  xfer += oprot->writeBinary((*(this->obj2)));
+  xfer += oprot->writeFieldBegin("queryObjs", ::apache::thrift::protocol::T_LIST, 2);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>((*(this->queryObjs)).size()));
+    std::vector<std::string> ::const_iterator _iter44;
+    for (_iter44 = (*(this->queryObjs)).begin(); _iter44 != (*(this->queryObjs)).end(); ++_iter44)
+    {
+      xfer += oprot->writeBinary((*_iter44));
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retExternId", ::apache::thrift::protocol::T_BOOL, 3);
+  xfer += oprot->writeBool((*(this->retExternId)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retObj", ::apache::thrift::protocol::T_BOOL, 4);
+  xfer += oprot->writeBool((*(this->retObj)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool((*(this->binaryQuery)));
   xfer += oprot->writeFieldEnd();
 
   xfer += oprot->writeFieldStop();
@@ -898,11 +1012,11 @@ uint32_t QueryService_getDistance_pargs::write(::apache::thrift::protocol::TProt
 }
 
 
-QueryService_getDistance_result::~QueryService_getDistance_result() throw() {
+QueryService_knnQueryBatch_result::~QueryService_knnQueryBatch_result() throw() {
 }
 
 
-uint32_t QueryService_getDistance_result::read(::apache::thrift::protocol::TProtocol* iprot) {
+uint32_t QueryService_knnQueryBatch_result::read(::apache::thrift::protocol::TProtocol* iprot) {
 
   ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
   uint32_t xfer = 0;
@@ -924,8 +1038,32 @@ uint32_t QueryService_getDistance_result::read(::apache::thrift::protocol::TProt
     switch (fid)
     {
       case 0:
-        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
-          xfer += iprot->readDouble(this->success);
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->success.clear();
+            uint32_t _size45;
+            ::apache::thrift::protocol::TType _etype48;
+            xfer += iprot->readListBegin(_etype48, _size45);
+            this->success.resize(_size45);
+            uint32_t _i49;
+            for (_i49 = 0; _i49 < _size45; ++_i49)
+            {
+              {
+                this->success[_i49].clear();
+                uint32_t _size50;
+                ::apache::thrift::protocol::TType _etype53;
+                xfer += iprot->readListBegin(_etype53, _size50);
+                this->success[_i49].resize(_size50);
+                uint32_t _i54;
+                for (_i54 = 0; _i54 < _size50; ++_i54)
+                {
+                  xfer += this->success[_i49][_i54].read(iprot);
+                }
+                xfer += iprot->readListEnd();
+              }
+            }
+            xfer += iprot->readListEnd();
+          }
           this->__isset.success = true;
         } else {
           xfer += iprot->skip(ftype);
@@ -951,15 +1089,31 @@ uint32_t QueryService_getDistance_result::read(::apache::thrift::protocol::TProt
   return xfer;
 }
 
-uint32_t QueryService_getDistance_result::write(::apache::thrift::protocol::TProtocol* oprot) const {
+uint32_t QueryService_knnQueryBatch_result::write(::apache::thrift::protocol::TProtocol* oprot) const {
 
   uint32_t xfer = 0;
 
-  xfer += oprot->writeStructBegin("QueryService_getDistance_result");
+  xfer += oprot->writeStructBegin("QueryService_knnQueryBatch_result");
 
   if (this->__isset.success) {
-    xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_DOUBLE, 0);
-    xfer += oprot->writeDouble(this->success);
+    xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_LIST, 0);
+    {
+      xfer += oprot->writeListBegin(::apache::thrift::protocol::T_LIST, static_cast<uint32_t>(this->success.size()));
+      std::vector<ReplyEntryList> ::const_iterator _iter55;
+      for (_iter55 = this->success.begin(); _iter55 != this->success.end(); ++_iter55)
+      {
+        {
+          xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>((*_iter55).size()));
+          std::vector<ReplyEntry> ::const_iterator _iter56;
+          for (_iter56 = (*_iter55).begin(); _iter56 != (*_iter55).end(); ++_iter56)
+          {
+            xfer += (*_iter56).write(oprot);
+          }
+          xfer += oprot->writeListEnd();
+        }
+      }
+      xfer += oprot->writeListEnd();
+    }
     xfer += oprot->writeFieldEnd();
   } else if (this->__isset.err) {
     xfer += oprot->writeFieldBegin("err", ::apache::thrift::protocol::T_STRUCT, 1);
@@ -972,11 +1126,11 @@ uint32_t QueryService_getDistance_result::write(::apache::thrift::protocol::TPro
 }
 
 
-QueryService_getDistance_presult::~QueryService_getDistance_presult() throw() {
+QueryService_knnQueryBatch_presult::~QueryService_knnQueryBatch_presult() throw() {
 }
 
 
-uint32_t QueryService_getDistance_presult::read(::apache::thrift::protocol::TProtocol* iprot) {
+uint32_t QueryService_knnQueryBatch_presult::read(::apache::thrift::protocol::TProtocol* iprot) {
 
   ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
   uint32_t xfer = 0;
@@ -998,8 +1152,32 @@ uint32_t QueryService_getDistance_presult::read(::apache::thrift::protocol::TPro
     switch (fid)
     {
       case 0:
-        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
-          xfer += iprot->readDouble((*(this->success)));
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            (*(this->success)).clear();
+            uint32_t _size57;
+            ::apache::thrift::protocol::TType _etype60;
+            xfer += iprot->readListBegin(_etype60, _size57);
+            (*(this->success)).resize(_size57);
+            uint32_t _i61;
+            for (_i61 = 0; _i61 < _size57; ++_i61)
+            {
+              {
+                (*(this->success))[_i61].clear();
+                uint32_t _size62;
+                ::apache::thrift::protocol::TType _etype65;
+                xfer += iprot->readListBegin(_etype65, _size62);
+                (*(this->success))[_i61].resize(_size62);
+                uint32_t _i66;
+                for (_i66 = 0; _i66 < _size62; ++_i66)
+                {
+                  xfer += (*(this->success))[_i61][_i66].read(iprot);
+                }
+                xfer += iprot->readListEnd();
+              }
+            }
+            xfer += iprot->readListEnd();
+          }
           this->__isset.success = true;
         } else {
           xfer += iprot->skip(ftype);
@@ -1025,519 +1203,2768 @@ uint32_t QueryService_getDistance_presult::read(::apache::thrift::protocol::TPro
   return xfer;
 }
 
-void QueryServiceClient::setQueryTimeParams(const std::string& queryTimeParams)
-{
-  send_setQueryTimeParams(queryTimeParams);
-  recv_setQueryTimeParams();
-}
-
-void QueryServiceClient::send_setQueryTimeParams(const std::string& queryTimeParams)
-{
-  int32_t cseqid = 0;
-  oprot_->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_CALL, cseqid);
-
-  QueryService_setQueryTimeParams_pargs args;
-  args.queryTimeParams = &queryTimeParams;
-  args.write(oprot_);
-
-  oprot_->writeMessageEnd();
-  oprot_->getTransport()->writeEnd();
-  oprot_->getTransport()->flush();
-}
-
-void QueryServiceClient::recv_setQueryTimeParams()
-{
-
-  int32_t rseqid = 0;
-  std::string fname;
-  ::apache::thrift::protocol::TMessageType mtype;
-
-  iprot_->readMessageBegin(fname, mtype, rseqid);
-  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
-    ::apache::thrift::TApplicationException x;
-    x.read(iprot_);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-    throw x;
-  }
-  if (mtype != ::apache::thrift::protocol::T_REPLY) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  if (fname.compare("setQueryTimeParams") != 0) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  QueryService_setQueryTimeParams_presult result;
-  result.read(iprot_);
-  iprot_->readMessageEnd();
-  iprot_->getTransport()->readEnd();
-
-  if (result.__isset.err) {
-    throw result.err;
-  }
-  return;
-}
 
-void QueryServiceClient::knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj)
-{
-  send_knnQuery(k, queryObj, retExternId, retObj);
-  recv_knnQuery(_return);
+QueryService_rangeQueryBatch_args::~QueryService_rangeQueryBatch_args() throw() {
 }
 
-void QueryServiceClient::send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj)
-{
-  int32_t cseqid = 0;
-  oprot_->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  QueryService_knnQuery_pargs args;
-  args.k = &k;
-  args.queryObj = &queryObj;
-  args.retExternId = &retExternId;
-  args.retObj = &retObj;
-  args.write(oprot_);
+uint32_t QueryService_rangeQueryBatch_args::read(::apache::thrift::protocol::TProtocol* iprot) {
 
-  oprot_->writeMessageEnd();
-  oprot_->getTransport()->writeEnd();
-  oprot_->getTransport()->flush();
-}
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
 
-void QueryServiceClient::recv_knnQuery(ReplyEntryList& _return)
-{
+  xfer += iprot->readStructBegin(fname);
 
-  int32_t rseqid = 0;
-  std::string fname;
-  ::apache::thrift::protocol::TMessageType mtype;
+  using ::apache::thrift::protocol::TProtocolException;
 
-  iprot_->readMessageBegin(fname, mtype, rseqid);
-  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
-    ::apache::thrift::TApplicationException x;
-    x.read(iprot_);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-    throw x;
-  }
-  if (mtype != ::apache::thrift::protocol::T_REPLY) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  if (fname.compare("knnQuery") != 0) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  QueryService_knnQuery_presult result;
-  result.success = &_return;
-  result.read(iprot_);
-  iprot_->readMessageEnd();
-  iprot_->getTransport()->readEnd();
+  bool isset_r = false;
+  bool isset_queryObjs = false;
+  bool isset_retExternId = false;
+  bool isset_retObj = false;
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->r);
+          isset_r = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->queryObjs.clear();
+            uint32_t _size67;
+            ::apache::thrift::protocol::TType _etype70;
+            xfer += iprot->readListBegin(_etype70, _size67);
+            this->queryObjs.resize(_size67);
+            uint32_t _i71;
+            for (_i71 = 0; _i71 < _size67; ++_i71)
+            {
+              xfer += iprot->readBinary(this->queryObjs[_i71]);
+            }
+            xfer += iprot->readListEnd();
+          }
+          isset_queryObjs = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->retExternId);
+          isset_retExternId = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->retObj);
+          isset_retObj = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->binaryQuery);
+          this->__isset.binaryQuery = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  if (!isset_r)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_queryObjs)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_retExternId)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_retObj)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  return xfer;
+}
+
+uint32_t QueryService_rangeQueryBatch_args::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_rangeQueryBatch_args");
+
+  xfer += oprot->writeFieldBegin("r", ::apache::thrift::protocol::T_DOUBLE, 1);
+  xfer += oprot->writeDouble(this->r);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("queryObjs", ::apache::thrift::protocol::T_LIST, 2);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>(this->queryObjs.size()));
+    std::vector<std::string> ::const_iterator _iter72;
+    for (_iter72 = this->queryObjs.begin(); _iter72 != this->queryObjs.end(); ++_iter72)
+    {
+      xfer += oprot->writeBinary((*_iter72));
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retExternId", ::apache::thrift::protocol::T_BOOL, 3);
+  xfer += oprot->writeBool(this->retExternId);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retObj", ::apache::thrift::protocol::T_BOOL, 4);
+  xfer += oprot->writeBool(this->retObj);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool(this->binaryQuery);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_rangeQueryBatch_pargs::~QueryService_rangeQueryBatch_pargs() throw() {
+}
+
+
+uint32_t QueryService_rangeQueryBatch_pargs::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_rangeQueryBatch_pargs");
+
+  xfer += oprot->writeFieldBegin("r", ::apache::thrift::protocol::T_DOUBLE, 1);
+  xfer += oprot->writeDouble((*(this->r)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("queryObjs", ::apache::thrift::protocol::T_LIST, 2);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>((*(this->queryObjs)).size()));
+    std::vector<std::string> ::const_iterator _iter73;
+    for (_iter73 = (*(this->queryObjs)).begin(); _iter73 != (*(this->queryObjs)).end(); ++_iter73)
+    {
+      xfer += oprot->writeBinary((*_iter73));
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retExternId", ::apache::thrift::protocol::T_BOOL, 3);
+  xfer += oprot->writeBool((*(this->retExternId)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("retObj", ::apache::thrift::protocol::T_BOOL, 4);
+  xfer += oprot->writeBool((*(this->retObj)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("binaryQuery", ::apache::thrift::protocol::T_BOOL, 5);
+  xfer += oprot->writeBool((*(this->binaryQuery)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_rangeQueryBatch_result::~QueryService_rangeQueryBatch_result() throw() {
+}
+
+
+uint32_t QueryService_rangeQueryBatch_result::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->success.clear();
+            uint32_t _size74;
+            ::apache::thrift::protocol::TType _etype77;
+            xfer += iprot->readListBegin(_etype77, _size74);
+            this->success.resize(_size74);
+            uint32_t _i78;
+            for (_i78 = 0; _i78 < _size74; ++_i78)
+            {
+              {
+                this->success[_i78].clear();
+                uint32_t _size79;
+                ::apache::thrift::protocol::TType _etype82;
+                xfer += iprot->readListBegin(_etype82, _size79);
+                this->success[_i78].resize(_size79);
+                uint32_t _i83;
+                for (_i83 = 0; _i83 < _size79; ++_i83)
+                {
+                  xfer += this->success[_i78][_i83].read(iprot);
+                }
+                xfer += iprot->readListEnd();
+              }
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t QueryService_rangeQueryBatch_result::write(::apache::thrift::protocol::TProtocol* oprot) const {
+
+  uint32_t xfer = 0;
+
+  xfer += oprot->writeStructBegin("QueryService_rangeQueryBatch_result");
+
+  if (this->__isset.success) {
+    xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_LIST, 0);
+    {
+      xfer += oprot->writeListBegin(::apache::thrift::protocol::T_LIST, static_cast<uint32_t>(this->success.size()));
+      std::vector<ReplyEntryList> ::const_iterator _iter84;
+      for (_iter84 = this->success.begin(); _iter84 != this->success.end(); ++_iter84)
+      {
+        {
+          xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>((*_iter84).size()));
+          std::vector<ReplyEntry> ::const_iterator _iter85;
+          for (_iter85 = (*_iter84).begin(); _iter85 != (*_iter84).end(); ++_iter85)
+          {
+            xfer += (*_iter85).write(oprot);
+          }
+          xfer += oprot->writeListEnd();
+        }
+      }
+      xfer += oprot->writeListEnd();
+    }
+    xfer += oprot->writeFieldEnd();
+  } else if (this->__isset.err) {
+    xfer += oprot->writeFieldBegin("err", ::apache::thrift::protocol::T_STRUCT, 1);
+    xfer += this->err.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  }
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_rangeQueryBatch_presult::~QueryService_rangeQueryBatch_presult() throw() {
+}
+
+
+uint32_t QueryService_rangeQueryBatch_presult::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            (*(this->success)).clear();
+            uint32_t _size86;
+            ::apache::thrift::protocol::TType _etype89;
+            xfer += iprot->readListBegin(_etype89, _size86);
+            (*(this->success)).resize(_size86);
+            uint32_t _i90;
+            for (_i90 = 0; _i90 < _size86; ++_i90)
+            {
+              {
+                (*(this->success))[_i90].clear();
+                uint32_t _size91;
+                ::apache::thrift::protocol::TType _etype94;
+                xfer += iprot->readListBegin(_etype94, _size91);
+                (*(this->success))[_i90].resize(_size91);
+                uint32_t _i95;
+                for (_i95 = 0; _i95 < _size91; ++_i95)
+                {
+                  xfer += (*(this->success))[_i90][_i95].read(iprot);
+                }
+                xfer += iprot->readListEnd();
+              }
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+
+QueryService_getDistance_args::~QueryService_getDistance_args() throw() {
+}
+
+
+uint32_t QueryService_getDistance_args::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+  bool isset_obj1 = false;
+  bool isset_obj2 = false;
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->obj1);
+          isset_obj1 = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->obj2);
+          isset_obj2 = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  if (!isset_obj1)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_obj2)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  return xfer;
+}
+
+uint32_t QueryService_getDistance_args::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_getDistance_args");
+
+  xfer += oprot->writeFieldBegin("obj1", ::apache::thrift::protocol::T_STRING, 1);
+  xfer += oprot->writeBinary(this->obj1);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("obj2", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeBinary(this->obj2);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getDistance_pargs::~QueryService_getDistance_pargs() throw() {
+}
+
+
+uint32_t QueryService_getDistance_pargs::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_getDistance_pargs");
+
+  xfer += oprot->writeFieldBegin("obj1", ::apache::thrift::protocol::T_STRING, 1);
+  xfer += oprot->writeBinary((*(this->obj1)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("obj2", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeBinary((*(this->obj2)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getDistance_result::~QueryService_getDistance_result() throw() {
+}
+
+
+uint32_t QueryService_getDistance_result::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->success);
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t QueryService_getDistance_result::write(::apache::thrift::protocol::TProtocol* oprot) const {
+
+  uint32_t xfer = 0;
+
+  xfer += oprot->writeStructBegin("QueryService_getDistance_result");
+
+  if (this->__isset.success) {
+    xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_DOUBLE, 0);
+    xfer += oprot->writeDouble(this->success);
+    xfer += oprot->writeFieldEnd();
+  } else if (this->__isset.err) {
+    xfer += oprot->writeFieldBegin("err", ::apache::thrift::protocol::T_STRUCT, 1);
+    xfer += this->err.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  }
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getDistance_presult::~QueryService_getDistance_presult() throw() {
+}
+
+
+uint32_t QueryService_getDistance_presult::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble((*(this->success)));
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+
+QueryService_getCacheStats_args::~QueryService_getCacheStats_args() throw() {
+}
+
+
+uint32_t QueryService_getCacheStats_args::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    xfer += iprot->skip(ftype);
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t QueryService_getCacheStats_args::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_getCacheStats_args");
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getCacheStats_pargs::~QueryService_getCacheStats_pargs() throw() {
+}
+
+
+uint32_t QueryService_getCacheStats_pargs::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_getCacheStats_pargs");
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getCacheStats_result::~QueryService_getCacheStats_result() throw() {
+}
+
+
+uint32_t QueryService_getCacheStats_result::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->success.read(iprot);
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t QueryService_getCacheStats_result::write(::apache::thrift::protocol::TProtocol* oprot) const {
+
+  uint32_t xfer = 0;
+
+  xfer += oprot->writeStructBegin("QueryService_getCacheStats_result");
+
+  if (this->__isset.success) {
+    xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_STRUCT, 0);
+    xfer += this->success.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  } else if (this->__isset.err) {
+    xfer += oprot->writeFieldBegin("err", ::apache::thrift::protocol::T_STRUCT, 1);
+    xfer += this->err.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  }
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getCacheStats_presult::~QueryService_getCacheStats_presult() throw() {
+}
+
+
+uint32_t QueryService_getCacheStats_presult::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += (*(this->success)).read(iprot);
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+
+QueryService_reloadIndex_args::~QueryService_reloadIndex_args() throw() {
+}
+
+
+uint32_t QueryService_reloadIndex_args::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+  bool isset_dataFile = false;
+  bool isset_loadIndexLoc = false;
+  bool isset_cacheData = false;
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->dataFile);
+          isset_dataFile = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->loadIndexLoc);
+          isset_loadIndexLoc = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->cacheData);
+          isset_cacheData = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  if (!isset_dataFile)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_loadIndexLoc)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_cacheData)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  return xfer;
+}
+
+uint32_t QueryService_reloadIndex_args::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_reloadIndex_args");
+
+  xfer += oprot->writeFieldBegin("dataFile", ::apache::thrift::protocol::T_STRING, 1);
+  xfer += oprot->writeString(this->dataFile);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("loadIndexLoc", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeString(this->loadIndexLoc);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("cacheData", ::apache::thrift::protocol::T_BOOL, 3);
+  xfer += oprot->writeBool(this->cacheData);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_reloadIndex_pargs::~QueryService_reloadIndex_pargs() throw() {
+}
+
+
+uint32_t QueryService_reloadIndex_pargs::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_reloadIndex_pargs");
+
+  xfer += oprot->writeFieldBegin("dataFile", ::apache::thrift::protocol::T_STRING, 1);
+  xfer += oprot->writeString((*(this->dataFile)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("loadIndexLoc", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeString((*(this->loadIndexLoc)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("cacheData", ::apache::thrift::protocol::T_BOOL, 3);
+  xfer += oprot->writeBool((*(this->cacheData)));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_reloadIndex_result::~QueryService_reloadIndex_result() throw() {
+}
+
+
+uint32_t QueryService_reloadIndex_result::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t QueryService_reloadIndex_result::write(::apache::thrift::protocol::TProtocol* oprot) const {
+
+  uint32_t xfer = 0;
+
+  xfer += oprot->writeStructBegin("QueryService_reloadIndex_result");
+
+  if (this->__isset.err) {
+    xfer += oprot->writeFieldBegin("err", ::apache::thrift::protocol::T_STRUCT, 1);
+    xfer += this->err.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  }
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_reloadIndex_presult::~QueryService_reloadIndex_presult() throw() {
+}
+
+
+uint32_t QueryService_reloadIndex_presult::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+
+QueryService_getStats_args::~QueryService_getStats_args() throw() {
+}
+
+
+uint32_t QueryService_getStats_args::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    xfer += iprot->skip(ftype);
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t QueryService_getStats_args::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_getStats_args");
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getStats_pargs::~QueryService_getStats_pargs() throw() {
+}
+
+
+uint32_t QueryService_getStats_pargs::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("QueryService_getStats_pargs");
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getStats_result::~QueryService_getStats_result() throw() {
+}
+
+
+uint32_t QueryService_getStats_result::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->success.read(iprot);
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t QueryService_getStats_result::write(::apache::thrift::protocol::TProtocol* oprot) const {
+
+  uint32_t xfer = 0;
+
+  xfer += oprot->writeStructBegin("QueryService_getStats_result");
+
+  if (this->__isset.success) {
+    xfer += oprot->writeFieldBegin("success", ::apache::thrift::protocol::T_STRUCT, 0);
+    xfer += this->success.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  } else if (this->__isset.err) {
+    xfer += oprot->writeFieldBegin("err", ::apache::thrift::protocol::T_STRUCT, 1);
+    xfer += this->err.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  }
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+
+QueryService_getStats_presult::~QueryService_getStats_presult() throw() {
+}
+
+
+uint32_t QueryService_getStats_presult::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 0:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += (*(this->success)).read(iprot);
+          this->__isset.success = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->err.read(iprot);
+          this->__isset.err = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+void QueryServiceClient::setQueryTimeParams(const std::string& queryTimeParams)
+{
+  send_setQueryTimeParams(queryTimeParams);
+  recv_setQueryTimeParams();
+}
+
+void QueryServiceClient::send_setQueryTimeParams(const std::string& queryTimeParams)
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_setQueryTimeParams_pargs args;
+  args.queryTimeParams = &queryTimeParams;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_setQueryTimeParams()
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("setQueryTimeParams") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_setQueryTimeParams_presult result;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  return;
+}
+
+void QueryServiceClient::knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  send_knnQuery(k, queryObj, retExternId, retObj, binaryQuery);
+  recv_knnQuery(_return);
+}
+
+void QueryServiceClient::send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_knnQuery_pargs args;
+  args.k = &k;
+  args.queryObj = &queryObj;
+  args.retExternId = &retExternId;
+  args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_knnQuery(ReplyEntryList& _return)
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("knnQuery") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_knnQuery_presult result;
+  result.success = &_return;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.success) {
+    // _return pointer has now been filled
+    return;
+  }
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "knnQuery failed: unknown result");
+}
+
+void QueryServiceClient::rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  send_rangeQuery(r, queryObj, retExternId, retObj, binaryQuery);
+  recv_rangeQuery(_return);
+}
+
+void QueryServiceClient::send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_rangeQuery_pargs args;
+  args.r = &r;
+  args.queryObj = &queryObj;
+  args.retExternId = &retExternId;
+  args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_rangeQuery(ReplyEntryList& _return)
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("rangeQuery") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_rangeQuery_presult result;
+  result.success = &_return;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.success) {
+    // _return pointer has now been filled
+    return;
+  }
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "rangeQuery failed: unknown result");
+}
+
+void QueryServiceClient::knnQueryBatch(ReplyEntryListList& _return, const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  send_knnQueryBatch(k, queryObjs, retExternId, retObj, binaryQuery);
+  recv_knnQueryBatch(_return);
+}
+
+void QueryServiceClient::send_knnQueryBatch(const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("knnQueryBatch", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_knnQueryBatch_pargs args;
+  args.k = &k;
+  args.queryObjs = &queryObjs;
+  args.retExternId = &retExternId;
+  args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_knnQueryBatch(ReplyEntryListList& _return)
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("knnQueryBatch") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_knnQueryBatch_presult result;
+  result.success = &_return;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.success) {
+    // _return pointer has now been filled
+    return;
+  }
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "knnQueryBatch failed: unknown result");
+}
+
+void QueryServiceClient::rangeQueryBatch(ReplyEntryListList& _return, const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  send_rangeQueryBatch(r, queryObjs, retExternId, retObj, binaryQuery);
+  recv_rangeQueryBatch(_return);
+}
+
+void QueryServiceClient::send_rangeQueryBatch(const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("rangeQueryBatch", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_rangeQueryBatch_pargs args;
+  args.r = &r;
+  args.queryObjs = &queryObjs;
+  args.retExternId = &retExternId;
+  args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_rangeQueryBatch(ReplyEntryListList& _return)
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("rangeQueryBatch") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_rangeQueryBatch_presult result;
+  result.success = &_return;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.success) {
+    // _return pointer has now been filled
+    return;
+  }
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "rangeQueryBatch failed: unknown result");
+}
+
+double QueryServiceClient::getDistance(const std::string& obj1, const std::string& obj2)
+{
+  send_getDistance(obj1, obj2);
+  return recv_getDistance();
+}
+
+void QueryServiceClient::send_getDistance(const std::string& obj1, const std::string& obj2)
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_getDistance_pargs args;
+  args.obj1 = &obj1;
+  args.obj2 = &obj2;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+double QueryServiceClient::recv_getDistance()
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("getDistance") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  double _return;
+  QueryService_getDistance_presult result;
+  result.success = &_return;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.success) {
+    return _return;
+  }
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getDistance failed: unknown result");
+}
+
+void QueryServiceClient::getCacheStats(CacheStats& _return)
+{
+  send_getCacheStats();
+  recv_getCacheStats(_return);
+}
+
+void QueryServiceClient::send_getCacheStats()
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("getCacheStats", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_getCacheStats_pargs args;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_getCacheStats(CacheStats& _return)
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("getCacheStats") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_getCacheStats_presult result;
+  result.success = &_return;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.success) {
+    // _return pointer has now been filled
+    return;
+  }
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getCacheStats failed: unknown result");
+}
+
+void QueryServiceClient::reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData)
+{
+  send_reloadIndex(dataFile, loadIndexLoc, cacheData);
+  recv_reloadIndex();
+}
+
+void QueryServiceClient::send_reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData)
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("reloadIndex", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_reloadIndex_pargs args;
+  args.dataFile = &dataFile;
+  args.loadIndexLoc = &loadIndexLoc;
+  args.cacheData = &cacheData;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_reloadIndex()
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("reloadIndex") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_reloadIndex_presult result;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
+
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  return;
+}
+
+void QueryServiceClient::getStats(ServerStats& _return)
+{
+  send_getStats();
+  recv_getStats(_return);
+}
+
+void QueryServiceClient::send_getStats()
+{
+  int32_t cseqid = 0;
+  oprot_->writeMessageBegin("getStats", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_getStats_pargs args;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+}
+
+void QueryServiceClient::recv_getStats(ServerStats& _return)
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  iprot_->readMessageBegin(fname, mtype, rseqid);
+  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+    ::apache::thrift::TApplicationException x;
+    x.read(iprot_);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+    throw x;
+  }
+  if (mtype != ::apache::thrift::protocol::T_REPLY) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  if (fname.compare("getStats") != 0) {
+    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot_->readMessageEnd();
+    iprot_->getTransport()->readEnd();
+  }
+  QueryService_getStats_presult result;
+  result.success = &_return;
+  result.read(iprot_);
+  iprot_->readMessageEnd();
+  iprot_->getTransport()->readEnd();
 
   if (result.__isset.success) {
     // _return pointer has now been filled
     return;
   }
-  if (result.__isset.err) {
-    throw result.err;
+  if (result.__isset.err) {
+    throw result.err;
+  }
+  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getStats failed: unknown result");
+}
+
+bool QueryServiceProcessor::dispatchCall(::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, const std::string& fname, int32_t seqid, void* callContext) {
+  ProcessMap::iterator pfn;
+  pfn = processMap_.find(fname);
+  if (pfn == processMap_.end()) {
+    iprot->skip(::apache::thrift::protocol::T_STRUCT);
+    iprot->readMessageEnd();
+    iprot->getTransport()->readEnd();
+    ::apache::thrift::TApplicationException x(::apache::thrift::TApplicationException::UNKNOWN_METHOD, "Invalid method name: '"+fname+"'");
+    oprot->writeMessageBegin(fname, ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return true;
+  }
+  (this->*(pfn->second))(seqid, iprot, oprot, callContext);
+  return true;
+}
+
+void QueryServiceProcessor::process_setQueryTimeParams(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.setQueryTimeParams", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.setQueryTimeParams");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.setQueryTimeParams");
+  }
+
+  QueryService_setQueryTimeParams_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.setQueryTimeParams", bytes);
+  }
+
+  QueryService_setQueryTimeParams_result result;
+  try {
+    iface_->setQueryTimeParams(args.queryTimeParams);
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.setQueryTimeParams");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.setQueryTimeParams");
+  }
+
+  oprot->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.setQueryTimeParams", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_knnQuery(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.knnQuery", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.knnQuery");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.knnQuery");
+  }
+
+  QueryService_knnQuery_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.knnQuery", bytes);
+  }
+
+  QueryService_knnQuery_result result;
+  try {
+    iface_->knnQuery(result.success, args.k, args.queryObj, args.retExternId, args.retObj, args.binaryQuery);
+    result.__isset.success = true;
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.knnQuery");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.knnQuery");
+  }
+
+  oprot->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.knnQuery", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_rangeQuery(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.rangeQuery", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.rangeQuery");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.rangeQuery");
+  }
+
+  QueryService_rangeQuery_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.rangeQuery", bytes);
+  }
+
+  QueryService_rangeQuery_result result;
+  try {
+    iface_->rangeQuery(result.success, args.r, args.queryObj, args.retExternId, args.retObj, args.binaryQuery);
+    result.__isset.success = true;
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.rangeQuery");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.rangeQuery");
+  }
+
+  oprot->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.rangeQuery", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_knnQueryBatch(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.knnQueryBatch", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.knnQueryBatch");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.knnQueryBatch");
+  }
+
+  QueryService_knnQueryBatch_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.knnQueryBatch", bytes);
+  }
+
+  QueryService_knnQueryBatch_result result;
+  try {
+    iface_->knnQueryBatch(result.success, args.k, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery);
+    result.__isset.success = true;
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.knnQueryBatch");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("knnQueryBatch", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.knnQueryBatch");
+  }
+
+  oprot->writeMessageBegin("knnQueryBatch", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.knnQueryBatch", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_rangeQueryBatch(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.rangeQueryBatch", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.rangeQueryBatch");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.rangeQueryBatch");
+  }
+
+  QueryService_rangeQueryBatch_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.rangeQueryBatch", bytes);
+  }
+
+  QueryService_rangeQueryBatch_result result;
+  try {
+    iface_->rangeQueryBatch(result.success, args.r, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery);
+    result.__isset.success = true;
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.rangeQueryBatch");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("rangeQueryBatch", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.rangeQueryBatch");
+  }
+
+  oprot->writeMessageBegin("rangeQueryBatch", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.rangeQueryBatch", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_getDistance(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.getDistance", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.getDistance");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.getDistance");
+  }
+
+  QueryService_getDistance_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.getDistance", bytes);
+  }
+
+  QueryService_getDistance_result result;
+  try {
+    result.success = iface_->getDistance(args.obj1, args.obj2);
+    result.__isset.success = true;
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.getDistance");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.getDistance");
+  }
+
+  oprot->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.getDistance", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_getCacheStats(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.getCacheStats", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.getCacheStats");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.getCacheStats");
+  }
+
+  QueryService_getCacheStats_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.getCacheStats", bytes);
+  }
+
+  QueryService_getCacheStats_result result;
+  try {
+    iface_->getCacheStats(result.success);
+    result.__isset.success = true;
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.getCacheStats");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("getCacheStats", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.getCacheStats");
+  }
+
+  oprot->writeMessageBegin("getCacheStats", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.getCacheStats", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_reloadIndex(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.reloadIndex", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.reloadIndex");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.reloadIndex");
+  }
+
+  QueryService_reloadIndex_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.reloadIndex", bytes);
+  }
+
+  QueryService_reloadIndex_result result;
+  try {
+    iface_->reloadIndex(args.dataFile, args.loadIndexLoc, args.cacheData);
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.reloadIndex");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("reloadIndex", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.reloadIndex");
+  }
+
+  oprot->writeMessageBegin("reloadIndex", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.reloadIndex", bytes);
+  }
+}
+
+void QueryServiceProcessor::process_getStats(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+{
+  void* ctx = NULL;
+  if (this->eventHandler_.get() != NULL) {
+    ctx = this->eventHandler_->getContext("QueryService.getStats", callContext);
+  }
+  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.getStats");
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preRead(ctx, "QueryService.getStats");
+  }
+
+  QueryService_getStats_args args;
+  args.read(iprot);
+  iprot->readMessageEnd();
+  uint32_t bytes = iprot->getTransport()->readEnd();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postRead(ctx, "QueryService.getStats", bytes);
+  }
+
+  QueryService_getStats_result result;
+  try {
+    iface_->getStats(result.success);
+    result.__isset.success = true;
+  } catch (QueryException &err) {
+    result.err = err;
+    result.__isset.err = true;
+  } catch (const std::exception& e) {
+    if (this->eventHandler_.get() != NULL) {
+      this->eventHandler_->handlerError(ctx, "QueryService.getStats");
+    }
+
+    ::apache::thrift::TApplicationException x(e.what());
+    oprot->writeMessageBegin("getStats", ::apache::thrift::protocol::T_EXCEPTION, seqid);
+    x.write(oprot);
+    oprot->writeMessageEnd();
+    oprot->getTransport()->writeEnd();
+    oprot->getTransport()->flush();
+    return;
+  }
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->preWrite(ctx, "QueryService.getStats");
   }
-  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "knnQuery failed: unknown result");
+
+  oprot->writeMessageBegin("getStats", ::apache::thrift::protocol::T_REPLY, seqid);
+  result.write(oprot);
+  oprot->writeMessageEnd();
+  bytes = oprot->getTransport()->writeEnd();
+  oprot->getTransport()->flush();
+
+  if (this->eventHandler_.get() != NULL) {
+    this->eventHandler_->postWrite(ctx, "QueryService.getStats", bytes);
+  }
+}
+
+::apache::thrift::stdcxx::shared_ptr< ::apache::thrift::TProcessor > QueryServiceProcessorFactory::getProcessor(const ::apache::thrift::TConnectionInfo& connInfo) {
+  ::apache::thrift::ReleaseHandler< QueryServiceIfFactory > cleanup(handlerFactory_);
+  ::apache::thrift::stdcxx::shared_ptr< QueryServiceIf > handler(handlerFactory_->getHandler(connInfo), cleanup);
+  ::apache::thrift::stdcxx::shared_ptr< ::apache::thrift::TProcessor > processor(new QueryServiceProcessor(handler));
+  return processor;
 }
 
-void QueryServiceClient::rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj)
+void QueryServiceConcurrentClient::setQueryTimeParams(const std::string& queryTimeParams)
 {
-  send_rangeQuery(r, queryObj, retExternId, retObj);
-  recv_rangeQuery(_return);
+  int32_t seqid = send_setQueryTimeParams(queryTimeParams);
+  recv_setQueryTimeParams(seqid);
 }
 
-void QueryServiceClient::send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj)
+int32_t QueryServiceConcurrentClient::send_setQueryTimeParams(const std::string& queryTimeParams)
 {
-  int32_t cseqid = 0;
-  oprot_->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_CALL, cseqid);
+  int32_t cseqid = this->sync_.generateSeqId();
+  ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
+  oprot_->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  QueryService_rangeQuery_pargs args;
-  args.r = &r;
+  QueryService_setQueryTimeParams_pargs args;
+  args.queryTimeParams = &queryTimeParams;
+  args.write(oprot_);
+
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
+
+  sentry.commit();
+  return cseqid;
+}
+
+void QueryServiceConcurrentClient::recv_setQueryTimeParams(const int32_t seqid)
+{
+
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
+
+  // the read mutex gets dropped and reacquired as part of waitForWork()
+  // The destructor of this sentry wakes up other clients
+  ::apache::thrift::async::TConcurrentRecvSentry sentry(&this->sync_, seqid);
+
+  while(true) {
+    if(!this->sync_.getPending(fname, mtype, rseqid)) {
+      iprot_->readMessageBegin(fname, mtype, rseqid);
+    }
+    if(seqid == rseqid) {
+      if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+        ::apache::thrift::TApplicationException x;
+        x.read(iprot_);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+        sentry.commit();
+        throw x;
+      }
+      if (mtype != ::apache::thrift::protocol::T_REPLY) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+      }
+      if (fname.compare("setQueryTimeParams") != 0) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+
+        // in a bad state, don't commit
+        using ::apache::thrift::protocol::TProtocolException;
+        throw TProtocolException(TProtocolException::INVALID_DATA);
+      }
+      QueryService_setQueryTimeParams_presult result;
+      result.read(iprot_);
+      iprot_->readMessageEnd();
+      iprot_->getTransport()->readEnd();
+
+      if (result.__isset.err) {
+        sentry.commit();
+        throw result.err;
+      }
+      sentry.commit();
+      return;
+    }
+    // seqid != rseqid
+    this->sync_.updatePending(fname, mtype, rseqid);
+
+    // this will temporarily unlock the readMutex, and let other clients get work done
+    this->sync_.waitForWork(seqid);
+  } // end while(true)
+}
+
+void QueryServiceConcurrentClient::knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t seqid = send_knnQuery(k, queryObj, retExternId, retObj, binaryQuery);
+  recv_knnQuery(_return, seqid);
+}
+
+int32_t QueryServiceConcurrentClient::send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t cseqid = this->sync_.generateSeqId();
+  ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
+  oprot_->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_CALL, cseqid);
+
+  QueryService_knnQuery_pargs args;
+  args.k = &k;
   args.queryObj = &queryObj;
   args.retExternId = &retExternId;
   args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
   args.write(oprot_);
 
   oprot_->writeMessageEnd();
   oprot_->getTransport()->writeEnd();
   oprot_->getTransport()->flush();
+
+  sentry.commit();
+  return cseqid;
 }
 
-void QueryServiceClient::recv_rangeQuery(ReplyEntryList& _return)
+void QueryServiceConcurrentClient::recv_knnQuery(ReplyEntryList& _return, const int32_t seqid)
 {
 
   int32_t rseqid = 0;
   std::string fname;
   ::apache::thrift::protocol::TMessageType mtype;
 
-  iprot_->readMessageBegin(fname, mtype, rseqid);
-  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
-    ::apache::thrift::TApplicationException x;
-    x.read(iprot_);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-    throw x;
-  }
-  if (mtype != ::apache::thrift::protocol::T_REPLY) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  if (fname.compare("rangeQuery") != 0) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  QueryService_rangeQuery_presult result;
-  result.success = &_return;
-  result.read(iprot_);
-  iprot_->readMessageEnd();
-  iprot_->getTransport()->readEnd();
+  // the read mutex gets dropped and reacquired as part of waitForWork()
+  // The destructor of this sentry wakes up other clients
+  ::apache::thrift::async::TConcurrentRecvSentry sentry(&this->sync_, seqid);
 
-  if (result.__isset.success) {
-    // _return pointer has now been filled
-    return;
-  }
-  if (result.__isset.err) {
-    throw result.err;
-  }
-  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "rangeQuery failed: unknown result");
+  while(true) {
+    if(!this->sync_.getPending(fname, mtype, rseqid)) {
+      iprot_->readMessageBegin(fname, mtype, rseqid);
+    }
+    if(seqid == rseqid) {
+      if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+        ::apache::thrift::TApplicationException x;
+        x.read(iprot_);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+        sentry.commit();
+        throw x;
+      }
+      if (mtype != ::apache::thrift::protocol::T_REPLY) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+      }
+      if (fname.compare("knnQuery") != 0) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+
+        // in a bad state, don't commit
+        using ::apache::thrift::protocol::TProtocolException;
+        throw TProtocolException(TProtocolException::INVALID_DATA);
+      }
+      QueryService_knnQuery_presult result;
+      result.success = &_return;
+      result.read(iprot_);
+      iprot_->readMessageEnd();
+      iprot_->getTransport()->readEnd();
+
+      if (result.__isset.success) {
+        // _return pointer has now been filled
+        sentry.commit();
+        return;
+      }
+      if (result.__isset.err) {
+        sentry.commit();
+        throw result.err;
+      }
+      // in a bad state, don't commit
+      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "knnQuery failed: unknown result");
+    }
+    // seqid != rseqid
+    this->sync_.updatePending(fname, mtype, rseqid);
+
+    // this will temporarily unlock the readMutex, and let other clients get work done
+    this->sync_.waitForWork(seqid);
+  } // end while(true)
 }
 
-double QueryServiceClient::getDistance(const std::string& obj1, const std::string& obj2)
+void QueryServiceConcurrentClient::rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
 {
-  send_getDistance(obj1, obj2);
-  return recv_getDistance();
+  int32_t seqid = send_rangeQuery(r, queryObj, retExternId, retObj, binaryQuery);
+  recv_rangeQuery(_return, seqid);
 }
 
-void QueryServiceClient::send_getDistance(const std::string& obj1, const std::string& obj2)
+int32_t QueryServiceConcurrentClient::send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery)
 {
-  int32_t cseqid = 0;
-  oprot_->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_CALL, cseqid);
+  int32_t cseqid = this->sync_.generateSeqId();
+  ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
+  oprot_->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  QueryService_getDistance_pargs args;
-  args.obj1 = &obj1;
-  args.obj2 = &obj2;
+  QueryService_rangeQuery_pargs args;
+  args.r = &r;
+  args.queryObj = &queryObj;
+  args.retExternId = &retExternId;
+  args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
   args.write(oprot_);
 
   oprot_->writeMessageEnd();
   oprot_->getTransport()->writeEnd();
   oprot_->getTransport()->flush();
+
+  sentry.commit();
+  return cseqid;
 }
 
-double QueryServiceClient::recv_getDistance()
+void QueryServiceConcurrentClient::recv_rangeQuery(ReplyEntryList& _return, const int32_t seqid)
 {
 
   int32_t rseqid = 0;
   std::string fname;
   ::apache::thrift::protocol::TMessageType mtype;
 
-  iprot_->readMessageBegin(fname, mtype, rseqid);
-  if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
-    ::apache::thrift::TApplicationException x;
-    x.read(iprot_);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-    throw x;
-  }
-  if (mtype != ::apache::thrift::protocol::T_REPLY) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  if (fname.compare("getDistance") != 0) {
-    iprot_->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot_->readMessageEnd();
-    iprot_->getTransport()->readEnd();
-  }
-  double _return;
-  QueryService_getDistance_presult result;
-  result.success = &_return;
-  result.read(iprot_);
-  iprot_->readMessageEnd();
-  iprot_->getTransport()->readEnd();
-
-  if (result.__isset.success) {
-    return _return;
-  }
-  if (result.__isset.err) {
-    throw result.err;
-  }
-  throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getDistance failed: unknown result");
-}
-
-bool QueryServiceProcessor::dispatchCall(::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, const std::string& fname, int32_t seqid, void* callContext) {
-  ProcessMap::iterator pfn;
-  pfn = processMap_.find(fname);
-  if (pfn == processMap_.end()) {
-    iprot->skip(::apache::thrift::protocol::T_STRUCT);
-    iprot->readMessageEnd();
-    iprot->getTransport()->readEnd();
-    ::apache::thrift::TApplicationException x(::apache::thrift::TApplicationException::UNKNOWN_METHOD, "Invalid method name: '"+fname+"'");
-    oprot->writeMessageBegin(fname, ::apache::thrift::protocol::T_EXCEPTION, seqid);
-    x.write(oprot);
-    oprot->writeMessageEnd();
-    oprot->getTransport()->writeEnd();
-    oprot->getTransport()->flush();
-    return true;
-  }
-  (this->*(pfn->second))(seqid, iprot, oprot, callContext);
-  return true;
-}
+  // the read mutex gets dropped and reacquired as part of waitForWork()
+  // The destructor of this sentry wakes up other clients
+  ::apache::thrift::async::TConcurrentRecvSentry sentry(&this->sync_, seqid);
 
-void QueryServiceProcessor::process_setQueryTimeParams(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
-{
-  void* ctx = NULL;
-  if (this->eventHandler_.get() != NULL) {
-    ctx = this->eventHandler_->getContext("QueryService.setQueryTimeParams", callContext);
-  }
-  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.setQueryTimeParams");
+  while(true) {
+    if(!this->sync_.getPending(fname, mtype, rseqid)) {
+      iprot_->readMessageBegin(fname, mtype, rseqid);
+    }
+    if(seqid == rseqid) {
+      if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+        ::apache::thrift::TApplicationException x;
+        x.read(iprot_);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+        sentry.commit();
+        throw x;
+      }
+      if (mtype != ::apache::thrift::protocol::T_REPLY) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+      }
+      if (fname.compare("rangeQuery") != 0) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preRead(ctx, "QueryService.setQueryTimeParams");
-  }
+        // in a bad state, don't commit
+        using ::apache::thrift::protocol::TProtocolException;
+        throw TProtocolException(TProtocolException::INVALID_DATA);
+      }
+      QueryService_rangeQuery_presult result;
+      result.success = &_return;
+      result.read(iprot_);
+      iprot_->readMessageEnd();
+      iprot_->getTransport()->readEnd();
 
-  QueryService_setQueryTimeParams_args args;
-  args.read(iprot);
-  iprot->readMessageEnd();
-  uint32_t bytes = iprot->getTransport()->readEnd();
+      if (result.__isset.success) {
+        // _return pointer has now been filled
+        sentry.commit();
+        return;
+      }
+      if (result.__isset.err) {
+        sentry.commit();
+        throw result.err;
+      }
+      // in a bad state, don't commit
+      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "rangeQuery failed: unknown result");
+    }
+    // seqid != rseqid
+    this->sync_.updatePending(fname, mtype, rseqid);
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postRead(ctx, "QueryService.setQueryTimeParams", bytes);
-  }
+    // this will temporarily unlock the readMutex, and let other clients get work done
+    this->sync_.waitForWork(seqid);
+  } // end while(true)
+}
 
-  QueryService_setQueryTimeParams_result result;
-  try {
-    iface_->setQueryTimeParams(args.queryTimeParams);
-  } catch (QueryException &err) {
-    result.err = err;
-    result.__isset.err = true;
-  } catch (const std::exception& e) {
-    if (this->eventHandler_.get() != NULL) {
-      this->eventHandler_->handlerError(ctx, "QueryService.setQueryTimeParams");
-    }
+void QueryServiceConcurrentClient::knnQueryBatch(ReplyEntryListList& _return, const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t seqid = send_knnQueryBatch(k, queryObjs, retExternId, retObj, binaryQuery);
+  recv_knnQueryBatch(_return, seqid);
+}
 
-    ::apache::thrift::TApplicationException x(e.what());
-    oprot->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_EXCEPTION, seqid);
-    x.write(oprot);
-    oprot->writeMessageEnd();
-    oprot->getTransport()->writeEnd();
-    oprot->getTransport()->flush();
-    return;
-  }
+int32_t QueryServiceConcurrentClient::send_knnQueryBatch(const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t cseqid = this->sync_.generateSeqId();
+  ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
+  oprot_->writeMessageBegin("knnQueryBatch", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preWrite(ctx, "QueryService.setQueryTimeParams");
-  }
+  QueryService_knnQueryBatch_pargs args;
+  args.k = &k;
+  args.queryObjs = &queryObjs;
+  args.retExternId = &retExternId;
+  args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
+  args.write(oprot_);
 
-  oprot->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_REPLY, seqid);
-  result.write(oprot);
-  oprot->writeMessageEnd();
-  bytes = oprot->getTransport()->writeEnd();
-  oprot->getTransport()->flush();
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postWrite(ctx, "QueryService.setQueryTimeParams", bytes);
-  }
+  sentry.commit();
+  return cseqid;
 }
 
-void QueryServiceProcessor::process_knnQuery(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+void QueryServiceConcurrentClient::recv_knnQueryBatch(ReplyEntryListList& _return, const int32_t seqid)
 {
-  void* ctx = NULL;
-  if (this->eventHandler_.get() != NULL) {
-    ctx = this->eventHandler_->getContext("QueryService.knnQuery", callContext);
-  }
-  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.knnQuery");
-
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preRead(ctx, "QueryService.knnQuery");
-  }
 
-  QueryService_knnQuery_args args;
-  args.read(iprot);
-  iprot->readMessageEnd();
-  uint32_t bytes = iprot->getTransport()->readEnd();
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postRead(ctx, "QueryService.knnQuery", bytes);
-  }
+  // the read mutex gets dropped and reacquired as part of waitForWork()
+  // The destructor of this sentry wakes up other clients
+  ::apache::thrift::async::TConcurrentRecvSentry sentry(&this->sync_, seqid);
 
-  QueryService_knnQuery_result result;
-  try {
-    iface_->knnQuery(result.success, args.k, args.queryObj, args.retExternId, args.retObj);
-    result.__isset.success = true;
-  } catch (QueryException &err) {
-    result.err = err;
-    result.__isset.err = true;
-  } catch (const std::exception& e) {
-    if (this->eventHandler_.get() != NULL) {
-      this->eventHandler_->handlerError(ctx, "QueryService.knnQuery");
+  while(true) {
+    if(!this->sync_.getPending(fname, mtype, rseqid)) {
+      iprot_->readMessageBegin(fname, mtype, rseqid);
     }
+    if(seqid == rseqid) {
+      if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+        ::apache::thrift::TApplicationException x;
+        x.read(iprot_);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+        sentry.commit();
+        throw x;
+      }
+      if (mtype != ::apache::thrift::protocol::T_REPLY) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+      }
+      if (fname.compare("knnQueryBatch") != 0) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
 
-    ::apache::thrift::TApplicationException x(e.what());
-    oprot->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_EXCEPTION, seqid);
-    x.write(oprot);
-    oprot->writeMessageEnd();
-    oprot->getTransport()->writeEnd();
-    oprot->getTransport()->flush();
-    return;
-  }
-
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preWrite(ctx, "QueryService.knnQuery");
-  }
+        // in a bad state, don't commit
+        using ::apache::thrift::protocol::TProtocolException;
+        throw TProtocolException(TProtocolException::INVALID_DATA);
+      }
+      QueryService_knnQueryBatch_presult result;
+      result.success = &_return;
+      result.read(iprot_);
+      iprot_->readMessageEnd();
+      iprot_->getTransport()->readEnd();
 
-  oprot->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_REPLY, seqid);
-  result.write(oprot);
-  oprot->writeMessageEnd();
-  bytes = oprot->getTransport()->writeEnd();
-  oprot->getTransport()->flush();
+      if (result.__isset.success) {
+        // _return pointer has now been filled
+        sentry.commit();
+        return;
+      }
+      if (result.__isset.err) {
+        sentry.commit();
+        throw result.err;
+      }
+      // in a bad state, don't commit
+      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "knnQueryBatch failed: unknown result");
+    }
+    // seqid != rseqid
+    this->sync_.updatePending(fname, mtype, rseqid);
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postWrite(ctx, "QueryService.knnQuery", bytes);
-  }
+    // this will temporarily unlock the readMutex, and let other clients get work done
+    this->sync_.waitForWork(seqid);
+  } // end while(true)
 }
 
-void QueryServiceProcessor::process_rangeQuery(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+void QueryServiceConcurrentClient::rangeQueryBatch(ReplyEntryListList& _return, const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
 {
-  void* ctx = NULL;
-  if (this->eventHandler_.get() != NULL) {
-    ctx = this->eventHandler_->getContext("QueryService.rangeQuery", callContext);
-  }
-  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.rangeQuery");
-
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preRead(ctx, "QueryService.rangeQuery");
-  }
-
-  QueryService_rangeQuery_args args;
-  args.read(iprot);
-  iprot->readMessageEnd();
-  uint32_t bytes = iprot->getTransport()->readEnd();
-
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postRead(ctx, "QueryService.rangeQuery", bytes);
-  }
-
-  QueryService_rangeQuery_result result;
-  try {
-    iface_->rangeQuery(result.success, args.r, args.queryObj, args.retExternId, args.retObj);
-    result.__isset.success = true;
-  } catch (QueryException &err) {
-    result.err = err;
-    result.__isset.err = true;
-  } catch (const std::exception& e) {
-    if (this->eventHandler_.get() != NULL) {
-      this->eventHandler_->handlerError(ctx, "QueryService.rangeQuery");
-    }
+  int32_t seqid = send_rangeQueryBatch(r, queryObjs, retExternId, retObj, binaryQuery);
+  recv_rangeQueryBatch(_return, seqid);
+}
 
-    ::apache::thrift::TApplicationException x(e.what());
-    oprot->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_EXCEPTION, seqid);
-    x.write(oprot);
-    oprot->writeMessageEnd();
-    oprot->getTransport()->writeEnd();
-    oprot->getTransport()->flush();
-    return;
-  }
+int32_t QueryServiceConcurrentClient::send_rangeQueryBatch(const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery)
+{
+  int32_t cseqid = this->sync_.generateSeqId();
+  ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
+  oprot_->writeMessageBegin("rangeQueryBatch", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preWrite(ctx, "QueryService.rangeQuery");
-  }
+  QueryService_rangeQueryBatch_pargs args;
+  args.r = &r;
+  args.queryObjs = &queryObjs;
+  args.retExternId = &retExternId;
+  args.retObj = &retObj;
+  args.binaryQuery = &binaryQuery;
+  args.write(oprot_);
 
-  oprot->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_REPLY, seqid);
-  result.write(oprot);
-  oprot->writeMessageEnd();
-  bytes = oprot->getTransport()->writeEnd();
-  oprot->getTransport()->flush();
+  oprot_->writeMessageEnd();
+  oprot_->getTransport()->writeEnd();
+  oprot_->getTransport()->flush();
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postWrite(ctx, "QueryService.rangeQuery", bytes);
-  }
+  sentry.commit();
+  return cseqid;
 }
 
-void QueryServiceProcessor::process_getDistance(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext)
+void QueryServiceConcurrentClient::recv_rangeQueryBatch(ReplyEntryListList& _return, const int32_t seqid)
 {
-  void* ctx = NULL;
-  if (this->eventHandler_.get() != NULL) {
-    ctx = this->eventHandler_->getContext("QueryService.getDistance", callContext);
-  }
-  ::apache::thrift::TProcessorContextFreer freer(this->eventHandler_.get(), ctx, "QueryService.getDistance");
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preRead(ctx, "QueryService.getDistance");
-  }
-
-  QueryService_getDistance_args args;
-  args.read(iprot);
-  iprot->readMessageEnd();
-  uint32_t bytes = iprot->getTransport()->readEnd();
+  int32_t rseqid = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TMessageType mtype;
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postRead(ctx, "QueryService.getDistance", bytes);
-  }
+  // the read mutex gets dropped and reacquired as part of waitForWork()
+  // The destructor of this sentry wakes up other clients
+  ::apache::thrift::async::TConcurrentRecvSentry sentry(&this->sync_, seqid);
 
-  QueryService_getDistance_result result;
-  try {
-    result.success = iface_->getDistance(args.obj1, args.obj2);
-    result.__isset.success = true;
-  } catch (QueryException &err) {
-    result.err = err;
-    result.__isset.err = true;
-  } catch (const std::exception& e) {
-    if (this->eventHandler_.get() != NULL) {
-      this->eventHandler_->handlerError(ctx, "QueryService.getDistance");
+  while(true) {
+    if(!this->sync_.getPending(fname, mtype, rseqid)) {
+      iprot_->readMessageBegin(fname, mtype, rseqid);
     }
+    if(seqid == rseqid) {
+      if (mtype == ::apache::thrift::protocol::T_EXCEPTION) {
+        ::apache::thrift::TApplicationException x;
+        x.read(iprot_);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+        sentry.commit();
+        throw x;
+      }
+      if (mtype != ::apache::thrift::protocol::T_REPLY) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
+      }
+      if (fname.compare("rangeQueryBatch") != 0) {
+        iprot_->skip(::apache::thrift::protocol::T_STRUCT);
+        iprot_->readMessageEnd();
+        iprot_->getTransport()->readEnd();
 
-    ::apache::thrift::TApplicationException x(e.what());
-    oprot->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_EXCEPTION, seqid);
-    x.write(oprot);
-    oprot->writeMessageEnd();
-    oprot->getTransport()->writeEnd();
-    oprot->getTransport()->flush();
-    return;
-  }
-
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->preWrite(ctx, "QueryService.getDistance");
-  }
-
-  oprot->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_REPLY, seqid);
-  result.write(oprot);
-  oprot->writeMessageEnd();
-  bytes = oprot->getTransport()->writeEnd();
-  oprot->getTransport()->flush();
+        // in a bad state, don't commit
+        using ::apache::thrift::protocol::TProtocolException;
+        throw TProtocolException(TProtocolException::INVALID_DATA);
+      }
+      QueryService_rangeQueryBatch_presult result;
+      result.success = &_return;
+      result.read(iprot_);
+      iprot_->readMessageEnd();
+      iprot_->getTransport()->readEnd();
 
-  if (this->eventHandler_.get() != NULL) {
-    this->eventHandler_->postWrite(ctx, "QueryService.getDistance", bytes);
-  }
-}
+      if (result.__isset.success) {
+        // _return pointer has now been filled
+        sentry.commit();
+        return;
+      }
+      if (result.__isset.err) {
+        sentry.commit();
+        throw result.err;
+      }
+      // in a bad state, don't commit
+      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "rangeQueryBatch failed: unknown result");
+    }
+    // seqid != rseqid
+    this->sync_.updatePending(fname, mtype, rseqid);
 
-::apache::thrift::stdcxx::shared_ptr< ::apache::thrift::TProcessor > QueryServiceProcessorFactory::getProcessor(const ::apache::thrift::TConnectionInfo& connInfo) {
-  ::apache::thrift::ReleaseHandler< QueryServiceIfFactory > cleanup(handlerFactory_);
-  ::apache::thrift::stdcxx::shared_ptr< QueryServiceIf > handler(handlerFactory_->getHandler(connInfo), cleanup);
-  ::apache::thrift::stdcxx::shared_ptr< ::apache::thrift::TProcessor > processor(new QueryServiceProcessor(handler));
-  return processor;
+    // this will temporarily unlock the readMutex, and let other clients get work done
+    this->sync_.waitForWork(seqid);
+  } // end while(true)
 }
 
-void QueryServiceConcurrentClient::setQueryTimeParams(const std::string& queryTimeParams)
+double QueryServiceConcurrentClient::getDistance(const std::string& obj1, const std::string& obj2)
 {
-  int32_t seqid = send_setQueryTimeParams(queryTimeParams);
-  recv_setQueryTimeParams(seqid);
+  int32_t seqid = send_getDistance(obj1, obj2);
+  return recv_getDistance(seqid);
 }
 
-int32_t QueryServiceConcurrentClient::send_setQueryTimeParams(const std::string& queryTimeParams)
+int32_t QueryServiceConcurrentClient::send_getDistance(const std::string& obj1, const std::string& obj2)
 {
   int32_t cseqid = this->sync_.generateSeqId();
   ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
-  oprot_->writeMessageBegin("setQueryTimeParams", ::apache::thrift::protocol::T_CALL, cseqid);
+  oprot_->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  QueryService_setQueryTimeParams_pargs args;
-  args.queryTimeParams = &queryTimeParams;
+  QueryService_getDistance_pargs args;
+  args.obj1 = &obj1;
+  args.obj2 = &obj2;
   args.write(oprot_);
 
   oprot_->writeMessageEnd();
@@ -1548,7 +3975,7 @@ int32_t QueryServiceConcurrentClient::send_setQueryTimeParams(const std::string&
   return cseqid;
 }
 
-void QueryServiceConcurrentClient::recv_setQueryTimeParams(const int32_t seqid)
+double QueryServiceConcurrentClient::recv_getDistance(const int32_t seqid)
 {
 
   int32_t rseqid = 0;
@@ -1577,7 +4004,7 @@ void QueryServiceConcurrentClient::recv_setQueryTimeParams(const int32_t seqid)
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
       }
-      if (fname.compare("setQueryTimeParams") != 0) {
+      if (fname.compare("getDistance") != 0) {
         iprot_->skip(::apache::thrift::protocol::T_STRUCT);
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
@@ -1586,17 +4013,23 @@ void QueryServiceConcurrentClient::recv_setQueryTimeParams(const int32_t seqid)
         using ::apache::thrift::protocol::TProtocolException;
         throw TProtocolException(TProtocolException::INVALID_DATA);
       }
-      QueryService_setQueryTimeParams_presult result;
+      double _return;
+      QueryService_getDistance_presult result;
+      result.success = &_return;
       result.read(iprot_);
       iprot_->readMessageEnd();
       iprot_->getTransport()->readEnd();
 
+      if (result.__isset.success) {
+        sentry.commit();
+        return _return;
+      }
       if (result.__isset.err) {
         sentry.commit();
         throw result.err;
       }
-      sentry.commit();
-      return;
+      // in a bad state, don't commit
+      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getDistance failed: unknown result");
     }
     // seqid != rseqid
     this->sync_.updatePending(fname, mtype, rseqid);
@@ -1606,23 +4039,19 @@ void QueryServiceConcurrentClient::recv_setQueryTimeParams(const int32_t seqid)
   } // end while(true)
 }
 
-void QueryServiceConcurrentClient::knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj)
+void QueryServiceConcurrentClient::getCacheStats(CacheStats& _return)
 {
-  int32_t seqid = send_knnQuery(k, queryObj, retExternId, retObj);
-  recv_knnQuery(_return, seqid);
+  int32_t seqid = send_getCacheStats();
+  recv_getCacheStats(_return, seqid);
 }
 
-int32_t QueryServiceConcurrentClient::send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj)
+int32_t QueryServiceConcurrentClient::send_getCacheStats()
 {
   int32_t cseqid = this->sync_.generateSeqId();
   ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
-  oprot_->writeMessageBegin("knnQuery", ::apache::thrift::protocol::T_CALL, cseqid);
+  oprot_->writeMessageBegin("getCacheStats", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  QueryService_knnQuery_pargs args;
-  args.k = &k;
-  args.queryObj = &queryObj;
-  args.retExternId = &retExternId;
-  args.retObj = &retObj;
+  QueryService_getCacheStats_pargs args;
   args.write(oprot_);
 
   oprot_->writeMessageEnd();
@@ -1633,7 +4062,7 @@ int32_t QueryServiceConcurrentClient::send_knnQuery(const int32_t k, const std::
   return cseqid;
 }
 
-void QueryServiceConcurrentClient::recv_knnQuery(ReplyEntryList& _return, const int32_t seqid)
+void QueryServiceConcurrentClient::recv_getCacheStats(CacheStats& _return, const int32_t seqid)
 {
 
   int32_t rseqid = 0;
@@ -1662,7 +4091,7 @@ void QueryServiceConcurrentClient::recv_knnQuery(ReplyEntryList& _return, const
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
       }
-      if (fname.compare("knnQuery") != 0) {
+      if (fname.compare("getCacheStats") != 0) {
         iprot_->skip(::apache::thrift::protocol::T_STRUCT);
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
@@ -1671,7 +4100,7 @@ void QueryServiceConcurrentClient::recv_knnQuery(ReplyEntryList& _return, const
         using ::apache::thrift::protocol::TProtocolException;
         throw TProtocolException(TProtocolException::INVALID_DATA);
       }
-      QueryService_knnQuery_presult result;
+      QueryService_getCacheStats_presult result;
       result.success = &_return;
       result.read(iprot_);
       iprot_->readMessageEnd();
@@ -1687,7 +4116,7 @@ void QueryServiceConcurrentClient::recv_knnQuery(ReplyEntryList& _return, const
         throw result.err;
       }
       // in a bad state, don't commit
-      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "knnQuery failed: unknown result");
+      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getCacheStats failed: unknown result");
     }
     // seqid != rseqid
     this->sync_.updatePending(fname, mtype, rseqid);
@@ -1697,23 +4126,22 @@ void QueryServiceConcurrentClient::recv_knnQuery(ReplyEntryList& _return, const
   } // end while(true)
 }
 
-void QueryServiceConcurrentClient::rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj)
+void QueryServiceConcurrentClient::reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData)
 {
-  int32_t seqid = send_rangeQuery(r, queryObj, retExternId, retObj);
-  recv_rangeQuery(_return, seqid);
+  int32_t seqid = send_reloadIndex(dataFile, loadIndexLoc, cacheData);
+  recv_reloadIndex(seqid);
 }
 
-int32_t QueryServiceConcurrentClient::send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj)
+int32_t QueryServiceConcurrentClient::send_reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData)
 {
   int32_t cseqid = this->sync_.generateSeqId();
   ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
-  oprot_->writeMessageBegin("rangeQuery", ::apache::thrift::protocol::T_CALL, cseqid);
+  oprot_->writeMessageBegin("reloadIndex", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  QueryService_rangeQuery_pargs args;
-  args.r = &r;
-  args.queryObj = &queryObj;
-  args.retExternId = &retExternId;
-  args.retObj = &retObj;
+  QueryService_reloadIndex_pargs args;
+  args.dataFile = &dataFile;
+  args.loadIndexLoc = &loadIndexLoc;
+  args.cacheData = &cacheData;
   args.write(oprot_);
 
   oprot_->writeMessageEnd();
@@ -1724,7 +4152,7 @@ int32_t QueryServiceConcurrentClient::send_rangeQuery(const double r, const std:
   return cseqid;
 }
 
-void QueryServiceConcurrentClient::recv_rangeQuery(ReplyEntryList& _return, const int32_t seqid)
+void QueryServiceConcurrentClient::recv_reloadIndex(const int32_t seqid)
 {
 
   int32_t rseqid = 0;
@@ -1753,7 +4181,7 @@ void QueryServiceConcurrentClient::recv_rangeQuery(ReplyEntryList& _return, cons
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
       }
-      if (fname.compare("rangeQuery") != 0) {
+      if (fname.compare("reloadIndex") != 0) {
         iprot_->skip(::apache::thrift::protocol::T_STRUCT);
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
@@ -1762,23 +4190,17 @@ void QueryServiceConcurrentClient::recv_rangeQuery(ReplyEntryList& _return, cons
         using ::apache::thrift::protocol::TProtocolException;
         throw TProtocolException(TProtocolException::INVALID_DATA);
       }
-      QueryService_rangeQuery_presult result;
-      result.success = &_return;
+      QueryService_reloadIndex_presult result;
       result.read(iprot_);
       iprot_->readMessageEnd();
       iprot_->getTransport()->readEnd();
 
-      if (result.__isset.success) {
-        // _return pointer has now been filled
-        sentry.commit();
-        return;
-      }
       if (result.__isset.err) {
         sentry.commit();
         throw result.err;
       }
-      // in a bad state, don't commit
-      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "rangeQuery failed: unknown result");
+      sentry.commit();
+      return;
     }
     // seqid != rseqid
     this->sync_.updatePending(fname, mtype, rseqid);
@@ -1788,21 +4210,19 @@ void QueryServiceConcurrentClient::recv_rangeQuery(ReplyEntryList& _return, cons
   } // end while(true)
 }
 
-double QueryServiceConcurrentClient::getDistance(const std::string& obj1, const std::string& obj2)
+void QueryServiceConcurrentClient::getStats(ServerStats& _return)
 {
-  int32_t seqid = send_getDistance(obj1, obj2);
-  return recv_getDistance(seqid);
+  int32_t seqid = send_getStats();
+  recv_getStats(_return, seqid);
 }
 
-int32_t QueryServiceConcurrentClient::send_getDistance(const std::string& obj1, const std::string& obj2)
+int32_t QueryServiceConcurrentClient::send_getStats()
 {
   int32_t cseqid = this->sync_.generateSeqId();
   ::apache::thrift::async::TConcurrentSendSentry sentry(&this->sync_);
-  oprot_->writeMessageBegin("getDistance", ::apache::thrift::protocol::T_CALL, cseqid);
+  oprot_->writeMessageBegin("getStats", ::apache::thrift::protocol::T_CALL, cseqid);
 
-  QueryService_getDistance_pargs args;
-  args.obj1 = &obj1;
-  args.obj2 = &obj2;
+  QueryService_getStats_pargs args;
   args.write(oprot_);
 
   oprot_->writeMessageEnd();
@@ -1813,7 +4233,7 @@ int32_t QueryServiceConcurrentClient::send_getDistance(const std::string& obj1,
   return cseqid;
 }
 
-double QueryServiceConcurrentClient::recv_getDistance(const int32_t seqid)
+void QueryServiceConcurrentClient::recv_getStats(ServerStats& _return, const int32_t seqid)
 {
 
   int32_t rseqid = 0;
@@ -1842,7 +4262,7 @@ double QueryServiceConcurrentClient::recv_getDistance(const int32_t seqid)
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
       }
-      if (fname.compare("getDistance") != 0) {
+      if (fname.compare("getStats") != 0) {
         iprot_->skip(::apache::thrift::protocol::T_STRUCT);
         iprot_->readMessageEnd();
         iprot_->getTransport()->readEnd();
@@ -1851,23 +4271,23 @@ double QueryServiceConcurrentClient::recv_getDistance(const int32_t seqid)
         using ::apache::thrift::protocol::TProtocolException;
         throw TProtocolException(TProtocolException::INVALID_DATA);
       }
-      double _return;
-      QueryService_getDistance_presult result;
+      QueryService_getStats_presult result;
       result.success = &_return;
       result.read(iprot_);
       iprot_->readMessageEnd();
       iprot_->getTransport()->readEnd();
 
       if (result.__isset.success) {
+        // _return pointer has now been filled
         sentry.commit();
-        return _return;
+        return;
       }
       if (result.__isset.err) {
         sentry.commit();
         throw result.err;
       }
       // in a bad state, don't commit
-      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getDistance failed: unknown result");
+      throw ::apache::thrift::TApplicationException(::apache::thrift::TApplicationException::MISSING_RESULT, "getStats failed: unknown result");
     }
     // seqid != rseqid
     this->sync_.updatePending(fname, mtype, rseqid);
@@ -22,9 +22,14 @@ class QueryServiceIf {
  public:
   virtual ~QueryServiceIf() {}
   virtual void setQueryTimeParams(const std::string& queryTimeParams) = 0;
-  virtual void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj) = 0;
-  virtual void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj) = 0;
+  virtual void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery) = 0;
+  virtual void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery) = 0;
+  virtual void knnQueryBatch(ReplyEntryListList& _return, const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery) = 0;
+  virtual void rangeQueryBatch(ReplyEntryListList& _return, const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery) = 0;
   virtual double getDistance(const std::string& obj1, const std::string& obj2) = 0;
+  virtual void getCacheStats(CacheStats& _return) = 0;
+  virtual void reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData) = 0;
+  virtual void getStats(ServerStats& _return) = 0;
 };
 
 class QueryServiceIfFactory {
@@ -57,16 +62,31 @@ class QueryServiceNull : virtual public QueryServiceIf {
   void setQueryTimeParams(const std::string& /* queryTimeParams */) {
     return;
   }
-  void knnQuery(ReplyEntryList& /* _return */, const int32_t /* k */, const std::string& /* queryObj */, const bool /* retExternId */, const bool /* retObj */) {
+  void knnQuery(ReplyEntryList& /* _return */, const int32_t /* k */, const std::string& /* queryObj */, const bool /* retExternId */, const bool /* retObj */, const bool /* binaryQuery */) {
     return;
   }
-  void rangeQuery(ReplyEntryList& /* _return */, const double /* r */, const std::string& /* queryObj */, const bool /* retExternId */, const bool /* retObj */) {
+  void rangeQuery(ReplyEntryList& /* _return */, const double /* r */, const std::string& /* queryObj */, const bool /* retExternId */, const bool /* retObj */, const bool /* binaryQuery */) {
+    return;
+  }
+  void knnQueryBatch(ReplyEntryListList& /* _return */, const int32_t /* k */, const std::vector<std::string> & /* queryObjs */, const bool /* retExternId */, const bool /* retObj */, const bool /* binaryQuery */) {
+    return;
+  }
+  void rangeQueryBatch(ReplyEntryListList& /* _return */, const double /* r */, const std::vector<std::string> & /* queryObjs */, const bool /* retExternId */, const bool /* retObj */, const bool /* binaryQuery */) {
     return;
   }
   double getDistance(const std::string& /* obj1 */, const std::string& /* obj2 */) {
     double _return = (double)0;
     return _return;
   }
+  void getCacheStats(CacheStats& /* _return */) {
+    return;
+  }
+  void reloadIndex(const std::string& /* dataFile */, const std::string& /* loadIndexLoc */, const bool /* cacheData */) {
+    return;
+  }
+  void getStats(ServerStats& /* _return */) {
+    return;
+  }
 };
 
 
@@ -167,13 +187,17 @@ class QueryService_setQueryTimeParams_presult {
 
 };
 
+typedef struct _QueryService_knnQuery_args__isset {
+  _QueryService_knnQuery_args__isset() : binaryQuery(false) {}
+  bool binaryQuery :1;
+} _QueryService_knnQuery_args__isset;
 
 class QueryService_knnQuery_args {
  public:
 
   QueryService_knnQuery_args(const QueryService_knnQuery_args&);
   QueryService_knnQuery_args& operator=(const QueryService_knnQuery_args&);
-  QueryService_knnQuery_args() : k(0), queryObj(), retExternId(0), retObj(0) {
+  QueryService_knnQuery_args() : k(0), queryObj(), retExternId(0), retObj(0), binaryQuery(0) {
   }
 
   virtual ~QueryService_knnQuery_args() throw();
@@ -181,6 +205,9 @@ class QueryService_knnQuery_args {
   std::string queryObj;
   bool retExternId;
   bool retObj;
+  bool binaryQuery;
+
+  _QueryService_knnQuery_args__isset __isset;
 
   void __set_k(const int32_t val);
 
@@ -190,6 +217,8 @@ class QueryService_knnQuery_args {
 
   void __set_retObj(const bool val);
 
+  void __set_binaryQuery(const bool val);
+
   bool operator == (const QueryService_knnQuery_args & rhs) const
   {
     if (!(k == rhs.k))
@@ -200,6 +229,8 @@ class QueryService_knnQuery_args {
       return false;
     if (!(retObj == rhs.retObj))
       return false;
+    if (!(binaryQuery == rhs.binaryQuery))
+      return false;
     return true;
   }
   bool operator != (const QueryService_knnQuery_args &rhs) const {
@@ -223,6 +254,7 @@ class QueryService_knnQuery_pargs {
   const std::string* queryObj;
   const bool* retExternId;
   const bool* retObj;
+  const bool* binaryQuery;
 
   uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
 
@@ -291,13 +323,17 @@ class QueryService_knnQuery_presult {
 
 };
 
+typedef struct _QueryService_rangeQuery_args__isset {
+  _QueryService_rangeQuery_args__isset() : binaryQuery(false) {}
+  bool binaryQuery :1;
+} _QueryService_rangeQuery_args__isset;
 
 class QueryService_rangeQuery_args {
  public:
 
   QueryService_rangeQuery_args(const QueryService_rangeQuery_args&);
   QueryService_rangeQuery_args& operator=(const QueryService_rangeQuery_args&);
-  QueryService_rangeQuery_args() : r(0), queryObj(), retExternId(0), retObj(0) {
+  QueryService_rangeQuery_args() : r(0), queryObj(), retExternId(0), retObj(0), binaryQuery(0) {
   }
 
   virtual ~QueryService_rangeQuery_args() throw();
@@ -305,6 +341,9 @@ class QueryService_rangeQuery_args {
   std::string queryObj;
   bool retExternId;
   bool retObj;
+  bool binaryQuery;
+
+  _QueryService_rangeQuery_args__isset __isset;
 
   void __set_r(const double val);
 
@@ -314,6 +353,8 @@ class QueryService_rangeQuery_args {
 
   void __set_retObj(const bool val);
 
+  void __set_binaryQuery(const bool val);
+
   bool operator == (const QueryService_rangeQuery_args & rhs) const
   {
     if (!(r == rhs.r))
@@ -324,6 +365,8 @@ class QueryService_rangeQuery_args {
       return false;
     if (!(retObj == rhs.retObj))
       return false;
+    if (!(binaryQuery == rhs.binaryQuery))
+      return false;
     return true;
   }
   bool operator != (const QueryService_rangeQuery_args &rhs) const {
@@ -347,6 +390,7 @@ class QueryService_rangeQuery_pargs {
   const std::string* queryObj;
   const bool* retExternId;
   const bool* retObj;
+  const bool* binaryQuery;
 
   uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
 
@@ -415,6 +459,278 @@ class QueryService_rangeQuery_presult {
 
 };
 
+typedef struct _QueryService_knnQueryBatch_args__isset {
+  _QueryService_knnQueryBatch_args__isset() : binaryQuery(false) {}
+  bool binaryQuery :1;
+} _QueryService_knnQueryBatch_args__isset;
+
+class QueryService_knnQueryBatch_args {
+ public:
+
+  QueryService_knnQueryBatch_args(const QueryService_knnQueryBatch_args&);
+  QueryService_knnQueryBatch_args& operator=(const QueryService_knnQueryBatch_args&);
+  QueryService_knnQueryBatch_args() : k(0), retExternId(0), retObj(0), binaryQuery(0) {
+  }
+
+  virtual ~QueryService_knnQueryBatch_args() throw();
+  int32_t k;
+  std::vector<std::string>  queryObjs;
+  bool retExternId;
+  bool retObj;
+  bool binaryQuery;
+
+  _QueryService_knnQueryBatch_args__isset __isset;
+
+  void __set_k(const int32_t val);
+
+  void __set_queryObjs(const std::vector<std::string> & val);
+
+  void __set_retExternId(const bool val);
+
+  void __set_retObj(const bool val);
+
+  void __set_binaryQuery(const bool val);
+
+  bool operator == (const QueryService_knnQueryBatch_args & rhs) const
+  {
+    if (!(k == rhs.k))
+      return false;
+    if (!(queryObjs == rhs.queryObjs))
+      return false;
+    if (!(retExternId == rhs.retExternId))
+      return false;
+    if (!(retObj == rhs.retObj))
+      return false;
+    if (!(binaryQuery == rhs.binaryQuery))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_knnQueryBatch_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_knnQueryBatch_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class QueryService_knnQueryBatch_pargs {
+ public:
+
+
+  virtual ~QueryService_knnQueryBatch_pargs() throw();
+  const int32_t* k;
+  const std::vector<std::string> * queryObjs;
+  const bool* retExternId;
+  const bool* retObj;
+  const bool* binaryQuery;
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_knnQueryBatch_result__isset {
+  _QueryService_knnQueryBatch_result__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_knnQueryBatch_result__isset;
+
+class QueryService_knnQueryBatch_result {
+ public:
+
+  QueryService_knnQueryBatch_result(const QueryService_knnQueryBatch_result&);
+  QueryService_knnQueryBatch_result& operator=(const QueryService_knnQueryBatch_result&);
+  QueryService_knnQueryBatch_result() {
+  }
+
+  virtual ~QueryService_knnQueryBatch_result() throw();
+  ReplyEntryListList success;
+  QueryException err;
+
+  _QueryService_knnQueryBatch_result__isset __isset;
+
+  void __set_success(const ReplyEntryListList& val);
+
+  void __set_err(const QueryException& val);
+
+  bool operator == (const QueryService_knnQueryBatch_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    if (!(err == rhs.err))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_knnQueryBatch_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_knnQueryBatch_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_knnQueryBatch_presult__isset {
+  _QueryService_knnQueryBatch_presult__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_knnQueryBatch_presult__isset;
+
+class QueryService_knnQueryBatch_presult {
+ public:
+
+
+  virtual ~QueryService_knnQueryBatch_presult() throw();
+  ReplyEntryListList* success;
+  QueryException err;
+
+  _QueryService_knnQueryBatch_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
+typedef struct _QueryService_rangeQueryBatch_args__isset {
+  _QueryService_rangeQueryBatch_args__isset() : binaryQuery(false) {}
+  bool binaryQuery :1;
+} _QueryService_rangeQueryBatch_args__isset;
+
+class QueryService_rangeQueryBatch_args {
+ public:
+
+  QueryService_rangeQueryBatch_args(const QueryService_rangeQueryBatch_args&);
+  QueryService_rangeQueryBatch_args& operator=(const QueryService_rangeQueryBatch_args&);
+  QueryService_rangeQueryBatch_args() : r(0), retExternId(0), retObj(0), binaryQuery(0) {
+  }
+
+  virtual ~QueryService_rangeQueryBatch_args() throw();
+  double r;
+  std::vector<std::string>  queryObjs;
+  bool retExternId;
+  bool retObj;
+  bool binaryQuery;
+
+  _QueryService_rangeQueryBatch_args__isset __isset;
+
+  void __set_r(const double val);
+
+  void __set_queryObjs(const std::vector<std::string> & val);
+
+  void __set_retExternId(const bool val);
+
+  void __set_retObj(const bool val);
+
+  void __set_binaryQuery(const bool val);
+
+  bool operator == (const QueryService_rangeQueryBatch_args & rhs) const
+  {
+    if (!(r == rhs.r))
+      return false;
+    if (!(queryObjs == rhs.queryObjs))
+      return false;
+    if (!(retExternId == rhs.retExternId))
+      return false;
+    if (!(retObj == rhs.retObj))
+      return false;
+    if (!(binaryQuery == rhs.binaryQuery))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_rangeQueryBatch_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_rangeQueryBatch_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class QueryService_rangeQueryBatch_pargs {
+ public:
+
+
+  virtual ~QueryService_rangeQueryBatch_pargs() throw();
+  const double* r;
+  const std::vector<std::string> * queryObjs;
+  const bool* retExternId;
+  const bool* retObj;
+  const bool* binaryQuery;
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_rangeQueryBatch_result__isset {
+  _QueryService_rangeQueryBatch_result__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_rangeQueryBatch_result__isset;
+
+class QueryService_rangeQueryBatch_result {
+ public:
+
+  QueryService_rangeQueryBatch_result(const QueryService_rangeQueryBatch_result&);
+  QueryService_rangeQueryBatch_result& operator=(const QueryService_rangeQueryBatch_result&);
+  QueryService_rangeQueryBatch_result() {
+  }
+
+  virtual ~QueryService_rangeQueryBatch_result() throw();
+  ReplyEntryListList success;
+  QueryException err;
+
+  _QueryService_rangeQueryBatch_result__isset __isset;
+
+  void __set_success(const ReplyEntryListList& val);
+
+  void __set_err(const QueryException& val);
+
+  bool operator == (const QueryService_rangeQueryBatch_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    if (!(err == rhs.err))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_rangeQueryBatch_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_rangeQueryBatch_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_rangeQueryBatch_presult__isset {
+  _QueryService_rangeQueryBatch_presult__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_rangeQueryBatch_presult__isset;
+
+class QueryService_rangeQueryBatch_presult {
+ public:
+
+
+  virtual ~QueryService_rangeQueryBatch_presult() throw();
+  ReplyEntryListList* success;
+  QueryException err;
+
+  _QueryService_rangeQueryBatch_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
 
 class QueryService_getDistance_args {
  public:
@@ -527,6 +843,316 @@ class QueryService_getDistance_presult {
 
 };
 
+
+class QueryService_getCacheStats_args {
+ public:
+
+  QueryService_getCacheStats_args(const QueryService_getCacheStats_args&);
+  QueryService_getCacheStats_args& operator=(const QueryService_getCacheStats_args&);
+  QueryService_getCacheStats_args() {
+  }
+
+  virtual ~QueryService_getCacheStats_args() throw();
+
+  bool operator == (const QueryService_getCacheStats_args & /* rhs */) const
+  {
+    return true;
+  }
+  bool operator != (const QueryService_getCacheStats_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_getCacheStats_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class QueryService_getCacheStats_pargs {
+ public:
+
+
+  virtual ~QueryService_getCacheStats_pargs() throw();
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_getCacheStats_result__isset {
+  _QueryService_getCacheStats_result__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_getCacheStats_result__isset;
+
+class QueryService_getCacheStats_result {
+ public:
+
+  QueryService_getCacheStats_result(const QueryService_getCacheStats_result&);
+  QueryService_getCacheStats_result& operator=(const QueryService_getCacheStats_result&);
+  QueryService_getCacheStats_result() {
+  }
+
+  virtual ~QueryService_getCacheStats_result() throw();
+  CacheStats success;
+  QueryException err;
+
+  _QueryService_getCacheStats_result__isset __isset;
+
+  void __set_success(const CacheStats& val);
+
+  void __set_err(const QueryException& val);
+
+  bool operator == (const QueryService_getCacheStats_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    if (!(err == rhs.err))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_getCacheStats_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_getCacheStats_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_getCacheStats_presult__isset {
+  _QueryService_getCacheStats_presult__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_getCacheStats_presult__isset;
+
+class QueryService_getCacheStats_presult {
+ public:
+
+
+  virtual ~QueryService_getCacheStats_presult() throw();
+  CacheStats* success;
+  QueryException err;
+
+  _QueryService_getCacheStats_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
+
+class QueryService_reloadIndex_args {
+ public:
+
+  QueryService_reloadIndex_args(const QueryService_reloadIndex_args&);
+  QueryService_reloadIndex_args& operator=(const QueryService_reloadIndex_args&);
+  QueryService_reloadIndex_args() : dataFile(), loadIndexLoc(), cacheData(0) {
+  }
+
+  virtual ~QueryService_reloadIndex_args() throw();
+  std::string dataFile;
+  std::string loadIndexLoc;
+  bool cacheData;
+
+  void __set_dataFile(const std::string& val);
+
+  void __set_loadIndexLoc(const std::string& val);
+
+  void __set_cacheData(const bool val);
+
+  bool operator == (const QueryService_reloadIndex_args & rhs) const
+  {
+    if (!(dataFile == rhs.dataFile))
+      return false;
+    if (!(loadIndexLoc == rhs.loadIndexLoc))
+      return false;
+    if (!(cacheData == rhs.cacheData))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_reloadIndex_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_reloadIndex_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class QueryService_reloadIndex_pargs {
+ public:
+
+
+  virtual ~QueryService_reloadIndex_pargs() throw();
+  const std::string* dataFile;
+  const std::string* loadIndexLoc;
+  const bool* cacheData;
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_reloadIndex_result__isset {
+  _QueryService_reloadIndex_result__isset() : err(false) {}
+  bool err :1;
+} _QueryService_reloadIndex_result__isset;
+
+class QueryService_reloadIndex_result {
+ public:
+
+  QueryService_reloadIndex_result(const QueryService_reloadIndex_result&);
+  QueryService_reloadIndex_result& operator=(const QueryService_reloadIndex_result&);
+  QueryService_reloadIndex_result() {
+  }
+
+  virtual ~QueryService_reloadIndex_result() throw();
+  QueryException err;
+
+  _QueryService_reloadIndex_result__isset __isset;
+
+  void __set_err(const QueryException& val);
+
+  bool operator == (const QueryService_reloadIndex_result & rhs) const
+  {
+    if (!(err == rhs.err))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_reloadIndex_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_reloadIndex_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_reloadIndex_presult__isset {
+  _QueryService_reloadIndex_presult__isset() : err(false) {}
+  bool err :1;
+} _QueryService_reloadIndex_presult__isset;
+
+class QueryService_reloadIndex_presult {
+ public:
+
+
+  virtual ~QueryService_reloadIndex_presult() throw();
+  QueryException err;
+
+  _QueryService_reloadIndex_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
+
+class QueryService_getStats_args {
+ public:
+
+  QueryService_getStats_args(const QueryService_getStats_args&);
+  QueryService_getStats_args& operator=(const QueryService_getStats_args&);
+  QueryService_getStats_args() {
+  }
+
+  virtual ~QueryService_getStats_args() throw();
+
+  bool operator == (const QueryService_getStats_args & /* rhs */) const
+  {
+    return true;
+  }
+  bool operator != (const QueryService_getStats_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_getStats_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class QueryService_getStats_pargs {
+ public:
+
+
+  virtual ~QueryService_getStats_pargs() throw();
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_getStats_result__isset {
+  _QueryService_getStats_result__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_getStats_result__isset;
+
+class QueryService_getStats_result {
+ public:
+
+  QueryService_getStats_result(const QueryService_getStats_result&);
+  QueryService_getStats_result& operator=(const QueryService_getStats_result&);
+  QueryService_getStats_result() {
+  }
+
+  virtual ~QueryService_getStats_result() throw();
+  ServerStats success;
+  QueryException err;
+
+  _QueryService_getStats_result__isset __isset;
+
+  void __set_success(const ServerStats& val);
+
+  void __set_err(const QueryException& val);
+
+  bool operator == (const QueryService_getStats_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    if (!(err == rhs.err))
+      return false;
+    return true;
+  }
+  bool operator != (const QueryService_getStats_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const QueryService_getStats_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _QueryService_getStats_presult__isset {
+  _QueryService_getStats_presult__isset() : success(false), err(false) {}
+  bool success :1;
+  bool err :1;
+} _QueryService_getStats_presult__isset;
+
+class QueryService_getStats_presult {
+ public:
+
+
+  virtual ~QueryService_getStats_presult() throw();
+  ServerStats* success;
+  QueryException err;
+
+  _QueryService_getStats_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
 class QueryServiceClient : virtual public QueryServiceIf {
  public:
   QueryServiceClient(apache::thrift::stdcxx::shared_ptr< ::apache::thrift::protocol::TProtocol> prot) {
@@ -555,15 +1181,30 @@ class QueryServiceClient : virtual public QueryServiceIf {
   void setQueryTimeParams(const std::string& queryTimeParams);
   void send_setQueryTimeParams(const std::string& queryTimeParams);
   void recv_setQueryTimeParams();
-  void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj);
-  void send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj);
+  void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
   void recv_knnQuery(ReplyEntryList& _return);
-  void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj);
-  void send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj);
+  void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
   void recv_rangeQuery(ReplyEntryList& _return);
+  void knnQueryBatch(ReplyEntryListList& _return, const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void send_knnQueryBatch(const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void recv_knnQueryBatch(ReplyEntryListList& _return);
+  void rangeQueryBatch(ReplyEntryListList& _return, const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void send_rangeQueryBatch(const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void recv_rangeQueryBatch(ReplyEntryListList& _return);
   double getDistance(const std::string& obj1, const std::string& obj2);
   void send_getDistance(const std::string& obj1, const std::string& obj2);
   double recv_getDistance();
+  void getCacheStats(CacheStats& _return);
+  void send_getCacheStats();
+  void recv_getCacheStats(CacheStats& _return);
+  void reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData);
+  void send_reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData);
+  void recv_reloadIndex();
+  void getStats(ServerStats& _return);
+  void send_getStats();
+  void recv_getStats(ServerStats& _return);
  protected:
   apache::thrift::stdcxx::shared_ptr< ::apache::thrift::protocol::TProtocol> piprot_;
   apache::thrift::stdcxx::shared_ptr< ::apache::thrift::protocol::TProtocol> poprot_;
@@ -582,14 +1223,24 @@ class QueryServiceProcessor : public ::apache::thrift::TDispatchProcessor {
   void process_setQueryTimeParams(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_knnQuery(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_rangeQuery(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_knnQueryBatch(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_rangeQueryBatch(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_getDistance(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_getCacheStats(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_reloadIndex(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_getStats(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
  public:
   QueryServiceProcessor(::apache::thrift::stdcxx::shared_ptr<QueryServiceIf> iface) :
     iface_(iface) {
     processMap_["setQueryTimeParams"] = &QueryServiceProcessor::process_setQueryTimeParams;
     processMap_["knnQuery"] = &QueryServiceProcessor::process_knnQuery;
     processMap_["rangeQuery"] = &QueryServiceProcessor::process_rangeQuery;
+    processMap_["knnQueryBatch"] = &QueryServiceProcessor::process_knnQueryBatch;
+    processMap_["rangeQueryBatch"] = &QueryServiceProcessor::process_rangeQueryBatch;
     processMap_["getDistance"] = &QueryServiceProcessor::process_getDistance;
+    processMap_["getCacheStats"] = &QueryServiceProcessor::process_getCacheStats;
+    processMap_["reloadIndex"] = &QueryServiceProcessor::process_reloadIndex;
+    processMap_["getStats"] = &QueryServiceProcessor::process_getStats;
   }
 
   virtual ~QueryServiceProcessor() {}
@@ -627,23 +1278,43 @@ class QueryServiceMultiface : virtual public QueryServiceIf {
     ifaces_[i]->setQueryTimeParams(queryTimeParams);
   }
 
-  void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj) {
+  void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery) {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->knnQuery(_return, k, queryObj, retExternId, retObj, binaryQuery);
+    }
+    ifaces_[i]->knnQuery(_return, k, queryObj, retExternId, retObj, binaryQuery);
+    return;
+  }
+
+  void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery) {
     size_t sz = ifaces_.size();
     size_t i = 0;
     for (; i < (sz - 1); ++i) {
-      ifaces_[i]->knnQuery(_return, k, queryObj, retExternId, retObj);
+      ifaces_[i]->rangeQuery(_return, r, queryObj, retExternId, retObj, binaryQuery);
     }
-    ifaces_[i]->knnQuery(_return, k, queryObj, retExternId, retObj);
+    ifaces_[i]->rangeQuery(_return, r, queryObj, retExternId, retObj, binaryQuery);
     return;
   }
 
-  void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj) {
+  void knnQueryBatch(ReplyEntryListList& _return, const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery) {
     size_t sz = ifaces_.size();
     size_t i = 0;
     for (; i < (sz - 1); ++i) {
-      ifaces_[i]->rangeQuery(_return, r, queryObj, retExternId, retObj);
+      ifaces_[i]->knnQueryBatch(_return, k, queryObjs, retExternId, retObj, binaryQuery);
     }
-    ifaces_[i]->rangeQuery(_return, r, queryObj, retExternId, retObj);
+    ifaces_[i]->knnQueryBatch(_return, k, queryObjs, retExternId, retObj, binaryQuery);
+    return;
+  }
+
+  void rangeQueryBatch(ReplyEntryListList& _return, const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery) {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->rangeQueryBatch(_return, r, queryObjs, retExternId, retObj, binaryQuery);
+    }
+    ifaces_[i]->rangeQueryBatch(_return, r, queryObjs, retExternId, retObj, binaryQuery);
     return;
   }
 
@@ -656,6 +1327,35 @@ class QueryServiceMultiface : virtual public QueryServiceIf {
     return ifaces_[i]->getDistance(obj1, obj2);
   }
 
+  void getCacheStats(CacheStats& _return) {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->getCacheStats(_return);
+    }
+    ifaces_[i]->getCacheStats(_return);
+    return;
+  }
+
+  void reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData) {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->reloadIndex(dataFile, loadIndexLoc, cacheData);
+    }
+    ifaces_[i]->reloadIndex(dataFile, loadIndexLoc, cacheData);
+  }
+
+  void getStats(ServerStats& _return) {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->getStats(_return);
+    }
+    ifaces_[i]->getStats(_return);
+    return;
+  }
+
 };
 
 // The 'concurrent' client is a thread safe client that correctly handles
@@ -689,15 +1389,30 @@ class QueryServiceConcurrentClient : virtual public QueryServiceIf {
   void setQueryTimeParams(const std::string& queryTimeParams);
   int32_t send_setQueryTimeParams(const std::string& queryTimeParams);
   void recv_setQueryTimeParams(const int32_t seqid);
-  void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj);
-  int32_t send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj);
+  void knnQuery(ReplyEntryList& _return, const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
+  int32_t send_knnQuery(const int32_t k, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
   void recv_knnQuery(ReplyEntryList& _return, const int32_t seqid);
-  void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj);
-  int32_t send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj);
+  void rangeQuery(ReplyEntryList& _return, const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
+  int32_t send_rangeQuery(const double r, const std::string& queryObj, const bool retExternId, const bool retObj, const bool binaryQuery);
   void recv_rangeQuery(ReplyEntryList& _return, const int32_t seqid);
+  void knnQueryBatch(ReplyEntryListList& _return, const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  int32_t send_knnQueryBatch(const int32_t k, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void recv_knnQueryBatch(ReplyEntryListList& _return, const int32_t seqid);
+  void rangeQueryBatch(ReplyEntryListList& _return, const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  int32_t send_rangeQueryBatch(const double r, const std::vector<std::string> & queryObjs, const bool retExternId, const bool retObj, const bool binaryQuery);
+  void recv_rangeQueryBatch(ReplyEntryListList& _return, const int32_t seqid);
   double getDistance(const std::string& obj1, const std::string& obj2);
   int32_t send_getDistance(const std::string& obj1, const std::string& obj2);
   double recv_getDistance(const int32_t seqid);
+  void getCacheStats(CacheStats& _return);
+  int32_t send_getCacheStats();
+  void recv_getCacheStats(CacheStats& _return, const int32_t seqid);
+  void reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData);
+  int32_t send_reloadIndex(const std::string& dataFile, const std::string& loadIndexLoc, const bool cacheData);
+  void recv_reloadIndex(const int32_t seqid);
+  void getStats(ServerStats& _return);
+  int32_t send_getStats();
+  void recv_getStats(ServerStats& _return, const int32_t seqid);
  protected:
   apache::thrift::stdcxx::shared_ptr< ::apache::thrift::protocol::TProtocol> piprot_;
   apache::thrift::stdcxx::shared_ptr< ::apache::thrift::protocol::TProtocol> poprot_;
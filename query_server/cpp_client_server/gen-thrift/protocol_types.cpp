@@ -278,4 +278,714 @@ const char* QueryException::what() const throw() {
   }
 }
 
+
+CacheStats::~CacheStats() throw() {
+}
+
+
+void CacheStats::__set_hitQty(const int64_t val) {
+  this->hitQty = val;
+}
+
+void CacheStats::__set_missQty(const int64_t val) {
+  this->missQty = val;
+}
+
+void CacheStats::__set_entryQty(const int64_t val) {
+  this->entryQty = val;
+}
+
+void CacheStats::__set_memUsed(const int64_t val) {
+  this->memUsed = val;
+}
+
+void CacheStats::__set_memBudget(const int64_t val) {
+  this->memBudget = val;
+}
+std::ostream& operator<<(std::ostream& out, const CacheStats& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t CacheStats::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+  bool isset_hitQty = false;
+  bool isset_missQty = false;
+  bool isset_entryQty = false;
+  bool isset_memUsed = false;
+  bool isset_memBudget = false;
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->hitQty);
+          isset_hitQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->missQty);
+          isset_missQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->entryQty);
+          isset_entryQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->memUsed);
+          isset_memUsed = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->memBudget);
+          isset_memBudget = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  if (!isset_hitQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_missQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_entryQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_memUsed)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_memBudget)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  return xfer;
+}
+
+uint32_t CacheStats::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("CacheStats");
+
+  xfer += oprot->writeFieldBegin("hitQty", ::apache::thrift::protocol::T_I64, 1);
+  xfer += oprot->writeI64(this->hitQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("missQty", ::apache::thrift::protocol::T_I64, 2);
+  xfer += oprot->writeI64(this->missQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("entryQty", ::apache::thrift::protocol::T_I64, 3);
+  xfer += oprot->writeI64(this->entryQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("memUsed", ::apache::thrift::protocol::T_I64, 4);
+  xfer += oprot->writeI64(this->memUsed);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("memBudget", ::apache::thrift::protocol::T_I64, 5);
+  xfer += oprot->writeI64(this->memBudget);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(CacheStats &a, CacheStats &b) {
+  using ::std::swap;
+  swap(a.hitQty, b.hitQty);
+  swap(a.missQty, b.missQty);
+  swap(a.entryQty, b.entryQty);
+  swap(a.memUsed, b.memUsed);
+  swap(a.memBudget, b.memBudget);
+}
+
+CacheStats::CacheStats(const CacheStats& other4) {
+  hitQty = other4.hitQty;
+  missQty = other4.missQty;
+  entryQty = other4.entryQty;
+  memUsed = other4.memUsed;
+  memBudget = other4.memBudget;
+}
+CacheStats& CacheStats::operator=(const CacheStats& other5) {
+  hitQty = other5.hitQty;
+  missQty = other5.missQty;
+  entryQty = other5.entryQty;
+  memUsed = other5.memUsed;
+  memBudget = other5.memBudget;
+  return *this;
+}
+void CacheStats::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "CacheStats(";
+  out << "hitQty=" << to_string(hitQty);
+  out << ", " << "missQty=" << to_string(missQty);
+  out << ", " << "entryQty=" << to_string(entryQty);
+  out << ", " << "memUsed=" << to_string(memUsed);
+  out << ", " << "memBudget=" << to_string(memBudget);
+  out << ")";
+}
+
+
+MethodStats::~MethodStats() throw() {
+}
+
+
+void MethodStats::__set_name(const std::string& val) {
+  this->name = val;
+}
+
+void MethodStats::__set_requestQty(const int64_t val) {
+  this->requestQty = val;
+}
+
+void MethodStats::__set_errorQty(const int64_t val) {
+  this->errorQty = val;
+}
+
+void MethodStats::__set_inFlightQty(const int64_t val) {
+  this->inFlightQty = val;
+}
+
+void MethodStats::__set_qps(const double val) {
+  this->qps = val;
+}
+
+void MethodStats::__set_p50(const double val) {
+  this->p50 = val;
+}
+
+void MethodStats::__set_p90(const double val) {
+  this->p90 = val;
+}
+
+void MethodStats::__set_p99(const double val) {
+  this->p99 = val;
+}
+
+void MethodStats::__set_p999(const double val) {
+  this->p999 = val;
+}
+
+void MethodStats::__set_maxLatency(const double val) {
+  this->maxLatency = val;
+}
+std::ostream& operator<<(std::ostream& out, const MethodStats& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t MethodStats::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+  bool isset_name = false;
+  bool isset_requestQty = false;
+  bool isset_errorQty = false;
+  bool isset_inFlightQty = false;
+  bool isset_qps = false;
+  bool isset_p50 = false;
+  bool isset_p90 = false;
+  bool isset_p99 = false;
+  bool isset_p999 = false;
+  bool isset_maxLatency = false;
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->name);
+          isset_name = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->requestQty);
+          isset_requestQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->errorQty);
+          isset_errorQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->inFlightQty);
+          isset_inFlightQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->qps);
+          isset_qps = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->p50);
+          isset_p50 = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 7:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->p90);
+          isset_p90 = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 8:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->p99);
+          isset_p99 = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 9:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->p999);
+          isset_p999 = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 10:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->maxLatency);
+          isset_maxLatency = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  if (!isset_name)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_requestQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_errorQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_inFlightQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_qps)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_p50)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_p90)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_p99)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_p999)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_maxLatency)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  return xfer;
+}
+
+uint32_t MethodStats::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("MethodStats");
+
+  xfer += oprot->writeFieldBegin("name", ::apache::thrift::protocol::T_STRING, 1);
+  xfer += oprot->writeString(this->name);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("requestQty", ::apache::thrift::protocol::T_I64, 2);
+  xfer += oprot->writeI64(this->requestQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("errorQty", ::apache::thrift::protocol::T_I64, 3);
+  xfer += oprot->writeI64(this->errorQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("inFlightQty", ::apache::thrift::protocol::T_I64, 4);
+  xfer += oprot->writeI64(this->inFlightQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("qps", ::apache::thrift::protocol::T_DOUBLE, 5);
+  xfer += oprot->writeDouble(this->qps);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("p50", ::apache::thrift::protocol::T_DOUBLE, 6);
+  xfer += oprot->writeDouble(this->p50);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("p90", ::apache::thrift::protocol::T_DOUBLE, 7);
+  xfer += oprot->writeDouble(this->p90);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("p99", ::apache::thrift::protocol::T_DOUBLE, 8);
+  xfer += oprot->writeDouble(this->p99);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("p999", ::apache::thrift::protocol::T_DOUBLE, 9);
+  xfer += oprot->writeDouble(this->p999);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("maxLatency", ::apache::thrift::protocol::T_DOUBLE, 10);
+  xfer += oprot->writeDouble(this->maxLatency);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(MethodStats &a, MethodStats &b) {
+  using ::std::swap;
+  swap(a.name, b.name);
+  swap(a.requestQty, b.requestQty);
+  swap(a.errorQty, b.errorQty);
+  swap(a.inFlightQty, b.inFlightQty);
+  swap(a.qps, b.qps);
+  swap(a.p50, b.p50);
+  swap(a.p90, b.p90);
+  swap(a.p99, b.p99);
+  swap(a.p999, b.p999);
+  swap(a.maxLatency, b.maxLatency);
+}
+
+MethodStats::MethodStats(const MethodStats& other6) {
+  name = other6.name;
+  requestQty = other6.requestQty;
+  errorQty = other6.errorQty;
+  inFlightQty = other6.inFlightQty;
+  qps = other6.qps;
+  p50 = other6.p50;
+  p90 = other6.p90;
+  p99 = other6.p99;
+  p999 = other6.p999;
+  maxLatency = other6.maxLatency;
+}
+MethodStats& MethodStats::operator=(const MethodStats& other7) {
+  name = other7.name;
+  requestQty = other7.requestQty;
+  errorQty = other7.errorQty;
+  inFlightQty = other7.inFlightQty;
+  qps = other7.qps;
+  p50 = other7.p50;
+  p90 = other7.p90;
+  p99 = other7.p99;
+  p999 = other7.p999;
+  maxLatency = other7.maxLatency;
+  return *this;
+}
+void MethodStats::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "MethodStats(";
+  out << "name=" << to_string(name);
+  out << ", " << "requestQty=" << to_string(requestQty);
+  out << ", " << "errorQty=" << to_string(errorQty);
+  out << ", " << "inFlightQty=" << to_string(inFlightQty);
+  out << ", " << "qps=" << to_string(qps);
+  out << ", " << "p50=" << to_string(p50);
+  out << ", " << "p90=" << to_string(p90);
+  out << ", " << "p99=" << to_string(p99);
+  out << ", " << "p999=" << to_string(p999);
+  out << ", " << "maxLatency=" << to_string(maxLatency);
+  out << ")";
+}
+
+
+ServerStats::~ServerStats() throw() {
+}
+
+
+void ServerStats::__set_uptime(const double val) {
+  this->uptime = val;
+}
+
+void ServerStats::__set_methods(const std::vector<MethodStats> & val) {
+  this->methods = val;
+}
+
+void ServerStats::__set_queueWait(const MethodStats& val) {
+  this->queueWait = val;
+}
+
+void ServerStats::__set_pendingTaskQty(const int64_t val) {
+  this->pendingTaskQty = val;
+}
+
+void ServerStats::__set_idleWorkerQty(const int64_t val) {
+  this->idleWorkerQty = val;
+}
+
+void ServerStats::__set_workerQty(const int64_t val) {
+  this->workerQty = val;
+}
+std::ostream& operator<<(std::ostream& out, const ServerStats& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t ServerStats::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+  bool isset_uptime = false;
+  bool isset_methods = false;
+  bool isset_queueWait = false;
+  bool isset_pendingTaskQty = false;
+  bool isset_idleWorkerQty = false;
+  bool isset_workerQty = false;
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_DOUBLE) {
+          xfer += iprot->readDouble(this->uptime);
+          isset_uptime = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->methods.clear();
+            uint32_t _size8;
+            ::apache::thrift::protocol::TType _etype11;
+            xfer += iprot->readListBegin(_etype11, _size8);
+            this->methods.resize(_size8);
+            uint32_t _i12;
+            for (_i12 = 0; _i12 < _size8; ++_i12)
+            {
+              xfer += this->methods[_i12].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          isset_methods = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->queueWait.read(iprot);
+          isset_queueWait = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->pendingTaskQty);
+          isset_pendingTaskQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->idleWorkerQty);
+          isset_idleWorkerQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->workerQty);
+          isset_workerQty = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  if (!isset_uptime)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_methods)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_queueWait)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_pendingTaskQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_idleWorkerQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  if (!isset_workerQty)
+    throw TProtocolException(TProtocolException::INVALID_DATA);
+  return xfer;
+}
+
+uint32_t ServerStats::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("ServerStats");
+
+  xfer += oprot->writeFieldBegin("uptime", ::apache::thrift::protocol::T_DOUBLE, 1);
+  xfer += oprot->writeDouble(this->uptime);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("methods", ::apache::thrift::protocol::T_LIST, 2);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->methods.size()));
+    std::vector<MethodStats> ::const_iterator _iter13;
+    for (_iter13 = this->methods.begin(); _iter13 != this->methods.end(); ++_iter13)
+    {
+      xfer += (*_iter13).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("queueWait", ::apache::thrift::protocol::T_STRUCT, 3);
+  xfer += this->queueWait.write(oprot);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("pendingTaskQty", ::apache::thrift::protocol::T_I64, 4);
+  xfer += oprot->writeI64(this->pendingTaskQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("idleWorkerQty", ::apache::thrift::protocol::T_I64, 5);
+  xfer += oprot->writeI64(this->idleWorkerQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("workerQty", ::apache::thrift::protocol::T_I64, 6);
+  xfer += oprot->writeI64(this->workerQty);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(ServerStats &a, ServerStats &b) {
+  using ::std::swap;
+  swap(a.uptime, b.uptime);
+  swap(a.methods, b.methods);
+  swap(a.queueWait, b.queueWait);
+  swap(a.pendingTaskQty, b.pendingTaskQty);
+  swap(a.idleWorkerQty, b.idleWorkerQty);
+  swap(a.workerQty, b.workerQty);
+}
+
+ServerStats::ServerStats(const ServerStats& other14) {
+  uptime = other14.uptime;
+  methods = other14.methods;
+  queueWait = other14.queueWait;
+  pendingTaskQty = other14.pendingTaskQty;
+  idleWorkerQty = other14.idleWorkerQty;
+  workerQty = other14.workerQty;
+}
+ServerStats& ServerStats::operator=(const ServerStats& other15) {
+  uptime = other15.uptime;
+  methods = other15.methods;
+  queueWait = other15.queueWait;
+  pendingTaskQty = other15.pendingTaskQty;
+  idleWorkerQty = other15.idleWorkerQty;
+  workerQty = other15.workerQty;
+  return *this;
+}
+void ServerStats::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "ServerStats(";
+  out << "uptime=" << to_string(uptime);
+  out << ", " << "methods=" << to_string(methods);
+  out << ", " << "queueWait=" << to_string(queueWait);
+  out << ", " << "pendingTaskQty=" << to_string(pendingTaskQty);
+  out << ", " << "idleWorkerQty=" << to_string(idleWorkerQty);
+  out << ", " << "workerQty=" << to_string(workerQty);
+  out << ")";
+}
+
 } // namespace
@@ -22,10 +22,18 @@ namespace similarity {
 
 typedef std::vector<class ReplyEntry>  ReplyEntryList;
 
+typedef std::vector<ReplyEntryList>  ReplyEntryListList;
+
 class ReplyEntry;
 
 class QueryException;
 
+class CacheStats;
+
+class MethodStats;
+
+class ServerStats;
+
 typedef struct _ReplyEntry__isset {
   _ReplyEntry__isset() : externId(false), obj(false) {}
   bool externId :1;
@@ -132,6 +140,204 @@ void swap(QueryException &a, QueryException &b);
 
 std::ostream& operator<<(std::ostream& out, const QueryException& obj);
 
+
+class CacheStats : public virtual ::apache::thrift::TBase {
+ public:
+
+  CacheStats(const CacheStats&);
+  CacheStats& operator=(const CacheStats&);
+  CacheStats() : hitQty(0), missQty(0), entryQty(0), memUsed(0), memBudget(0) {
+  }
+
+  virtual ~CacheStats() throw();
+  int64_t hitQty;
+  int64_t missQty;
+  int64_t entryQty;
+  int64_t memUsed;
+  int64_t memBudget;
+
+  void __set_hitQty(const int64_t val);
+
+  void __set_missQty(const int64_t val);
+
+  void __set_entryQty(const int64_t val);
+
+  void __set_memUsed(const int64_t val);
+
+  void __set_memBudget(const int64_t val);
+
+  bool operator == (const CacheStats & rhs) const
+  {
+    if (!(hitQty == rhs.hitQty))
+      return false;
+    if (!(missQty == rhs.missQty))
+      return false;
+    if (!(entryQty == rhs.entryQty))
+      return false;
+    if (!(memUsed == rhs.memUsed))
+      return false;
+    if (!(memBudget == rhs.memBudget))
+      return false;
+    return true;
+  }
+  bool operator != (const CacheStats &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const CacheStats & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(CacheStats &a, CacheStats &b);
+
+std::ostream& operator<<(std::ostream& out, const CacheStats& obj);
+
+
+class MethodStats : public virtual ::apache::thrift::TBase {
+ public:
+
+  MethodStats(const MethodStats&);
+  MethodStats& operator=(const MethodStats&);
+  MethodStats() : name(), requestQty(0), errorQty(0), inFlightQty(0), qps(0), p50(0), p90(0), p99(0), p999(0), maxLatency(0) {
+  }
+
+  virtual ~MethodStats() throw();
+  std::string name;
+  int64_t requestQty;
+  int64_t errorQty;
+  int64_t inFlightQty;
+  double qps;
+  double p50;
+  double p90;
+  double p99;
+  double p999;
+  double maxLatency;
+
+  void __set_name(const std::string& val);
+
+  void __set_requestQty(const int64_t val);
+
+  void __set_errorQty(const int64_t val);
+
+  void __set_inFlightQty(const int64_t val);
+
+  void __set_qps(const double val);
+
+  void __set_p50(const double val);
+
+  void __set_p90(const double val);
+
+  void __set_p99(const double val);
+
+  void __set_p999(const double val);
+
+  void __set_maxLatency(const double val);
+
+  bool operator == (const MethodStats & rhs) const
+  {
+    if (!(name == rhs.name))
+      return false;
+    if (!(requestQty == rhs.requestQty))
+      return false;
+    if (!(errorQty == rhs.errorQty))
+      return false;
+    if (!(inFlightQty == rhs.inFlightQty))
+      return false;
+    if (!(qps == rhs.qps))
+      return false;
+    if (!(p50 == rhs.p50))
+      return false;
+    if (!(p90 == rhs.p90))
+      return false;
+    if (!(p99 == rhs.p99))
+      return false;
+    if (!(p999 == rhs.p999))
+      return false;
+    if (!(maxLatency == rhs.maxLatency))
+      return false;
+    return true;
+  }
+  bool operator != (const MethodStats &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const MethodStats & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(MethodStats &a, MethodStats &b);
+
+std::ostream& operator<<(std::ostream& out, const MethodStats& obj);
+
+
+class ServerStats : public virtual ::apache::thrift::TBase {
+ public:
+
+  ServerStats(const ServerStats&);
+  ServerStats& operator=(const ServerStats&);
+  ServerStats() : uptime(0), pendingTaskQty(0), idleWorkerQty(0), workerQty(0) {
+  }
+
+  virtual ~ServerStats() throw();
+  double uptime;
+  std::vector<MethodStats>  methods;
+  MethodStats queueWait;
+  int64_t pendingTaskQty;
+  int64_t idleWorkerQty;
+  int64_t workerQty;
+
+  void __set_uptime(const double val);
+
+  void __set_methods(const std::vector<MethodStats> & val);
+
+  void __set_queueWait(const MethodStats& val);
+
+  void __set_pendingTaskQty(const int64_t val);
+
+  void __set_idleWorkerQty(const int64_t val);
+
+  void __set_workerQty(const int64_t val);
+
+  bool operator == (const ServerStats & rhs) const
+  {
+    if (!(uptime == rhs.uptime))
+      return false;
+    if (!(methods == rhs.methods))
+      return false;
+    if (!(queueWait == rhs.queueWait))
+      return false;
+    if (!(pendingTaskQty == rhs.pendingTaskQty))
+      return false;
+    if (!(idleWorkerQty == rhs.idleWorkerQty))
+      return false;
+    if (!(workerQty == rhs.workerQty))
+      return false;
+    return true;
+  }
+  bool operator != (const ServerStats &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const ServerStats & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(ServerStats &a, ServerStats &b);
+
+std::ostream& operator<<(std::ostream& out, const ServerStats& obj);
+
 } // namespace
 
 #endif
@@ -0,0 +1,734 @@
+/**
+ * Autogenerated by Thrift Compiler (0.11.0)
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ *  @generated
+ */
+package edu.cmu.lti.oaqa.similarity;
+
+@SuppressWarnings({"cast", "rawtypes", "serial", "unchecked", "unused"})
+@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.11.0)", date = "2026-10-18")
+public class CacheStats implements org.apache.thrift.TBase<CacheStats, CacheStats._Fields>, java.io.Serializable, Cloneable, Comparable<CacheStats> {
+  private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("CacheStats");
+
+  private static final org.apache.thrift.protocol.TField HIT_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("hitQty", org.apache.thrift.protocol.TType.I64, (short)1);
+  private static final org.apache.thrift.protocol.TField MISS_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("missQty", org.apache.thrift.protocol.TType.I64, (short)2);
+  private static final org.apache.thrift.protocol.TField ENTRY_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("entryQty", org.apache.thrift.protocol.TType.I64, (short)3);
+  private static final org.apache.thrift.protocol.TField MEM_USED_FIELD_DESC = new org.apache.thrift.protocol.TField("memUsed", org.apache.thrift.protocol.TType.I64, (short)4);
+  private static final org.apache.thrift.protocol.TField MEM_BUDGET_FIELD_DESC = new org.apache.thrift.protocol.TField("memBudget", org.apache.thrift.protocol.TType.I64, (short)5);
+
+  private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new CacheStatsStandardSchemeFactory();
+  private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new CacheStatsTupleSchemeFactory();
+
+  public long hitQty; // required
+  public long missQty; // required
+  public long entryQty; // required
+  public long memUsed; // required
+  public long memBudget; // required
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+    HIT_QTY((short)1, "hitQty"),
+    MISS_QTY((short)2, "missQty"),
+    ENTRY_QTY((short)3, "entryQty"),
+    MEM_USED((short)4, "memUsed"),
+    MEM_BUDGET((short)5, "memBudget");
+
+    private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+    static {
+      for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      switch(fieldId) {
+        case 1: // HIT_QTY
+          return HIT_QTY;
+        case 2: // MISS_QTY
+          return MISS_QTY;
+        case 3: // ENTRY_QTY
+          return ENTRY_QTY;
+        case 4: // MEM_USED
+          return MEM_USED;
+        case 5: // MEM_BUDGET
+          return MEM_BUDGET;
+        default:
+          return null;
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(java.lang.String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final java.lang.String _fieldName;
+
+    _Fields(short thriftId, java.lang.String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public java.lang.String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __HITQTY_ISSET_ID = 0;
+  private static final int __MISSQTY_ISSET_ID = 1;
+  private static final int __ENTRYQTY_ISSET_ID = 2;
+  private static final int __MEMUSED_ISSET_ID = 3;
+  private static final int __MEMBUDGET_ISSET_ID = 4;
+  private byte __isset_bitfield = 0;
+  public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+  static {
+    java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+    tmpMap.put(_Fields.HIT_QTY, new org.apache.thrift.meta_data.FieldMetaData("hitQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.MISS_QTY, new org.apache.thrift.meta_data.FieldMetaData("missQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.ENTRY_QTY, new org.apache.thrift.meta_data.FieldMetaData("entryQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.MEM_USED, new org.apache.thrift.meta_data.FieldMetaData("memUsed", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.MEM_BUDGET, new org.apache.thrift.meta_data.FieldMetaData("memBudget", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+    org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(CacheStats.class, metaDataMap);
+  }
+
+  public CacheStats() {
+  }
+
+  public CacheStats(
+    long hitQty,
+    long missQty,
+    long entryQty,
+    long memUsed,
+    long memBudget)
+  {
+    this();
+    this.hitQty = hitQty;
+    setHitQtyIsSet(true);
+    this.missQty = missQty;
+    setMissQtyIsSet(true);
+    this.entryQty = entryQty;
+    setEntryQtyIsSet(true);
+    this.memUsed = memUsed;
+    setMemUsedIsSet(true);
+    this.memBudget = memBudget;
+    setMemBudgetIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public CacheStats(CacheStats other) {
+    __isset_bitfield = other.__isset_bitfield;
+    this.hitQty = other.hitQty;
+    this.missQty = other.missQty;
+    this.entryQty = other.entryQty;
+    this.memUsed = other.memUsed;
+    this.memBudget = other.memBudget;
+  }
+
+  public CacheStats deepCopy() {
+    return new CacheStats(this);
+  }
+
+  @Override
+  public void clear() {
+    setHitQtyIsSet(false);
+    this.hitQty = 0;
+    setMissQtyIsSet(false);
+    this.missQty = 0;
+    setEntryQtyIsSet(false);
+    this.entryQty = 0;
+    setMemUsedIsSet(false);
+    this.memUsed = 0;
+    setMemBudgetIsSet(false);
+    this.memBudget = 0;
+  }
+
+  public long getHitQty() {
+    return this.hitQty;
+  }
+
+  public CacheStats setHitQty(long hitQty) {
+    this.hitQty = hitQty;
+    setHitQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetHitQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __HITQTY_ISSET_ID);
+  }
+
+  /** Returns true if field hitQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetHitQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __HITQTY_ISSET_ID);
+  }
+
+  public void setHitQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __HITQTY_ISSET_ID, value);
+  }
+
+  public long getMissQty() {
+    return this.missQty;
+  }
+
+  public CacheStats setMissQty(long missQty) {
+    this.missQty = missQty;
+    setMissQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetMissQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __MISSQTY_ISSET_ID);
+  }
+
+  /** Returns true if field missQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetMissQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __MISSQTY_ISSET_ID);
+  }
+
+  public void setMissQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __MISSQTY_ISSET_ID, value);
+  }
+
+  public long getEntryQty() {
+    return this.entryQty;
+  }
+
+  public CacheStats setEntryQty(long entryQty) {
+    this.entryQty = entryQty;
+    setEntryQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetEntryQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __ENTRYQTY_ISSET_ID);
+  }
+
+  /** Returns true if field entryQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetEntryQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __ENTRYQTY_ISSET_ID);
+  }
+
+  public void setEntryQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __ENTRYQTY_ISSET_ID, value);
+  }
+
+  public long getMemUsed() {
+    return this.memUsed;
+  }
+
+  public CacheStats setMemUsed(long memUsed) {
+    this.memUsed = memUsed;
+    setMemUsedIsSet(true);
+    return this;
+  }
+
+  public void unsetMemUsed() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __MEMUSED_ISSET_ID);
+  }
+
+  /** Returns true if field memUsed is set (has been assigned a value) and false otherwise */
+  public boolean isSetMemUsed() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __MEMUSED_ISSET_ID);
+  }
+
+  public void setMemUsedIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __MEMUSED_ISSET_ID, value);
+  }
+
+  public long getMemBudget() {
+    return this.memBudget;
+  }
+
+  public CacheStats setMemBudget(long memBudget) {
+    this.memBudget = memBudget;
+    setMemBudgetIsSet(true);
+    return this;
+  }
+
+  public void unsetMemBudget() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __MEMBUDGET_ISSET_ID);
+  }
+
+  /** Returns true if field memBudget is set (has been assigned a value) and false otherwise */
+  public boolean isSetMemBudget() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __MEMBUDGET_ISSET_ID);
+  }
+
+  public void setMemBudgetIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __MEMBUDGET_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, java.lang.Object value) {
+    switch (field) {
+    case HIT_QTY:
+      if (value == null) {
+        unsetHitQty();
+      } else {
+        setHitQty((java.lang.Long)value);
+      }
+      break;
+
+    case MISS_QTY:
+      if (value == null) {
+        unsetMissQty();
+      } else {
+        setMissQty((java.lang.Long)value);
+      }
+      break;
+
+    case ENTRY_QTY:
+      if (value == null) {
+        unsetEntryQty();
+      } else {
+        setEntryQty((java.lang.Long)value);
+      }
+      break;
+
+    case MEM_USED:
+      if (value == null) {
+        unsetMemUsed();
+      } else {
+        setMemUsed((java.lang.Long)value);
+      }
+      break;
+
+    case MEM_BUDGET:
+      if (value == null) {
+        unsetMemBudget();
+      } else {
+        setMemBudget((java.lang.Long)value);
+      }
+      break;
+
+    }
+  }
+
+  public java.lang.Object getFieldValue(_Fields field) {
+    switch (field) {
+    case HIT_QTY:
+      return getHitQty();
+
+    case MISS_QTY:
+      return getMissQty();
+
+    case ENTRY_QTY:
+      return getEntryQty();
+
+    case MEM_USED:
+      return getMemUsed();
+
+    case MEM_BUDGET:
+      return getMemBudget();
+
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    if (field == null) {
+      throw new java.lang.IllegalArgumentException();
+    }
+
+    switch (field) {
+    case HIT_QTY:
+      return isSetHitQty();
+    case MISS_QTY:
+      return isSetMissQty();
+    case ENTRY_QTY:
+      return isSetEntryQty();
+    case MEM_USED:
+      return isSetMemUsed();
+    case MEM_BUDGET:
+      return isSetMemBudget();
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  @Override
+  public boolean equals(java.lang.Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof CacheStats)
+      return this.equals((CacheStats)that);
+    return false;
+  }
+
+  public boolean equals(CacheStats that) {
+    if (that == null)
+      return false;
+    if (this == that)
+      return true;
+
+    boolean this_present_hitQty = true;
+    boolean that_present_hitQty = true;
+    if (this_present_hitQty || that_present_hitQty) {
+      if (!(this_present_hitQty && that_present_hitQty))
+        return false;
+      if (this.hitQty != that.hitQty)
+        return false;
+    }
+
+    boolean this_present_missQty = true;
+    boolean that_present_missQty = true;
+    if (this_present_missQty || that_present_missQty) {
+      if (!(this_present_missQty && that_present_missQty))
+        return false;
+      if (this.missQty != that.missQty)
+        return false;
+    }
+
+    boolean this_present_entryQty = true;
+    boolean that_present_entryQty = true;
+    if (this_present_entryQty || that_present_entryQty) {
+      if (!(this_present_entryQty && that_present_entryQty))
+        return false;
+      if (this.entryQty != that.entryQty)
+        return false;
+    }
+
+    boolean this_present_memUsed = true;
+    boolean that_present_memUsed = true;
+    if (this_present_memUsed || that_present_memUsed) {
+      if (!(this_present_memUsed && that_present_memUsed))
+        return false;
+      if (this.memUsed != that.memUsed)
+        return false;
+    }
+
+    boolean this_present_memBudget = true;
+    boolean that_present_memBudget = true;
+    if (this_present_memBudget || that_present_memBudget) {
+      if (!(this_present_memBudget && that_present_memBudget))
+        return false;
+      if (this.memBudget != that.memBudget)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    int hashCode = 1;
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(hitQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(missQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(entryQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(memUsed);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(memBudget);
+
+    return hashCode;
+  }
+
+  @Override
+  public int compareTo(CacheStats other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+
+    lastComparison = java.lang.Boolean.valueOf(isSetHitQty()).compareTo(other.isSetHitQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetHitQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.hitQty, other.hitQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetMissQty()).compareTo(other.isSetMissQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetMissQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.missQty, other.missQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetEntryQty()).compareTo(other.isSetEntryQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetEntryQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.entryQty, other.entryQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetMemUsed()).compareTo(other.isSetMemUsed());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetMemUsed()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.memUsed, other.memUsed);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetMemBudget()).compareTo(other.isSetMemBudget());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetMemBudget()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.memBudget, other.memBudget);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    return 0;
+  }
+
+  public _Fields fieldForId(int fieldId) {
+    return _Fields.findByThriftId(fieldId);
+  }
+
+  public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+    scheme(iprot).read(iprot, this);
+  }
+
+  public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+    scheme(oprot).write(oprot, this);
+  }
+
+  @Override
+  public java.lang.String toString() {
+    java.lang.StringBuilder sb = new java.lang.StringBuilder("CacheStats(");
+    boolean first = true;
+
+    sb.append("hitQty:");
+    sb.append(this.hitQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("missQty:");
+    sb.append(this.missQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("entryQty:");
+    sb.append(this.entryQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("memUsed:");
+    sb.append(this.memUsed);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("memBudget:");
+    sb.append(this.memBudget);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws org.apache.thrift.TException {
+    // check for required fields
+    // alas, we cannot check 'hitQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'missQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'entryQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'memUsed' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'memBudget' because it's a primitive and you chose the non-beans generator.
+    // check for sub-struct validity
+  }
+
+  private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+    try {
+      write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+    try {
+      // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+      __isset_bitfield = 0;
+      read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private static class CacheStatsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public CacheStatsStandardScheme getScheme() {
+      return new CacheStatsStandardScheme();
+    }
+  }
+
+  private static class CacheStatsStandardScheme extends org.apache.thrift.scheme.StandardScheme<CacheStats> {
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot, CacheStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TField schemeField;
+      iprot.readStructBegin();
+      while (true)
+      {
+        schemeField = iprot.readFieldBegin();
+        if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+          break;
+        }
+        switch (schemeField.id) {
+          case 1: // HIT_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.hitQty = iprot.readI64();
+              struct.setHitQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 2: // MISS_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.missQty = iprot.readI64();
+              struct.setMissQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 3: // ENTRY_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.entryQty = iprot.readI64();
+              struct.setEntryQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 4: // MEM_USED
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.memUsed = iprot.readI64();
+              struct.setMemUsedIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 5: // MEM_BUDGET
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.memBudget = iprot.readI64();
+              struct.setMemBudgetIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          default:
+            org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      if (!struct.isSetHitQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'hitQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetMissQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'missQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetEntryQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'entryQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetMemUsed()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'memUsed' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetMemBudget()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'memBudget' was not found in serialized data! Struct: " + toString());
+      }
+      struct.validate();
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot, CacheStats struct) throws org.apache.thrift.TException {
+      struct.validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      oprot.writeFieldBegin(HIT_QTY_FIELD_DESC);
+      oprot.writeI64(struct.hitQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(MISS_QTY_FIELD_DESC);
+      oprot.writeI64(struct.missQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(ENTRY_QTY_FIELD_DESC);
+      oprot.writeI64(struct.entryQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(MEM_USED_FIELD_DESC);
+      oprot.writeI64(struct.memUsed);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(MEM_BUDGET_FIELD_DESC);
+      oprot.writeI64(struct.memBudget);
+      oprot.writeFieldEnd();
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+  }
+
+  private static class CacheStatsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public CacheStatsTupleScheme getScheme() {
+      return new CacheStatsTupleScheme();
+    }
+  }
+
+  private static class CacheStatsTupleScheme extends org.apache.thrift.scheme.TupleScheme<CacheStats> {
+
+    @Override
+    public void write(org.apache.thrift.protocol.TProtocol prot, CacheStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      oprot.writeI64(struct.hitQty);
+      oprot.writeI64(struct.missQty);
+      oprot.writeI64(struct.entryQty);
+      oprot.writeI64(struct.memUsed);
+      oprot.writeI64(struct.memBudget);
+    }
+
+    @Override
+    public void read(org.apache.thrift.protocol.TProtocol prot, CacheStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      struct.hitQty = iprot.readI64();
+      struct.setHitQtyIsSet(true);
+      struct.missQty = iprot.readI64();
+      struct.setMissQtyIsSet(true);
+      struct.entryQty = iprot.readI64();
+      struct.setEntryQtyIsSet(true);
+      struct.memUsed = iprot.readI64();
+      struct.setMemUsedIsSet(true);
+      struct.memBudget = iprot.readI64();
+      struct.setMemBudgetIsSet(true);
+    }
+  }
+
+  private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+    return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+  }
+}
+
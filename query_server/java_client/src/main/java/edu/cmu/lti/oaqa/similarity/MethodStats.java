@@ -0,0 +1,1206 @@
+/**
+ * Autogenerated by Thrift Compiler (0.11.0)
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ *  @generated
+ */
+package edu.cmu.lti.oaqa.similarity;
+
+@SuppressWarnings({"cast", "rawtypes", "serial", "unchecked", "unused"})
+@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.11.0)", date = "2026-10-18")
+public class MethodStats implements org.apache.thrift.TBase<MethodStats, MethodStats._Fields>, java.io.Serializable, Cloneable, Comparable<MethodStats> {
+  private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("MethodStats");
+
+  private static final org.apache.thrift.protocol.TField NAME_FIELD_DESC = new org.apache.thrift.protocol.TField("name", org.apache.thrift.protocol.TType.STRING, (short)1);
+  private static final org.apache.thrift.protocol.TField REQUEST_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("requestQty", org.apache.thrift.protocol.TType.I64, (short)2);
+  private static final org.apache.thrift.protocol.TField ERROR_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("errorQty", org.apache.thrift.protocol.TType.I64, (short)3);
+  private static final org.apache.thrift.protocol.TField IN_FLIGHT_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("inFlightQty", org.apache.thrift.protocol.TType.I64, (short)4);
+  private static final org.apache.thrift.protocol.TField QPS_FIELD_DESC = new org.apache.thrift.protocol.TField("qps", org.apache.thrift.protocol.TType.DOUBLE, (short)5);
+  private static final org.apache.thrift.protocol.TField P50_FIELD_DESC = new org.apache.thrift.protocol.TField("p50", org.apache.thrift.protocol.TType.DOUBLE, (short)6);
+  private static final org.apache.thrift.protocol.TField P90_FIELD_DESC = new org.apache.thrift.protocol.TField("p90", org.apache.thrift.protocol.TType.DOUBLE, (short)7);
+  private static final org.apache.thrift.protocol.TField P99_FIELD_DESC = new org.apache.thrift.protocol.TField("p99", org.apache.thrift.protocol.TType.DOUBLE, (short)8);
+  private static final org.apache.thrift.protocol.TField P999_FIELD_DESC = new org.apache.thrift.protocol.TField("p999", org.apache.thrift.protocol.TType.DOUBLE, (short)9);
+  private static final org.apache.thrift.protocol.TField MAX_LATENCY_FIELD_DESC = new org.apache.thrift.protocol.TField("maxLatency", org.apache.thrift.protocol.TType.DOUBLE, (short)10);
+
+  private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new MethodStatsStandardSchemeFactory();
+  private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new MethodStatsTupleSchemeFactory();
+
+  public java.lang.String name; // required
+  public long requestQty; // required
+  public long errorQty; // required
+  public long inFlightQty; // required
+  public double qps; // required
+  public double p50; // required
+  public double p90; // required
+  public double p99; // required
+  public double p999; // required
+  public double maxLatency; // required
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+    NAME((short)1, "name"),
+    REQUEST_QTY((short)2, "requestQty"),
+    ERROR_QTY((short)3, "errorQty"),
+    IN_FLIGHT_QTY((short)4, "inFlightQty"),
+    QPS((short)5, "qps"),
+    P50((short)6, "p50"),
+    P90((short)7, "p90"),
+    P99((short)8, "p99"),
+    P999((short)9, "p999"),
+    MAX_LATENCY((short)10, "maxLatency");
+
+    private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+    static {
+      for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      switch(fieldId) {
+        case 1: // NAME
+          return NAME;
+        case 2: // REQUEST_QTY
+          return REQUEST_QTY;
+        case 3: // ERROR_QTY
+          return ERROR_QTY;
+        case 4: // IN_FLIGHT_QTY
+          return IN_FLIGHT_QTY;
+        case 5: // QPS
+          return QPS;
+        case 6: // P50
+          return P50;
+        case 7: // P90
+          return P90;
+        case 8: // P99
+          return P99;
+        case 9: // P999
+          return P999;
+        case 10: // MAX_LATENCY
+          return MAX_LATENCY;
+        default:
+          return null;
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(java.lang.String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final java.lang.String _fieldName;
+
+    _Fields(short thriftId, java.lang.String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public java.lang.String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __REQUESTQTY_ISSET_ID = 0;
+  private static final int __ERRORQTY_ISSET_ID = 1;
+  private static final int __INFLIGHTQTY_ISSET_ID = 2;
+  private static final int __QPS_ISSET_ID = 3;
+  private static final int __P50_ISSET_ID = 4;
+  private static final int __P90_ISSET_ID = 5;
+  private static final int __P99_ISSET_ID = 6;
+  private static final int __P999_ISSET_ID = 7;
+  private static final int __MAXLATENCY_ISSET_ID = 8;
+  private short __isset_bitfield = 0;
+  public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+  static {
+    java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+    tmpMap.put(_Fields.NAME, new org.apache.thrift.meta_data.FieldMetaData("name", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+    tmpMap.put(_Fields.REQUEST_QTY, new org.apache.thrift.meta_data.FieldMetaData("requestQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.ERROR_QTY, new org.apache.thrift.meta_data.FieldMetaData("errorQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.IN_FLIGHT_QTY, new org.apache.thrift.meta_data.FieldMetaData("inFlightQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.QPS, new org.apache.thrift.meta_data.FieldMetaData("qps", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+    tmpMap.put(_Fields.P50, new org.apache.thrift.meta_data.FieldMetaData("p50", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+    tmpMap.put(_Fields.P90, new org.apache.thrift.meta_data.FieldMetaData("p90", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+    tmpMap.put(_Fields.P99, new org.apache.thrift.meta_data.FieldMetaData("p99", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+    tmpMap.put(_Fields.P999, new org.apache.thrift.meta_data.FieldMetaData("p999", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+    tmpMap.put(_Fields.MAX_LATENCY, new org.apache.thrift.meta_data.FieldMetaData("maxLatency", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+    metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+    org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(MethodStats.class, metaDataMap);
+  }
+
+  public MethodStats() {
+  }
+
+  public MethodStats(
+    java.lang.String name,
+    long requestQty,
+    long errorQty,
+    long inFlightQty,
+    double qps,
+    double p50,
+    double p90,
+    double p99,
+    double p999,
+    double maxLatency)
+  {
+    this();
+    this.name = name;
+    this.requestQty = requestQty;
+    setRequestQtyIsSet(true);
+    this.errorQty = errorQty;
+    setErrorQtyIsSet(true);
+    this.inFlightQty = inFlightQty;
+    setInFlightQtyIsSet(true);
+    this.qps = qps;
+    setQpsIsSet(true);
+    this.p50 = p50;
+    setP50IsSet(true);
+    this.p90 = p90;
+    setP90IsSet(true);
+    this.p99 = p99;
+    setP99IsSet(true);
+    this.p999 = p999;
+    setP999IsSet(true);
+    this.maxLatency = maxLatency;
+    setMaxLatencyIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public MethodStats(MethodStats other) {
+    __isset_bitfield = other.__isset_bitfield;
+    if (other.isSetName()) {
+      this.name = other.name;
+    }
+    this.requestQty = other.requestQty;
+    this.errorQty = other.errorQty;
+    this.inFlightQty = other.inFlightQty;
+    this.qps = other.qps;
+    this.p50 = other.p50;
+    this.p90 = other.p90;
+    this.p99 = other.p99;
+    this.p999 = other.p999;
+    this.maxLatency = other.maxLatency;
+  }
+
+  public MethodStats deepCopy() {
+    return new MethodStats(this);
+  }
+
+  @Override
+  public void clear() {
+    this.name = null;
+    setRequestQtyIsSet(false);
+    this.requestQty = 0;
+    setErrorQtyIsSet(false);
+    this.errorQty = 0;
+    setInFlightQtyIsSet(false);
+    this.inFlightQty = 0;
+    setQpsIsSet(false);
+    this.qps = 0.0;
+    setP50IsSet(false);
+    this.p50 = 0.0;
+    setP90IsSet(false);
+    this.p90 = 0.0;
+    setP99IsSet(false);
+    this.p99 = 0.0;
+    setP999IsSet(false);
+    this.p999 = 0.0;
+    setMaxLatencyIsSet(false);
+    this.maxLatency = 0.0;
+  }
+
+  public java.lang.String getName() {
+    return this.name;
+  }
+
+  public MethodStats setName(java.lang.String name) {
+    this.name = name;
+    return this;
+  }
+
+  public void unsetName() {
+    this.name = null;
+  }
+
+  /** Returns true if field name is set (has been assigned a value) and false otherwise */
+  public boolean isSetName() {
+    return this.name != null;
+  }
+
+  public void setNameIsSet(boolean value) {
+    if (!value) {
+      this.name = null;
+    }
+  }
+
+  public long getRequestQty() {
+    return this.requestQty;
+  }
+
+  public MethodStats setRequestQty(long requestQty) {
+    this.requestQty = requestQty;
+    setRequestQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetRequestQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __REQUESTQTY_ISSET_ID);
+  }
+
+  /** Returns true if field requestQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetRequestQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __REQUESTQTY_ISSET_ID);
+  }
+
+  public void setRequestQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __REQUESTQTY_ISSET_ID, value);
+  }
+
+  public long getErrorQty() {
+    return this.errorQty;
+  }
+
+  public MethodStats setErrorQty(long errorQty) {
+    this.errorQty = errorQty;
+    setErrorQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetErrorQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __ERRORQTY_ISSET_ID);
+  }
+
+  /** Returns true if field errorQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetErrorQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __ERRORQTY_ISSET_ID);
+  }
+
+  public void setErrorQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __ERRORQTY_ISSET_ID, value);
+  }
+
+  public long getInFlightQty() {
+    return this.inFlightQty;
+  }
+
+  public MethodStats setInFlightQty(long inFlightQty) {
+    this.inFlightQty = inFlightQty;
+    setInFlightQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetInFlightQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __INFLIGHTQTY_ISSET_ID);
+  }
+
+  /** Returns true if field inFlightQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetInFlightQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __INFLIGHTQTY_ISSET_ID);
+  }
+
+  public void setInFlightQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __INFLIGHTQTY_ISSET_ID, value);
+  }
+
+  public double getQps() {
+    return this.qps;
+  }
+
+  public MethodStats setQps(double qps) {
+    this.qps = qps;
+    setQpsIsSet(true);
+    return this;
+  }
+
+  public void unsetQps() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __QPS_ISSET_ID);
+  }
+
+  /** Returns true if field qps is set (has been assigned a value) and false otherwise */
+  public boolean isSetQps() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __QPS_ISSET_ID);
+  }
+
+  public void setQpsIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __QPS_ISSET_ID, value);
+  }
+
+  public double getP50() {
+    return this.p50;
+  }
+
+  public MethodStats setP50(double p50) {
+    this.p50 = p50;
+    setP50IsSet(true);
+    return this;
+  }
+
+  public void unsetP50() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __P50_ISSET_ID);
+  }
+
+  /** Returns true if field p50 is set (has been assigned a value) and false otherwise */
+  public boolean isSetP50() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __P50_ISSET_ID);
+  }
+
+  public void setP50IsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __P50_ISSET_ID, value);
+  }
+
+  public double getP90() {
+    return this.p90;
+  }
+
+  public MethodStats setP90(double p90) {
+    this.p90 = p90;
+    setP90IsSet(true);
+    return this;
+  }
+
+  public void unsetP90() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __P90_ISSET_ID);
+  }
+
+  /** Returns true if field p90 is set (has been assigned a value) and false otherwise */
+  public boolean isSetP90() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __P90_ISSET_ID);
+  }
+
+  public void setP90IsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __P90_ISSET_ID, value);
+  }
+
+  public double getP99() {
+    return this.p99;
+  }
+
+  public MethodStats setP99(double p99) {
+    this.p99 = p99;
+    setP99IsSet(true);
+    return this;
+  }
+
+  public void unsetP99() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __P99_ISSET_ID);
+  }
+
+  /** Returns true if field p99 is set (has been assigned a value) and false otherwise */
+  public boolean isSetP99() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __P99_ISSET_ID);
+  }
+
+  public void setP99IsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __P99_ISSET_ID, value);
+  }
+
+  public double getP999() {
+    return this.p999;
+  }
+
+  public MethodStats setP999(double p999) {
+    this.p999 = p999;
+    setP999IsSet(true);
+    return this;
+  }
+
+  public void unsetP999() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __P999_ISSET_ID);
+  }
+
+  /** Returns true if field p999 is set (has been assigned a value) and false otherwise */
+  public boolean isSetP999() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __P999_ISSET_ID);
+  }
+
+  public void setP999IsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __P999_ISSET_ID, value);
+  }
+
+  public double getMaxLatency() {
+    return this.maxLatency;
+  }
+
+  public MethodStats setMaxLatency(double maxLatency) {
+    this.maxLatency = maxLatency;
+    setMaxLatencyIsSet(true);
+    return this;
+  }
+
+  public void unsetMaxLatency() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __MAXLATENCY_ISSET_ID);
+  }
+
+  /** Returns true if field maxLatency is set (has been assigned a value) and false otherwise */
+  public boolean isSetMaxLatency() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __MAXLATENCY_ISSET_ID);
+  }
+
+  public void setMaxLatencyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __MAXLATENCY_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, java.lang.Object value) {
+    switch (field) {
+    case NAME:
+      if (value == null) {
+        unsetName();
+      } else {
+        setName((java.lang.String)value);
+      }
+      break;
+
+    case REQUEST_QTY:
+      if (value == null) {
+        unsetRequestQty();
+      } else {
+        setRequestQty((java.lang.Long)value);
+      }
+      break;
+
+    case ERROR_QTY:
+      if (value == null) {
+        unsetErrorQty();
+      } else {
+        setErrorQty((java.lang.Long)value);
+      }
+      break;
+
+    case IN_FLIGHT_QTY:
+      if (value == null) {
+        unsetInFlightQty();
+      } else {
+        setInFlightQty((java.lang.Long)value);
+      }
+      break;
+
+    case QPS:
+      if (value == null) {
+        unsetQps();
+      } else {
+        setQps((java.lang.Double)value);
+      }
+      break;
+
+    case P50:
+      if (value == null) {
+        unsetP50();
+      } else {
+        setP50((java.lang.Double)value);
+      }
+      break;
+
+    case P90:
+      if (value == null) {
+        unsetP90();
+      } else {
+        setP90((java.lang.Double)value);
+      }
+      break;
+
+    case P99:
+      if (value == null) {
+        unsetP99();
+      } else {
+        setP99((java.lang.Double)value);
+      }
+      break;
+
+    case P999:
+      if (value == null) {
+        unsetP999();
+      } else {
+        setP999((java.lang.Double)value);
+      }
+      break;
+
+    case MAX_LATENCY:
+      if (value == null) {
+        unsetMaxLatency();
+      } else {
+        setMaxLatency((java.lang.Double)value);
+      }
+      break;
+
+    }
+  }
+
+  public java.lang.Object getFieldValue(_Fields field) {
+    switch (field) {
+    case NAME:
+      return getName();
+
+    case REQUEST_QTY:
+      return getRequestQty();
+
+    case ERROR_QTY:
+      return getErrorQty();
+
+    case IN_FLIGHT_QTY:
+      return getInFlightQty();
+
+    case QPS:
+      return getQps();
+
+    case P50:
+      return getP50();
+
+    case P90:
+      return getP90();
+
+    case P99:
+      return getP99();
+
+    case P999:
+      return getP999();
+
+    case MAX_LATENCY:
+      return getMaxLatency();
+
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    if (field == null) {
+      throw new java.lang.IllegalArgumentException();
+    }
+
+    switch (field) {
+    case NAME:
+      return isSetName();
+    case REQUEST_QTY:
+      return isSetRequestQty();
+    case ERROR_QTY:
+      return isSetErrorQty();
+    case IN_FLIGHT_QTY:
+      return isSetInFlightQty();
+    case QPS:
+      return isSetQps();
+    case P50:
+      return isSetP50();
+    case P90:
+      return isSetP90();
+    case P99:
+      return isSetP99();
+    case P999:
+      return isSetP999();
+    case MAX_LATENCY:
+      return isSetMaxLatency();
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  @Override
+  public boolean equals(java.lang.Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof MethodStats)
+      return this.equals((MethodStats)that);
+    return false;
+  }
+
+  public boolean equals(MethodStats that) {
+    if (that == null)
+      return false;
+    if (this == that)
+      return true;
+
+    boolean this_present_name = true && this.isSetName();
+    boolean that_present_name = true && that.isSetName();
+    if (this_present_name || that_present_name) {
+      if (!(this_present_name && that_present_name))
+        return false;
+      if (!this.name.equals(that.name))
+        return false;
+    }
+
+    boolean this_present_requestQty = true;
+    boolean that_present_requestQty = true;
+    if (this_present_requestQty || that_present_requestQty) {
+      if (!(this_present_requestQty && that_present_requestQty))
+        return false;
+      if (this.requestQty != that.requestQty)
+        return false;
+    }
+
+    boolean this_present_errorQty = true;
+    boolean that_present_errorQty = true;
+    if (this_present_errorQty || that_present_errorQty) {
+      if (!(this_present_errorQty && that_present_errorQty))
+        return false;
+      if (this.errorQty != that.errorQty)
+        return false;
+    }
+
+    boolean this_present_inFlightQty = true;
+    boolean that_present_inFlightQty = true;
+    if (this_present_inFlightQty || that_present_inFlightQty) {
+      if (!(this_present_inFlightQty && that_present_inFlightQty))
+        return false;
+      if (this.inFlightQty != that.inFlightQty)
+        return false;
+    }
+
+    boolean this_present_qps = true;
+    boolean that_present_qps = true;
+    if (this_present_qps || that_present_qps) {
+      if (!(this_present_qps && that_present_qps))
+        return false;
+      if (this.qps != that.qps)
+        return false;
+    }
+
+    boolean this_present_p50 = true;
+    boolean that_present_p50 = true;
+    if (this_present_p50 || that_present_p50) {
+      if (!(this_present_p50 && that_present_p50))
+        return false;
+      if (this.p50 != that.p50)
+        return false;
+    }
+
+    boolean this_present_p90 = true;
+    boolean that_present_p90 = true;
+    if (this_present_p90 || that_present_p90) {
+      if (!(this_present_p90 && that_present_p90))
+        return false;
+      if (this.p90 != that.p90)
+        return false;
+    }
+
+    boolean this_present_p99 = true;
+    boolean that_present_p99 = true;
+    if (this_present_p99 || that_present_p99) {
+      if (!(this_present_p99 && that_present_p99))
+        return false;
+      if (this.p99 != that.p99)
+        return false;
+    }
+
+    boolean this_present_p999 = true;
+    boolean that_present_p999 = true;
+    if (this_present_p999 || that_present_p999) {
+      if (!(this_present_p999 && that_present_p999))
+        return false;
+      if (this.p999 != that.p999)
+        return false;
+    }
+
+    boolean this_present_maxLatency = true;
+    boolean that_present_maxLatency = true;
+    if (this_present_maxLatency || that_present_maxLatency) {
+      if (!(this_present_maxLatency && that_present_maxLatency))
+        return false;
+      if (this.maxLatency != that.maxLatency)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    int hashCode = 1;
+
+    hashCode = hashCode * 8191 + ((isSetName()) ? 131071 : 524287);
+    if (isSetName())
+      hashCode = hashCode * 8191 + name.hashCode();
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(requestQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(errorQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(inFlightQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(qps);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(p50);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(p90);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(p99);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(p999);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(maxLatency);
+
+    return hashCode;
+  }
+
+  @Override
+  public int compareTo(MethodStats other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+
+    lastComparison = java.lang.Boolean.valueOf(isSetName()).compareTo(other.isSetName());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetName()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.name, other.name);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetRequestQty()).compareTo(other.isSetRequestQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetRequestQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.requestQty, other.requestQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetErrorQty()).compareTo(other.isSetErrorQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetErrorQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.errorQty, other.errorQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetInFlightQty()).compareTo(other.isSetInFlightQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetInFlightQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.inFlightQty, other.inFlightQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetQps()).compareTo(other.isSetQps());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetQps()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.qps, other.qps);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetP50()).compareTo(other.isSetP50());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetP50()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.p50, other.p50);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetP90()).compareTo(other.isSetP90());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetP90()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.p90, other.p90);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetP99()).compareTo(other.isSetP99());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetP99()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.p99, other.p99);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetP999()).compareTo(other.isSetP999());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetP999()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.p999, other.p999);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetMaxLatency()).compareTo(other.isSetMaxLatency());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetMaxLatency()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.maxLatency, other.maxLatency);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    return 0;
+  }
+
+  public _Fields fieldForId(int fieldId) {
+    return _Fields.findByThriftId(fieldId);
+  }
+
+  public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+    scheme(iprot).read(iprot, this);
+  }
+
+  public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+    scheme(oprot).write(oprot, this);
+  }
+
+  @Override
+  public java.lang.String toString() {
+    java.lang.StringBuilder sb = new java.lang.StringBuilder("MethodStats(");
+    boolean first = true;
+
+    sb.append("name:");
+    if (this.name == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.name);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("requestQty:");
+    sb.append(this.requestQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("errorQty:");
+    sb.append(this.errorQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("inFlightQty:");
+    sb.append(this.inFlightQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("qps:");
+    sb.append(this.qps);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("p50:");
+    sb.append(this.p50);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("p90:");
+    sb.append(this.p90);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("p99:");
+    sb.append(this.p99);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("p999:");
+    sb.append(this.p999);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("maxLatency:");
+    sb.append(this.maxLatency);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws org.apache.thrift.TException {
+    // check for required fields
+    if (name == null) {
+      throw new org.apache.thrift.protocol.TProtocolException("Required field 'name' was not present! Struct: " + toString());
+    }
+    // alas, we cannot check 'requestQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'errorQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'inFlightQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'qps' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'p50' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'p90' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'p99' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'p999' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'maxLatency' because it's a primitive and you chose the non-beans generator.
+    // check for sub-struct validity
+  }
+
+  private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+    try {
+      write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+    try {
+      // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+      __isset_bitfield = 0;
+      read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private static class MethodStatsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public MethodStatsStandardScheme getScheme() {
+      return new MethodStatsStandardScheme();
+    }
+  }
+
+  private static class MethodStatsStandardScheme extends org.apache.thrift.scheme.StandardScheme<MethodStats> {
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot, MethodStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TField schemeField;
+      iprot.readStructBegin();
+      while (true)
+      {
+        schemeField = iprot.readFieldBegin();
+        if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+          break;
+        }
+        switch (schemeField.id) {
+          case 1: // NAME
+            if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+              struct.name = iprot.readString();
+              struct.setNameIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 2: // REQUEST_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.requestQty = iprot.readI64();
+              struct.setRequestQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 3: // ERROR_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.errorQty = iprot.readI64();
+              struct.setErrorQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 4: // IN_FLIGHT_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.inFlightQty = iprot.readI64();
+              struct.setInFlightQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 5: // QPS
+            if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+              struct.qps = iprot.readDouble();
+              struct.setQpsIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 6: // P50
+            if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+              struct.p50 = iprot.readDouble();
+              struct.setP50IsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 7: // P90
+            if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+              struct.p90 = iprot.readDouble();
+              struct.setP90IsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 8: // P99
+            if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+              struct.p99 = iprot.readDouble();
+              struct.setP99IsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 9: // P999
+            if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+              struct.p999 = iprot.readDouble();
+              struct.setP999IsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 10: // MAX_LATENCY
+            if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+              struct.maxLatency = iprot.readDouble();
+              struct.setMaxLatencyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          default:
+            org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      if (!struct.isSetRequestQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'requestQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetErrorQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'errorQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetInFlightQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'inFlightQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetQps()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'qps' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetP50()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'p50' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetP90()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'p90' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetP99()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'p99' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetP999()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'p999' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetMaxLatency()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'maxLatency' was not found in serialized data! Struct: " + toString());
+      }
+      struct.validate();
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot, MethodStats struct) throws org.apache.thrift.TException {
+      struct.validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (struct.name != null) {
+        oprot.writeFieldBegin(NAME_FIELD_DESC);
+        oprot.writeString(struct.name);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(REQUEST_QTY_FIELD_DESC);
+      oprot.writeI64(struct.requestQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(ERROR_QTY_FIELD_DESC);
+      oprot.writeI64(struct.errorQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(IN_FLIGHT_QTY_FIELD_DESC);
+      oprot.writeI64(struct.inFlightQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(QPS_FIELD_DESC);
+      oprot.writeDouble(struct.qps);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(P50_FIELD_DESC);
+      oprot.writeDouble(struct.p50);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(P90_FIELD_DESC);
+      oprot.writeDouble(struct.p90);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(P99_FIELD_DESC);
+      oprot.writeDouble(struct.p99);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(P999_FIELD_DESC);
+      oprot.writeDouble(struct.p999);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(MAX_LATENCY_FIELD_DESC);
+      oprot.writeDouble(struct.maxLatency);
+      oprot.writeFieldEnd();
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+  }
+
+  private static class MethodStatsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public MethodStatsTupleScheme getScheme() {
+      return new MethodStatsTupleScheme();
+    }
+  }
+
+  private static class MethodStatsTupleScheme extends org.apache.thrift.scheme.TupleScheme<MethodStats> {
+
+    @Override
+    public void write(org.apache.thrift.protocol.TProtocol prot, MethodStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      oprot.writeString(struct.name);
+      oprot.writeI64(struct.requestQty);
+      oprot.writeI64(struct.errorQty);
+      oprot.writeI64(struct.inFlightQty);
+      oprot.writeDouble(struct.qps);
+      oprot.writeDouble(struct.p50);
+      oprot.writeDouble(struct.p90);
+      oprot.writeDouble(struct.p99);
+      oprot.writeDouble(struct.p999);
+      oprot.writeDouble(struct.maxLatency);
+    }
+
+    @Override
+    public void read(org.apache.thrift.protocol.TProtocol prot, MethodStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      struct.name = iprot.readString();
+      struct.setNameIsSet(true);
+      struct.requestQty = iprot.readI64();
+      struct.setRequestQtyIsSet(true);
+      struct.errorQty = iprot.readI64();
+      struct.setErrorQtyIsSet(true);
+      struct.inFlightQty = iprot.readI64();
+      struct.setInFlightQtyIsSet(true);
+      struct.qps = iprot.readDouble();
+      struct.setQpsIsSet(true);
+      struct.p50 = iprot.readDouble();
+      struct.setP50IsSet(true);
+      struct.p90 = iprot.readDouble();
+      struct.setP90IsSet(true);
+      struct.p99 = iprot.readDouble();
+      struct.setP99IsSet(true);
+      struct.p999 = iprot.readDouble();
+      struct.setP999IsSet(true);
+      struct.maxLatency = iprot.readDouble();
+      struct.setMaxLatencyIsSet(true);
+    }
+  }
+
+  private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+    return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+  }
+}
+
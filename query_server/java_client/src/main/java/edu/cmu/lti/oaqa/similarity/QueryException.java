@@ -7,7 +7,7 @@
 package edu.cmu.lti.oaqa.similarity;
 
 @SuppressWarnings({"cast", "rawtypes", "serial", "unchecked", "unused"})
-@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.11.0)", date = "2019-01-15")
+@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.11.0)", date = "2026-10-18")
 public class QueryException extends org.apache.thrift.TException implements org.apache.thrift.TBase<QueryException, QueryException._Fields>, java.io.Serializable, Cloneable, Comparable<QueryException> {
   private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("QueryException");
 
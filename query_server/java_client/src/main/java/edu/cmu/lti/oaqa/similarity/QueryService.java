@@ -7,31 +7,51 @@
 package edu.cmu.lti.oaqa.similarity;
 
 @SuppressWarnings({"cast", "rawtypes", "serial", "unchecked", "unused"})
-@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.11.0)", date = "2019-01-15")
+@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.11.0)", date = "2026-10-18")
 public class QueryService {
 
   public interface Iface {
 
     public void setQueryTimeParams(java.lang.String queryTimeParams) throws QueryException, org.apache.thrift.TException;
 
-    public java.util.List<ReplyEntry> knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj) throws QueryException, org.apache.thrift.TException;
+    public java.util.List<ReplyEntry> knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException;
 
-    public java.util.List<ReplyEntry> rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj) throws QueryException, org.apache.thrift.TException;
+    public java.util.List<ReplyEntry> rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException;
+
+    public java.util.List<java.util.List<ReplyEntry>> knnQueryBatch(int k, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException;
+
+    public java.util.List<java.util.List<ReplyEntry>> rangeQueryBatch(double r, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException;
 
     public double getDistance(java.nio.ByteBuffer obj1, java.nio.ByteBuffer obj2) throws QueryException, org.apache.thrift.TException;
 
+    public CacheStats getCacheStats() throws QueryException, org.apache.thrift.TException;
+
+    public void reloadIndex(java.lang.String dataFile, java.lang.String loadIndexLoc, boolean cacheData) throws QueryException, org.apache.thrift.TException;
+
+    public ServerStats getStats() throws QueryException, org.apache.thrift.TException;
+
   }
 
   public interface AsyncIface {
 
     public void setQueryTimeParams(java.lang.String queryTimeParams, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException;
 
-    public void knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException;
+    public void knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException;
+
+    public void rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException;
 
-    public void rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException;
+    public void knnQueryBatch(int k, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler) throws org.apache.thrift.TException;
+
+    public void rangeQueryBatch(double r, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler) throws org.apache.thrift.TException;
 
     public void getDistance(java.nio.ByteBuffer obj1, java.nio.ByteBuffer obj2, org.apache.thrift.async.AsyncMethodCallback<java.lang.Double> resultHandler) throws org.apache.thrift.TException;
 
+    public void getCacheStats(org.apache.thrift.async.AsyncMethodCallback<CacheStats> resultHandler) throws org.apache.thrift.TException;
+
+    public void reloadIndex(java.lang.String dataFile, java.lang.String loadIndexLoc, boolean cacheData, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException;
+
+    public void getStats(org.apache.thrift.async.AsyncMethodCallback<ServerStats> resultHandler) throws org.apache.thrift.TException;
+
   }
 
   public static class Client extends org.apache.thrift.TServiceClient implements Iface {
@@ -77,19 +97,20 @@ public class QueryService {
       return;
     }
 
-    public java.util.List<ReplyEntry> knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj) throws QueryException, org.apache.thrift.TException
+    public java.util.List<ReplyEntry> knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException
     {
-      send_knnQuery(k, queryObj, retExternId, retObj);
+      send_knnQuery(k, queryObj, retExternId, retObj, binaryQuery);
       return recv_knnQuery();
     }
 
-    public void send_knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj) throws org.apache.thrift.TException
+    public void send_knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery) throws org.apache.thrift.TException
     {
       knnQuery_args args = new knnQuery_args();
       args.setK(k);
       args.setQueryObj(queryObj);
       args.setRetExternId(retExternId);
       args.setRetObj(retObj);
+      args.setBinaryQuery(binaryQuery);
       sendBase("knnQuery", args);
     }
 
@@ -106,19 +127,20 @@ public class QueryService {
       throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "knnQuery failed: unknown result");
     }
 
-    public java.util.List<ReplyEntry> rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj) throws QueryException, org.apache.thrift.TException
+    public java.util.List<ReplyEntry> rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException
     {
-      send_rangeQuery(r, queryObj, retExternId, retObj);
+      send_rangeQuery(r, queryObj, retExternId, retObj, binaryQuery);
       return recv_rangeQuery();
     }
 
-    public void send_rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj) throws org.apache.thrift.TException
+    public void send_rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery) throws org.apache.thrift.TException
     {
       rangeQuery_args args = new rangeQuery_args();
       args.setR(r);
       args.setQueryObj(queryObj);
       args.setRetExternId(retExternId);
       args.setRetObj(retObj);
+      args.setBinaryQuery(binaryQuery);
       sendBase("rangeQuery", args);
     }
 
@@ -135,6 +157,66 @@ public class QueryService {
       throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "rangeQuery failed: unknown result");
     }
 
+    public java.util.List<java.util.List<ReplyEntry>> knnQueryBatch(int k, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException
+    {
+      send_knnQueryBatch(k, queryObjs, retExternId, retObj, binaryQuery);
+      return recv_knnQueryBatch();
+    }
+
+    public void send_knnQueryBatch(int k, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery) throws org.apache.thrift.TException
+    {
+      knnQueryBatch_args args = new knnQueryBatch_args();
+      args.setK(k);
+      args.setQueryObjs(queryObjs);
+      args.setRetExternId(retExternId);
+      args.setRetObj(retObj);
+      args.setBinaryQuery(binaryQuery);
+      sendBase("knnQueryBatch", args);
+    }
+
+    public java.util.List<java.util.List<ReplyEntry>> recv_knnQueryBatch() throws QueryException, org.apache.thrift.TException
+    {
+      knnQueryBatch_result result = new knnQueryBatch_result();
+      receiveBase(result, "knnQueryBatch");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "knnQueryBatch failed: unknown result");
+    }
+
+    public java.util.List<java.util.List<ReplyEntry>> rangeQueryBatch(double r, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery) throws QueryException, org.apache.thrift.TException
+    {
+      send_rangeQueryBatch(r, queryObjs, retExternId, retObj, binaryQuery);
+      return recv_rangeQueryBatch();
+    }
+
+    public void send_rangeQueryBatch(double r, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery) throws org.apache.thrift.TException
+    {
+      rangeQueryBatch_args args = new rangeQueryBatch_args();
+      args.setR(r);
+      args.setQueryObjs(queryObjs);
+      args.setRetExternId(retExternId);
+      args.setRetObj(retObj);
+      args.setBinaryQuery(binaryQuery);
+      sendBase("rangeQueryBatch", args);
+    }
+
+    public java.util.List<java.util.List<ReplyEntry>> recv_rangeQueryBatch() throws QueryException, org.apache.thrift.TException
+    {
+      rangeQueryBatch_result result = new rangeQueryBatch_result();
+      receiveBase(result, "rangeQueryBatch");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "rangeQueryBatch failed: unknown result");
+    }
+
     public double getDistance(java.nio.ByteBuffer obj1, java.nio.ByteBuffer obj2) throws QueryException, org.apache.thrift.TException
     {
       send_getDistance(obj1, obj2);
@@ -162,6 +244,81 @@ public class QueryService {
       throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "getDistance failed: unknown result");
     }
 
+    public CacheStats getCacheStats() throws QueryException, org.apache.thrift.TException
+    {
+      send_getCacheStats();
+      return recv_getCacheStats();
+    }
+
+    public void send_getCacheStats() throws org.apache.thrift.TException
+    {
+      getCacheStats_args args = new getCacheStats_args();
+      sendBase("getCacheStats", args);
+    }
+
+    public CacheStats recv_getCacheStats() throws QueryException, org.apache.thrift.TException
+    {
+      getCacheStats_result result = new getCacheStats_result();
+      receiveBase(result, "getCacheStats");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "getCacheStats failed: unknown result");
+    }
+
+    public void reloadIndex(java.lang.String dataFile, java.lang.String loadIndexLoc, boolean cacheData) throws QueryException, org.apache.thrift.TException
+    {
+      send_reloadIndex(dataFile, loadIndexLoc, cacheData);
+      recv_reloadIndex();
+    }
+
+    public void send_reloadIndex(java.lang.String dataFile, java.lang.String loadIndexLoc, boolean cacheData) throws org.apache.thrift.TException
+    {
+      reloadIndex_args args = new reloadIndex_args();
+      args.setDataFile(dataFile);
+      args.setLoadIndexLoc(loadIndexLoc);
+      args.setCacheData(cacheData);
+      sendBase("reloadIndex", args);
+    }
+
+    public void recv_reloadIndex() throws QueryException, org.apache.thrift.TException
+    {
+      reloadIndex_result result = new reloadIndex_result();
+      receiveBase(result, "reloadIndex");
+      if (result.err != null) {
+        throw result.err;
+      }
+      return;
+    }
+
+    public ServerStats getStats() throws QueryException, org.apache.thrift.TException
+    {
+      send_getStats();
+      return recv_getStats();
+    }
+
+    public void send_getStats() throws org.apache.thrift.TException
+    {
+      getStats_args args = new getStats_args();
+      sendBase("getStats", args);
+    }
+
+    public ServerStats recv_getStats() throws QueryException, org.apache.thrift.TException
+    {
+      getStats_result result = new getStats_result();
+      receiveBase(result, "getStats");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "getStats failed: unknown result");
+    }
+
   }
   public static class AsyncClient extends org.apache.thrift.async.TAsyncClient implements AsyncIface {
     public static class Factory implements org.apache.thrift.async.TAsyncClientFactory<AsyncClient> {
@@ -212,9 +369,9 @@ public class QueryService {
       }
     }
 
-    public void knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException {
+    public void knnQuery(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException {
       checkReady();
-      knnQuery_call method_call = new knnQuery_call(k, queryObj, retExternId, retObj, resultHandler, this, ___protocolFactory, ___transport);
+      knnQuery_call method_call = new knnQuery_call(k, queryObj, retExternId, retObj, binaryQuery, resultHandler, this, ___protocolFactory, ___transport);
       this.___currentMethod = method_call;
       ___manager.call(method_call);
     }
@@ -224,12 +381,14 @@ public class QueryService {
       private java.nio.ByteBuffer queryObj;
       private boolean retExternId;
       private boolean retObj;
-      public knnQuery_call(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+      private boolean binaryQuery;
+      public knnQuery_call(int k, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
         super(client, protocolFactory, transport, resultHandler, false);
         this.k = k;
         this.queryObj = queryObj;
         this.retExternId = retExternId;
         this.retObj = retObj;
+        this.binaryQuery = binaryQuery;
       }
 
       public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
@@ -239,6 +398,7 @@ public class QueryService {
         args.setQueryObj(queryObj);
         args.setRetExternId(retExternId);
         args.setRetObj(retObj);
+        args.setBinaryQuery(binaryQuery);
         args.write(prot);
         prot.writeMessageEnd();
       }
@@ -253,9 +413,9 @@ public class QueryService {
       }
     }
 
-    public void rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException {
+    public void rangeQuery(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException {
       checkReady();
-      rangeQuery_call method_call = new rangeQuery_call(r, queryObj, retExternId, retObj, resultHandler, this, ___protocolFactory, ___transport);
+      rangeQuery_call method_call = new rangeQuery_call(r, queryObj, retExternId, retObj, binaryQuery, resultHandler, this, ___protocolFactory, ___transport);
       this.___currentMethod = method_call;
       ___manager.call(method_call);
     }
@@ -265,12 +425,14 @@ public class QueryService {
       private java.nio.ByteBuffer queryObj;
       private boolean retExternId;
       private boolean retObj;
-      public rangeQuery_call(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+      private boolean binaryQuery;
+      public rangeQuery_call(double r, java.nio.ByteBuffer queryObj, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
         super(client, protocolFactory, transport, resultHandler, false);
         this.r = r;
         this.queryObj = queryObj;
         this.retExternId = retExternId;
         this.retObj = retObj;
+        this.binaryQuery = binaryQuery;
       }
 
       public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
@@ -280,6 +442,7 @@ public class QueryService {
         args.setQueryObj(queryObj);
         args.setRetExternId(retExternId);
         args.setRetObj(retObj);
+        args.setBinaryQuery(binaryQuery);
         args.write(prot);
         prot.writeMessageEnd();
       }
@@ -294,6 +457,94 @@ public class QueryService {
       }
     }
 
+    public void knnQueryBatch(int k, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      knnQueryBatch_call method_call = new knnQueryBatch_call(k, queryObjs, retExternId, retObj, binaryQuery, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class knnQueryBatch_call extends org.apache.thrift.async.TAsyncMethodCall<java.util.List<java.util.List<ReplyEntry>>> {
+      private int k;
+      private java.util.List<java.nio.ByteBuffer> queryObjs;
+      private boolean retExternId;
+      private boolean retObj;
+      private boolean binaryQuery;
+      public knnQueryBatch_call(int k, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.k = k;
+        this.queryObjs = queryObjs;
+        this.retExternId = retExternId;
+        this.retObj = retObj;
+        this.binaryQuery = binaryQuery;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("knnQueryBatch", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        knnQueryBatch_args args = new knnQueryBatch_args();
+        args.setK(k);
+        args.setQueryObjs(queryObjs);
+        args.setRetExternId(retExternId);
+        args.setRetObj(retObj);
+        args.setBinaryQuery(binaryQuery);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public java.util.List<java.util.List<ReplyEntry>> getResult() throws QueryException, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_knnQueryBatch();
+      }
+    }
+
+    public void rangeQueryBatch(double r, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      rangeQueryBatch_call method_call = new rangeQueryBatch_call(r, queryObjs, retExternId, retObj, binaryQuery, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class rangeQueryBatch_call extends org.apache.thrift.async.TAsyncMethodCall<java.util.List<java.util.List<ReplyEntry>>> {
+      private double r;
+      private java.util.List<java.nio.ByteBuffer> queryObjs;
+      private boolean retExternId;
+      private boolean retObj;
+      private boolean binaryQuery;
+      public rangeQueryBatch_call(double r, java.util.List<java.nio.ByteBuffer> queryObjs, boolean retExternId, boolean retObj, boolean binaryQuery, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.r = r;
+        this.queryObjs = queryObjs;
+        this.retExternId = retExternId;
+        this.retObj = retObj;
+        this.binaryQuery = binaryQuery;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("rangeQueryBatch", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        rangeQueryBatch_args args = new rangeQueryBatch_args();
+        args.setR(r);
+        args.setQueryObjs(queryObjs);
+        args.setRetExternId(retExternId);
+        args.setRetObj(retObj);
+        args.setBinaryQuery(binaryQuery);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public java.util.List<java.util.List<ReplyEntry>> getResult() throws QueryException, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_rangeQueryBatch();
+      }
+    }
+
     public void getDistance(java.nio.ByteBuffer obj1, java.nio.ByteBuffer obj2, org.apache.thrift.async.AsyncMethodCallback<java.lang.Double> resultHandler) throws org.apache.thrift.TException {
       checkReady();
       getDistance_call method_call = new getDistance_call(obj1, obj2, resultHandler, this, ___protocolFactory, ___transport);
@@ -329,6 +580,102 @@ public class QueryService {
       }
     }
 
+    public void getCacheStats(org.apache.thrift.async.AsyncMethodCallback<CacheStats> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      getCacheStats_call method_call = new getCacheStats_call(resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class getCacheStats_call extends org.apache.thrift.async.TAsyncMethodCall<CacheStats> {
+      public getCacheStats_call(org.apache.thrift.async.AsyncMethodCallback<CacheStats> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("getCacheStats", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        getCacheStats_args args = new getCacheStats_args();
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public CacheStats getResult() throws QueryException, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_getCacheStats();
+      }
+    }
+
+    public void reloadIndex(java.lang.String dataFile, java.lang.String loadIndexLoc, boolean cacheData, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      reloadIndex_call method_call = new reloadIndex_call(dataFile, loadIndexLoc, cacheData, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class reloadIndex_call extends org.apache.thrift.async.TAsyncMethodCall<Void> {
+      private java.lang.String dataFile;
+      private java.lang.String loadIndexLoc;
+      private boolean cacheData;
+      public reloadIndex_call(java.lang.String dataFile, java.lang.String loadIndexLoc, boolean cacheData, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.dataFile = dataFile;
+        this.loadIndexLoc = loadIndexLoc;
+        this.cacheData = cacheData;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("reloadIndex", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        reloadIndex_args args = new reloadIndex_args();
+        args.setDataFile(dataFile);
+        args.setLoadIndexLoc(loadIndexLoc);
+        args.setCacheData(cacheData);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public Void getResult() throws QueryException, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return null;
+      }
+    }
+
+    public void getStats(org.apache.thrift.async.AsyncMethodCallback<ServerStats> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      getStats_call method_call = new getStats_call(resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class getStats_call extends org.apache.thrift.async.TAsyncMethodCall<ServerStats> {
+      public getStats_call(org.apache.thrift.async.AsyncMethodCallback<ServerStats> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("getStats", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        getStats_args args = new getStats_args();
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public ServerStats getResult() throws QueryException, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_getStats();
+      }
+    }
+
   }
 
   public static class Processor<I extends Iface> extends org.apache.thrift.TBaseProcessor<I> implements org.apache.thrift.TProcessor {
@@ -345,7 +692,12 @@ public class QueryService {
       processMap.put("setQueryTimeParams", new setQueryTimeParams());
       processMap.put("knnQuery", new knnQuery());
       processMap.put("rangeQuery", new rangeQuery());
+      processMap.put("knnQueryBatch", new knnQueryBatch());
+      processMap.put("rangeQueryBatch", new rangeQueryBatch());
       processMap.put("getDistance", new getDistance());
+      processMap.put("getCacheStats", new getCacheStats());
+      processMap.put("reloadIndex", new reloadIndex());
+      processMap.put("getStats", new getStats());
       return processMap;
     }
 
@@ -399,7 +751,7 @@ public class QueryService {
       public knnQuery_result getResult(I iface, knnQuery_args args) throws org.apache.thrift.TException {
         knnQuery_result result = new knnQuery_result();
         try {
-          result.success = iface.knnQuery(args.k, args.queryObj, args.retExternId, args.retObj);
+          result.success = iface.knnQuery(args.k, args.queryObj, args.retExternId, args.retObj, args.binaryQuery);
         } catch (QueryException err) {
           result.err = err;
         }
@@ -428,7 +780,65 @@ public class QueryService {
       public rangeQuery_result getResult(I iface, rangeQuery_args args) throws org.apache.thrift.TException {
         rangeQuery_result result = new rangeQuery_result();
         try {
-          result.success = iface.rangeQuery(args.r, args.queryObj, args.retExternId, args.retObj);
+          result.success = iface.rangeQuery(args.r, args.queryObj, args.retExternId, args.retObj, args.binaryQuery);
+        } catch (QueryException err) {
+          result.err = err;
+        }
+        return result;
+      }
+    }
+
+    public static class knnQueryBatch<I extends Iface> extends org.apache.thrift.ProcessFunction<I, knnQueryBatch_args> {
+      public knnQueryBatch() {
+        super("knnQueryBatch");
+      }
+
+      public knnQueryBatch_args getEmptyArgsInstance() {
+        return new knnQueryBatch_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public knnQueryBatch_result getResult(I iface, knnQueryBatch_args args) throws org.apache.thrift.TException {
+        knnQueryBatch_result result = new knnQueryBatch_result();
+        try {
+          result.success = iface.knnQueryBatch(args.k, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery);
+        } catch (QueryException err) {
+          result.err = err;
+        }
+        return result;
+      }
+    }
+
+    public static class rangeQueryBatch<I extends Iface> extends org.apache.thrift.ProcessFunction<I, rangeQueryBatch_args> {
+      public rangeQueryBatch() {
+        super("rangeQueryBatch");
+      }
+
+      public rangeQueryBatch_args getEmptyArgsInstance() {
+        return new rangeQueryBatch_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public rangeQueryBatch_result getResult(I iface, rangeQueryBatch_args args) throws org.apache.thrift.TException {
+        rangeQueryBatch_result result = new rangeQueryBatch_result();
+        try {
+          result.success = iface.rangeQueryBatch(args.r, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery);
         } catch (QueryException err) {
           result.err = err;
         }
@@ -466,6 +876,93 @@ public class QueryService {
       }
     }
 
+    public static class getCacheStats<I extends Iface> extends org.apache.thrift.ProcessFunction<I, getCacheStats_args> {
+      public getCacheStats() {
+        super("getCacheStats");
+      }
+
+      public getCacheStats_args getEmptyArgsInstance() {
+        return new getCacheStats_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public getCacheStats_result getResult(I iface, getCacheStats_args args) throws org.apache.thrift.TException {
+        getCacheStats_result result = new getCacheStats_result();
+        try {
+          result.success = iface.getCacheStats();
+        } catch (QueryException err) {
+          result.err = err;
+        }
+        return result;
+      }
+    }
+
+    public static class reloadIndex<I extends Iface> extends org.apache.thrift.ProcessFunction<I, reloadIndex_args> {
+      public reloadIndex() {
+        super("reloadIndex");
+      }
+
+      public reloadIndex_args getEmptyArgsInstance() {
+        return new reloadIndex_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public reloadIndex_result getResult(I iface, reloadIndex_args args) throws org.apache.thrift.TException {
+        reloadIndex_result result = new reloadIndex_result();
+        try {
+          iface.reloadIndex(args.dataFile, args.loadIndexLoc, args.cacheData);
+        } catch (QueryException err) {
+          result.err = err;
+        }
+        return result;
+      }
+    }
+
+    public static class getStats<I extends Iface> extends org.apache.thrift.ProcessFunction<I, getStats_args> {
+      public getStats() {
+        super("getStats");
+      }
+
+      public getStats_args getEmptyArgsInstance() {
+        return new getStats_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean handleRuntimeExceptions() {
+        return false;
+      }
+
+      public getStats_result getResult(I iface, getStats_args args) throws org.apache.thrift.TException {
+        getStats_result result = new getStats_result();
+        try {
+          result.success = iface.getStats();
+        } catch (QueryException err) {
+          result.err = err;
+        }
+        return result;
+      }
+    }
+
   }
 
   public static class AsyncProcessor<I extends AsyncIface> extends org.apache.thrift.TBaseAsyncProcessor<I> {
@@ -482,7 +979,12 @@ public class QueryService {
       processMap.put("setQueryTimeParams", new setQueryTimeParams());
       processMap.put("knnQuery", new knnQuery());
       processMap.put("rangeQuery", new rangeQuery());
+      processMap.put("knnQueryBatch", new knnQueryBatch());
+      processMap.put("rangeQueryBatch", new rangeQueryBatch());
       processMap.put("getDistance", new getDistance());
+      processMap.put("getCacheStats", new getCacheStats());
+      processMap.put("reloadIndex", new reloadIndex());
+      processMap.put("getStats", new getStats());
       return processMap;
     }
 
@@ -611,7 +1113,7 @@ public class QueryService {
       }
 
       public void start(I iface, knnQuery_args args, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException {
-        iface.knnQuery(args.k, args.queryObj, args.retExternId, args.retObj,resultHandler);
+        iface.knnQuery(args.k, args.queryObj, args.retExternId, args.retObj, args.binaryQuery,resultHandler);
       }
     }
 
@@ -676,7 +1178,137 @@ public class QueryService {
       }
 
       public void start(I iface, rangeQuery_args args, org.apache.thrift.async.AsyncMethodCallback<java.util.List<ReplyEntry>> resultHandler) throws org.apache.thrift.TException {
-        iface.rangeQuery(args.r, args.queryObj, args.retExternId, args.retObj,resultHandler);
+        iface.rangeQuery(args.r, args.queryObj, args.retExternId, args.retObj, args.binaryQuery,resultHandler);
+      }
+    }
+
+    public static class knnQueryBatch<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, knnQueryBatch_args, java.util.List<java.util.List<ReplyEntry>>> {
+      public knnQueryBatch() {
+        super("knnQueryBatch");
+      }
+
+      public knnQueryBatch_args getEmptyArgsInstance() {
+        return new knnQueryBatch_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>>() { 
+          public void onComplete(java.util.List<java.util.List<ReplyEntry>> o) {
+            knnQueryBatch_result result = new knnQueryBatch_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            knnQueryBatch_result result = new knnQueryBatch_result();
+            if (e instanceof QueryException) {
+              result.err = (QueryException) e;
+              result.setErrIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, knnQueryBatch_args args, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler) throws org.apache.thrift.TException {
+        iface.knnQueryBatch(args.k, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery,resultHandler);
+      }
+    }
+
+    public static class rangeQueryBatch<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, rangeQueryBatch_args, java.util.List<java.util.List<ReplyEntry>>> {
+      public rangeQueryBatch() {
+        super("rangeQueryBatch");
+      }
+
+      public rangeQueryBatch_args getEmptyArgsInstance() {
+        return new rangeQueryBatch_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>>() { 
+          public void onComplete(java.util.List<java.util.List<ReplyEntry>> o) {
+            rangeQueryBatch_result result = new rangeQueryBatch_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            rangeQueryBatch_result result = new rangeQueryBatch_result();
+            if (e instanceof QueryException) {
+              result.err = (QueryException) e;
+              result.setErrIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, rangeQueryBatch_args args, org.apache.thrift.async.AsyncMethodCallback<java.util.List<java.util.List<ReplyEntry>>> resultHandler) throws org.apache.thrift.TException {
+        iface.rangeQueryBatch(args.r, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery,resultHandler);
       }
     }
 
@@ -746,56 +1378,250 @@ public class QueryService {
       }
     }
 
-  }
-
-  public static class setQueryTimeParams_args implements org.apache.thrift.TBase<setQueryTimeParams_args, setQueryTimeParams_args._Fields>, java.io.Serializable, Cloneable, Comparable<setQueryTimeParams_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("setQueryTimeParams_args");
-
-    private static final org.apache.thrift.protocol.TField QUERY_TIME_PARAMS_FIELD_DESC = new org.apache.thrift.protocol.TField("queryTimeParams", org.apache.thrift.protocol.TType.STRING, (short)1);
-
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new setQueryTimeParams_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new setQueryTimeParams_argsTupleSchemeFactory();
+    public static class getCacheStats<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, getCacheStats_args, CacheStats> {
+      public getCacheStats() {
+        super("getCacheStats");
+      }
 
-    public java.lang.String queryTimeParams; // required
+      public getCacheStats_args getEmptyArgsInstance() {
+        return new getCacheStats_args();
+      }
 
-    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
-    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      QUERY_TIME_PARAMS((short)1, "queryTimeParams");
+      public org.apache.thrift.async.AsyncMethodCallback<CacheStats> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<CacheStats>() { 
+          public void onComplete(CacheStats o) {
+            getCacheStats_result result = new getCacheStats_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            getCacheStats_result result = new getCacheStats_result();
+            if (e instanceof QueryException) {
+              result.err = (QueryException) e;
+              result.setErrIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
 
-      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+      protected boolean isOneway() {
+        return false;
+      }
 
-      static {
-        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
-          byName.put(field.getFieldName(), field);
-        }
+      public void start(I iface, getCacheStats_args args, org.apache.thrift.async.AsyncMethodCallback<CacheStats> resultHandler) throws org.apache.thrift.TException {
+        iface.getCacheStats(resultHandler);
       }
+    }
 
-      /**
-       * Find the _Fields constant that matches fieldId, or null if its not found.
-       */
-      public static _Fields findByThriftId(int fieldId) {
-        switch(fieldId) {
-          case 1: // QUERY_TIME_PARAMS
-            return QUERY_TIME_PARAMS;
-          default:
-            return null;
-        }
+    public static class reloadIndex<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, reloadIndex_args, Void> {
+      public reloadIndex() {
+        super("reloadIndex");
       }
 
-      /**
-       * Find the _Fields constant that matches fieldId, throwing an exception
-       * if it is not found.
-       */
-      public static _Fields findByThriftIdOrThrow(int fieldId) {
-        _Fields fields = findByThriftId(fieldId);
-        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
-        return fields;
+      public reloadIndex_args getEmptyArgsInstance() {
+        return new reloadIndex_args();
       }
 
-      /**
-       * Find the _Fields constant that matches name, or null if its not found.
-       */
-      public static _Fields findByName(java.lang.String name) {
+      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
+          public void onComplete(Void o) {
+            reloadIndex_result result = new reloadIndex_result();
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            reloadIndex_result result = new reloadIndex_result();
+            if (e instanceof QueryException) {
+              result.err = (QueryException) e;
+              result.setErrIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, reloadIndex_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+        iface.reloadIndex(args.dataFile, args.loadIndexLoc, args.cacheData,resultHandler);
+      }
+    }
+
+    public static class getStats<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, getStats_args, ServerStats> {
+      public getStats() {
+        super("getStats");
+      }
+
+      public getStats_args getEmptyArgsInstance() {
+        return new getStats_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<ServerStats> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<ServerStats>() { 
+          public void onComplete(ServerStats o) {
+            getStats_result result = new getStats_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            getStats_result result = new getStats_result();
+            if (e instanceof QueryException) {
+              result.err = (QueryException) e;
+              result.setErrIsSet(true);
+              msg = result;
+            } else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, getStats_args args, org.apache.thrift.async.AsyncMethodCallback<ServerStats> resultHandler) throws org.apache.thrift.TException {
+        iface.getStats(resultHandler);
+      }
+    }
+
+  }
+
+  public static class setQueryTimeParams_args implements org.apache.thrift.TBase<setQueryTimeParams_args, setQueryTimeParams_args._Fields>, java.io.Serializable, Cloneable, Comparable<setQueryTimeParams_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("setQueryTimeParams_args");
+
+    private static final org.apache.thrift.protocol.TField QUERY_TIME_PARAMS_FIELD_DESC = new org.apache.thrift.protocol.TField("queryTimeParams", org.apache.thrift.protocol.TType.STRING, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new setQueryTimeParams_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new setQueryTimeParams_argsTupleSchemeFactory();
+
+    public java.lang.String queryTimeParams; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      QUERY_TIME_PARAMS((short)1, "queryTimeParams");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // QUERY_TIME_PARAMS
+            return QUERY_TIME_PARAMS;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
         return byName.get(name);
       }
 
@@ -1474,6 +2300,7 @@ public class QueryService {
     private static final org.apache.thrift.protocol.TField QUERY_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("queryObj", org.apache.thrift.protocol.TType.STRING, (short)2);
     private static final org.apache.thrift.protocol.TField RET_EXTERN_ID_FIELD_DESC = new org.apache.thrift.protocol.TField("retExternId", org.apache.thrift.protocol.TType.BOOL, (short)3);
     private static final org.apache.thrift.protocol.TField RET_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("retObj", org.apache.thrift.protocol.TType.BOOL, (short)4);
+    private static final org.apache.thrift.protocol.TField BINARY_QUERY_FIELD_DESC = new org.apache.thrift.protocol.TField("binaryQuery", org.apache.thrift.protocol.TType.BOOL, (short)5);
 
     private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new knnQuery_argsStandardSchemeFactory();
     private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new knnQuery_argsTupleSchemeFactory();
@@ -1482,13 +2309,15 @@ public class QueryService {
     public java.nio.ByteBuffer queryObj; // required
     public boolean retExternId; // required
     public boolean retObj; // required
+    public boolean binaryQuery; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
       K((short)1, "k"),
       QUERY_OBJ((short)2, "queryObj"),
       RET_EXTERN_ID((short)3, "retExternId"),
-      RET_OBJ((short)4, "retObj");
+      RET_OBJ((short)4, "retObj"),
+      BINARY_QUERY((short)5, "binaryQuery");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -1511,6 +2340,8 @@ public class QueryService {
             return RET_EXTERN_ID;
           case 4: // RET_OBJ
             return RET_OBJ;
+          case 5: // BINARY_QUERY
+            return BINARY_QUERY;
           default:
             return null;
         }
@@ -1554,6 +2385,7 @@ public class QueryService {
     private static final int __K_ISSET_ID = 0;
     private static final int __RETEXTERNID_ISSET_ID = 1;
     private static final int __RETOBJ_ISSET_ID = 2;
+    private static final int __BINARYQUERY_ISSET_ID = 3;
     private byte __isset_bitfield = 0;
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
@@ -1566,6 +2398,8 @@ public class QueryService {
           new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
       tmpMap.put(_Fields.RET_OBJ, new org.apache.thrift.meta_data.FieldMetaData("retObj", org.apache.thrift.TFieldRequirementType.REQUIRED, 
           new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      tmpMap.put(_Fields.BINARY_QUERY, new org.apache.thrift.meta_data.FieldMetaData("binaryQuery", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
       org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(knnQuery_args.class, metaDataMap);
     }
@@ -1577,7 +2411,8 @@ public class QueryService {
       int k,
       java.nio.ByteBuffer queryObj,
       boolean retExternId,
-      boolean retObj)
+      boolean retObj,
+      boolean binaryQuery)
     {
       this();
       this.k = k;
@@ -1587,6 +2422,8 @@ public class QueryService {
       setRetExternIdIsSet(true);
       this.retObj = retObj;
       setRetObjIsSet(true);
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
     }
 
     /**
@@ -1600,6 +2437,7 @@ public class QueryService {
       }
       this.retExternId = other.retExternId;
       this.retObj = other.retObj;
+      this.binaryQuery = other.binaryQuery;
     }
 
     public knnQuery_args deepCopy() {
@@ -1615,6 +2453,8 @@ public class QueryService {
       this.retExternId = false;
       setRetObjIsSet(false);
       this.retObj = false;
+      setBinaryQueryIsSet(false);
+      this.binaryQuery = false;
     }
 
     public int getK() {
@@ -1720,6 +2560,29 @@ public class QueryService {
       __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETOBJ_ISSET_ID, value);
     }
 
+    public boolean isBinaryQuery() {
+      return this.binaryQuery;
+    }
+
+    public knnQuery_args setBinaryQuery(boolean binaryQuery) {
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
+      return this;
+    }
+
+    public void unsetBinaryQuery() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    /** Returns true if field binaryQuery is set (has been assigned a value) and false otherwise */
+    public boolean isSetBinaryQuery() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    public void setBinaryQueryIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __BINARYQUERY_ISSET_ID, value);
+    }
+
     public void setFieldValue(_Fields field, java.lang.Object value) {
       switch (field) {
       case K:
@@ -1758,6 +2621,14 @@ public class QueryService {
         }
         break;
 
+      case BINARY_QUERY:
+        if (value == null) {
+          unsetBinaryQuery();
+        } else {
+          setBinaryQuery((java.lang.Boolean)value);
+        }
+        break;
+
       }
     }
 
@@ -1775,6 +2646,9 @@ public class QueryService {
       case RET_OBJ:
         return isRetObj();
 
+      case BINARY_QUERY:
+        return isBinaryQuery();
+
       }
       throw new java.lang.IllegalStateException();
     }
@@ -1794,6 +2668,8 @@ public class QueryService {
         return isSetRetExternId();
       case RET_OBJ:
         return isSetRetObj();
+      case BINARY_QUERY:
+        return isSetBinaryQuery();
       }
       throw new java.lang.IllegalStateException();
     }
@@ -1849,6 +2725,15 @@ public class QueryService {
           return false;
       }
 
+      boolean this_present_binaryQuery = true;
+      boolean that_present_binaryQuery = true;
+      if (this_present_binaryQuery || that_present_binaryQuery) {
+        if (!(this_present_binaryQuery && that_present_binaryQuery))
+          return false;
+        if (this.binaryQuery != that.binaryQuery)
+          return false;
+      }
+
       return true;
     }
 
@@ -1866,6 +2751,8 @@ public class QueryService {
 
       hashCode = hashCode * 8191 + ((retObj) ? 131071 : 524287);
 
+      hashCode = hashCode * 8191 + ((binaryQuery) ? 131071 : 524287);
+
       return hashCode;
     }
 
@@ -1917,6 +2804,16 @@ public class QueryService {
           return lastComparison;
         }
       }
+      lastComparison = java.lang.Boolean.valueOf(isSetBinaryQuery()).compareTo(other.isSetBinaryQuery());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetBinaryQuery()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.binaryQuery, other.binaryQuery);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
       return 0;
     }
 
@@ -1956,6 +2853,10 @@ public class QueryService {
       sb.append("retObj:");
       sb.append(this.retObj);
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("binaryQuery:");
+      sb.append(this.binaryQuery);
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -2039,6 +2940,5735 @@ public class QueryService {
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
               break;
+            case 5: // BINARY_QUERY
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.binaryQuery = iprot.readBool();
+                struct.setBinaryQueryIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        if (!struct.isSetK()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'k' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetExternId()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retExternId' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetObj()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retObj' was not found in serialized data! Struct: " + toString());
+        }
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, knnQuery_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldBegin(K_FIELD_DESC);
+        oprot.writeI32(struct.k);
+        oprot.writeFieldEnd();
+        if (struct.queryObj != null) {
+          oprot.writeFieldBegin(QUERY_OBJ_FIELD_DESC);
+          oprot.writeBinary(struct.queryObj);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(RET_EXTERN_ID_FIELD_DESC);
+        oprot.writeBool(struct.retExternId);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(RET_OBJ_FIELD_DESC);
+        oprot.writeBool(struct.retObj);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(BINARY_QUERY_FIELD_DESC);
+        oprot.writeBool(struct.binaryQuery);
+        oprot.writeFieldEnd();
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class knnQuery_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public knnQuery_argsTupleScheme getScheme() {
+        return new knnQuery_argsTupleScheme();
+      }
+    }
+
+    private static class knnQuery_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<knnQuery_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, knnQuery_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        oprot.writeI32(struct.k);
+        oprot.writeBinary(struct.queryObj);
+        oprot.writeBool(struct.retExternId);
+        oprot.writeBool(struct.retObj);
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetBinaryQuery()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetBinaryQuery()) {
+          oprot.writeBool(struct.binaryQuery);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, knnQuery_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        struct.k = iprot.readI32();
+        struct.setKIsSet(true);
+        struct.queryObj = iprot.readBinary();
+        struct.setQueryObjIsSet(true);
+        struct.retExternId = iprot.readBool();
+        struct.setRetExternIdIsSet(true);
+        struct.retObj = iprot.readBool();
+        struct.setRetObjIsSet(true);
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.binaryQuery = iprot.readBool();
+          struct.setBinaryQueryIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class knnQuery_result implements org.apache.thrift.TBase<knnQuery_result, knnQuery_result._Fields>, java.io.Serializable, Cloneable, Comparable<knnQuery_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("knnQuery_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
+    private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new knnQuery_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new knnQuery_resultTupleSchemeFactory();
+
+    public java.util.List<ReplyEntry> success; // required
+    public QueryException err; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // ERR
+            return ERR;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.LIST          , "ReplyEntryList")));
+      tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(knnQuery_result.class, metaDataMap);
+    }
+
+    public knnQuery_result() {
+    }
+
+    public knnQuery_result(
+      java.util.List<ReplyEntry> success,
+      QueryException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public knnQuery_result(knnQuery_result other) {
+      if (other.isSetSuccess()) {
+        java.util.List<ReplyEntry> __this__success = new java.util.ArrayList<ReplyEntry>(other.success.size());
+        for (ReplyEntry other_element : other.success) {
+          __this__success.add(new ReplyEntry(other_element));
+        }
+        this.success = __this__success;
+      }
+      if (other.isSetErr()) {
+        this.err = new QueryException(other.err);
+      }
+    }
+
+    public knnQuery_result deepCopy() {
+      return new knnQuery_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.err = null;
+    }
+
+    public int getSuccessSize() {
+      return (this.success == null) ? 0 : this.success.size();
+    }
+
+    public java.util.Iterator<ReplyEntry> getSuccessIterator() {
+      return (this.success == null) ? null : this.success.iterator();
+    }
+
+    public void addToSuccess(ReplyEntry elem) {
+      if (this.success == null) {
+        this.success = new java.util.ArrayList<ReplyEntry>();
+      }
+      this.success.add(elem);
+    }
+
+    public java.util.List<ReplyEntry> getSuccess() {
+      return this.success;
+    }
+
+    public knnQuery_result setSuccess(java.util.List<ReplyEntry> success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public QueryException getErr() {
+      return this.err;
+    }
+
+    public knnQuery_result setErr(QueryException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been assigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.util.List<ReplyEntry>)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((QueryException)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof knnQuery_result)
+        return this.equals((knnQuery_result)that);
+      return false;
+    }
+
+    public boolean equals(knnQuery_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetErr()) ? 131071 : 524287);
+      if (isSetErr())
+        hashCode = hashCode * 8191 + err.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(knnQuery_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetErr()).compareTo(other.isSetErr());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetErr()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.err, other.err);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("knnQuery_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class knnQuery_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public knnQuery_resultStandardScheme getScheme() {
+        return new knnQuery_resultStandardScheme();
+      }
+    }
+
+    private static class knnQuery_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<knnQuery_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, knnQuery_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list8 = iprot.readListBegin();
+                  struct.success = new java.util.ArrayList<ReplyEntry>(_list8.size);
+                  ReplyEntry _elem9;
+                  for (int _i10 = 0; _i10 < _list8.size; ++_i10)
+                  {
+                    _elem9 = new ReplyEntry();
+                    _elem9.read(iprot);
+                    struct.success.add(_elem9);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // ERR
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.err = new QueryException();
+                struct.err.read(iprot);
+                struct.setErrIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, knnQuery_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, struct.success.size()));
+            for (ReplyEntry _iter11 : struct.success)
+            {
+              _iter11.write(oprot);
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.err != null) {
+          oprot.writeFieldBegin(ERR_FIELD_DESC);
+          struct.err.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class knnQuery_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public knnQuery_resultTupleScheme getScheme() {
+        return new knnQuery_resultTupleScheme();
+      }
+    }
+
+    private static class knnQuery_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<knnQuery_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, knnQuery_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetErr()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          {
+            oprot.writeI32(struct.success.size());
+            for (ReplyEntry _iter12 : struct.success)
+            {
+              _iter12.write(oprot);
+            }
+          }
+        }
+        if (struct.isSetErr()) {
+          struct.err.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, knnQuery_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list13 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, iprot.readI32());
+            struct.success = new java.util.ArrayList<ReplyEntry>(_list13.size);
+            ReplyEntry _elem14;
+            for (int _i15 = 0; _i15 < _list13.size; ++_i15)
+            {
+              _elem14 = new ReplyEntry();
+              _elem14.read(iprot);
+              struct.success.add(_elem14);
+            }
+          }
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.err = new QueryException();
+          struct.err.read(iprot);
+          struct.setErrIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class rangeQuery_args implements org.apache.thrift.TBase<rangeQuery_args, rangeQuery_args._Fields>, java.io.Serializable, Cloneable, Comparable<rangeQuery_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("rangeQuery_args");
+
+    private static final org.apache.thrift.protocol.TField R_FIELD_DESC = new org.apache.thrift.protocol.TField("r", org.apache.thrift.protocol.TType.DOUBLE, (short)1);
+    private static final org.apache.thrift.protocol.TField QUERY_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("queryObj", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField RET_EXTERN_ID_FIELD_DESC = new org.apache.thrift.protocol.TField("retExternId", org.apache.thrift.protocol.TType.BOOL, (short)3);
+    private static final org.apache.thrift.protocol.TField RET_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("retObj", org.apache.thrift.protocol.TType.BOOL, (short)4);
+    private static final org.apache.thrift.protocol.TField BINARY_QUERY_FIELD_DESC = new org.apache.thrift.protocol.TField("binaryQuery", org.apache.thrift.protocol.TType.BOOL, (short)5);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new rangeQuery_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new rangeQuery_argsTupleSchemeFactory();
+
+    public double r; // required
+    public java.nio.ByteBuffer queryObj; // required
+    public boolean retExternId; // required
+    public boolean retObj; // required
+    public boolean binaryQuery; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      R((short)1, "r"),
+      QUERY_OBJ((short)2, "queryObj"),
+      RET_EXTERN_ID((short)3, "retExternId"),
+      RET_OBJ((short)4, "retObj"),
+      BINARY_QUERY((short)5, "binaryQuery");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // R
+            return R;
+          case 2: // QUERY_OBJ
+            return QUERY_OBJ;
+          case 3: // RET_EXTERN_ID
+            return RET_EXTERN_ID;
+          case 4: // RET_OBJ
+            return RET_OBJ;
+          case 5: // BINARY_QUERY
+            return BINARY_QUERY;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __R_ISSET_ID = 0;
+    private static final int __RETEXTERNID_ISSET_ID = 1;
+    private static final int __RETOBJ_ISSET_ID = 2;
+    private static final int __BINARYQUERY_ISSET_ID = 3;
+    private byte __isset_bitfield = 0;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.R, new org.apache.thrift.meta_data.FieldMetaData("r", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+      tmpMap.put(_Fields.QUERY_OBJ, new org.apache.thrift.meta_data.FieldMetaData("queryObj", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      tmpMap.put(_Fields.RET_EXTERN_ID, new org.apache.thrift.meta_data.FieldMetaData("retExternId", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      tmpMap.put(_Fields.RET_OBJ, new org.apache.thrift.meta_data.FieldMetaData("retObj", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      tmpMap.put(_Fields.BINARY_QUERY, new org.apache.thrift.meta_data.FieldMetaData("binaryQuery", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(rangeQuery_args.class, metaDataMap);
+    }
+
+    public rangeQuery_args() {
+    }
+
+    public rangeQuery_args(
+      double r,
+      java.nio.ByteBuffer queryObj,
+      boolean retExternId,
+      boolean retObj,
+      boolean binaryQuery)
+    {
+      this();
+      this.r = r;
+      setRIsSet(true);
+      this.queryObj = org.apache.thrift.TBaseHelper.copyBinary(queryObj);
+      this.retExternId = retExternId;
+      setRetExternIdIsSet(true);
+      this.retObj = retObj;
+      setRetObjIsSet(true);
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public rangeQuery_args(rangeQuery_args other) {
+      __isset_bitfield = other.__isset_bitfield;
+      this.r = other.r;
+      if (other.isSetQueryObj()) {
+        this.queryObj = org.apache.thrift.TBaseHelper.copyBinary(other.queryObj);
+      }
+      this.retExternId = other.retExternId;
+      this.retObj = other.retObj;
+      this.binaryQuery = other.binaryQuery;
+    }
+
+    public rangeQuery_args deepCopy() {
+      return new rangeQuery_args(this);
+    }
+
+    @Override
+    public void clear() {
+      setRIsSet(false);
+      this.r = 0.0;
+      this.queryObj = null;
+      setRetExternIdIsSet(false);
+      this.retExternId = false;
+      setRetObjIsSet(false);
+      this.retObj = false;
+      setBinaryQueryIsSet(false);
+      this.binaryQuery = false;
+    }
+
+    public double getR() {
+      return this.r;
+    }
+
+    public rangeQuery_args setR(double r) {
+      this.r = r;
+      setRIsSet(true);
+      return this;
+    }
+
+    public void unsetR() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __R_ISSET_ID);
+    }
+
+    /** Returns true if field r is set (has been assigned a value) and false otherwise */
+    public boolean isSetR() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __R_ISSET_ID);
+    }
+
+    public void setRIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __R_ISSET_ID, value);
+    }
+
+    public byte[] getQueryObj() {
+      setQueryObj(org.apache.thrift.TBaseHelper.rightSize(queryObj));
+      return queryObj == null ? null : queryObj.array();
+    }
+
+    public java.nio.ByteBuffer bufferForQueryObj() {
+      return org.apache.thrift.TBaseHelper.copyBinary(queryObj);
+    }
+
+    public rangeQuery_args setQueryObj(byte[] queryObj) {
+      this.queryObj = queryObj == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(queryObj.clone());
+      return this;
+    }
+
+    public rangeQuery_args setQueryObj(java.nio.ByteBuffer queryObj) {
+      this.queryObj = org.apache.thrift.TBaseHelper.copyBinary(queryObj);
+      return this;
+    }
+
+    public void unsetQueryObj() {
+      this.queryObj = null;
+    }
+
+    /** Returns true if field queryObj is set (has been assigned a value) and false otherwise */
+    public boolean isSetQueryObj() {
+      return this.queryObj != null;
+    }
+
+    public void setQueryObjIsSet(boolean value) {
+      if (!value) {
+        this.queryObj = null;
+      }
+    }
+
+    public boolean isRetExternId() {
+      return this.retExternId;
+    }
+
+    public rangeQuery_args setRetExternId(boolean retExternId) {
+      this.retExternId = retExternId;
+      setRetExternIdIsSet(true);
+      return this;
+    }
+
+    public void unsetRetExternId() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    }
+
+    /** Returns true if field retExternId is set (has been assigned a value) and false otherwise */
+    public boolean isSetRetExternId() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    }
+
+    public void setRetExternIdIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETEXTERNID_ISSET_ID, value);
+    }
+
+    public boolean isRetObj() {
+      return this.retObj;
+    }
+
+    public rangeQuery_args setRetObj(boolean retObj) {
+      this.retObj = retObj;
+      setRetObjIsSet(true);
+      return this;
+    }
+
+    public void unsetRetObj() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    }
+
+    /** Returns true if field retObj is set (has been assigned a value) and false otherwise */
+    public boolean isSetRetObj() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    }
+
+    public void setRetObjIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETOBJ_ISSET_ID, value);
+    }
+
+    public boolean isBinaryQuery() {
+      return this.binaryQuery;
+    }
+
+    public rangeQuery_args setBinaryQuery(boolean binaryQuery) {
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
+      return this;
+    }
+
+    public void unsetBinaryQuery() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    /** Returns true if field binaryQuery is set (has been assigned a value) and false otherwise */
+    public boolean isSetBinaryQuery() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    public void setBinaryQueryIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __BINARYQUERY_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case R:
+        if (value == null) {
+          unsetR();
+        } else {
+          setR((java.lang.Double)value);
+        }
+        break;
+
+      case QUERY_OBJ:
+        if (value == null) {
+          unsetQueryObj();
+        } else {
+          if (value instanceof byte[]) {
+            setQueryObj((byte[])value);
+          } else {
+            setQueryObj((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case RET_EXTERN_ID:
+        if (value == null) {
+          unsetRetExternId();
+        } else {
+          setRetExternId((java.lang.Boolean)value);
+        }
+        break;
+
+      case RET_OBJ:
+        if (value == null) {
+          unsetRetObj();
+        } else {
+          setRetObj((java.lang.Boolean)value);
+        }
+        break;
+
+      case BINARY_QUERY:
+        if (value == null) {
+          unsetBinaryQuery();
+        } else {
+          setBinaryQuery((java.lang.Boolean)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case R:
+        return getR();
+
+      case QUERY_OBJ:
+        return getQueryObj();
+
+      case RET_EXTERN_ID:
+        return isRetExternId();
+
+      case RET_OBJ:
+        return isRetObj();
+
+      case BINARY_QUERY:
+        return isBinaryQuery();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case R:
+        return isSetR();
+      case QUERY_OBJ:
+        return isSetQueryObj();
+      case RET_EXTERN_ID:
+        return isSetRetExternId();
+      case RET_OBJ:
+        return isSetRetObj();
+      case BINARY_QUERY:
+        return isSetBinaryQuery();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof rangeQuery_args)
+        return this.equals((rangeQuery_args)that);
+      return false;
+    }
+
+    public boolean equals(rangeQuery_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_r = true;
+      boolean that_present_r = true;
+      if (this_present_r || that_present_r) {
+        if (!(this_present_r && that_present_r))
+          return false;
+        if (this.r != that.r)
+          return false;
+      }
+
+      boolean this_present_queryObj = true && this.isSetQueryObj();
+      boolean that_present_queryObj = true && that.isSetQueryObj();
+      if (this_present_queryObj || that_present_queryObj) {
+        if (!(this_present_queryObj && that_present_queryObj))
+          return false;
+        if (!this.queryObj.equals(that.queryObj))
+          return false;
+      }
+
+      boolean this_present_retExternId = true;
+      boolean that_present_retExternId = true;
+      if (this_present_retExternId || that_present_retExternId) {
+        if (!(this_present_retExternId && that_present_retExternId))
+          return false;
+        if (this.retExternId != that.retExternId)
+          return false;
+      }
+
+      boolean this_present_retObj = true;
+      boolean that_present_retObj = true;
+      if (this_present_retObj || that_present_retObj) {
+        if (!(this_present_retObj && that_present_retObj))
+          return false;
+        if (this.retObj != that.retObj)
+          return false;
+      }
+
+      boolean this_present_binaryQuery = true;
+      boolean that_present_binaryQuery = true;
+      if (this_present_binaryQuery || that_present_binaryQuery) {
+        if (!(this_present_binaryQuery && that_present_binaryQuery))
+          return false;
+        if (this.binaryQuery != that.binaryQuery)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(r);
+
+      hashCode = hashCode * 8191 + ((isSetQueryObj()) ? 131071 : 524287);
+      if (isSetQueryObj())
+        hashCode = hashCode * 8191 + queryObj.hashCode();
+
+      hashCode = hashCode * 8191 + ((retExternId) ? 131071 : 524287);
+
+      hashCode = hashCode * 8191 + ((retObj) ? 131071 : 524287);
+
+      hashCode = hashCode * 8191 + ((binaryQuery) ? 131071 : 524287);
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(rangeQuery_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetR()).compareTo(other.isSetR());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetR()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.r, other.r);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetQueryObj()).compareTo(other.isSetQueryObj());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetQueryObj()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.queryObj, other.queryObj);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetRetExternId()).compareTo(other.isSetRetExternId());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRetExternId()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retExternId, other.retExternId);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetRetObj()).compareTo(other.isSetRetObj());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRetObj()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retObj, other.retObj);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetBinaryQuery()).compareTo(other.isSetBinaryQuery());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetBinaryQuery()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.binaryQuery, other.binaryQuery);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("rangeQuery_args(");
+      boolean first = true;
+
+      sb.append("r:");
+      sb.append(this.r);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("queryObj:");
+      if (this.queryObj == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.queryObj, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("retExternId:");
+      sb.append(this.retExternId);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("retObj:");
+      sb.append(this.retObj);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("binaryQuery:");
+      sb.append(this.binaryQuery);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // alas, we cannot check 'r' because it's a primitive and you chose the non-beans generator.
+      if (queryObj == null) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'queryObj' was not present! Struct: " + toString());
+      }
+      // alas, we cannot check 'retExternId' because it's a primitive and you chose the non-beans generator.
+      // alas, we cannot check 'retObj' because it's a primitive and you chose the non-beans generator.
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class rangeQuery_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQuery_argsStandardScheme getScheme() {
+        return new rangeQuery_argsStandardScheme();
+      }
+    }
+
+    private static class rangeQuery_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<rangeQuery_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, rangeQuery_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // R
+              if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+                struct.r = iprot.readDouble();
+                struct.setRIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // QUERY_OBJ
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.queryObj = iprot.readBinary();
+                struct.setQueryObjIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // RET_EXTERN_ID
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.retExternId = iprot.readBool();
+                struct.setRetExternIdIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // RET_OBJ
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.retObj = iprot.readBool();
+                struct.setRetObjIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 5: // BINARY_QUERY
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.binaryQuery = iprot.readBool();
+                struct.setBinaryQueryIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        if (!struct.isSetR()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'r' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetExternId()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retExternId' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetObj()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retObj' was not found in serialized data! Struct: " + toString());
+        }
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, rangeQuery_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldBegin(R_FIELD_DESC);
+        oprot.writeDouble(struct.r);
+        oprot.writeFieldEnd();
+        if (struct.queryObj != null) {
+          oprot.writeFieldBegin(QUERY_OBJ_FIELD_DESC);
+          oprot.writeBinary(struct.queryObj);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(RET_EXTERN_ID_FIELD_DESC);
+        oprot.writeBool(struct.retExternId);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(RET_OBJ_FIELD_DESC);
+        oprot.writeBool(struct.retObj);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(BINARY_QUERY_FIELD_DESC);
+        oprot.writeBool(struct.binaryQuery);
+        oprot.writeFieldEnd();
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class rangeQuery_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQuery_argsTupleScheme getScheme() {
+        return new rangeQuery_argsTupleScheme();
+      }
+    }
+
+    private static class rangeQuery_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<rangeQuery_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, rangeQuery_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        oprot.writeDouble(struct.r);
+        oprot.writeBinary(struct.queryObj);
+        oprot.writeBool(struct.retExternId);
+        oprot.writeBool(struct.retObj);
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetBinaryQuery()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetBinaryQuery()) {
+          oprot.writeBool(struct.binaryQuery);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, rangeQuery_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        struct.r = iprot.readDouble();
+        struct.setRIsSet(true);
+        struct.queryObj = iprot.readBinary();
+        struct.setQueryObjIsSet(true);
+        struct.retExternId = iprot.readBool();
+        struct.setRetExternIdIsSet(true);
+        struct.retObj = iprot.readBool();
+        struct.setRetObjIsSet(true);
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.binaryQuery = iprot.readBool();
+          struct.setBinaryQueryIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class rangeQuery_result implements org.apache.thrift.TBase<rangeQuery_result, rangeQuery_result._Fields>, java.io.Serializable, Cloneable, Comparable<rangeQuery_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("rangeQuery_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
+    private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new rangeQuery_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new rangeQuery_resultTupleSchemeFactory();
+
+    public java.util.List<ReplyEntry> success; // required
+    public QueryException err; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // ERR
+            return ERR;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.LIST          , "ReplyEntryList")));
+      tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(rangeQuery_result.class, metaDataMap);
+    }
+
+    public rangeQuery_result() {
+    }
+
+    public rangeQuery_result(
+      java.util.List<ReplyEntry> success,
+      QueryException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public rangeQuery_result(rangeQuery_result other) {
+      if (other.isSetSuccess()) {
+        java.util.List<ReplyEntry> __this__success = new java.util.ArrayList<ReplyEntry>(other.success.size());
+        for (ReplyEntry other_element : other.success) {
+          __this__success.add(new ReplyEntry(other_element));
+        }
+        this.success = __this__success;
+      }
+      if (other.isSetErr()) {
+        this.err = new QueryException(other.err);
+      }
+    }
+
+    public rangeQuery_result deepCopy() {
+      return new rangeQuery_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.err = null;
+    }
+
+    public int getSuccessSize() {
+      return (this.success == null) ? 0 : this.success.size();
+    }
+
+    public java.util.Iterator<ReplyEntry> getSuccessIterator() {
+      return (this.success == null) ? null : this.success.iterator();
+    }
+
+    public void addToSuccess(ReplyEntry elem) {
+      if (this.success == null) {
+        this.success = new java.util.ArrayList<ReplyEntry>();
+      }
+      this.success.add(elem);
+    }
+
+    public java.util.List<ReplyEntry> getSuccess() {
+      return this.success;
+    }
+
+    public rangeQuery_result setSuccess(java.util.List<ReplyEntry> success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public QueryException getErr() {
+      return this.err;
+    }
+
+    public rangeQuery_result setErr(QueryException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been assigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.util.List<ReplyEntry>)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((QueryException)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof rangeQuery_result)
+        return this.equals((rangeQuery_result)that);
+      return false;
+    }
+
+    public boolean equals(rangeQuery_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetErr()) ? 131071 : 524287);
+      if (isSetErr())
+        hashCode = hashCode * 8191 + err.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(rangeQuery_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetErr()).compareTo(other.isSetErr());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetErr()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.err, other.err);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("rangeQuery_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class rangeQuery_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQuery_resultStandardScheme getScheme() {
+        return new rangeQuery_resultStandardScheme();
+      }
+    }
+
+    private static class rangeQuery_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<rangeQuery_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, rangeQuery_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list16 = iprot.readListBegin();
+                  struct.success = new java.util.ArrayList<ReplyEntry>(_list16.size);
+                  ReplyEntry _elem17;
+                  for (int _i18 = 0; _i18 < _list16.size; ++_i18)
+                  {
+                    _elem17 = new ReplyEntry();
+                    _elem17.read(iprot);
+                    struct.success.add(_elem17);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // ERR
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.err = new QueryException();
+                struct.err.read(iprot);
+                struct.setErrIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, rangeQuery_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, struct.success.size()));
+            for (ReplyEntry _iter19 : struct.success)
+            {
+              _iter19.write(oprot);
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.err != null) {
+          oprot.writeFieldBegin(ERR_FIELD_DESC);
+          struct.err.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class rangeQuery_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQuery_resultTupleScheme getScheme() {
+        return new rangeQuery_resultTupleScheme();
+      }
+    }
+
+    private static class rangeQuery_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<rangeQuery_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, rangeQuery_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetErr()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          {
+            oprot.writeI32(struct.success.size());
+            for (ReplyEntry _iter20 : struct.success)
+            {
+              _iter20.write(oprot);
+            }
+          }
+        }
+        if (struct.isSetErr()) {
+          struct.err.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, rangeQuery_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list21 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, iprot.readI32());
+            struct.success = new java.util.ArrayList<ReplyEntry>(_list21.size);
+            ReplyEntry _elem22;
+            for (int _i23 = 0; _i23 < _list21.size; ++_i23)
+            {
+              _elem22 = new ReplyEntry();
+              _elem22.read(iprot);
+              struct.success.add(_elem22);
+            }
+          }
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.err = new QueryException();
+          struct.err.read(iprot);
+          struct.setErrIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class knnQueryBatch_args implements org.apache.thrift.TBase<knnQueryBatch_args, knnQueryBatch_args._Fields>, java.io.Serializable, Cloneable, Comparable<knnQueryBatch_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("knnQueryBatch_args");
+
+    private static final org.apache.thrift.protocol.TField K_FIELD_DESC = new org.apache.thrift.protocol.TField("k", org.apache.thrift.protocol.TType.I32, (short)1);
+    private static final org.apache.thrift.protocol.TField QUERY_OBJS_FIELD_DESC = new org.apache.thrift.protocol.TField("queryObjs", org.apache.thrift.protocol.TType.LIST, (short)2);
+    private static final org.apache.thrift.protocol.TField RET_EXTERN_ID_FIELD_DESC = new org.apache.thrift.protocol.TField("retExternId", org.apache.thrift.protocol.TType.BOOL, (short)3);
+    private static final org.apache.thrift.protocol.TField RET_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("retObj", org.apache.thrift.protocol.TType.BOOL, (short)4);
+    private static final org.apache.thrift.protocol.TField BINARY_QUERY_FIELD_DESC = new org.apache.thrift.protocol.TField("binaryQuery", org.apache.thrift.protocol.TType.BOOL, (short)5);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new knnQueryBatch_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new knnQueryBatch_argsTupleSchemeFactory();
+
+    public int k; // required
+    public java.util.List<java.nio.ByteBuffer> queryObjs; // required
+    public boolean retExternId; // required
+    public boolean retObj; // required
+    public boolean binaryQuery; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      K((short)1, "k"),
+      QUERY_OBJS((short)2, "queryObjs"),
+      RET_EXTERN_ID((short)3, "retExternId"),
+      RET_OBJ((short)4, "retObj"),
+      BINARY_QUERY((short)5, "binaryQuery");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // K
+            return K;
+          case 2: // QUERY_OBJS
+            return QUERY_OBJS;
+          case 3: // RET_EXTERN_ID
+            return RET_EXTERN_ID;
+          case 4: // RET_OBJ
+            return RET_OBJ;
+          case 5: // BINARY_QUERY
+            return BINARY_QUERY;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __K_ISSET_ID = 0;
+    private static final int __RETEXTERNID_ISSET_ID = 1;
+    private static final int __RETOBJ_ISSET_ID = 2;
+    private static final int __BINARYQUERY_ISSET_ID = 3;
+    private byte __isset_bitfield = 0;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.K, new org.apache.thrift.meta_data.FieldMetaData("k", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I32)));
+      tmpMap.put(_Fields.QUERY_OBJS, new org.apache.thrift.meta_data.FieldMetaData("queryObjs", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING              , true))));
+      tmpMap.put(_Fields.RET_EXTERN_ID, new org.apache.thrift.meta_data.FieldMetaData("retExternId", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      tmpMap.put(_Fields.RET_OBJ, new org.apache.thrift.meta_data.FieldMetaData("retObj", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      tmpMap.put(_Fields.BINARY_QUERY, new org.apache.thrift.meta_data.FieldMetaData("binaryQuery", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(knnQueryBatch_args.class, metaDataMap);
+    }
+
+    public knnQueryBatch_args() {
+    }
+
+    public knnQueryBatch_args(
+      int k,
+      java.util.List<java.nio.ByteBuffer> queryObjs,
+      boolean retExternId,
+      boolean retObj,
+      boolean binaryQuery)
+    {
+      this();
+      this.k = k;
+      setKIsSet(true);
+      this.queryObjs = queryObjs;
+      this.retExternId = retExternId;
+      setRetExternIdIsSet(true);
+      this.retObj = retObj;
+      setRetObjIsSet(true);
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public knnQueryBatch_args(knnQueryBatch_args other) {
+      __isset_bitfield = other.__isset_bitfield;
+      this.k = other.k;
+      if (other.isSetQueryObjs()) {
+        java.util.List<java.nio.ByteBuffer> __this__queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>(other.queryObjs);
+        this.queryObjs = __this__queryObjs;
+      }
+      this.retExternId = other.retExternId;
+      this.retObj = other.retObj;
+      this.binaryQuery = other.binaryQuery;
+    }
+
+    public knnQueryBatch_args deepCopy() {
+      return new knnQueryBatch_args(this);
+    }
+
+    @Override
+    public void clear() {
+      setKIsSet(false);
+      this.k = 0;
+      this.queryObjs = null;
+      setRetExternIdIsSet(false);
+      this.retExternId = false;
+      setRetObjIsSet(false);
+      this.retObj = false;
+      setBinaryQueryIsSet(false);
+      this.binaryQuery = false;
+    }
+
+    public int getK() {
+      return this.k;
+    }
+
+    public knnQueryBatch_args setK(int k) {
+      this.k = k;
+      setKIsSet(true);
+      return this;
+    }
+
+    public void unsetK() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __K_ISSET_ID);
+    }
+
+    /** Returns true if field k is set (has been assigned a value) and false otherwise */
+    public boolean isSetK() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __K_ISSET_ID);
+    }
+
+    public void setKIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __K_ISSET_ID, value);
+    }
+
+    public int getQueryObjsSize() {
+      return (this.queryObjs == null) ? 0 : this.queryObjs.size();
+    }
+
+    public java.util.Iterator<java.nio.ByteBuffer> getQueryObjsIterator() {
+      return (this.queryObjs == null) ? null : this.queryObjs.iterator();
+    }
+
+    public void addToQueryObjs(java.nio.ByteBuffer elem) {
+      if (this.queryObjs == null) {
+        this.queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>();
+      }
+      this.queryObjs.add(elem);
+    }
+
+    public java.util.List<java.nio.ByteBuffer> getQueryObjs() {
+      return this.queryObjs;
+    }
+
+    public knnQueryBatch_args setQueryObjs(java.util.List<java.nio.ByteBuffer> queryObjs) {
+      this.queryObjs = queryObjs;
+      return this;
+    }
+
+    public void unsetQueryObjs() {
+      this.queryObjs = null;
+    }
+
+    /** Returns true if field queryObjs is set (has been assigned a value) and false otherwise */
+    public boolean isSetQueryObjs() {
+      return this.queryObjs != null;
+    }
+
+    public void setQueryObjsIsSet(boolean value) {
+      if (!value) {
+        this.queryObjs = null;
+      }
+    }
+
+    public boolean isRetExternId() {
+      return this.retExternId;
+    }
+
+    public knnQueryBatch_args setRetExternId(boolean retExternId) {
+      this.retExternId = retExternId;
+      setRetExternIdIsSet(true);
+      return this;
+    }
+
+    public void unsetRetExternId() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    }
+
+    /** Returns true if field retExternId is set (has been assigned a value) and false otherwise */
+    public boolean isSetRetExternId() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    }
+
+    public void setRetExternIdIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETEXTERNID_ISSET_ID, value);
+    }
+
+    public boolean isRetObj() {
+      return this.retObj;
+    }
+
+    public knnQueryBatch_args setRetObj(boolean retObj) {
+      this.retObj = retObj;
+      setRetObjIsSet(true);
+      return this;
+    }
+
+    public void unsetRetObj() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    }
+
+    /** Returns true if field retObj is set (has been assigned a value) and false otherwise */
+    public boolean isSetRetObj() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    }
+
+    public void setRetObjIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETOBJ_ISSET_ID, value);
+    }
+
+    public boolean isBinaryQuery() {
+      return this.binaryQuery;
+    }
+
+    public knnQueryBatch_args setBinaryQuery(boolean binaryQuery) {
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
+      return this;
+    }
+
+    public void unsetBinaryQuery() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    /** Returns true if field binaryQuery is set (has been assigned a value) and false otherwise */
+    public boolean isSetBinaryQuery() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    public void setBinaryQueryIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __BINARYQUERY_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case K:
+        if (value == null) {
+          unsetK();
+        } else {
+          setK((java.lang.Integer)value);
+        }
+        break;
+
+      case QUERY_OBJS:
+        if (value == null) {
+          unsetQueryObjs();
+        } else {
+          setQueryObjs((java.util.List<java.nio.ByteBuffer>)value);
+        }
+        break;
+
+      case RET_EXTERN_ID:
+        if (value == null) {
+          unsetRetExternId();
+        } else {
+          setRetExternId((java.lang.Boolean)value);
+        }
+        break;
+
+      case RET_OBJ:
+        if (value == null) {
+          unsetRetObj();
+        } else {
+          setRetObj((java.lang.Boolean)value);
+        }
+        break;
+
+      case BINARY_QUERY:
+        if (value == null) {
+          unsetBinaryQuery();
+        } else {
+          setBinaryQuery((java.lang.Boolean)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case K:
+        return getK();
+
+      case QUERY_OBJS:
+        return getQueryObjs();
+
+      case RET_EXTERN_ID:
+        return isRetExternId();
+
+      case RET_OBJ:
+        return isRetObj();
+
+      case BINARY_QUERY:
+        return isBinaryQuery();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case K:
+        return isSetK();
+      case QUERY_OBJS:
+        return isSetQueryObjs();
+      case RET_EXTERN_ID:
+        return isSetRetExternId();
+      case RET_OBJ:
+        return isSetRetObj();
+      case BINARY_QUERY:
+        return isSetBinaryQuery();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof knnQueryBatch_args)
+        return this.equals((knnQueryBatch_args)that);
+      return false;
+    }
+
+    public boolean equals(knnQueryBatch_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_k = true;
+      boolean that_present_k = true;
+      if (this_present_k || that_present_k) {
+        if (!(this_present_k && that_present_k))
+          return false;
+        if (this.k != that.k)
+          return false;
+      }
+
+      boolean this_present_queryObjs = true && this.isSetQueryObjs();
+      boolean that_present_queryObjs = true && that.isSetQueryObjs();
+      if (this_present_queryObjs || that_present_queryObjs) {
+        if (!(this_present_queryObjs && that_present_queryObjs))
+          return false;
+        if (!this.queryObjs.equals(that.queryObjs))
+          return false;
+      }
+
+      boolean this_present_retExternId = true;
+      boolean that_present_retExternId = true;
+      if (this_present_retExternId || that_present_retExternId) {
+        if (!(this_present_retExternId && that_present_retExternId))
+          return false;
+        if (this.retExternId != that.retExternId)
+          return false;
+      }
+
+      boolean this_present_retObj = true;
+      boolean that_present_retObj = true;
+      if (this_present_retObj || that_present_retObj) {
+        if (!(this_present_retObj && that_present_retObj))
+          return false;
+        if (this.retObj != that.retObj)
+          return false;
+      }
+
+      boolean this_present_binaryQuery = true;
+      boolean that_present_binaryQuery = true;
+      if (this_present_binaryQuery || that_present_binaryQuery) {
+        if (!(this_present_binaryQuery && that_present_binaryQuery))
+          return false;
+        if (this.binaryQuery != that.binaryQuery)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + k;
+
+      hashCode = hashCode * 8191 + ((isSetQueryObjs()) ? 131071 : 524287);
+      if (isSetQueryObjs())
+        hashCode = hashCode * 8191 + queryObjs.hashCode();
+
+      hashCode = hashCode * 8191 + ((retExternId) ? 131071 : 524287);
+
+      hashCode = hashCode * 8191 + ((retObj) ? 131071 : 524287);
+
+      hashCode = hashCode * 8191 + ((binaryQuery) ? 131071 : 524287);
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(knnQueryBatch_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetK()).compareTo(other.isSetK());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetK()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.k, other.k);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetQueryObjs()).compareTo(other.isSetQueryObjs());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetQueryObjs()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.queryObjs, other.queryObjs);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetRetExternId()).compareTo(other.isSetRetExternId());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRetExternId()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retExternId, other.retExternId);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetRetObj()).compareTo(other.isSetRetObj());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRetObj()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retObj, other.retObj);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetBinaryQuery()).compareTo(other.isSetBinaryQuery());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetBinaryQuery()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.binaryQuery, other.binaryQuery);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("knnQueryBatch_args(");
+      boolean first = true;
+
+      sb.append("k:");
+      sb.append(this.k);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("queryObjs:");
+      if (this.queryObjs == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.queryObjs, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("retExternId:");
+      sb.append(this.retExternId);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("retObj:");
+      sb.append(this.retObj);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("binaryQuery:");
+      sb.append(this.binaryQuery);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // alas, we cannot check 'k' because it's a primitive and you chose the non-beans generator.
+      if (queryObjs == null) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'queryObjs' was not present! Struct: " + toString());
+      }
+      // alas, we cannot check 'retExternId' because it's a primitive and you chose the non-beans generator.
+      // alas, we cannot check 'retObj' because it's a primitive and you chose the non-beans generator.
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class knnQueryBatch_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public knnQueryBatch_argsStandardScheme getScheme() {
+        return new knnQueryBatch_argsStandardScheme();
+      }
+    }
+
+    private static class knnQueryBatch_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<knnQueryBatch_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, knnQueryBatch_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // K
+              if (schemeField.type == org.apache.thrift.protocol.TType.I32) {
+                struct.k = iprot.readI32();
+                struct.setKIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // QUERY_OBJS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list24 = iprot.readListBegin();
+                  struct.queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>(_list24.size);
+                  java.nio.ByteBuffer _elem25;
+                  for (int _i26 = 0; _i26 < _list24.size; ++_i26)
+                  {
+                    _elem25 = iprot.readBinary();
+                    struct.queryObjs.add(_elem25);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setQueryObjsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // RET_EXTERN_ID
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.retExternId = iprot.readBool();
+                struct.setRetExternIdIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // RET_OBJ
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.retObj = iprot.readBool();
+                struct.setRetObjIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 5: // BINARY_QUERY
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.binaryQuery = iprot.readBool();
+                struct.setBinaryQueryIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        if (!struct.isSetK()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'k' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetExternId()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retExternId' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetObj()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retObj' was not found in serialized data! Struct: " + toString());
+        }
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, knnQueryBatch_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldBegin(K_FIELD_DESC);
+        oprot.writeI32(struct.k);
+        oprot.writeFieldEnd();
+        if (struct.queryObjs != null) {
+          oprot.writeFieldBegin(QUERY_OBJS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, struct.queryObjs.size()));
+            for (java.nio.ByteBuffer _iter27 : struct.queryObjs)
+            {
+              oprot.writeBinary(_iter27);
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(RET_EXTERN_ID_FIELD_DESC);
+        oprot.writeBool(struct.retExternId);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(RET_OBJ_FIELD_DESC);
+        oprot.writeBool(struct.retObj);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(BINARY_QUERY_FIELD_DESC);
+        oprot.writeBool(struct.binaryQuery);
+        oprot.writeFieldEnd();
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class knnQueryBatch_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public knnQueryBatch_argsTupleScheme getScheme() {
+        return new knnQueryBatch_argsTupleScheme();
+      }
+    }
+
+    private static class knnQueryBatch_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<knnQueryBatch_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, knnQueryBatch_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        oprot.writeI32(struct.k);
+        {
+          oprot.writeI32(struct.queryObjs.size());
+          for (java.nio.ByteBuffer _iter28 : struct.queryObjs)
+          {
+            oprot.writeBinary(_iter28);
+          }
+        }
+        oprot.writeBool(struct.retExternId);
+        oprot.writeBool(struct.retObj);
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetBinaryQuery()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetBinaryQuery()) {
+          oprot.writeBool(struct.binaryQuery);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, knnQueryBatch_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        struct.k = iprot.readI32();
+        struct.setKIsSet(true);
+        {
+          org.apache.thrift.protocol.TList _list29 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
+          struct.queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>(_list29.size);
+          java.nio.ByteBuffer _elem30;
+          for (int _i31 = 0; _i31 < _list29.size; ++_i31)
+          {
+            _elem30 = iprot.readBinary();
+            struct.queryObjs.add(_elem30);
+          }
+        }
+        struct.setQueryObjsIsSet(true);
+        struct.retExternId = iprot.readBool();
+        struct.setRetExternIdIsSet(true);
+        struct.retObj = iprot.readBool();
+        struct.setRetObjIsSet(true);
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.binaryQuery = iprot.readBool();
+          struct.setBinaryQueryIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class knnQueryBatch_result implements org.apache.thrift.TBase<knnQueryBatch_result, knnQueryBatch_result._Fields>, java.io.Serializable, Cloneable, Comparable<knnQueryBatch_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("knnQueryBatch_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
+    private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new knnQueryBatch_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new knnQueryBatch_resultTupleSchemeFactory();
+
+    public java.util.List<java.util.List<ReplyEntry>> success; // required
+    public QueryException err; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // ERR
+            return ERR;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.LIST          , "ReplyEntryListList")));
+      tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(knnQueryBatch_result.class, metaDataMap);
+    }
+
+    public knnQueryBatch_result() {
+    }
+
+    public knnQueryBatch_result(
+      java.util.List<java.util.List<ReplyEntry>> success,
+      QueryException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public knnQueryBatch_result(knnQueryBatch_result other) {
+      if (other.isSetSuccess()) {
+        java.util.List<java.util.List<ReplyEntry>> __this__success = new java.util.ArrayList<java.util.List<ReplyEntry>>(other.success.size());
+        for (java.util.List<ReplyEntry> other_element : other.success) {
+          __this__success.add(other_element);
+        }
+        this.success = __this__success;
+      }
+      if (other.isSetErr()) {
+        this.err = new QueryException(other.err);
+      }
+    }
+
+    public knnQueryBatch_result deepCopy() {
+      return new knnQueryBatch_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.err = null;
+    }
+
+    public int getSuccessSize() {
+      return (this.success == null) ? 0 : this.success.size();
+    }
+
+    public java.util.Iterator<java.util.List<ReplyEntry>> getSuccessIterator() {
+      return (this.success == null) ? null : this.success.iterator();
+    }
+
+    public void addToSuccess(java.util.List<ReplyEntry> elem) {
+      if (this.success == null) {
+        this.success = new java.util.ArrayList<java.util.List<ReplyEntry>>();
+      }
+      this.success.add(elem);
+    }
+
+    public java.util.List<java.util.List<ReplyEntry>> getSuccess() {
+      return this.success;
+    }
+
+    public knnQueryBatch_result setSuccess(java.util.List<java.util.List<ReplyEntry>> success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public QueryException getErr() {
+      return this.err;
+    }
+
+    public knnQueryBatch_result setErr(QueryException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been assigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.util.List<java.util.List<ReplyEntry>>)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((QueryException)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof knnQueryBatch_result)
+        return this.equals((knnQueryBatch_result)that);
+      return false;
+    }
+
+    public boolean equals(knnQueryBatch_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetErr()) ? 131071 : 524287);
+      if (isSetErr())
+        hashCode = hashCode * 8191 + err.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(knnQueryBatch_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetErr()).compareTo(other.isSetErr());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetErr()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.err, other.err);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("knnQueryBatch_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class knnQueryBatch_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public knnQueryBatch_resultStandardScheme getScheme() {
+        return new knnQueryBatch_resultStandardScheme();
+      }
+    }
+
+    private static class knnQueryBatch_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<knnQueryBatch_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, knnQueryBatch_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list32 = iprot.readListBegin();
+                  struct.success = new java.util.ArrayList<java.util.List<ReplyEntry>>(_list32.size);
+                  java.util.List<ReplyEntry> _elem33;
+                  for (int _i34 = 0; _i34 < _list32.size; ++_i34)
+                  {
+                    {
+                      org.apache.thrift.protocol.TList _list35 = iprot.readListBegin();
+                      _elem33 = new java.util.ArrayList<ReplyEntry>(_list35.size);
+                      ReplyEntry _elem36;
+                      for (int _i37 = 0; _i37 < _list35.size; ++_i37)
+                      {
+                        _elem36 = new ReplyEntry();
+                        _elem36.read(iprot);
+                        _elem33.add(_elem36);
+                      }
+                      iprot.readListEnd();
+                    }
+                    struct.success.add(_elem33);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // ERR
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.err = new QueryException();
+                struct.err.read(iprot);
+                struct.setErrIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, knnQueryBatch_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.success.size()));
+            for (java.util.List<ReplyEntry> _iter38 : struct.success)
+            {
+              {
+                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, _iter38.size()));
+                for (ReplyEntry _iter39 : _iter38)
+                {
+                  _iter39.write(oprot);
+                }
+                oprot.writeListEnd();
+              }
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.err != null) {
+          oprot.writeFieldBegin(ERR_FIELD_DESC);
+          struct.err.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class knnQueryBatch_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public knnQueryBatch_resultTupleScheme getScheme() {
+        return new knnQueryBatch_resultTupleScheme();
+      }
+    }
+
+    private static class knnQueryBatch_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<knnQueryBatch_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, knnQueryBatch_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetErr()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          {
+            oprot.writeI32(struct.success.size());
+            for (java.util.List<ReplyEntry> _iter40 : struct.success)
+            {
+              {
+                oprot.writeI32(_iter40.size());
+                for (ReplyEntry _iter41 : _iter40)
+                {
+                  _iter41.write(oprot);
+                }
+              }
+            }
+          }
+        }
+        if (struct.isSetErr()) {
+          struct.err.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, knnQueryBatch_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list42 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
+            struct.success = new java.util.ArrayList<java.util.List<ReplyEntry>>(_list42.size);
+            java.util.List<ReplyEntry> _elem43;
+            for (int _i44 = 0; _i44 < _list42.size; ++_i44)
+            {
+              {
+                org.apache.thrift.protocol.TList _list45 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, iprot.readI32());
+                _elem43 = new java.util.ArrayList<ReplyEntry>(_list45.size);
+                ReplyEntry _elem46;
+                for (int _i47 = 0; _i47 < _list45.size; ++_i47)
+                {
+                  _elem46 = new ReplyEntry();
+                  _elem46.read(iprot);
+                  _elem43.add(_elem46);
+                }
+              }
+              struct.success.add(_elem43);
+            }
+          }
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.err = new QueryException();
+          struct.err.read(iprot);
+          struct.setErrIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class rangeQueryBatch_args implements org.apache.thrift.TBase<rangeQueryBatch_args, rangeQueryBatch_args._Fields>, java.io.Serializable, Cloneable, Comparable<rangeQueryBatch_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("rangeQueryBatch_args");
+
+    private static final org.apache.thrift.protocol.TField R_FIELD_DESC = new org.apache.thrift.protocol.TField("r", org.apache.thrift.protocol.TType.DOUBLE, (short)1);
+    private static final org.apache.thrift.protocol.TField QUERY_OBJS_FIELD_DESC = new org.apache.thrift.protocol.TField("queryObjs", org.apache.thrift.protocol.TType.LIST, (short)2);
+    private static final org.apache.thrift.protocol.TField RET_EXTERN_ID_FIELD_DESC = new org.apache.thrift.protocol.TField("retExternId", org.apache.thrift.protocol.TType.BOOL, (short)3);
+    private static final org.apache.thrift.protocol.TField RET_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("retObj", org.apache.thrift.protocol.TType.BOOL, (short)4);
+    private static final org.apache.thrift.protocol.TField BINARY_QUERY_FIELD_DESC = new org.apache.thrift.protocol.TField("binaryQuery", org.apache.thrift.protocol.TType.BOOL, (short)5);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new rangeQueryBatch_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new rangeQueryBatch_argsTupleSchemeFactory();
+
+    public double r; // required
+    public java.util.List<java.nio.ByteBuffer> queryObjs; // required
+    public boolean retExternId; // required
+    public boolean retObj; // required
+    public boolean binaryQuery; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      R((short)1, "r"),
+      QUERY_OBJS((short)2, "queryObjs"),
+      RET_EXTERN_ID((short)3, "retExternId"),
+      RET_OBJ((short)4, "retObj"),
+      BINARY_QUERY((short)5, "binaryQuery");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // R
+            return R;
+          case 2: // QUERY_OBJS
+            return QUERY_OBJS;
+          case 3: // RET_EXTERN_ID
+            return RET_EXTERN_ID;
+          case 4: // RET_OBJ
+            return RET_OBJ;
+          case 5: // BINARY_QUERY
+            return BINARY_QUERY;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __R_ISSET_ID = 0;
+    private static final int __RETEXTERNID_ISSET_ID = 1;
+    private static final int __RETOBJ_ISSET_ID = 2;
+    private static final int __BINARYQUERY_ISSET_ID = 3;
+    private byte __isset_bitfield = 0;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.R, new org.apache.thrift.meta_data.FieldMetaData("r", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+      tmpMap.put(_Fields.QUERY_OBJS, new org.apache.thrift.meta_data.FieldMetaData("queryObjs", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+              new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING              , true))));
+      tmpMap.put(_Fields.RET_EXTERN_ID, new org.apache.thrift.meta_data.FieldMetaData("retExternId", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      tmpMap.put(_Fields.RET_OBJ, new org.apache.thrift.meta_data.FieldMetaData("retObj", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      tmpMap.put(_Fields.BINARY_QUERY, new org.apache.thrift.meta_data.FieldMetaData("binaryQuery", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(rangeQueryBatch_args.class, metaDataMap);
+    }
+
+    public rangeQueryBatch_args() {
+    }
+
+    public rangeQueryBatch_args(
+      double r,
+      java.util.List<java.nio.ByteBuffer> queryObjs,
+      boolean retExternId,
+      boolean retObj,
+      boolean binaryQuery)
+    {
+      this();
+      this.r = r;
+      setRIsSet(true);
+      this.queryObjs = queryObjs;
+      this.retExternId = retExternId;
+      setRetExternIdIsSet(true);
+      this.retObj = retObj;
+      setRetObjIsSet(true);
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public rangeQueryBatch_args(rangeQueryBatch_args other) {
+      __isset_bitfield = other.__isset_bitfield;
+      this.r = other.r;
+      if (other.isSetQueryObjs()) {
+        java.util.List<java.nio.ByteBuffer> __this__queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>(other.queryObjs);
+        this.queryObjs = __this__queryObjs;
+      }
+      this.retExternId = other.retExternId;
+      this.retObj = other.retObj;
+      this.binaryQuery = other.binaryQuery;
+    }
+
+    public rangeQueryBatch_args deepCopy() {
+      return new rangeQueryBatch_args(this);
+    }
+
+    @Override
+    public void clear() {
+      setRIsSet(false);
+      this.r = 0.0;
+      this.queryObjs = null;
+      setRetExternIdIsSet(false);
+      this.retExternId = false;
+      setRetObjIsSet(false);
+      this.retObj = false;
+      setBinaryQueryIsSet(false);
+      this.binaryQuery = false;
+    }
+
+    public double getR() {
+      return this.r;
+    }
+
+    public rangeQueryBatch_args setR(double r) {
+      this.r = r;
+      setRIsSet(true);
+      return this;
+    }
+
+    public void unsetR() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __R_ISSET_ID);
+    }
+
+    /** Returns true if field r is set (has been assigned a value) and false otherwise */
+    public boolean isSetR() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __R_ISSET_ID);
+    }
+
+    public void setRIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __R_ISSET_ID, value);
+    }
+
+    public int getQueryObjsSize() {
+      return (this.queryObjs == null) ? 0 : this.queryObjs.size();
+    }
+
+    public java.util.Iterator<java.nio.ByteBuffer> getQueryObjsIterator() {
+      return (this.queryObjs == null) ? null : this.queryObjs.iterator();
+    }
+
+    public void addToQueryObjs(java.nio.ByteBuffer elem) {
+      if (this.queryObjs == null) {
+        this.queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>();
+      }
+      this.queryObjs.add(elem);
+    }
+
+    public java.util.List<java.nio.ByteBuffer> getQueryObjs() {
+      return this.queryObjs;
+    }
+
+    public rangeQueryBatch_args setQueryObjs(java.util.List<java.nio.ByteBuffer> queryObjs) {
+      this.queryObjs = queryObjs;
+      return this;
+    }
+
+    public void unsetQueryObjs() {
+      this.queryObjs = null;
+    }
+
+    /** Returns true if field queryObjs is set (has been assigned a value) and false otherwise */
+    public boolean isSetQueryObjs() {
+      return this.queryObjs != null;
+    }
+
+    public void setQueryObjsIsSet(boolean value) {
+      if (!value) {
+        this.queryObjs = null;
+      }
+    }
+
+    public boolean isRetExternId() {
+      return this.retExternId;
+    }
+
+    public rangeQueryBatch_args setRetExternId(boolean retExternId) {
+      this.retExternId = retExternId;
+      setRetExternIdIsSet(true);
+      return this;
+    }
+
+    public void unsetRetExternId() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    }
+
+    /** Returns true if field retExternId is set (has been assigned a value) and false otherwise */
+    public boolean isSetRetExternId() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    }
+
+    public void setRetExternIdIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETEXTERNID_ISSET_ID, value);
+    }
+
+    public boolean isRetObj() {
+      return this.retObj;
+    }
+
+    public rangeQueryBatch_args setRetObj(boolean retObj) {
+      this.retObj = retObj;
+      setRetObjIsSet(true);
+      return this;
+    }
+
+    public void unsetRetObj() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    }
+
+    /** Returns true if field retObj is set (has been assigned a value) and false otherwise */
+    public boolean isSetRetObj() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    }
+
+    public void setRetObjIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETOBJ_ISSET_ID, value);
+    }
+
+    public boolean isBinaryQuery() {
+      return this.binaryQuery;
+    }
+
+    public rangeQueryBatch_args setBinaryQuery(boolean binaryQuery) {
+      this.binaryQuery = binaryQuery;
+      setBinaryQueryIsSet(true);
+      return this;
+    }
+
+    public void unsetBinaryQuery() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    /** Returns true if field binaryQuery is set (has been assigned a value) and false otherwise */
+    public boolean isSetBinaryQuery() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __BINARYQUERY_ISSET_ID);
+    }
+
+    public void setBinaryQueryIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __BINARYQUERY_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case R:
+        if (value == null) {
+          unsetR();
+        } else {
+          setR((java.lang.Double)value);
+        }
+        break;
+
+      case QUERY_OBJS:
+        if (value == null) {
+          unsetQueryObjs();
+        } else {
+          setQueryObjs((java.util.List<java.nio.ByteBuffer>)value);
+        }
+        break;
+
+      case RET_EXTERN_ID:
+        if (value == null) {
+          unsetRetExternId();
+        } else {
+          setRetExternId((java.lang.Boolean)value);
+        }
+        break;
+
+      case RET_OBJ:
+        if (value == null) {
+          unsetRetObj();
+        } else {
+          setRetObj((java.lang.Boolean)value);
+        }
+        break;
+
+      case BINARY_QUERY:
+        if (value == null) {
+          unsetBinaryQuery();
+        } else {
+          setBinaryQuery((java.lang.Boolean)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case R:
+        return getR();
+
+      case QUERY_OBJS:
+        return getQueryObjs();
+
+      case RET_EXTERN_ID:
+        return isRetExternId();
+
+      case RET_OBJ:
+        return isRetObj();
+
+      case BINARY_QUERY:
+        return isBinaryQuery();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case R:
+        return isSetR();
+      case QUERY_OBJS:
+        return isSetQueryObjs();
+      case RET_EXTERN_ID:
+        return isSetRetExternId();
+      case RET_OBJ:
+        return isSetRetObj();
+      case BINARY_QUERY:
+        return isSetBinaryQuery();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof rangeQueryBatch_args)
+        return this.equals((rangeQueryBatch_args)that);
+      return false;
+    }
+
+    public boolean equals(rangeQueryBatch_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_r = true;
+      boolean that_present_r = true;
+      if (this_present_r || that_present_r) {
+        if (!(this_present_r && that_present_r))
+          return false;
+        if (this.r != that.r)
+          return false;
+      }
+
+      boolean this_present_queryObjs = true && this.isSetQueryObjs();
+      boolean that_present_queryObjs = true && that.isSetQueryObjs();
+      if (this_present_queryObjs || that_present_queryObjs) {
+        if (!(this_present_queryObjs && that_present_queryObjs))
+          return false;
+        if (!this.queryObjs.equals(that.queryObjs))
+          return false;
+      }
+
+      boolean this_present_retExternId = true;
+      boolean that_present_retExternId = true;
+      if (this_present_retExternId || that_present_retExternId) {
+        if (!(this_present_retExternId && that_present_retExternId))
+          return false;
+        if (this.retExternId != that.retExternId)
+          return false;
+      }
+
+      boolean this_present_retObj = true;
+      boolean that_present_retObj = true;
+      if (this_present_retObj || that_present_retObj) {
+        if (!(this_present_retObj && that_present_retObj))
+          return false;
+        if (this.retObj != that.retObj)
+          return false;
+      }
+
+      boolean this_present_binaryQuery = true;
+      boolean that_present_binaryQuery = true;
+      if (this_present_binaryQuery || that_present_binaryQuery) {
+        if (!(this_present_binaryQuery && that_present_binaryQuery))
+          return false;
+        if (this.binaryQuery != that.binaryQuery)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(r);
+
+      hashCode = hashCode * 8191 + ((isSetQueryObjs()) ? 131071 : 524287);
+      if (isSetQueryObjs())
+        hashCode = hashCode * 8191 + queryObjs.hashCode();
+
+      hashCode = hashCode * 8191 + ((retExternId) ? 131071 : 524287);
+
+      hashCode = hashCode * 8191 + ((retObj) ? 131071 : 524287);
+
+      hashCode = hashCode * 8191 + ((binaryQuery) ? 131071 : 524287);
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(rangeQueryBatch_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetR()).compareTo(other.isSetR());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetR()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.r, other.r);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetQueryObjs()).compareTo(other.isSetQueryObjs());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetQueryObjs()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.queryObjs, other.queryObjs);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetRetExternId()).compareTo(other.isSetRetExternId());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRetExternId()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retExternId, other.retExternId);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetRetObj()).compareTo(other.isSetRetObj());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRetObj()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retObj, other.retObj);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetBinaryQuery()).compareTo(other.isSetBinaryQuery());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetBinaryQuery()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.binaryQuery, other.binaryQuery);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("rangeQueryBatch_args(");
+      boolean first = true;
+
+      sb.append("r:");
+      sb.append(this.r);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("queryObjs:");
+      if (this.queryObjs == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.queryObjs, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("retExternId:");
+      sb.append(this.retExternId);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("retObj:");
+      sb.append(this.retObj);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("binaryQuery:");
+      sb.append(this.binaryQuery);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // alas, we cannot check 'r' because it's a primitive and you chose the non-beans generator.
+      if (queryObjs == null) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'queryObjs' was not present! Struct: " + toString());
+      }
+      // alas, we cannot check 'retExternId' because it's a primitive and you chose the non-beans generator.
+      // alas, we cannot check 'retObj' because it's a primitive and you chose the non-beans generator.
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class rangeQueryBatch_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQueryBatch_argsStandardScheme getScheme() {
+        return new rangeQueryBatch_argsStandardScheme();
+      }
+    }
+
+    private static class rangeQueryBatch_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<rangeQueryBatch_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, rangeQueryBatch_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // R
+              if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+                struct.r = iprot.readDouble();
+                struct.setRIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // QUERY_OBJS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list48 = iprot.readListBegin();
+                  struct.queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>(_list48.size);
+                  java.nio.ByteBuffer _elem49;
+                  for (int _i50 = 0; _i50 < _list48.size; ++_i50)
+                  {
+                    _elem49 = iprot.readBinary();
+                    struct.queryObjs.add(_elem49);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setQueryObjsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // RET_EXTERN_ID
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.retExternId = iprot.readBool();
+                struct.setRetExternIdIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // RET_OBJ
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.retObj = iprot.readBool();
+                struct.setRetObjIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 5: // BINARY_QUERY
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.binaryQuery = iprot.readBool();
+                struct.setBinaryQueryIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        if (!struct.isSetR()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'r' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetExternId()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retExternId' was not found in serialized data! Struct: " + toString());
+        }
+        if (!struct.isSetRetObj()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retObj' was not found in serialized data! Struct: " + toString());
+        }
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, rangeQueryBatch_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldBegin(R_FIELD_DESC);
+        oprot.writeDouble(struct.r);
+        oprot.writeFieldEnd();
+        if (struct.queryObjs != null) {
+          oprot.writeFieldBegin(QUERY_OBJS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, struct.queryObjs.size()));
+            for (java.nio.ByteBuffer _iter51 : struct.queryObjs)
+            {
+              oprot.writeBinary(_iter51);
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(RET_EXTERN_ID_FIELD_DESC);
+        oprot.writeBool(struct.retExternId);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(RET_OBJ_FIELD_DESC);
+        oprot.writeBool(struct.retObj);
+        oprot.writeFieldEnd();
+        oprot.writeFieldBegin(BINARY_QUERY_FIELD_DESC);
+        oprot.writeBool(struct.binaryQuery);
+        oprot.writeFieldEnd();
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class rangeQueryBatch_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQueryBatch_argsTupleScheme getScheme() {
+        return new rangeQueryBatch_argsTupleScheme();
+      }
+    }
+
+    private static class rangeQueryBatch_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<rangeQueryBatch_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, rangeQueryBatch_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        oprot.writeDouble(struct.r);
+        {
+          oprot.writeI32(struct.queryObjs.size());
+          for (java.nio.ByteBuffer _iter52 : struct.queryObjs)
+          {
+            oprot.writeBinary(_iter52);
+          }
+        }
+        oprot.writeBool(struct.retExternId);
+        oprot.writeBool(struct.retObj);
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetBinaryQuery()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetBinaryQuery()) {
+          oprot.writeBool(struct.binaryQuery);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, rangeQueryBatch_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        struct.r = iprot.readDouble();
+        struct.setRIsSet(true);
+        {
+          org.apache.thrift.protocol.TList _list53 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRING, iprot.readI32());
+          struct.queryObjs = new java.util.ArrayList<java.nio.ByteBuffer>(_list53.size);
+          java.nio.ByteBuffer _elem54;
+          for (int _i55 = 0; _i55 < _list53.size; ++_i55)
+          {
+            _elem54 = iprot.readBinary();
+            struct.queryObjs.add(_elem54);
+          }
+        }
+        struct.setQueryObjsIsSet(true);
+        struct.retExternId = iprot.readBool();
+        struct.setRetExternIdIsSet(true);
+        struct.retObj = iprot.readBool();
+        struct.setRetObjIsSet(true);
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.binaryQuery = iprot.readBool();
+          struct.setBinaryQueryIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class rangeQueryBatch_result implements org.apache.thrift.TBase<rangeQueryBatch_result, rangeQueryBatch_result._Fields>, java.io.Serializable, Cloneable, Comparable<rangeQueryBatch_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("rangeQueryBatch_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
+    private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new rangeQueryBatch_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new rangeQueryBatch_resultTupleSchemeFactory();
+
+    public java.util.List<java.util.List<ReplyEntry>> success; // required
+    public QueryException err; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // ERR
+            return ERR;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.LIST          , "ReplyEntryListList")));
+      tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(rangeQueryBatch_result.class, metaDataMap);
+    }
+
+    public rangeQueryBatch_result() {
+    }
+
+    public rangeQueryBatch_result(
+      java.util.List<java.util.List<ReplyEntry>> success,
+      QueryException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public rangeQueryBatch_result(rangeQueryBatch_result other) {
+      if (other.isSetSuccess()) {
+        java.util.List<java.util.List<ReplyEntry>> __this__success = new java.util.ArrayList<java.util.List<ReplyEntry>>(other.success.size());
+        for (java.util.List<ReplyEntry> other_element : other.success) {
+          __this__success.add(other_element);
+        }
+        this.success = __this__success;
+      }
+      if (other.isSetErr()) {
+        this.err = new QueryException(other.err);
+      }
+    }
+
+    public rangeQueryBatch_result deepCopy() {
+      return new rangeQueryBatch_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.err = null;
+    }
+
+    public int getSuccessSize() {
+      return (this.success == null) ? 0 : this.success.size();
+    }
+
+    public java.util.Iterator<java.util.List<ReplyEntry>> getSuccessIterator() {
+      return (this.success == null) ? null : this.success.iterator();
+    }
+
+    public void addToSuccess(java.util.List<ReplyEntry> elem) {
+      if (this.success == null) {
+        this.success = new java.util.ArrayList<java.util.List<ReplyEntry>>();
+      }
+      this.success.add(elem);
+    }
+
+    public java.util.List<java.util.List<ReplyEntry>> getSuccess() {
+      return this.success;
+    }
+
+    public rangeQueryBatch_result setSuccess(java.util.List<java.util.List<ReplyEntry>> success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public QueryException getErr() {
+      return this.err;
+    }
+
+    public rangeQueryBatch_result setErr(QueryException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been assigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.util.List<java.util.List<ReplyEntry>>)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((QueryException)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof rangeQueryBatch_result)
+        return this.equals((rangeQueryBatch_result)that);
+      return false;
+    }
+
+    public boolean equals(rangeQueryBatch_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetErr()) ? 131071 : 524287);
+      if (isSetErr())
+        hashCode = hashCode * 8191 + err.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(rangeQueryBatch_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetErr()).compareTo(other.isSetErr());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetErr()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.err, other.err);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("rangeQueryBatch_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class rangeQueryBatch_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQueryBatch_resultStandardScheme getScheme() {
+        return new rangeQueryBatch_resultStandardScheme();
+      }
+    }
+
+    private static class rangeQueryBatch_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<rangeQueryBatch_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, rangeQueryBatch_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+                {
+                  org.apache.thrift.protocol.TList _list56 = iprot.readListBegin();
+                  struct.success = new java.util.ArrayList<java.util.List<ReplyEntry>>(_list56.size);
+                  java.util.List<ReplyEntry> _elem57;
+                  for (int _i58 = 0; _i58 < _list56.size; ++_i58)
+                  {
+                    {
+                      org.apache.thrift.protocol.TList _list59 = iprot.readListBegin();
+                      _elem57 = new java.util.ArrayList<ReplyEntry>(_list59.size);
+                      ReplyEntry _elem60;
+                      for (int _i61 = 0; _i61 < _list59.size; ++_i61)
+                      {
+                        _elem60 = new ReplyEntry();
+                        _elem60.read(iprot);
+                        _elem57.add(_elem60);
+                      }
+                      iprot.readListEnd();
+                    }
+                    struct.success.add(_elem57);
+                  }
+                  iprot.readListEnd();
+                }
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // ERR
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.err = new QueryException();
+                struct.err.read(iprot);
+                struct.setErrIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, rangeQueryBatch_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          {
+            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, struct.success.size()));
+            for (java.util.List<ReplyEntry> _iter62 : struct.success)
+            {
+              {
+                oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, _iter62.size()));
+                for (ReplyEntry _iter63 : _iter62)
+                {
+                  _iter63.write(oprot);
+                }
+                oprot.writeListEnd();
+              }
+            }
+            oprot.writeListEnd();
+          }
+          oprot.writeFieldEnd();
+        }
+        if (struct.err != null) {
+          oprot.writeFieldBegin(ERR_FIELD_DESC);
+          struct.err.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class rangeQueryBatch_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public rangeQueryBatch_resultTupleScheme getScheme() {
+        return new rangeQueryBatch_resultTupleScheme();
+      }
+    }
+
+    private static class rangeQueryBatch_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<rangeQueryBatch_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, rangeQueryBatch_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetErr()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          {
+            oprot.writeI32(struct.success.size());
+            for (java.util.List<ReplyEntry> _iter64 : struct.success)
+            {
+              {
+                oprot.writeI32(_iter64.size());
+                for (ReplyEntry _iter65 : _iter64)
+                {
+                  _iter65.write(oprot);
+                }
+              }
+            }
+          }
+        }
+        if (struct.isSetErr()) {
+          struct.err.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, rangeQueryBatch_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          {
+            org.apache.thrift.protocol.TList _list66 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.LIST, iprot.readI32());
+            struct.success = new java.util.ArrayList<java.util.List<ReplyEntry>>(_list66.size);
+            java.util.List<ReplyEntry> _elem67;
+            for (int _i68 = 0; _i68 < _list66.size; ++_i68)
+            {
+              {
+                org.apache.thrift.protocol.TList _list69 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, iprot.readI32());
+                _elem67 = new java.util.ArrayList<ReplyEntry>(_list69.size);
+                ReplyEntry _elem70;
+                for (int _i71 = 0; _i71 < _list69.size; ++_i71)
+                {
+                  _elem70 = new ReplyEntry();
+                  _elem70.read(iprot);
+                  _elem67.add(_elem70);
+                }
+              }
+              struct.success.add(_elem67);
+            }
+          }
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.err = new QueryException();
+          struct.err.read(iprot);
+          struct.setErrIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class getDistance_args implements org.apache.thrift.TBase<getDistance_args, getDistance_args._Fields>, java.io.Serializable, Cloneable, Comparable<getDistance_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getDistance_args");
+
+    private static final org.apache.thrift.protocol.TField OBJ1_FIELD_DESC = new org.apache.thrift.protocol.TField("obj1", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField OBJ2_FIELD_DESC = new org.apache.thrift.protocol.TField("obj2", org.apache.thrift.protocol.TType.STRING, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getDistance_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getDistance_argsTupleSchemeFactory();
+
+    public java.nio.ByteBuffer obj1; // required
+    public java.nio.ByteBuffer obj2; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      OBJ1((short)1, "obj1"),
+      OBJ2((short)2, "obj2");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // OBJ1
+            return OBJ1;
+          case 2: // OBJ2
+            return OBJ2;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.OBJ1, new org.apache.thrift.meta_data.FieldMetaData("obj1", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      tmpMap.put(_Fields.OBJ2, new org.apache.thrift.meta_data.FieldMetaData("obj2", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getDistance_args.class, metaDataMap);
+    }
+
+    public getDistance_args() {
+    }
+
+    public getDistance_args(
+      java.nio.ByteBuffer obj1,
+      java.nio.ByteBuffer obj2)
+    {
+      this();
+      this.obj1 = org.apache.thrift.TBaseHelper.copyBinary(obj1);
+      this.obj2 = org.apache.thrift.TBaseHelper.copyBinary(obj2);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getDistance_args(getDistance_args other) {
+      if (other.isSetObj1()) {
+        this.obj1 = org.apache.thrift.TBaseHelper.copyBinary(other.obj1);
+      }
+      if (other.isSetObj2()) {
+        this.obj2 = org.apache.thrift.TBaseHelper.copyBinary(other.obj2);
+      }
+    }
+
+    public getDistance_args deepCopy() {
+      return new getDistance_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.obj1 = null;
+      this.obj2 = null;
+    }
+
+    public byte[] getObj1() {
+      setObj1(org.apache.thrift.TBaseHelper.rightSize(obj1));
+      return obj1 == null ? null : obj1.array();
+    }
+
+    public java.nio.ByteBuffer bufferForObj1() {
+      return org.apache.thrift.TBaseHelper.copyBinary(obj1);
+    }
+
+    public getDistance_args setObj1(byte[] obj1) {
+      this.obj1 = obj1 == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(obj1.clone());
+      return this;
+    }
+
+    public getDistance_args setObj1(java.nio.ByteBuffer obj1) {
+      this.obj1 = org.apache.thrift.TBaseHelper.copyBinary(obj1);
+      return this;
+    }
+
+    public void unsetObj1() {
+      this.obj1 = null;
+    }
+
+    /** Returns true if field obj1 is set (has been assigned a value) and false otherwise */
+    public boolean isSetObj1() {
+      return this.obj1 != null;
+    }
+
+    public void setObj1IsSet(boolean value) {
+      if (!value) {
+        this.obj1 = null;
+      }
+    }
+
+    public byte[] getObj2() {
+      setObj2(org.apache.thrift.TBaseHelper.rightSize(obj2));
+      return obj2 == null ? null : obj2.array();
+    }
+
+    public java.nio.ByteBuffer bufferForObj2() {
+      return org.apache.thrift.TBaseHelper.copyBinary(obj2);
+    }
+
+    public getDistance_args setObj2(byte[] obj2) {
+      this.obj2 = obj2 == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(obj2.clone());
+      return this;
+    }
+
+    public getDistance_args setObj2(java.nio.ByteBuffer obj2) {
+      this.obj2 = org.apache.thrift.TBaseHelper.copyBinary(obj2);
+      return this;
+    }
+
+    public void unsetObj2() {
+      this.obj2 = null;
+    }
+
+    /** Returns true if field obj2 is set (has been assigned a value) and false otherwise */
+    public boolean isSetObj2() {
+      return this.obj2 != null;
+    }
+
+    public void setObj2IsSet(boolean value) {
+      if (!value) {
+        this.obj2 = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case OBJ1:
+        if (value == null) {
+          unsetObj1();
+        } else {
+          if (value instanceof byte[]) {
+            setObj1((byte[])value);
+          } else {
+            setObj1((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case OBJ2:
+        if (value == null) {
+          unsetObj2();
+        } else {
+          if (value instanceof byte[]) {
+            setObj2((byte[])value);
+          } else {
+            setObj2((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case OBJ1:
+        return getObj1();
+
+      case OBJ2:
+        return getObj2();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case OBJ1:
+        return isSetObj1();
+      case OBJ2:
+        return isSetObj2();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getDistance_args)
+        return this.equals((getDistance_args)that);
+      return false;
+    }
+
+    public boolean equals(getDistance_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_obj1 = true && this.isSetObj1();
+      boolean that_present_obj1 = true && that.isSetObj1();
+      if (this_present_obj1 || that_present_obj1) {
+        if (!(this_present_obj1 && that_present_obj1))
+          return false;
+        if (!this.obj1.equals(that.obj1))
+          return false;
+      }
+
+      boolean this_present_obj2 = true && this.isSetObj2();
+      boolean that_present_obj2 = true && that.isSetObj2();
+      if (this_present_obj2 || that_present_obj2) {
+        if (!(this_present_obj2 && that_present_obj2))
+          return false;
+        if (!this.obj2.equals(that.obj2))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetObj1()) ? 131071 : 524287);
+      if (isSetObj1())
+        hashCode = hashCode * 8191 + obj1.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetObj2()) ? 131071 : 524287);
+      if (isSetObj2())
+        hashCode = hashCode * 8191 + obj2.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(getDistance_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetObj1()).compareTo(other.isSetObj1());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetObj1()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.obj1, other.obj1);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetObj2()).compareTo(other.isSetObj2());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetObj2()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.obj2, other.obj2);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("getDistance_args(");
+      boolean first = true;
+
+      sb.append("obj1:");
+      if (this.obj1 == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.obj1, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("obj2:");
+      if (this.obj2 == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.obj2, sb);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      if (obj1 == null) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'obj1' was not present! Struct: " + toString());
+      }
+      if (obj2 == null) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'obj2' was not present! Struct: " + toString());
+      }
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class getDistance_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getDistance_argsStandardScheme getScheme() {
+        return new getDistance_argsStandardScheme();
+      }
+    }
+
+    private static class getDistance_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<getDistance_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, getDistance_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // OBJ1
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.obj1 = iprot.readBinary();
+                struct.setObj1IsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // OBJ2
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.obj2 = iprot.readBinary();
+                struct.setObj2IsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, getDistance_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.obj1 != null) {
+          oprot.writeFieldBegin(OBJ1_FIELD_DESC);
+          oprot.writeBinary(struct.obj1);
+          oprot.writeFieldEnd();
+        }
+        if (struct.obj2 != null) {
+          oprot.writeFieldBegin(OBJ2_FIELD_DESC);
+          oprot.writeBinary(struct.obj2);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class getDistance_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getDistance_argsTupleScheme getScheme() {
+        return new getDistance_argsTupleScheme();
+      }
+    }
+
+    private static class getDistance_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<getDistance_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, getDistance_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        oprot.writeBinary(struct.obj1);
+        oprot.writeBinary(struct.obj2);
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, getDistance_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        struct.obj1 = iprot.readBinary();
+        struct.setObj1IsSet(true);
+        struct.obj2 = iprot.readBinary();
+        struct.setObj2IsSet(true);
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class getDistance_result implements org.apache.thrift.TBase<getDistance_result, getDistance_result._Fields>, java.io.Serializable, Cloneable, Comparable<getDistance_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getDistance_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.DOUBLE, (short)0);
+    private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getDistance_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getDistance_resultTupleSchemeFactory();
+
+    public double success; // required
+    public QueryException err; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // ERR
+            return ERR;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __SUCCESS_ISSET_ID = 0;
+    private byte __isset_bitfield = 0;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+      tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getDistance_result.class, metaDataMap);
+    }
+
+    public getDistance_result() {
+    }
+
+    public getDistance_result(
+      double success,
+      QueryException err)
+    {
+      this();
+      this.success = success;
+      setSuccessIsSet(true);
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getDistance_result(getDistance_result other) {
+      __isset_bitfield = other.__isset_bitfield;
+      this.success = other.success;
+      if (other.isSetErr()) {
+        this.err = new QueryException(other.err);
+      }
+    }
+
+    public getDistance_result deepCopy() {
+      return new getDistance_result(this);
+    }
+
+    @Override
+    public void clear() {
+      setSuccessIsSet(false);
+      this.success = 0.0;
+      this.err = null;
+    }
+
+    public double getSuccess() {
+      return this.success;
+    }
+
+    public getDistance_result setSuccess(double success) {
+      this.success = success;
+      setSuccessIsSet(true);
+      return this;
+    }
+
+    public void unsetSuccess() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __SUCCESS_ISSET_ID, value);
+    }
+
+    public QueryException getErr() {
+      return this.err;
+    }
+
+    public getDistance_result setErr(QueryException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been assigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.lang.Double)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((QueryException)value);
+        }
+        break;
+
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getDistance_result)
+        return this.equals((getDistance_result)that);
+      return false;
+    }
+
+    public boolean equals(getDistance_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true;
+      boolean that_present_success = true;
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (this.success != that.success)
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(success);
+
+      hashCode = hashCode * 8191 + ((isSetErr()) ? 131071 : 524287);
+      if (isSetErr())
+        hashCode = hashCode * 8191 + err.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(getDistance_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.valueOf(isSetErr()).compareTo(other.isSetErr());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetErr()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.err, other.err);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("getDistance_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      sb.append(this.success);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class getDistance_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getDistance_resultStandardScheme getScheme() {
+        return new getDistance_resultStandardScheme();
+      }
+    }
+
+    private static class getDistance_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<getDistance_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, getDistance_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+                struct.success = iprot.readDouble();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // ERR
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.err = new QueryException();
+                struct.err.read(iprot);
+                struct.setErrIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, getDistance_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.isSetSuccess()) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeDouble(struct.success);
+          oprot.writeFieldEnd();
+        }
+        if (struct.err != null) {
+          oprot.writeFieldBegin(ERR_FIELD_DESC);
+          struct.err.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class getDistance_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getDistance_resultTupleScheme getScheme() {
+        return new getDistance_resultTupleScheme();
+      }
+    }
+
+    private static class getDistance_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<getDistance_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, getDistance_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetErr()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetSuccess()) {
+          oprot.writeDouble(struct.success);
+        }
+        if (struct.isSetErr()) {
+          struct.err.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, getDistance_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          struct.success = iprot.readDouble();
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.err = new QueryException();
+          struct.err.read(iprot);
+          struct.setErrIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class getCacheStats_args implements org.apache.thrift.TBase<getCacheStats_args, getCacheStats_args._Fields>, java.io.Serializable, Cloneable, Comparable<getCacheStats_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getCacheStats_args");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getCacheStats_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getCacheStats_argsTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getCacheStats_args.class, metaDataMap);
+    }
+
+    public getCacheStats_args() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getCacheStats_args(getCacheStats_args other) {
+    }
+
+    public getCacheStats_args deepCopy() {
+      return new getCacheStats_args(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getCacheStats_args)
+        return this.equals((getCacheStats_args)that);
+      return false;
+    }
+
+    public boolean equals(getCacheStats_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(getCacheStats_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("getCacheStats_args(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class getCacheStats_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getCacheStats_argsStandardScheme getScheme() {
+        return new getCacheStats_argsStandardScheme();
+      }
+    }
+
+    private static class getCacheStats_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<getCacheStats_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, getCacheStats_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -2047,70 +8677,35 @@ public class QueryService {
         iprot.readStructEnd();
 
         // check for required fields of primitive type, which can't be checked in the validate method
-        if (!struct.isSetK()) {
-          throw new org.apache.thrift.protocol.TProtocolException("Required field 'k' was not found in serialized data! Struct: " + toString());
-        }
-        if (!struct.isSetRetExternId()) {
-          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retExternId' was not found in serialized data! Struct: " + toString());
-        }
-        if (!struct.isSetRetObj()) {
-          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retObj' was not found in serialized data! Struct: " + toString());
-        }
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, knnQuery_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, getCacheStats_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        oprot.writeFieldBegin(K_FIELD_DESC);
-        oprot.writeI32(struct.k);
-        oprot.writeFieldEnd();
-        if (struct.queryObj != null) {
-          oprot.writeFieldBegin(QUERY_OBJ_FIELD_DESC);
-          oprot.writeBinary(struct.queryObj);
-          oprot.writeFieldEnd();
-        }
-        oprot.writeFieldBegin(RET_EXTERN_ID_FIELD_DESC);
-        oprot.writeBool(struct.retExternId);
-        oprot.writeFieldEnd();
-        oprot.writeFieldBegin(RET_OBJ_FIELD_DESC);
-        oprot.writeBool(struct.retObj);
-        oprot.writeFieldEnd();
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class knnQuery_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public knnQuery_argsTupleScheme getScheme() {
-        return new knnQuery_argsTupleScheme();
+    private static class getCacheStats_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getCacheStats_argsTupleScheme getScheme() {
+        return new getCacheStats_argsTupleScheme();
       }
     }
 
-    private static class knnQuery_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<knnQuery_args> {
+    private static class getCacheStats_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<getCacheStats_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, knnQuery_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, getCacheStats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        oprot.writeI32(struct.k);
-        oprot.writeBinary(struct.queryObj);
-        oprot.writeBool(struct.retExternId);
-        oprot.writeBool(struct.retObj);
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, knnQuery_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, getCacheStats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        struct.k = iprot.readI32();
-        struct.setKIsSet(true);
-        struct.queryObj = iprot.readBinary();
-        struct.setQueryObjIsSet(true);
-        struct.retExternId = iprot.readBool();
-        struct.setRetExternIdIsSet(true);
-        struct.retObj = iprot.readBool();
-        struct.setRetObjIsSet(true);
       }
     }
 
@@ -2119,16 +8714,16 @@ public class QueryService {
     }
   }
 
-  public static class knnQuery_result implements org.apache.thrift.TBase<knnQuery_result, knnQuery_result._Fields>, java.io.Serializable, Cloneable, Comparable<knnQuery_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("knnQuery_result");
+  public static class getCacheStats_result implements org.apache.thrift.TBase<getCacheStats_result, getCacheStats_result._Fields>, java.io.Serializable, Cloneable, Comparable<getCacheStats_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getCacheStats_result");
 
-    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRUCT, (short)0);
     private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new knnQuery_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new knnQuery_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getCacheStats_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getCacheStats_resultTupleSchemeFactory();
 
-    public java.util.List<ReplyEntry> success; // required
+    public CacheStats success; // required
     public QueryException err; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
@@ -2197,18 +8792,18 @@ public class QueryService {
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
       tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.LIST          , "ReplyEntryList")));
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, CacheStats.class)));
       tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
           new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(knnQuery_result.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getCacheStats_result.class, metaDataMap);
     }
 
-    public knnQuery_result() {
+    public getCacheStats_result() {
     }
 
-    public knnQuery_result(
-      java.util.List<ReplyEntry> success,
+    public getCacheStats_result(
+      CacheStats success,
       QueryException err)
     {
       this();
@@ -2219,21 +8814,17 @@ public class QueryService {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public knnQuery_result(knnQuery_result other) {
+    public getCacheStats_result(getCacheStats_result other) {
       if (other.isSetSuccess()) {
-        java.util.List<ReplyEntry> __this__success = new java.util.ArrayList<ReplyEntry>(other.success.size());
-        for (ReplyEntry other_element : other.success) {
-          __this__success.add(new ReplyEntry(other_element));
-        }
-        this.success = __this__success;
+        this.success = new CacheStats(other.success);
       }
       if (other.isSetErr()) {
         this.err = new QueryException(other.err);
       }
     }
 
-    public knnQuery_result deepCopy() {
-      return new knnQuery_result(this);
+    public getCacheStats_result deepCopy() {
+      return new getCacheStats_result(this);
     }
 
     @Override
@@ -2242,26 +8833,11 @@ public class QueryService {
       this.err = null;
     }
 
-    public int getSuccessSize() {
-      return (this.success == null) ? 0 : this.success.size();
-    }
-
-    public java.util.Iterator<ReplyEntry> getSuccessIterator() {
-      return (this.success == null) ? null : this.success.iterator();
-    }
-
-    public void addToSuccess(ReplyEntry elem) {
-      if (this.success == null) {
-        this.success = new java.util.ArrayList<ReplyEntry>();
-      }
-      this.success.add(elem);
-    }
-
-    public java.util.List<ReplyEntry> getSuccess() {
+    public CacheStats getSuccess() {
       return this.success;
     }
 
-    public knnQuery_result setSuccess(java.util.List<ReplyEntry> success) {
+    public getCacheStats_result setSuccess(CacheStats success) {
       this.success = success;
       return this;
     }
@@ -2285,7 +8861,7 @@ public class QueryService {
       return this.err;
     }
 
-    public knnQuery_result setErr(QueryException err) {
+    public getCacheStats_result setErr(QueryException err) {
       this.err = err;
       return this;
     }
@@ -2311,7 +8887,7 @@ public class QueryService {
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((java.util.List<ReplyEntry>)value);
+          setSuccess((CacheStats)value);
         }
         break;
 
@@ -2357,12 +8933,12 @@ public class QueryService {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof knnQuery_result)
-        return this.equals((knnQuery_result)that);
+      if (that instanceof getCacheStats_result)
+        return this.equals((getCacheStats_result)that);
       return false;
     }
 
-    public boolean equals(knnQuery_result that) {
+    public boolean equals(getCacheStats_result that) {
       if (that == null)
         return false;
       if (this == that)
@@ -2405,7 +8981,7 @@ public class QueryService {
     }
 
     @Override
-    public int compareTo(knnQuery_result other) {
+    public int compareTo(getCacheStats_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
@@ -2449,7 +9025,7 @@ public class QueryService {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("knnQuery_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("getCacheStats_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -2474,6 +9050,9 @@ public class QueryService {
     public void validate() throws org.apache.thrift.TException {
       // check for required fields
       // check for sub-struct validity
+      if (success != null) {
+        success.validate();
+      }
     }
 
     private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
@@ -2492,15 +9071,15 @@ public class QueryService {
       }
     }
 
-    private static class knnQuery_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public knnQuery_resultStandardScheme getScheme() {
-        return new knnQuery_resultStandardScheme();
+    private static class getCacheStats_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getCacheStats_resultStandardScheme getScheme() {
+        return new getCacheStats_resultStandardScheme();
       }
     }
 
-    private static class knnQuery_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<knnQuery_result> {
+    private static class getCacheStats_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<getCacheStats_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, knnQuery_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, getCacheStats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -2511,19 +9090,9 @@ public class QueryService {
           }
           switch (schemeField.id) {
             case 0: // SUCCESS
-              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
-                {
-                  org.apache.thrift.protocol.TList _list0 = iprot.readListBegin();
-                  struct.success = new java.util.ArrayList<ReplyEntry>(_list0.size);
-                  ReplyEntry _elem1;
-                  for (int _i2 = 0; _i2 < _list0.size; ++_i2)
-                  {
-                    _elem1 = new ReplyEntry();
-                    _elem1.read(iprot);
-                    struct.success.add(_elem1);
-                  }
-                  iprot.readListEnd();
-                }
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.success = new CacheStats();
+                struct.success.read(iprot);
                 struct.setSuccessIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
@@ -2549,20 +9118,13 @@ public class QueryService {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, knnQuery_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, getCacheStats_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
         if (struct.success != null) {
           oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-          {
-            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, struct.success.size()));
-            for (ReplyEntry _iter3 : struct.success)
-            {
-              _iter3.write(oprot);
-            }
-            oprot.writeListEnd();
-          }
+          struct.success.write(oprot);
           oprot.writeFieldEnd();
         }
         if (struct.err != null) {
@@ -2576,16 +9138,16 @@ public class QueryService {
 
     }
 
-    private static class knnQuery_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public knnQuery_resultTupleScheme getScheme() {
-        return new knnQuery_resultTupleScheme();
+    private static class getCacheStats_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getCacheStats_resultTupleScheme getScheme() {
+        return new getCacheStats_resultTupleScheme();
       }
     }
 
-    private static class knnQuery_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<knnQuery_result> {
+    private static class getCacheStats_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<getCacheStats_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, knnQuery_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, getCacheStats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet optionals = new java.util.BitSet();
         if (struct.isSetSuccess()) {
@@ -2596,13 +9158,7 @@ public class QueryService {
         }
         oprot.writeBitSet(optionals, 2);
         if (struct.isSetSuccess()) {
-          {
-            oprot.writeI32(struct.success.size());
-            for (ReplyEntry _iter4 : struct.success)
-            {
-              _iter4.write(oprot);
-            }
-          }
+          struct.success.write(oprot);
         }
         if (struct.isSetErr()) {
           struct.err.write(oprot);
@@ -2610,21 +9166,12 @@ public class QueryService {
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, knnQuery_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, getCacheStats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet incoming = iprot.readBitSet(2);
         if (incoming.get(0)) {
-          {
-            org.apache.thrift.protocol.TList _list5 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, iprot.readI32());
-            struct.success = new java.util.ArrayList<ReplyEntry>(_list5.size);
-            ReplyEntry _elem6;
-            for (int _i7 = 0; _i7 < _list5.size; ++_i7)
-            {
-              _elem6 = new ReplyEntry();
-              _elem6.read(iprot);
-              struct.success.add(_elem6);
-            }
-          }
+          struct.success = new CacheStats();
+          struct.success.read(iprot);
           struct.setSuccessIsSet(true);
         }
         if (incoming.get(1)) {
@@ -2640,28 +9187,25 @@ public class QueryService {
     }
   }
 
-  public static class rangeQuery_args implements org.apache.thrift.TBase<rangeQuery_args, rangeQuery_args._Fields>, java.io.Serializable, Cloneable, Comparable<rangeQuery_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("rangeQuery_args");
+  public static class reloadIndex_args implements org.apache.thrift.TBase<reloadIndex_args, reloadIndex_args._Fields>, java.io.Serializable, Cloneable, Comparable<reloadIndex_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reloadIndex_args");
 
-    private static final org.apache.thrift.protocol.TField R_FIELD_DESC = new org.apache.thrift.protocol.TField("r", org.apache.thrift.protocol.TType.DOUBLE, (short)1);
-    private static final org.apache.thrift.protocol.TField QUERY_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("queryObj", org.apache.thrift.protocol.TType.STRING, (short)2);
-    private static final org.apache.thrift.protocol.TField RET_EXTERN_ID_FIELD_DESC = new org.apache.thrift.protocol.TField("retExternId", org.apache.thrift.protocol.TType.BOOL, (short)3);
-    private static final org.apache.thrift.protocol.TField RET_OBJ_FIELD_DESC = new org.apache.thrift.protocol.TField("retObj", org.apache.thrift.protocol.TType.BOOL, (short)4);
+    private static final org.apache.thrift.protocol.TField DATA_FILE_FIELD_DESC = new org.apache.thrift.protocol.TField("dataFile", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField LOAD_INDEX_LOC_FIELD_DESC = new org.apache.thrift.protocol.TField("loadIndexLoc", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField CACHE_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("cacheData", org.apache.thrift.protocol.TType.BOOL, (short)3);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new rangeQuery_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new rangeQuery_argsTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reloadIndex_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reloadIndex_argsTupleSchemeFactory();
 
-    public double r; // required
-    public java.nio.ByteBuffer queryObj; // required
-    public boolean retExternId; // required
-    public boolean retObj; // required
+    public java.lang.String dataFile; // required
+    public java.lang.String loadIndexLoc; // required
+    public boolean cacheData; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      R((short)1, "r"),
-      QUERY_OBJ((short)2, "queryObj"),
-      RET_EXTERN_ID((short)3, "retExternId"),
-      RET_OBJ((short)4, "retObj");
+      DATA_FILE((short)1, "dataFile"),
+      LOAD_INDEX_LOC((short)2, "loadIndexLoc"),
+      CACHE_DATA((short)3, "cacheData");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -2676,14 +9220,12 @@ public class QueryService {
        */
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
-          case 1: // R
-            return R;
-          case 2: // QUERY_OBJ
-            return QUERY_OBJ;
-          case 3: // RET_EXTERN_ID
-            return RET_EXTERN_ID;
-          case 4: // RET_OBJ
-            return RET_OBJ;
+          case 1: // DATA_FILE
+            return DATA_FILE;
+          case 2: // LOAD_INDEX_LOC
+            return LOAD_INDEX_LOC;
+          case 3: // CACHE_DATA
+            return CACHE_DATA;
           default:
             return null;
         }
@@ -2724,210 +9266,156 @@ public class QueryService {
     }
 
     // isset id assignments
-    private static final int __R_ISSET_ID = 0;
-    private static final int __RETEXTERNID_ISSET_ID = 1;
-    private static final int __RETOBJ_ISSET_ID = 2;
+    private static final int __CACHEDATA_ISSET_ID = 0;
     private byte __isset_bitfield = 0;
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      tmpMap.put(_Fields.R, new org.apache.thrift.meta_data.FieldMetaData("r", org.apache.thrift.TFieldRequirementType.REQUIRED, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
-      tmpMap.put(_Fields.QUERY_OBJ, new org.apache.thrift.meta_data.FieldMetaData("queryObj", org.apache.thrift.TFieldRequirementType.REQUIRED, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
-      tmpMap.put(_Fields.RET_EXTERN_ID, new org.apache.thrift.meta_data.FieldMetaData("retExternId", org.apache.thrift.TFieldRequirementType.REQUIRED, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
-      tmpMap.put(_Fields.RET_OBJ, new org.apache.thrift.meta_data.FieldMetaData("retObj", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+      tmpMap.put(_Fields.DATA_FILE, new org.apache.thrift.meta_data.FieldMetaData("dataFile", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.LOAD_INDEX_LOC, new org.apache.thrift.meta_data.FieldMetaData("loadIndexLoc", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.CACHE_DATA, new org.apache.thrift.meta_data.FieldMetaData("cacheData", org.apache.thrift.TFieldRequirementType.REQUIRED, 
           new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(rangeQuery_args.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reloadIndex_args.class, metaDataMap);
     }
 
-    public rangeQuery_args() {
+    public reloadIndex_args() {
     }
 
-    public rangeQuery_args(
-      double r,
-      java.nio.ByteBuffer queryObj,
-      boolean retExternId,
-      boolean retObj)
+    public reloadIndex_args(
+      java.lang.String dataFile,
+      java.lang.String loadIndexLoc,
+      boolean cacheData)
     {
       this();
-      this.r = r;
-      setRIsSet(true);
-      this.queryObj = org.apache.thrift.TBaseHelper.copyBinary(queryObj);
-      this.retExternId = retExternId;
-      setRetExternIdIsSet(true);
-      this.retObj = retObj;
-      setRetObjIsSet(true);
+      this.dataFile = dataFile;
+      this.loadIndexLoc = loadIndexLoc;
+      this.cacheData = cacheData;
+      setCacheDataIsSet(true);
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public rangeQuery_args(rangeQuery_args other) {
+    public reloadIndex_args(reloadIndex_args other) {
       __isset_bitfield = other.__isset_bitfield;
-      this.r = other.r;
-      if (other.isSetQueryObj()) {
-        this.queryObj = org.apache.thrift.TBaseHelper.copyBinary(other.queryObj);
+      if (other.isSetDataFile()) {
+        this.dataFile = other.dataFile;
       }
-      this.retExternId = other.retExternId;
-      this.retObj = other.retObj;
+      if (other.isSetLoadIndexLoc()) {
+        this.loadIndexLoc = other.loadIndexLoc;
+      }
+      this.cacheData = other.cacheData;
     }
 
-    public rangeQuery_args deepCopy() {
-      return new rangeQuery_args(this);
+    public reloadIndex_args deepCopy() {
+      return new reloadIndex_args(this);
     }
 
     @Override
     public void clear() {
-      setRIsSet(false);
-      this.r = 0.0;
-      this.queryObj = null;
-      setRetExternIdIsSet(false);
-      this.retExternId = false;
-      setRetObjIsSet(false);
-      this.retObj = false;
-    }
-
-    public double getR() {
-      return this.r;
-    }
-
-    public rangeQuery_args setR(double r) {
-      this.r = r;
-      setRIsSet(true);
-      return this;
-    }
-
-    public void unsetR() {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __R_ISSET_ID);
-    }
-
-    /** Returns true if field r is set (has been assigned a value) and false otherwise */
-    public boolean isSetR() {
-      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __R_ISSET_ID);
-    }
-
-    public void setRIsSet(boolean value) {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __R_ISSET_ID, value);
-    }
-
-    public byte[] getQueryObj() {
-      setQueryObj(org.apache.thrift.TBaseHelper.rightSize(queryObj));
-      return queryObj == null ? null : queryObj.array();
-    }
-
-    public java.nio.ByteBuffer bufferForQueryObj() {
-      return org.apache.thrift.TBaseHelper.copyBinary(queryObj);
+      this.dataFile = null;
+      this.loadIndexLoc = null;
+      setCacheDataIsSet(false);
+      this.cacheData = false;
     }
 
-    public rangeQuery_args setQueryObj(byte[] queryObj) {
-      this.queryObj = queryObj == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(queryObj.clone());
-      return this;
+    public java.lang.String getDataFile() {
+      return this.dataFile;
     }
 
-    public rangeQuery_args setQueryObj(java.nio.ByteBuffer queryObj) {
-      this.queryObj = org.apache.thrift.TBaseHelper.copyBinary(queryObj);
+    public reloadIndex_args setDataFile(java.lang.String dataFile) {
+      this.dataFile = dataFile;
       return this;
     }
 
-    public void unsetQueryObj() {
-      this.queryObj = null;
+    public void unsetDataFile() {
+      this.dataFile = null;
     }
 
-    /** Returns true if field queryObj is set (has been assigned a value) and false otherwise */
-    public boolean isSetQueryObj() {
-      return this.queryObj != null;
+    /** Returns true if field dataFile is set (has been assigned a value) and false otherwise */
+    public boolean isSetDataFile() {
+      return this.dataFile != null;
     }
 
-    public void setQueryObjIsSet(boolean value) {
+    public void setDataFileIsSet(boolean value) {
       if (!value) {
-        this.queryObj = null;
+        this.dataFile = null;
       }
     }
 
-    public boolean isRetExternId() {
-      return this.retExternId;
+    public java.lang.String getLoadIndexLoc() {
+      return this.loadIndexLoc;
     }
 
-    public rangeQuery_args setRetExternId(boolean retExternId) {
-      this.retExternId = retExternId;
-      setRetExternIdIsSet(true);
+    public reloadIndex_args setLoadIndexLoc(java.lang.String loadIndexLoc) {
+      this.loadIndexLoc = loadIndexLoc;
       return this;
     }
 
-    public void unsetRetExternId() {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    public void unsetLoadIndexLoc() {
+      this.loadIndexLoc = null;
     }
 
-    /** Returns true if field retExternId is set (has been assigned a value) and false otherwise */
-    public boolean isSetRetExternId() {
-      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETEXTERNID_ISSET_ID);
+    /** Returns true if field loadIndexLoc is set (has been assigned a value) and false otherwise */
+    public boolean isSetLoadIndexLoc() {
+      return this.loadIndexLoc != null;
     }
 
-    public void setRetExternIdIsSet(boolean value) {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETEXTERNID_ISSET_ID, value);
+    public void setLoadIndexLocIsSet(boolean value) {
+      if (!value) {
+        this.loadIndexLoc = null;
+      }
     }
 
-    public boolean isRetObj() {
-      return this.retObj;
+    public boolean isCacheData() {
+      return this.cacheData;
     }
 
-    public rangeQuery_args setRetObj(boolean retObj) {
-      this.retObj = retObj;
-      setRetObjIsSet(true);
+    public reloadIndex_args setCacheData(boolean cacheData) {
+      this.cacheData = cacheData;
+      setCacheDataIsSet(true);
       return this;
     }
 
-    public void unsetRetObj() {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    public void unsetCacheData() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __CACHEDATA_ISSET_ID);
     }
 
-    /** Returns true if field retObj is set (has been assigned a value) and false otherwise */
-    public boolean isSetRetObj() {
-      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __RETOBJ_ISSET_ID);
+    /** Returns true if field cacheData is set (has been assigned a value) and false otherwise */
+    public boolean isSetCacheData() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __CACHEDATA_ISSET_ID);
     }
 
-    public void setRetObjIsSet(boolean value) {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __RETOBJ_ISSET_ID, value);
+    public void setCacheDataIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __CACHEDATA_ISSET_ID, value);
     }
 
     public void setFieldValue(_Fields field, java.lang.Object value) {
       switch (field) {
-      case R:
-        if (value == null) {
-          unsetR();
-        } else {
-          setR((java.lang.Double)value);
-        }
-        break;
-
-      case QUERY_OBJ:
+      case DATA_FILE:
         if (value == null) {
-          unsetQueryObj();
+          unsetDataFile();
         } else {
-          if (value instanceof byte[]) {
-            setQueryObj((byte[])value);
-          } else {
-            setQueryObj((java.nio.ByteBuffer)value);
-          }
+          setDataFile((java.lang.String)value);
         }
         break;
 
-      case RET_EXTERN_ID:
+      case LOAD_INDEX_LOC:
         if (value == null) {
-          unsetRetExternId();
+          unsetLoadIndexLoc();
         } else {
-          setRetExternId((java.lang.Boolean)value);
+          setLoadIndexLoc((java.lang.String)value);
         }
         break;
 
-      case RET_OBJ:
+      case CACHE_DATA:
         if (value == null) {
-          unsetRetObj();
+          unsetCacheData();
         } else {
-          setRetObj((java.lang.Boolean)value);
+          setCacheData((java.lang.Boolean)value);
         }
         break;
 
@@ -2936,17 +9424,14 @@ public class QueryService {
 
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
-      case R:
-        return getR();
+      case DATA_FILE:
+        return getDataFile();
 
-      case QUERY_OBJ:
-        return getQueryObj();
-
-      case RET_EXTERN_ID:
-        return isRetExternId();
+      case LOAD_INDEX_LOC:
+        return getLoadIndexLoc();
 
-      case RET_OBJ:
-        return isRetObj();
+      case CACHE_DATA:
+        return isCacheData();
 
       }
       throw new java.lang.IllegalStateException();
@@ -2959,14 +9444,12 @@ public class QueryService {
       }
 
       switch (field) {
-      case R:
-        return isSetR();
-      case QUERY_OBJ:
-        return isSetQueryObj();
-      case RET_EXTERN_ID:
-        return isSetRetExternId();
-      case RET_OBJ:
-        return isSetRetObj();
+      case DATA_FILE:
+        return isSetDataFile();
+      case LOAD_INDEX_LOC:
+        return isSetLoadIndexLoc();
+      case CACHE_DATA:
+        return isSetCacheData();
       }
       throw new java.lang.IllegalStateException();
     }
@@ -2975,50 +9458,41 @@ public class QueryService {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof rangeQuery_args)
-        return this.equals((rangeQuery_args)that);
+      if (that instanceof reloadIndex_args)
+        return this.equals((reloadIndex_args)that);
       return false;
     }
 
-    public boolean equals(rangeQuery_args that) {
+    public boolean equals(reloadIndex_args that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_r = true;
-      boolean that_present_r = true;
-      if (this_present_r || that_present_r) {
-        if (!(this_present_r && that_present_r))
-          return false;
-        if (this.r != that.r)
-          return false;
-      }
-
-      boolean this_present_queryObj = true && this.isSetQueryObj();
-      boolean that_present_queryObj = true && that.isSetQueryObj();
-      if (this_present_queryObj || that_present_queryObj) {
-        if (!(this_present_queryObj && that_present_queryObj))
+      boolean this_present_dataFile = true && this.isSetDataFile();
+      boolean that_present_dataFile = true && that.isSetDataFile();
+      if (this_present_dataFile || that_present_dataFile) {
+        if (!(this_present_dataFile && that_present_dataFile))
           return false;
-        if (!this.queryObj.equals(that.queryObj))
+        if (!this.dataFile.equals(that.dataFile))
           return false;
       }
 
-      boolean this_present_retExternId = true;
-      boolean that_present_retExternId = true;
-      if (this_present_retExternId || that_present_retExternId) {
-        if (!(this_present_retExternId && that_present_retExternId))
+      boolean this_present_loadIndexLoc = true && this.isSetLoadIndexLoc();
+      boolean that_present_loadIndexLoc = true && that.isSetLoadIndexLoc();
+      if (this_present_loadIndexLoc || that_present_loadIndexLoc) {
+        if (!(this_present_loadIndexLoc && that_present_loadIndexLoc))
           return false;
-        if (this.retExternId != that.retExternId)
+        if (!this.loadIndexLoc.equals(that.loadIndexLoc))
           return false;
       }
 
-      boolean this_present_retObj = true;
-      boolean that_present_retObj = true;
-      if (this_present_retObj || that_present_retObj) {
-        if (!(this_present_retObj && that_present_retObj))
+      boolean this_present_cacheData = true;
+      boolean that_present_cacheData = true;
+      if (this_present_cacheData || that_present_cacheData) {
+        if (!(this_present_cacheData && that_present_cacheData))
           return false;
-        if (this.retObj != that.retObj)
+        if (this.cacheData != that.cacheData)
           return false;
       }
 
@@ -3029,63 +9503,53 @@ public class QueryService {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(r);
-
-      hashCode = hashCode * 8191 + ((isSetQueryObj()) ? 131071 : 524287);
-      if (isSetQueryObj())
-        hashCode = hashCode * 8191 + queryObj.hashCode();
+      hashCode = hashCode * 8191 + ((isSetDataFile()) ? 131071 : 524287);
+      if (isSetDataFile())
+        hashCode = hashCode * 8191 + dataFile.hashCode();
 
-      hashCode = hashCode * 8191 + ((retExternId) ? 131071 : 524287);
+      hashCode = hashCode * 8191 + ((isSetLoadIndexLoc()) ? 131071 : 524287);
+      if (isSetLoadIndexLoc())
+        hashCode = hashCode * 8191 + loadIndexLoc.hashCode();
 
-      hashCode = hashCode * 8191 + ((retObj) ? 131071 : 524287);
+      hashCode = hashCode * 8191 + ((cacheData) ? 131071 : 524287);
 
       return hashCode;
     }
 
     @Override
-    public int compareTo(rangeQuery_args other) {
+    public int compareTo(reloadIndex_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
-      lastComparison = java.lang.Boolean.valueOf(isSetR()).compareTo(other.isSetR());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetR()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.r, other.r);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
-      lastComparison = java.lang.Boolean.valueOf(isSetQueryObj()).compareTo(other.isSetQueryObj());
+      lastComparison = java.lang.Boolean.valueOf(isSetDataFile()).compareTo(other.isSetDataFile());
       if (lastComparison != 0) {
         return lastComparison;
       }
-      if (isSetQueryObj()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.queryObj, other.queryObj);
+      if (isSetDataFile()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.dataFile, other.dataFile);
         if (lastComparison != 0) {
           return lastComparison;
         }
       }
-      lastComparison = java.lang.Boolean.valueOf(isSetRetExternId()).compareTo(other.isSetRetExternId());
+      lastComparison = java.lang.Boolean.valueOf(isSetLoadIndexLoc()).compareTo(other.isSetLoadIndexLoc());
       if (lastComparison != 0) {
         return lastComparison;
       }
-      if (isSetRetExternId()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retExternId, other.retExternId);
+      if (isSetLoadIndexLoc()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.loadIndexLoc, other.loadIndexLoc);
         if (lastComparison != 0) {
           return lastComparison;
         }
       }
-      lastComparison = java.lang.Boolean.valueOf(isSetRetObj()).compareTo(other.isSetRetObj());
+      lastComparison = java.lang.Boolean.valueOf(isSetCacheData()).compareTo(other.isSetCacheData());
       if (lastComparison != 0) {
         return lastComparison;
       }
-      if (isSetRetObj()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.retObj, other.retObj);
+      if (isSetCacheData()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.cacheData, other.cacheData);
         if (lastComparison != 0) {
           return lastComparison;
         }
@@ -3107,27 +9571,27 @@ public class QueryService {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("rangeQuery_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reloadIndex_args(");
       boolean first = true;
 
-      sb.append("r:");
-      sb.append(this.r);
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("queryObj:");
-      if (this.queryObj == null) {
+      sb.append("dataFile:");
+      if (this.dataFile == null) {
         sb.append("null");
       } else {
-        org.apache.thrift.TBaseHelper.toString(this.queryObj, sb);
+        sb.append(this.dataFile);
       }
       first = false;
       if (!first) sb.append(", ");
-      sb.append("retExternId:");
-      sb.append(this.retExternId);
+      sb.append("loadIndexLoc:");
+      if (this.loadIndexLoc == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.loadIndexLoc);
+      }
       first = false;
       if (!first) sb.append(", ");
-      sb.append("retObj:");
-      sb.append(this.retObj);
+      sb.append("cacheData:");
+      sb.append(this.cacheData);
       first = false;
       sb.append(")");
       return sb.toString();
@@ -3135,12 +9599,13 @@ public class QueryService {
 
     public void validate() throws org.apache.thrift.TException {
       // check for required fields
-      // alas, we cannot check 'r' because it's a primitive and you chose the non-beans generator.
-      if (queryObj == null) {
-        throw new org.apache.thrift.protocol.TProtocolException("Required field 'queryObj' was not present! Struct: " + toString());
+      if (dataFile == null) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'dataFile' was not present! Struct: " + toString());
       }
-      // alas, we cannot check 'retExternId' because it's a primitive and you chose the non-beans generator.
-      // alas, we cannot check 'retObj' because it's a primitive and you chose the non-beans generator.
+      if (loadIndexLoc == null) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'loadIndexLoc' was not present! Struct: " + toString());
+      }
+      // alas, we cannot check 'cacheData' because it's a primitive and you chose the non-beans generator.
       // check for sub-struct validity
     }
 
@@ -3162,15 +9627,15 @@ public class QueryService {
       }
     }
 
-    private static class rangeQuery_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public rangeQuery_argsStandardScheme getScheme() {
-        return new rangeQuery_argsStandardScheme();
+    private static class reloadIndex_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reloadIndex_argsStandardScheme getScheme() {
+        return new reloadIndex_argsStandardScheme();
       }
     }
 
-    private static class rangeQuery_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<rangeQuery_args> {
+    private static class reloadIndex_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<reloadIndex_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, rangeQuery_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reloadIndex_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -3180,34 +9645,26 @@ public class QueryService {
             break;
           }
           switch (schemeField.id) {
-            case 1: // R
-              if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
-                struct.r = iprot.readDouble();
-                struct.setRIsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
-            case 2: // QUERY_OBJ
+            case 1: // DATA_FILE
               if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.queryObj = iprot.readBinary();
-                struct.setQueryObjIsSet(true);
+                struct.dataFile = iprot.readString();
+                struct.setDataFileIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
               break;
-            case 3: // RET_EXTERN_ID
-              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
-                struct.retExternId = iprot.readBool();
-                struct.setRetExternIdIsSet(true);
+            case 2: // LOAD_INDEX_LOC
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.loadIndexLoc = iprot.readString();
+                struct.setLoadIndexLocIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
               break;
-            case 4: // RET_OBJ
+            case 3: // CACHE_DATA
               if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
-                struct.retObj = iprot.readBool();
-                struct.setRetObjIsSet(true);
+                struct.cacheData = iprot.readBool();
+                struct.setCacheDataIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
@@ -3220,35 +9677,28 @@ public class QueryService {
         iprot.readStructEnd();
 
         // check for required fields of primitive type, which can't be checked in the validate method
-        if (!struct.isSetR()) {
-          throw new org.apache.thrift.protocol.TProtocolException("Required field 'r' was not found in serialized data! Struct: " + toString());
-        }
-        if (!struct.isSetRetExternId()) {
-          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retExternId' was not found in serialized data! Struct: " + toString());
-        }
-        if (!struct.isSetRetObj()) {
-          throw new org.apache.thrift.protocol.TProtocolException("Required field 'retObj' was not found in serialized data! Struct: " + toString());
+        if (!struct.isSetCacheData()) {
+          throw new org.apache.thrift.protocol.TProtocolException("Required field 'cacheData' was not found in serialized data! Struct: " + toString());
         }
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, rangeQuery_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reloadIndex_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        oprot.writeFieldBegin(R_FIELD_DESC);
-        oprot.writeDouble(struct.r);
-        oprot.writeFieldEnd();
-        if (struct.queryObj != null) {
-          oprot.writeFieldBegin(QUERY_OBJ_FIELD_DESC);
-          oprot.writeBinary(struct.queryObj);
+        if (struct.dataFile != null) {
+          oprot.writeFieldBegin(DATA_FILE_FIELD_DESC);
+          oprot.writeString(struct.dataFile);
           oprot.writeFieldEnd();
         }
-        oprot.writeFieldBegin(RET_EXTERN_ID_FIELD_DESC);
-        oprot.writeBool(struct.retExternId);
-        oprot.writeFieldEnd();
-        oprot.writeFieldBegin(RET_OBJ_FIELD_DESC);
-        oprot.writeBool(struct.retObj);
+        if (struct.loadIndexLoc != null) {
+          oprot.writeFieldBegin(LOAD_INDEX_LOC_FIELD_DESC);
+          oprot.writeString(struct.loadIndexLoc);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(CACHE_DATA_FIELD_DESC);
+        oprot.writeBool(struct.cacheData);
         oprot.writeFieldEnd();
         oprot.writeFieldStop();
         oprot.writeStructEnd();
@@ -3256,34 +9706,31 @@ public class QueryService {
 
     }
 
-    private static class rangeQuery_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public rangeQuery_argsTupleScheme getScheme() {
-        return new rangeQuery_argsTupleScheme();
+    private static class reloadIndex_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reloadIndex_argsTupleScheme getScheme() {
+        return new reloadIndex_argsTupleScheme();
       }
     }
 
-    private static class rangeQuery_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<rangeQuery_args> {
+    private static class reloadIndex_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<reloadIndex_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, rangeQuery_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, reloadIndex_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        oprot.writeDouble(struct.r);
-        oprot.writeBinary(struct.queryObj);
-        oprot.writeBool(struct.retExternId);
-        oprot.writeBool(struct.retObj);
+        oprot.writeString(struct.dataFile);
+        oprot.writeString(struct.loadIndexLoc);
+        oprot.writeBool(struct.cacheData);
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, rangeQuery_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, reloadIndex_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        struct.r = iprot.readDouble();
-        struct.setRIsSet(true);
-        struct.queryObj = iprot.readBinary();
-        struct.setQueryObjIsSet(true);
-        struct.retExternId = iprot.readBool();
-        struct.setRetExternIdIsSet(true);
-        struct.retObj = iprot.readBool();
-        struct.setRetObjIsSet(true);
+        struct.dataFile = iprot.readString();
+        struct.setDataFileIsSet(true);
+        struct.loadIndexLoc = iprot.readString();
+        struct.setLoadIndexLocIsSet(true);
+        struct.cacheData = iprot.readBool();
+        struct.setCacheDataIsSet(true);
       }
     }
 
@@ -3292,21 +9739,18 @@ public class QueryService {
     }
   }
 
-  public static class rangeQuery_result implements org.apache.thrift.TBase<rangeQuery_result, rangeQuery_result._Fields>, java.io.Serializable, Cloneable, Comparable<rangeQuery_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("rangeQuery_result");
+  public static class reloadIndex_result implements org.apache.thrift.TBase<reloadIndex_result, reloadIndex_result._Fields>, java.io.Serializable, Cloneable, Comparable<reloadIndex_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reloadIndex_result");
 
-    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.LIST, (short)0);
     private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new rangeQuery_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new rangeQuery_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reloadIndex_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reloadIndex_resultTupleSchemeFactory();
 
-    public java.util.List<ReplyEntry> success; // required
     public QueryException err; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      SUCCESS((short)0, "success"),
       ERR((short)1, "err");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
@@ -3322,8 +9766,6 @@ public class QueryService {
        */
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
-          case 0: // SUCCESS
-            return SUCCESS;
           case 1: // ERR
             return ERR;
           default:
@@ -3369,96 +9811,45 @@ public class QueryService {
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.LIST          , "ReplyEntryList")));
       tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
           new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
-      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(rangeQuery_result.class, metaDataMap);
-    }
-
-    public rangeQuery_result() {
-    }
-
-    public rangeQuery_result(
-      java.util.List<ReplyEntry> success,
-      QueryException err)
-    {
-      this();
-      this.success = success;
-      this.err = err;
-    }
-
-    /**
-     * Performs a deep copy on <i>other</i>.
-     */
-    public rangeQuery_result(rangeQuery_result other) {
-      if (other.isSetSuccess()) {
-        java.util.List<ReplyEntry> __this__success = new java.util.ArrayList<ReplyEntry>(other.success.size());
-        for (ReplyEntry other_element : other.success) {
-          __this__success.add(new ReplyEntry(other_element));
-        }
-        this.success = __this__success;
-      }
-      if (other.isSetErr()) {
-        this.err = new QueryException(other.err);
-      }
-    }
-
-    public rangeQuery_result deepCopy() {
-      return new rangeQuery_result(this);
-    }
-
-    @Override
-    public void clear() {
-      this.success = null;
-      this.err = null;
-    }
-
-    public int getSuccessSize() {
-      return (this.success == null) ? 0 : this.success.size();
-    }
-
-    public java.util.Iterator<ReplyEntry> getSuccessIterator() {
-      return (this.success == null) ? null : this.success.iterator();
-    }
-
-    public void addToSuccess(ReplyEntry elem) {
-      if (this.success == null) {
-        this.success = new java.util.ArrayList<ReplyEntry>();
-      }
-      this.success.add(elem);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reloadIndex_result.class, metaDataMap);
     }
 
-    public java.util.List<ReplyEntry> getSuccess() {
-      return this.success;
+    public reloadIndex_result() {
     }
 
-    public rangeQuery_result setSuccess(java.util.List<ReplyEntry> success) {
-      this.success = success;
-      return this;
+    public reloadIndex_result(
+      QueryException err)
+    {
+      this();
+      this.err = err;
     }
 
-    public void unsetSuccess() {
-      this.success = null;
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public reloadIndex_result(reloadIndex_result other) {
+      if (other.isSetErr()) {
+        this.err = new QueryException(other.err);
+      }
     }
 
-    /** Returns true if field success is set (has been assigned a value) and false otherwise */
-    public boolean isSetSuccess() {
-      return this.success != null;
+    public reloadIndex_result deepCopy() {
+      return new reloadIndex_result(this);
     }
 
-    public void setSuccessIsSet(boolean value) {
-      if (!value) {
-        this.success = null;
-      }
+    @Override
+    public void clear() {
+      this.err = null;
     }
 
     public QueryException getErr() {
       return this.err;
     }
 
-    public rangeQuery_result setErr(QueryException err) {
+    public reloadIndex_result setErr(QueryException err) {
       this.err = err;
       return this;
     }
@@ -3480,14 +9871,6 @@ public class QueryService {
 
     public void setFieldValue(_Fields field, java.lang.Object value) {
       switch (field) {
-      case SUCCESS:
-        if (value == null) {
-          unsetSuccess();
-        } else {
-          setSuccess((java.util.List<ReplyEntry>)value);
-        }
-        break;
-
       case ERR:
         if (value == null) {
           unsetErr();
@@ -3501,9 +9884,6 @@ public class QueryService {
 
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
-      case SUCCESS:
-        return getSuccess();
-
       case ERR:
         return getErr();
 
@@ -3518,8 +9898,6 @@ public class QueryService {
       }
 
       switch (field) {
-      case SUCCESS:
-        return isSetSuccess();
       case ERR:
         return isSetErr();
       }
@@ -3530,26 +9908,17 @@ public class QueryService {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof rangeQuery_result)
-        return this.equals((rangeQuery_result)that);
+      if (that instanceof reloadIndex_result)
+        return this.equals((reloadIndex_result)that);
       return false;
     }
 
-    public boolean equals(rangeQuery_result that) {
+    public boolean equals(reloadIndex_result that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_success = true && this.isSetSuccess();
-      boolean that_present_success = true && that.isSetSuccess();
-      if (this_present_success || that_present_success) {
-        if (!(this_present_success && that_present_success))
-          return false;
-        if (!this.success.equals(that.success))
-          return false;
-      }
-
       boolean this_present_err = true && this.isSetErr();
       boolean that_present_err = true && that.isSetErr();
       if (this_present_err || that_present_err) {
@@ -3566,10 +9935,6 @@ public class QueryService {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
-      if (isSetSuccess())
-        hashCode = hashCode * 8191 + success.hashCode();
-
       hashCode = hashCode * 8191 + ((isSetErr()) ? 131071 : 524287);
       if (isSetErr())
         hashCode = hashCode * 8191 + err.hashCode();
@@ -3578,23 +9943,13 @@ public class QueryService {
     }
 
     @Override
-    public int compareTo(rangeQuery_result other) {
+    public int compareTo(reloadIndex_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
-      lastComparison = java.lang.Boolean.valueOf(isSetSuccess()).compareTo(other.isSetSuccess());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetSuccess()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
       lastComparison = java.lang.Boolean.valueOf(isSetErr()).compareTo(other.isSetErr());
       if (lastComparison != 0) {
         return lastComparison;
@@ -3622,17 +9977,9 @@ public class QueryService {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("rangeQuery_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reloadIndex_result(");
       boolean first = true;
 
-      sb.append("success:");
-      if (this.success == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.success);
-      }
-      first = false;
-      if (!first) sb.append(", ");
       sb.append("err:");
       if (this.err == null) {
         sb.append("null");
@@ -3665,15 +10012,15 @@ public class QueryService {
       }
     }
 
-    private static class rangeQuery_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public rangeQuery_resultStandardScheme getScheme() {
-        return new rangeQuery_resultStandardScheme();
+    private static class reloadIndex_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reloadIndex_resultStandardScheme getScheme() {
+        return new reloadIndex_resultStandardScheme();
       }
     }
 
-    private static class rangeQuery_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<rangeQuery_result> {
+    private static class reloadIndex_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<reloadIndex_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, rangeQuery_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reloadIndex_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -3683,25 +10030,6 @@ public class QueryService {
             break;
           }
           switch (schemeField.id) {
-            case 0: // SUCCESS
-              if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
-                {
-                  org.apache.thrift.protocol.TList _list8 = iprot.readListBegin();
-                  struct.success = new java.util.ArrayList<ReplyEntry>(_list8.size);
-                  ReplyEntry _elem9;
-                  for (int _i10 = 0; _i10 < _list8.size; ++_i10)
-                  {
-                    _elem9 = new ReplyEntry();
-                    _elem9.read(iprot);
-                    struct.success.add(_elem9);
-                  }
-                  iprot.readListEnd();
-                }
-                struct.setSuccessIsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
             case 1: // ERR
               if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
                 struct.err = new QueryException();
@@ -3722,22 +10050,10 @@ public class QueryService {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, rangeQuery_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reloadIndex_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.success != null) {
-          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-          {
-            oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, struct.success.size()));
-            for (ReplyEntry _iter11 : struct.success)
-            {
-              _iter11.write(oprot);
-            }
-            oprot.writeListEnd();
-          }
-          oprot.writeFieldEnd();
-        }
         if (struct.err != null) {
           oprot.writeFieldBegin(ERR_FIELD_DESC);
           struct.err.write(oprot);
@@ -3749,58 +10065,32 @@ public class QueryService {
 
     }
 
-    private static class rangeQuery_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public rangeQuery_resultTupleScheme getScheme() {
-        return new rangeQuery_resultTupleScheme();
+    private static class reloadIndex_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reloadIndex_resultTupleScheme getScheme() {
+        return new reloadIndex_resultTupleScheme();
       }
     }
 
-    private static class rangeQuery_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<rangeQuery_result> {
+    private static class reloadIndex_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<reloadIndex_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, rangeQuery_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, reloadIndex_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet optionals = new java.util.BitSet();
-        if (struct.isSetSuccess()) {
-          optionals.set(0);
-        }
         if (struct.isSetErr()) {
-          optionals.set(1);
-        }
-        oprot.writeBitSet(optionals, 2);
-        if (struct.isSetSuccess()) {
-          {
-            oprot.writeI32(struct.success.size());
-            for (ReplyEntry _iter12 : struct.success)
-            {
-              _iter12.write(oprot);
-            }
-          }
+          optionals.set(0);
         }
+        oprot.writeBitSet(optionals, 1);
         if (struct.isSetErr()) {
           struct.err.write(oprot);
         }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, rangeQuery_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, reloadIndex_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet incoming = iprot.readBitSet(2);
+        java.util.BitSet incoming = iprot.readBitSet(1);
         if (incoming.get(0)) {
-          {
-            org.apache.thrift.protocol.TList _list13 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, iprot.readI32());
-            struct.success = new java.util.ArrayList<ReplyEntry>(_list13.size);
-            ReplyEntry _elem14;
-            for (int _i15 = 0; _i15 < _list13.size; ++_i15)
-            {
-              _elem14 = new ReplyEntry();
-              _elem14.read(iprot);
-              struct.success.add(_elem14);
-            }
-          }
-          struct.setSuccessIsSet(true);
-        }
-        if (incoming.get(1)) {
           struct.err = new QueryException();
           struct.err.read(iprot);
           struct.setErrIsSet(true);
@@ -3813,22 +10103,17 @@ public class QueryService {
     }
   }
 
-  public static class getDistance_args implements org.apache.thrift.TBase<getDistance_args, getDistance_args._Fields>, java.io.Serializable, Cloneable, Comparable<getDistance_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getDistance_args");
+  public static class getStats_args implements org.apache.thrift.TBase<getStats_args, getStats_args._Fields>, java.io.Serializable, Cloneable, Comparable<getStats_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getStats_args");
 
-    private static final org.apache.thrift.protocol.TField OBJ1_FIELD_DESC = new org.apache.thrift.protocol.TField("obj1", org.apache.thrift.protocol.TType.STRING, (short)1);
-    private static final org.apache.thrift.protocol.TField OBJ2_FIELD_DESC = new org.apache.thrift.protocol.TField("obj2", org.apache.thrift.protocol.TType.STRING, (short)2);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getDistance_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getDistance_argsTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getStats_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getStats_argsTupleSchemeFactory();
 
-    public java.nio.ByteBuffer obj1; // required
-    public java.nio.ByteBuffer obj2; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      OBJ1((short)1, "obj1"),
-      OBJ2((short)2, "obj2");
+;
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -3843,10 +10128,6 @@ public class QueryService {
        */
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
-          case 1: // OBJ1
-            return OBJ1;
-          case 2: // OBJ2
-            return OBJ2;
           default:
             return null;
         }
@@ -3885,158 +10166,37 @@ public class QueryService {
         return _fieldName;
       }
     }
-
-    // isset id assignments
-    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
-    static {
-      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      tmpMap.put(_Fields.OBJ1, new org.apache.thrift.meta_data.FieldMetaData("obj1", org.apache.thrift.TFieldRequirementType.REQUIRED, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
-      tmpMap.put(_Fields.OBJ2, new org.apache.thrift.meta_data.FieldMetaData("obj2", org.apache.thrift.TFieldRequirementType.REQUIRED, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
-      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getDistance_args.class, metaDataMap);
-    }
-
-    public getDistance_args() {
-    }
-
-    public getDistance_args(
-      java.nio.ByteBuffer obj1,
-      java.nio.ByteBuffer obj2)
-    {
-      this();
-      this.obj1 = org.apache.thrift.TBaseHelper.copyBinary(obj1);
-      this.obj2 = org.apache.thrift.TBaseHelper.copyBinary(obj2);
-    }
-
-    /**
-     * Performs a deep copy on <i>other</i>.
-     */
-    public getDistance_args(getDistance_args other) {
-      if (other.isSetObj1()) {
-        this.obj1 = org.apache.thrift.TBaseHelper.copyBinary(other.obj1);
-      }
-      if (other.isSetObj2()) {
-        this.obj2 = org.apache.thrift.TBaseHelper.copyBinary(other.obj2);
-      }
-    }
-
-    public getDistance_args deepCopy() {
-      return new getDistance_args(this);
-    }
-
-    @Override
-    public void clear() {
-      this.obj1 = null;
-      this.obj2 = null;
-    }
-
-    public byte[] getObj1() {
-      setObj1(org.apache.thrift.TBaseHelper.rightSize(obj1));
-      return obj1 == null ? null : obj1.array();
-    }
-
-    public java.nio.ByteBuffer bufferForObj1() {
-      return org.apache.thrift.TBaseHelper.copyBinary(obj1);
-    }
-
-    public getDistance_args setObj1(byte[] obj1) {
-      this.obj1 = obj1 == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(obj1.clone());
-      return this;
-    }
-
-    public getDistance_args setObj1(java.nio.ByteBuffer obj1) {
-      this.obj1 = org.apache.thrift.TBaseHelper.copyBinary(obj1);
-      return this;
-    }
-
-    public void unsetObj1() {
-      this.obj1 = null;
-    }
-
-    /** Returns true if field obj1 is set (has been assigned a value) and false otherwise */
-    public boolean isSetObj1() {
-      return this.obj1 != null;
-    }
-
-    public void setObj1IsSet(boolean value) {
-      if (!value) {
-        this.obj1 = null;
-      }
-    }
-
-    public byte[] getObj2() {
-      setObj2(org.apache.thrift.TBaseHelper.rightSize(obj2));
-      return obj2 == null ? null : obj2.array();
-    }
-
-    public java.nio.ByteBuffer bufferForObj2() {
-      return org.apache.thrift.TBaseHelper.copyBinary(obj2);
-    }
-
-    public getDistance_args setObj2(byte[] obj2) {
-      this.obj2 = obj2 == null ? (java.nio.ByteBuffer)null : java.nio.ByteBuffer.wrap(obj2.clone());
-      return this;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getStats_args.class, metaDataMap);
     }
 
-    public getDistance_args setObj2(java.nio.ByteBuffer obj2) {
-      this.obj2 = org.apache.thrift.TBaseHelper.copyBinary(obj2);
-      return this;
+    public getStats_args() {
     }
 
-    public void unsetObj2() {
-      this.obj2 = null;
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getStats_args(getStats_args other) {
     }
 
-    /** Returns true if field obj2 is set (has been assigned a value) and false otherwise */
-    public boolean isSetObj2() {
-      return this.obj2 != null;
+    public getStats_args deepCopy() {
+      return new getStats_args(this);
     }
 
-    public void setObj2IsSet(boolean value) {
-      if (!value) {
-        this.obj2 = null;
-      }
+    @Override
+    public void clear() {
     }
 
     public void setFieldValue(_Fields field, java.lang.Object value) {
       switch (field) {
-      case OBJ1:
-        if (value == null) {
-          unsetObj1();
-        } else {
-          if (value instanceof byte[]) {
-            setObj1((byte[])value);
-          } else {
-            setObj1((java.nio.ByteBuffer)value);
-          }
-        }
-        break;
-
-      case OBJ2:
-        if (value == null) {
-          unsetObj2();
-        } else {
-          if (value instanceof byte[]) {
-            setObj2((byte[])value);
-          } else {
-            setObj2((java.nio.ByteBuffer)value);
-          }
-        }
-        break;
-
       }
     }
 
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
-      case OBJ1:
-        return getObj1();
-
-      case OBJ2:
-        return getObj2();
-
       }
       throw new java.lang.IllegalStateException();
     }
@@ -4048,10 +10208,6 @@ public class QueryService {
       }
 
       switch (field) {
-      case OBJ1:
-        return isSetObj1();
-      case OBJ2:
-        return isSetObj2();
       }
       throw new java.lang.IllegalStateException();
     }
@@ -4060,35 +10216,17 @@ public class QueryService {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof getDistance_args)
-        return this.equals((getDistance_args)that);
+      if (that instanceof getStats_args)
+        return this.equals((getStats_args)that);
       return false;
     }
 
-    public boolean equals(getDistance_args that) {
+    public boolean equals(getStats_args that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_obj1 = true && this.isSetObj1();
-      boolean that_present_obj1 = true && that.isSetObj1();
-      if (this_present_obj1 || that_present_obj1) {
-        if (!(this_present_obj1 && that_present_obj1))
-          return false;
-        if (!this.obj1.equals(that.obj1))
-          return false;
-      }
-
-      boolean this_present_obj2 = true && this.isSetObj2();
-      boolean that_present_obj2 = true && that.isSetObj2();
-      if (this_present_obj2 || that_present_obj2) {
-        if (!(this_present_obj2 && that_present_obj2))
-          return false;
-        if (!this.obj2.equals(that.obj2))
-          return false;
-      }
-
       return true;
     }
 
@@ -4096,45 +10234,17 @@ public class QueryService {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + ((isSetObj1()) ? 131071 : 524287);
-      if (isSetObj1())
-        hashCode = hashCode * 8191 + obj1.hashCode();
-
-      hashCode = hashCode * 8191 + ((isSetObj2()) ? 131071 : 524287);
-      if (isSetObj2())
-        hashCode = hashCode * 8191 + obj2.hashCode();
-
       return hashCode;
     }
 
     @Override
-    public int compareTo(getDistance_args other) {
+    public int compareTo(getStats_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
-      lastComparison = java.lang.Boolean.valueOf(isSetObj1()).compareTo(other.isSetObj1());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetObj1()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.obj1, other.obj1);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
-      lastComparison = java.lang.Boolean.valueOf(isSetObj2()).compareTo(other.isSetObj2());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      if (isSetObj2()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.obj2, other.obj2);
-        if (lastComparison != 0) {
-          return lastComparison;
-        }
-      }
       return 0;
     }
 
@@ -4152,36 +10262,15 @@ public class QueryService {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("getDistance_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("getStats_args(");
       boolean first = true;
 
-      sb.append("obj1:");
-      if (this.obj1 == null) {
-        sb.append("null");
-      } else {
-        org.apache.thrift.TBaseHelper.toString(this.obj1, sb);
-      }
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("obj2:");
-      if (this.obj2 == null) {
-        sb.append("null");
-      } else {
-        org.apache.thrift.TBaseHelper.toString(this.obj2, sb);
-      }
-      first = false;
       sb.append(")");
       return sb.toString();
     }
 
     public void validate() throws org.apache.thrift.TException {
       // check for required fields
-      if (obj1 == null) {
-        throw new org.apache.thrift.protocol.TProtocolException("Required field 'obj1' was not present! Struct: " + toString());
-      }
-      if (obj2 == null) {
-        throw new org.apache.thrift.protocol.TProtocolException("Required field 'obj2' was not present! Struct: " + toString());
-      }
       // check for sub-struct validity
     }
 
@@ -4201,15 +10290,15 @@ public class QueryService {
       }
     }
 
-    private static class getDistance_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public getDistance_argsStandardScheme getScheme() {
-        return new getDistance_argsStandardScheme();
+    private static class getStats_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getStats_argsStandardScheme getScheme() {
+        return new getStats_argsStandardScheme();
       }
     }
 
-    private static class getDistance_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<getDistance_args> {
+    private static class getStats_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<getStats_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, getDistance_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, getStats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -4219,22 +10308,6 @@ public class QueryService {
             break;
           }
           switch (schemeField.id) {
-            case 1: // OBJ1
-              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.obj1 = iprot.readBinary();
-                struct.setObj1IsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
-            case 2: // OBJ2
-              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.obj2 = iprot.readBinary();
-                struct.setObj2IsSet(true);
-              } else { 
-                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
-              }
-              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -4246,48 +10319,32 @@ public class QueryService {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, getDistance_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, getStats_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.obj1 != null) {
-          oprot.writeFieldBegin(OBJ1_FIELD_DESC);
-          oprot.writeBinary(struct.obj1);
-          oprot.writeFieldEnd();
-        }
-        if (struct.obj2 != null) {
-          oprot.writeFieldBegin(OBJ2_FIELD_DESC);
-          oprot.writeBinary(struct.obj2);
-          oprot.writeFieldEnd();
-        }
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class getDistance_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public getDistance_argsTupleScheme getScheme() {
-        return new getDistance_argsTupleScheme();
+    private static class getStats_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getStats_argsTupleScheme getScheme() {
+        return new getStats_argsTupleScheme();
       }
     }
 
-    private static class getDistance_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<getDistance_args> {
+    private static class getStats_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<getStats_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, getDistance_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, getStats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        oprot.writeBinary(struct.obj1);
-        oprot.writeBinary(struct.obj2);
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, getDistance_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, getStats_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        struct.obj1 = iprot.readBinary();
-        struct.setObj1IsSet(true);
-        struct.obj2 = iprot.readBinary();
-        struct.setObj2IsSet(true);
       }
     }
 
@@ -4296,16 +10353,16 @@ public class QueryService {
     }
   }
 
-  public static class getDistance_result implements org.apache.thrift.TBase<getDistance_result, getDistance_result._Fields>, java.io.Serializable, Cloneable, Comparable<getDistance_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getDistance_result");
+  public static class getStats_result implements org.apache.thrift.TBase<getStats_result, getStats_result._Fields>, java.io.Serializable, Cloneable, Comparable<getStats_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("getStats_result");
 
-    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.DOUBLE, (short)0);
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRUCT, (short)0);
     private static final org.apache.thrift.protocol.TField ERR_FIELD_DESC = new org.apache.thrift.protocol.TField("err", org.apache.thrift.protocol.TType.STRUCT, (short)1);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getDistance_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getDistance_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new getStats_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new getStats_resultTupleSchemeFactory();
 
-    public double success; // required
+    public ServerStats success; // required
     public QueryException err; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
@@ -4370,82 +10427,80 @@ public class QueryService {
     }
 
     // isset id assignments
-    private static final int __SUCCESS_ISSET_ID = 0;
-    private byte __isset_bitfield = 0;
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
       tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ServerStats.class)));
       tmpMap.put(_Fields.ERR, new org.apache.thrift.meta_data.FieldMetaData("err", org.apache.thrift.TFieldRequirementType.DEFAULT, 
           new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, QueryException.class)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getDistance_result.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(getStats_result.class, metaDataMap);
     }
 
-    public getDistance_result() {
+    public getStats_result() {
     }
 
-    public getDistance_result(
-      double success,
+    public getStats_result(
+      ServerStats success,
       QueryException err)
     {
       this();
       this.success = success;
-      setSuccessIsSet(true);
       this.err = err;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getDistance_result(getDistance_result other) {
-      __isset_bitfield = other.__isset_bitfield;
-      this.success = other.success;
+    public getStats_result(getStats_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ServerStats(other.success);
+      }
       if (other.isSetErr()) {
         this.err = new QueryException(other.err);
       }
     }
 
-    public getDistance_result deepCopy() {
-      return new getDistance_result(this);
+    public getStats_result deepCopy() {
+      return new getStats_result(this);
     }
 
     @Override
     public void clear() {
-      setSuccessIsSet(false);
-      this.success = 0.0;
+      this.success = null;
       this.err = null;
     }
 
-    public double getSuccess() {
+    public ServerStats getSuccess() {
       return this.success;
     }
 
-    public getDistance_result setSuccess(double success) {
+    public getStats_result setSuccess(ServerStats success) {
       this.success = success;
-      setSuccessIsSet(true);
       return this;
     }
 
     public void unsetSuccess() {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+      this.success = null;
     }
 
     /** Returns true if field success is set (has been assigned a value) and false otherwise */
     public boolean isSetSuccess() {
-      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+      return this.success != null;
     }
 
     public void setSuccessIsSet(boolean value) {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __SUCCESS_ISSET_ID, value);
+      if (!value) {
+        this.success = null;
+      }
     }
 
     public QueryException getErr() {
       return this.err;
     }
 
-    public getDistance_result setErr(QueryException err) {
+    public getStats_result setErr(QueryException err) {
       this.err = err;
       return this;
     }
@@ -4471,7 +10526,7 @@ public class QueryService {
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((java.lang.Double)value);
+          setSuccess((ServerStats)value);
         }
         break;
 
@@ -4517,23 +10572,23 @@ public class QueryService {
     public boolean equals(java.lang.Object that) {
       if (that == null)
         return false;
-      if (that instanceof getDistance_result)
-        return this.equals((getDistance_result)that);
+      if (that instanceof getStats_result)
+        return this.equals((getStats_result)that);
       return false;
     }
 
-    public boolean equals(getDistance_result that) {
+    public boolean equals(getStats_result that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_success = true;
-      boolean that_present_success = true;
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
       if (this_present_success || that_present_success) {
         if (!(this_present_success && that_present_success))
           return false;
-        if (this.success != that.success)
+        if (!this.success.equals(that.success))
           return false;
       }
 
@@ -4553,7 +10608,9 @@ public class QueryService {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(success);
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
 
       hashCode = hashCode * 8191 + ((isSetErr()) ? 131071 : 524287);
       if (isSetErr())
@@ -4563,7 +10620,7 @@ public class QueryService {
     }
 
     @Override
-    public int compareTo(getDistance_result other) {
+    public int compareTo(getStats_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
@@ -4607,11 +10664,15 @@ public class QueryService {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("getDistance_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("getStats_result(");
       boolean first = true;
 
       sb.append("success:");
-      sb.append(this.success);
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
       first = false;
       if (!first) sb.append(", ");
       sb.append("err:");
@@ -4628,6 +10689,9 @@ public class QueryService {
     public void validate() throws org.apache.thrift.TException {
       // check for required fields
       // check for sub-struct validity
+      if (success != null) {
+        success.validate();
+      }
     }
 
     private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
@@ -4640,23 +10704,21 @@ public class QueryService {
 
     private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
       try {
-        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
-        __isset_bitfield = 0;
         read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
       } catch (org.apache.thrift.TException te) {
         throw new java.io.IOException(te);
       }
     }
 
-    private static class getDistance_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public getDistance_resultStandardScheme getScheme() {
-        return new getDistance_resultStandardScheme();
+    private static class getStats_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getStats_resultStandardScheme getScheme() {
+        return new getStats_resultStandardScheme();
       }
     }
 
-    private static class getDistance_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<getDistance_result> {
+    private static class getStats_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<getStats_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, getDistance_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, getStats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -4667,8 +10729,9 @@ public class QueryService {
           }
           switch (schemeField.id) {
             case 0: // SUCCESS
-              if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
-                struct.success = iprot.readDouble();
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.success = new ServerStats();
+                struct.success.read(iprot);
                 struct.setSuccessIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
@@ -4694,13 +10757,13 @@ public class QueryService {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, getDistance_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, getStats_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.isSetSuccess()) {
+        if (struct.success != null) {
           oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-          oprot.writeDouble(struct.success);
+          struct.success.write(oprot);
           oprot.writeFieldEnd();
         }
         if (struct.err != null) {
@@ -4714,16 +10777,16 @@ public class QueryService {
 
     }
 
-    private static class getDistance_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public getDistance_resultTupleScheme getScheme() {
-        return new getDistance_resultTupleScheme();
+    private static class getStats_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public getStats_resultTupleScheme getScheme() {
+        return new getStats_resultTupleScheme();
       }
     }
 
-    private static class getDistance_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<getDistance_result> {
+    private static class getStats_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<getStats_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, getDistance_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, getStats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet optionals = new java.util.BitSet();
         if (struct.isSetSuccess()) {
@@ -4734,7 +10797,7 @@ public class QueryService {
         }
         oprot.writeBitSet(optionals, 2);
         if (struct.isSetSuccess()) {
-          oprot.writeDouble(struct.success);
+          struct.success.write(oprot);
         }
         if (struct.isSetErr()) {
           struct.err.write(oprot);
@@ -4742,11 +10805,12 @@ public class QueryService {
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, getDistance_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, getStats_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet incoming = iprot.readBitSet(2);
         if (incoming.get(0)) {
-          struct.success = iprot.readDouble();
+          struct.success = new ServerStats();
+          struct.success.read(iprot);
           struct.setSuccessIsSet(true);
         }
         if (incoming.get(1)) {
@@ -0,0 +1,900 @@
+/**
+ * Autogenerated by Thrift Compiler (0.11.0)
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ *  @generated
+ */
+package edu.cmu.lti.oaqa.similarity;
+
+@SuppressWarnings({"cast", "rawtypes", "serial", "unchecked", "unused"})
+@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.11.0)", date = "2026-10-18")
+public class ServerStats implements org.apache.thrift.TBase<ServerStats, ServerStats._Fields>, java.io.Serializable, Cloneable, Comparable<ServerStats> {
+  private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("ServerStats");
+
+  private static final org.apache.thrift.protocol.TField UPTIME_FIELD_DESC = new org.apache.thrift.protocol.TField("uptime", org.apache.thrift.protocol.TType.DOUBLE, (short)1);
+  private static final org.apache.thrift.protocol.TField METHODS_FIELD_DESC = new org.apache.thrift.protocol.TField("methods", org.apache.thrift.protocol.TType.LIST, (short)2);
+  private static final org.apache.thrift.protocol.TField QUEUE_WAIT_FIELD_DESC = new org.apache.thrift.protocol.TField("queueWait", org.apache.thrift.protocol.TType.STRUCT, (short)3);
+  private static final org.apache.thrift.protocol.TField PENDING_TASK_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("pendingTaskQty", org.apache.thrift.protocol.TType.I64, (short)4);
+  private static final org.apache.thrift.protocol.TField IDLE_WORKER_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("idleWorkerQty", org.apache.thrift.protocol.TType.I64, (short)5);
+  private static final org.apache.thrift.protocol.TField WORKER_QTY_FIELD_DESC = new org.apache.thrift.protocol.TField("workerQty", org.apache.thrift.protocol.TType.I64, (short)6);
+
+  private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new ServerStatsStandardSchemeFactory();
+  private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new ServerStatsTupleSchemeFactory();
+
+  public double uptime; // required
+  public java.util.List<MethodStats> methods; // required
+  public MethodStats queueWait; // required
+  public long pendingTaskQty; // required
+  public long idleWorkerQty; // required
+  public long workerQty; // required
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+    UPTIME((short)1, "uptime"),
+    METHODS((short)2, "methods"),
+    QUEUE_WAIT((short)3, "queueWait"),
+    PENDING_TASK_QTY((short)4, "pendingTaskQty"),
+    IDLE_WORKER_QTY((short)5, "idleWorkerQty"),
+    WORKER_QTY((short)6, "workerQty");
+
+    private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+    static {
+      for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      switch(fieldId) {
+        case 1: // UPTIME
+          return UPTIME;
+        case 2: // METHODS
+          return METHODS;
+        case 3: // QUEUE_WAIT
+          return QUEUE_WAIT;
+        case 4: // PENDING_TASK_QTY
+          return PENDING_TASK_QTY;
+        case 5: // IDLE_WORKER_QTY
+          return IDLE_WORKER_QTY;
+        case 6: // WORKER_QTY
+          return WORKER_QTY;
+        default:
+          return null;
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(java.lang.String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final java.lang.String _fieldName;
+
+    _Fields(short thriftId, java.lang.String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public java.lang.String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __UPTIME_ISSET_ID = 0;
+  private static final int __PENDINGTASKQTY_ISSET_ID = 1;
+  private static final int __IDLEWORKERQTY_ISSET_ID = 2;
+  private static final int __WORKERQTY_ISSET_ID = 3;
+  private byte __isset_bitfield = 0;
+  public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+  static {
+    java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+    tmpMap.put(_Fields.UPTIME, new org.apache.thrift.meta_data.FieldMetaData("uptime", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE)));
+    tmpMap.put(_Fields.METHODS, new org.apache.thrift.meta_data.FieldMetaData("methods", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.ListMetaData(org.apache.thrift.protocol.TType.LIST, 
+            new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, MethodStats.class))));
+    tmpMap.put(_Fields.QUEUE_WAIT, new org.apache.thrift.meta_data.FieldMetaData("queueWait", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, MethodStats.class)));
+    tmpMap.put(_Fields.PENDING_TASK_QTY, new org.apache.thrift.meta_data.FieldMetaData("pendingTaskQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.IDLE_WORKER_QTY, new org.apache.thrift.meta_data.FieldMetaData("idleWorkerQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    tmpMap.put(_Fields.WORKER_QTY, new org.apache.thrift.meta_data.FieldMetaData("workerQty", org.apache.thrift.TFieldRequirementType.REQUIRED, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+    metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+    org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(ServerStats.class, metaDataMap);
+  }
+
+  public ServerStats() {
+  }
+
+  public ServerStats(
+    double uptime,
+    java.util.List<MethodStats> methods,
+    MethodStats queueWait,
+    long pendingTaskQty,
+    long idleWorkerQty,
+    long workerQty)
+  {
+    this();
+    this.uptime = uptime;
+    setUptimeIsSet(true);
+    this.methods = methods;
+    this.queueWait = queueWait;
+    this.pendingTaskQty = pendingTaskQty;
+    setPendingTaskQtyIsSet(true);
+    this.idleWorkerQty = idleWorkerQty;
+    setIdleWorkerQtyIsSet(true);
+    this.workerQty = workerQty;
+    setWorkerQtyIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ServerStats(ServerStats other) {
+    __isset_bitfield = other.__isset_bitfield;
+    this.uptime = other.uptime;
+    if (other.isSetMethods()) {
+      java.util.List<MethodStats> __this__methods = new java.util.ArrayList<MethodStats>(other.methods.size());
+      for (MethodStats other_element : other.methods) {
+        __this__methods.add(new MethodStats(other_element));
+      }
+      this.methods = __this__methods;
+    }
+    if (other.isSetQueueWait()) {
+      this.queueWait = new MethodStats(other.queueWait);
+    }
+    this.pendingTaskQty = other.pendingTaskQty;
+    this.idleWorkerQty = other.idleWorkerQty;
+    this.workerQty = other.workerQty;
+  }
+
+  public ServerStats deepCopy() {
+    return new ServerStats(this);
+  }
+
+  @Override
+  public void clear() {
+    setUptimeIsSet(false);
+    this.uptime = 0.0;
+    this.methods = null;
+    this.queueWait = null;
+    setPendingTaskQtyIsSet(false);
+    this.pendingTaskQty = 0;
+    setIdleWorkerQtyIsSet(false);
+    this.idleWorkerQty = 0;
+    setWorkerQtyIsSet(false);
+    this.workerQty = 0;
+  }
+
+  public double getUptime() {
+    return this.uptime;
+  }
+
+  public ServerStats setUptime(double uptime) {
+    this.uptime = uptime;
+    setUptimeIsSet(true);
+    return this;
+  }
+
+  public void unsetUptime() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __UPTIME_ISSET_ID);
+  }
+
+  /** Returns true if field uptime is set (has been assigned a value) and false otherwise */
+  public boolean isSetUptime() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __UPTIME_ISSET_ID);
+  }
+
+  public void setUptimeIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __UPTIME_ISSET_ID, value);
+  }
+
+  public int getMethodsSize() {
+    return (this.methods == null) ? 0 : this.methods.size();
+  }
+
+  public java.util.Iterator<MethodStats> getMethodsIterator() {
+    return (this.methods == null) ? null : this.methods.iterator();
+  }
+
+  public void addToMethods(MethodStats elem) {
+    if (this.methods == null) {
+      this.methods = new java.util.ArrayList<MethodStats>();
+    }
+    this.methods.add(elem);
+  }
+
+  public java.util.List<MethodStats> getMethods() {
+    return this.methods;
+  }
+
+  public ServerStats setMethods(java.util.List<MethodStats> methods) {
+    this.methods = methods;
+    return this;
+  }
+
+  public void unsetMethods() {
+    this.methods = null;
+  }
+
+  /** Returns true if field methods is set (has been assigned a value) and false otherwise */
+  public boolean isSetMethods() {
+    return this.methods != null;
+  }
+
+  public void setMethodsIsSet(boolean value) {
+    if (!value) {
+      this.methods = null;
+    }
+  }
+
+  public MethodStats getQueueWait() {
+    return this.queueWait;
+  }
+
+  public ServerStats setQueueWait(MethodStats queueWait) {
+    this.queueWait = queueWait;
+    return this;
+  }
+
+  public void unsetQueueWait() {
+    this.queueWait = null;
+  }
+
+  /** Returns true if field queueWait is set (has been assigned a value) and false otherwise */
+  public boolean isSetQueueWait() {
+    return this.queueWait != null;
+  }
+
+  public void setQueueWaitIsSet(boolean value) {
+    if (!value) {
+      this.queueWait = null;
+    }
+  }
+
+  public long getPendingTaskQty() {
+    return this.pendingTaskQty;
+  }
+
+  public ServerStats setPendingTaskQty(long pendingTaskQty) {
+    this.pendingTaskQty = pendingTaskQty;
+    setPendingTaskQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetPendingTaskQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __PENDINGTASKQTY_ISSET_ID);
+  }
+
+  /** Returns true if field pendingTaskQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetPendingTaskQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __PENDINGTASKQTY_ISSET_ID);
+  }
+
+  public void setPendingTaskQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __PENDINGTASKQTY_ISSET_ID, value);
+  }
+
+  public long getIdleWorkerQty() {
+    return this.idleWorkerQty;
+  }
+
+  public ServerStats setIdleWorkerQty(long idleWorkerQty) {
+    this.idleWorkerQty = idleWorkerQty;
+    setIdleWorkerQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetIdleWorkerQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __IDLEWORKERQTY_ISSET_ID);
+  }
+
+  /** Returns true if field idleWorkerQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetIdleWorkerQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __IDLEWORKERQTY_ISSET_ID);
+  }
+
+  public void setIdleWorkerQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __IDLEWORKERQTY_ISSET_ID, value);
+  }
+
+  public long getWorkerQty() {
+    return this.workerQty;
+  }
+
+  public ServerStats setWorkerQty(long workerQty) {
+    this.workerQty = workerQty;
+    setWorkerQtyIsSet(true);
+    return this;
+  }
+
+  public void unsetWorkerQty() {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __WORKERQTY_ISSET_ID);
+  }
+
+  /** Returns true if field workerQty is set (has been assigned a value) and false otherwise */
+  public boolean isSetWorkerQty() {
+    return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __WORKERQTY_ISSET_ID);
+  }
+
+  public void setWorkerQtyIsSet(boolean value) {
+    __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __WORKERQTY_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, java.lang.Object value) {
+    switch (field) {
+    case UPTIME:
+      if (value == null) {
+        unsetUptime();
+      } else {
+        setUptime((java.lang.Double)value);
+      }
+      break;
+
+    case METHODS:
+      if (value == null) {
+        unsetMethods();
+      } else {
+        setMethods((java.util.List<MethodStats>)value);
+      }
+      break;
+
+    case QUEUE_WAIT:
+      if (value == null) {
+        unsetQueueWait();
+      } else {
+        setQueueWait((MethodStats)value);
+      }
+      break;
+
+    case PENDING_TASK_QTY:
+      if (value == null) {
+        unsetPendingTaskQty();
+      } else {
+        setPendingTaskQty((java.lang.Long)value);
+      }
+      break;
+
+    case IDLE_WORKER_QTY:
+      if (value == null) {
+        unsetIdleWorkerQty();
+      } else {
+        setIdleWorkerQty((java.lang.Long)value);
+      }
+      break;
+
+    case WORKER_QTY:
+      if (value == null) {
+        unsetWorkerQty();
+      } else {
+        setWorkerQty((java.lang.Long)value);
+      }
+      break;
+
+    }
+  }
+
+  public java.lang.Object getFieldValue(_Fields field) {
+    switch (field) {
+    case UPTIME:
+      return getUptime();
+
+    case METHODS:
+      return getMethods();
+
+    case QUEUE_WAIT:
+      return getQueueWait();
+
+    case PENDING_TASK_QTY:
+      return getPendingTaskQty();
+
+    case IDLE_WORKER_QTY:
+      return getIdleWorkerQty();
+
+    case WORKER_QTY:
+      return getWorkerQty();
+
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    if (field == null) {
+      throw new java.lang.IllegalArgumentException();
+    }
+
+    switch (field) {
+    case UPTIME:
+      return isSetUptime();
+    case METHODS:
+      return isSetMethods();
+    case QUEUE_WAIT:
+      return isSetQueueWait();
+    case PENDING_TASK_QTY:
+      return isSetPendingTaskQty();
+    case IDLE_WORKER_QTY:
+      return isSetIdleWorkerQty();
+    case WORKER_QTY:
+      return isSetWorkerQty();
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  @Override
+  public boolean equals(java.lang.Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ServerStats)
+      return this.equals((ServerStats)that);
+    return false;
+  }
+
+  public boolean equals(ServerStats that) {
+    if (that == null)
+      return false;
+    if (this == that)
+      return true;
+
+    boolean this_present_uptime = true;
+    boolean that_present_uptime = true;
+    if (this_present_uptime || that_present_uptime) {
+      if (!(this_present_uptime && that_present_uptime))
+        return false;
+      if (this.uptime != that.uptime)
+        return false;
+    }
+
+    boolean this_present_methods = true && this.isSetMethods();
+    boolean that_present_methods = true && that.isSetMethods();
+    if (this_present_methods || that_present_methods) {
+      if (!(this_present_methods && that_present_methods))
+        return false;
+      if (!this.methods.equals(that.methods))
+        return false;
+    }
+
+    boolean this_present_queueWait = true && this.isSetQueueWait();
+    boolean that_present_queueWait = true && that.isSetQueueWait();
+    if (this_present_queueWait || that_present_queueWait) {
+      if (!(this_present_queueWait && that_present_queueWait))
+        return false;
+      if (!this.queueWait.equals(that.queueWait))
+        return false;
+    }
+
+    boolean this_present_pendingTaskQty = true;
+    boolean that_present_pendingTaskQty = true;
+    if (this_present_pendingTaskQty || that_present_pendingTaskQty) {
+      if (!(this_present_pendingTaskQty && that_present_pendingTaskQty))
+        return false;
+      if (this.pendingTaskQty != that.pendingTaskQty)
+        return false;
+    }
+
+    boolean this_present_idleWorkerQty = true;
+    boolean that_present_idleWorkerQty = true;
+    if (this_present_idleWorkerQty || that_present_idleWorkerQty) {
+      if (!(this_present_idleWorkerQty && that_present_idleWorkerQty))
+        return false;
+      if (this.idleWorkerQty != that.idleWorkerQty)
+        return false;
+    }
+
+    boolean this_present_workerQty = true;
+    boolean that_present_workerQty = true;
+    if (this_present_workerQty || that_present_workerQty) {
+      if (!(this_present_workerQty && that_present_workerQty))
+        return false;
+      if (this.workerQty != that.workerQty)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    int hashCode = 1;
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(uptime);
+
+    hashCode = hashCode * 8191 + ((isSetMethods()) ? 131071 : 524287);
+    if (isSetMethods())
+      hashCode = hashCode * 8191 + methods.hashCode();
+
+    hashCode = hashCode * 8191 + ((isSetQueueWait()) ? 131071 : 524287);
+    if (isSetQueueWait())
+      hashCode = hashCode * 8191 + queueWait.hashCode();
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(pendingTaskQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(idleWorkerQty);
+
+    hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(workerQty);
+
+    return hashCode;
+  }
+
+  @Override
+  public int compareTo(ServerStats other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+
+    lastComparison = java.lang.Boolean.valueOf(isSetUptime()).compareTo(other.isSetUptime());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetUptime()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.uptime, other.uptime);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetMethods()).compareTo(other.isSetMethods());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetMethods()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.methods, other.methods);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetQueueWait()).compareTo(other.isSetQueueWait());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetQueueWait()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.queueWait, other.queueWait);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetPendingTaskQty()).compareTo(other.isSetPendingTaskQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetPendingTaskQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.pendingTaskQty, other.pendingTaskQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetIdleWorkerQty()).compareTo(other.isSetIdleWorkerQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetIdleWorkerQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.idleWorkerQty, other.idleWorkerQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.valueOf(isSetWorkerQty()).compareTo(other.isSetWorkerQty());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetWorkerQty()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.workerQty, other.workerQty);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    return 0;
+  }
+
+  public _Fields fieldForId(int fieldId) {
+    return _Fields.findByThriftId(fieldId);
+  }
+
+  public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+    scheme(iprot).read(iprot, this);
+  }
+
+  public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+    scheme(oprot).write(oprot, this);
+  }
+
+  @Override
+  public java.lang.String toString() {
+    java.lang.StringBuilder sb = new java.lang.StringBuilder("ServerStats(");
+    boolean first = true;
+
+    sb.append("uptime:");
+    sb.append(this.uptime);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("methods:");
+    if (this.methods == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.methods);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("queueWait:");
+    if (this.queueWait == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.queueWait);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("pendingTaskQty:");
+    sb.append(this.pendingTaskQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("idleWorkerQty:");
+    sb.append(this.idleWorkerQty);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("workerQty:");
+    sb.append(this.workerQty);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws org.apache.thrift.TException {
+    // check for required fields
+    // alas, we cannot check 'uptime' because it's a primitive and you chose the non-beans generator.
+    if (methods == null) {
+      throw new org.apache.thrift.protocol.TProtocolException("Required field 'methods' was not present! Struct: " + toString());
+    }
+    if (queueWait == null) {
+      throw new org.apache.thrift.protocol.TProtocolException("Required field 'queueWait' was not present! Struct: " + toString());
+    }
+    // alas, we cannot check 'pendingTaskQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'idleWorkerQty' because it's a primitive and you chose the non-beans generator.
+    // alas, we cannot check 'workerQty' because it's a primitive and you chose the non-beans generator.
+    // check for sub-struct validity
+    if (queueWait != null) {
+      queueWait.validate();
+    }
+  }
+
+  private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+    try {
+      write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+    try {
+      // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+      __isset_bitfield = 0;
+      read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private static class ServerStatsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public ServerStatsStandardScheme getScheme() {
+      return new ServerStatsStandardScheme();
+    }
+  }
+
+  private static class ServerStatsStandardScheme extends org.apache.thrift.scheme.StandardScheme<ServerStats> {
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot, ServerStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TField schemeField;
+      iprot.readStructBegin();
+      while (true)
+      {
+        schemeField = iprot.readFieldBegin();
+        if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+          break;
+        }
+        switch (schemeField.id) {
+          case 1: // UPTIME
+            if (schemeField.type == org.apache.thrift.protocol.TType.DOUBLE) {
+              struct.uptime = iprot.readDouble();
+              struct.setUptimeIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 2: // METHODS
+            if (schemeField.type == org.apache.thrift.protocol.TType.LIST) {
+              {
+                org.apache.thrift.protocol.TList _list0 = iprot.readListBegin();
+                struct.methods = new java.util.ArrayList<MethodStats>(_list0.size);
+                MethodStats _elem1;
+                for (int _i2 = 0; _i2 < _list0.size; ++_i2)
+                {
+                  _elem1 = new MethodStats();
+                  _elem1.read(iprot);
+                  struct.methods.add(_elem1);
+                }
+                iprot.readListEnd();
+              }
+              struct.setMethodsIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 3: // QUEUE_WAIT
+            if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+              struct.queueWait = new MethodStats();
+              struct.queueWait.read(iprot);
+              struct.setQueueWaitIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 4: // PENDING_TASK_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.pendingTaskQty = iprot.readI64();
+              struct.setPendingTaskQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 5: // IDLE_WORKER_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.idleWorkerQty = iprot.readI64();
+              struct.setIdleWorkerQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 6: // WORKER_QTY
+            if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+              struct.workerQty = iprot.readI64();
+              struct.setWorkerQtyIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          default:
+            org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      if (!struct.isSetUptime()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'uptime' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetPendingTaskQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'pendingTaskQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetIdleWorkerQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'idleWorkerQty' was not found in serialized data! Struct: " + toString());
+      }
+      if (!struct.isSetWorkerQty()) {
+        throw new org.apache.thrift.protocol.TProtocolException("Required field 'workerQty' was not found in serialized data! Struct: " + toString());
+      }
+      struct.validate();
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot, ServerStats struct) throws org.apache.thrift.TException {
+      struct.validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      oprot.writeFieldBegin(UPTIME_FIELD_DESC);
+      oprot.writeDouble(struct.uptime);
+      oprot.writeFieldEnd();
+      if (struct.methods != null) {
+        oprot.writeFieldBegin(METHODS_FIELD_DESC);
+        {
+          oprot.writeListBegin(new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, struct.methods.size()));
+          for (MethodStats _iter3 : struct.methods)
+          {
+            _iter3.write(oprot);
+          }
+          oprot.writeListEnd();
+        }
+        oprot.writeFieldEnd();
+      }
+      if (struct.queueWait != null) {
+        oprot.writeFieldBegin(QUEUE_WAIT_FIELD_DESC);
+        struct.queueWait.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(PENDING_TASK_QTY_FIELD_DESC);
+      oprot.writeI64(struct.pendingTaskQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(IDLE_WORKER_QTY_FIELD_DESC);
+      oprot.writeI64(struct.idleWorkerQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(WORKER_QTY_FIELD_DESC);
+      oprot.writeI64(struct.workerQty);
+      oprot.writeFieldEnd();
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+  }
+
+  private static class ServerStatsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public ServerStatsTupleScheme getScheme() {
+      return new ServerStatsTupleScheme();
+    }
+  }
+
+  private static class ServerStatsTupleScheme extends org.apache.thrift.scheme.TupleScheme<ServerStats> {
+
+    @Override
+    public void write(org.apache.thrift.protocol.TProtocol prot, ServerStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      oprot.writeDouble(struct.uptime);
+      {
+        oprot.writeI32(struct.methods.size());
+        for (MethodStats _iter4 : struct.methods)
+        {
+          _iter4.write(oprot);
+        }
+      }
+      struct.queueWait.write(oprot);
+      oprot.writeI64(struct.pendingTaskQty);
+      oprot.writeI64(struct.idleWorkerQty);
+      oprot.writeI64(struct.workerQty);
+    }
+
+    @Override
+    public void read(org.apache.thrift.protocol.TProtocol prot, ServerStats struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      struct.uptime = iprot.readDouble();
+      struct.setUptimeIsSet(true);
+      {
+        org.apache.thrift.protocol.TList _list5 = new org.apache.thrift.protocol.TList(org.apache.thrift.protocol.TType.STRUCT, iprot.readI32());
+        struct.methods = new java.util.ArrayList<MethodStats>(_list5.size);
+        MethodStats _elem6;
+        for (int _i7 = 0; _i7 < _list5.size; ++_i7)
+        {
+          _elem6 = new MethodStats();
+          _elem6.read(iprot);
+          struct.methods.add(_elem6);
+        }
+      }
+      struct.setMethodsIsSet(true);
+      struct.queueWait = new MethodStats();
+      struct.queueWait.read(iprot);
+      struct.setQueueWaitIsSet(true);
+      struct.pendingTaskQty = iprot.readI64();
+      struct.setPendingTaskQtyIsSet(true);
+      struct.idleWorkerQty = iprot.readI64();
+      struct.setIdleWorkerQtyIsSet(true);
+      struct.workerQty = iprot.readI64();
+      struct.setWorkerQtyIsSet(true);
+    }
+  }
+
+  private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+    return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+  }
+}
+
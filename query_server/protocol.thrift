@@ -9,11 +9,60 @@ struct ReplyEntry {
 }
 
 typedef list<ReplyEntry> ReplyEntryList
+typedef list<ReplyEntryList> ReplyEntryListList
 
 exception QueryException {
     1: string message;
 }
 
+struct CacheStats {
+  1: required i64 hitQty ;    // the number of queries answered using the result cache
+  2: required i64 missQty ;   // the number of queries that were not found in the cache
+  3: required i64 entryQty ;  // the number of cached query results
+  4: required i64 memUsed ;   // the (estimated) amount of memory used by cached results, in bytes
+  5: required i64 memBudget ; // the cache memory budget in bytes (zero means that the cache is disabled)
+}
+
+/*
+ * Latencies are in milliseconds, percentiles are computed
+ * using a histogram with about 3% relative precision.
+ */
+struct MethodStats {
+  1: required string name ;
+  2: required i64 requestQty ;    // the number of requests since the server start
+  3: required i64 errorQty ;      // the number of requests that ended with an exception
+  4: required i64 inFlightQty ;   // the number of requests that are being processed now
+  5: required double qps ;        // the number of requests per second during the last minute
+  6: required double p50 ;
+  7: required double p90 ;
+  8: required double p99 ;
+  9: required double p999 ;
+  10: required double maxLatency ;
+}
+
+struct ServerStats {
+  1: required double uptime ;           // seconds since the server start
+  2: required list<MethodStats> methods ;
+  /*
+   * In the thread-pool server, each connection is processed by one worker
+   * thread: if all of them are busy, a new connection waits in the queue.
+   * The queue wait time is given by the method entry "queueWait".
+   */
+  3: required MethodStats queueWait ;
+  4: required i64 pendingTaskQty ;      // connections waiting for a worker thread
+  5: required i64 idleWorkerQty ;
+  6: required i64 workerQty ;
+}
+
+/*
+ * Query objects are normally sent using the same string representation
+ * as objects in data files. If the flag binaryQuery is set, a query object
+ * is sent as a raw buffer instead (no text formatting/parsing on either side):
+ *   - a dense vector is an array of little-endian float32 values
+ *     (for the space l2sqr_sift, it is an array of 128 uint8 values);
+ *   - a sparse vector is an array of (little-endian uint32 id, little-endian float32 value) pairs.
+ */
+
 service QueryService {
   /*
    * This function allows one to set query-time parameters.
@@ -29,12 +78,33 @@ service QueryService {
   ReplyEntryList knnQuery(1: required i32 k,           // k as in k-NN
                           2: required binary queryObj, // a binary/string representation of a query object 
                           3: required bool retExternId,// if true, we will return an external ID
-                          4: required bool retObj)     // if true, we will return a string representation of each answer object
+                          4: required bool retObj,     // if true, we will return a string representation of each answer object
+                          5: bool binaryQuery)         // if true, a query object uses the binary encoding (see above)
   throws (1: QueryException err),
   ReplyEntryList rangeQuery(1: required double r,      // a range value in the range search
                           2: required binary queryObj, // a binary/string representation of a query object 
                           3: required bool retExternId,// if true, we will return an external ID
-                          4: required bool retObj)     // if true, we will return a string representation of each answer object
+                          4: required bool retObj,     // if true, we will return a string representation of each answer object
+                          5: bool binaryQuery)         // if true, a query object uses the binary encoding (see above)
+  throws (1: QueryException err),
+
+  /*
+   * Batched versions of knnQuery and rangeQuery: the server executes
+   * queries in parallel and returns one result list per query object
+   * (in the same order as query objects). The whole batch costs only
+   * one round trip.
+   */
+  ReplyEntryListList knnQueryBatch(1: required i32 k,                  // k as in k-NN
+                                   2: required list<binary> queryObjs, // binary/string representations of query objects
+                                   3: required bool retExternId,       // if true, we will return an external ID
+                                   4: required bool retObj,            // if true, we will return a string representation of each answer object
+                                   5: bool binaryQuery)                // if true, query objects use the binary encoding (see above)
+  throws (1: QueryException err),
+  ReplyEntryListList rangeQueryBatch(1: required double r,               // a range value in the range search
+                                     2: required list<binary> queryObjs, // binary/string representations of query objects
+                                     3: required bool retExternId,       // if true, we will return an external ID
+                                     4: required bool retObj,            // if true, we will return a string representation of each answer object
+                                     5: bool binaryQuery)                // if true, query objects use the binary encoding (see above)
   throws (1: QueryException err),
 
   /*
@@ -43,5 +113,34 @@ service QueryService {
    */
   double getDistance(1: required binary obj1,
                      2: required binary obj2)
+  throws (1: QueryException err),
+
+  /*
+   * Return statistics of the query result cache. The cache is
+   * cleared every time query-time parameters are changed.
+   */
+  CacheStats getCacheStats()
+  throws (1: QueryException err),
+
+  /*
+   * Load a new data set and index while serving queries using the current
+   * ones. When the new index is ready, it replaces the current one:
+   * queries that are already running finish using the old index.
+   * The call returns after the replacement. Data and index files
+   * are read in the same way as on the server start:
+   * if cacheData is true, the data is loaded from loadIndexLoc + ".dat";
+   * if loadIndexLoc is empty or doesn't exist, the index is created
+   * using the server index-time parameters. Current query-time
+   * parameters are applied to the new index.
+   */
+  void reloadIndex(1: required string dataFile,
+                   2: required string loadIndexLoc,
+                   3: required bool cacheData)
+  throws (1: QueryException err),
+
+  /*
+   * Return request counts, throughput, and latency statistics.
+   */
+  ServerStats getStats()
   throws (1: QueryException err)
 }
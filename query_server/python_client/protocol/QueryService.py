@@ -26,23 +26,47 @@ class Iface(object):
         """
         pass
 
-    def knnQuery(self, k, queryObj, retExternId, retObj):
+    def knnQuery(self, k, queryObj, retExternId, retObj, binaryQuery):
         """
         Parameters:
          - k
          - queryObj
          - retExternId
          - retObj
+         - binaryQuery
         """
         pass
 
-    def rangeQuery(self, r, queryObj, retExternId, retObj):
+    def rangeQuery(self, r, queryObj, retExternId, retObj, binaryQuery):
         """
         Parameters:
          - r
          - queryObj
          - retExternId
          - retObj
+         - binaryQuery
+        """
+        pass
+
+    def knnQueryBatch(self, k, queryObjs, retExternId, retObj, binaryQuery):
+        """
+        Parameters:
+         - k
+         - queryObjs
+         - retExternId
+         - retObj
+         - binaryQuery
+        """
+        pass
+
+    def rangeQueryBatch(self, r, queryObjs, retExternId, retObj, binaryQuery):
+        """
+        Parameters:
+         - r
+         - queryObjs
+         - retExternId
+         - retObj
+         - binaryQuery
         """
         pass
 
@@ -54,6 +78,21 @@ class Iface(object):
         """
         pass
 
+    def getCacheStats(self):
+        pass
+
+    def reloadIndex(self, dataFile, loadIndexLoc, cacheData):
+        """
+        Parameters:
+         - dataFile
+         - loadIndexLoc
+         - cacheData
+        """
+        pass
+
+    def getStats(self):
+        pass
+
 
 class Client(Iface):
     def __init__(self, iprot, oprot=None):
@@ -93,24 +132,26 @@ class Client(Iface):
             raise result.err
         return
 
-    def knnQuery(self, k, queryObj, retExternId, retObj):
+    def knnQuery(self, k, queryObj, retExternId, retObj, binaryQuery):
         """
         Parameters:
          - k
          - queryObj
          - retExternId
          - retObj
+         - binaryQuery
         """
-        self.send_knnQuery(k, queryObj, retExternId, retObj)
+        self.send_knnQuery(k, queryObj, retExternId, retObj, binaryQuery)
         return self.recv_knnQuery()
 
-    def send_knnQuery(self, k, queryObj, retExternId, retObj):
+    def send_knnQuery(self, k, queryObj, retExternId, retObj, binaryQuery):
         self._oprot.writeMessageBegin('knnQuery', TMessageType.CALL, self._seqid)
         args = knnQuery_args()
         args.k = k
         args.queryObj = queryObj
         args.retExternId = retExternId
         args.retObj = retObj
+        args.binaryQuery = binaryQuery
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -132,24 +173,26 @@ class Client(Iface):
             raise result.err
         raise TApplicationException(TApplicationException.MISSING_RESULT, "knnQuery failed: unknown result")
 
-    def rangeQuery(self, r, queryObj, retExternId, retObj):
+    def rangeQuery(self, r, queryObj, retExternId, retObj, binaryQuery):
         """
         Parameters:
          - r
          - queryObj
          - retExternId
          - retObj
+         - binaryQuery
         """
-        self.send_rangeQuery(r, queryObj, retExternId, retObj)
+        self.send_rangeQuery(r, queryObj, retExternId, retObj, binaryQuery)
         return self.recv_rangeQuery()
 
-    def send_rangeQuery(self, r, queryObj, retExternId, retObj):
+    def send_rangeQuery(self, r, queryObj, retExternId, retObj, binaryQuery):
         self._oprot.writeMessageBegin('rangeQuery', TMessageType.CALL, self._seqid)
         args = rangeQuery_args()
         args.r = r
         args.queryObj = queryObj
         args.retExternId = retExternId
         args.retObj = retObj
+        args.binaryQuery = binaryQuery
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
@@ -171,6 +214,88 @@ class Client(Iface):
             raise result.err
         raise TApplicationException(TApplicationException.MISSING_RESULT, "rangeQuery failed: unknown result")
 
+    def knnQueryBatch(self, k, queryObjs, retExternId, retObj, binaryQuery):
+        """
+        Parameters:
+         - k
+         - queryObjs
+         - retExternId
+         - retObj
+         - binaryQuery
+        """
+        self.send_knnQueryBatch(k, queryObjs, retExternId, retObj, binaryQuery)
+        return self.recv_knnQueryBatch()
+
+    def send_knnQueryBatch(self, k, queryObjs, retExternId, retObj, binaryQuery):
+        self._oprot.writeMessageBegin('knnQueryBatch', TMessageType.CALL, self._seqid)
+        args = knnQueryBatch_args()
+        args.k = k
+        args.queryObjs = queryObjs
+        args.retExternId = retExternId
+        args.retObj = retObj
+        args.binaryQuery = binaryQuery
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_knnQueryBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = knnQueryBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.err is not None:
+            raise result.err
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "knnQueryBatch failed: unknown result")
+
+    def rangeQueryBatch(self, r, queryObjs, retExternId, retObj, binaryQuery):
+        """
+        Parameters:
+         - r
+         - queryObjs
+         - retExternId
+         - retObj
+         - binaryQuery
+        """
+        self.send_rangeQueryBatch(r, queryObjs, retExternId, retObj, binaryQuery)
+        return self.recv_rangeQueryBatch()
+
+    def send_rangeQueryBatch(self, r, queryObjs, retExternId, retObj, binaryQuery):
+        self._oprot.writeMessageBegin('rangeQueryBatch', TMessageType.CALL, self._seqid)
+        args = rangeQueryBatch_args()
+        args.r = r
+        args.queryObjs = queryObjs
+        args.retExternId = retExternId
+        args.retObj = retObj
+        args.binaryQuery = binaryQuery
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_rangeQueryBatch(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = rangeQueryBatch_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.err is not None:
+            raise result.err
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "rangeQueryBatch failed: unknown result")
+
     def getDistance(self, obj1, obj2):
         """
         Parameters:
@@ -206,6 +331,97 @@ class Client(Iface):
             raise result.err
         raise TApplicationException(TApplicationException.MISSING_RESULT, "getDistance failed: unknown result")
 
+    def getCacheStats(self):
+        self.send_getCacheStats()
+        return self.recv_getCacheStats()
+
+    def send_getCacheStats(self):
+        self._oprot.writeMessageBegin('getCacheStats', TMessageType.CALL, self._seqid)
+        args = getCacheStats_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_getCacheStats(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = getCacheStats_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.err is not None:
+            raise result.err
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "getCacheStats failed: unknown result")
+
+    def reloadIndex(self, dataFile, loadIndexLoc, cacheData):
+        """
+        Parameters:
+         - dataFile
+         - loadIndexLoc
+         - cacheData
+        """
+        self.send_reloadIndex(dataFile, loadIndexLoc, cacheData)
+        self.recv_reloadIndex()
+
+    def send_reloadIndex(self, dataFile, loadIndexLoc, cacheData):
+        self._oprot.writeMessageBegin('reloadIndex', TMessageType.CALL, self._seqid)
+        args = reloadIndex_args()
+        args.dataFile = dataFile
+        args.loadIndexLoc = loadIndexLoc
+        args.cacheData = cacheData
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_reloadIndex(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = reloadIndex_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.err is not None:
+            raise result.err
+        return
+
+    def getStats(self):
+        self.send_getStats()
+        return self.recv_getStats()
+
+    def send_getStats(self):
+        self._oprot.writeMessageBegin('getStats', TMessageType.CALL, self._seqid)
+        args = getStats_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_getStats(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = getStats_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.err is not None:
+            raise result.err
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "getStats failed: unknown result")
+
 
 class Processor(Iface, TProcessor):
     def __init__(self, handler):
@@ -214,7 +430,12 @@ class Processor(Iface, TProcessor):
         self._processMap["setQueryTimeParams"] = Processor.process_setQueryTimeParams
         self._processMap["knnQuery"] = Processor.process_knnQuery
         self._processMap["rangeQuery"] = Processor.process_rangeQuery
+        self._processMap["knnQueryBatch"] = Processor.process_knnQueryBatch
+        self._processMap["rangeQueryBatch"] = Processor.process_rangeQueryBatch
         self._processMap["getDistance"] = Processor.process_getDistance
+        self._processMap["getCacheStats"] = Processor.process_getCacheStats
+        self._processMap["reloadIndex"] = Processor.process_reloadIndex
+        self._processMap["getStats"] = Processor.process_getStats
 
     def process(self, iprot, oprot):
         (name, type, seqid) = iprot.readMessageBegin()
@@ -263,7 +484,7 @@ class Processor(Iface, TProcessor):
         iprot.readMessageEnd()
         result = knnQuery_result()
         try:
-            result.success = self._handler.knnQuery(args.k, args.queryObj, args.retExternId, args.retObj)
+            result.success = self._handler.knnQuery(args.k, args.queryObj, args.retExternId, args.retObj, args.binaryQuery)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -289,7 +510,7 @@ class Processor(Iface, TProcessor):
         iprot.readMessageEnd()
         result = rangeQuery_result()
         try:
-            result.success = self._handler.rangeQuery(args.r, args.queryObj, args.retExternId, args.retObj)
+            result.success = self._handler.rangeQuery(args.r, args.queryObj, args.retExternId, args.retObj, args.binaryQuery)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -309,6 +530,58 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_knnQueryBatch(self, seqid, iprot, oprot):
+        args = knnQueryBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = knnQueryBatch_result()
+        try:
+            result.success = self._handler.knnQueryBatch(args.k, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except QueryException as err:
+            msg_type = TMessageType.REPLY
+            result.err = err
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("knnQueryBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_rangeQueryBatch(self, seqid, iprot, oprot):
+        args = rangeQueryBatch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = rangeQueryBatch_result()
+        try:
+            result.success = self._handler.rangeQueryBatch(args.r, args.queryObjs, args.retExternId, args.retObj, args.binaryQuery)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except QueryException as err:
+            msg_type = TMessageType.REPLY
+            result.err = err
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("rangeQueryBatch", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
     def process_getDistance(self, seqid, iprot, oprot):
         args = getDistance_args()
         args.read(iprot)
@@ -335,6 +608,84 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_getCacheStats(self, seqid, iprot, oprot):
+        args = getCacheStats_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = getCacheStats_result()
+        try:
+            result.success = self._handler.getCacheStats()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except QueryException as err:
+            msg_type = TMessageType.REPLY
+            result.err = err
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("getCacheStats", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_reloadIndex(self, seqid, iprot, oprot):
+        args = reloadIndex_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reloadIndex_result()
+        try:
+            self._handler.reloadIndex(args.dataFile, args.loadIndexLoc, args.cacheData)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except QueryException as err:
+            msg_type = TMessageType.REPLY
+            result.err = err
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("reloadIndex", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_getStats(self, seqid, iprot, oprot):
+        args = getStats_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = getStats_result()
+        try:
+            result.success = self._handler.getStats()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except QueryException as err:
+            msg_type = TMessageType.REPLY
+            result.err = err
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("getStats", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
 # HELPER FUNCTIONS AND STRUCTURES
 
 
@@ -470,14 +821,16 @@ class knnQuery_args(object):
      - queryObj
      - retExternId
      - retObj
+     - binaryQuery
     """
 
 
-    def __init__(self, k=None, queryObj=None, retExternId=None, retObj=None,):
+    def __init__(self, k=None, queryObj=None, retExternId=None, retObj=None, binaryQuery=None,):
         self.k = k
         self.queryObj = queryObj
         self.retExternId = retExternId
         self.retObj = retObj
+        self.binaryQuery = binaryQuery
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -508,6 +861,11 @@ class knnQuery_args(object):
                     self.retObj = iprot.readBool()
                 else:
                     iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.binaryQuery = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -534,6 +892,10 @@ class knnQuery_args(object):
             oprot.writeFieldBegin('retObj', TType.BOOL, 4)
             oprot.writeBool(self.retObj)
             oprot.writeFieldEnd()
+        if self.binaryQuery is not None:
+            oprot.writeFieldBegin('binaryQuery', TType.BOOL, 5)
+            oprot.writeBool(self.binaryQuery)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -565,6 +927,7 @@ knnQuery_args.thrift_spec = (
     (2, TType.STRING, 'queryObj', 'BINARY', None, ),  # 2
     (3, TType.BOOL, 'retExternId', None, None, ),  # 3
     (4, TType.BOOL, 'retObj', None, None, ),  # 4
+    (5, TType.BOOL, 'binaryQuery', None, None, ),  # 5
 )
 
 
@@ -592,11 +955,11 @@ class knnQuery_result(object):
             if fid == 0:
                 if ftype == TType.LIST:
                     self.success = []
-                    (_etype3, _size0) = iprot.readListBegin()
-                    for _i4 in range(_size0):
-                        _elem5 = ReplyEntry()
-                        _elem5.read(iprot)
-                        self.success.append(_elem5)
+                    (_etype10, _size7) = iprot.readListBegin()
+                    for _i11 in range(_size7):
+                        _elem12 = ReplyEntry()
+                        _elem12.read(iprot)
+                        self.success.append(_elem12)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -619,8 +982,8 @@ class knnQuery_result(object):
         if self.success is not None:
             oprot.writeFieldBegin('success', TType.LIST, 0)
             oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter6 in self.success:
-                iter6.write(oprot)
+            for iter13 in self.success:
+                iter13.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.err is not None:
@@ -657,14 +1020,16 @@ class rangeQuery_args(object):
      - queryObj
      - retExternId
      - retObj
+     - binaryQuery
     """
 
 
-    def __init__(self, r=None, queryObj=None, retExternId=None, retObj=None,):
+    def __init__(self, r=None, queryObj=None, retExternId=None, retObj=None, binaryQuery=None,):
         self.r = r
         self.queryObj = queryObj
         self.retExternId = retExternId
         self.retObj = retObj
+        self.binaryQuery = binaryQuery
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -695,7 +1060,12 @@ class rangeQuery_args(object):
                     self.retObj = iprot.readBool()
                 else:
                     iprot.skip(ftype)
-            else:
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.binaryQuery = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
         iprot.readStructEnd()
@@ -721,6 +1091,10 @@ class rangeQuery_args(object):
             oprot.writeFieldBegin('retObj', TType.BOOL, 4)
             oprot.writeBool(self.retObj)
             oprot.writeFieldEnd()
+        if self.binaryQuery is not None:
+            oprot.writeFieldBegin('binaryQuery', TType.BOOL, 5)
+            oprot.writeBool(self.binaryQuery)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -752,6 +1126,7 @@ rangeQuery_args.thrift_spec = (
     (2, TType.STRING, 'queryObj', 'BINARY', None, ),  # 2
     (3, TType.BOOL, 'retExternId', None, None, ),  # 3
     (4, TType.BOOL, 'retObj', None, None, ),  # 4
+    (5, TType.BOOL, 'binaryQuery', None, None, ),  # 5
 )
 
 
@@ -779,11 +1154,11 @@ class rangeQuery_result(object):
             if fid == 0:
                 if ftype == TType.LIST:
                     self.success = []
-                    (_etype10, _size7) = iprot.readListBegin()
-                    for _i11 in range(_size7):
-                        _elem12 = ReplyEntry()
-                        _elem12.read(iprot)
-                        self.success.append(_elem12)
+                    (_etype17, _size14) = iprot.readListBegin()
+                    for _i18 in range(_size14):
+                        _elem19 = ReplyEntry()
+                        _elem19.read(iprot)
+                        self.success.append(_elem19)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -806,8 +1181,8 @@ class rangeQuery_result(object):
         if self.success is not None:
             oprot.writeFieldBegin('success', TType.LIST, 0)
             oprot.writeListBegin(TType.STRUCT, len(self.success))
-            for iter13 in self.success:
-                iter13.write(oprot)
+            for iter20 in self.success:
+                iter20.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.err is not None:
@@ -837,17 +1212,23 @@ rangeQuery_result.thrift_spec = (
 )
 
 
-class getDistance_args(object):
+class knnQueryBatch_args(object):
     """
     Attributes:
-     - obj1
-     - obj2
+     - k
+     - queryObjs
+     - retExternId
+     - retObj
+     - binaryQuery
     """
 
 
-    def __init__(self, obj1=None, obj2=None,):
-        self.obj1 = obj1
-        self.obj2 = obj2
+    def __init__(self, k=None, queryObjs=None, retExternId=None, retObj=None, binaryQuery=None,):
+        self.k = k
+        self.queryObjs = queryObjs
+        self.retExternId = retExternId
+        self.retObj = retObj
+        self.binaryQuery = binaryQuery
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -859,13 +1240,33 @@ class getDistance_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.obj1 = iprot.readBinary()
+                if ftype == TType.I32:
+                    self.k = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.STRING:
-                    self.obj2 = iprot.readBinary()
+                if ftype == TType.LIST:
+                    self.queryObjs = []
+                    (_etype24, _size21) = iprot.readListBegin()
+                    for _i25 in range(_size21):
+                        _elem26 = iprot.readBinary()
+                        self.queryObjs.append(_elem26)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.BOOL:
+                    self.retExternId = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.BOOL:
+                    self.retObj = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.binaryQuery = iprot.readBool()
                 else:
                     iprot.skip(ftype)
             else:
@@ -877,23 +1278,42 @@ class getDistance_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('getDistance_args')
-        if self.obj1 is not None:
-            oprot.writeFieldBegin('obj1', TType.STRING, 1)
-            oprot.writeBinary(self.obj1)
+        oprot.writeStructBegin('knnQueryBatch_args')
+        if self.k is not None:
+            oprot.writeFieldBegin('k', TType.I32, 1)
+            oprot.writeI32(self.k)
             oprot.writeFieldEnd()
-        if self.obj2 is not None:
-            oprot.writeFieldBegin('obj2', TType.STRING, 2)
-            oprot.writeBinary(self.obj2)
+        if self.queryObjs is not None:
+            oprot.writeFieldBegin('queryObjs', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.queryObjs))
+            for iter27 in self.queryObjs:
+                oprot.writeBinary(iter27)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.retExternId is not None:
+            oprot.writeFieldBegin('retExternId', TType.BOOL, 3)
+            oprot.writeBool(self.retExternId)
+            oprot.writeFieldEnd()
+        if self.retObj is not None:
+            oprot.writeFieldBegin('retObj', TType.BOOL, 4)
+            oprot.writeBool(self.retObj)
+            oprot.writeFieldEnd()
+        if self.binaryQuery is not None:
+            oprot.writeFieldBegin('binaryQuery', TType.BOOL, 5)
+            oprot.writeBool(self.binaryQuery)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
     def validate(self):
-        if self.obj1 is None:
-            raise TProtocolException(message='Required field obj1 is unset!')
-        if self.obj2 is None:
-            raise TProtocolException(message='Required field obj2 is unset!')
+        if self.k is None:
+            raise TProtocolException(message='Required field k is unset!')
+        if self.queryObjs is None:
+            raise TProtocolException(message='Required field queryObjs is unset!')
+        if self.retExternId is None:
+            raise TProtocolException(message='Required field retExternId is unset!')
+        if self.retObj is None:
+            raise TProtocolException(message='Required field retObj is unset!')
         return
 
     def __repr__(self):
@@ -906,15 +1326,18 @@ class getDistance_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(getDistance_args)
-getDistance_args.thrift_spec = (
+all_structs.append(knnQueryBatch_args)
+knnQueryBatch_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRING, 'obj1', 'BINARY', None, ),  # 1
-    (2, TType.STRING, 'obj2', 'BINARY', None, ),  # 2
+    (1, TType.I32, 'k', None, None, ),  # 1
+    (2, TType.LIST, 'queryObjs', (TType.STRING, 'BINARY', False), None, ),  # 2
+    (3, TType.BOOL, 'retExternId', None, None, ),  # 3
+    (4, TType.BOOL, 'retObj', None, None, ),  # 4
+    (5, TType.BOOL, 'binaryQuery', None, None, ),  # 5
 )
 
 
-class getDistance_result(object):
+class knnQueryBatch_result(object):
     """
     Attributes:
      - success
@@ -936,8 +1359,19 @@ class getDistance_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.DOUBLE:
-                    self.success = iprot.readDouble()
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype31, _size28) = iprot.readListBegin()
+                    for _i32 in range(_size28):
+                        _elem33 = []
+                        (_etype37, _size34) = iprot.readListBegin()
+                        for _i38 in range(_size34):
+                            _elem39 = ReplyEntry()
+                            _elem39.read(iprot)
+                            _elem33.append(_elem39)
+                        iprot.readListEnd()
+                        self.success.append(_elem33)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 1:
@@ -955,10 +1389,16 @@ class getDistance_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('getDistance_result')
+        oprot.writeStructBegin('knnQueryBatch_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.DOUBLE, 0)
-            oprot.writeDouble(self.success)
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.LIST, len(self.success))
+            for iter40 in self.success:
+                oprot.writeListBegin(TType.STRUCT, len(iter40))
+                for iter41 in iter40:
+                    iter41.write(oprot)
+                oprot.writeListEnd()
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.err is not None:
             oprot.writeFieldBegin('err', TType.STRUCT, 1)
@@ -980,9 +1420,759 @@ class getDistance_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(getDistance_result)
-getDistance_result.thrift_spec = (
-    (0, TType.DOUBLE, 'success', None, None, ),  # 0
+all_structs.append(knnQueryBatch_result)
+knnQueryBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.LIST, (TType.STRUCT, [ReplyEntry, None], False), False), None, ),  # 0
+    (1, TType.STRUCT, 'err', [QueryException, None], None, ),  # 1
+)
+
+
+class rangeQueryBatch_args(object):
+    """
+    Attributes:
+     - r
+     - queryObjs
+     - retExternId
+     - retObj
+     - binaryQuery
+    """
+
+
+    def __init__(self, r=None, queryObjs=None, retExternId=None, retObj=None, binaryQuery=None,):
+        self.r = r
+        self.queryObjs = queryObjs
+        self.retExternId = retExternId
+        self.retObj = retObj
+        self.binaryQuery = binaryQuery
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.DOUBLE:
+                    self.r = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.queryObjs = []
+                    (_etype45, _size42) = iprot.readListBegin()
+                    for _i46 in range(_size42):
+                        _elem47 = iprot.readBinary()
+                        self.queryObjs.append(_elem47)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.BOOL:
+                    self.retExternId = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.BOOL:
+                    self.retObj = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.binaryQuery = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('rangeQueryBatch_args')
+        if self.r is not None:
+            oprot.writeFieldBegin('r', TType.DOUBLE, 1)
+            oprot.writeDouble(self.r)
+            oprot.writeFieldEnd()
+        if self.queryObjs is not None:
+            oprot.writeFieldBegin('queryObjs', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.queryObjs))
+            for iter48 in self.queryObjs:
+                oprot.writeBinary(iter48)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.retExternId is not None:
+            oprot.writeFieldBegin('retExternId', TType.BOOL, 3)
+            oprot.writeBool(self.retExternId)
+            oprot.writeFieldEnd()
+        if self.retObj is not None:
+            oprot.writeFieldBegin('retObj', TType.BOOL, 4)
+            oprot.writeBool(self.retObj)
+            oprot.writeFieldEnd()
+        if self.binaryQuery is not None:
+            oprot.writeFieldBegin('binaryQuery', TType.BOOL, 5)
+            oprot.writeBool(self.binaryQuery)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        if self.r is None:
+            raise TProtocolException(message='Required field r is unset!')
+        if self.queryObjs is None:
+            raise TProtocolException(message='Required field queryObjs is unset!')
+        if self.retExternId is None:
+            raise TProtocolException(message='Required field retExternId is unset!')
+        if self.retObj is None:
+            raise TProtocolException(message='Required field retObj is unset!')
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(rangeQueryBatch_args)
+rangeQueryBatch_args.thrift_spec = (
+    None,  # 0
+    (1, TType.DOUBLE, 'r', None, None, ),  # 1
+    (2, TType.LIST, 'queryObjs', (TType.STRING, 'BINARY', False), None, ),  # 2
+    (3, TType.BOOL, 'retExternId', None, None, ),  # 3
+    (4, TType.BOOL, 'retObj', None, None, ),  # 4
+    (5, TType.BOOL, 'binaryQuery', None, None, ),  # 5
+)
+
+
+class rangeQueryBatch_result(object):
+    """
+    Attributes:
+     - success
+     - err
+    """
+
+
+    def __init__(self, success=None, err=None,):
+        self.success = success
+        self.err = err
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype52, _size49) = iprot.readListBegin()
+                    for _i53 in range(_size49):
+                        _elem54 = []
+                        (_etype58, _size55) = iprot.readListBegin()
+                        for _i59 in range(_size55):
+                            _elem60 = ReplyEntry()
+                            _elem60.read(iprot)
+                            _elem54.append(_elem60)
+                        iprot.readListEnd()
+                        self.success.append(_elem54)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.err = QueryException()
+                    self.err.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('rangeQueryBatch_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.LIST, len(self.success))
+            for iter61 in self.success:
+                oprot.writeListBegin(TType.STRUCT, len(iter61))
+                for iter62 in iter61:
+                    iter62.write(oprot)
+                oprot.writeListEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.err is not None:
+            oprot.writeFieldBegin('err', TType.STRUCT, 1)
+            self.err.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(rangeQueryBatch_result)
+rangeQueryBatch_result.thrift_spec = (
+    (0, TType.LIST, 'success', (TType.LIST, (TType.STRUCT, [ReplyEntry, None], False), False), None, ),  # 0
+    (1, TType.STRUCT, 'err', [QueryException, None], None, ),  # 1
+)
+
+
+class getDistance_args(object):
+    """
+    Attributes:
+     - obj1
+     - obj2
+    """
+
+
+    def __init__(self, obj1=None, obj2=None,):
+        self.obj1 = obj1
+        self.obj2 = obj2
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.obj1 = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.obj2 = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('getDistance_args')
+        if self.obj1 is not None:
+            oprot.writeFieldBegin('obj1', TType.STRING, 1)
+            oprot.writeBinary(self.obj1)
+            oprot.writeFieldEnd()
+        if self.obj2 is not None:
+            oprot.writeFieldBegin('obj2', TType.STRING, 2)
+            oprot.writeBinary(self.obj2)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        if self.obj1 is None:
+            raise TProtocolException(message='Required field obj1 is unset!')
+        if self.obj2 is None:
+            raise TProtocolException(message='Required field obj2 is unset!')
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(getDistance_args)
+getDistance_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'obj1', 'BINARY', None, ),  # 1
+    (2, TType.STRING, 'obj2', 'BINARY', None, ),  # 2
+)
+
+
+class getDistance_result(object):
+    """
+    Attributes:
+     - success
+     - err
+    """
+
+
+    def __init__(self, success=None, err=None,):
+        self.success = success
+        self.err = err
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.DOUBLE:
+                    self.success = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.err = QueryException()
+                    self.err.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('getDistance_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.DOUBLE, 0)
+            oprot.writeDouble(self.success)
+            oprot.writeFieldEnd()
+        if self.err is not None:
+            oprot.writeFieldBegin('err', TType.STRUCT, 1)
+            self.err.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(getDistance_result)
+getDistance_result.thrift_spec = (
+    (0, TType.DOUBLE, 'success', None, None, ),  # 0
+    (1, TType.STRUCT, 'err', [QueryException, None], None, ),  # 1
+)
+
+
+class getCacheStats_args(object):
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('getCacheStats_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(getCacheStats_args)
+getCacheStats_args.thrift_spec = (
+)
+
+
+class getCacheStats_result(object):
+    """
+    Attributes:
+     - success
+     - err
+    """
+
+
+    def __init__(self, success=None, err=None,):
+        self.success = success
+        self.err = err
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = CacheStats()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.err = QueryException()
+                    self.err.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('getCacheStats_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.err is not None:
+            oprot.writeFieldBegin('err', TType.STRUCT, 1)
+            self.err.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(getCacheStats_result)
+getCacheStats_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [CacheStats, None], None, ),  # 0
+    (1, TType.STRUCT, 'err', [QueryException, None], None, ),  # 1
+)
+
+
+class reloadIndex_args(object):
+    """
+    Attributes:
+     - dataFile
+     - loadIndexLoc
+     - cacheData
+    """
+
+
+    def __init__(self, dataFile=None, loadIndexLoc=None, cacheData=None,):
+        self.dataFile = dataFile
+        self.loadIndexLoc = loadIndexLoc
+        self.cacheData = cacheData
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.dataFile = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.loadIndexLoc = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.BOOL:
+                    self.cacheData = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reloadIndex_args')
+        if self.dataFile is not None:
+            oprot.writeFieldBegin('dataFile', TType.STRING, 1)
+            oprot.writeString(self.dataFile.encode('utf-8') if sys.version_info[0] == 2 else self.dataFile)
+            oprot.writeFieldEnd()
+        if self.loadIndexLoc is not None:
+            oprot.writeFieldBegin('loadIndexLoc', TType.STRING, 2)
+            oprot.writeString(self.loadIndexLoc.encode('utf-8') if sys.version_info[0] == 2 else self.loadIndexLoc)
+            oprot.writeFieldEnd()
+        if self.cacheData is not None:
+            oprot.writeFieldBegin('cacheData', TType.BOOL, 3)
+            oprot.writeBool(self.cacheData)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        if self.dataFile is None:
+            raise TProtocolException(message='Required field dataFile is unset!')
+        if self.loadIndexLoc is None:
+            raise TProtocolException(message='Required field loadIndexLoc is unset!')
+        if self.cacheData is None:
+            raise TProtocolException(message='Required field cacheData is unset!')
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reloadIndex_args)
+reloadIndex_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'dataFile', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'loadIndexLoc', 'UTF8', None, ),  # 2
+    (3, TType.BOOL, 'cacheData', None, None, ),  # 3
+)
+
+
+class reloadIndex_result(object):
+    """
+    Attributes:
+     - err
+    """
+
+
+    def __init__(self, err=None,):
+        self.err = err
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.err = QueryException()
+                    self.err.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reloadIndex_result')
+        if self.err is not None:
+            oprot.writeFieldBegin('err', TType.STRUCT, 1)
+            self.err.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reloadIndex_result)
+reloadIndex_result.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'err', [QueryException, None], None, ),  # 1
+)
+
+
+class getStats_args(object):
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('getStats_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(getStats_args)
+getStats_args.thrift_spec = (
+)
+
+
+class getStats_result(object):
+    """
+    Attributes:
+     - success
+     - err
+    """
+
+
+    def __init__(self, success=None, err=None,):
+        self.success = success
+        self.err = err
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = ServerStats()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.err = QueryException()
+                    self.err.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('getStats_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.err is not None:
+            oprot.writeFieldBegin('err', TType.STRUCT, 1)
+            self.err.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(getStats_result)
+getStats_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [ServerStats, None], None, ),  # 0
     (1, TType.STRUCT, 'err', [QueryException, None], None, ),  # 1
 )
 fix_spec(all_structs)
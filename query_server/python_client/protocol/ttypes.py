@@ -166,6 +166,424 @@ class QueryException(TException):
 
     def __ne__(self, other):
         return not (self == other)
+
+
+class CacheStats(object):
+    """
+    Attributes:
+     - hitQty
+     - missQty
+     - entryQty
+     - memUsed
+     - memBudget
+    """
+
+
+    def __init__(self, hitQty=None, missQty=None, entryQty=None, memUsed=None, memBudget=None,):
+        self.hitQty = hitQty
+        self.missQty = missQty
+        self.entryQty = entryQty
+        self.memUsed = memUsed
+        self.memBudget = memBudget
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.hitQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.missQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.entryQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.memUsed = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I64:
+                    self.memBudget = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('CacheStats')
+        if self.hitQty is not None:
+            oprot.writeFieldBegin('hitQty', TType.I64, 1)
+            oprot.writeI64(self.hitQty)
+            oprot.writeFieldEnd()
+        if self.missQty is not None:
+            oprot.writeFieldBegin('missQty', TType.I64, 2)
+            oprot.writeI64(self.missQty)
+            oprot.writeFieldEnd()
+        if self.entryQty is not None:
+            oprot.writeFieldBegin('entryQty', TType.I64, 3)
+            oprot.writeI64(self.entryQty)
+            oprot.writeFieldEnd()
+        if self.memUsed is not None:
+            oprot.writeFieldBegin('memUsed', TType.I64, 4)
+            oprot.writeI64(self.memUsed)
+            oprot.writeFieldEnd()
+        if self.memBudget is not None:
+            oprot.writeFieldBegin('memBudget', TType.I64, 5)
+            oprot.writeI64(self.memBudget)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        if self.hitQty is None:
+            raise TProtocolException(message='Required field hitQty is unset!')
+        if self.missQty is None:
+            raise TProtocolException(message='Required field missQty is unset!')
+        if self.entryQty is None:
+            raise TProtocolException(message='Required field entryQty is unset!')
+        if self.memUsed is None:
+            raise TProtocolException(message='Required field memUsed is unset!')
+        if self.memBudget is None:
+            raise TProtocolException(message='Required field memBudget is unset!')
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class MethodStats(object):
+    """
+    Attributes:
+     - name
+     - requestQty
+     - errorQty
+     - inFlightQty
+     - qps
+     - p50
+     - p90
+     - p99
+     - p999
+     - maxLatency
+    """
+
+
+    def __init__(self, name=None, requestQty=None, errorQty=None, inFlightQty=None, qps=None, p50=None, p90=None, p99=None, p999=None, maxLatency=None,):
+        self.name = name
+        self.requestQty = requestQty
+        self.errorQty = errorQty
+        self.inFlightQty = inFlightQty
+        self.qps = qps
+        self.p50 = p50
+        self.p90 = p90
+        self.p99 = p99
+        self.p999 = p999
+        self.maxLatency = maxLatency
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.name = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.requestQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.errorQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.inFlightQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.DOUBLE:
+                    self.qps = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.DOUBLE:
+                    self.p50 = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.DOUBLE:
+                    self.p90 = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.DOUBLE:
+                    self.p99 = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.DOUBLE:
+                    self.p999 = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.DOUBLE:
+                    self.maxLatency = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('MethodStats')
+        if self.name is not None:
+            oprot.writeFieldBegin('name', TType.STRING, 1)
+            oprot.writeString(self.name.encode('utf-8') if sys.version_info[0] == 2 else self.name)
+            oprot.writeFieldEnd()
+        if self.requestQty is not None:
+            oprot.writeFieldBegin('requestQty', TType.I64, 2)
+            oprot.writeI64(self.requestQty)
+            oprot.writeFieldEnd()
+        if self.errorQty is not None:
+            oprot.writeFieldBegin('errorQty', TType.I64, 3)
+            oprot.writeI64(self.errorQty)
+            oprot.writeFieldEnd()
+        if self.inFlightQty is not None:
+            oprot.writeFieldBegin('inFlightQty', TType.I64, 4)
+            oprot.writeI64(self.inFlightQty)
+            oprot.writeFieldEnd()
+        if self.qps is not None:
+            oprot.writeFieldBegin('qps', TType.DOUBLE, 5)
+            oprot.writeDouble(self.qps)
+            oprot.writeFieldEnd()
+        if self.p50 is not None:
+            oprot.writeFieldBegin('p50', TType.DOUBLE, 6)
+            oprot.writeDouble(self.p50)
+            oprot.writeFieldEnd()
+        if self.p90 is not None:
+            oprot.writeFieldBegin('p90', TType.DOUBLE, 7)
+            oprot.writeDouble(self.p90)
+            oprot.writeFieldEnd()
+        if self.p99 is not None:
+            oprot.writeFieldBegin('p99', TType.DOUBLE, 8)
+            oprot.writeDouble(self.p99)
+            oprot.writeFieldEnd()
+        if self.p999 is not None:
+            oprot.writeFieldBegin('p999', TType.DOUBLE, 9)
+            oprot.writeDouble(self.p999)
+            oprot.writeFieldEnd()
+        if self.maxLatency is not None:
+            oprot.writeFieldBegin('maxLatency', TType.DOUBLE, 10)
+            oprot.writeDouble(self.maxLatency)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        if self.name is None:
+            raise TProtocolException(message='Required field name is unset!')
+        if self.requestQty is None:
+            raise TProtocolException(message='Required field requestQty is unset!')
+        if self.errorQty is None:
+            raise TProtocolException(message='Required field errorQty is unset!')
+        if self.inFlightQty is None:
+            raise TProtocolException(message='Required field inFlightQty is unset!')
+        if self.qps is None:
+            raise TProtocolException(message='Required field qps is unset!')
+        if self.p50 is None:
+            raise TProtocolException(message='Required field p50 is unset!')
+        if self.p90 is None:
+            raise TProtocolException(message='Required field p90 is unset!')
+        if self.p99 is None:
+            raise TProtocolException(message='Required field p99 is unset!')
+        if self.p999 is None:
+            raise TProtocolException(message='Required field p999 is unset!')
+        if self.maxLatency is None:
+            raise TProtocolException(message='Required field maxLatency is unset!')
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ServerStats(object):
+    """
+    Attributes:
+     - uptime
+     - methods
+     - queueWait
+     - pendingTaskQty
+     - idleWorkerQty
+     - workerQty
+    """
+
+
+    def __init__(self, uptime=None, methods=None, queueWait=None, pendingTaskQty=None, idleWorkerQty=None, workerQty=None,):
+        self.uptime = uptime
+        self.methods = methods
+        self.queueWait = queueWait
+        self.pendingTaskQty = pendingTaskQty
+        self.idleWorkerQty = idleWorkerQty
+        self.workerQty = workerQty
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.DOUBLE:
+                    self.uptime = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.methods = []
+                    (_etype3, _size0) = iprot.readListBegin()
+                    for _i4 in range(_size0):
+                        _elem5 = MethodStats()
+                        _elem5.read(iprot)
+                        self.methods.append(_elem5)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.queueWait = MethodStats()
+                    self.queueWait.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.pendingTaskQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I64:
+                    self.idleWorkerQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I64:
+                    self.workerQty = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ServerStats')
+        if self.uptime is not None:
+            oprot.writeFieldBegin('uptime', TType.DOUBLE, 1)
+            oprot.writeDouble(self.uptime)
+            oprot.writeFieldEnd()
+        if self.methods is not None:
+            oprot.writeFieldBegin('methods', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRUCT, len(self.methods))
+            for iter6 in self.methods:
+                iter6.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.queueWait is not None:
+            oprot.writeFieldBegin('queueWait', TType.STRUCT, 3)
+            self.queueWait.write(oprot)
+            oprot.writeFieldEnd()
+        if self.pendingTaskQty is not None:
+            oprot.writeFieldBegin('pendingTaskQty', TType.I64, 4)
+            oprot.writeI64(self.pendingTaskQty)
+            oprot.writeFieldEnd()
+        if self.idleWorkerQty is not None:
+            oprot.writeFieldBegin('idleWorkerQty', TType.I64, 5)
+            oprot.writeI64(self.idleWorkerQty)
+            oprot.writeFieldEnd()
+        if self.workerQty is not None:
+            oprot.writeFieldBegin('workerQty', TType.I64, 6)
+            oprot.writeI64(self.workerQty)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        if self.uptime is None:
+            raise TProtocolException(message='Required field uptime is unset!')
+        if self.methods is None:
+            raise TProtocolException(message='Required field methods is unset!')
+        if self.queueWait is None:
+            raise TProtocolException(message='Required field queueWait is unset!')
+        if self.pendingTaskQty is None:
+            raise TProtocolException(message='Required field pendingTaskQty is unset!')
+        if self.idleWorkerQty is None:
+            raise TProtocolException(message='Required field idleWorkerQty is unset!')
+        if self.workerQty is None:
+            raise TProtocolException(message='Required field workerQty is unset!')
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
 all_structs.append(ReplyEntry)
 ReplyEntry.thrift_spec = (
     None,  # 0
@@ -179,5 +597,38 @@ QueryException.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'message', 'UTF8', None, ),  # 1
 )
+all_structs.append(CacheStats)
+CacheStats.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'hitQty', None, None, ),  # 1
+    (2, TType.I64, 'missQty', None, None, ),  # 2
+    (3, TType.I64, 'entryQty', None, None, ),  # 3
+    (4, TType.I64, 'memUsed', None, None, ),  # 4
+    (5, TType.I64, 'memBudget', None, None, ),  # 5
+)
+all_structs.append(MethodStats)
+MethodStats.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'name', 'UTF8', None, ),  # 1
+    (2, TType.I64, 'requestQty', None, None, ),  # 2
+    (3, TType.I64, 'errorQty', None, None, ),  # 3
+    (4, TType.I64, 'inFlightQty', None, None, ),  # 4
+    (5, TType.DOUBLE, 'qps', None, None, ),  # 5
+    (6, TType.DOUBLE, 'p50', None, None, ),  # 6
+    (7, TType.DOUBLE, 'p90', None, None, ),  # 7
+    (8, TType.DOUBLE, 'p99', None, None, ),  # 8
+    (9, TType.DOUBLE, 'p999', None, None, ),  # 9
+    (10, TType.DOUBLE, 'maxLatency', None, None, ),  # 10
+)
+all_structs.append(ServerStats)
+ServerStats.thrift_spec = (
+    None,  # 0
+    (1, TType.DOUBLE, 'uptime', None, None, ),  # 1
+    (2, TType.LIST, 'methods', (TType.STRUCT, [MethodStats, None], False), None, ),  # 2
+    (3, TType.STRUCT, 'queueWait', [MethodStats, None], None, ),  # 3
+    (4, TType.I64, 'pendingTaskQty', None, None, ),  # 4
+    (5, TType.I64, 'idleWorkerQty', None, None, ),  # 5
+    (6, TType.I64, 'workerQty', None, None, ),  # 6
+)
 fix_spec(all_structs)
 del all_structs
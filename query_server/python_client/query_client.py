@@ -1,5 +1,5 @@
 #!/usr/bin/env python
-import sys, glob
+import sys, glob, struct
 
 from thrift import Thrift
 from thrift.transport import TSocket
@@ -13,12 +13,28 @@ from datetime import datetime
 
 ENCODING='utf8'
 
+BINARY_DENSE='dense'
+BINARY_SPARSE='sparse'
+BINARY_UINT8='uint8'
+
 import argparse
 
 def error_exit(s):
   print("Error: %s" % s)
   sys.exit(1)
 
+def encode_query_binary(s, binary_type):
+  """Converts a string representation of a query vector into the binary
+     encoding described in protocol.thrift (little-endian values)."""
+  # sparse vectors are written as id:value pairs
+  items = s.replace(':', ' ').replace(',', ' ').split()
+  if binary_type == BINARY_DENSE:
+    return struct.pack('<%df' % len(items), *[float(v) for v in items])
+  if binary_type == BINARY_SPARSE:
+    pairs = [(int(items[i]), float(items[i + 1])) for i in range(0, len(items) - 1, 2)]
+    return b''.join([struct.pack('<If', i, v) for i, v in pairs])
+  return struct.pack('<%dB' % len(items), *[int(v) for v in items])
+
 parser = argparse.ArgumentParser()
 
 parser.add_argument('-p', '--port', help='TCP/IP server port number', action='store', type=int,required=True)
@@ -28,6 +44,14 @@ parser.add_argument('-r', '--range', help='range for the range search', action='
 parser.add_argument('-t', '--queryTimeParams', help='Query time parameter', action='store', default='')
 parser.add_argument('-o', '--retObj', help='Return string representation of found objects?', action='store_true', default=False)
 parser.add_argument('-e', '--retExternId', help='Return external IDs?', action='store_true', default=False)
+parser.add_argument('-b', '--batch', help='Treat each input line as a separate query and send all of them in one batch?', action='store_true', default=False)
+parser.add_argument('-B', '--binary', help='Send queries in the binary form: dense (float32 vectors), sparse (sparse float32 vectors), uint8 (SIFT vectors)',
+                    action='store', choices=[BINARY_DENSE, BINARY_SPARSE, BINARY_UINT8], default=None)
+parser.add_argument('-c', '--cacheStats', help='Print statistics of the server query result cache?', action='store_true', default=False)
+parser.add_argument('-s', '--stats', help='Print server request statistics?', action='store_true', default=False)
+parser.add_argument('--reloadDataFile', help='Make the server load a new data file (and an index)', action='store', default='')
+parser.add_argument('--reloadIndexLoc', help='Make the server load a new index from this location', action='store', default='')
+parser.add_argument('--reloadCacheData', help='The server should load new data from the index location', action='store_true', default=False)
 
 args = parser.parse_args()
 
@@ -36,6 +60,7 @@ port=args.port
 queryTimeParams=args.queryTimeParams
 retObj = args.retObj
 retExternId = args.retObj
+binaryQuery = args.binary is not None
 
 try:
   print("Host %s socket %d" % (host,port))
@@ -50,9 +75,23 @@ try:
 
   transport.open()
 
+  # Only administrative calls are made if no search is specified
+  noSearch = args.knn is None and args.range is None and \
+             (args.cacheStats or args.stats or args.reloadDataFile != '' or args.reloadIndexLoc != '')
+
   queryObj = '' 
-  for s in sys.stdin:
+  queryObjs = []
+  for s in ([] if noSearch else sys.stdin):
     queryObj = queryObj + s + '\n'
+    if args.batch and s.strip() != '':
+      queryObjs.append(encode_query_binary(s, args.binary) if binaryQuery else bytearray(s, ENCODING))
+
+  queryObj = encode_query_binary(queryObj, args.binary) if binaryQuery else bytearray(queryObj, ENCODING)
+
+  if args.reloadDataFile != '' or args.reloadIndexLoc != '':
+    print("Reloading the index")
+    client.reloadIndex(args.reloadDataFile, args.reloadIndexLoc, args.reloadCacheData)
+    print("The index is reloaded")
 
   if args.queryTimeParams != '': 
     client.setQueryTimeParams(args.queryTimeParams)
@@ -64,16 +103,26 @@ try:
     k = args.knn
     if not args.range is None:
       error_exit('Range search is not allowed if the KNN search is specified!')
-    print("Running %d-NN search" % k)
-    res = client.knnQuery(k, bytearray(queryObj, ENCODING), retObj, retExternId)
+    if args.batch:
+      print("Running a batch of %d %d-NN queries" % (len(queryObjs), k))
+      res = client.knnQueryBatch(k, queryObjs, retObj, retExternId, binaryQuery)
+    else:
+      print("Running %d-NN search" % k)
+      res = [client.knnQuery(k, queryObj, retObj, retExternId, binaryQuery)]
   elif not args.range is None:
     r = args.range
     if not args.knn is None:
       error_exit('KNN search is not allowed if the range search is specified')
-    print("Running range search, range=%f" % r)
-    res = client.rangeQuery(r, bytearray(queryObj, ENCODING), retObj, retExternId)
+    if args.batch:
+      print("Running a batch of %d range queries, range=%f" % (len(queryObjs), r))
+      res = client.rangeQueryBatch(r, queryObjs, retObj, retExternId, binaryQuery)
+    else:
+      print("Running range search, range=%f" % r)
+      res = [client.rangeQuery(r, queryObj, retObj, retExternId, binaryQuery)]
+  elif noSearch:
+    res = []
   else: 
-    error_exit("Wrong search type %s" % searchType)
+    error_exit("Specify either k-NN or range search")
 
   t2 = datetime.now()
 
@@ -83,13 +132,29 @@ try:
 
   print("Finished in %f ms" % elapsed)
 
-  for e in res:
-    s=''
-    if retExternId:
-      s='externId=' + e.externId
-    print("id=%d dist=%f %s" % (e.id, e.dist, s))
-    if retObj:
-      print(str(e.obj))
+  for qid, qres in enumerate(res):
+    if args.batch:
+      print("Query #%d" % qid)
+    for e in qres:
+      s=''
+      if retExternId:
+        s='externId=' + e.externId
+      print("id=%d dist=%f %s" % (e.id, e.dist, s))
+      if retObj:
+        print(str(e.obj))
+
+  if args.cacheStats:
+    st = client.getCacheStats()
+    print("Cache: hits=%d misses=%d entries=%d memory used=%d budget=%d" %
+          (st.hitQty, st.missQty, st.entryQty, st.memUsed, st.memBudget))
+
+  if args.stats:
+    st = client.getStats()
+    print("Uptime: %f sec pending connections: %d idle workers: %d workers: %d" %
+          (st.uptime, st.pendingTaskQty, st.idleWorkerQty, st.workerQty))
+    for m in st.methods + [st.queueWait]:
+      print("%s: requests=%d errors=%d inFlight=%d qps=%f p50=%f p90=%f p99=%f p999=%f max=%f ms" %
+            (m.name, m.requestQty, m.errorQty, m.inFlightQty, m.qps, m.p50, m.p90, m.p99, m.p999, m.maxLatency))
 
 # Close!
   transport.close()
@@ -24,9 +24,11 @@
 #include "factory/space/space_dummy.h"
 #include "factory/space/space_js.h"
 #include "factory/space/space_lp.h"
+#include "factory/space/space_pq.h"
 #include "factory/space/space_scalar.h"
 #include "factory/space/space_sparse_lp.h"
 #include "factory/space/space_sparse_scalar.h"
+#include "factory/space/space_vector_lowprec.h"
 #include "factory/space/space_word_embed.h"
 #include "factory/space/space_ab_diverg.h"
 #include "factory/space/space_renyi_diverg.h"
@@ -96,6 +98,9 @@ inline void initSpaces() {
   REGISTER_SPACE_CREATOR(float,  SPACE_L2, CreateL2)
   REGISTER_SPACE_CREATOR(double, SPACE_L2, CreateL2)
 
+  // The Euclidean space with product quantization
+  REGISTER_SPACE_CREATOR(float,  SPACE_PQ, CreatePQ)
+
   // Scalar product and related distances
   // Dense
   REGISTER_SPACE_CREATOR(float,  SPACE_COSINE_SIMILARITY, CreateCosineSimilarity)
@@ -105,6 +110,14 @@ inline void initSpaces() {
   REGISTER_SPACE_CREATOR(float,  SPACE_NEGATIVE_SCALAR, CreateNegativeScalarProduct)
   REGISTER_SPACE_CREATOR(double, SPACE_NEGATIVE_SCALAR, CreateNegativeScalarProduct)
 
+  // Low-precision dense vectors
+  REGISTER_SPACE_CREATOR(float,  SPACE_L2_FLOAT16, CreateL2LowPrec<Float16>)
+  REGISTER_SPACE_CREATOR(float,  SPACE_COSINE_SIMILARITY_FLOAT16, CreateCosineSimilarityLowPrec<Float16>)
+  REGISTER_SPACE_CREATOR(float,  SPACE_NEGATIVE_SCALAR_FLOAT16, CreateNegativeScalarProductLowPrec<Float16>)
+  REGISTER_SPACE_CREATOR(float,  SPACE_L2_INT8, CreateL2LowPrec<int8_t>)
+  REGISTER_SPACE_CREATOR(float,  SPACE_COSINE_SIMILARITY_INT8, CreateCosineSimilarityLowPrec<int8_t>)
+  REGISTER_SPACE_CREATOR(float,  SPACE_NEGATIVE_SCALAR_INT8, CreateNegativeScalarProductLowPrec<int8_t>)
+
   // Sparse
   REGISTER_SPACE_CREATOR(float,  SPACE_SPARSE_L, CreateSparseL)
   REGISTER_SPACE_CREATOR(double, SPACE_SPARSE_L, CreateSparseL)
@@ -0,0 +1,47 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#ifndef FACTORY_SPACE_PQ_H
+#define FACTORY_SPACE_PQ_H
+
+#include <space/space_pq.h>
+
+namespace similarity {
+
+/*
+ * Creating functions.
+ */
+
+inline Space<float>* CreatePQ(const AnyParams& AllParams) {
+  AnyParamManager pmgr(AllParams);
+
+  size_t subQty, centroidQty, trainQty, iterQty;
+
+  pmgr.GetParamOptional("m",         subQty,      8);
+  pmgr.GetParamOptional("k",         centroidQty, 256);
+  pmgr.GetParamOptional("trainQty",  trainQty,    65536);
+  pmgr.GetParamOptional("iterQty",   iterQty,     25);
+
+  pmgr.CheckUnused();
+
+  return new SpacePQ(subQty, centroidQty, trainQty, iterQty);
+}
+
+/*
+ * End of creating functions.
+ */
+
+}
+
+#endif
@@ -0,0 +1,47 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#ifndef FACTORY_SPACE_VECTOR_LOWPREC_H
+#define FACTORY_SPACE_VECTOR_LOWPREC_H
+
+#include <space/space_vector_lowprec.h>
+
+namespace similarity {
+
+/*
+ * Creating functions.
+ */
+
+template <typename ElemType>
+Space<float>* CreateL2LowPrec(const AnyParams& /* ignoring params */) {
+  return new SpaceLowPrecVector<ElemType>(SpaceLowPrecVector<ElemType>::kL2);
+}
+
+template <typename ElemType>
+Space<float>* CreateCosineSimilarityLowPrec(const AnyParams& /* ignoring params */) {
+  return new SpaceLowPrecVector<ElemType>(SpaceLowPrecVector<ElemType>::kCosine);
+}
+
+template <typename ElemType>
+Space<float>* CreateNegativeScalarProductLowPrec(const AnyParams& /* ignoring params */) {
+  return new SpaceLowPrecVector<ElemType>(SpaceLowPrecVector<ElemType>::kNegDotProd);
+}
+
+/*
+ * End of creating functions.
+ */
+
+}
+
+#endif
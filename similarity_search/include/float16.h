@@ -0,0 +1,89 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#ifndef _FLOAT16_H_
+#define _FLOAT16_H_
+
+#include <cstdint>
+#include <cstring>
+
+namespace similarity {
+
+/*
+ * IEEE 754 half-precision numbers (the same as numpy.float16) are stored
+ * as 16-bit unsigned integers. Distance kernels convert them to float on the fly.
+ */
+typedef uint16_t Float16;
+
+inline float Float16ToFloat(Float16 h) {
+  uint32_t sign = uint32_t(h & 0x8000) << 16;
+  uint32_t exp = (h >> 10) & 0x1f;
+  uint32_t mant = h & 0x3ff;
+  uint32_t bits;
+
+  if (exp == 0x1f) {
+    // Infinity or NaN
+    bits = sign | 0x7f800000 | (mant << 13);
+  } else if (exp != 0) {
+    bits = sign | ((exp + 127 - 15) << 23) | (mant << 13);
+  } else if (mant == 0) {
+    bits = sign;
+  } else {
+    // A subnormal number becomes a normal float
+    exp = 127 - 14;
+    while (!(mant & 0x400)) {
+      mant <<= 1;
+      --exp;
+    }
+    bits = sign | (exp << 23) | ((mant & 0x3ff) << 13);
+  }
+  float res;
+  memcpy(&res, &bits, sizeof(res));
+  return res;
+}
+
+// Rounds to the nearest representable number (ties to even), too large numbers become infinities
+inline Float16 FloatToFloat16(float f) {
+  const uint32_t f32Inf = 255u << 23;
+  const uint32_t f16Max = (127u + 16) << 23;
+  const uint32_t denormMagic = ((127u - 15) + (23 - 10) + 1) << 23;
+
+  uint32_t x;
+  memcpy(&x, &f, sizeof(x));
+  uint32_t sign = x & 0x80000000u;
+  x ^= sign;
+
+  uint32_t res;
+  if (x >= f16Max) {
+    res = x > f32Inf ? 0x7e00 : 0x7c00;
+  } else if (x < (113u << 23)) {
+    // The result is subnormal: the addition rounds away extra mantissa bits
+    float fx, magic;
+    memcpy(&fx, &x, sizeof(fx));
+    memcpy(&magic, &denormMagic, sizeof(magic));
+    fx += magic;
+    memcpy(&x, &fx, sizeof(x));
+    res = x - denormMagic;
+  } else {
+    uint32_t mantOdd = (x >> 13) & 1;
+    x += ((15u - 127) << 23) + 0xfff;
+    x += mantOdd;
+    res = x >> 13;
+  }
+  return static_cast<Float16>(res | (sign >> 16));
+}
+
+}  // namespace similarity
+
+#endif
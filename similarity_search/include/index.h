@@ -61,6 +61,13 @@ public:
   virtual void LoadIndex(const string& location) {
     throw runtime_error("LoadIndex is not implemented for method: " + StrDesc());
   }
+  /*
+   * Loading an index by memory-mapping the saved file (so that processes
+   * can share one copy of it) is not necessarily implemented either.
+   */
+  virtual void LoadIndexMapped(const string& location) {
+    throw runtime_error("LoadIndexMapped is not implemented for method: " + StrDesc());
+  }
   virtual ~Index() {}
   /*
    * There are two type of search methods: a range search and a k-Nearest Neighbor search.
@@ -83,6 +90,11 @@ public:
    * adjust the memory consumption of the index.
    */
   virtual bool DuplicateData() const { return false; }
+  /*
+   * Methods that can add data to an already created index (see AddBatch)
+   * should return true here.
+   */
+  virtual bool SupportsAddBatch() const { return false; }
 
   virtual void AddBatch(const ObjectVector& batchData, bool printProgress, bool checkIDs = false/* this is a debug flag only, turning it on may affect performance */) {
     throw runtime_error("AddBatch is not implemented!");
@@ -99,6 +111,23 @@ public:
   }
 
   virtual size_t GetSize() const { return data_.size(); }
+
+  /*
+   * Methods that keep their own copy of the data can stop using the data points
+   * the index was created from (along with structures needed only to modify the index).
+   * If this function returns true, the caller can free the data points and obtain
+   * copies stored by the index using GetStoredObject.
+   */
+  virtual bool ReleaseData() { return false; }
+  // The copy of the data point at the given position (only after ReleaseData returned true)
+  virtual const Object* GetStoredObject(size_t pos) const {
+    throw runtime_error("GetStoredObject is not implemented for method: " + StrDesc());
+  }
+  /*
+   * The memory (in bytes) used by lists of visited elements that searches keep for reuse.
+   * Methods that don't keep such lists return zero.
+   */
+  virtual size_t GetVisitedListMemory() const { return 0; }
 protected:
   const ObjectVector& data_;
 
@@ -27,6 +27,9 @@
 
 #include "index.h"
 #include "params.h"
+#include "pq.h"
+#include "space.h"
+#include "method/visited_list.h"
 
 #include <condition_variable>
 #include <iostream>
@@ -37,6 +40,7 @@
 #include <queue>
 #include <set>
 #include <thread>
+#include <unordered_map>
 #include <unordered_set>
 
 #define METH_HNSW "hnsw"
@@ -53,7 +57,6 @@ namespace similarity {
     using std::ref;
 
     template <typename dist_t> class Space;
-    class VisitedListPool;
     template <typename dist_t> class HnswNodeDistCloser;
     template <typename dist_t> class HnswNodeDistFarther;
 
@@ -63,6 +66,7 @@ namespace similarity {
         {
             data_ = Obj;
             id_ = id;
+            linksChanged_ = false;
         }
         ~HnswNode(){};
         const Object *getData() { return data_; }
@@ -266,6 +270,7 @@ namespace similarity {
                     return;
                 }
             allFriends_[level].push_back(element);
+            linksChanged_ = true;
             bool shrink = false;
             if (level > 0) {
                 if (allFriends_[level].size() > maxsize) {
@@ -332,8 +337,15 @@ namespace similarity {
             *((int *)(mem)) = level;
             mem += sizeof(int);
 
-            char *memlevels = mem1 + offsetlevels;
+            copyLevel0LinksToOptIndex(mem1 + offsetlevels);
+            mem = mem1 + offsetData;
+            memcpy(mem, data_->buffer(), data_->bufferlength());
 
+            return;
+        }
+
+        void copyLevel0LinksToOptIndex(char *memlevels)
+        {
             char *memt = memlevels;
             *((int *)(memt)) = (int)allFriends_[0].size();
             memt += sizeof(int);
@@ -341,10 +353,6 @@ namespace similarity {
                 *((int *)(memt)) = (int)allFriends_[0][j]->getId();
                 memt += sizeof(int);
             }
-            mem = mem1 + offsetData;
-            memcpy(mem, data_->buffer(), data_->bufferlength());
-
-            return;
         }
 
         void copyHigherLevelLinksToOptIndex(char *mem1, size_t offsetlevels)
@@ -380,6 +388,8 @@ namespace similarity {
         int maxsize0;
         int maxsize;
         int level;
+        // Set when the list of friends is modified, used to update the optimized index
+        bool linksChanged_;
 
     private:
         const Object *data_;
@@ -457,6 +467,13 @@ namespace similarity {
 
         virtual void LoadIndex(const string &location) override;
 
+        /*
+         * Maps an optimized index saved in the aligned format read-only, the index
+         * can't be modified then (except for deleting elements without repairing).
+         * Other indices are simply loaded.
+         */
+        virtual void LoadIndexMapped(const string &location) override;
+
         Hnsw(bool PrintProgress, const Space<dist_t> &space, const ObjectVector &data);
         void CreateIndex(const AnyParams &IndexParams) override;
 
@@ -468,15 +485,57 @@ namespace similarity {
 
         void SetQueryTimeParams(const AnyParams &) override;
 
+        /*
+         * Inserts new data points into a created (or loaded) index. If the index has
+         * an optimized layout, it is updated as well (its memory grows as needed).
+         * Searching concurrently with the insertion isn't supported.
+         */
+        void AddBatch(const ObjectVector &batchData, bool bPrintProgress, bool bCheckIDs = false) override;
+        bool SupportsAddBatch() const override { return true; }
+        size_t GetSize() const override;
+
+        /*
+         * Deleted elements (identified by object IDs) become tombstones: they are never
+         * returned by searches, but they are still used for routing. Deletion takes time
+         * proportional to the number of deleted elements. The kDelRepair strategy also relinks
+         * nodes that link to deleted elements that weren't repaired yet (the batch can be empty
+         * in this case). Finding these nodes requires a parallel scan of the links of all nodes,
+         * i.e., O(N) time, but distances are computed only for these nodes; so, it's cheaper
+         * to repair after deleting many elements than after each deletion. Tombstones are
+         * never removed: the memory of deleted elements is reclaimed only by rebuilding the index.
+         * Searching concurrently isn't supported.
+         */
+        enum DeleteStrategy { kDelTombstone = 0, kDelRepair = 1 };
+        void DeleteBatch(const ObjectVector &batchData, int delStrategy, bool checkIDs = false) override;
+        void DeleteBatch(const vector<IdType> &batchData, int delStrategy, bool checkIDs = false) override;
+
+        /*
+         * The optimized index stores a copy of every data point, so the graph can be deleted and
+         * the data points are no longer used (GetStoredObject returns the copies; in the cosine space,
+         * they are normalized). The graph can't be restored afterwards: data can't be added to the index
+         * and deleted elements can't be repaired. Returns false if there is no optimized index.
+         */
+        bool ReleaseData() override;
+        const Object *GetStoredObject(size_t pos) const override;
+        size_t GetVisitedListMemory() const override;
+
     private:
         typedef std::vector<HnswNode *> ElementList;
-        void baseSearchAlgorithmOld(KNNQuery<dist_t> *query);
-        void baseSearchAlgorithmV1Merge(KNNQuery<dist_t> *query);
-        void listPassingModifiedAlgorithm(KNNQuery<dist_t> *query);
-        void SearchL2CustomV1Merge(KNNQuery<dist_t> *query);
-        void SearchL2CustomOld(KNNQuery<dist_t> *query);
-        void SearchCosineNormalizedOld(KNNQuery<dist_t> *query);
-        void SearchCosineNormalizedV1Merge(KNNQuery<dist_t> *query);
+        void baseSearchAlgorithmOld(KNNQuery<dist_t> *query, size_t ef);
+        void baseSearchAlgorithmV1Merge(KNNQuery<dist_t> *query, size_t ef);
+        void listPassingModifiedAlgorithm(KNNQuery<dist_t> *query, size_t ef);
+        void SearchL2CustomV1Merge(KNNQuery<dist_t> *query, size_t ef);
+        void SearchL2CustomOld(KNNQuery<dist_t> *query, size_t ef);
+        void SearchCosineNormalizedOld(KNNQuery<dist_t> *query, size_t ef);
+        void SearchCosineNormalizedV1Merge(KNNQuery<dist_t> *query, size_t ef);
+        void SearchQuantized(KNNQuery<dist_t> *query, size_t ef);
+        template <typename KeyType, typename CodeDistFunc>
+        void SearchQuantizedCodes(KNNQuery<dist_t> *query, size_t ef, CodeDistFunc codeDist);
+        void PrefetchElement(const VisitedList *vl, int id) const;
+        // Computes distances to all objects accepted by the filter of the query
+        void SearchFilteredExhaustive(KNNQuery<dist_t> *query) const;
+        // Returns a visited list for a search with the given size of the result set
+        VisitedList *GetVisitedList(size_t ef) const;
 
         int getRandomLevel(double revSize)
         {
@@ -485,10 +544,36 @@ namespace similarity {
             return (int)r;
         }
 
+        void RestoreNodesFromOptimizedIndex();
+        void AddToOptimizedIndex(size_t oldQty);
+        void UpdateOptimizedIndexLinks(size_t id);
+        void CopyToOptimizedIndex(size_t id);
+        void TrainQuantizer();
+        void EncodeVector(const float *pVect, uint8_t *code) const;
+        void EncodeQuery(const float *pVect, size_t qty, uint8_t *code) const;
+
+        // The object data of an element in the optimized index
+        char *optimizedData(size_t id) const {
+            return quantized_ ? data_exact_memory_ + id * exactObjectSize_
+                              : data_level0_memory_ + id * memoryPerObject_ + offsetData_;
+        }
+        void RepairDeleted(bool checkIDs);
+        void MapObjectIds(size_t start);
+        void ReorderElements();
+        void SaveDeleted(std::ostream& output);
+        void LoadDeleted(std::istream& input);
+
+        // An element at this position was deleted (but it's still used for routing)
+        bool isDeleted(size_t id) const { return deletedQty_ != 0 && deleted_[id]; }
+
         void SaveOptimizedIndex(std::ostream& output);
-        void LoadOptimizedIndex(std::istream& input);
+        void SaveOriginalIds(std::ostream& output);
+        void LoadOriginalIds(std::istream& input, bool reordered);
+        void LoadOptimizedIndexHeader(std::istream& input, unsigned optimIndexFlag);
+        void LoadOptimizedIndex(std::istream& input, unsigned optimIndexFlag);
 
-        void SaveRegularIndexBin(std::ostream& output);
+        void SaveRegularIndexCSR(std::ostream& output);
+        void LoadRegularIndexCSR(std::istream& input);
         void LoadRegularIndexBin(std::istream& input);
         void SaveRegularIndexText(std::ostream& output);
         void LoadRegularIndexText(std::istream& input);
@@ -499,7 +584,11 @@ namespace similarity {
                                               std::priority_queue<HnswNodeDistCloser<dist_t>> &resultSet, HnswNode *ep,
                                               int level) const;
 
-        void add(const Space<dist_t> *space, HnswNode *newElement);
+        // Elements with the level below minLevel are not linked (level 0 can be built separately)
+        void add(const Space<dist_t> *space, HnswNode *newElement, int minLevel = 0);
+        void BuildLevel0ByNNDescent(size_t K, float sampleRate, double delta, size_t maxIterQty);
+        HnswNode *searchGreedy(const Space<dist_t> *space, const Object *queryObj, HnswNode *ep, int fromLevel,
+                               int toLevel) const;
         void addToElementListSynchronized(HnswNode *newElement);
 
         void link(HnswNode *first, HnswNode *second, int level, const Space<dist_t> *space, int delaunay_type)
@@ -517,6 +606,13 @@ namespace similarity {
         size_t maxM0_;
         size_t efConstruction_;
         size_t ef_;
+        /*
+         * The optimized search prefetches the visited-list entry and prefetchLines_ cache lines
+         * of the data of the neighbor that is prefetchDepth_ positions ahead of the neighbor
+         * whose distance is computed (0 disables prefetching)
+         */
+        size_t prefetchDepth_ = 1;
+        size_t prefetchLines_ = 1;
         size_t searchMethod_;
         size_t indexThreadQty_;
         const Space<dist_t> &space_;
@@ -543,85 +639,80 @@ namespace similarity {
         char *data_level0_memory_;
         char **linkLists_;
         size_t memoryPerObject_;
+        // The number of elements data_level0_memory_ and linkLists_ can hold
+        size_t optimizedCapacity_ = 0;
+        // Levels of elements stored in the optimized index
+        vector<int> elementLevels_;
+        /*
+         * In a quantized optimized index, the level-0 block stores a one-byte code per dimension
+         * (code = (x - sqOffset_[dim]) / sqStep_) instead of the vector. Exact objects are
+         * stored in a separate block, which is accessed only to re-rank the candidates.
+         * If the space supports product quantization, the level-0 block stores PQ codes instead.
+         */
+        bool quantized_ = false;
+        vector<float> sqOffset_;
+        float sqStep_ = 1;
+        std::unique_ptr<ProductQuantizer> pq_;
+        char *data_exact_memory_ = nullptr;
+        size_t exactObjectSize_ = 0;
+        // The memory-mapped index file and objects pointing to its data (if the index is mapped)
+        char *mappedMemory_ = nullptr;
+        size_t mappedSize_ = 0;
+        Object *mappedObjects_ = nullptr;
+
+        // Tombstones: the number of deleted elements, deletion flags
+        // and deleted elements whose neighbors weren't relinked yet (all by position)
+        size_t deletedQty_ = 0;
+        vector<char> deleted_;
+        vector<IdType> toRepair_;
+        // Maps object IDs to positions (created by the first deletion)
+        unordered_map<IdType, IdType> idToPos_;
+        /*
+         * If elements of the optimized index are reordered, this maps positions of elements
+         * to their original positions, i.e., to the positions of their data points in data_
+         * (otherwise, it's empty). Search results aren't affected, because objects keep their IDs.
+         */
+        vector<IdType> origIds_;
+        // Set by ReleaseData, along with the inverse of origIds_ (if elements are reordered)
+        bool dataReleased_ = false;
+        vector<IdType> optimizedPos_;
         float (*fstdistfunc_)(const float *pVect1, const float *pVect2, size_t &qty, float *TmpRes);
+        // A distance function provided by the space (used instead of fstdistfunc_ if set)
+        typename FlatDistFunc<dist_t>::FuncType flatdistfunc_ = nullptr;
+
+        // Computes the distance between the query vector and the data of an object from the optimized index
+        inline dist_t fstDistance(const float *pVectq, const char *pData, size_t &qty, size_t dataLength,
+                                  float *TmpRes) const {
+            if (flatdistfunc_)
+                return flatdistfunc_(reinterpret_cast<const char *>(pVectq), pData, dataLength);
+            return fstdistfunc_(pVectq, reinterpret_cast<const float *>(pData), qty, TmpRes);
+        }
 
         enum AlgoType { kOld, kV1Merge, kHybrid };
 
         AlgoType searchAlgoType_;
 
-    protected:
-        DISABLE_COPY_AND_ASSIGN(Hnsw);
-    };
+        static AlgoType ParseAlgoType(string algoType);
 
-    typedef unsigned char vl_type;
-    class VisitedList {
-    public:
-        vl_type curV;
-        vl_type *mass;
-        unsigned int numelements;
+        enum ReorderType { kReorderNone, kReorderBFS, kReorderRCM, kReorderDegree };
 
-        VisitedList(int numelements1)
-        {
-            curV = -1;
-            numelements = numelements1;
-            mass = new vl_type[numelements];
-        }
-        void reset()
-        {
-            curV++;
-            if (curV == 0) {
-                memset(mass, 0, sizeof(vl_type) * numelements);
-                curV++;
-            }
-        };
-        ~VisitedList() { delete [] mass; }
-    };
-    ///////////////////////////////////////////////////////////
-    //
-    // Class for multi-threaded pool-management of VisitedLists
-    //
-    /////////////////////////////////////////////////////////
+        ReorderType reorderType_ = kReorderNone;
 
-    class VisitedListPool {
-        deque<VisitedList *> pool;
-        mutex poolguard;
-        int numelements;
+        static ReorderType ParseReorderType(string reorderType);
 
-    public:
-        VisitedListPool(int initmaxpools, int numelements1)
-        {
-            numelements = numelements1;
-            for (int i = 0; i < initmaxpools; i++)
-                pool.push_front(new VisitedList(numelements));
-        }
-        VisitedList *getFreeVisitedList()
-        {
-            VisitedList *rez;
-            {
-                unique_lock<mutex> lock(poolguard);
-                if (pool.size() > 0) {
-                    rez = pool.front();
-                    pool.pop_front();
-                } else {
-                    rez = new VisitedList(numelements);
-                }
-            }
-            rez->reset();
-            return rez;
-        };
-        void releaseVisitedList(VisitedList *vl)
-        {
-            unique_lock<mutex> lock(poolguard);
-            pool.push_front(vl);
-        };
-        ~VisitedListPool()
-        {
-            //LOG(LIB_INFO) << "Total " << pool.size() << " lists allocated";
-            while (pool.size()) {
-                VisitedList *rez = pool.front();
-                pool.pop_front();
-                delete rez;
-            }
-        };
+        /*
+         * The set of visited elements can be an array with one byte per element or a hash table
+         * whose size is proportional to the number of visited elements. The auto mode uses the hash table
+         * if the array is VISITED_HASH_RATIO times larger than the expected number of visited elements.
+         */
+        enum VisitedSetType { kVisitedSetAuto, kVisitedSetArray, kVisitedSetHash };
+
+        VisitedSetType visitedSetType_ = kVisitedSetAuto;
+
+        static VisitedSetType ParseVisitedSetType(string visitedSetType);
+
+    protected:
+        DISABLE_COPY_AND_ASSIGN(Hnsw);
     };
+
 }
@@ -0,0 +1,226 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <functional>
+#include <mutex>
+#include <vector>
+
+#include "idtype.h"
+#include "logging.h"
+#include "thread_pool.h"
+#include "utils.h"
+
+namespace similarity {
+
+    /*
+     * A multithreaded builder of the approximate k-NN graph using NN-descent:
+     *
+     * Wei Dong, Moses Charikar, Kai Li. Efficient k-nearest neighbor graph construction
+     * for generic similarity measures. WWW 2011.
+     *
+     * The graph starts from candidates provided by the caller (e.g., elements that are
+     * likely to be close) and random neighbors. In each iteration, neighbors of neighbors
+     * (both direct and reverse ones) are compared to each other ("the local join"),
+     * but only pairs where at least one element is new (i.e., it got into the list in
+     * the previous iteration) are compared, and at most sampleRate * K new/old neighbors
+     * of every element take part in the join. The iterations stop when fewer than
+     * delta * N * K neighbor lists are updated or after maxIterQty iterations.
+     * The distance is assumed to be symmetric: it's computed only once for each pair.
+     */
+    template <typename dist_t>
+    class NNDescent {
+    public:
+        struct Neighbor {
+            IdType id;
+            dist_t dist;
+            // The neighbor was added after the element took part in the last local join
+            bool isNew;
+        };
+        typedef std::function<dist_t(IdType, IdType)> DistFunc;
+        // Fills initial candidate neighbors of the element
+        typedef std::function<void(IdType, vector<IdType> &)> InitFunc;
+
+        NNDescent(size_t qty, size_t K, float sampleRate, double delta, size_t maxIterQty, size_t threadQty,
+                  const DistFunc &distFunc)
+            : qty_(qty), K_(std::min(K, qty ? qty - 1 : 0)),
+              sampleQty_(std::max<size_t>(1, static_cast<size_t>(sampleRate * K_))), delta_(delta),
+              maxIterQty_(maxIterQty), threadQty_(threadQty), distFunc_(distFunc), knn_(qty), locks_(qty)
+        {
+        }
+
+        void build(const InitFunc &initFunc = nullptr)
+        {
+            initNeighbors(initFunc);
+            vector<vector<IdType>> newCand(qty_), oldCand(qty_), newRev(qty_), oldRev(qty_);
+
+            for (size_t iter = 0; iter < maxIterQty_; iter++) {
+                ParallelFor(0, qty_, threadQty_, [&](size_t id, size_t threadId) {
+                    sampleCandidates(id, newCand[id], oldCand[id]);
+                });
+                for (size_t id = 0; id < qty_; id++) {
+                    newRev[id].clear();
+                    oldRev[id].clear();
+                }
+                for (size_t id = 0; id < qty_; id++) {
+                    for (IdType n : newCand[id])
+                        newRev[n].push_back(id);
+                    for (IdType n : oldCand[id])
+                        oldRev[n].push_back(id);
+                }
+
+                std::atomic<size_t> updateQty(0);
+                ParallelFor(0, qty_, threadQty_, [&](size_t id, size_t threadId) {
+                    vector<IdType> &newIds = newCand[id];
+                    vector<IdType> &oldIds = oldCand[id];
+                    mergeSample(newRev[id], newIds);
+                    mergeSample(oldRev[id], oldIds);
+                    size_t localUpdateQty = 0, localDistCompQty = 0;
+                    for (size_t i = 0; i < newIds.size(); i++) {
+                        for (size_t j = i + 1; j < newIds.size(); j++)
+                            localUpdateQty += update(newIds[i], newIds[j], localDistCompQty);
+                        for (IdType oldId : oldIds)
+                            localUpdateQty += update(newIds[i], oldId, localDistCompQty);
+                    }
+                    updateQty += localUpdateQty;
+                    distCompQty_ += localDistCompQty;
+                });
+
+                LOG(LIB_INFO) << "NN-descent iteration " << (iter + 1) << ": " << updateQty.load() << " updates, "
+                              << distCompQty_.load() << " distance computations";
+                if (updateQty <= delta_ * qty_ * K_)
+                    break;
+            }
+        }
+
+        // Neighbors of the element sorted by the distance in the ascending order
+        const vector<Neighbor> &getNeighbors(IdType id) const { return knn_[id]; }
+        size_t getDistCompQty() const { return distCompQty_; }
+
+    private:
+        void initNeighbors(const InitFunc &initFunc)
+        {
+            ParallelFor(0, qty_, threadQty_, [&](size_t id, size_t threadId) {
+                vector<Neighbor> &neighbors = knn_[id];
+                neighbors.clear();
+                vector<IdType> candidates;
+                // For small data sets, sampling random neighbors would take too long
+                if (K_ + 1 == qty_) {
+                    for (IdType n = 0; n < qty_; n++)
+                        candidates.push_back(n);
+                } else if (initFunc) {
+                    initFunc(id, candidates);
+                }
+                // At most K_ distinct candidates are used, the rest are random
+                std::sort(candidates.begin(), candidates.end());
+                candidates.erase(std::unique(candidates.begin(), candidates.end()), candidates.end());
+                candidates.erase(std::remove(candidates.begin(), candidates.end(), IdType(id)), candidates.end());
+                shuffleAndResize(candidates, K_);
+                for (IdType n : candidates)
+                    neighbors.push_back(Neighbor{n, distFunc_(id, n), true});
+                while (neighbors.size() < K_) {
+                    IdType n = RandomInt() % qty_;
+                    if (n == IdType(id) || std::any_of(neighbors.begin(), neighbors.end(),
+                                                       [n](const Neighbor &e) { return e.id == n; }))
+                        continue;
+                    neighbors.push_back(Neighbor{n, distFunc_(id, n), true});
+                }
+                distCompQty_ += neighbors.size();
+                std::sort(neighbors.begin(), neighbors.end(),
+                          [](const Neighbor &a, const Neighbor &b) { return a.dist < b.dist; });
+            });
+        }
+
+        // At most sampleQty_ new neighbors take part in the local join, they become old afterwards
+        void sampleCandidates(IdType id, vector<IdType> &newIds, vector<IdType> &oldIds)
+        {
+            newIds.clear();
+            oldIds.clear();
+            vector<size_t> newPos;
+            for (size_t i = 0; i < knn_[id].size(); i++) {
+                if (knn_[id][i].isNew)
+                    newPos.push_back(i);
+                else
+                    oldIds.push_back(knn_[id][i].id);
+            }
+            shuffleAndResize(newPos, sampleQty_);
+            for (size_t pos : newPos) {
+                knn_[id][pos].isNew = false;
+                newIds.push_back(knn_[id][pos].id);
+            }
+        }
+
+        // Adds a sample of reverse neighbors to direct ones
+        void mergeSample(vector<IdType> &reverseIds, vector<IdType> &ids)
+        {
+            shuffleAndResize(reverseIds, sampleQty_);
+            ids.insert(ids.end(), reverseIds.begin(), reverseIds.end());
+            std::sort(ids.begin(), ids.end());
+            ids.erase(std::unique(ids.begin(), ids.end()), ids.end());
+        }
+
+        template <typename T>
+        static void shuffleAndResize(vector<T> &v, size_t qty)
+        {
+            if (v.size() <= qty)
+                return;
+            // A partial Fisher-Yates shuffle
+            for (size_t i = 0; i < qty; i++)
+                std::swap(v[i], v[i + RandomInt() % (v.size() - i)]);
+            v.resize(qty);
+        }
+
+        // Returns the number of updated neighbor lists
+        size_t update(IdType id1, IdType id2, size_t &distCompQty)
+        {
+            if (id1 == id2)
+                return 0;
+            dist_t d = distFunc_(id1, id2);
+            distCompQty++;
+            return insert(id1, id2, d) + insert(id2, id1, d);
+        }
+
+        size_t insert(IdType id, IdType n, dist_t d)
+        {
+            std::unique_lock<std::mutex> lock(locks_[id]);
+            vector<Neighbor> &neighbors = knn_[id];
+            if (neighbors.size() >= K_ && d >= neighbors.back().dist)
+                return 0;
+            for (const Neighbor &e : neighbors) {
+                if (e.id == n)
+                    return 0;
+            }
+            auto it = std::upper_bound(neighbors.begin(), neighbors.end(), d,
+                                       [](dist_t d, const Neighbor &e) { return d < e.dist; });
+            neighbors.insert(it, Neighbor{n, d, true});
+            if (neighbors.size() > K_)
+                neighbors.pop_back();
+            return 1;
+        }
+
+        size_t qty_;
+        size_t K_;
+        size_t sampleQty_;
+        double delta_;
+        size_t maxIterQty_;
+        size_t threadQty_;
+        DistFunc distFunc_;
+        vector<vector<Neighbor>> knn_;
+        vector<std::mutex> locks_;
+        std::atomic<size_t> distCompQty_{0};
+    };
+}
@@ -15,9 +15,11 @@
 #ifndef _SEQSEARCH_H_
 #define _SEQSEARCH_H_
 
+#include <memory>
 #include <string>
 
 #include "index.h"
+#include "pq.h"
 
 #define METH_SEQ_SEARCH                 "brute_force"
 #define METH_SEQ_SEARCH_SYN             "seq_search"
@@ -27,7 +29,12 @@ namespace similarity {
 using std::string;
 using std::vector;
 
-// Sequential search
+/*
+ * Sequential search. If the space supports product quantization (see SpacePQ),
+ * k-NN search scans PQ codes instead of the data, and the rerankQty closest
+ * candidates are re-ranked using exact distances (rerankQty = 0 disables re-ranking,
+ * so that approximate distances are returned). Range search is always exact.
+ */
 
 template <typename dist_t>
 class SeqSearch : public Index<dist_t> {
@@ -41,7 +48,7 @@ class SeqSearch : public Index<dist_t> {
   void Search(RangeQuery<dist_t>* query, IdType) const override;
   void Search(KNNQuery<dist_t>* query, IdType) const override;
 
-  void SetQueryTimeParams(const AnyParams& params) override {}
+  void SetQueryTimeParams(const AnyParams& params) override;
 
   size_t GetSize() const override { return getData().size(); }
  private:
@@ -53,6 +60,13 @@ class SeqSearch : public Index<dist_t> {
   IdTypeUnsign            threadQty_;
   vector<ObjectVector>    vvThreadData;
 
+  // PQ codes of the data (if the space supports product quantization)
+  std::unique_ptr<ProductQuantizer> pq_;
+  vector<uint8_t>         pqCodes_;
+  size_t                  rerankQty_ = 100;
+
+  void SearchPQ(KNNQuery<dist_t>* query) const;
+
   const ObjectVector& getData() const { return pData_ != NULL ? *pData_ : this->data_; }
   // disable copy and assign
   DISABLE_COPY_AND_ASSIGN(SeqSearch);
@@ -16,6 +16,7 @@
 #define _SMALL_WORLD_RAND_H_
 
 #include "index.h"
+#include "method/visited_list.h"
 #include "params.h"
 #include <set>
 #include <limits>
@@ -272,6 +273,7 @@ public:
   void addCriticalSection(MSWNode *newElement);
 
   void SetQueryTimeParams(const AnyParams& ) override;
+  size_t GetVisitedListMemory() const override;
 
   enum PatchingStrategy { kNone = 0, kNeighborsOnly = 1 };
 
@@ -297,10 +299,14 @@ private:
   IdType          NextNodeId_ = 0; // This is internal node id
   bool            changedAfterCreateIndex_ = false;
   MSWNode*        pEntryPoint_ = nullptr;
+  // Visited lists of query-time searches, recreated when NextNodeId_ changes
+  unique_ptr<VisitedListPool> visitedListPool_;
 
 
-  void SearchOld(KNNQuery<dist_t>* query) const;
-  void SearchV1Merge(KNNQuery<dist_t>* query) const;
+  void SearchOld(KNNQuery<dist_t>* query, size_t efSearch) const;
+  void SearchV1Merge(KNNQuery<dist_t>* query, size_t efSearch) const;
+  // Returns a visited list for a search with the given size of the candidate queue
+  VisitedList* GetVisitedList(size_t efSearch) const;
 
   void UpdateNextNodeId(size_t newNextNodeId);
   void CompactIdsIfNeeded();
@@ -311,6 +317,8 @@ private:
 
   AlgoType               searchAlgoType_;
 
+  static AlgoType ParseAlgoType(string algoType);
+
 protected:
 
   DISABLE_COPY_AND_ASSIGN(SmallWorldRand);
@@ -0,0 +1,279 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#pragma once
+
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <deque>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include "idtype.h"
+#include "logging.h"
+#include "portable_simd.h"
+// This is only for _mm_prefetch
+#include <mmintrin.h>
+
+namespace similarity {
+
+    typedef unsigned char vl_type;
+
+    /*
+     * A hash table is used instead of the array when the array would be at least this
+     * many times larger than the expected number of visited elements (a hash slot takes
+     * 8 bytes and the table is at most half-full, so the table is still several
+     * times smaller than the array, while its lookups are only slightly slower)
+     */
+    const size_t VISITED_HASH_RATIO = 64;
+
+    // The initial capacity of a hash table that is used when the pool can't create more arrays
+    const size_t VISITED_HASH_FALLBACK_CAPACITY = 1024;
+
+    inline bool useVisitedHash(size_t elemQty, size_t expectedVisitedQty)
+    {
+        return elemQty >= VISITED_HASH_RATIO * expectedVisitedQty;
+    }
+
+    /*
+     * The set of elements visited by a graph search (identified by positions from 0 to numelements - 1).
+     * By default, it is an array with one byte per element: an element is visited if its byte
+     * is equal to curV, so the array needs to be cleared only once in 255 searches.
+     * For huge indices, the set can be an open-addressing hash table instead: its memory
+     * is proportional to the number of visited elements rather than to the number of all elements.
+     * The table grows if it becomes half-full, and it's cleared in O(1) by incrementing the tag of the search.
+     */
+    class VisitedList {
+    public:
+        vl_type curV;
+        vl_type *mass;
+        unsigned int numelements;
+        // The memory of the list that was accounted for by the pool
+        size_t accountedMemory = 0;
+
+        // If hashCapacity > 0, the hash table with (at least) this initial capacity is used instead of the array
+        VisitedList(int numelements1, size_t hashCapacity = 0)
+        {
+            curV = -1;
+            numelements = numelements1;
+            mass = nullptr;
+            if (hashCapacity) {
+                size_t capacity = 16;
+                while (capacity < hashCapacity)
+                    capacity *= 2;
+                initHashTable(capacity);
+            } else {
+                mass = new vl_type[numelements];
+            }
+        }
+        void reset()
+        {
+            if (mass == nullptr) {
+                hashQty_ = 0;
+                if (++hashTag_ == 0) {
+                    for (HashSlot &slot : hashSlots_)
+                        slot.tag = 0;
+                    hashTag_ = 1;
+                }
+                return;
+            }
+            curV++;
+            if (curV == 0) {
+                memset(mass, 0, sizeof(vl_type) * numelements);
+                curV++;
+            }
+        };
+        bool isHash() const { return mass == nullptr; }
+
+        bool isVisited(IdTypeUnsign id) const
+        {
+            if (mass != nullptr)
+                return mass[id] == curV;
+            for (size_t pos = hashPos(id); hashSlots_[pos].tag == hashTag_; pos = (pos + 1) & hashMask_) {
+                if (hashSlots_[pos].id == id)
+                    return true;
+            }
+            return false;
+        }
+        // Marks the element as visited, returns false if it was already visited
+        bool markVisited(IdTypeUnsign id)
+        {
+            if (mass != nullptr) {
+                if (mass[id] == curV)
+                    return false;
+                mass[id] = curV;
+                return true;
+            }
+            size_t pos = hashPos(id);
+            for (; hashSlots_[pos].tag == hashTag_; pos = (pos + 1) & hashMask_) {
+                if (hashSlots_[pos].id == id)
+                    return false;
+            }
+            hashSlots_[pos].id = id;
+            hashSlots_[pos].tag = hashTag_;
+            if (2 * ++hashQty_ > hashSlots_.size())
+                growHashTable();
+            return true;
+        }
+        void prefetch(IdTypeUnsign id) const
+        {
+            if (mass != nullptr)
+                _mm_prefetch((const char *)(mass + id), _MM_HINT_T0);
+            else
+                _mm_prefetch((const char *)(&hashSlots_[hashPos(id)]), _MM_HINT_T0);
+        }
+        size_t memoryUsage() const
+        {
+            return mass != nullptr ? sizeof(vl_type) * numelements : sizeof(HashSlot) * hashSlots_.size();
+        }
+        ~VisitedList() { delete [] mass; }
+
+    private:
+        // A slot is occupied in the current search if its tag is equal to hashTag_
+        struct HashSlot {
+            IdTypeUnsign id;
+            uint32_t tag;
+        };
+        std::vector<HashSlot> hashSlots_;
+        size_t hashMask_ = 0;
+        unsigned hashShift_ = 0;
+        size_t hashQty_ = 0;
+        uint32_t hashTag_ = 0;
+
+        // Fibonacci hashing: the upper bits of the product are well-mixed even for consecutive IDs
+        size_t hashPos(IdTypeUnsign id) const
+        {
+            return static_cast<size_t>((uint64_t(id) * 0x9E3779B97F4A7C15ull) >> hashShift_);
+        }
+        void initHashTable(size_t capacity)
+        {
+            hashSlots_.assign(capacity, HashSlot{0, 0});
+            hashMask_ = capacity - 1;
+            hashShift_ = 64;
+            for (size_t c = capacity; c > 1; c >>= 1)
+                hashShift_--;
+            hashQty_ = 0;
+            hashTag_ = 1;
+        }
+        void growHashTable()
+        {
+            std::vector<HashSlot> oldSlots;
+            oldSlots.swap(hashSlots_);
+            uint32_t oldTag = hashTag_;
+            initHashTable(2 * oldSlots.size());
+            for (const HashSlot &slot : oldSlots) {
+                if (slot.tag == oldTag)
+                    markVisited(slot.id);
+            }
+        }
+    };
+
+    ///////////////////////////////////////////////////////////
+    //
+    // Class for multi-threaded pool-management of VisitedLists
+    //
+    /////////////////////////////////////////////////////////
+
+    /*
+     * Lists are created on demand (one per concurrent search) and are never deleted before the pool.
+     * At most maxPoolSize arrays are created: if all of them are in use, a search gets a hash table
+     * instead, whose memory is proportional to the number of visited elements. Thus, the memory
+     * is bounded even if there are many more concurrent searches than cores.
+     */
+    class VisitedListPool {
+        std::deque<VisitedList *> pool;
+        std::deque<VisitedList *> hashPool;
+        std::mutex poolguard;
+        int numelements;
+        size_t maxPoolSize;
+        // All lists (both free and used) and their memory
+        size_t listQty = 0;
+        size_t arrayQty = 0;
+        size_t maxListQty = 0;
+        size_t memoryUsage = 0;
+
+    public:
+        VisitedListPool(int numelements1, size_t maxPoolSize1 = std::thread::hardware_concurrency())
+        {
+            numelements = numelements1;
+            maxPoolSize = std::max<size_t>(1, maxPoolSize1);
+        }
+        int getNumElements() const { return numelements; }
+
+        // Returns an array if hashCapacity is zero (and the array limit isn't reached),
+        // or a hash table with (at least) this initial capacity otherwise
+        VisitedList *getFreeVisitedList(size_t hashCapacity = 0)
+        {
+            VisitedList *rez = nullptr;
+            {
+                std::unique_lock<std::mutex> lock(poolguard);
+                bool useHash = hashCapacity > 0 || (pool.empty() && arrayQty >= maxPoolSize);
+                std::deque<VisitedList *> &freeLists = useHash ? hashPool : pool;
+                if (freeLists.size() > 0) {
+                    rez = freeLists.front();
+                    freeLists.pop_front();
+                } else {
+                    rez = new VisitedList(numelements, useHash ? std::max(hashCapacity, VISITED_HASH_FALLBACK_CAPACITY) : 0);
+                    rez->accountedMemory = rez->memoryUsage();
+                    memoryUsage += rez->accountedMemory;
+                    if (!useHash)
+                        ++arrayQty;
+                    if (++listQty > maxListQty) {
+                        maxListQty = listQty;
+                        LOG(LIB_INFO) << "The visited list pool has " << listQty << " lists (" << arrayQty
+                                      << " arrays) using " << (memoryUsage >> 10) << " Kb";
+                    }
+                }
+            }
+            rez->reset();
+            return rez;
+        };
+        void releaseVisitedList(VisitedList *vl)
+        {
+            std::unique_lock<std::mutex> lock(poolguard);
+            // Hash tables can grow
+            memoryUsage += vl->memoryUsage() - vl->accountedMemory;
+            vl->accountedMemory = vl->memoryUsage();
+            (vl->isHash() ? hashPool : pool).push_front(vl);
+        };
+        // The memory used by all lists (both free and used)
+        size_t getMemoryUsage()
+        {
+            std::unique_lock<std::mutex> lock(poolguard);
+            return memoryUsage;
+        }
+        size_t getListQty()
+        {
+            std::unique_lock<std::mutex> lock(poolguard);
+            return listQty;
+        }
+        size_t getArrayQty()
+        {
+            std::unique_lock<std::mutex> lock(poolguard);
+            return arrayQty;
+        }
+        ~VisitedListPool()
+        {
+            for (std::deque<VisitedList *> *freeLists : {&pool, &hashPool}) {
+                while (freeLists->size()) {
+                    VisitedList *rez = freeLists->front();
+                    freeLists->pop_front();
+                    delete rez;
+                }
+            }
+        };
+    };
+}
@@ -82,7 +82,8 @@ class VPTree : public Index<dist_t> {
     ~VPNode();
 
     template <typename QueryType>
-    void GenericSearch(QueryType* query, int& MaxLeavesToVisit) const;
+    // level is the depth of the node (used only to collect search statistics)
+    void GenericSearch(QueryType* query, int& MaxLeavesToVisit, unsigned level = 0) const;
 
    private:
     void CreateBucket(bool ChunkBucket, const ObjectVector& data, 
@@ -25,6 +25,7 @@
 #include <limits>
 #include <algorithm>
 #include <cstdint>
+#include <new>
 
 #include "global.h"
 #include "idtype.h"
@@ -223,6 +224,65 @@ inline void ClearBucket(char* CacheOptimizedBucket,
   delete bucket;
 }
 
+/*
+ * A contiguous arena of objects whose data sections have the same length.
+ * Object buffers are carved out of one large block, and Object instances
+ * (which merely point to these buffers) are placement-constructed in another
+ * block. Thus, creating N objects costs two memory allocations rather than 2N.
+ *
+ * Objects returned by the arena are owned by it: they must NOT be deleted
+ * by the caller and they become invalid once the arena is destroyed.
+ * Different objects can be initialized concurrently from different threads.
+ */
+class ObjectArena {
+ public:
+  ObjectArena(size_t qty, size_t datalength) : qty_(qty), datalength_(datalength) {
+    // Keep each object buffer 8-byte aligned (see the comment to the Object class)
+    stride_ = (ID_SIZE + LABEL_SIZE + DATALENGTH_SIZE + datalength_ + 7) & ~size_t(7);
+    buffer_ = new char[std::max<size_t>(1, qty_ * stride_)];
+    objects_ = static_cast<Object*>(::operator new(std::max<size_t>(1, qty_) * sizeof(Object)));
+  }
+
+  ~ObjectArena() {
+    // Object instances don't own their memory, so there is no need to call their destructors
+    ::operator delete(objects_);
+    delete [] buffer_;
+  }
+
+  /*
+   * Initializes the header of the i-th object and returns a pointer
+   * to its data section, which should be filled by the caller.
+   */
+  char* InitObject(size_t i, IdType id, LabelType label) {
+    char* ptr = buffer_ + i * stride_;
+    Object* obj = new (objects_ + i) Object(ptr);
+    memcpy(ptr, &id, ID_SIZE);
+    ptr += ID_SIZE;
+    memcpy(ptr, &label, LABEL_SIZE);
+    ptr += LABEL_SIZE;
+    memcpy(ptr, &datalength_, DATALENGTH_SIZE);
+    return obj->data();
+  }
+
+  const Object* GetObject(size_t i) const { return objects_ + i; }
+
+  bool Contains(const Object* obj) const { return obj >= objects_ && obj < objects_ + qty_; }
+
+  size_t size() const { return qty_; }
+  size_t datalength() const { return datalength_; }
+  // The total amount of memory used by the arena
+  size_t memoryUsed() const { return qty_ * (stride_ + sizeof(Object)); }
+
+ private:
+  size_t    qty_;
+  size_t    datalength_;
+  size_t    stride_;
+  char*     buffer_;
+  Object*   objects_;
+
+  DISABLE_COPY_AND_ASSIGN(ObjectArena);
+};
+
 typedef std::list<const Object*> ObjectList;
 
 template<typename dist_t>
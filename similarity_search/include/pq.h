@@ -0,0 +1,84 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#ifndef _PQ_H_
+#define _PQ_H_
+
+#include <cstddef>
+#include <cstdint>
+#include <iostream>
+#include <vector>
+
+namespace similarity {
+
+using std::vector;
+
+/*
+ * Product quantization (PQ) for the Euclidean distance, see
+ * "Product quantization for nearest neighbor search" by H. Jegou, M. Douze, C. Schmid.
+ *
+ * A vector is split into subQty subvectors, each of which is replaced by the ID of the
+ * closest centroid (one byte) found by k-means in the respective subspace. The distance
+ * from a query to an encoded vector is computed asymmetrically (ADC): a per-query table
+ * keeps squared distances from query subvectors to all centroids, and the distance to
+ * a code is a sum of subQty table entries.
+ */
+class ProductQuantizer {
+ public:
+  // At most trainQty vectors are used to train centroids (using iterQty k-means iterations)
+  ProductQuantizer(size_t subQty = 8, size_t centroidQty = 256, size_t trainQty = 65536, size_t iterQty = 25);
+
+  // Trains centroids on (a sample of) vectors of the given dimensionality
+  void Train(const vector<const float*>& data, size_t dim);
+
+  bool IsTrained() const { return !centroids_.empty(); }
+  size_t GetDim() const { return dim_; }
+  // The size of a code in bytes
+  size_t GetCodeSize() const { return subQty_; }
+
+  void Encode(const float* pVect, uint8_t* code) const;
+  // Computes the table of squared distances from query subvectors to all centroids
+  void ComputeDistanceTable(const float* pQuery, vector<float>& table) const;
+  // The squared distance (approximately) from the query of the table to the encoded vector
+  float TableDistance(const vector<float>& table, const uint8_t* code) const {
+    const float* t = &table[0];
+    float res = 0;
+    for (size_t i = 0; i < subQty_; ++i, t += centroidQty_) {
+      res += t[code[i]];
+    }
+    return res;
+  }
+
+  void Save(std::ostream& output) const;
+  void Load(std::istream& input);
+
+ private:
+  size_t subDim(size_t sub) const { return subOffset_[sub + 1] - subOffset_[sub]; }
+  // The closest centroid of the subspace to the subvector
+  size_t closestCentroid(size_t sub, const float* pSubVect) const;
+
+  size_t          subQty_;
+  size_t          centroidQty_;
+  size_t          trainQty_;
+  size_t          iterQty_;
+  size_t          dim_ = 0;
+  // Subspace i contains dimensions from subOffset_[i] to subOffset_[i + 1] (exclusive)
+  vector<size_t>  subOffset_;
+  // Centroids of subspace i start at centroidQty_ * subOffset_[i]
+  vector<float>   centroids_;
+};
+
+}  // namespace similarity
+
+#endif
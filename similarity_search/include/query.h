@@ -15,10 +15,103 @@
 #ifndef _QUERY_H_
 #define _QUERY_H_
 
+#include <algorithm>
+#include <string>
+#include <vector>
+
 #include "object.h"
+#include "params.h"
 
 namespace similarity {
 
+/*
+ * Optional per-query search statistics. They are collected only if a QueryStats
+ * object is attached to the query (see Query::SetStats), so queries without
+ * statistics pay (almost) nothing for the bookkeeping. Methods that don't
+ * support statistics simply leave hops_per_level and visited_qty empty/zero.
+ */
+struct QueryStats {
+  // The number of distance computations
+  uint64_t              distance_computations = 0;
+  /*
+   * The number of graph (or tree) nodes expanded at each level: for HNSW the
+   * level is the layer of the hierarchy, for a VP-tree the depth of a node,
+   * for flat graphs everything happens at level 0.
+   */
+  std::vector<uint64_t> hops_per_level;
+  // The number of distinct data points visited
+  uint64_t              visited_qty = 0;
+  // Wall clock search time in microseconds
+  uint64_t              search_time = 0;
+
+  void AddHop(size_t level) {
+    if (hops_per_level.size() <= level) hops_per_level.resize(level + 1);
+    ++hops_per_level[level];
+  }
+};
+
+/*
+ * Query-time parameters that override the index-wide ones (see Index::SetQueryTimeParams)
+ * for a single query. Because they are stored in the query object, concurrent queries
+ * can use different settings without any locking. Methods ignore overrides they don't support.
+ */
+struct QueryTimeParams {
+  // efSearch (a.k.a. ef) of graph-based methods, 0 means "not overridden"
+  size_t      efSearch = 0;
+  // algoType of graph-based methods (lowercase), an empty string means "not overridden"
+  std::string algoType;
+
+  bool empty() const { return efSearch == 0 && algoType.empty(); }
+
+  // Throws an exception if there is a parameter that cannot be set per query
+  static QueryTimeParams FromAnyParams(const AnyParams& params);
+};
+
+/*
+ * Restricts the set of objects (identified by Object::id()) that a query can return.
+ * The filter is checked when an object is about to be added to the result set:
+ * graph-based methods still traverse filtered-out nodes, so that filtered search
+ * costs about the same as a regular one. The filter doesn't own the memory.
+ */
+class QueryFilter {
+ public:
+  // mask[id] is true if the object with this id can be returned (ids >= qty can't)
+  static QueryFilter FromMask(const bool* mask, size_t qty) {
+    return QueryFilter(mask, nullptr, qty);
+  }
+  // ids that can be returned, they must be sorted in ascending order
+  static QueryFilter FromSortedIds(const IdType* ids, size_t qty) {
+    return QueryFilter(nullptr, ids, qty);
+  }
+
+  bool IsAllowed(IdType id) const {
+    if (mask_) return id >= 0 && static_cast<size_t>(id) < qty_ && mask_[id];
+    return std::binary_search(ids_, ids_ + qty_, id);
+  }
+  // The number of ids that can be returned (some of them may be missing in the index)
+  size_t AllowedQty() const { return allowedQty_; }
+  // Calls f(id) for every id that can be returned, in ascending order
+  template <typename F>
+  void ForEachAllowed(F f) const {
+    if (mask_) {
+      for (size_t id = 0; id < qty_; ++id)
+        if (mask_[id]) f(static_cast<IdType>(id));
+    } else {
+      for (size_t i = 0; i < qty_; ++i) f(ids_[i]);
+    }
+  }
+
+ private:
+  QueryFilter(const bool* mask, const IdType* ids, size_t qty)
+      : mask_(mask), ids_(ids), qty_(qty),
+        allowedQty_(mask ? std::count(mask, mask + qty, true) : qty) {}
+
+  const bool*   mask_;
+  const IdType* ids_;
+  size_t        qty_;
+  size_t        allowedQty_;
+};
+
 template <typename dist_t>
 class Space;
 
@@ -31,6 +124,18 @@ class Query {
   const Object* QueryObject() const;
   uint64_t DistanceComputations() const;
   void AddDistanceComputations(uint64_t DistComp) { distance_computations_ += DistComp; }
+  // Statistics are NOT owned by the query, a nullptr means "do not collect statistics"
+  QueryStats* Stats() const { return stats_; }
+  void SetStats(QueryStats* stats) { stats_ = stats; }
+  // Query-time parameter overrides are NOT owned by the query, a nullptr means "no overrides"
+  const QueryTimeParams* QueryParams() const { return query_params_; }
+  void SetQueryParams(const QueryTimeParams* params) { query_params_ = params; }
+  // The filter is NOT owned by the query, a nullptr means "any object can be returned"
+  const QueryFilter* Filter() const { return filter_; }
+  void SetFilter(const QueryFilter* filter) { filter_ = filter; }
+  bool IsAllowed(const Object* object) const {
+    return filter_ == nullptr || filter_->IsAllowed(object->id());
+  }
 
   void ResetStats();
   virtual dist_t Distance(const Object* object1, const Object* object2) const;
@@ -48,6 +153,9 @@ class Query {
   const Space<dist_t>& space_;
   const Object* query_object_;
   mutable uint64_t distance_computations_;
+  QueryStats* stats_ = nullptr;
+  const QueryTimeParams* query_params_ = nullptr;
+  const QueryFilter* filter_ = nullptr;
 
   // disable copy and assign
   DISABLE_COPY_AND_ASSIGN(Query);
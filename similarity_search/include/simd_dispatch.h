@@ -0,0 +1,81 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#ifndef _SIMD_DISPATCH_H_
+#define _SIMD_DISPATCH_H_
+
+#include <cstddef>
+#include <cstdint>
+
+namespace similarity {
+
+/*
+ * The most frequently used distance kernels are compiled for several instruction
+ * sets and the best one supported by the CPU is chosen at runtime. Thus, the library
+ * doesn't need to be compiled with -march=native to run at full speed, and a binary
+ * built on one machine doesn't crash on another one lacking, e.g., AVX-512.
+ */
+enum SIMDLevel {
+  kSIMDGeneric = 0, // plain C++
+  kSIMDSSE42   = 1,
+  kSIMDAVX2    = 2, // AVX2 + FMA + F16C
+  kSIMDAVX512  = 3  // AVX-512F + AVX-512BW
+};
+
+/*
+ * These kernels compute raw sums, which are then transformed
+ * into distances by the respective distance functions.
+ */
+struct DistKernels {
+  SIMDLevel level;
+  // The sum of squared differences
+  float   (*L2Sqr)(const float* pVect1, const float* pVect2, size_t qty);
+  // The sum of absolute differences
+  float   (*L1)(const float* pVect1, const float* pVect2, size_t qty);
+  // The scalar product
+  float   (*Dot)(const float* pVect1, const float* pVect2, size_t qty);
+  // The scalar product and squared norms of both vectors (computed in one pass for the cosine distance)
+  void    (*DotNorms)(const float* pVect1, const float* pVect2, size_t qty,
+                      float& prod, float& sqr1, float& sqr2);
+  // The scalar product of vectors with unsigned byte elements
+  int32_t (*DotUInt8)(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty);
+  // The sum of squared differences of vectors with unsigned byte elements
+  int32_t (*L2SqrUInt8)(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty);
+  // The same as L2Sqr, Dot, and DotNorms for vectors of half-precision numbers (see float16.h)
+  float   (*L2SqrFloat16)(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty);
+  float   (*DotFloat16)(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty);
+  void    (*DotNormsFloat16)(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty,
+                             float& prod, float& sqr1, float& sqr2);
+  // The same as L2Sqr, Dot, and DotNorms for vectors with signed byte elements
+  int32_t (*L2SqrInt8)(const int8_t* pVect1, const int8_t* pVect2, size_t qty);
+  int32_t (*DotInt8)(const int8_t* pVect1, const int8_t* pVect2, size_t qty);
+  void    (*DotNormsInt8)(const int8_t* pVect1, const int8_t* pVect2, size_t qty,
+                          int32_t& prod, int32_t& sqr1, int32_t& sqr2);
+};
+
+/*
+ * The kernels for the best level supported by both the CPU and the compiler.
+ * The level can be lowered (but not raised) by setting the environment variable
+ * NMSLIB_SIMD to one of: generic, sse4.2, avx2, avx512.
+ */
+const DistKernels& GetDistKernels();
+// The kernels for the given level, or for the best supported level if the given one isn't supported
+const DistKernels& GetDistKernels(SIMDLevel level);
+// The best level supported by both the CPU and the compiler (disregarding NMSLIB_SIMD)
+SIMDLevel GetSupportedSIMDLevel();
+const char* GetSIMDLevelName(SIMDLevel level);
+
+}  // namespace similarity
+
+#endif
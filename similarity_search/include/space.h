@@ -127,6 +127,46 @@ public:
   virtual void ComputePivotDistancesQueryTime(const Query<dist_t>* pQuery, vector<dist_t>& vResDist) const override;
 };
 
+/*
+ * Distances in some vector spaces are computed from data sections of two objects
+ * by a simple function. Such spaces describe their distance functions, so that
+ * methods (e.g., HNSW) can compute distances directly on flat copies of the data,
+ * without virtual calls. The kind permits using a method's own implementation.
+ */
+enum FlatDistKind {
+  kFlatDistNone       = 0,
+  kFlatDistL2         = 1, // the Euclidean distance
+  kFlatDistCosine     = 2, // the cosine distance
+  kFlatDistNegDotProd = 3, // the negative scalar product
+  kFlatDistL1         = 4,
+  kFlatDistLInf       = 5,
+  kFlatDistL2SqrSIFT  = 6, // the squared Euclidean distance between SIFT vectors
+  // The Euclidean distance, the cosine distance, and the negative scalar product
+  // between low-precision vectors (see SpaceLowPrecVector)
+  kFlatDistL2Float16         = 7,
+  kFlatDistCosineFloat16     = 8,
+  kFlatDistNegDotProdFloat16 = 9,
+  kFlatDistL2Int8            = 10,
+  kFlatDistCosineInt8        = 11,
+  kFlatDistNegDotProdInt8    = 12
+};
+
+template <typename dist_t>
+struct FlatDistFunc {
+  typedef dist_t (*FuncType)(const char* pData1, const char* pData2, size_t dataLength);
+
+  FlatDistFunc(FlatDistKind kind = kFlatDistNone, FuncType func = nullptr) : kind(kind), func(func) {}
+
+  FlatDistKind  kind;
+  /*
+   * Computes exactly the same value as IndexTimeDistance given data sections of two
+   * objects (the first one is the left argument), dataLength is the length of a section.
+   */
+  FuncType      func;
+};
+
+class ProductQuantizer;
+
 template <typename dist_t>
 class Space {
  public:
@@ -147,6 +187,16 @@ class Space {
 
   virtual string StrDesc() const = 0;
 
+  // Spaces whose distance can be computed by a simple function of data sections return it (see FlatDistFunc)
+  virtual FlatDistFunc<dist_t> GetFlatDistFunc() const { return FlatDistFunc<dist_t>(); }
+
+  /*
+   * Spaces that support product quantization (see SpacePQ) create untrained quantizers,
+   * which methods can train on their data and use to generate candidates cheaply.
+   * The caller owns the returned object.
+   */
+  virtual ProductQuantizer* CreateProductQuantizer() const { return nullptr; }
+
   /*
    * This virtual function can be overridden to create an index that
    * efficiently computes distance to all pivots. Contract: this
@@ -136,6 +136,8 @@ class KLDivGenFast : public KLDivAbstract<dist_t> {
   virtual Object* InverseGradientFunction(const Object* object) const;
   virtual std::string StrDesc() const { return "Generalized Kullback-Leibler divergence (precomputed logs)"; }
   virtual Object* CreateObjFromVect(IdType id, LabelType label, const std::vector<dist_t>& InpVect) const;
+  virtual size_t GetObjDataLength(size_t elemQty) const { return 2 * elemQty * sizeof(dist_t); }
+  virtual void CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const;
   virtual size_t GetElemQty(const Object* object) const { return object->datalength()/ sizeof(dist_t)/ 2; }
   virtual Object* Mean(const ObjectVector& data) const;
  protected:
@@ -156,6 +158,8 @@ class ItakuraSaitoFast : public BregmanDiv<dist_t> {
 
   virtual std::string StrDesc() const { return "Itakura-Saito (precomputed logs)"; }
   virtual Object* CreateObjFromVect(IdType id, LabelType label, const std::vector<dist_t>& InpVect) const;
+  virtual size_t GetObjDataLength(size_t elemQty) const { return 2 * elemQty * sizeof(dist_t); }
+  virtual void CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const;
   virtual size_t GetElemQty(const Object* object) const { return object->datalength()/ sizeof(dist_t)/ 2; }
   virtual Object* Mean(const ObjectVector& data) const;
  protected:
@@ -178,6 +182,8 @@ class KLDivGenFastRightQuery : public VectorSpace<dist_t> {
 
   virtual std::string StrDesc() const { return "Generalized Kullback-Leibler divergence, right queries (precomputed logs)"; }
   virtual Object* CreateObjFromVect(IdType id, LabelType label, const std::vector<dist_t>& InpVect) const;
+  virtual size_t GetObjDataLength(size_t elemQty) const { return 2 * elemQty * sizeof(dist_t); }
+  virtual void CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const;
   virtual size_t GetElemQty(const Object* object) const { return object->datalength()/ sizeof(dist_t)/ 2; }
  protected:
   // Should not be directly accessible
@@ -199,6 +205,8 @@ class KLDivFast: public VectorSpace<dist_t> {
 
   virtual std::string StrDesc() const { return "Kullback-Leibler divergence (precomputed logs)"; }
   virtual Object* CreateObjFromVect(IdType id, LabelType label, const std::vector<dist_t>& InpVect) const;
+  virtual size_t GetObjDataLength(size_t elemQty) const { return 2 * elemQty * sizeof(dist_t); }
+  virtual void CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const;
   virtual size_t GetElemQty(const Object* object) const { return object->datalength()/ sizeof(dist_t)/ 2; }
  protected:
   // Should not be directly accessible
@@ -220,6 +228,8 @@ class KLDivFastRightQuery: public VectorSpace<dist_t> {
 
   virtual std::string StrDesc() const { return "Kullback-Leibler divergence, right queries (precomputed logs)"; }
   virtual Object* CreateObjFromVect(IdType id, LabelType label, const std::vector<dist_t>& InpVect) const;
+  virtual size_t GetObjDataLength(size_t elemQty) const { return 2 * elemQty * sizeof(dist_t); }
+  virtual void CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const;
   virtual size_t GetElemQty(const Object* object) const { return object->datalength()/ sizeof(dist_t)/ 2; }
  protected:
   // Should not be directly accessible
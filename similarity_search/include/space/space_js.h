@@ -46,6 +46,10 @@ class SpaceJSBase : public VectorSpace<dist_t> {
 
   virtual std::string StrDesc() const = 0;
   virtual Object* CreateObjFromVect(IdType id, LabelType label, const std::vector<dist_t>& InpVect) const;
+  virtual size_t GetObjDataLength(size_t elemQty) const {
+    return (type_ == kJSSlow ? 1 : 2) * elemQty * sizeof(dist_t);
+  }
+  virtual void CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const;
 
   virtual size_t GetElemQty(const Object* object) const {
     size_t tmp = object->datalength()/ sizeof(dist_t);
@@ -58,10 +58,18 @@ class SpaceL2SqrSift : public Space<DistTypeSIFT> {
   /** End of standard functions to read/write/create objects */ 
 
   virtual Object* CreateObjFromUint8Vect(IdType id, LabelType label, const std::vector<uint8_t>& InpVect) const;
+  // The length of the data section of a SIFT object: a vector of bytes followed by the precomputed squared norm
+  size_t GetObjDataLength() const { return SIFT_DIM + sizeof(DistTypeSIFT); }
+  // Fills out the data section of an object in place (pVect must have SIFT_DIM elements)
+  void CreateObjDataFromUint8Vect(const uint8_t* pVect, char* pData) const;
   virtual size_t GetElemQty(const Object* object) const override { return SIFT_DIM; }
 
   virtual string StrDesc() const override { return SPACE_L2SQR_SIFT; }
 
+  virtual FlatDistFunc<DistTypeSIFT> GetFlatDistFunc() const override {
+    return FlatDistFunc<DistTypeSIFT>(kFlatDistL2SqrSIFT, FlatDistance);
+  }
+
   virtual bool ApproxEqual(const Object& obj1, const Object& obj2) const override;
 
   virtual void CreateDenseVectFromObj(const Object* obj, DistTypeSIFT* pVect, size_t nElem) const override;
@@ -77,6 +85,10 @@ protected:
 
     return l2SqrSIFTPrecompAVX(pVect1, pVect2);
   }
+
+  static DistTypeSIFT FlatDistance(const char* pData1, const char* pData2, size_t /* dataLength */) {
+    return l2SqrSIFTPrecompAVX(reinterpret_cast<const uint8_t*>(pData1), reinterpret_cast<const uint8_t*>(pData2));
+  }
 };
  
 }  // namespace similarity
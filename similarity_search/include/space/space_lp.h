@@ -80,6 +80,7 @@ class SpaceLp : public VectorSpaceSimpleStorage<dist_t> {
   virtual ~SpaceLp() {}
 
   virtual std::string StrDesc() const;
+  virtual FlatDistFunc<dist_t> GetFlatDistFunc() const;
  protected:
   virtual dist_t HiddenDistance(const Object* obj1, const Object* obj2) const;
  private:
@@ -0,0 +1,61 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#ifndef _SPACE_PQ_H_
+#define _SPACE_PQ_H_
+
+#include <string>
+#include <sstream>
+
+#include "space/space_lp.h"
+#include "pq.h"
+
+#define SPACE_PQ    "pq"
+
+namespace similarity {
+
+/*
+ * The Euclidean space, whose data can be compressed by product quantization.
+ * Distances between objects are exact, but methods supporting PQ (brute_force, hnsw)
+ * scan PQ codes of the data (subQty bytes per vector) and re-rank the best candidates
+ * using exact distances.
+ */
+class SpacePQ : public SpaceLp<float> {
+ public:
+  SpacePQ(size_t subQty, size_t centroidQty, size_t trainQty, size_t iterQty) :
+      SpaceLp<float>(2), subQty_(subQty), centroidQty_(centroidQty), trainQty_(trainQty), iterQty_(iterQty) {
+    // Check parameters right away
+    ProductQuantizer(subQty_, centroidQty_, trainQty_, iterQty_);
+  }
+
+  virtual std::string StrDesc() const override {
+    std::stringstream stream;
+    stream << "SpacePQ: m = " << subQty_ << " k = " << centroidQty_;
+    return stream.str();
+  }
+
+  virtual ProductQuantizer* CreateProductQuantizer() const override {
+    return new ProductQuantizer(subQty_, centroidQty_, trainQty_, iterQty_);
+  }
+
+ private:
+  size_t subQty_;
+  size_t centroidQty_;
+  size_t trainQty_;
+  size_t iterQty_;
+};
+
+}  // namespace similarity
+
+#endif
@@ -42,6 +42,7 @@ public:
   virtual std::string StrDesc() const {
     return "CosineSimilarity";
   }
+  virtual FlatDistFunc<dist_t> GetFlatDistFunc() const;
 protected:
   virtual dist_t HiddenDistance(const Object* obj1, const Object* obj2) const;
   DISABLE_COPY_AND_ASSIGN(SpaceCosineSimilarity);
@@ -75,6 +76,7 @@ public:
   virtual std::string StrDesc() const {
     return SPACE_NEGATIVE_SCALAR;
   }
+  virtual FlatDistFunc<dist_t> GetFlatDistFunc() const;
   virtual size_t GetElemQty(const Object* object) const {
     return object->datalength()/ sizeof(dist_t);
   }
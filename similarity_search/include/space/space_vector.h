@@ -62,6 +62,17 @@ class VectorSpace : public Space<dist_t> {
   virtual bool ApproxEqual(const Object& obj1, const Object& obj2) const;
 
   virtual Object* CreateObjFromVect(IdType id, LabelType label, const std::vector<dist_t>& InpVect) const;
+  /*
+   * The following two functions permit creating objects in place, e.g., in an ObjectArena,
+   * without copying the input vector into a temporary std::vector first. If a space overrides
+   * CreateObjFromVect, it should override both of these functions as well (and vice versa).
+   */
+  // The length of the data section of an object that represents a vector with elemQty elements
+  virtual size_t GetObjDataLength(size_t elemQty) const { return elemQty * sizeof(dist_t); }
+  // Fills out the data section of an object (its size is given by GetObjDataLength)
+  virtual void CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const {
+    memcpy(pData, pVect, elemQty * sizeof(dist_t));
+  }
   virtual size_t GetElemQty(const Object* object) const = 0;
   virtual void CreateDenseVectFromObj(const Object* obj, dist_t* pVect,
                                  size_t nElem) const = 0;
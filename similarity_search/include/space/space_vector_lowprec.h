@@ -0,0 +1,176 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#ifndef _SPACE_VECTOR_LOWPREC_H_
+#define _SPACE_VECTOR_LOWPREC_H_
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <cstring>
+#include <limits>
+#include <string>
+#include <vector>
+
+#include "space/space_vector.h"
+#include "float16.h"
+#include "simd_dispatch.h"
+
+#define SPACE_L2_FLOAT16                "l2_float16"
+#define SPACE_COSINE_SIMILARITY_FLOAT16 "cosinesimil_float16"
+#define SPACE_NEGATIVE_SCALAR_FLOAT16   "negdotprod_float16"
+#define SPACE_L2_INT8                   "l2_int8"
+#define SPACE_COSINE_SIMILARITY_INT8    "cosinesimil_int8"
+#define SPACE_NEGATIVE_SCALAR_INT8      "negdotprod_int8"
+
+namespace similarity {
+
+using std::string;
+using std::vector;
+
+/*
+ * Element types of low-precision vectors: conversion from/to float and distance kernels.
+ */
+template <typename ElemType> struct LowPrecTraits;
+
+template <> struct LowPrecTraits<Float16> {
+  static const char* Name() { return "float16"; }
+  // The first of three consecutive kinds (L2, cosine, negative scalar product)
+  static FlatDistKind FirstFlatDistKind() { return kFlatDistL2Float16; }
+
+  static Float16 FromFloat(float val) { return FloatToFloat16(val); }
+  static float ToFloat(Float16 val) { return Float16ToFloat(val); }
+
+  static float L2Sqr(const Float16* pVect1, const Float16* pVect2, size_t qty) {
+    return GetDistKernels().L2SqrFloat16(pVect1, pVect2, qty);
+  }
+  static float Dot(const Float16* pVect1, const Float16* pVect2, size_t qty) {
+    return GetDistKernels().DotFloat16(pVect1, pVect2, qty);
+  }
+  static void DotNorms(const Float16* pVect1, const Float16* pVect2, size_t qty,
+                       float& prod, float& sqr1, float& sqr2) {
+    GetDistKernels().DotNormsFloat16(pVect1, pVect2, qty, prod, sqr1, sqr2);
+  }
+};
+
+template <> struct LowPrecTraits<int8_t> {
+  static const char* Name() { return "int8"; }
+  static FlatDistKind FirstFlatDistKind() { return kFlatDistL2Int8; }
+
+  // Values are rounded and clipped to [-128, 127]
+  static int8_t FromFloat(float val) {
+    return static_cast<int8_t>(std::max(-128.0f, std::min(127.0f, std::round(val))));
+  }
+  static float ToFloat(int8_t val) { return val; }
+
+  static float L2Sqr(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+    return GetDistKernels().L2SqrInt8(pVect1, pVect2, qty);
+  }
+  static float Dot(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+    return GetDistKernels().DotInt8(pVect1, pVect2, qty);
+  }
+  static void DotNorms(const int8_t* pVect1, const int8_t* pVect2, size_t qty,
+                       float& prod, float& sqr1, float& sqr2) {
+    int32_t iprod, isqr1, isqr2;
+    GetDistKernels().DotNormsInt8(pVect1, pVect2, qty, iprod, isqr1, isqr2);
+    prod = iprod; sqr1 = isqr1; sqr2 = isqr2;
+  }
+};
+
+/*
+ * Dense vectors stored using half-precision (Float16) or signed byte (int8_t) elements,
+ * which take two or four times less memory than float vectors. Distances (the Euclidean
+ * distance, the cosine distance, and the negative scalar product) are computed in float
+ * by kernels that convert elements on the fly. Float vectors (e.g., read from files)
+ * are converted to elements of the space, int8 values are rounded and clipped.
+ */
+template <typename ElemType>
+class SpaceLowPrecVector : public VectorSpace<float> {
+ public:
+  enum DistKind { kL2 = 0, kCosine = 1, kNegDotProd = 2 };
+
+  explicit SpaceLowPrecVector(DistKind distKind) : distKind_(distKind) {}
+  virtual ~SpaceLowPrecVector() {}
+
+  virtual string StrDesc() const override;
+
+  virtual bool ApproxEqual(const Object& obj1, const Object& obj2) const override;
+  virtual string CreateStrFromObj(const Object* pObj, const string& externId /* ignored */) const override;
+
+  virtual Object* CreateObjFromVect(IdType id, LabelType label, const vector<float>& InpVect) const override;
+  virtual size_t GetObjDataLength(size_t elemQty) const override { return elemQty * sizeof(ElemType); }
+  // Converts float elements
+  virtual void CreateObjDataFromVect(const float* pVect, size_t elemQty, char* pData) const override;
+  // Copies elements of the space type as they are
+  void CreateObjDataFromElems(const ElemType* pVect, size_t elemQty, char* pData) const {
+    memcpy(pData, pVect, elemQty * sizeof(ElemType));
+  }
+
+  virtual size_t GetElemQty(const Object* object) const override {
+    return object->datalength() / sizeof(ElemType);
+  }
+  virtual void CreateDenseVectFromObj(const Object* obj, float* pVect, size_t nElem) const override;
+
+  virtual FlatDistFunc<float> GetFlatDistFunc() const override {
+    static const typename FlatDistFunc<float>::FuncType funcs[] = {
+      L2Distance, CosineDistance, NegDotProdDistance
+    };
+    return FlatDistFunc<float>(FlatDistKind(LowPrecTraits<ElemType>::FirstFlatDistKind() + distKind_),
+                               funcs[distKind_]);
+  }
+
+ protected:
+  virtual float HiddenDistance(const Object* obj1, const Object* obj2) const override {
+    CHECK(obj1->datalength() > 0);
+    CHECK(obj1->datalength() == obj2->datalength());
+    switch (distKind_) {
+      case kL2:     return L2Distance(obj1->data(), obj2->data(), obj1->datalength());
+      case kCosine: return CosineDistance(obj1->data(), obj2->data(), obj1->datalength());
+      default:      return NegDotProdDistance(obj1->data(), obj2->data(), obj1->datalength());
+    }
+  }
+
+ private:
+  typedef LowPrecTraits<ElemType> Traits;
+
+  static const ElemType* elems(const char* pData) { return reinterpret_cast<const ElemType*>(pData); }
+
+  static float L2Distance(const char* pData1, const char* pData2, size_t dataLength) {
+    return std::sqrt(Traits::L2Sqr(elems(pData1), elems(pData2), dataLength / sizeof(ElemType)));
+  }
+  // The same as the distance of the space cosinesimil
+  static float CosineDistance(const char* pData1, const char* pData2, size_t dataLength) {
+    float prod, sqr1, sqr2;
+    Traits::DotNorms(elems(pData1), elems(pData2), dataLength / sizeof(ElemType), prod, sqr1, sqr2);
+    const float eps = std::numeric_limits<float>::min() * 2;
+    float cosine;
+    if (sqr1 < eps) {
+      cosine = sqr2 < eps ? 1 : 0;
+    } else {
+      cosine = std::max(-1.0f, std::min(1.0f, prod / std::sqrt(sqr1) / std::sqrt(sqr2)));
+    }
+    return std::max(0.0f, 1 - cosine);
+  }
+  static float NegDotProdDistance(const char* pData1, const char* pData2, size_t dataLength) {
+    return -Traits::Dot(elems(pData1), elems(pData2), dataLength / sizeof(ElemType));
+  }
+
+  DistKind distKind_;
+
+  DISABLE_COPY_AND_ASSIGN(SpaceLowPrecVector);
+};
+
+}  // namespace similarity
+
+#endif
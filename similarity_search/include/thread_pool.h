@@ -12,10 +12,23 @@
  * Apache License Version 2.0 http://www.apache.org/licenses/.
  *
  */
+#ifndef _THREAD_POOL_H_
+#define _THREAD_POOL_H_
+
+#include <algorithm>
 #include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <functional>
+#include <memory>
 #include <thread>
 #include <queue>
 #include <mutex>
+#include <new>
+#include <vector>
+#if !defined(_WIN32)
+#include <pthread.h>
+#endif
 
 namespace similarity {
 
@@ -53,64 +66,253 @@ namespace similarity {
 
 */
 
+  /*
+   * A pool of worker threads executing queued tasks. The process-wide instance
+   * returned by ThreadPool::Global() is shared by ParallelFor (and, hence, by all
+   * the indexing/querying code that relies on ParallelFor), so that threads are
+   * not created and joined on every call. Worker threads are started lazily,
+   * when the first task is submitted.
+   *
+   * A forked child process inherits only the thread that called fork(): the global
+   * pool is reset in the child, so that its workers are started anew.
+   */
+  class ThreadPool {
+   public:
+    explicit ThreadPool(size_t threadQty) : threadQty_(threadQty), stop_(false) {}
+    ~ThreadPool() { StopWorkers(); }
+
+    // The process-wide pool: by default, it has one thread per (logical) core
+    static ThreadPool& Global() {
+      static ThreadPool pool(std::max<size_t>(1, std::thread::hardware_concurrency()));
+#if !defined(_WIN32)
+      static bool forkHandlersSet = pthread_atfork(&BeforeFork, &AfterForkInParent, &AfterForkInChild) == 0;
+      (void)forkHandlersSet;
+#endif
+      return pool;
+    }
+
+    size_t Size() {
+      std::unique_lock<std::mutex> lock(mtx_);
+      return threadQty_;
+    }
+
+    /*
+     * Changes the number of worker threads: the current workers finish
+     * all queued tasks and exit, new workers are started on demand.
+     * This function must not be called from a task running in the pool.
+     */
+    void Resize(size_t threadQty) {
+      std::unique_lock<std::mutex> resizeLock(resizeMtx_);
+      StopWorkers();
+      std::unique_lock<std::mutex> lock(mtx_);
+      threadQty_ = std::max<size_t>(1, threadQty);
+    }
+
+    // Tasks must not throw exceptions, any exception would be silently ignored.
+    void Submit(std::function<void()> task) {
+      std::unique_lock<std::mutex> lock(mtx_);
+      if (workers_.empty() && !stop_) {
+        for (size_t i = 0; i < threadQty_; ++i) {
+          workers_.push_back(std::thread([this] { WorkerLoop(); }));
+        }
+      }
+      tasks_.push(std::move(task));
+      cond_.notify_one();
+    }
+
+   private:
+    // The lock is held across fork(), so that the child doesn't get a queue in the middle of an update
+    static void BeforeFork() { Global().mtx_.lock(); }
+    static void AfterForkInParent() { Global().mtx_.unlock(); }
+
+    /*
+     * Threads of the parent don't exist in the child: their std::thread objects are leaked,
+     * because destroying them would call std::terminate and they can't be joined.
+     * Queued tasks belong to ParallelFor calls of the parent and are discarded.
+     * Other synchronization objects could be held (or waited on) by the parent's threads,
+     * so they are re-created.
+     */
+    static void AfterForkInChild() {
+      ThreadPool& pool = Global();
+      new std::vector<std::thread>(std::move(pool.workers_));
+      std::queue<std::function<void()>>().swap(pool.tasks_);
+      pool.stop_ = false;
+      new (&pool.resizeMtx_) std::mutex();
+      new (&pool.cond_) std::condition_variable();
+      pool.mtx_.unlock();
+    }
+
+    void WorkerLoop() {
+      while (true) {
+        std::function<void()> task;
+        {
+          std::unique_lock<std::mutex> lock(mtx_);
+          cond_.wait(lock, [this] { return stop_ || !tasks_.empty(); });
+          // When stopping, the queue is drained first
+          if (tasks_.empty()) return;
+          task = std::move(tasks_.front());
+          tasks_.pop();
+        }
+        try {
+          task();
+        } catch (...) {}
+      }
+    }
+
+    void StopWorkers() {
+      std::vector<std::thread> workers;
+      {
+        std::unique_lock<std::mutex> lock(mtx_);
+        stop_ = true;
+        workers.swap(workers_);
+      }
+      cond_.notify_all();
+      for (auto & worker : workers) {
+        worker.join();
+      }
+      std::unique_lock<std::mutex> lock(mtx_);
+      stop_ = false;
+    }
+
+    size_t                              threadQty_;
+    bool                                stop_;
+    std::vector<std::thread>            workers_;
+    std::queue<std::function<void()>>   tasks_;
+    std::mutex                          mtx_;
+    std::mutex                          resizeMtx_;
+    std::condition_variable             cond_;
+  };
+
+  // Changes the number of threads in the process-wide pool used by ParallelFor
+  inline void SetThreadPoolSize(size_t threadQty) {
+    ThreadPool::Global().Resize(threadQty);
+  }
+
+  inline size_t GetThreadPoolSize() {
+    return ThreadPool::Global().Size();
+  }
+
+  // ParallelFor threads grab this many ids at once (fewer if there is not enough work)
+  const size_t PARALLEL_FOR_MAX_CHUNK_SIZE = 64;
+
+  /*
+   * The state of a ParallelFor call shared with the pool tasks. A task can start
+   * after the call has finished (e.g., if all pool threads were busy): in this
+   * case, it simply exits and doesn't touch the caller's (already destroyed) data.
+   */
+  struct ParallelForState {
+    explicit ParallelForState(size_t start) : current_(start) {}
+
+    bool Enter() {
+      std::unique_lock<std::mutex> lock(mtx_);
+      if (finished_) return false;
+      ++active_;
+      return true;
+    }
+
+    void Leave() {
+      std::unique_lock<std::mutex> lock(mtx_);
+      if (--active_ == 0) cond_.notify_all();
+    }
+
+    // Prevents new tasks from entering and waits for the active ones to finish
+    void Finish() {
+      std::unique_lock<std::mutex> lock(mtx_);
+      finished_ = true;
+      cond_.wait(lock, [this] { return active_ == 0; });
+    }
+
+    std::atomic<size_t>       current_;
+    // keep track of exceptions in threads
+    // https://stackoverflow.com/a/32428427/1713196
+    std::exception_ptr        lastException_ = nullptr;
+    std::mutex                lastExceptMutex_;
+
+   private:
+    std::mutex                mtx_;
+    std::condition_variable   cond_;
+    size_t                    active_ = 0;
+    bool                      finished_ = false;
+  };
+
   /* 
    * replacement for the openmp '#pragma omp parallel for' directive
    * only handles a subset of functionality (no reductions etc)
    * Process ids from start (inclusive) to end (EXCLUSIVE)
+   *
+   * The work is done by the calling thread and (at most numThreads - 1) threads
+   * from the process-wide pool. Thus, the number of threads is limited by the
+   * pool size (numThreads == 0 means "use the whole pool"): a larger numThreads,
+   * e.g., an explicit indexThreadQty exceeding the number of cores, is reduced
+   * to the pool size, which can be increased using SetThreadPoolSize.
+   * Ids are handed out in chunks, threadId is always < numThreads.
    */
   template <class Function>
   inline void ParallelFor(size_t start, size_t end, size_t numThreads, Function fn) {
-    if (numThreads <= 0) {
-      numThreads = std::thread::hardware_concurrency();
+    ThreadPool& pool = ThreadPool::Global();
+    size_t poolSize = pool.Size();
+    if (numThreads <= 0 || numThreads > poolSize) {
+      numThreads = poolSize;
     }
+    size_t qty = end > start ? end - start : 0;
+    numThreads = std::min(numThreads, qty);
 
-    if (numThreads == 1) {
+    if (numThreads <= 1) {
       for (size_t id = start; id < end; id++) {
         fn(id, 0);
       }
     } else {
-      std::vector<std::thread>  threads;
-      std::atomic<size_t>       current(start);
-
-      // keep track of exceptions in threads
-      // https://stackoverflow.com/a/32428427/1713196
-      std::exception_ptr lastException = nullptr;
-      std::mutex         lastExceptMutex;
+      size_t chunkSize = std::max<size_t>(1, std::min(PARALLEL_FOR_MAX_CHUNK_SIZE,
+                                                      qty / (numThreads * 8)));
+      std::shared_ptr<ParallelForState> state = std::make_shared<ParallelForState>(start);
 
-      for (size_t threadId = 0; threadId < numThreads; ++threadId) {
-        threads.push_back(std::thread([&, threadId] {
-          while (true) {
-            size_t id = current.fetch_add(1);
+      auto worker = [&](size_t threadId) {
+        while (true) {
+          size_t first = state->current_.fetch_add(chunkSize);
 
-            if ((id >= end)) {
-              break;
-            }
+          if ((first >= end)) {
+            break;
+          }
 
-            try {
+          size_t last = std::min(end, first + chunkSize);
+          try {
+            for (size_t id = first; id < last; ++id) {
               fn(id, threadId);
-            } catch (...) {
-              std::unique_lock<std::mutex> lastExcepLock(lastExceptMutex);
-              lastException = std::current_exception();
-              /* 
-               * This will work even when current is the largest value that
-               * size_t can fit, because fetch_add returns the previous value
-               * before the increment (what will result in overflow 
-               * and produce 0 instead of current + 1).
-               */
-              current = end;
-              break;
             }
+          } catch (...) {
+            std::unique_lock<std::mutex> lastExcepLock(state->lastExceptMutex_);
+            state->lastException_ = std::current_exception();
+            /* 
+             * This will work even when current is the largest value that
+             * size_t can fit, because fetch_add returns the previous value
+             * before the increment (what will result in overflow 
+             * and produce 0 instead of current + chunkSize).
+             */
+            state->current_ = end;
+            break;
           }
-        }));
-      }
-      for (auto & thread : threads) {
-        thread.join();
+        }
+      };
+      auto pWorker = &worker;
+
+      for (size_t threadId = 1; threadId < numThreads; ++threadId) {
+        pool.Submit([state, pWorker, threadId] {
+          if (state->Enter()) {
+            (*pWorker)(threadId);
+            state->Leave();
+          }
+        });
       }
-      if (lastException) {
-        std::rethrow_exception(lastException);
+      // The calling thread participates too, which guarantees progress
+      // even if all pool threads are busy (e.g., for nested calls).
+      worker(0);
+      state->Finish();
+
+      if (state->lastException_) {
+        std::rethrow_exception(state->lastException_);
       }
     }
-
-
   }
 };
+
+#endif
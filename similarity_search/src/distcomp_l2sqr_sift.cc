@@ -17,6 +17,7 @@
 #include "utils.h"
 #include "pow.h"
 #include "portable_intrinsics.h"
+#include "simd_dispatch.h"
 
 #include <cstdlib>
 #include <limits>
@@ -99,55 +100,12 @@ DistTypeSIFT l2SqrSIFTPrecompSSE2(const uint8_t* pVect1,
 
 DistTypeSIFT l2SqrSIFTPrecompAVX(const uint8_t* pVect1,
                                  const uint8_t* pVect2) {
-#ifndef PORTABLE_AVX2
-#pragma message WARN("l2SqrSIFTPrecompAVX: AVX2 is not available")
-  #ifndef PORTABLE_SSE4
-  #pragma message WARN("l2SqrSIFTPrecompAVX: SSE4 is not available")
-    return l2SqrSIFTPrecomp(pVect1, pVect2);
-  #else
-    return l2SqrSIFTPrecompSSE2(pVect1, pVect2);
-  #endif
-#else
-  const unsigned dim = SIFT_DIM;
-
-  DistTypeSIFT sumProd = 0;
-
-  size_t sse_offset = (dim / 32) * 32;
-
-  const __m256i* pStart1 = reinterpret_cast<const __m256i*>(pVect1);
-  const __m256i* pStart2 = reinterpret_cast<const __m256i*>(pVect2);
-  const __m256i* pEnd1   = reinterpret_cast<const __m256i*>(pVect1 + sse_offset);
-
-  __m256i zero, x1, y1;
-  zero = _mm256_xor_si256(zero,zero);
-  __m256i sum = zero;
-
-  int32_t PORTABLE_ALIGN32 unpack[8];
-
-  while (pStart1 < pEnd1) {
-    const __m256i x = _mm256_loadu_si256(pStart1++);
-    const __m256i y = _mm256_loadu_si256(pStart2++);
-    x1 = _mm256_unpackhi_epi8(x,zero);
-    y1 = _mm256_unpackhi_epi8(y,zero);
-    sum = _mm256_add_epi32(sum, _mm256_madd_epi16(x1, y1));
-    x1 = _mm256_unpacklo_epi8(x,zero);
-    y1 = _mm256_unpacklo_epi8(y,zero);
-    sum = _mm256_add_epi32(sum, _mm256_madd_epi16(x1, y1));
-  }
-  _mm256_store_si256((__m256i *)unpack, sum);
-  sumProd += unpack[0] + unpack[1] + unpack[2] + unpack[3] +
-         unpack[4] + unpack[5] + unpack[6] + unpack[7];
-
-  if (dim & 32) {
-    for (uint_fast32_t i = sse_offset; i < dim; ++i) {
-      sumProd += DistTypeSIFT(pVect1[i]) * DistTypeSIFT(pVect2[i]);
-    }
-  }
+  // Despite the name, the kernel is chosen at runtime according to the instruction set supported by the CPU
+  DistTypeSIFT sumProd = GetDistKernels().DotUInt8(pVect1, pVect2, SIFT_DIM);
 
   return
-      *reinterpret_cast<const DistTypeSIFT*>(pVect1+dim) +
-      *reinterpret_cast<const DistTypeSIFT*>(pVect2+dim) - 2*sumProd;
-#endif
+      *reinterpret_cast<const DistTypeSIFT*>(pVect1 + SIFT_DIM) +
+      *reinterpret_cast<const DistTypeSIFT*>(pVect2 + SIFT_DIM) - 2*sumProd;
 }
 
 }
@@ -17,6 +17,7 @@
 #include "utils.h"
 #include "pow.h"
 #include "portable_intrinsics.h"
+#include "simd_dispatch.h"
 
 #include <cstdlib>
 #include <limits>
@@ -236,65 +237,8 @@ template double L1Norm<double>(const double* pVect1, const double* pVect2, size_
 
 template <> 
 float L1NormSIMD(const float* pVect1, const float* pVect2, size_t qty) {
-#ifndef PORTABLE_SSE2
-#pragma message WARN("L1NormSIMD<float>: SSE2 is not available, defaulting to pure C++ implementation!")
-    return L1NormStandard(pVect1, pVect2, qty);
-#else
-    size_t qty4  = qty/4;
-    size_t qty16 = qty/16;
-
-    const float* pEnd1 = pVect1 + 16 * qty16;
-    const float* pEnd2 = pVect1 + 4  * qty4;
-    const float* pEnd3 = pVect1 + qty;
-
-    __m128  diff, v1, v2; 
-    __m128  sum = _mm_setzero_ps();
-
-    /* 
-     * A hack to quickly unset the sign flag.
-     */
-    __m128 mask_sign = _mm_castsi128_ps(_mm_set1_epi32(0x7fffffffu));
-
-    while (pVect1 < pEnd1) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_and_ps(diff, mask_sign));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_and_ps(diff, mask_sign));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_and_ps(diff, mask_sign));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_and_ps(diff, mask_sign));
-    }
-
-    while (pVect1 < pEnd2) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_and_ps(diff, mask_sign));
-    }
-
-    float PORTABLE_ALIGN16 TmpRes[4];
-
-    _mm_store_ps(TmpRes, sum);
-    double res= TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-
-    while (pVect1 < pEnd3) {
-        res += fabs(*pVect1++ - *pVect2++);
-    }
-
-    return res;
-#endif
+    // The kernel is chosen at runtime according to the instruction set supported by the CPU
+    return GetDistKernels().L1(pVect1, pVect2, qty);
 }
 
 template <> 
@@ -395,66 +339,8 @@ template double L2Norm<double>(const double* pVect1, const double* pVect2, size_
  */
 
 float L2SqrSIMD(const float* pVect1, const float* pVect2, size_t qty) {
-#ifndef PORTABLE_SSE2
-#pragma message WARN("L2SqrSIMD<float>: SSE2 is not available, defaulting to pure C++ implementation!")
-    float res = 0, diff;
-    for (int i = 0; i < qty; ++i) {
-        diff = pVect1[i] - pVect2[i];
-        res += diff * diff;
-    }
-    return res;
-#else
-    size_t qty4  = qty/4;
-    size_t qty16 = qty/16;
-
-    const float* pEnd1 = pVect1 + 16 * qty16;
-    const float* pEnd2 = pVect1 + 4  * qty4;
-    const float* pEnd3 = pVect1 + qty;
-
-    __m128  diff, v1, v2; 
-    __m128  sum = _mm_set1_ps(0); 
-
-    while (pVect1 < pEnd1) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-    }
-
-    while (pVect1 < pEnd2) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        diff = _mm_sub_ps(v1, v2);
-        sum  = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-    }
-
-    float PORTABLE_ALIGN16 TmpRes[4];
-
-    _mm_store_ps(TmpRes, sum);
-    float res= TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-
-    while (pVect1 < pEnd3) {
-        float diff = *pVect1++ - *pVect2++; 
-        res += diff * diff;
-    }
-
-    return res;
-#endif
+    // The kernel is chosen at runtime according to the instruction set supported by the CPU
+    return GetDistKernels().L2Sqr(pVect1, pVect2, qty);
 }
 
 template <> 
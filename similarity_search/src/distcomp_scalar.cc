@@ -13,6 +13,7 @@
  *
  */
 #include "portable_intrinsics.h"
+#include "simd_dispatch.h"
 #include "distcomp.h"
 #include "string.h"
 
@@ -84,74 +85,9 @@ template double QueryNormScalarProduct<double>(const double* pVect1, const doubl
 
 template <> 
 float NormScalarProductSIMD(const float* pVect1, const float* pVect2, size_t qty) {
-#ifndef PORTABLE_SSE2
-#pragma message WARN("ScalarProductSIMD<float>: SSE2 is not available, defaulting to pure C++ implementation!")
-    return NormScalarProduct(pVect1, pVect2, qty);
-#else
-    size_t qty16  = qty/16;
-    size_t qty4  = qty/4;
-
-    const float* pEnd1 = pVect1 + 16  * qty16;
-    const float* pEnd2 = pVect1 + 4  * qty4;
-    const float* pEnd3 = pVect1 + qty;
-
-    __m128  v1, v2; 
-    __m128  sum_prod = _mm_set1_ps(0); 
-    __m128  sum_square1 = sum_prod;
-    __m128  sum_square2 = sum_prod;
-
-    while (pVect1 < pEnd1) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum_prod  = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        sum_square1  = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-        sum_square2  = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum_prod  = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        sum_square1  = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-        sum_square2  = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum_prod  = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        sum_square1  = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-        sum_square2  = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum_prod  = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        sum_square1  = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-        sum_square2  = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-    }
-
-    while (pVect1 < pEnd2) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum_prod  = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        sum_square1  = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-        sum_square2  = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-    }
-
-    float PORTABLE_ALIGN16 TmpResProd[4];
-    float PORTABLE_ALIGN16 TmpResSquare1[4];
-    float PORTABLE_ALIGN16 TmpResSquare2[4];
-
-    _mm_store_ps(TmpResProd, sum_prod);
-    float sum = TmpResProd[0] + TmpResProd[1] + TmpResProd[2] + TmpResProd[3];
-    _mm_store_ps(TmpResSquare1, sum_square1);
-    float norm1 = TmpResSquare1[0] + TmpResSquare1[1] + TmpResSquare1[2] + TmpResSquare1[3];
-    _mm_store_ps(TmpResSquare2, sum_square2);
-    float norm2 = TmpResSquare2[0] + TmpResSquare2[1] + TmpResSquare2[2] + TmpResSquare2[3];
-
-    while (pVect1 < pEnd3) {
-        sum += (*pVect1) * (*pVect2); 
-        norm1 += (*pVect1) * (*pVect1); 
-        norm2 += (*pVect2) * (*pVect2); 
-
-        ++pVect1; ++pVect2;
-    }
+    // The kernel is chosen at runtime according to the instruction set supported by the CPU
+    float sum, norm1, norm2;
+    GetDistKernels().DotNorms(pVect1, pVect2, qty, sum, norm1, norm2);
 
     const float eps = numeric_limits<float>::min() * 2;
 
@@ -167,7 +103,6 @@ float NormScalarProductSIMD(const float* pVect1, const float* pVect2, size_t qty
      * This throws off other functions that use scalar product, e.g., acos
      */
     return max(float(-1), min(float(1), sum / sqrt(norm1) / sqrt(norm2)));
-#endif
 }
 
 template <> 
@@ -289,56 +224,8 @@ template double ScalarProduct<double>(const double* pVect1, const double* pVect2
 
 template <> 
 float ScalarProductSIMD(const float* pVect1, const float* pVect2, size_t qty) {
-#ifndef PORTABLE_SSE2
-#pragma message WARN("ScalarProductSIMD<float>: SSE2 is not available, defaulting to pure C++ implementation!")
-    return ScalarProduct(pVect1, pVect2, qty);
-#else
-    size_t qty16  = qty/16;
-    size_t qty4  = qty/4;
-
-    const float* pEnd1 = pVect1 + 16  * qty16;
-    const float* pEnd2 = pVect1 + 4  * qty4;
-    const float* pEnd3 = pVect1 + qty;
-
-    __m128  v1, v2; 
-    __m128  sum = _mm_set1_ps(0); 
-
-    while (pVect1 < pEnd1) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum  = _mm_add_ps(sum, _mm_mul_ps(v1, v2));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum  = _mm_add_ps(sum, _mm_mul_ps(v1, v2));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum  = _mm_add_ps(sum, _mm_mul_ps(v1, v2));
-
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum  = _mm_add_ps(sum, _mm_mul_ps(v1, v2));
-    }
-
-    while (pVect1 < pEnd2) {
-        v1   = _mm_loadu_ps(pVect1); pVect1 += 4;
-        v2   = _mm_loadu_ps(pVect2); pVect2 += 4;
-        sum  = _mm_add_ps(sum, _mm_mul_ps(v1, v2));
-    }
-
-    float PORTABLE_ALIGN16 TmpRes[4];
-
-    _mm_store_ps(TmpRes, sum);
-    float res = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-
-    while (pVect1 < pEnd3) {
-        res += (*pVect1) * (*pVect2); 
-        ++pVect1; ++pVect2;
-    }
-
-    return res;
-#endif
+    // The kernel is chosen at runtime according to the instruction set supported by the CPU
+    return GetDistKernels().Dot(pVect1, pVect2, qty);
 }
 
 template <> 
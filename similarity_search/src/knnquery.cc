@@ -66,6 +66,7 @@ unsigned KNNQuery<dist_t>::ResultSize() const {
 template <typename dist_t>
 bool KNNQuery<dist_t>::CheckAndAddToResult(const dist_t distance,
                                            const Object* object) {
+  if (!this->IsAllowed(object)) return false;
   if (result_->Size() < static_cast<size_t>(K_) ||
       distance < result_->TopDistance()) {
     result_->Push(distance, object);
@@ -76,6 +77,8 @@ bool KNNQuery<dist_t>::CheckAndAddToResult(const dist_t distance,
 
 template <typename dist_t>
 bool KNNQuery<dist_t>::CheckAndAddToResult(const Object* object) {
+  // there is no need to compute the distance to objects that are filtered out
+  if (!this->IsAllowed(object)) return false;
   return this->CheckAndAddToResult(this->DistanceObjLeft(object), object);
 }
 
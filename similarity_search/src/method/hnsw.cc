@@ -29,9 +29,11 @@
 // This is only for _mm_prefetch
 #include <mmintrin.h>
 
+#include "portable_align.h"
 #include "portable_simd.h"
 #include "knnquery.h"
 #include "method/hnsw.h"
+#include "method/nn_descent.h"
 #include "ported_boost_progress.h"
 #include "rangequery.h"
 #include "space.h"
@@ -43,8 +45,16 @@
 #include <set>
 #include <sstream>
 #include <typeinfo>
+#include <type_traits>
 #include <vector>
 
+#if !defined(_MSC_VER)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
 #include "sort_arr_bi.h"
 #define MERGE_BUFFER_ALGO_SWITCH_THRESHOLD 100
 
@@ -60,6 +70,28 @@
 // For debug purposes we also implemented saving an index to a text file
 #define USE_TEXT_REGULAR_INDEX (false)
 
+// The flag that starts a saved index
+// The old regular index (links are written one by one), which can still be loaded
+#define HNSW_REGULAR_INDEX              0
+#define HNSW_OPTIMIZED_INDEX            1
+// Sections of the optimized index are aligned, so that the file can be memory-mapped
+#define HNSW_OPTIMIZED_INDEX_ALIGNED    2
+#define HNSW_SECTION_ALIGNMENT          4096
+// An aligned optimized index with quantized level-0 data, followed by the section of exact data
+#define HNSW_OPTIMIZED_INDEX_QUANTIZED  3
+// The same as HNSW_OPTIMIZED_INDEX_QUANTIZED, but the level-0 block stores PQ codes
+#define HNSW_OPTIMIZED_INDEX_PQ         4
+// A regular index whose links are stored as CSR arrays (one per level), which are read in bulk
+#define HNSW_REGULAR_INDEX_CSR          5
+
+// Set in addition to the flag of an aligned optimized index if its elements were reordered:
+// original positions of elements are stored after all other sections
+#define HNSW_REORDERED_INDEX            0x100
+
+// Distance function types above this value denote functions provided by the space
+// (the type is this value plus FlatDistKind), types 1-3 denote built-in L2 and cosine functions
+#define HNSW_DIST_FUNC_SPACE            100
+
 #define TOTAL_QTY       "TOTAL_QTY"
 #define MAX_LEVEL       "MAX_LEVEL"
 #define ENTER_POINT_ID  "ENTER_POINT_ID"
@@ -83,8 +115,17 @@ namespace similarity {
     template <typename dist_t>
     Hnsw<dist_t>::Hnsw(bool PrintProgress, const Space<dist_t> &space, const ObjectVector &data)
         : Index<dist_t>(data)
+        , M_(16)
+        , maxM_(16)
+        , maxM0_(32)
+        , efConstruction_(200)
+        , ef_(20)
+        , searchMethod_(0)
+        , indexThreadQty_(std::thread::hardware_concurrency())
         , space_(space)
         , PrintProgress_(PrintProgress)
+        , delaunay_type_(2)
+        , mult_(1 / log(16.0))
         , visitedlistpool(nullptr)
         , enterpoint_(nullptr)
         , data_level0_memory_(nullptr)
@@ -150,6 +191,22 @@ namespace similarity {
         out.close();
         return;
     }
+    // normalizes vectors stored in the optimized index for cosine similarity
+    void
+    normalizeVector(float *v, int qty)
+    {
+        float sum = 0;
+        for (int i = 0; i < qty; i++) {
+            sum += v[i] * v[i];
+        }
+        if (sum != 0.0) {
+            sum = 1 / sqrt(sum);
+            for (int i = 0; i < qty; i++) {
+                v[i] *= sum;
+            }
+        }
+    }
+
     template <typename dist_t>
     void
     Hnsw<dist_t>::CreateIndex(const AnyParams &IndexParams)
@@ -176,6 +233,23 @@ namespace similarity {
         pmgr.GetParamOptional("post", post_, 0);
         int skip_optimized_index = 0;
         pmgr.GetParamOptional("skip_optimized_index", skip_optimized_index, 0);
+        int quantize = 0;
+        pmgr.GetParamOptional("quantize", quantize, 0);
+        string reorder;
+        pmgr.GetParamOptional("reorder", reorder, "none");
+        reorderType_ = ParseReorderType(reorder);
+        string level0Builder;
+        pmgr.GetParamOptional("level0Builder", level0Builder, "hnsw");
+        ToLower(level0Builder);
+        if (level0Builder != "hnsw" && level0Builder != "nndescent")
+            throw runtime_error("level0Builder should be one of the following: hnsw, nndescent");
+        size_t nndescentK, nndescentMaxIter;
+        float nndescentSampleRate;
+        double nndescentDelta;
+        pmgr.GetParamOptional("nndescentK", nndescentK, maxM0_);
+        pmgr.GetParamOptional("nndescentSampleRate", nndescentSampleRate, 0.5);
+        pmgr.GetParamOptional("nndescentDelta", nndescentDelta, 0.001);
+        pmgr.GetParamOptional("nndescentMaxIter", nndescentMaxIter, 10);
 
         LOG(LIB_INFO) << "M                   = " << M_;
         LOG(LIB_INFO) << "indexThreadQty      = " << indexThreadQty_;
@@ -185,6 +259,15 @@ namespace similarity {
 
         LOG(LIB_INFO) << "mult                = " << mult_;
         LOG(LIB_INFO) << "skip_optimized_index= " << skip_optimized_index;
+        LOG(LIB_INFO) << "quantize            = " << quantize;
+        LOG(LIB_INFO) << "reorder             = " << reorder;
+        LOG(LIB_INFO) << "level0Builder       = " << level0Builder;
+        if (level0Builder == "nndescent") {
+            LOG(LIB_INFO) << "nndescentK          = " << nndescentK;
+            LOG(LIB_INFO) << "nndescentSampleRate = " << nndescentSampleRate;
+            LOG(LIB_INFO) << "nndescentDelta      = " << nndescentDelta;
+            LOG(LIB_INFO) << "nndescentMaxIter    = " << nndescentMaxIter;
+        }
         LOG(LIB_INFO) << "delaunay_type       = " << delaunay_type_;
 
         SetQueryTimeParams(getEmptyParams());
@@ -201,13 +284,19 @@ namespace similarity {
         enterpoint_ = first;
         ElList_[0] = first;
 
-        visitedlistpool = new VisitedListPool(indexThreadQty_, this->data_.size());
+        // At most one free list per indexing or search thread is kept
+        visitedlistpool = new VisitedListPool(this->data_.size(),
+                                              max<size_t>(indexThreadQty_, std::thread::hardware_concurrency()));
 
         unique_ptr<ProgressDisplay> progress_bar(PrintProgress_ ? new ProgressDisplay(this->data_.size(), cerr) : NULL);
 
+        // With NN-descent, only elements of upper levels are inserted, which is cheap,
+        // because only one in M elements gets there. Their level-0 links connect clusters
+        // of the k-NN graph.
+        int minLevel = level0Builder == "nndescent" ? 1 : 0;
         ParallelFor(1, this->data_.size(), indexThreadQty_, [&](int id, int threadId) {
             HnswNode *node = new HnswNode(this->data_[id], id);
-            add(&space_, node);
+            add(&space_, node, minLevel);
             {
                 unique_lock<mutex> lock(ElListGuard_);
                 ElList_[id] = node;
@@ -218,6 +307,9 @@ namespace similarity {
         if (progress_bar)
           progress_bar->finish();
 
+        if (level0Builder == "nndescent")
+            BuildLevel0ByNNDescent(nndescentK, nndescentSampleRate, nndescentDelta, nndescentMaxIter);
+
         if (post_ == 1 || post_ == 2) {
             vector<HnswNode *> temp;
             temp.swap(ElList_);
@@ -313,8 +405,11 @@ namespace similarity {
         linkLists_ = NULL;
 
         enterpointId_ = enterpoint_->getId();
+        origIds_.clear();
 
         if (skip_optimized_index) {
+            if (reorderType_ != kReorderNone)
+                LOG(LIB_WARNING) << "Elements are reordered only in the optimized index, the parameter reorder is ignored";
             LOG(LIB_INFO) << "searchMethod			  = " << searchMethod_;
             pmgr.CheckUnused();
             return;
@@ -330,8 +425,9 @@ namespace similarity {
         }
 
         // Selecting custom made functions
-        if (space_.StrDesc().compare("SpaceLp: p = 2 do we have a special implementation for this p? : 1") == 0 &&
-            sizeof(dist_t) == 4) {
+        const FlatDistFunc<dist_t> flatDist = space_.GetFlatDistFunc();
+        flatdistfunc_ = nullptr;
+        if (flatDist.kind == kFlatDistL2 && std::is_same<dist_t, float>::value) {
             LOG(LIB_INFO) << "\nThe space is Euclidean";
             vectorlength_ = ((dataSectionSize - 16) >> 2);
             LOG(LIB_INFO) << "Vector length=" << vectorlength_;
@@ -346,7 +442,7 @@ namespace similarity {
                 dist_func_type_ = 2;
                 searchMethod_ = 3;
             }
-        } else if (space_.StrDesc().compare("CosineSimilarity") == 0 && sizeof(dist_t) == 4) {
+        } else if (flatDist.kind == kFlatDistCosine && std::is_same<dist_t, float>::value) {
             LOG(LIB_INFO) << "\nThe vectorspace is Cosine Similarity";
             vectorlength_ = ((dataSectionSize - 16) >> 2);
             LOG(LIB_INFO) << "Vector length=" << vectorlength_;
@@ -363,6 +459,12 @@ namespace similarity {
                 dist_func_type_ = 3;
                 searchMethod_ = 3;
             }
+        } else if (flatDist.func != nullptr) {
+            LOG(LIB_INFO) << "\nUsing the distance function of the space " << space_.StrDesc();
+            vectorlength_ = ((dataSectionSize - 16) >> 2);
+            flatdistfunc_ = flatDist.func;
+            dist_func_type_ = HNSW_DIST_FUNC_SPACE + flatDist.kind;
+            searchMethod_ = 3;
         } else {
             LOG(LIB_INFO) << "No appropriate custom distance function for " << space_.StrDesc();
             // if (searchMethod_ != 0 && searchMethod_ != 1)
@@ -371,45 +473,66 @@ namespace similarity {
             pmgr.CheckUnused();
             return; // No optimized index
         }
+        quantized_ = false;
+        pq_.reset(fstdistfunc_ != nullptr && !iscosine_ ? space_.CreateProductQuantizer() : nullptr);
+        if (pq_) {
+            // The space defines the compression, so the index is always quantized
+            quantized_ = true;
+            searchMethod_ = 5;
+        } else if (quantize) {
+            if (fstdistfunc_ != nullptr) {
+                // Quantized vectors are compared using the Euclidean distance: for cosine,
+                // the vectors are normalized, so the order of distances is the same
+                quantized_ = true;
+                searchMethod_ = 5;
+            } else {
+                LOG(LIB_WARNING) << "Quantization is supported only for the spaces l2 and cosinesimil,"
+                                 << " the optimized index isn't quantized";
+            }
+        }
         pmgr.CheckUnused();
         LOG(LIB_INFO) << "searchMethod			  = " << searchMethod_;
-        memoryPerObject_ = dataSectionSize + friendsSectionSize;
 
-        size_t total_memory_allocated = (memoryPerObject_ * ElList_.size());
+        if (reorderType_ != kReorderNone)
+            ReorderElements();
+
+        size_t total_memory_allocated = 0;
+        if (quantized_) {
+            // Codes are followed by links, which need to be aligned
+            size_t codeSize = pq_ ? pq_->GetCodeSize() : vectorlength_;
+            size_t codeSectionSize = (codeSize + sizeof(int) - 1) / sizeof(int) * sizeof(int);
+            memoryPerObject_ = codeSectionSize + friendsSectionSize;
+            offsetLevel0_ = codeSectionSize;
+            exactObjectSize_ = dataSectionSize;
+            data_exact_memory_ = (char *)calloc(ElList_.size(), exactObjectSize_);
+            CHECK(data_exact_memory_);
+            total_memory_allocated += exactObjectSize_ * ElList_.size();
+        } else {
+            memoryPerObject_ = dataSectionSize + friendsSectionSize;
+            offsetLevel0_ = dataSectionSize;
+        }
+        offsetData_ = 0;
+
+        total_memory_allocated += memoryPerObject_ * ElList_.size();
         data_level0_memory_ = (char *)malloc(memoryPerObject_ * ElList_.size());
         CHECK(data_level0_memory_);
 
-        offsetLevel0_ = dataSectionSize;
-        offsetData_ = 0;
-
         memset(data_level0_memory_, 1, memoryPerObject_ * ElList_.size());
         LOG(LIB_INFO) << "Making optimized index";
         data_rearranged_.resize(ElList_.size());
+        elementLevels_.resize(ElList_.size());
+        optimizedCapacity_ = ElList_.size();
         for (long i = 0; i < ElList_.size(); i++) {
-            ElList_[i]->copyDataAndLevel0LinksToOptIndex(
-                data_level0_memory_ + (size_t)i * memoryPerObject_, offsetLevel0_, offsetData_);
-            data_rearranged_[i] = new Object(data_level0_memory_ + (i)*memoryPerObject_ + offsetData_);
+            CopyToOptimizedIndex(i);
         };
-        ////////////////////////////////////////////////////////////////////////
-        //
-        // The next step is needed only fos cosine similarity space
-        // All vectors are normalized, so we don't have to normalize them later
-        //
-        ////////////////////////////////////////////////////////////////////////
-        if (iscosine_) {
-            for (long i = 0; i < ElList_.size(); i++) {
-                float *v = (float *)(data_level0_memory_ + (size_t)i * memoryPerObject_ + offsetData_ + 16);
-                float sum = 0;
-                for (int i = 0; i < vectorlength_; i++) {
-                    sum += v[i] * v[i];
-                }
-                if (sum != 0.0) {
-                    sum = 1 / sqrt(sum);
-                    for (int i = 0; i < vectorlength_; i++) {
-                        v[i] *= sum;
-                    }
-                }
-            };
+        if (quantized_) {
+            TrainQuantizer();
+            ParallelFor(0, ElList_.size(), indexThreadQty_, [&](size_t i, size_t threadId) {
+                EncodeVector(reinterpret_cast<const float *>(optimizedData(i) + 16),
+                             reinterpret_cast<uint8_t *>(data_level0_memory_ + i * memoryPerObject_ + offsetData_));
+            });
+            LOG(LIB_INFO) << "Level-0 block size: " << ((memoryPerObject_ * ElList_.size()) >> 20) << " Mb"
+                          << ", exact data size: " << ((exactObjectSize_ * ElList_.size()) >> 20) << " Mb";
         }
 
         /////////////////////////////////////////////////////////
@@ -448,6 +571,8 @@ namespace similarity {
         // ef and efSearch are going to be parameter-synonyms with the default value 20
         pmgr.GetParamOptional("ef", ef_, 20);
         pmgr.GetParamOptional("efSearch", ef_, ef_);
+        pmgr.GetParamOptional("prefetchDepth", prefetchDepth_, 1);
+        pmgr.GetParamOptional("prefetchLines", prefetchLines_, 1);
 
         int tmp;
         pmgr.GetParamOptional(
@@ -455,21 +580,733 @@ namespace similarity {
 
         string tmps;
         pmgr.GetParamOptional("algoType", tmps, "hybrid");
-        ToLower(tmps);
-        if (tmps == "v1merge")
-            searchAlgoType_ = kV1Merge;
-        else if (tmps == "old")
-            searchAlgoType_ = kOld;
-        else if (tmps == "hybrid")
-            searchAlgoType_ = kHybrid;
-        else {
-            throw runtime_error("algoType should be one of the following: old, v1merge");
-        }
+        searchAlgoType_ = ParseAlgoType(tmps);
+
+        pmgr.GetParamOptional("visitedSet", tmps, "auto");
+        visitedSetType_ = ParseVisitedSetType(tmps);
 
         pmgr.CheckUnused();
         LOG(LIB_INFO) << "Set HNSW query-time parameters:";
         LOG(LIB_INFO) << "ef(Search)         =" << ef_;
+        LOG(LIB_INFO) << "prefetchDepth      =" << prefetchDepth_;
+        LOG(LIB_INFO) << "prefetchLines      =" << prefetchLines_;
         LOG(LIB_INFO) << "algoType           =" << searchAlgoType_;
+        LOG(LIB_INFO) << "visitedSet         =" << visitedSetType_;
+    }
+
+    template <typename dist_t>
+    typename Hnsw<dist_t>::AlgoType
+    Hnsw<dist_t>::ParseAlgoType(string algoType)
+    {
+        ToLower(algoType);
+        if (algoType == "v1merge")
+            return kV1Merge;
+        else if (algoType == "old")
+            return kOld;
+        else if (algoType == "hybrid")
+            return kHybrid;
+        throw runtime_error("algoType should be one of the following: old, v1merge, hybrid");
+    }
+
+    template <typename dist_t>
+    typename Hnsw<dist_t>::ReorderType
+    Hnsw<dist_t>::ParseReorderType(string reorderType)
+    {
+        ToLower(reorderType);
+        if (reorderType == "none")
+            return kReorderNone;
+        else if (reorderType == "bfs")
+            return kReorderBFS;
+        else if (reorderType == "rcm")
+            return kReorderRCM;
+        else if (reorderType == "degree")
+            return kReorderDegree;
+        throw runtime_error("reorder should be one of the following: none, bfs, rcm, degree");
+    }
+
+    template <typename dist_t>
+    typename Hnsw<dist_t>::VisitedSetType
+    Hnsw<dist_t>::ParseVisitedSetType(string visitedSetType)
+    {
+        ToLower(visitedSetType);
+        if (visitedSetType == "auto")
+            return kVisitedSetAuto;
+        else if (visitedSetType == "array")
+            return kVisitedSetArray;
+        else if (visitedSetType == "hash")
+            return kVisitedSetHash;
+        throw runtime_error("visitedSet should be one of the following: auto, array, hash");
+    }
+
+    template <typename dist_t>
+    VisitedList *
+    Hnsw<dist_t>::GetVisitedList(size_t ef) const
+    {
+        // A search visits roughly ef nodes and computes distances to their neighbors
+        size_t expectedQty = max<size_t>(ef, 1) * maxM0_;
+        bool useHash = visitedSetType_ == kVisitedSetHash ||
+                       (visitedSetType_ == kVisitedSetAuto &&
+                        useVisitedHash(visitedlistpool->getNumElements(), expectedQty));
+        return visitedlistpool->getFreeVisitedList(useHash ? 2 * expectedQty : 0);
+    }
+
+    /*
+     * Orders of elements that place neighbors in the level-0 graph close to each other
+     * in memory. Each function returns old positions of elements in the new order.
+     * Elements that are unreachable from the starting element are appended by
+     * starting a new traversal from each of them.
+     */
+    static vector<IdType> getBFSOrder(const vector<vector<IdType>> &links, IdType start)
+    {
+        size_t qty = links.size();
+        vector<IdType> order;
+        order.reserve(qty);
+        vector<char> visited(qty);
+        auto traverse = [&](IdType root) {
+            visited[root] = 1;
+            order.push_back(root);
+            for (size_t head = order.size() - 1; head < order.size(); head++) {
+                for (IdType next : links[order[head]]) {
+                    if (!visited[next]) {
+                        visited[next] = 1;
+                        order.push_back(next);
+                    }
+                }
+            }
+        };
+        traverse(start);
+        for (size_t i = 0; i < qty; i++) {
+            if (!visited[i])
+                traverse(i);
+        }
+        return order;
+    }
+
+    /*
+     * The reverse Cuthill-McKee ordering of the (symmetrized) graph: each traversal starts
+     * from an element of the minimum degree and visits neighbors in the order of increasing degrees.
+     */
+    static vector<IdType> getRCMOrder(const vector<vector<IdType>> &links)
+    {
+        size_t qty = links.size();
+        vector<vector<IdType>> undirected(qty);
+        for (size_t i = 0; i < qty; i++) {
+            for (IdType next : links[i]) {
+                undirected[i].push_back(next);
+                undirected[next].push_back(i);
+            }
+        }
+        for (vector<IdType> &neighbors : undirected) {
+            sort(neighbors.begin(), neighbors.end());
+            neighbors.resize(unique(neighbors.begin(), neighbors.end()) - neighbors.begin());
+        }
+        auto byDegree = [&](IdType a, IdType b) { return undirected[a].size() < undirected[b].size(); };
+
+        vector<IdType> roots(qty);
+        for (size_t i = 0; i < qty; i++)
+            roots[i] = i;
+        stable_sort(roots.begin(), roots.end(), byDegree);
+
+        vector<IdType> order;
+        order.reserve(qty);
+        vector<char> visited(qty);
+        for (IdType root : roots) {
+            if (visited[root])
+                continue;
+            visited[root] = 1;
+            order.push_back(root);
+            for (size_t head = order.size() - 1; head < order.size(); head++) {
+                size_t first = order.size();
+                for (IdType next : undirected[order[head]]) {
+                    if (!visited[next]) {
+                        visited[next] = 1;
+                        order.push_back(next);
+                    }
+                }
+                stable_sort(order.begin() + first, order.end(), byDegree);
+            }
+        }
+        reverse(order.begin(), order.end());
+        return order;
+    }
+
+    /*
+     * Elements sorted by the number of incoming links (in the decreasing order): the hubs,
+     * which are visited by most searches, are packed together at the beginning of the block.
+     */
+    static vector<IdType> getDegreeOrder(const vector<vector<IdType>> &links)
+    {
+        size_t qty = links.size();
+        vector<size_t> inDegree(qty);
+        for (const vector<IdType> &neighbors : links) {
+            for (IdType next : neighbors)
+                inDegree[next]++;
+        }
+        vector<IdType> order(qty);
+        for (size_t i = 0; i < qty; i++)
+            order[i] = i;
+        stable_sort(order.begin(), order.end(),
+                    [&](IdType a, IdType b) { return inDegree[a] > inDegree[b]; });
+        return order;
+    }
+
+    /*
+     * The average logarithm of differences between positions of linked elements
+     * (a rough measure of locality, which is smaller for better orders)
+     */
+    static double getAverageLinkLogGap(const vector<vector<IdType>> &links, const vector<IdType> &newPos)
+    {
+        double sum = 0;
+        size_t qty = 0;
+        for (size_t i = 0; i < links.size(); i++) {
+            for (IdType next : links[i]) {
+                sum += log2(1 + std::abs(double(newPos[i]) - double(newPos[next])));
+                qty++;
+            }
+        }
+        return qty ? sum / qty : 0;
+    }
+
+    /*
+     * Renumbers elements (before the optimized index is created), so that elements
+     * linked in the level-0 graph are stored close to each other. This reduces cache and
+     * TLB misses during the search. Original positions are kept in origIds_.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::ReorderElements()
+    {
+        size_t qty = ElList_.size();
+        vector<vector<IdType>> links(qty);
+        for (size_t i = 0; i < qty; i++) {
+            for (const HnswNode *neighbor : ElList_[i]->getAllFriends(0))
+                links[i].push_back(neighbor->getId());
+        }
+
+        vector<IdType> order;
+        switch (reorderType_) {
+        case kReorderBFS:
+            order = getBFSOrder(links, enterpoint_->getId());
+            break;
+        case kReorderRCM:
+            order = getRCMOrder(links);
+            break;
+        case kReorderDegree:
+            order = getDegreeOrder(links);
+            break;
+        default:
+            return;
+        }
+        CHECK(order.size() == qty);
+
+        vector<IdType> newPos(qty);
+        for (size_t i = 0; i < qty; i++)
+            newPos[i] = i;
+        LOG(LIB_INFO) << "Average log-gap of level-0 links before reordering: " << getAverageLinkLogGap(links, newPos);
+        for (size_t i = 0; i < qty; i++)
+            newPos[order[i]] = i;
+        LOG(LIB_INFO) << "Average log-gap of level-0 links after reordering: " << getAverageLinkLogGap(links, newPos);
+
+        // Links are pointers to nodes, so only the list and IDs of nodes need to be changed
+        ElementList reordered(qty);
+        for (size_t i = 0; i < qty; i++) {
+            reordered[i] = ElList_[order[i]];
+            reordered[i]->id_ = i;
+        }
+        ElList_.swap(reordered);
+        enterpointId_ = enterpoint_->getId();
+        // Before reordering, the position of each element is the position of its data point
+        origIds_.swap(order);
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::AddBatch(const ObjectVector &batchData, bool bPrintProgress, bool bCheckIDs)
+    {
+        if (batchData.empty())
+            return;
+        CHECK_MSG(mappedMemory_ == nullptr, "Can't add data to a memory-mapped index, it is read-only");
+        if (ElList_.empty() && data_level0_memory_ != nullptr) {
+            // The index was loaded from the optimized format: only the graph
+            // can be extended, so we need to recreate it first
+            RestoreNodesFromOptimizedIndex();
+        }
+        if (data_level0_memory_ != nullptr) {
+            // Check this before modifying the graph
+            size_t dataSectionSize = quantized_ ? exactObjectSize_ : offsetLevel0_;
+            for (const Object *obj : batchData) {
+                CHECK_MSG(obj->bufferlength() <= dataSectionSize,
+                          "The size of an added object (" + ConvertToString(obj->bufferlength()) +
+                          ") is larger than the size of the data section of the optimized index (" +
+                          ConvertToString(dataSectionSize) + ")");
+            }
+        }
+        if (!idToPos_.empty()) {
+            // IDs are mapped (because elements were deleted), so new IDs must be unique too
+            unordered_set<IdType> batchIds;
+            for (const Object *obj : batchData) {
+                CHECK_MSG(idToPos_.count(obj->id()) == 0 && batchIds.insert(obj->id()).second,
+                          "The ID " + ConvertToString(obj->id()) + " of an added object is already used");
+            }
+        }
+
+        size_t oldQty = ElList_.size();
+        size_t newQty = oldQty + batchData.size();
+        LOG(LIB_INFO) << "Adding " << batchData.size() << " elements to the index of " << oldQty << " elements";
+
+        ElList_.resize(newQty);
+        delete visitedlistpool;
+        visitedlistpool = new VisitedListPool(newQty, max<size_t>(indexThreadQty_, std::thread::hardware_concurrency()));
+
+        size_t start = 0;
+        if (enterpoint_ == nullptr) {
+            // One entry should be added before all the threads are started, or else add() will not work properly
+            HnswNode *first = new HnswNode(batchData[0], oldQty);
+            first->init(getRandomLevel(mult_), maxM_, maxM0_);
+            maxlevel_ = first->level;
+            enterpoint_ = first;
+            ElList_[oldQty] = first;
+            start = 1;
+        }
+
+        unique_ptr<ProgressDisplay> progress_bar(bPrintProgress ? new ProgressDisplay(batchData.size(), cerr) : NULL);
+
+        ParallelFor(start, batchData.size(), indexThreadQty_, [&](size_t i, size_t threadId) {
+            HnswNode *node = new HnswNode(batchData[i], oldQty + i);
+            add(&space_, node);
+            {
+                unique_lock<mutex> lock(ElListGuard_);
+                ElList_[oldQty + i] = node;
+                if (progress_bar)
+                  ++(*progress_bar);
+            }
+        });
+        if (progress_bar)
+          progress_bar->finish();
+
+        enterpointId_ = enterpoint_->getId();
+        if (data_level0_memory_ != nullptr)
+            AddToOptimizedIndex(oldQty);
+        if (!deleted_.empty())
+            deleted_.resize(newQty);
+        if (!idToPos_.empty())
+            MapObjectIds(oldQty);
+        // New elements are appended, as well as their data points
+        for (size_t i = oldQty; i < newQty && !origIds_.empty(); i++)
+            origIds_.push_back(i);
+
+        if (bCheckIDs)
+            checkList1(ElList_);
+        LOG(LIB_INFO) << "The number of data points: " << ElList_.size();
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::RestoreNodesFromOptimizedIndex()
+    {
+        size_t qty = data_rearranged_.size();
+        CHECK_MSG(!dataReleased_, "The data points were released, so the graph can't be restored"
+                                  " (to add data to the index or to repair deleted elements)");
+        CHECK_MSG(this->data_.size() >= qty,
+                  "Data points should be loaded along with the optimized index to add new data to it");
+        LOG(LIB_INFO) << "Restoring the graph from the optimized index";
+
+        ElList_.resize(qty);
+        for (size_t i = 0; i < qty; i++) {
+            size_t dataPos = origIds_.empty() ? i : origIds_[i];
+            CHECK_MSG(dataPos < this->data_.size() && this->data_[dataPos]->id() == data_rearranged_[i]->id(),
+                      "The loaded data doesn't match the data of the optimized index at position " + ConvertToString(i));
+            ElList_[i] = new HnswNode(this->data_[dataPos], i);
+            ElList_[i]->init(elementLevels_[i], maxM_, maxM0_);
+        }
+        for (size_t i = 0; i < qty; i++) {
+            HnswNode *node = ElList_[i];
+            for (int level = 0; level <= node->level; level++) {
+                int *data = level ? (int *)(linkLists_[i] + (maxM_ + 1) * (level - 1) * sizeof(int))
+                                  : (int *)(data_level0_memory_ + i * memoryPerObject_ + offsetLevel0_);
+                int size = *data;
+                for (int j = 1; j <= size; j++) {
+                    node->allFriends_[level].push_back(ElList_[*(data + j)]);
+                }
+            }
+        }
+        enterpoint_ = ElList_[enterpointId_];
+    }
+
+    template <typename dist_t>
+    bool
+    Hnsw<dist_t>::ReleaseData()
+    {
+        if (data_level0_memory_ == nullptr)
+            return false;
+        LOG(LIB_INFO) << "Releasing the graph of " << ElList_.size() << " elements, only the optimized index is kept";
+        for (HnswNode *node : ElList_)
+            delete node;
+        ElementList().swap(ElList_);
+        enterpoint_ = nullptr;
+
+        optimizedPos_.clear();
+        if (!origIds_.empty()) {
+            optimizedPos_.resize(origIds_.size());
+            for (size_t i = 0; i < origIds_.size(); i++)
+                optimizedPos_[origIds_[i]] = i;
+        }
+        dataReleased_ = true;
+        return true;
+    }
+
+    template <typename dist_t>
+    const Object *
+    Hnsw<dist_t>::GetStoredObject(size_t pos) const
+    {
+        CHECK_MSG(dataReleased_, "Stored objects are available only after the data points are released");
+        return data_rearranged_.at(optimizedPos_.empty() ? pos : optimizedPos_.at(pos));
+    }
+
+    template <typename dist_t>
+    size_t
+    Hnsw<dist_t>::GetVisitedListMemory() const
+    {
+        return visitedlistpool == nullptr ? 0 : visitedlistpool->getMemoryUsage();
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::AddToOptimizedIndex(size_t oldQty)
+    {
+        size_t newQty = ElList_.size();
+        if (newQty > optimizedCapacity_) {
+            // Grow geometrically, so that the cost of copying is amortized over many additions
+            size_t newCapacity = max(newQty, 2 * optimizedCapacity_);
+            char *newMemory = (char *)realloc(data_level0_memory_, memoryPerObject_ * newCapacity);
+            CHECK(newMemory);
+            char **newLinkLists = (char **)realloc(linkLists_, sizeof(void *) * newCapacity);
+            CHECK(newLinkLists);
+            linkLists_ = newLinkLists;
+            char *oldData = optimizedData(0);
+            data_level0_memory_ = newMemory;
+            if (quantized_) {
+                char *newExactMemory = (char *)realloc(data_exact_memory_, exactObjectSize_ * newCapacity);
+                CHECK(newExactMemory);
+                data_exact_memory_ = newExactMemory;
+            }
+            if (optimizedData(0) != oldData) {
+                // These objects point to the old memory
+                for (size_t i = 0; i < oldQty; i++) {
+                    delete data_rearranged_[i];
+                    data_rearranged_[i] = new Object(optimizedData(i));
+                }
+            }
+            optimizedCapacity_ = newCapacity;
+            LOG(LIB_INFO) << "The capacity of the optimized index is increased to " << optimizedCapacity_;
+        }
+
+        // Adding new elements could have changed links of the old ones
+        for (size_t i = 0; i < oldQty; i++) {
+            if (ElList_[i]->linksChanged_)
+                UpdateOptimizedIndexLinks(i);
+        }
+
+        data_rearranged_.resize(newQty);
+        elementLevels_.resize(newQty);
+        for (size_t i = oldQty; i < newQty; i++) {
+            HnswNode *node = ElList_[i];
+            CopyToOptimizedIndex(i);
+            if (quantized_) {
+                // New vectors are encoded using the original quantizer
+                EncodeVector(reinterpret_cast<const float *>(optimizedData(i) + 16),
+                             reinterpret_cast<uint8_t *>(data_level0_memory_ + i * memoryPerObject_ + offsetData_));
+            }
+
+            linkLists_[i] = nullptr;
+            if (node->level > 0) {
+                SIZEMASS_TYPE sizemass = ((node->level) * (maxM_ + 1)) * sizeof(int);
+                linkLists_[i] = (char *)malloc(sizemass);
+                CHECK(linkLists_[i]);
+                node->copyHigherLevelLinksToOptIndex(linkLists_[i], 0);
+            }
+        }
+    }
+
+    /*
+     * Copies the data and level-0 links of an element to the optimized index.
+     * In the cosine space, the copy of the data is normalized.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::CopyToOptimizedIndex(size_t id)
+    {
+        HnswNode *node = ElList_[id];
+        char *mem = data_level0_memory_ + id * memoryPerObject_;
+        const Object *obj = node->getData();
+        if (quantized_) {
+            // The code is computed when the quantizer is trained
+            node->copyLevel0LinksToOptIndex(mem + offsetLevel0_);
+            memcpy(optimizedData(id), obj->buffer(), obj->bufferlength());
+        } else {
+            node->copyDataAndLevel0LinksToOptIndex(mem, offsetLevel0_, offsetData_);
+        }
+        if (iscosine_) {
+            normalizeVector(reinterpret_cast<float *>(optimizedData(id) + 16), obj->datalength() / sizeof(float));
+        }
+        data_rearranged_[id] = new Object(optimizedData(id));
+        elementLevels_[id] = node->level;
+        node->linksChanged_ = false;
+    }
+
+    /*
+     * All dimensions share the same quantization step, so the squared Euclidean
+     * distance between codes is proportional to the distance between (approximate) vectors.
+     * Hence, the distance can be computed by an integer SIMD kernel.
+     * A product quantizer is trained by the quantizer itself.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::TrainQuantizer()
+    {
+        size_t qty = data_rearranged_.size();
+        if (pq_) {
+            vector<const float *> vects(qty);
+            for (size_t i = 0; i < qty; i++) {
+                vects[i] = reinterpret_cast<const float *>(optimizedData(i) + 16);
+            }
+            pq_->Train(vects, vectorlength_);
+            return;
+        }
+        vector<float> maxVal(vectorlength_, -numeric_limits<float>::max());
+        sqOffset_.assign(vectorlength_, numeric_limits<float>::max());
+        for (size_t i = 0; i < qty; i++) {
+            const float *pVect = reinterpret_cast<const float *>(optimizedData(i) + 16);
+            for (int k = 0; k < vectorlength_; k++) {
+                sqOffset_[k] = min(sqOffset_[k], pVect[k]);
+                maxVal[k] = max(maxVal[k], pVect[k]);
+            }
+        }
+        float maxRange = 0;
+        for (int k = 0; k < vectorlength_; k++) {
+            maxRange = max(maxRange, maxVal[k] - sqOffset_[k]);
+        }
+        sqStep_ = maxRange > 0 ? maxRange / 255 : 1;
+        LOG(LIB_INFO) << "Quantization step: " << sqStep_;
+    }
+
+    // Values outside of the range of the training data are clipped
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::EncodeVector(const float *pVect, uint8_t *code) const
+    {
+        if (pq_) {
+            pq_->Encode(pVect, code);
+            return;
+        }
+        const float scale = 1 / sqStep_;
+        for (int k = 0; k < vectorlength_; k++) {
+            float val = round((pVect[k] - sqOffset_[k]) * scale);
+            code[k] = static_cast<uint8_t>(max(0.0f, min(255.0f, val)));
+        }
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::EncodeQuery(const float *pVect, size_t qty, uint8_t *code) const
+    {
+        vector<float> vect(vectorlength_);
+        memcpy(&vect[0], pVect, min<size_t>(qty, vectorlength_) * sizeof(float));
+        if (iscosine_)
+            normalizeVector(&vect[0], vectorlength_);
+        EncodeVector(&vect[0], code);
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::DeleteBatch(const ObjectVector &batchData, int delStrategy, bool checkIDs)
+    {
+        vector<IdType> batchIds;
+        for (auto o : batchData) batchIds.push_back(o->id());
+        DeleteBatch(batchIds, delStrategy, checkIDs);
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::DeleteBatch(const vector<IdType> &batchData, int delStrategy, bool checkIDs)
+    {
+        CHECK_MSG(delStrategy == kDelTombstone || delStrategy == kDelRepair,
+                  "Unsupported deletion strategy code: " + ConvertToString(delStrategy));
+        // Repairing modifies the graph, while elements can be deleted without it
+        CHECK_MSG(delStrategy == kDelTombstone || mappedMemory_ == nullptr,
+                  "Can't repair a memory-mapped index, it is read-only");
+        size_t qty = GetSize();
+        if (!batchData.empty()) {
+            if (idToPos_.empty())
+                MapObjectIds(0);
+            deleted_.resize(qty);
+            // Check all IDs first, so that a failed call doesn't delete anything
+            for (IdType objId : batchData) {
+                auto it = idToPos_.find(objId);
+                CHECK_MSG(it != idToPos_.end() && !deleted_[it->second],
+                          "An attempt to delete a non-existing object with id=" + ConvertToString(objId));
+            }
+            for (IdType objId : batchData) {
+                IdType pos = idToPos_.at(objId);
+                if (deleted_[pos])
+                    continue; // a duplicate ID in the batch
+                deleted_[pos] = 1;
+                toRepair_.push_back(pos);
+                ++deletedQty_;
+            }
+            LOG(LIB_INFO) << "The number of deleted elements: " << deletedQty_;
+        }
+        if (delStrategy == kDelRepair)
+            RepairDeleted(checkIDs);
+    }
+
+    /*
+     * Maps IDs of objects starting from the given position. A hash map is used, because
+     * object IDs are arbitrary: an array indexed by IDs could be much larger than the index.
+     * IDs must be unique, otherwise it would be unclear which element to delete.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::MapObjectIds(size_t start)
+    {
+        size_t qty = GetSize();
+        idToPos_.reserve(qty);
+        for (size_t i = start; i < qty; i++) {
+            IdType objId = data_rearranged_.empty() ? ElList_[i]->getData()->id() : data_rearranged_[i]->id();
+            if (!idToPos_.emplace(objId, i).second) {
+                if (start == 0)
+                    idToPos_.clear();
+                throw runtime_error("Objects can be deleted only if their IDs are unique, but the ID " +
+                                    ConvertToString(objId) + " is used more than once");
+            }
+        }
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::RepairDeleted(bool checkIDs)
+    {
+        if (toRepair_.empty())
+            return;
+        if (ElList_.empty() && data_level0_memory_ != nullptr)
+            RestoreNodesFromOptimizedIndex();
+
+        /*
+         * Links of (non-deleted) nodes that link to deleted elements need patching.
+         * Links are directed and pruning makes them asymmetric: a node can link to a deleted
+         * element that doesn't link back. Hence, all nodes are scanned rather than
+         * only the neighbors of deleted elements. An index of incoming links would avoid
+         * the scan, but every insertion and pruning would have to update it and it would
+         * take as much memory as the links themselves. The scan only checks flags, while
+         * the costly relinking below is done only for nodes that need it.
+         */
+        size_t qty = ElList_.size();
+        vector<char> needPatch(qty);
+        ParallelFor(0, qty, indexThreadQty_, [&](size_t pos, size_t threadId) {
+            HnswNode *node = ElList_[pos];
+            if (isDeleted(node->getId()))
+                return;
+            for (int level = 0; level <= node->level && !needPatch[pos]; level++) {
+                for (HnswNode *fr : node->getAllFriends(level)) {
+                    if (isDeleted(fr->getId())) {
+                        needPatch[pos] = 1;
+                        break;
+                    }
+                }
+            }
+        });
+        vector<HnswNode *> toPatch;
+        for (size_t pos = 0; pos < qty; pos++) {
+            if (needPatch[pos])
+                toPatch.push_back(ElList_[pos]);
+        }
+        LOG(LIB_INFO) << "The number of nodes that need patching: " << toPatch.size();
+
+        // Deleted elements are only read here, and each node modifies only its own links
+        ParallelFor(0, toPatch.size(), indexThreadQty_, [&](size_t i, size_t threadId) {
+            HnswNode *node = toPatch[i];
+            for (int level = 0; level <= node->level; level++) {
+                const vector<HnswNode *> &friends = node->getAllFriends(level);
+                // Deleted friends are replaced by their own (non-deleted) friends
+                vector<HnswNode *> candidates;
+                bool patch = false;
+                for (HnswNode *fr : friends) {
+                    if (!isDeleted(fr->getId())) {
+                        candidates.push_back(fr);
+                        continue;
+                    }
+                    patch = true;
+                    for (HnswNode *fr2 : fr->getAllFriends(level)) {
+                        if (fr2 != node && !isDeleted(fr2->getId()))
+                            candidates.push_back(fr2);
+                    }
+                }
+                if (!patch)
+                    continue;
+                sort(candidates.begin(), candidates.end());
+                candidates.resize(unique(candidates.begin(), candidates.end()) - candidates.begin());
+
+                priority_queue<HnswNodeDistCloser<dist_t>> resultSet;
+                for (HnswNode *cand : candidates) {
+                    resultSet.emplace(space_.IndexTimeDistance(node->getData(), cand->getData()), cand);
+                }
+                size_t maxQty = level ? maxM_ : maxM0_;
+                if (delaunay_type_ > 0) {
+                    node->getNeighborsByHeuristic1(resultSet, maxQty, &space_);
+                } else {
+                    while (resultSet.size() > maxQty)
+                        resultSet.pop();
+                }
+                vector<HnswNode *> rez;
+                while (!resultSet.empty()) {
+                    rez.push_back(resultSet.top().getMSWNodeHier());
+                    resultSet.pop();
+                }
+                {
+                    unique_lock<mutex> lock(node->accessGuard_);
+                    node->allFriends_[level].swap(rez);
+                    node->linksChanged_ = true;
+                }
+            }
+        });
+
+        if (checkIDs) {
+            for (HnswNode *node : ElList_) {
+                if (isDeleted(node->getId()))
+                    continue;
+                for (int level = 0; level <= node->level; level++) {
+                    for (HnswNode *fr : node->getAllFriends(level)) {
+                        CHECK_MSG(!isDeleted(fr->getId()), "Bug: a deleted node is still found among neighbors!");
+                    }
+                }
+            }
+        }
+        if (data_level0_memory_ != nullptr) {
+            for (HnswNode *node : toPatch) {
+                if (node->linksChanged_)
+                    UpdateOptimizedIndexLinks(node->getId());
+            }
+        }
+        toRepair_.clear();
+    }
+
+    // Copies (modified) links of the element to the optimized index
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::UpdateOptimizedIndexLinks(size_t id)
+    {
+        HnswNode *node = ElList_[id];
+        node->copyLevel0LinksToOptIndex(data_level0_memory_ + id * memoryPerObject_ + offsetLevel0_);
+        if (node->level > 0)
+            node->copyHigherLevelLinksToOptIndex(linkLists_[id], 0);
+        node->linksChanged_ = false;
+    }
+
+    template <typename dist_t>
+    size_t
+    Hnsw<dist_t>::GetSize() const
+    {
+        return data_rearranged_.empty() ? ElList_.size() : data_rearranged_.size();
     }
 
     template <typename dist_t>
@@ -482,10 +1319,13 @@ namespace similarity {
     template <typename dist_t> Hnsw<dist_t>::~Hnsw()
     {
         delete visitedlistpool;
-        if (data_level0_memory_)
+        // The level-0 block and the link lists of a memory-mapped index reside in the mapping
+        if (data_level0_memory_ && !mappedMemory_)
             free(data_level0_memory_);
+        if (data_exact_memory_ && !mappedMemory_)
+            free(data_exact_memory_);
         if (linkLists_) {
-            for (int i = 0; i < data_rearranged_.size(); i++) {
+            for (int i = 0; i < data_rearranged_.size() && !mappedMemory_; i++) {
                 if (linkLists_[i])
                     free(linkLists_[i]);
             }
@@ -493,15 +1333,29 @@ namespace similarity {
         }
         for (int i = 0; i < ElList_.size(); i++)
             delete ElList_[i];
-        for (const Object *p : data_rearranged_)
-            delete p;
+        if (mappedObjects_) {
+            // These objects don't own their memory, so there is no need to call their destructors
+            ::operator delete(mappedObjects_);
+        } else {
+            for (const Object *p : data_rearranged_)
+                delete p;
+        }
+#if !defined(_MSC_VER)
+        if (mappedMemory_)
+            munmap(mappedMemory_, mappedSize_);
+#endif
     }
 
     template <typename dist_t>
     void
-    Hnsw<dist_t>::add(const Space<dist_t> *space, HnswNode *NewElement)
+    Hnsw<dist_t>::add(const Space<dist_t> *space, HnswNode *NewElement, int minLevel)
     {
         int curlevel = getRandomLevel(mult_);
+        if (curlevel < minLevel) {
+            // The element isn't inserted yet
+            NewElement->init(curlevel, maxM_, maxM0_);
+            return;
+        }
         unique_lock<mutex> *lock = nullptr;
         if (curlevel > maxlevel_)
             lock = new unique_lock<mutex>(MaxLevelGuard_);
@@ -510,36 +1364,8 @@ namespace similarity {
 
         int maxlevelcopy = maxlevel_;
         HnswNode *ep = enterpoint_;
-        if (curlevel < maxlevelcopy) {
-            const Object *currObj = ep->getData();
-
-            dist_t d = space->IndexTimeDistance(NewElement->getData(), currObj);
-            dist_t curdist = d;
-            HnswNode *curNode = ep;
-            for (int level = maxlevelcopy; level > curlevel; level--) {
-                bool changed = true;
-                while (changed) {
-                    changed = false;
-                    unique_lock<mutex> lock(curNode->accessGuard_);
-                    const vector<HnswNode *> &neighbor = curNode->getAllFriends(level);
-                    int size = neighbor.size();
-                    for (int i = 0; i < size; i++) {
-                        HnswNode *node = neighbor[i];
-                        _mm_prefetch((char *)(node)->getData(), _MM_HINT_T0);
-                    }
-                    for (int i = 0; i < size; i++) {
-                        currObj = (neighbor[i])->getData();
-                        d = space->IndexTimeDistance(NewElement->getData(), currObj);
-                        if (d < curdist) {
-                            curdist = d;
-                            curNode = neighbor[i];
-                            changed = true;
-                        }
-                    }
-                }
-            }
-            ep = curNode;
-        }
+        if (curlevel < maxlevelcopy)
+            ep = searchGreedy(space, NewElement->getData(), ep, maxlevelcopy, curlevel + 1);
 
         for (int level = min(curlevel, maxlevelcopy); level >= 0; level--) {
             priority_queue<HnswNodeDistCloser<dist_t>> resultSet;
@@ -574,6 +1400,155 @@ namespace similarity {
             delete lock;
     }
 
+    /*
+     * Level 0 is built from the approximate k-NN graph: the neighbors of each element are
+     * selected from its k-NN list (and its level-0 links if the element was inserted
+     * by add()) by the same heuristic as in add(), then links are made
+     * bidirectional and lists longer than maxM0_ are shrunk as in HnswNode::addFriendlevel().
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::BuildLevel0ByNNDescent(size_t K, float sampleRate, double delta, size_t maxIterQty)
+    {
+        size_t qty = ElList_.size();
+        if (qty < 2)
+            return;
+        /*
+         * Each element is assigned to the cell of the closest element of upper levels found by the greedy
+         * search (like an inserted element). Elements of the same and linked cells are initial candidates,
+         * which is much better than random neighbors and saves a few iterations of NN-descent.
+         */
+        vector<IdType> cells(qty);
+        ParallelFor(0, qty, indexThreadQty_, [&](size_t id, size_t threadId) {
+            HnswNode *node = ElList_[id];
+            cells[id] = node->level > 0 ? id : searchGreedy(&space_, node->getData(), enterpoint_, maxlevel_, 0)->getId();
+        });
+        vector<vector<IdType>> cellElements(qty);
+        for (size_t id = 0; id < qty; id++)
+            cellElements[cells[id]].push_back(id);
+
+        NNDescent<dist_t> nndes(qty, K, sampleRate, delta, maxIterQty, indexThreadQty_, [&](IdType id1, IdType id2) {
+            return space_.IndexTimeDistance(ElList_[id1]->getData(), ElList_[id2]->getData());
+        });
+        nndes.build([&](IdType id, vector<IdType> &candidates) {
+            HnswNode *center = ElList_[cells[id]];
+            candidates = cellElements[center->getId()];
+            for (HnswNode *neighbor : center->allFriends_[0]) {
+                const vector<IdType> &elements = cellElements[neighbor->getId()];
+                candidates.insert(candidates.end(), elements.begin(), elements.end());
+            }
+        });
+        cellElements.clear();
+
+        vector<vector<IdType>> links(qty);
+        ParallelFor(0, qty, indexThreadQty_, [&](size_t id, size_t threadId) {
+            priority_queue<HnswNodeDistCloser<dist_t>> resultSet;
+            for (const auto &neighbor : nndes.getNeighbors(id))
+                resultSet.emplace(neighbor.dist, ElList_[neighbor.id]);
+            for (HnswNode *neighbor : ElList_[id]->allFriends_[0])
+                resultSet.emplace(space_.IndexTimeDistance(ElList_[id]->getData(), neighbor->getData()), neighbor);
+
+            switch (delaunay_type_) {
+            case 0:
+                while (resultSet.size() > M_)
+                    resultSet.pop();
+                break;
+            case 1:
+                ElList_[id]->getNeighborsByHeuristic1(resultSet, M_, &space_);
+                break;
+            case 2:
+                ElList_[id]->getNeighborsByHeuristic2(resultSet, M_, &space_, 0);
+                break;
+            case 3:
+                ElList_[id]->getNeighborsByHeuristic3(resultSet, M_, &space_, 0);
+                break;
+            }
+            while (!resultSet.empty()) {
+                links[id].push_back(resultSet.top().getMSWNodeHier()->getId());
+                resultSet.pop();
+            }
+        });
+
+        vector<vector<IdType>> reverseLinks(qty);
+        for (size_t id = 0; id < qty; id++) {
+            for (IdType neighborId : links[id])
+                reverseLinks[neighborId].push_back(id);
+        }
+
+        // Links are written only after all lists are shrunk, because the third heuristic reads neighbors' links
+        vector<vector<HnswNode *>> allFriends(qty);
+        ParallelFor(0, qty, indexThreadQty_, [&](size_t id, size_t threadId) {
+            vector<IdType> &neighborIds = links[id];
+            neighborIds.insert(neighborIds.end(), reverseLinks[id].begin(), reverseLinks[id].end());
+            sort(neighborIds.begin(), neighborIds.end());
+            neighborIds.erase(unique(neighborIds.begin(), neighborIds.end()), neighborIds.end());
+
+            HnswNode *node = ElList_[id];
+            vector<HnswNode *> &friends = allFriends[id];
+            if (neighborIds.size() <= maxM0_) {
+                for (IdType neighborId : neighborIds)
+                    friends.push_back(ElList_[neighborId]);
+                return;
+            }
+
+            priority_queue<HnswNodeDistCloser<dist_t>> resultSet;
+            for (IdType neighborId : neighborIds)
+                resultSet.emplace(space_.IndexTimeDistance(node->getData(), ElList_[neighborId]->getData()),
+                                  ElList_[neighborId]);
+            if (delaunay_type_ == 1)
+                node->getNeighborsByHeuristic1(resultSet, maxM0_, &space_);
+            else if (delaunay_type_ == 2)
+                node->getNeighborsByHeuristic2(resultSet, maxM0_, &space_, 0);
+            else if (delaunay_type_ == 3)
+                node->getNeighborsByHeuristic3(resultSet, maxM0_, &space_, 0);
+            while (resultSet.size() > maxM0_)
+                resultSet.pop();
+            while (!resultSet.empty()) {
+                friends.push_back(resultSet.top().getMSWNodeHier());
+                resultSet.pop();
+            }
+        });
+        for (size_t id = 0; id < qty; id++)
+            ElList_[id]->allFriends_[0].swap(allFriends[id]);
+        LOG(LIB_INFO) << "Level 0 is built by NN-descent using " << nndes.getDistCompQty() << " distance computations";
+    }
+
+    // Moves to the closest neighbor while it is possible, at levels from fromLevel down to toLevel
+    template <typename dist_t>
+    HnswNode *
+    Hnsw<dist_t>::searchGreedy(const Space<dist_t> *space, const Object *queryObj, HnswNode *ep, int fromLevel,
+                               int toLevel) const
+    {
+        const Object *currObj = ep->getData();
+
+        dist_t d = space->IndexTimeDistance(queryObj, currObj);
+        dist_t curdist = d;
+        HnswNode *curNode = ep;
+        for (int level = fromLevel; level >= toLevel; level--) {
+            bool changed = true;
+            while (changed) {
+                changed = false;
+                unique_lock<mutex> lock(curNode->accessGuard_);
+                const vector<HnswNode *> &neighbor = curNode->getAllFriends(level);
+                int size = neighbor.size();
+                for (int i = 0; i < size; i++) {
+                    HnswNode *node = neighbor[i];
+                    _mm_prefetch((char *)(node)->getData(), _MM_HINT_T0);
+                }
+                for (int i = 0; i < size; i++) {
+                    currObj = (neighbor[i])->getData();
+                    d = space->IndexTimeDistance(queryObj, currObj);
+                    if (d < curdist) {
+                        curdist = d;
+                        curNode = neighbor[i];
+                        changed = true;
+                    }
+                }
+            }
+        }
+        return curNode;
+    }
+
     template <typename dist_t>
     void
     Hnsw<dist_t>::kSearchElementsWithAttemptsLevel(const Space<dist_t> *space, const Object *queryObj, size_t efConstruction,
@@ -585,9 +1560,7 @@ namespace similarity {
 #endif
 
 #if USE_BITSET_FOR_INDEXING
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *mass = vl->mass;
-        vl_type curV = vl->curV;
+        VisitedList *vl = GetVisitedList(efConstruction);
 #else
         unordered_set<HnswNode *> visited;
 #endif
@@ -604,8 +1577,7 @@ namespace similarity {
 #endif
 
 #if USE_BITSET_FOR_INDEXING
-        size_t nodeId = provider->getId();
-        mass[nodeId] = curV;
+        vl->markVisited(provider->getId());
 #else
         visited.insert(provider);
 #endif
@@ -639,9 +1611,7 @@ namespace similarity {
 
             for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
 #if USE_BITSET_FOR_INDEXING
-                size_t nodeId = (*iter)->getId();
-                if (mass[nodeId] != curV) {
-                    mass[nodeId] = curV;
+                if (vl->markVisited((*iter)->getId())) {
 #else
                 if (visited.find((*iter)) == visited.end()) {
                     visited.insert(*iter);
@@ -684,11 +1654,28 @@ namespace similarity {
     void
     Hnsw<dist_t>::Search(KNNQuery<dist_t> *query, IdType) const
     {
-        if (this->data_.empty() && this->data_rearranged_.empty()) {
+        if (ElList_.empty() && this->data_rearranged_.empty()) {
           return;
         }
-        bool useOld = searchAlgoType_ == kOld || (searchAlgoType_ == kHybrid && ef_ >= 1000);
-        // cout << "Ef = " << ef_ << " use old = " << useOld << endl;
+        // per-query overrides take precedence over the index-wide settings
+        size_t ef = ef_;
+        AlgoType algoType = searchAlgoType_;
+        const QueryTimeParams *params = query->QueryParams();
+        if (params) {
+            if (params->efSearch) ef = params->efSearch;
+            if (!params->algoType.empty()) algoType = ParseAlgoType(params->algoType);
+        }
+        /*
+         * A selective filter (compared to the ef * maxM0 distance computations of a graph search)
+         * is handled exhaustively: allowed objects are rarely reached in the graph.
+         */
+        const QueryFilter *filter = query->Filter();
+        if (filter && filter->AllowedQty() <= ef * maxM0_) {
+            SearchFilteredExhaustive(query);
+            return;
+        }
+        bool useOld = algoType == kOld || (algoType == kHybrid && ef >= 1000);
+        // cout << "Ef = " << ef << " use old = " << useOld << endl;
         switch (searchMethod_) {
         default:
             throw runtime_error("Invalid searchMethod: " + ConvertToString(searchMethod_));
@@ -696,30 +1683,99 @@ namespace similarity {
         case 0:
             /// Basic search using Nmslib data structure:
             if (useOld)
-                const_cast<Hnsw *>(this)->baseSearchAlgorithmOld(query);
+                const_cast<Hnsw *>(this)->baseSearchAlgorithmOld(query, ef);
             else
-                const_cast<Hnsw *>(this)->baseSearchAlgorithmV1Merge(query);
+                const_cast<Hnsw *>(this)->baseSearchAlgorithmV1Merge(query, ef);
             break;
         case 1:
             /// Experimental search using Nmslib data structure (should not be used):
-            const_cast<Hnsw *>(this)->listPassingModifiedAlgorithm(query);
+            const_cast<Hnsw *>(this)->listPassingModifiedAlgorithm(query, ef);
             break;
         case 3:
-            /// Basic search using optimized index(cosine+L2)
+            /// Basic search using optimized index(cosine+L2 and other spaces providing flat distance functions)
             if (useOld)
-                const_cast<Hnsw *>(this)->SearchL2CustomOld(query);
+                const_cast<Hnsw *>(this)->SearchL2CustomOld(query, ef);
             else
-                const_cast<Hnsw *>(this)->SearchL2CustomV1Merge(query);
+                const_cast<Hnsw *>(this)->SearchL2CustomV1Merge(query, ef);
             break;
         case 4:
             /// Basic search using optimized index with one-time normalized cosine similarity
             /// Only for cosine similarity!
             if (useOld)
-                const_cast<Hnsw *>(this)->SearchCosineNormalizedOld(query);
+                const_cast<Hnsw *>(this)->SearchCosineNormalizedOld(query, ef);
             else
-                const_cast<Hnsw *>(this)->SearchCosineNormalizedV1Merge(query);
+                const_cast<Hnsw *>(this)->SearchCosineNormalizedV1Merge(query, ef);
+            break;
+        case 5:
+            /// Search using the quantized optimized index (cosine+L2), candidates are re-ranked using exact data
+            const_cast<Hnsw *>(this)->SearchQuantized(query, ef);
             break;
         };
+        // If the graph search didn't find k allowed objects, they are searched for exhaustively
+        if (filter && query->ResultSize() < query->GetK()) {
+            uint64_t distCompQty = query->DistanceComputations();
+            query->Reset();
+            query->AddDistanceComputations(distCompQty);
+            SearchFilteredExhaustive(query);
+        }
+    }
+
+    /*
+     * Objects are looked up by their ids, which are usually equal to their positions
+     * (otherwise, idToPos_ is used if it exists). If some ids can't be found this way,
+     * all objects are checked, which requires no distance computations for filtered-out ones.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::SearchFilteredExhaustive(KNNQuery<dist_t> *query) const
+    {
+        // distances are computed in the same way as in the graph search
+        const bool optimized = searchMethod_ >= 3;
+        const size_t qty = optimized ? data_rearranged_.size() : ElList_.size();
+        auto objectAt = [&](size_t pos) {
+            return optimized ? data_rearranged_[pos] : ElList_[pos]->getData();
+        };
+
+        vector<size_t> positions;
+        bool found = true;
+        query->Filter()->ForEachAllowed([&](IdType id) {
+            if (!found)
+                return;
+            if (!idToPos_.empty()) {
+                auto it = idToPos_.find(id);
+                if (it != idToPos_.end())
+                    positions.push_back(it->second);
+            } else if (id >= 0 && static_cast<size_t>(id) < qty && objectAt(id)->id() == id) {
+                positions.push_back(id);
+            } else {
+                found = false;
+            }
+        });
+        if (!found) {
+            positions.clear();
+            for (size_t pos = 0; pos < qty; pos++) {
+                if (query->IsAllowed(objectAt(pos)))
+                    positions.push_back(pos);
+            }
+        }
+
+        const float *pVectq = (const float *)query->QueryObject()->data();
+        size_t dataLength = query->QueryObject()->datalength();
+        size_t vecQty = dataLength >> 2;
+        float PORTABLE_ALIGN32 TmpRes[8];
+        for (size_t pos : positions) {
+            if (isDeleted(pos))
+                continue;
+            const Object *obj = objectAt(pos);
+            dist_t d;
+            if (optimized) {
+                query->AddDistanceComputations(1);
+                d = fstDistance(pVectq, obj->data(), vecQty, dataLength, TmpRes);
+            } else {
+                d = query->DistanceObjLeft(obj);
+            }
+            query->CheckAndAddToResult(d, obj);
+        }
     }
 
     template <typename dist_t>
@@ -730,28 +1786,57 @@ namespace similarity {
         CHECK_MSG(output, "Cannot open file '" + location + "' for writing");
         output.exceptions(ios::badbit | ios::failbit);
 
-        unsigned int optimIndexFlag = data_level0_memory_ != nullptr;
+        unsigned int optimIndexFlag = data_level0_memory_ == nullptr ? HNSW_REGULAR_INDEX_CSR :
+                                      pq_ ? HNSW_OPTIMIZED_INDEX_PQ :
+                                      quantized_ ? HNSW_OPTIMIZED_INDEX_QUANTIZED : HNSW_OPTIMIZED_INDEX_ALIGNED;
 
 
-        if (!optimIndexFlag) {
+        if (optimIndexFlag == HNSW_REGULAR_INDEX_CSR) {
 #if USE_TEXT_REGULAR_INDEX
             SaveRegularIndexText(output);
 #else
             writeBinaryPOD(output, optimIndexFlag);
-            SaveRegularIndexBin(output);
+            SaveRegularIndexCSR(output);
 #endif
         } else {
+            if (!origIds_.empty())
+                optimIndexFlag |= HNSW_REORDERED_INDEX;
             writeBinaryPOD(output, optimIndexFlag);
             SaveOptimizedIndex(output);
+            SaveOriginalIds(output);
         }
+        SaveDeleted(output);
 
         output.close();
     }
 
+    static size_t alignSectionOffset(size_t offset) {
+        return (offset + HNSW_SECTION_ALIGNMENT - 1) / HNSW_SECTION_ALIGNMENT * HNSW_SECTION_ALIGNMENT;
+    }
+
+    // Pads the output with zeros up to the beginning of the next section
+    static void writeSectionPadding(std::ostream& output) {
+        static const char zeros[HNSW_SECTION_ALIGNMENT] = {0};
+        size_t offset = output.tellp();
+        output.write(zeros, alignSectionOffset(offset) - offset);
+    }
+
+    static void skipSectionPadding(std::istream& input) {
+        size_t offset = input.tellg();
+        input.seekg(alignSectionOffset(offset));
+    }
+
+    /*
+     * Sections of the optimized index (the level-0 block, levels of elements,
+     * and upper-level links of all elements stored one after another)
+     * start at offsets aligned to HNSW_SECTION_ALIGNMENT. Hence, the file
+     * can be memory-mapped, see LoadIndexMapped. A quantized index also
+     * stores the quantizer in the header and the exact data in the last section.
+     */
     template <typename dist_t>
     void
     Hnsw<dist_t>::SaveOptimizedIndex(std::ostream& output) {
-        totalElementsStored_ = ElList_.size();
+        totalElementsStored_ = data_rearranged_.size();
 
         writeBinaryPOD(output, totalElementsStored_);
         writeBinaryPOD(output, memoryPerObject_);
@@ -763,28 +1848,47 @@ namespace similarity {
         writeBinaryPOD(output, maxM0_);
         writeBinaryPOD(output, dist_func_type_);
         writeBinaryPOD(output, searchMethod_);
+        if (quantized_) {
+            writeBinaryPOD(output, vectorlength_);
+            writeBinaryPOD(output, exactObjectSize_);
+            if (pq_) {
+                pq_->Save(output);
+            } else {
+                writeBinaryPOD(output, sqStep_);
+                output.write(reinterpret_cast<const char *>(sqOffset_.data()), sizeof(float) * vectorlength_);
+            }
+        }
 
         size_t data_plus_links0_size = memoryPerObject_ * totalElementsStored_;
         LOG(LIB_INFO) << "writing " << data_plus_links0_size << " bytes";
+        writeSectionPadding(output);
         output.write(data_level0_memory_, data_plus_links0_size);
 
-        // output.write(data_level0_memory_, memoryPerObject_*totalElementsStored_);
-
-        // size_t total_memory_allocated = 0;
+        writeSectionPadding(output);
+        output.write(reinterpret_cast<const char *>(elementLevels_.data()), sizeof(int) * totalElementsStored_);
 
+        writeSectionPadding(output);
         for (size_t i = 0; i < totalElementsStored_; i++) {
             // TODO Can this one overflow? I really doubt
-            SIZEMASS_TYPE sizemass = ((ElList_[i]->level) * (maxM_ + 1)) * sizeof(int);
-            writeBinaryPOD(output, sizemass);
+            SIZEMASS_TYPE sizemass = ((elementLevels_[i]) * (maxM_ + 1)) * sizeof(int);
             if ((sizemass))
                 output.write(linkLists_[i], sizemass);
         };
 
+        if (quantized_) {
+            writeSectionPadding(output);
+            output.write(data_exact_memory_, exactObjectSize_ * totalElementsStored_);
+        }
     }
 
+    /*
+     * The regular index: the header, levels of all elements, and, for each level, links of elements
+     * that have this level (in the order of their IDs) as a CSR matrix: the number of rows,
+     * row offsets, and IDs of friends.
+     */
     template <typename dist_t>
     void
-    Hnsw<dist_t>::SaveRegularIndexBin(std::ostream& output) {
+    Hnsw<dist_t>::SaveRegularIndexCSR(std::ostream& output) {
         totalElementsStored_ = ElList_.size();
 
         writeBinaryPOD(output, totalElementsStored_);
@@ -794,25 +1898,34 @@ namespace similarity {
         writeBinaryPOD(output, maxM_);
         writeBinaryPOD(output, maxM0_);
 
+        vector<unsigned> levels(totalElementsStored_);
+        unsigned levelQty = 0;
         for (unsigned i = 0; i < totalElementsStored_; ++i) {
             const HnswNode& node = *ElList_[i];
-            unsigned currlevel = node.level;
-            CHECK(currlevel + 1 == node.allFriends_.size());
-            /*
-             * This check strangely fails ...
-            CHECK_MSG(maxlevel_ >= currlevel, ""
-                    "maxlevel_ (" + ConvertToString(maxlevel_) + ") < node.allFriends_.size() (" + ConvertToString(currlevel));
-                    */
-            writeBinaryPOD(output, currlevel);
-            for (unsigned level = 0; level <= currlevel; ++level) {
-                const auto& friends = node.allFriends_[level];
-                unsigned friendQty = friends.size();
-                writeBinaryPOD(output, friendQty);
-                for (unsigned k = 0; k < friendQty; ++k) {
-                    IdType friendId = friends[k]->id_;
-                    writeBinaryPOD(output, friendId);
-                }
+            levels[i] = node.level;
+            CHECK(levels[i] + 1 == node.allFriends_.size());
+            // maxlevel_ isn't always the maximum level of elements
+            levelQty = max(levelQty, levels[i] + 1);
+        }
+        output.write(reinterpret_cast<const char *>(levels.data()), sizeof(unsigned) * totalElementsStored_);
+        writeBinaryPOD(output, levelQty);
+
+        vector<size_t> offsets;
+        vector<IdType> friendIds;
+        for (unsigned level = 0; level < levelQty; ++level) {
+            offsets.assign(1, 0);
+            friendIds.clear();
+            for (unsigned i = 0; i < totalElementsStored_; ++i) {
+                if (levels[i] < level)
+                    continue;
+                for (const HnswNode *friendNode : ElList_[i]->allFriends_[level])
+                    friendIds.push_back(friendNode->id_);
+                offsets.push_back(friendIds.size());
             }
+            size_t rowQty = offsets.size() - 1;
+            writeBinaryPOD(output, rowQty);
+            output.write(reinterpret_cast<const char *>(offsets.data()), sizeof(size_t) * offsets.size());
+            output.write(reinterpret_cast<const char *>(friendIds.data()), sizeof(IdType) * friendIds.size());
         }
     }
 
@@ -871,6 +1984,7 @@ namespace similarity {
         ReadField(input, FIELD_MAX_M0, maxM0_); lineNum++;
 
         fstdistfunc_ = nullptr;
+        flatdistfunc_ = nullptr;
         dist_func_type_ = 0;
         searchMethod_ = 0;
 
@@ -888,6 +2002,9 @@ namespace similarity {
             unsigned currlevel;
             ReadField(input, CURR_LEVEL, currlevel); lineNum++;
             node.level = currlevel;
+            // limits on the number of friends are needed to add data to the loaded index
+            node.maxsize = maxM_;
+            node.maxsize0 = maxM0_;
             node.allFriends_.resize(currlevel + 1);
             for (unsigned level = 0; level <= currlevel; ++level) {
                 CHECK_MSG(getline(input, line),
@@ -927,6 +2044,7 @@ namespace similarity {
         readBinaryPOD(input, maxM0_);
 
         fstdistfunc_ = nullptr;
+        flatdistfunc_ = nullptr;
         dist_func_type_ = 0;
         searchMethod_ = 0;
 
@@ -947,6 +2065,9 @@ namespace similarity {
             unsigned currlevel;
             readBinaryPOD(input, currlevel);
             node.level = currlevel;
+            // limits on the number of friends are needed to add data to the loaded index
+            node.maxsize = maxM_;
+            node.maxsize0 = maxM0_;
             node.allFriends_.resize(currlevel + 1);
             for (unsigned level = 0; level <= currlevel; ++level) {
                 auto& friends = node.allFriends_[level];
@@ -965,6 +2086,75 @@ namespace similarity {
         }
     }
 
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::LoadRegularIndexCSR(std::istream& input) {
+        LOG(LIB_INFO) << "Loading regular index (CSR links).";
+        readBinaryPOD(input, totalElementsStored_);
+        readBinaryPOD(input, maxlevel_);
+        readBinaryPOD(input, enterpointId_);
+        readBinaryPOD(input, M_);
+        readBinaryPOD(input, maxM_);
+        readBinaryPOD(input, maxM0_);
+
+        fstdistfunc_ = nullptr;
+        flatdistfunc_ = nullptr;
+        dist_func_type_ = 0;
+        searchMethod_ = 0;
+
+        CHECK_MSG(totalElementsStored_ == this->data_.size(),
+             "The number of stored elements " + ConvertToString(totalElementsStored_) +
+             " doesn't match the number of data points " + ConvertToString(this->data_.size()) +
+             "! Did you forget to re-load data?");
+
+        vector<unsigned> levels(totalElementsStored_);
+        input.read(reinterpret_cast<char *>(levels.data()), sizeof(unsigned) * totalElementsStored_);
+        unsigned levelQty;
+        readBinaryPOD(input, levelQty);
+
+        ElList_.resize(totalElementsStored_);
+        ParallelFor(0, totalElementsStored_, indexThreadQty_, [&](size_t id, size_t threadId) {
+            HnswNode *node = new HnswNode(this->data_[id], id);
+            node->level = levels[id];
+            // limits on the number of friends are needed to add data to the loaded index
+            node->maxsize = maxM_;
+            node->maxsize0 = maxM0_;
+            node->allFriends_.resize(levels[id] + 1);
+            ElList_[id] = node;
+        });
+        enterpoint_ = ElList_[enterpointId_];
+
+        vector<IdType> rowIds;
+        vector<size_t> offsets;
+        vector<IdType> friendIds;
+        for (unsigned level = 0; level < levelQty; ++level) {
+            rowIds.clear();
+            for (unsigned id = 0; id < totalElementsStored_; ++id) {
+                if (levels[id] >= level)
+                    rowIds.push_back(id);
+            }
+            size_t rowQty;
+            readBinaryPOD(input, rowQty);
+            CHECK_MSG(rowQty == rowIds.size(), "Invalid number of elements at level " + ConvertToString(level));
+            offsets.resize(rowQty + 1);
+            input.read(reinterpret_cast<char *>(offsets.data()), sizeof(size_t) * offsets.size());
+            friendIds.resize(offsets[rowQty]);
+            input.read(reinterpret_cast<char *>(friendIds.data()), sizeof(IdType) * friendIds.size());
+            for (IdType friendId : friendIds) {
+                CHECK_MSG(friendId >= 0 && friendId < totalElementsStored_,
+                          "Invalid friendId = " + ConvertToString(friendId) + " at level " + ConvertToString(level));
+            }
+
+            ParallelFor(0, rowQty, indexThreadQty_, [&](size_t row, size_t threadId) {
+                // as in LoadRegularIndexBin, lists aren't reserved up to the maximum size
+                vector<HnswNode *> &friends = ElList_[rowIds[row]]->allFriends_[level];
+                friends.resize(offsets[row + 1] - offsets[row]);
+                for (size_t k = offsets[row]; k < offsets[row + 1]; ++k)
+                    friends[k - offsets[row]] = ElList_[friendIds[k]];
+            });
+        }
+    }
+
     template <typename dist_t>
     void
     Hnsw<dist_t>::LoadIndex(const string &location) {
@@ -981,27 +2171,178 @@ namespace similarity {
         unsigned int optimIndexFlag= 0;
 
         readBinaryPOD(input, optimIndexFlag);
+        bool reordered = (optimIndexFlag & HNSW_REORDERED_INDEX) != 0;
+        optimIndexFlag &= ~HNSW_REORDERED_INDEX;
 
-        if (!optimIndexFlag) {
+        if (optimIndexFlag == HNSW_REGULAR_INDEX && !reordered) {
             LoadRegularIndexBin(input);
+        } else if (optimIndexFlag == HNSW_REGULAR_INDEX_CSR && !reordered) {
+            LoadRegularIndexCSR(input);
         } else {
-            LoadOptimizedIndex(input);
+            CHECK_MSG(optimIndexFlag == HNSW_OPTIMIZED_INDEX || optimIndexFlag == HNSW_OPTIMIZED_INDEX_ALIGNED ||
+                      optimIndexFlag == HNSW_OPTIMIZED_INDEX_QUANTIZED || optimIndexFlag == HNSW_OPTIMIZED_INDEX_PQ,
+                      "Unknown format of the index file '" + location + "'");
+            LoadOptimizedIndex(input, optimIndexFlag);
+            LoadOriginalIds(input, reordered);
         }
+        LoadDeleted(input);
 #endif
         input.close();
 
         LOG(LIB_INFO) << "Finished loading index";
-        visitedlistpool = new VisitedListPool(1, totalElementsStored_);
+        visitedlistpool = new VisitedListPool(totalElementsStored_);
+        // this one isn't stored, but it is needed to add data to the loaded index
+        mult_ = 1 / log(1.0 * M_);
 
 
     }
 
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::LoadIndexMapped(const string &location) {
+#if defined(_MSC_VER)
+        throw runtime_error("Memory-mapped loading of HNSW indices isn't supported on this platform");
+#else
+        LOG(LIB_INFO) << "Memory-mapping index from " << location;
+        std::ifstream input(location, std::ios::binary);
+        CHECK_MSG(input, "Cannot open file '" + location + "' for reading");
+
+        input.exceptions(ios::badbit | ios::failbit);
 
+        unsigned int optimIndexFlag = 0;
+        readBinaryPOD(input, optimIndexFlag);
+        bool reordered = (optimIndexFlag & HNSW_REORDERED_INDEX) != 0;
+        optimIndexFlag &= ~HNSW_REORDERED_INDEX;
+        if (optimIndexFlag != HNSW_OPTIMIZED_INDEX_ALIGNED && optimIndexFlag != HNSW_OPTIMIZED_INDEX_QUANTIZED &&
+            optimIndexFlag != HNSW_OPTIMIZED_INDEX_PQ) {
+            LOG(LIB_WARNING) << "The index isn't saved as an aligned optimized index, it can't be memory-mapped";
+            input.close();
+            LoadIndex(location);
+            return;
+        }
+        LoadOptimizedIndexHeader(input, optimIndexFlag);
+
+        size_t level0Offset = alignSectionOffset(input.tellg());
+        size_t levelsOffset = alignSectionOffset(level0Offset + memoryPerObject_ * totalElementsStored_);
+        size_t linksOffset = alignSectionOffset(levelsOffset + sizeof(int) * totalElementsStored_);
+
+        int fd = open(location.c_str(), O_RDONLY);
+        CHECK_MSG(fd >= 0, "Cannot open file '" + location + "' for reading");
+        struct stat fileStat;
+        if (fstat(fd, &fileStat) != 0) {
+            close(fd);
+            throw runtime_error("Cannot obtain the size of the file '" + location + "'");
+        }
+        void *mem = mmap(nullptr, fileStat.st_size, PROT_READ, MAP_SHARED, fd, 0);
+        close(fd);
+        CHECK_MSG(mem != MAP_FAILED, "Cannot memory-map the file '" + location + "'");
+        mappedMemory_ = static_cast<char *>(mem);
+        mappedSize_ = fileStat.st_size;
+        CHECK_MSG(linksOffset <= mappedSize_, "The index file '" + location + "' is truncated");
+
+        data_level0_memory_ = mappedMemory_ + level0Offset;
+        const int *levels = reinterpret_cast<const int *>(mappedMemory_ + levelsOffset);
+        elementLevels_.assign(levels, levels + totalElementsStored_);
+
+        linkLists_ = (char **)malloc(sizeof(void *) * std::max<size_t>(1, totalElementsStored_));
+        CHECK(linkLists_);
+        size_t linksEnd = linksOffset;
+        for (size_t i = 0; i < totalElementsStored_; i++) {
+            SIZEMASS_TYPE linkListSize = elementLevels_[i] * (maxM_ + 1) * sizeof(int);
+            linkLists_[i] = linkListSize ? mappedMemory_ + linksEnd : nullptr;
+            linksEnd += linkListSize;
+        }
+        CHECK_MSG(linksEnd <= mappedSize_, "The index file '" + location + "' is truncated");
+        size_t dataEnd = linksEnd;
+        if (quantized_) {
+            // Exact data are paged in only when candidates are re-ranked
+            size_t exactOffset = alignSectionOffset(linksEnd);
+            dataEnd = exactOffset + exactObjectSize_ * totalElementsStored_;
+            CHECK_MSG(dataEnd <= mappedSize_, "The index file '" + location + "' is truncated");
+            data_exact_memory_ = mappedMemory_ + exactOffset;
+        }
+
+        mappedObjects_ = static_cast<Object *>(::operator new(std::max<size_t>(1, totalElementsStored_) * sizeof(Object)));
+        data_rearranged_.resize(totalElementsStored_);
+        for (size_t i = 0; i < totalElementsStored_; i++) {
+            data_rearranged_[i] = new (mappedObjects_ + i) Object(optimizedData(i));
+        }
+        optimizedCapacity_ = totalElementsStored_;
+
+        input.seekg(dataEnd);
+        LoadOriginalIds(input, reordered);
+        LoadDeleted(input);
+        input.close();
+
+        LOG(LIB_INFO) << "Finished memory-mapping index";
+        visitedlistpool = new VisitedListPool(totalElementsStored_);
+        mult_ = 1 / log(1.0 * M_);
+#endif
+    }
+
+
+    // Original positions of reordered elements follow all sections of the optimized index
     template <typename dist_t>
     void
-    Hnsw<dist_t>::LoadOptimizedIndex(std::istream& input) {
-        LOG(LIB_INFO) << "Loading optimized index.";
+    Hnsw<dist_t>::SaveOriginalIds(std::ostream& output) {
+        if (origIds_.empty())
+            return;
+        CHECK(origIds_.size() == data_rearranged_.size());
+        output.write(reinterpret_cast<const char *>(origIds_.data()), sizeof(IdType) * origIds_.size());
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::LoadOriginalIds(std::istream& input, bool reordered) {
+        origIds_.clear();
+        if (!reordered)
+            return;
+        origIds_.resize(totalElementsStored_);
+        input.read(reinterpret_cast<char *>(origIds_.data()), sizeof(IdType) * totalElementsStored_);
+        for (IdType origId : origIds_) {
+            CHECK_MSG(origId >= 0 && origId < totalElementsStored_, "Invalid original ID of an element: " + ConvertToString(origId));
+        }
+    }
+
+    /*
+     * Tombstones are saved at the end of the file (only if there are any), so that indices
+     * without deleted elements are saved exactly as before. All loaded tombstones are
+     * considered to be unrepaired: repairing them again only re-checks their neighbors.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::SaveDeleted(std::ostream& output) {
+        if (!deletedQty_)
+            return;
+        writeBinaryPOD(output, deletedQty_);
+        for (size_t i = 0; i < deleted_.size(); i++) {
+            IdType pos = i;
+            if (deleted_[i])
+                writeBinaryPOD(output, pos);
+        }
+    }
+
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::LoadDeleted(std::istream& input) {
+        if (input.peek() == EOF)
+            return;
+        readBinaryPOD(input, deletedQty_);
+        deleted_.assign(totalElementsStored_, 0);
+        toRepair_.resize(deletedQty_);
+        for (size_t i = 0; i < deletedQty_; i++) {
+            IdType pos;
+            readBinaryPOD(input, pos);
+            CHECK_MSG(pos >= 0 && pos < totalElementsStored_, "Invalid position of a deleted element: " + ConvertToString(pos));
+            deleted_[pos] = 1;
+            toRepair_[i] = pos;
+        }
+        LOG(LIB_INFO) << "The number of deleted elements: " << deletedQty_;
+    }
 
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::LoadOptimizedIndexHeader(std::istream& input, unsigned optimIndexFlag) {
         readBinaryPOD(input, totalElementsStored_);
         readBinaryPOD(input, memoryPerObject_);
         readBinaryPOD(input, offsetLevel0_);
@@ -1012,30 +2353,84 @@ namespace similarity {
         readBinaryPOD(input, maxM0_);
         readBinaryPOD(input, dist_func_type_);
         readBinaryPOD(input, searchMethod_);
+        quantized_ = optimIndexFlag == HNSW_OPTIMIZED_INDEX_QUANTIZED || optimIndexFlag == HNSW_OPTIMIZED_INDEX_PQ;
+        pq_.reset();
+        if (quantized_) {
+            readBinaryPOD(input, vectorlength_);
+            readBinaryPOD(input, exactObjectSize_);
+            if (optimIndexFlag == HNSW_OPTIMIZED_INDEX_PQ) {
+                pq_.reset(new ProductQuantizer());
+                pq_->Load(input);
+            } else {
+                readBinaryPOD(input, sqStep_);
+                sqOffset_.resize(vectorlength_);
+                input.read(reinterpret_cast<char *>(sqOffset_.data()), sizeof(float) * vectorlength_);
+            }
+        }
+        // M isn't stored in the optimized index, but maxM is equal to M by default
+        M_ = maxM_;
+        iscosine_ = dist_func_type_ == 3;
 
         LOG(LIB_INFO) << "searchMethod: " << searchMethod_;
 
+        flatdistfunc_ = nullptr;
         if (dist_func_type_ == 1)
             fstdistfunc_ = L2SqrSIMD16Ext;
         else if (dist_func_type_ == 2)
             fstdistfunc_ = L2SqrSIMDExt;
         else if (dist_func_type_ == 3)
             fstdistfunc_ = NormScalarProductSIMD;
+        else if (dist_func_type_ > HNSW_DIST_FUNC_SPACE) {
+            const FlatDistFunc<dist_t> flatDist = space_.GetFlatDistFunc();
+            CHECK_MSG(flatDist.func != nullptr && HNSW_DIST_FUNC_SPACE + flatDist.kind == dist_func_type_,
+                      "The optimized index was created for a different space, the current space is " +
+                      space_.StrDesc());
+            flatdistfunc_ = flatDist.func;
+        }
 
         //        LOG(LIB_INFO) << input.tellg();
         LOG(LIB_INFO) << "Total: " << totalElementsStored_ << ", Memory per object: " << memoryPerObject_;
+    }
+
+    /*
+     * An aligned index stores levels of all elements before their link lists.
+     * An older (unaligned) index stores the size of each link list before the list.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::LoadOptimizedIndex(std::istream& input, unsigned optimIndexFlag) {
+        LOG(LIB_INFO) << "Loading optimized index.";
+
+        LoadOptimizedIndexHeader(input, optimIndexFlag);
+        bool aligned = optimIndexFlag != HNSW_OPTIMIZED_INDEX;
+
         size_t data_plus_links0_size = memoryPerObject_ * totalElementsStored_;
         data_level0_memory_ = (char *)malloc(data_plus_links0_size);
         CHECK(data_level0_memory_);
+        if (aligned)
+            skipSectionPadding(input);
         input.read(data_level0_memory_, data_plus_links0_size);
         linkLists_ = (char **)malloc(sizeof(void *) * totalElementsStored_);
         CHECK(linkLists_);
 
         data_rearranged_.resize(totalElementsStored_);
+        elementLevels_.resize(totalElementsStored_);
+        optimizedCapacity_ = totalElementsStored_;
+
+        if (aligned) {
+            skipSectionPadding(input);
+            input.read(reinterpret_cast<char *>(elementLevels_.data()), sizeof(int) * totalElementsStored_);
+            skipSectionPadding(input);
+        }
 
         for (size_t i = 0; i < totalElementsStored_; i++) {
             SIZEMASS_TYPE linkListSize;
-            readBinaryPOD(input, linkListSize);
+            if (aligned) {
+                linkListSize = elementLevels_[i] * (maxM_ + 1) * sizeof(int);
+            } else {
+                readBinaryPOD(input, linkListSize);
+                elementLevels_[i] = linkListSize / ((maxM_ + 1) * sizeof(int));
+            }
 
             if (linkListSize == 0) {
                 linkLists_[i] = nullptr;
@@ -1044,18 +2439,25 @@ namespace similarity {
                 CHECK(linkLists_[i]);
                 input.read(linkLists_[i], linkListSize);
             }
-            data_rearranged_[i] = new Object(data_level0_memory_ + (i)*memoryPerObject_ + offsetData_);
         }
 
+        if (quantized_) {
+            data_exact_memory_ = (char *)malloc(exactObjectSize_ * std::max<size_t>(1, totalElementsStored_));
+            CHECK(data_exact_memory_);
+            skipSectionPadding(input);
+            input.read(data_exact_memory_, exactObjectSize_ * totalElementsStored_);
+        }
+        for (size_t i = 0; i < totalElementsStored_; i++) {
+            data_rearranged_[i] = new Object(optimizedData(i));
+        }
     }
 
     template <typename dist_t>
     void
-    Hnsw<dist_t>::baseSearchAlgorithmOld(KNNQuery<dist_t> *query)
+    Hnsw<dist_t>::baseSearchAlgorithmOld(KNNQuery<dist_t> *query, size_t ef)
     {
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *massVisited = vl->mass;
-        vl_type currentV = vl->curV;
+        VisitedList *vl = GetVisitedList(ef);
+        QueryStats *stats = query->Stats();
 
         HnswNode *provider;
         int maxlevel1 = enterpoint_->level;
@@ -1070,6 +2472,7 @@ namespace similarity {
             bool changed = true;
             while (changed) {
                 changed = false;
+                if (stats) stats->AddHop(i);
 
                 const vector<HnswNode *> &neighbor = curNode->getAllFriends(i);
                 for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
@@ -1094,8 +2497,10 @@ namespace similarity {
         candidateQueue.emplace(curdist, curNode);
         closestDistQueue1.emplace(curdist, curNode);
 
-        query->CheckAndAddToResult(curdist, curNode->getData());
-        massVisited[curNode->getId()] = currentV;
+        if (!isDeleted(curNode->getId()))
+            query->CheckAndAddToResult(curdist, curNode->getData());
+        vl->markVisited(curNode->getId());
+        uint64_t distCompQty0 = query->DistanceComputations();
         // visitedQueue.insert(curNode->getId());
 
         ////////////////////////////////////////////////////////////////////////////////
@@ -1114,6 +2519,7 @@ namespace similarity {
 
             HnswNode *initNode = currEv.getMSWNodeHier();
             candidateQueue.pop();
+            if (stats) stats->AddHop(0);
 
             const vector<HnswNode *> &neighbor = (initNode)->getAllFriends(0);
 
@@ -1121,22 +2527,22 @@ namespace similarity {
 
             for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                 _mm_prefetch((char *)(*iter)->getData(), _MM_HINT_T0);
-                _mm_prefetch((char *)(massVisited + (*iter)->getId()), _MM_HINT_T0);
+                vl->prefetch((*iter)->getId());
             }
             // calculate distance to each neighbor
             for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                 curId = (*iter)->getId();
 
-                if (!(massVisited[curId] == currentV)) {
-                    massVisited[curId] = currentV;
+                if (vl->markVisited(curId)) {
                     currObj = (*iter)->getData();
                     d = query->DistanceObjLeft(currObj);
-                    if (closestDistQueue1.top().getDistance() > d || closestDistQueue1.size() < ef_) {
+                    if (closestDistQueue1.top().getDistance() > d || closestDistQueue1.size() < ef) {
                         {
-                            query->CheckAndAddToResult(d, currObj);
+                            if (!isDeleted(curId))
+                                query->CheckAndAddToResult(d, currObj);
                             candidateQueue.emplace(d, *iter);
                             closestDistQueue1.emplace(d, *iter);
-                            if (closestDistQueue1.size() > ef_) {
+                            if (closestDistQueue1.size() > ef) {
                                 closestDistQueue1.pop();
                             }
                         }
@@ -1144,16 +2550,17 @@ namespace similarity {
                 }
             }
         }
+        // every node visited at level 0 (except the first one) requires a distance computation
+        if (stats) stats->visited_qty += 1 + query->DistanceComputations() - distCompQty0;
         visitedlistpool->releaseVisitedList(vl);
     }
 
     template <typename dist_t>
     void
-    Hnsw<dist_t>::baseSearchAlgorithmV1Merge(KNNQuery<dist_t> *query)
+    Hnsw<dist_t>::baseSearchAlgorithmV1Merge(KNNQuery<dist_t> *query, size_t ef)
     {
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *massVisited = vl->mass;
-        vl_type currentV = vl->curV;
+        VisitedList *vl = GetVisitedList(ef);
+        QueryStats *stats = query->Stats();
 
         HnswNode *provider;
         int maxlevel1 = enterpoint_->level;
@@ -1168,6 +2575,7 @@ namespace similarity {
             bool changed = true;
             while (changed) {
                 changed = false;
+                if (stats) stats->AddHop(i);
 
                 const vector<HnswNode *> &neighbor = curNode->getAllFriends(i);
                 for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
@@ -1185,7 +2593,7 @@ namespace similarity {
             }
         }
 
-        SortArrBI<dist_t, HnswNode *> sortedArr(max<size_t>(ef_, query->GetK()));
+        SortArrBI<dist_t, HnswNode *> sortedArr(max<size_t>(ef, query->GetK()));
         sortedArr.push_unsorted_grow(curdist, curNode);
 
         int_fast32_t currElem = 0;
@@ -1194,20 +2602,30 @@ namespace similarity {
         vector<QueueItem> &queueData = sortedArr.get_data();
         vector<QueueItem> itemBuff(1 + max(maxM_, maxM0_));
 
-        massVisited[curNode->getId()] = currentV;
+        vl->markVisited(curNode->getId());
+        uint64_t distCompQty0 = query->DistanceComputations();
         // visitedQueue.insert(curNode->getId());
 
+        /*
+         * With a filter (or deleted elements), the top-K of the candidate buffer may contain few
+         * (or no) allowed objects. Thus, every evaluated object is offered to the result set instead
+         * (CheckAndAddToResult ignores filtered-out ones), while the traversal itself is unchanged.
+         */
+        const bool filtered = query->Filter() != nullptr || deletedQty_ != 0;
+        if (filtered && !isDeleted(curNode->getId())) query->CheckAndAddToResult(curdist, curNode->getData());
+
         ////////////////////////////////////////////////////////////////////////////////
         // PHASE TWO OF THE SEARCH
         // Extraction of the neighborhood to find k nearest neighbors.
         ////////////////////////////////////////////////////////////////////////////////
 
-        while (currElem < min(sortedArr.size(), ef_)) {
+        while (currElem < min(sortedArr.size(), ef)) {
             auto &e = queueData[currElem];
             CHECK(!e.used);
             e.used = true;
             HnswNode *initNode = e.data;
             ++currElem;
+            if (stats) stats->AddHop(0);
 
             size_t itemQty = 0;
             dist_t topKey = sortedArr.top_key();
@@ -1219,19 +2637,19 @@ namespace similarity {
             for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                 _mm_prefetch((char *)(*iter)->getData(), _MM_HINT_T0);
                 IdType curId = (*iter)->getId();
-                CHECK(curId >= 0 && curId < this->data_.size());
-                _mm_prefetch((char *)(massVisited + curId), _MM_HINT_T0);
+                CHECK(curId >= 0 && curId < ElList_.size());
+                vl->prefetch(curId);
             }
             // calculate distance to each neighbor
             for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                 curId = (*iter)->getId();
 
-                if (!(massVisited[curId] == currentV)) {
-                    massVisited[curId] = currentV;
+                if (vl->markVisited(curId)) {
                     currObj = (*iter)->getData();
                     d = query->DistanceObjLeft(currObj);
+                    if (filtered && !isDeleted(curId)) query->CheckAndAddToResult(d, currObj);
 
-                    if (d < topKey || sortedArr.size() < ef_) {
+                    if (d < topKey || sortedArr.size() < ef) {
                         CHECK_MSG(itemBuff.size() > itemQty,
                                   "Perhaps a bug: buffer size is not enough " + 
                                   ConvertToString(itemQty) + " >= " + ConvertToString(itemBuff.size()));
@@ -1268,23 +2686,23 @@ namespace similarity {
                 ++currElem;
         }
 
-        for (uint_fast32_t i = 0; i < query->GetK() && i < sortedArr.size(); ++i) {
+        for (uint_fast32_t i = 0; !filtered && i < query->GetK() && i < sortedArr.size(); ++i) {
             query->CheckAndAddToResult(queueData[i].key, queueData[i].data->getData());
         }
 
+        // every node visited at level 0 (except the first one) requires a distance computation
+        if (stats) stats->visited_qty += 1 + query->DistanceComputations() - distCompQty0;
         visitedlistpool->releaseVisitedList(vl);
     }
     // Experimental search algorithm
     template <typename dist_t>
     void
-    Hnsw<dist_t>::listPassingModifiedAlgorithm(KNNQuery<dist_t> *query)
+    Hnsw<dist_t>::listPassingModifiedAlgorithm(KNNQuery<dist_t> *query, size_t ef)
     {
         int efSearchL = 4; // This parameters defines the confidence of searches at level higher than zero
                            // for zero level it is set to ef
                            // Getting the visitedlist
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *massVisited = vl->mass;
-        vl_type currentV = vl->curV;
+        VisitedList *vl = GetVisitedList(ef);
 
         int maxlevel1 = enterpoint_->level;
 
@@ -1303,7 +2721,7 @@ namespace similarity {
         candidateQueue.emplace(curdist, curNode);
         closestDistQueue.emplace(curdist, curNode);
 
-        massVisited[curNode->getId()] = currentV;
+        vl->markVisited(curNode->getId());
 
         for (int i = maxlevel1; i > 0; i--) {
             while (!candidateQueue.empty()) {
@@ -1324,13 +2742,12 @@ namespace similarity {
 
                 for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                     _mm_prefetch((char *)(*iter)->getData(), _MM_HINT_T0);
-                    _mm_prefetch((char *)(massVisited + (*iter)->getId()), _MM_HINT_T0);
+                    vl->prefetch((*iter)->getId());
                 }
                 // calculate distance to each neighbor
                 for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                     curId = (*iter)->getId();
-                    if (!(massVisited[curId] == currentV)) {
-                        massVisited[curId] = currentV;
+                    if (vl->markVisited(curId)) {
                         currObj = (*iter)->getData();
                         d = query->DistanceObjLeft(currObj);
                         if (closestDistQueue.top().getDistance() > d || closestDistQueue.size() < efSearchL) {
@@ -1343,28 +2760,23 @@ namespace similarity {
                     }
                 }
             }
-            // Updating the bitset key:
-            currentV++;
-            vl->curV++; // not to forget updating in the pool
-            if (currentV == 0) {
-                memset(massVisited, 0, ElList_.size() * sizeof(vl_type));
-                currentV++;
-                vl->curV++; // not to forget updating in the pool
-            }
+            // Clearing the visited set:
+            vl->reset();
             candidateQueue = priority_queue<HnswNodeDistFarther<dist_t>>();
             closestDistQueueCpy = priority_queue<HnswNodeDistCloser<dist_t>>(closestDistQueue);
             if (i > 1) { // Passing the closest neighbors to layers higher than zero:
                 while (closestDistQueueCpy.size() > 0) {
-                    massVisited[closestDistQueueCpy.top().getMSWNodeHier()->getId()] = currentV;
+                    vl->markVisited(closestDistQueueCpy.top().getMSWNodeHier()->getId());
                     candidateQueue.emplace(closestDistQueueCpy.top().getDistance(), closestDistQueueCpy.top().getMSWNodeHier());
                     closestDistQueueCpy.pop();
                 }
             } else { // Passing the closest neighbors to the 0 zero layer(one has to add also to query):
                 while (closestDistQueueCpy.size() > 0) {
-                    massVisited[closestDistQueueCpy.top().getMSWNodeHier()->getId()] = currentV;
+                    vl->markVisited(closestDistQueueCpy.top().getMSWNodeHier()->getId());
                     candidateQueue.emplace(closestDistQueueCpy.top().getDistance(), closestDistQueueCpy.top().getMSWNodeHier());
-                    query->CheckAndAddToResult(closestDistQueueCpy.top().getDistance(),
-                                               closestDistQueueCpy.top().getMSWNodeHier()->getData());
+                    if (!isDeleted(closestDistQueueCpy.top().getMSWNodeHier()->getId()))
+                        query->CheckAndAddToResult(closestDistQueueCpy.top().getDistance(),
+                                                   closestDistQueueCpy.top().getMSWNodeHier()->getData());
                     closestDistQueueCpy.pop();
                 }
             }
@@ -1393,21 +2805,21 @@ namespace similarity {
 
             for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                 _mm_prefetch((char *)(*iter)->getData(), _MM_HINT_T0);
-                _mm_prefetch((char *)(massVisited + (*iter)->getId()), _MM_HINT_T0);
+                vl->prefetch((*iter)->getId());
             }
             // calculate distance to each neighbor
             for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter) {
                 curId = (*iter)->getId();
-                if (!(massVisited[curId] == currentV)) {
-                    massVisited[curId] = currentV;
+                if (vl->markVisited(curId)) {
                     currObj = (*iter)->getData();
                     d = query->DistanceObjLeft(currObj);
-                    if (closestDistQueue.top().getDistance() > d || closestDistQueue.size() < ef_) {
+                    if (closestDistQueue.top().getDistance() > d || closestDistQueue.size() < ef) {
                         {
-                            query->CheckAndAddToResult(d, currObj);
+                            if (!isDeleted(curId))
+                                query->CheckAndAddToResult(d, currObj);
                             candidateQueue.emplace(d, *iter);
                             closestDistQueue.emplace(d, *iter);
-                            if (closestDistQueue.size() > ef_) {
+                            if (closestDistQueue.size() > ef) {
                                 closestDistQueue.pop();
                             }
                         }
@@ -29,6 +29,7 @@
 #include "ported_boost_progress.h"
 #include "rangequery.h"
 #include "portable_intrinsics.h"
+#include "simd_dispatch.h"
 // This is only for _mm_prefetch
 #include <mmintrin.h>
 #include "space.h"
@@ -40,324 +41,32 @@
 #include <limits>
 #include <vector>
 
-#ifdef __AVX__
-#define USE_AVX
-#endif
-
-//#define DIST_CALC
 namespace similarity {
     float
     L2SqrSIMD16Ext(const float *pVect1, const float *pVect2, size_t &qty, float *TmpRes)
     {
-#ifdef USE_AVX
-        size_t qty16 = qty >> 4;
-
-        const float *pEnd1 = pVect1 + (qty16 << 4);
-
-        __m256 diff, v1, v2;
-        __m256 sum = _mm256_set1_ps(0);
-
-        while (pVect1 < pEnd1) {
-            //_mm_prefetch((char*)(pVect2 + 16), _MM_HINT_T0);
-            v1 = _mm256_loadu_ps(pVect1);
-            pVect1 += 8;
-            v2 = _mm256_loadu_ps(pVect2);
-            pVect2 += 8;
-            diff = _mm256_sub_ps(v1, v2);
-            sum = _mm256_add_ps(sum, _mm256_mul_ps(diff, diff));
-
-            v1 = _mm256_loadu_ps(pVect1);
-            pVect1 += 8;
-            v2 = _mm256_loadu_ps(pVect2);
-            pVect2 += 8;
-            diff = _mm256_sub_ps(v1, v2);
-            sum = _mm256_add_ps(sum, _mm256_mul_ps(diff, diff));
-        }
-
-        _mm256_store_ps(TmpRes, sum);
-        float res = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3] + TmpRes[4] + TmpRes[5] + TmpRes[6] + TmpRes[7];
-
-        return (res);
-#else
-        // size_t qty4 = qty >> 2;
-        size_t qty16 = qty >> 4;
-
-        const float *pEnd1 = pVect1 + (qty16 << 4);
-        // const float* pEnd2 = pVect1 + (qty4 << 2);
-        // const float* pEnd3 = pVect1 + qty;
-
-        __m128 diff, v1, v2;
-        __m128 sum = _mm_set1_ps(0);
-
-        while (pVect1 < pEnd1) {
-            //_mm_prefetch((char*)(pVect2 + 16), _MM_HINT_T0);
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-        }
-
-        _mm_store_ps(TmpRes, sum);
-        float res = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-
-        return (res);
-#endif
+        // Kernels are chosen at runtime according to the instruction set supported by the CPU, TmpRes is no longer needed
+        return GetDistKernels().L2Sqr(pVect1, pVect2, qty);
     };
 
     float
     L2SqrSIMDExt(const float *pVect1, const float *pVect2, size_t &qty, float *TmpRes)
     {
-        size_t qty4 = qty >> 2;
-        size_t qty16 = qty >> 4;
-
-        const float *pEnd1 = pVect1 + (qty16 << 4);
-        const float *pEnd2 = pVect1 + (qty4 << 2);
-        const float *pEnd3 = pVect1 + qty;
-
-        __m128 diff, v1, v2;
-        __m128 sum = _mm_set1_ps(0);
-
-        while (pVect1 < pEnd1) {
-            //_mm_prefetch((char*)(pVect2 + 16), _MM_HINT_T0);
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-        }
-
-        while (pVect1 < pEnd2) {
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            diff = _mm_sub_ps(v1, v2);
-            sum = _mm_add_ps(sum, _mm_mul_ps(diff, diff));
-        }
-
-        _mm_store_ps(TmpRes, sum);
-        float res = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-
-        while (pVect1 < pEnd3) {
-            float diff = *pVect1++ - *pVect2++;
-            res += diff * diff;
-        }
-
-        return sqrt(res);
+        return sqrt(GetDistKernels().L2Sqr(pVect1, pVect2, qty));
     };
     float
     ScalarProductSIMD(const float *__restrict pVect1, const float *__restrict pVect2, size_t qty, float *__restrict TmpRes)
     {
-#ifdef USE_AVX
-        size_t qty16 = qty / 16;
-        size_t qty4 = qty / 4;
-
-        const float *pEnd1 = pVect1 + 16 * qty16;
-        const float *pEnd2 = pVect1 + 4 * qty4;
-
-        __m256 sum256 = _mm256_set1_ps(0);
-
-        while (pVect1 < pEnd1) {
-            //_mm_prefetch((char*)(pVect2 + 16), _MM_HINT_T0);
-
-            __m256 v1 = _mm256_loadu_ps(pVect1);
-            pVect1 += 8;
-            __m256 v2 = _mm256_loadu_ps(pVect2);
-            pVect2 += 8;
-            sum256 = _mm256_add_ps(sum256, _mm256_mul_ps(v1, v2));
-
-            v1 = _mm256_loadu_ps(pVect1);
-            pVect1 += 8;
-            v2 = _mm256_loadu_ps(pVect2);
-            pVect2 += 8;
-            sum256 = _mm256_add_ps(sum256, _mm256_mul_ps(v1, v2));
-        }
-
-        __m128 v1, v2;
-        __m128 sum_prod = _mm_add_ps(_mm256_extractf128_ps(sum256, 0), _mm256_extractf128_ps(sum256, 1));
-
-        while (pVect1 < pEnd2) {
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        }
-
-        _mm_store_ps(TmpRes, sum_prod);
-        float sum = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-        ;
-        return 1.0f - sum;
-// return std::max(0.0f, 1 - std::max(float(-1), std::min(float(1), sum)));
-#else
-        size_t qty16 = qty / 16;
-        size_t qty4 = qty / 4;
-
-        const float *pEnd1 = pVect1 + 16 * qty16;
-        const float *pEnd2 = pVect1 + 4 * qty4;
-
-        __m128 v1, v2;
-        __m128 sum_prod = _mm_set1_ps(0);
-
-        while (pVect1 < pEnd1) {
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        }
-
-        while (pVect1 < pEnd2) {
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-        }
-
-        _mm_store_ps(TmpRes, sum_prod);
-        float sum = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
+        float sum = GetDistKernels().Dot(pVect1, pVect2, qty);
 
         return std::max(0.0f, 1 - std::max(float(-1), std::min(float(1), sum)));
-#endif
     };
 
     float
     NormScalarProductSIMD(const float *pVect1, const float *pVect2, size_t &qty, float *TmpRes)
     {
-        size_t qty16 = qty / 16;
-        size_t qty4 = qty / 4;
-
-        const float *pEnd1 = pVect1 + 16 * qty16;
-        const float *pEnd2 = pVect1 + 4 * qty4;
-        const float *pEnd3 = pVect1 + qty;
-
-        __m128 v1, v2;
-        __m128 sum_prod = _mm_set1_ps(0);
-        __m128 sum_square1 = sum_prod;
-        __m128 sum_square2 = sum_prod;
-
-        while (pVect1 < pEnd1) {
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-            sum_square1 = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-            sum_square2 = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-            sum_square1 = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-            sum_square2 = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-            sum_square1 = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-            sum_square2 = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-            sum_square1 = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-            sum_square2 = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-        }
-
-        while (pVect1 < pEnd2) {
-            v1 = _mm_loadu_ps(pVect1);
-            pVect1 += 4;
-            v2 = _mm_loadu_ps(pVect2);
-            pVect2 += 4;
-            sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
-            sum_square1 = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
-            sum_square2 = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
-        }
-
-        _mm_store_ps(TmpRes, sum_prod);
-        float sum = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-        _mm_store_ps(TmpRes, sum_square1);
-        float norm1 = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-        _mm_store_ps(TmpRes, sum_square2);
-        float norm2 = TmpRes[0] + TmpRes[1] + TmpRes[2] + TmpRes[3];
-        while (pVect1 < pEnd3) {
-            sum += (*pVect1) * (*pVect2);
-            norm1 += (*pVect1) * (*pVect1);
-            norm2 += (*pVect2) * (*pVect2);
-
-            ++pVect1;
-            ++pVect2;
-        }
+        float sum, norm1, norm2;
+        GetDistKernels().DotNorms(pVect1, pVect2, qty, sum, norm1, norm2);
 
         const float eps = numeric_limits<float>::min() * 2;
 
@@ -372,6 +81,17 @@ namespace similarity {
         return std::max(0.0f, 1 - std::max(float(-1), std::min(float(1), sum / sqrt(norm1 * norm2))));
     };
 
+    // Prefetches the visited-list entry and the first prefetchLines_ cache lines of the data of an element
+    template <typename dist_t>
+    inline void
+    Hnsw<dist_t>::PrefetchElement(const VisitedList *vl, int id) const
+    {
+        vl->prefetch(id);
+        const char *elemData = data_level0_memory_ + id * memoryPerObject_ + offsetData_;
+        for (size_t line = 0; line < prefetchLines_; line++)
+            _mm_prefetch(elemData + line * 64, _MM_HINT_T0);
+    }
+
     /****************************************************************
 
     UNIVERSAL FUNCTION FOR CUSTOM DISTANCES
@@ -379,39 +99,38 @@ namespace similarity {
     ****************************************************************/
     template <typename dist_t>
     void
-    Hnsw<dist_t>::SearchL2CustomOld(KNNQuery<dist_t> *query)
+    Hnsw<dist_t>::SearchL2CustomOld(KNNQuery<dist_t> *query, size_t ef)
     {
         float *pVectq = (float *)((char *)query->QueryObject()->data());
         float PORTABLE_ALIGN32 TmpRes[8];
-        size_t qty = query->QueryObject()->datalength() >> 2;
+        size_t dataLength = query->QueryObject()->datalength();
+        size_t qty = dataLength >> 2;
 
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *massVisited = vl->mass;
-        vl_type currentV = vl->curV;
+        VisitedList *vl = GetVisitedList(ef);
+        QueryStats *stats = query->Stats();
 
         int maxlevel1 = maxlevel_;
         int curNodeNum = enterpointId_;
-        dist_t curdist = (fstdistfunc_(
-            pVectq, (float *)(data_level0_memory_ + enterpointId_ * memoryPerObject_ + offsetData_ + 16), qty, TmpRes));
+        dist_t curdist = fstDistance(
+            pVectq, data_level0_memory_ + enterpointId_ * memoryPerObject_ + offsetData_ + 16, qty, dataLength, TmpRes);
 
         for (int i = maxlevel1; i > 0; i--) {
             bool changed = true;
             while (changed) {
                 changed = false;
+                if (stats) stats->AddHop(i);
                 int *data = (int *)(linkLists_[curNodeNum] + (maxM_ + 1) * (i - 1) * sizeof(int));
                 int size = *data;
                 for (int j = 1; j <= size; j++) {
                     _mm_prefetch(data_level0_memory_ + (*(data + j)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
                 }
-#ifdef DIST_CALC
-                query->distance_computations_ += size;
-#endif
+                query->AddDistanceComputations(size);
 
                 for (int j = 1; j <= size; j++) {
                     int tnum = *(data + j);
 
-                    dist_t d = (fstdistfunc_(
-                        pVectq, (float *)(data_level0_memory_ + tnum * memoryPerObject_ + offsetData_ + 16), qty, TmpRes));
+                    dist_t d = fstDistance(
+                        pVectq, data_level0_memory_ + tnum * memoryPerObject_ + offsetData_ + 16, qty, dataLength, TmpRes);
                     if (d < curdist) {
                         curdist = d;
                         curNodeNum = tnum;
@@ -430,8 +149,10 @@ namespace similarity {
         closestDistQueuei.emplace(curdist, curNodeNum);
 
         // query->CheckAndAddToResult(curdist, new Object(data_level0_memory_ + (curNodeNum)*memoryPerObject_ + offsetData_));
-        query->CheckAndAddToResult(curdist, data_rearranged_[curNodeNum]);
-        massVisited[curNodeNum] = currentV;
+        if (!isDeleted(curNodeNum))
+            query->CheckAndAddToResult(curdist, data_rearranged_[curNodeNum]);
+        vl->markVisited(curNodeNum);
+        uint64_t distCompQty0 = query->DistanceComputations();
 
         while (!candidateQueuei.empty()) {
             EvaluatedMSWNodeInt<dist_t> currEv = candidateQueuei.top(); // This one was already compared to the query
@@ -443,77 +164,76 @@ namespace similarity {
 
             candidateQueuei.pop();
             curNodeNum = currEv.element;
+            if (stats) stats->AddHop(0);
             int *data = (int *)(data_level0_memory_ + curNodeNum * memoryPerObject_ + offsetLevel0_);
             int size = *data;
-            _mm_prefetch((char *)(massVisited + *(data + 1)), _MM_HINT_T0);
-            _mm_prefetch((char *)(massVisited + *(data + 1) + 64), _MM_HINT_T0);
+            vl->prefetch(*(data + 1));
             _mm_prefetch(data_level0_memory_ + (*(data + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
             _mm_prefetch((char *)(data + 2), _MM_HINT_T0);
 
             for (int j = 1; j <= size; j++) {
                 int tnum = *(data + j);
-                _mm_prefetch((char *)(massVisited + *(data + j + 1)), _MM_HINT_T0);
+                vl->prefetch(*(data + j + 1));
                 _mm_prefetch(data_level0_memory_ + (*(data + j + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
-                if (!(massVisited[tnum] == currentV)) {
-#ifdef DIST_CALC
-                    query->distance_computations_++;
-#endif
-                    massVisited[tnum] = currentV;
+                if (vl->markVisited(tnum)) {
+                    query->AddDistanceComputations(1);
                     char *currObj1 = (data_level0_memory_ + tnum * memoryPerObject_ + offsetData_);
-                    dist_t d = (fstdistfunc_(pVectq, (float *)(currObj1 + 16), qty, TmpRes));
-                    if (closestDistQueuei.top().getDistance() > d || closestDistQueuei.size() < ef_) {
+                    dist_t d = fstDistance(pVectq, currObj1 + 16, qty, dataLength, TmpRes);
+                    if (closestDistQueuei.top().getDistance() > d || closestDistQueuei.size() < ef) {
                         candidateQueuei.emplace(-d, tnum);
                         _mm_prefetch(data_level0_memory_ + candidateQueuei.top().element * memoryPerObject_ + offsetLevel0_,
                                      _MM_HINT_T0);
                         // query->CheckAndAddToResult(d, new Object(currObj1));
-                        query->CheckAndAddToResult(d, data_rearranged_[tnum]);
+                        if (!isDeleted(tnum))
+                            query->CheckAndAddToResult(d, data_rearranged_[tnum]);
                         closestDistQueuei.emplace(d, tnum);
 
-                        if (closestDistQueuei.size() > ef_) {
+                        if (closestDistQueuei.size() > ef) {
                             closestDistQueuei.pop();
                         }
                     }
                 }
             }
         }
+        // every node visited at level 0 (except the first one) requires a distance computation
+        if (stats) stats->visited_qty += 1 + query->DistanceComputations() - distCompQty0;
         visitedlistpool->releaseVisitedList(vl);
     }
 
     template <typename dist_t>
     void
-    Hnsw<dist_t>::SearchL2CustomV1Merge(KNNQuery<dist_t> *query)
+    Hnsw<dist_t>::SearchL2CustomV1Merge(KNNQuery<dist_t> *query, size_t ef)
     {
         float *pVectq = (float *)((char *)query->QueryObject()->data());
         float PORTABLE_ALIGN32 TmpRes[8];
-        size_t qty = query->QueryObject()->datalength() >> 2;
+        size_t dataLength = query->QueryObject()->datalength();
+        size_t qty = dataLength >> 2;
 
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *massVisited = vl->mass;
-        vl_type currentV = vl->curV;
+        VisitedList *vl = GetVisitedList(ef);
+        QueryStats *stats = query->Stats();
 
         int maxlevel1 = maxlevel_;
         int curNodeNum = enterpointId_;
-        dist_t curdist = (fstdistfunc_(
-            pVectq, (float *)(data_level0_memory_ + enterpointId_ * memoryPerObject_ + offsetData_ + 16), qty, TmpRes));
+        dist_t curdist = fstDistance(
+            pVectq, data_level0_memory_ + enterpointId_ * memoryPerObject_ + offsetData_ + 16, qty, dataLength, TmpRes);
 
         for (int i = maxlevel1; i > 0; i--) {
             bool changed = true;
             while (changed) {
                 changed = false;
+                if (stats) stats->AddHop(i);
                 int *data = (int *)(linkLists_[curNodeNum] + (maxM_ + 1) * (i - 1) * sizeof(int));
                 int size = *data;
                 for (int j = 1; j <= size; j++) {
                     _mm_prefetch(data_level0_memory_ + (*(data + j)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
                 }
-#ifdef DIST_CALC
-                query->distance_computations_ += size;
-#endif
+                query->AddDistanceComputations(size);
 
                 for (int j = 1; j <= size; j++) {
                     int tnum = *(data + j);
 
-                    dist_t d = (fstdistfunc_(
-                        pVectq, (float *)(data_level0_memory_ + tnum * memoryPerObject_ + offsetData_ + 16), qty, TmpRes));
+                    dist_t d = fstDistance(
+                        pVectq, data_level0_memory_ + tnum * memoryPerObject_ + offsetData_ + 16, qty, dataLength, TmpRes);
                     if (d < curdist) {
                         curdist = d;
                         curNodeNum = tnum;
@@ -523,7 +243,7 @@ namespace similarity {
             }
         }
 
-        SortArrBI<dist_t, int> sortedArr(max<size_t>(ef_, query->GetK()));
+        SortArrBI<dist_t, int> sortedArr(max<size_t>(ef, query->GetK()));
         sortedArr.push_unsorted_grow(curdist, curNodeNum);
 
         int_fast32_t currElem = 0;
@@ -532,38 +252,43 @@ namespace similarity {
         vector<QueueItem> &queueData = sortedArr.get_data();
         vector<QueueItem> itemBuff(1 + max(maxM_, maxM0_));
 
-        massVisited[curNodeNum] = currentV;
+        vl->markVisited(curNodeNum);
+        const int prefetchDepth = prefetchDepth_;
+        uint64_t distCompQty0 = query->DistanceComputations();
 
-        while (currElem < min(sortedArr.size(), ef_)) {
+        // See the comment in baseSearchAlgorithmV1Merge
+        const bool filtered = query->Filter() != nullptr || deletedQty_ != 0;
+        if (filtered && !isDeleted(curNodeNum)) query->CheckAndAddToResult(curdist, data_rearranged_[curNodeNum]);
+
+        while (currElem < min(sortedArr.size(), ef)) {
             auto &e = queueData[currElem];
             CHECK(!e.used);
             e.used = true;
             curNodeNum = e.data;
             ++currElem;
+            if (stats) stats->AddHop(0);
 
             size_t itemQty = 0;
             dist_t topKey = sortedArr.top_key();
 
             int *data = (int *)(data_level0_memory_ + curNodeNum * memoryPerObject_ + offsetLevel0_);
             int size = *data;
-            _mm_prefetch((char *)(massVisited + *(data + 1)), _MM_HINT_T0);
-            _mm_prefetch((char *)(massVisited + *(data + 1) + 64), _MM_HINT_T0);
-            _mm_prefetch(data_level0_memory_ + (*(data + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
+            // The first prefetchDepth neighbors are prefetched in advance
+            for (int j = 1; j <= min(size, prefetchDepth); j++)
+                PrefetchElement(vl, *(data + j));
             _mm_prefetch((char *)(data + 2), _MM_HINT_T0);
 
             for (int j = 1; j <= size; j++) {
                 int tnum = *(data + j);
-                _mm_prefetch((char *)(massVisited + *(data + j + 1)), _MM_HINT_T0);
-                _mm_prefetch(data_level0_memory_ + (*(data + j + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
-                if (!(massVisited[tnum] == currentV)) {
-#ifdef DIST_CALC
-                    query->distance_computations_++;
-#endif
-                    massVisited[tnum] = currentV;
+                if (prefetchDepth && j + prefetchDepth <= size)
+                    PrefetchElement(vl, *(data + j + prefetchDepth));
+                if (vl->markVisited(tnum)) {
+                    query->AddDistanceComputations(1);
                     char *currObj1 = (data_level0_memory_ + tnum * memoryPerObject_ + offsetData_);
-                    dist_t d = (fstdistfunc_(pVectq, (float *)(currObj1 + 16), qty, TmpRes));
+                    dist_t d = fstDistance(pVectq, currObj1 + 16, qty, dataLength, TmpRes);
+                    if (filtered && !isDeleted(tnum)) query->CheckAndAddToResult(d, data_rearranged_[tnum]);
 
-                    if (d < topKey || sortedArr.size() < ef_) {
+                    if (d < topKey || sortedArr.size() < ef) {
                         CHECK_MSG(itemBuff.size() > itemQty,
                                   "Perhaps a bug: buffer size is not enough " + 
                                    ConvertToString(itemQty) + " >= " + ConvertToString(itemBuff.size()));
@@ -598,12 +323,14 @@ namespace similarity {
                 ++currElem;
         }
 
-        for (int_fast32_t i = 0; i < query->GetK() && i < sortedArr.size(); ++i) {
+        for (int_fast32_t i = 0; !filtered && i < query->GetK() && i < sortedArr.size(); ++i) {
             int tnum = queueData[i].data;
             // char *currObj = (data_level0_memory_ + tnum*memoryPerObject_ + offsetData_);
             // query->CheckAndAddToResult(queueData[i].key, new Object(currObj));
             query->CheckAndAddToResult(queueData[i].key, data_rearranged_[tnum]);
         }
+        // every node visited at level 0 (except the first one) requires a distance computation
+        if (stats) stats->visited_qty += 1 + query->DistanceComputations() - distCompQty0;
         visitedlistpool->releaseVisitedList(vl);
     }
 
@@ -614,7 +341,7 @@ namespace similarity {
     ****************************************************************/
     template <typename dist_t>
     void
-    Hnsw<dist_t>::SearchCosineNormalizedOld(KNNQuery<dist_t> *query)
+    Hnsw<dist_t>::SearchCosineNormalizedOld(KNNQuery<dist_t> *query, size_t ef)
     {
         float *pVectq = (float *)((char *)query->QueryObject()->data());
         float PORTABLE_ALIGN32 TmpRes[8];
@@ -632,9 +359,8 @@ namespace similarity {
             }
         }
 
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *massVisited = vl->mass;
-        vl_type currentV = vl->curV;
+        VisitedList *vl = GetVisitedList(ef);
+        QueryStats *stats = query->Stats();
 
         int maxlevel1 = maxlevel_;
         int curNodeNum = enterpointId_;
@@ -645,14 +371,13 @@ namespace similarity {
             bool changed = true;
             while (changed) {
                 changed = false;
+                if (stats) stats->AddHop(i);
                 int *data = (int *)(linkLists_[curNodeNum] + (maxM_ + 1) * (i - 1) * sizeof(int));
                 int size = *data;
                 for (int j = 1; j <= size; j++) {
                     _mm_prefetch(data_level0_memory_ + (*(data + j)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
                 }
-#ifdef DIST_CALC
-                query->distance_computations_ += size;
-#endif
+                query->AddDistanceComputations(size);
 
                 for (int j = 1; j <= size; j++) {
                     int tnum = *(data + j);
@@ -677,8 +402,10 @@ namespace similarity {
         closestDistQueuei.emplace(curdist, curNodeNum);
 
         // query->CheckAndAddToResult(curdist, new Object(data_level0_memory_ + (curNodeNum)*memoryPerObject_ + offsetData_));
-        query->CheckAndAddToResult(curdist, data_rearranged_[curNodeNum]);
-        massVisited[curNodeNum] = currentV;
+        if (!isDeleted(curNodeNum))
+            query->CheckAndAddToResult(curdist, data_rearranged_[curNodeNum]);
+        vl->markVisited(curNodeNum);
+        uint64_t distCompQty0 = query->DistanceComputations();
 
         while (!candidateQueuei.empty()) {
             EvaluatedMSWNodeInt<dist_t> currEv = candidateQueuei.top(); // This one was already compared to the query
@@ -690,45 +417,45 @@ namespace similarity {
 
             candidateQueuei.pop();
             curNodeNum = currEv.element;
+            if (stats) stats->AddHop(0);
             int *data = (int *)(data_level0_memory_ + curNodeNum * memoryPerObject_ + offsetLevel0_);
             int size = *data;
-            _mm_prefetch((char *)(massVisited + *(data + 1)), _MM_HINT_T0);
-            _mm_prefetch((char *)(massVisited + *(data + 1) + 64), _MM_HINT_T0);
+            vl->prefetch(*(data + 1));
             _mm_prefetch(data_level0_memory_ + (*(data + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
             _mm_prefetch((char *)(data + 2), _MM_HINT_T0);
 
             for (int j = 1; j <= size; j++) {
                 int tnum = *(data + j);
-                _mm_prefetch((char *)(massVisited + *(data + j + 1)), _MM_HINT_T0);
+                vl->prefetch(*(data + j + 1));
                 _mm_prefetch(data_level0_memory_ + (*(data + j + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
-                if (!(massVisited[tnum] == currentV)) {
-#ifdef DIST_CALC
-                    query->distance_computations_++;
-#endif
-                    massVisited[tnum] = currentV;
+                if (vl->markVisited(tnum)) {
+                    query->AddDistanceComputations(1);
                     char *currObj1 = (data_level0_memory_ + tnum * memoryPerObject_ + offsetData_);
                     dist_t d = (ScalarProductSIMD(pVectq, (float *)(currObj1 + 16), qty, TmpRes));
-                    if (closestDistQueuei.top().getDistance() > d || closestDistQueuei.size() < ef_) {
+                    if (closestDistQueuei.top().getDistance() > d || closestDistQueuei.size() < ef) {
                         candidateQueuei.emplace(-d, tnum);
                         _mm_prefetch(data_level0_memory_ + candidateQueuei.top().element * memoryPerObject_ + offsetLevel0_,
                                      _MM_HINT_T0);
                         // query->CheckAndAddToResult(d, new Object(currObj1));
-                        query->CheckAndAddToResult(d, data_rearranged_[tnum]);
+                        if (!isDeleted(tnum))
+                            query->CheckAndAddToResult(d, data_rearranged_[tnum]);
                         closestDistQueuei.emplace(d, tnum);
 
-                        if (closestDistQueuei.size() > ef_) {
+                        if (closestDistQueuei.size() > ef) {
                             closestDistQueuei.pop();
                         }
                     }
                 }
             }
         }
+        // every node visited at level 0 (except the first one) requires a distance computation
+        if (stats) stats->visited_qty += 1 + query->DistanceComputations() - distCompQty0;
         visitedlistpool->releaseVisitedList(vl);
     }
 
     template <typename dist_t>
     void
-    Hnsw<dist_t>::SearchCosineNormalizedV1Merge(KNNQuery<dist_t> *query)
+    Hnsw<dist_t>::SearchCosineNormalizedV1Merge(KNNQuery<dist_t> *query, size_t ef)
     {
         float *pVectq = (float *)((char *)query->QueryObject()->data());
         float PORTABLE_ALIGN32 TmpRes[8];
@@ -746,9 +473,8 @@ namespace similarity {
             }
         }
 
-        VisitedList *vl = visitedlistpool->getFreeVisitedList();
-        vl_type *massVisited = vl->mass;
-        vl_type currentV = vl->curV;
+        VisitedList *vl = GetVisitedList(ef);
+        QueryStats *stats = query->Stats();
 
         int maxlevel1 = maxlevel_;
         int curNodeNum = enterpointId_;
@@ -759,14 +485,13 @@ namespace similarity {
             bool changed = true;
             while (changed) {
                 changed = false;
+                if (stats) stats->AddHop(i);
                 int *data = (int *)(linkLists_[curNodeNum] + (maxM_ + 1) * (i - 1) * sizeof(int));
                 int size = *data;
                 for (int j = 1; j <= size; j++) {
                     _mm_prefetch(data_level0_memory_ + (*(data + j)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
                 }
-#ifdef DIST_CALC
-                query->distance_computations_ += size;
-#endif
+                query->AddDistanceComputations(size);
 
                 for (int j = 1; j <= size; j++) {
                     int tnum = *(data + j);
@@ -782,7 +507,7 @@ namespace similarity {
             }
         }
 
-        SortArrBI<dist_t, int> sortedArr(max<size_t>(ef_, query->GetK()));
+        SortArrBI<dist_t, int> sortedArr(max<size_t>(ef, query->GetK()));
         sortedArr.push_unsorted_grow(curdist, curNodeNum);
 
         int_fast32_t currElem = 0;
@@ -791,38 +516,43 @@ namespace similarity {
         vector<QueueItem> &queueData = sortedArr.get_data();
         vector<QueueItem> itemBuff(1 + max(maxM_, maxM0_));
 
-        massVisited[curNodeNum] = currentV;
+        vl->markVisited(curNodeNum);
+        const int prefetchDepth = prefetchDepth_;
+        uint64_t distCompQty0 = query->DistanceComputations();
+
+        // See the comment in baseSearchAlgorithmV1Merge
+        const bool filtered = query->Filter() != nullptr || deletedQty_ != 0;
+        if (filtered && !isDeleted(curNodeNum)) query->CheckAndAddToResult(curdist, data_rearranged_[curNodeNum]);
 
-        while (currElem < min(sortedArr.size(), ef_)) {
+        while (currElem < min(sortedArr.size(), ef)) {
             auto &e = queueData[currElem];
             CHECK(!e.used);
             e.used = true;
             curNodeNum = e.data;
             ++currElem;
+            if (stats) stats->AddHop(0);
 
             size_t itemQty = 0;
             dist_t topKey = sortedArr.top_key();
 
             int *data = (int *)(data_level0_memory_ + curNodeNum * memoryPerObject_ + offsetLevel0_);
             int size = *data;
-            _mm_prefetch((char *)(massVisited + *(data + 1)), _MM_HINT_T0);
-            _mm_prefetch((char *)(massVisited + *(data + 1) + 64), _MM_HINT_T0);
-            _mm_prefetch(data_level0_memory_ + (*(data + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
+            // The first prefetchDepth neighbors are prefetched in advance
+            for (int j = 1; j <= min(size, prefetchDepth); j++)
+                PrefetchElement(vl, *(data + j));
             _mm_prefetch((char *)(data + 2), _MM_HINT_T0);
 
             for (int j = 1; j <= size; j++) {
                 int tnum = *(data + j);
-                _mm_prefetch((char *)(massVisited + *(data + j + 1)), _MM_HINT_T0);
-                _mm_prefetch(data_level0_memory_ + (*(data + j + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
-                if (!(massVisited[tnum] == currentV)) {
-#ifdef DIST_CALC
-                    query->distance_computations_++;
-#endif
-                    massVisited[tnum] = currentV;
+                if (prefetchDepth && j + prefetchDepth <= size)
+                    PrefetchElement(vl, *(data + j + prefetchDepth));
+                if (vl->markVisited(tnum)) {
+                    query->AddDistanceComputations(1);
                     char *currObj1 = (data_level0_memory_ + tnum * memoryPerObject_ + offsetData_);
                     dist_t d = (ScalarProductSIMD(pVectq, (float *)(currObj1 + 16), qty, TmpRes));
+                    if (filtered && !isDeleted(tnum)) query->CheckAndAddToResult(d, data_rearranged_[tnum]);
 
-                    if (d < topKey || sortedArr.size() < ef_) {
+                    if (d < topKey || sortedArr.size() < ef) {
                         CHECK_MSG(itemBuff.size() > itemQty,
                                   "Perhaps a bug: buffer size is not enough " + 
                                   ConvertToString(itemQty) + " >= " + ConvertToString(itemBuff.size()));
@@ -858,13 +588,194 @@ namespace similarity {
                 ++currElem;
         }
 
-        for (int_fast32_t i = 0; i < query->GetK() && i < sortedArr.size(); ++i) {
+        for (int_fast32_t i = 0; !filtered && i < query->GetK() && i < sortedArr.size(); ++i) {
             int tnum = queueData[i].data;
             // char *currObj = (data_level0_memory_ + tnum*memoryPerObject_ + offsetData_);
             // query->CheckAndAddToResult(queueData[i].key, new Object(currObj));
             query->CheckAndAddToResult(queueData[i].key, data_rearranged_[tnum]);
         }
+        // every node visited at level 0 (except the first one) requires a distance computation
+        if (stats) stats->visited_qty += 1 + query->DistanceComputations() - distCompQty0;
+        visitedlistpool->releaseVisitedList(vl);
+    }
+
+    /****************************************************************
+
+    Search function for the quantized index (cosine+L2)
+
+    ****************************************************************/
+    /*
+     * The graph is traversed using distances between codes. All visited elements that
+     * can be returned (i.e., they aren't deleted or filtered out) are candidates, and the
+     * closest max(ef, k) candidates are re-ranked using exact distances.
+     * Scalar codes are compared using integer distances, PQ codes are compared
+     * using the (float) distance table of the query.
+     */
+    template <typename dist_t>
+    void
+    Hnsw<dist_t>::SearchQuantized(KNNQuery<dist_t> *query, size_t ef)
+    {
+        const float *pVectq = (const float *)query->QueryObject()->data();
+        size_t qty = query->QueryObject()->datalength() >> 2;
+
+        if (pq_) {
+            CHECK_MSG(qty == vectorlength_,
+                      "The dimensionality of the query doesn't match the dimensionality of the data");
+            vector<float> table;
+            pq_->ComputeDistanceTable(pVectq, table);
+            SearchQuantizedCodes<float>(query, ef, [&](const uint8_t *code) {
+                return pq_->TableDistance(table, code);
+            });
+        } else {
+            vector<uint8_t> queryCode(vectorlength_);
+            EncodeQuery(pVectq, qty, &queryCode[0]);
+            const uint8_t *pCodeq = &queryCode[0];
+            const size_t codeLength = vectorlength_;
+            int32_t (*l2SqrUInt8)(const uint8_t *, const uint8_t *, size_t) = GetDistKernels().L2SqrUInt8;
+            SearchQuantizedCodes<int32_t>(query, ef, [&](const uint8_t *code) {
+                return l2SqrUInt8(pCodeq, code, codeLength);
+            });
+        }
+    }
+
+    template <typename dist_t>
+    template <typename KeyType, typename CodeDistFunc>
+    void
+    Hnsw<dist_t>::SearchQuantizedCodes(KNNQuery<dist_t> *query, size_t ef, CodeDistFunc codeDist)
+    {
+        float *pVectq = (float *)((char *)query->QueryObject()->data());
+        float PORTABLE_ALIGN32 TmpRes[8];
+        size_t qty = query->QueryObject()->datalength() >> 2;
+
+        VisitedList *vl = GetVisitedList(ef);
+        QueryStats *stats = query->Stats();
+
+        int maxlevel1 = maxlevel_;
+        int curNodeNum = enterpointId_;
+        KeyType curdist = codeDist((uint8_t *)(data_level0_memory_ + enterpointId_ * memoryPerObject_ + offsetData_));
+
+        for (int i = maxlevel1; i > 0; i--) {
+            bool changed = true;
+            while (changed) {
+                changed = false;
+                if (stats) stats->AddHop(i);
+                int *data = (int *)(linkLists_[curNodeNum] + (maxM_ + 1) * (i - 1) * sizeof(int));
+                int size = *data;
+                for (int j = 1; j <= size; j++) {
+                    _mm_prefetch(data_level0_memory_ + (*(data + j)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
+                }
+                query->AddDistanceComputations(size);
+
+                for (int j = 1; j <= size; j++) {
+                    int tnum = *(data + j);
+
+                    KeyType d = codeDist((uint8_t *)(data_level0_memory_ + tnum * memoryPerObject_ + offsetData_));
+                    if (d < curdist) {
+                        curdist = d;
+                        curNodeNum = tnum;
+                        changed = true;
+                    }
+                }
+            }
+        }
+
+        const size_t candQty = max<size_t>(ef, query->GetK());
+        SortArrBI<KeyType, int> sortedArr(candQty);
+        sortedArr.push_unsorted_grow(curdist, curNodeNum);
+
+        // The closest candidates to re-rank
+        priority_queue<pair<KeyType, int>> candidates;
+        auto addCandidate = [&](KeyType d, int tnum) {
+            if (isDeleted(tnum) || !query->IsAllowed(data_rearranged_[tnum]))
+                return;
+            if (candidates.size() < candQty || d < candidates.top().first) {
+                candidates.emplace(d, tnum);
+                if (candidates.size() > candQty)
+                    candidates.pop();
+            }
+        };
+
+        int_fast32_t currElem = 0;
+
+        typedef typename SortArrBI<KeyType, int>::Item QueueItem;
+        vector<QueueItem> &queueData = sortedArr.get_data();
+        vector<QueueItem> itemBuff(1 + max(maxM_, maxM0_));
+
+        vl->markVisited(curNodeNum);
+        uint64_t distCompQty0 = query->DistanceComputations();
+        addCandidate(curdist, curNodeNum);
+
+        while (currElem < min(sortedArr.size(), ef)) {
+            auto &e = queueData[currElem];
+            CHECK(!e.used);
+            e.used = true;
+            curNodeNum = e.data;
+            ++currElem;
+            if (stats) stats->AddHop(0);
+
+            size_t itemQty = 0;
+            KeyType topKey = sortedArr.top_key();
+
+            int *data = (int *)(data_level0_memory_ + curNodeNum * memoryPerObject_ + offsetLevel0_);
+            int size = *data;
+            vl->prefetch(*(data + 1));
+            _mm_prefetch(data_level0_memory_ + (*(data + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
+            _mm_prefetch((char *)(data + 2), _MM_HINT_T0);
+
+            for (int j = 1; j <= size; j++) {
+                int tnum = *(data + j);
+                vl->prefetch(*(data + j + 1));
+                _mm_prefetch(data_level0_memory_ + (*(data + j + 1)) * memoryPerObject_ + offsetData_, _MM_HINT_T0);
+                if (vl->markVisited(tnum)) {
+                    query->AddDistanceComputations(1);
+                    uint8_t *currCode = (uint8_t *)(data_level0_memory_ + tnum * memoryPerObject_ + offsetData_);
+                    KeyType d = codeDist(currCode);
+                    addCandidate(d, tnum);
+
+                    if (d < topKey || sortedArr.size() < ef) {
+                        CHECK_MSG(itemBuff.size() > itemQty,
+                                  "Perhaps a bug: buffer size is not enough " +
+                                   ConvertToString(itemQty) + " >= " + ConvertToString(itemBuff.size()));
+                        itemBuff[itemQty++] = QueueItem(d, tnum);
+                    }
+                }
+            }
+            if (itemQty) {
+                _mm_prefetch(const_cast<const char *>(reinterpret_cast<char *>(&itemBuff[0])), _MM_HINT_T0);
+                std::sort(itemBuff.begin(), itemBuff.begin() + itemQty);
+
+                size_t insIndex = 0;
+                if (itemQty > MERGE_BUFFER_ALGO_SWITCH_THRESHOLD) {
+                    insIndex = sortedArr.merge_with_sorted_items(&itemBuff[0], itemQty);
+
+                    if (insIndex < currElem) {
+                        currElem = insIndex;
+                    }
+                } else {
+                    for (size_t ii = 0; ii < itemQty; ++ii) {
+                        size_t insIndex = sortedArr.push_or_replace_non_empty_exp(itemBuff[ii].key, itemBuff[ii].data);
+                        if (insIndex < currElem) {
+                            currElem = insIndex;
+                        }
+                    }
+                }
+                _mm_prefetch(data_level0_memory_ + sortedArr.top_item().data * memoryPerObject_ + offsetLevel0_, _MM_HINT_T0);
+            }
+            // To ensure that we either reach the end of the unexplored queue or currElem points to the first unused element
+            while (currElem < sortedArr.size() && queueData[currElem].used == true)
+                ++currElem;
+        }
+        // every node visited at level 0 (except the first one) requires a distance computation
+        if (stats) stats->visited_qty += 1 + query->DistanceComputations() - distCompQty0;
         visitedlistpool->releaseVisitedList(vl);
+
+        query->AddDistanceComputations(candidates.size());
+        while (!candidates.empty()) {
+            int tnum = candidates.top().second;
+            candidates.pop();
+            dist_t d = fstdistfunc_(pVectq, (const float *)data_rearranged_[tnum]->data(), qty, TmpRes);
+            query->CheckAndAddToResult(d, data_rearranged_[tnum]);
+        }
     }
 
     template class Hnsw<float>;
@@ -30,6 +30,7 @@
 #include "incremental_quick_select.h"
 #include "method/pivot_neighb_invindx.h"
 #include "utils.h"
+#include "thread_pool.h"
 
 #include "falconn_heap_mod.h"
 
@@ -39,43 +40,6 @@ using std::vector;
 using std::pair;
 using std::mutex;
 
-template <typename dist_t>
-struct IndexThreadParamsPNII {
-  PivotNeighbInvertedIndex<dist_t>&           index_;
-  size_t                                      chunk_qty_;
-  size_t                                      index_every_;
-  size_t                                      out_of_;
-  ProgressDisplay*                            progress_bar_;
-  mutex&                                      display_mutex_;
-
-  IndexThreadParamsPNII(
-                     PivotNeighbInvertedIndex<dist_t>&  index,
-                     size_t                             chunk_qty,
-                     size_t                             index_every,
-                     size_t                             out_of,
-                     ProgressDisplay*                   progress_bar,
-                     mutex&                             display_mutex
-                      ) :
-                     index_(index),
-                     chunk_qty_(chunk_qty),
-                     index_every_(index_every),
-                     out_of_(out_of),
-                     progress_bar_(progress_bar),
-                     display_mutex_(display_mutex)
-                     { }
-};
-
-template <typename dist_t>
-struct IndexThreadPNII {
-  void operator()(IndexThreadParamsPNII<dist_t>& prm) {
-    for (size_t i = 0; i < prm.chunk_qty_; ++i) {
-      if (prm.index_every_ == i % prm.out_of_) {
-        prm.index_.IndexChunk(i, prm.progress_bar_, prm.display_mutex_);
-      }
-    }
-  }
-};
-
 template <typename dist_t>
 PivotNeighbInvertedIndex<dist_t>::PivotNeighbInvertedIndex(
     bool  PrintProgress,
@@ -173,28 +137,15 @@ void PivotNeighbInvertedIndex<dist_t>::CreateIndex(const AnyParams& IndexParams)
       (*progress_bar) += (progress_bar->expected_count() - progress_bar->count());
     }
   } else {
-    vector<thread>                                      threads(index_thread_qty_);
-    vector<shared_ptr<IndexThreadParamsPNII<dist_t>>>   threadParams;
-
-    LOG(LIB_INFO) << "Will create " << index_thread_qty_ << " indexing threads";;
+    LOG(LIB_INFO) << "Will use " << index_thread_qty_ << " indexing threads";;
 
     unique_ptr<ProgressDisplay> progress_bar(PrintProgress_ ?
                                 new ProgressDisplay(this->data_.size(), cerr)
                                 :NULL);
 
-    for (size_t i = 0; i < index_thread_qty_; ++i) {
-      threadParams.push_back(shared_ptr<IndexThreadParamsPNII<dist_t>>(
-                              new IndexThreadParamsPNII<dist_t>(*this, indexQty, i, index_thread_qty_,
-                                                               progress_bar.get(), progressBarMutex)));
-    }
-
-    for (size_t i = 0; i < index_thread_qty_; ++i) {
-      threads[i] = thread(IndexThreadPNII<dist_t>(), ref(*threadParams[i]));
-    }
-
-    for (size_t i = 0; i < index_thread_qty_; ++i) {
-      threads[i].join();
-    }
+    ParallelFor(0, indexQty, index_thread_qty_, [&](size_t chunkId, size_t threadId) {
+      IndexChunk(chunkId, progress_bar.get(), progressBarMutex);
+    });
 
     if (progress_bar) {
       (*progress_bar) += (progress_bar->expected_count() - progress_bar->count());
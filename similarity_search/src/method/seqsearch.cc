@@ -12,6 +12,8 @@
  * Apache License Version 2.0 http://www.apache.org/licenses/.
  *
  */
+#include <cmath>
+#include <queue>
 #include <thread>
 
 #include "space.h"
@@ -19,6 +21,7 @@
 #include "knnquery.h"
 #include "knnqueue.h"
 #include "method/seqsearch.h"
+#include "thread_pool.h"
 
 namespace similarity {
 
@@ -96,6 +99,34 @@ void SeqSearch<dist_t>::CreateIndex(const AnyParams& IndexParams) {
   if (bCopyMem) {
     CreateCacheOptimizedBucket(this->data_, cacheOptimizedBucket_, pData_);
   }
+
+  pq_.reset(space_.CreateProductQuantizer());
+  const ObjectVector& data = getData();
+  if (pq_ && !data.empty()) {
+    size_t dataLength = data[0]->datalength();
+    vector<const float*> vects(data.size());
+    for (size_t i = 0; i < data.size(); ++i) {
+      CHECK_MSG(data[i]->datalength() == dataLength, "PQ requires vectors of the same dimensionality");
+      vects[i] = reinterpret_cast<const float*>(data[i]->data());
+    }
+    pq_->Train(vects, dataLength / sizeof(float));
+
+    size_t codeSize = pq_->GetCodeSize();
+    pqCodes_.resize(codeSize * data.size());
+    ParallelFor(0, data.size(), 0, [&](size_t i, size_t threadId) {
+      pq_->Encode(vects[i], &pqCodes_[i * codeSize]);
+    });
+    LOG(LIB_INFO) << "PQ codes size: " << (pqCodes_.size() >> 20) << " Mb";
+  }
+}
+
+template <typename dist_t>
+void SeqSearch<dist_t>::SetQueryTimeParams(const AnyParams& params) {
+  // Without PQ there are no query-time parameters: they are ignored as before
+  if (!pq_) return;
+  AnyParamManager pmgr(params);
+  pmgr.GetParamOptional("rerankQty", rerankQty_, 100);
+  pmgr.CheckUnused();
 }
 
 template <typename dist_t>
@@ -140,10 +171,50 @@ void SeqSearch<dist_t>::Search(RangeQuery<dist_t>* query, IdType) const {
   }
 }
 
+template <typename dist_t>
+void SeqSearch<dist_t>::SearchPQ(KNNQuery<dist_t>* query) const {
+  const ObjectVector& data = getData();
+  const Object* queryObj = query->QueryObject();
+  CHECK_MSG(queryObj->datalength() == pq_->GetDim() * sizeof(float),
+            "The dimensionality of the query doesn't match the dimensionality of the data");
+
+  vector<float> table;
+  pq_->ComputeDistanceTable(reinterpret_cast<const float*>(queryObj->data()), table);
+
+  // The closest candidates (by approximate distances)
+  size_t candQty = std::max<size_t>(rerankQty_, query->GetK());
+  std::priority_queue<std::pair<float, size_t>> candidates;
+  size_t codeSize = pq_->GetCodeSize();
+  for (size_t i = 0; i < data.size(); ++i) {
+    if (!query->IsAllowed(data[i])) continue;
+    float d = pq_->TableDistance(table, &pqCodes_[i * codeSize]);
+    if (candidates.size() < candQty || d < candidates.top().first) {
+      candidates.emplace(d, i);
+      if (candidates.size() > candQty) candidates.pop();
+    }
+  }
+
+  while (!candidates.empty()) {
+    const Object* obj = data[candidates.top().second];
+    if (rerankQty_) {
+      query->CheckAndAddToResult(obj);
+    } else {
+      // TableDistance is the squared Euclidean distance
+      query->CheckAndAddToResult(static_cast<dist_t>(std::sqrt(candidates.top().first)), obj);
+    }
+    candidates.pop();
+  }
+}
+
 template <typename dist_t>
 void SeqSearch<dist_t>::Search(KNNQuery<dist_t>* query, IdType) const {
   const ObjectVector& data = getData();
 
+  if (pq_ && !pqCodes_.empty()) {
+    SearchPQ(query);
+    return;
+  }
+
   if (!multiThread_) {
     for (size_t i = 0; i < data.size(); ++i) {
       query->CheckAndAddToResult(data[i]);
@@ -46,71 +46,6 @@ namespace similarity {
 
 using namespace std;
 
-template <typename dist_t>
-struct IndexThreadParamsSW {
-  const Space<dist_t>&                        space_;
-  SmallWorldRand<dist_t>&                     index_;
-  IdType                                      startNodeId_;
-  const ObjectVector&                         batchData_;
-  size_t                                      index_every_;
-  size_t                                      out_of_;
-  ProgressDisplay*                            progress_bar_;
-  mutex&                                      display_mutex_;
-  size_t                                      progress_update_qty_;
-  
-  IndexThreadParamsSW(
-                     const Space<dist_t>&             space,
-                     SmallWorldRand<dist_t>&          index, 
-                     IdType                           startNodeId,
-                     const ObjectVector&              batchData,
-                     size_t                           index_every,
-                     size_t                           out_of,
-                     ProgressDisplay*                 progress_bar,
-                     mutex&                           display_mutex,
-                     size_t                           progress_update_qty
-                      ) : 
-                     space_(space),
-                     index_(index), 
-                     startNodeId_(startNodeId),
-                     batchData_(batchData),
-                     index_every_(index_every),
-                     out_of_(out_of),
-                     progress_bar_(progress_bar),
-                     display_mutex_(display_mutex),
-                     progress_update_qty_(progress_update_qty)
-                     { }
-};
-
-template <typename dist_t>
-struct IndexThreadSW {
-  void operator()(IndexThreadParamsSW<dist_t>& prm) {
-    ProgressDisplay*  progress_bar = prm.progress_bar_;
-    mutex&            display_mutex(prm.display_mutex_); 
-    /* 
-     * Skip the first element, it was added already in the AddBatch
-     */
-    size_t futureNextNodeId = prm.startNodeId_ + prm.batchData_.size();
-
-    size_t nextQty = prm.progress_update_qty_;
-    for (size_t id = 1; id < prm.batchData_.size(); ++id) {
-      if (prm.index_every_ == id % prm.out_of_) {
-        MSWNode* node = new MSWNode(prm.batchData_[id], id + prm.startNodeId_);
-        prm.index_.add(node, futureNextNodeId);
-      
-        if ((id + 1 >= min(prm.batchData_.size(), nextQty)) && progress_bar) {
-          unique_lock<mutex> lock(display_mutex);
-          (*progress_bar) += (nextQty - progress_bar->count());
-          nextQty += prm.progress_update_qty_;
-        }
-      }
-    }
-    if (progress_bar) {
-      unique_lock<mutex> lock(display_mutex);
-      (*progress_bar) += (progress_bar->expected_count() - progress_bar->count());
-    }
-  }
-};
-
 template <typename dist_t>
 SmallWorldRand<dist_t>::SmallWorldRand(bool PrintProgress,
                                        const Space<dist_t>& space,
@@ -121,6 +56,22 @@ template <typename dist_t>
 void SmallWorldRand<dist_t>::UpdateNextNodeId(size_t newNextNodeId)
 {
   NextNodeId_ = newNextNodeId;
+  visitedListPool_.reset(new VisitedListPool(NextNodeId_));
+}
+
+template <typename dist_t>
+VisitedList* SmallWorldRand<dist_t>::GetVisitedList(size_t efSearch) const
+{
+  // A search visits roughly efSearch nodes and computes distances to their neighbors
+  size_t expectedQty = efSearch * NN_;
+  bool useHash = useVisitedHash(visitedListPool_->getNumElements(), expectedQty);
+  return visitedListPool_->getFreeVisitedList(useHash ? 2 * expectedQty : 0);
+}
+
+template <typename dist_t>
+size_t SmallWorldRand<dist_t>::GetVisitedListMemory() const
+{
+  return visitedListPool_ ? visitedListPool_->getMemoryUsage() : 0;
 }
 
 template <typename dist_t>
@@ -181,22 +132,18 @@ void SmallWorldRand<dist_t>::AddBatch(const ObjectVector& batchData,
       if (progress_bar) ++(*progress_bar);
     }
   } else {
-    vector<thread>                                    threads(indexThreadQty_);
-    vector<shared_ptr<IndexThreadParamsSW<dist_t>>>   threadParams; 
     mutex                                             progressBarMutex;
 
-    for (size_t i = 0; i < indexThreadQty_; ++i) {
-      threadParams.push_back(shared_ptr<IndexThreadParamsSW<dist_t>>(
-                              new IndexThreadParamsSW<dist_t>(space_, *this, NextNodeId_, 
-                                                              batchData, 
-                                                              i, indexThreadQty_,
-                                                              progress_bar.get(), progressBarMutex, 200)));
-    }
-    for (size_t i = 0; i < indexThreadQty_; ++i) {
-      threads[i] = thread(IndexThreadSW<dist_t>(), ref(*threadParams[i]));
-    }
-    for (size_t i = 0; i < indexThreadQty_; ++i) {
-      threads[i].join();
+    ParallelFor(start_add, batchData.size(), indexThreadQty_, [&](size_t id, size_t threadId) {
+      MSWNode* node = new MSWNode(batchData[id], id + NextNodeId_);
+      add(node, futureNextNodeId);
+      if (progress_bar) {
+        unique_lock<mutex> lock(progressBarMutex);
+        ++(*progress_bar);
+      }
+    });
+    if (progress_bar) {
+      (*progress_bar) += (progress_bar->expected_count() - progress_bar->count());
     }
     LOG(LIB_INFO) << indexThreadQty_ << " indexing threads have finished";
   }
@@ -263,7 +210,6 @@ void SmallWorldRand<dist_t>::DeleteBatch(const vector<IdType>& batchData, int de
   queue<MSWNode*> toPatchQueue;
   for (MSWNode* node : vToPatchNodes) toPatchQueue.push(node);
   mutex mtx;
-  vector<thread> threads;
 
   if (indexThreadQty_ <= 1) {
     LOG(LIB_INFO) << "Single threaded batch delete: " << vToPatchNodes.size();
@@ -276,20 +222,13 @@ void SmallWorldRand<dist_t>::DeleteBatch(const vector<IdType>& batchData, int de
     }
 
   } else {
-    for (size_t i = 0; i < indexThreadQty_; ++i) {
-      threads.push_back(thread(
-        [&]() {
-          MSWNode* node = nullptr;
-          vector<MSWNode*> cacheDelNode;
-          while(GetNextQueueObj(mtx, toPatchQueue, node)) {
-            if (kNone == patchStrat) node->removeGivenFriends(delNodesBitset);
-            else node->removeGivenFriendsPatchWithClosestNeighbor<dist_t>(space_, use_proxy_dist_,
-                                                                          delNodesBitset, cacheDelNode);
-          }
-        }
-      ));
-    }
-    for (auto& thread : threads) thread.join();
+    vector<vector<MSWNode*>> cacheDelNodes(indexThreadQty_);
+    ParallelFor(0, vToPatchNodes.size(), indexThreadQty_, [&](size_t i, size_t threadId) {
+      MSWNode* node = vToPatchNodes[i];
+      if (kNone == patchStrat) node->removeGivenFriends(delNodesBitset);
+      else node->removeGivenFriendsPatchWithClosestNeighbor<dist_t>(space_, use_proxy_dist_,
+                                                                    delNodesBitset, cacheDelNodes[threadId]);
+    });
   }
 
   if (checkIDs) {
@@ -416,18 +355,21 @@ SmallWorldRand<dist_t>::SetQueryTimeParams(const AnyParams& QueryTimeParams) {
   string tmp;
   //pmgr.GetParamOptional("algoType", tmp, "v1merge");
   pmgr.GetParamOptional("algoType", tmp, "old");
-  ToLower(tmp);
-  if (tmp == "v1merge") searchAlgoType_ = kV1Merge;
-  else if (tmp == "old") searchAlgoType_ = kOld;
-  else {
-    throw runtime_error("algoType should be one of the following: old, v1merge");
-  }
+  searchAlgoType_ = ParseAlgoType(tmp);
   pmgr.CheckUnused();
   LOG(LIB_INFO) << "Set SmallWorldRand query-time parameters:";
   LOG(LIB_INFO) << "efSearch           =" << efSearch_;
   LOG(LIB_INFO) << "algoType           =" << searchAlgoType_;
 }
 
+template <typename dist_t>
+typename SmallWorldRand<dist_t>::AlgoType SmallWorldRand<dist_t>::ParseAlgoType(string algoType) {
+  ToLower(algoType);
+  if (algoType == "v1merge") return kV1Merge;
+  else if (algoType == "old") return kOld;
+  throw runtime_error("algoType should be one of the following: old, v1merge");
+}
+
 template <typename dist_t>
 const std::string SmallWorldRand<dist_t>::StrDesc() const {
   return METH_SMALL_WORLD_RAND;
@@ -606,41 +548,57 @@ void SmallWorldRand<dist_t>::Search(RangeQuery<dist_t>* query, IdType) const {
 
 template <typename dist_t>
 void SmallWorldRand<dist_t>::Search(KNNQuery<dist_t>* query, IdType) const {
-  if (searchAlgoType_ == kV1Merge) SearchV1Merge(query);
-  else SearchOld(query);
+  // per-query overrides take precedence over the index-wide settings
+  size_t efSearch = efSearch_;
+  AlgoType algoType = searchAlgoType_;
+  const QueryTimeParams* params = query->QueryParams();
+  if (params) {
+    if (params->efSearch) efSearch = params->efSearch;
+    if (!params->algoType.empty()) algoType = ParseAlgoType(params->algoType);
+  }
+  uint64_t distCompQty = query->DistanceComputations();
+  if (algoType == kV1Merge) SearchV1Merge(query, efSearch);
+  else SearchOld(query, efSearch);
+  // each visited node requires exactly one distance computation
+  QueryStats* stats = query->Stats();
+  if (stats) stats->visited_qty += query->DistanceComputations() - distCompQty;
 }
 
 template <typename dist_t>
-void SmallWorldRand<dist_t>::SearchV1Merge(KNNQuery<dist_t>* query) const {
+void SmallWorldRand<dist_t>::SearchV1Merge(KNNQuery<dist_t>* query, size_t efSearch) const {
   if (ElList_.empty()) return;
-  CHECK_MSG(efSearch_ > 0, "efSearch should be > 0");
+  CHECK_MSG(efSearch > 0, "efSearch should be > 0");
 /*
- * The trick of using large dense bitsets instead of unordered_set was
- * borrowed from Wei Dong's kgraph: https://github.com/aaalgo/kgraph
- *
- * This trick works really well even in a multi-threaded mode. Indeed, the amount
- * of allocated memory is small. For example, if one has 8M entries, the size of
- * the bitmap is merely 1 MB. Furthermore, setting 1MB of entries to zero via memset would take only
- * a fraction of millisecond.
+ * Visited lists are taken from the pool: they are arrays (cleared only once in 255 searches)
+ * unless the index is so large that a hash table of the visited nodes is much smaller.
  */
-  vector<bool>                        visitedBitset(NextNodeId_);
+  VisitedList*                        vl = GetVisitedList(efSearch);
 
   /**
    * Search of most k-closest elements to the query.
    */
   MSWNode* currNode = pEntryPoint_;
   CHECK_MSG(currNode != nullptr, "Bug: there is not entry point set!")
+  QueryStats* stats = query->Stats();
 
-  SortArrBI<dist_t,MSWNode*> sortedArr(max<size_t>(efSearch_, query->GetK()));
+  SortArrBI<dist_t,MSWNode*> sortedArr(max<size_t>(efSearch, query->GetK()));
 
   const Object* currObj = currNode->getData();
   dist_t d = query->DistanceObjLeft(currObj);
   sortedArr.push_unsorted_grow(d, currNode); // It won't grow
 
+  /*
+   * With a filter, the top-K of the candidate buffer may contain few (or no) allowed
+   * objects. Thus, every evaluated object is offered to the result set instead
+   * (CheckAndAddToResult ignores filtered-out ones), while the traversal itself is unchanged.
+   */
+  const bool filtered = query->Filter() != nullptr;
+  if (filtered) query->CheckAndAddToResult(d, currObj);
+
   IdType nodeId = currNode->getId();
   CHECK_MSG(nodeId < NextNodeId_, "Bug: nodeId (" + ConvertToString(nodeId) +  ") > NextNodeId_ (" +ConvertToString(NextNodeId_) +")");
 
-  visitedBitset[nodeId] = true;
+  vl->markVisited(nodeId);
 
   uint_fast32_t  currElem = 0;
 
@@ -649,14 +607,15 @@ void SmallWorldRand<dist_t>::SearchV1Merge(KNNQuery<dist_t>* query) const {
   vector<QueueItem>& queueData = sortedArr.get_data();
   vector<QueueItem>  itemBuff(8*NN_);
 
-  // efSearch_ is always <= # of elements in the queueData.size() (the size of the BUFFER), but it can be
+  // efSearch is always <= # of elements in the queueData.size() (the size of the BUFFER), but it can be
   // larger than sortedArr.size(), which returns the number of actual elements in the buffer
-  while(currElem < min(sortedArr.size(),efSearch_)){
+  while(currElem < min(sortedArr.size(),efSearch)){
     auto& e = queueData[currElem];
     CHECK(!e.used);
     e.used = true;
     currNode = e.data;
     ++currElem;
+    if (stats) stats->AddHop(0);
 
     for (MSWNode* neighbor : currNode->getAllFriends()) {
       _mm_prefetch(reinterpret_cast<const char*>(const_cast<const Object*>(neighbor->getData())), _MM_HINT_T0);
@@ -676,11 +635,11 @@ void SmallWorldRand<dist_t>::SearchV1Merge(KNNQuery<dist_t>* query) const {
       nodeId = neighbor->getId();
       CHECK_MSG(nodeId < NextNodeId_, "Bug: nodeId (" + ConvertToString(nodeId) +  ") > NextNodeId_ (" +ConvertToString(NextNodeId_));
 
-      if (!visitedBitset[nodeId]) {
+      if (vl->markVisited(nodeId)) {
         currObj = neighbor->getData();
         d = query->DistanceObjLeft(currObj);
-        visitedBitset[nodeId] = true;
-        if (sortedArr.size() < efSearch_ || d < topKey) {
+        if (filtered) query->CheckAndAddToResult(d, currObj);
+        if (sortedArr.size() < efSearch || d < topKey) {
           itemBuff[itemQty++]=QueueItem(d, neighbor);
         }
       }
@@ -713,30 +672,27 @@ void SmallWorldRand<dist_t>::SearchV1Merge(KNNQuery<dist_t>* query) const {
       ++currElem;
   }
 
-  for (uint_fast32_t i = 0; i < query->GetK() && i < sortedArr.size(); ++i) {
+  for (uint_fast32_t i = 0; !filtered && i < query->GetK() && i < sortedArr.size(); ++i) {
     query->CheckAndAddToResult(queueData[i].key, queueData[i].data->getData());
   }
+  visitedListPool_->releaseVisitedList(vl);
 }
 
 
 template <typename dist_t>
-void SmallWorldRand<dist_t>::SearchOld(KNNQuery<dist_t>* query) const {
+void SmallWorldRand<dist_t>::SearchOld(KNNQuery<dist_t>* query, size_t efSearch) const {
 
   if (ElList_.empty()) return;
-  CHECK_MSG(efSearch_ > 0, "efSearch should be > 0");
+  CHECK_MSG(efSearch > 0, "efSearch should be > 0");
 /*
- * The trick of using large dense bitsets instead of unordered_set was
- * borrowed from Wei Dong's kgraph: https://github.com/aaalgo/kgraph
- *
- * This trick works really well even in a multi-threaded mode. Indeed, the amount
- * of allocated memory is small. For example, if one has 8M entries, the size of
- * the bitmap is merely 1 MB. Furthermore, setting 1MB of entries to zero via memset would take only
- * a fraction of millisecond.
+ * Visited lists are taken from the pool: they are arrays (cleared only once in 255 searches)
+ * unless the index is so large that a hash table of the visited nodes is much smaller.
  */
-  vector<bool>                        visitedBitset(NextNodeId_);
+  VisitedList*                        vl = GetVisitedList(efSearch);
 
   MSWNode* provider = pEntryPoint_;
   CHECK_MSG(provider != nullptr, "Bug: there is not entry point set!")
+  QueryStats* stats = query->Stats();
 
   priority_queue <dist_t>                          closestDistQueue; //The set of all elements which distance was calculated
   priority_queue <EvaluatedMSWNodeReverse<dist_t>> candidateQueue; //the set of elements which we can use to evaluate
@@ -751,7 +707,7 @@ void SmallWorldRand<dist_t>::SearchOld(KNNQuery<dist_t>* query) const {
 
   IdType nodeId = provider->getId();
   CHECK_MSG(nodeId < NextNodeId_, "Bug: nodeId (" + ConvertToString(nodeId) +  ") > NextNodeId_ (" +ConvertToString(NextNodeId_) + ")");
-  visitedBitset[nodeId] = true;
+  vl->markVisited(nodeId);
 
   while(!candidateQueue.empty()){
 
@@ -774,19 +730,19 @@ void SmallWorldRand<dist_t>::SearchOld(KNNQuery<dist_t>* query) const {
 
     // Can't access curEv anymore! The reference would become invalid
     candidateQueue.pop();
+    if (stats) stats->AddHop(0);
 
     //calculate distance to each neighbor
     for (auto iter = neighbor.begin(); iter != neighbor.end(); ++iter){
       nodeId = (*iter)->getId();
       CHECK_MSG(nodeId < NextNodeId_, "Bug: nodeId (" + ConvertToString(nodeId) +  ") > NextNodeId_ (" +ConvertToString(NextNodeId_));
-      if (!visitedBitset[nodeId]) {
+      if (vl->markVisited(nodeId)) {
         currObj = (*iter)->getData();
         d = query->DistanceObjLeft(currObj);
-        visitedBitset[nodeId] = true;
 
-        if (closestDistQueue.size() < efSearch_ || d < closestDistQueue.top()) {
+        if (closestDistQueue.size() < efSearch || d < closestDistQueue.top()) {
           closestDistQueue.emplace(d);
-          if (closestDistQueue.size() > efSearch_) {
+          if (closestDistQueue.size() > efSearch) {
             closestDistQueue.pop();
           }
 
@@ -797,6 +753,7 @@ void SmallWorldRand<dist_t>::SearchOld(KNNQuery<dist_t>* query) const {
       }
     }
   }
+  visitedListPool_->releaseVisitedList(vl);
 }
 
 template <typename dist_t>
@@ -914,7 +871,7 @@ void SmallWorldRand<dist_t>::LoadIndex(const string &location) {
 
   pEntryPoint_ = ElList_.empty() ? nullptr : ElList_.begin()->second; 
   CHECK(pEntryPoint_ != nullptr || ElList_.empty());
-  NextNodeId_ = ElList_.size();
+  UpdateNextNodeId(ElList_.size());
 
   LOG(LIB_INFO) << "Next node id: " << NextNodeId_ << " ElList_.size(): " << ElList_.size(); 
 }
@@ -118,7 +118,11 @@ void VPTree<dist_t, SearchOracle>::Search(RangeQuery<dist_t>* query, IdType) con
 template <typename dist_t, typename SearchOracle>
 void VPTree<dist_t, SearchOracle>::Search(KNNQuery<dist_t>* query, IdType) const {
   int mx = MaxLeavesToVisit_;
+  uint64_t distCompQty = query->DistanceComputations();
   root_->GenericSearch(query, mx);
+  // each visited data point (a pivot or a bucket entry) requires exactly one distance computation
+  QueryStats* stats = query->Stats();
+  if (stats) stats->visited_qty += query->DistanceComputations() - distCompQty;
 }
 
 template <typename dist_t, typename SearchOracle>
@@ -247,8 +251,11 @@ VPTree<dist_t, SearchOracle>::VPNode::~VPNode() {
 template <typename dist_t, typename SearchOracle>
 template <typename QueryType>
 void VPTree<dist_t, SearchOracle>::VPNode::GenericSearch(QueryType* query,
-                                                         int& MaxLeavesToVisit) const {
+                                                         int& MaxLeavesToVisit,
+                                                         unsigned level) const {
   if (MaxLeavesToVisit <= 0) return; // early termination
+  QueryStats* stats = query->Stats();
+  if (stats) stats->AddHop(level);
   if (bucket_) {
     --MaxLeavesToVisit;
 
@@ -271,7 +278,7 @@ void VPTree<dist_t, SearchOracle>::VPNode::GenericSearch(QueryType* query,
   if (distQC < mediandist_) {      // the query is inside
     // then first check inside
     if (left_child_ != NULL && oracle_.Classify(distQC, query->Radius(), mediandist_) != kVisitRight)
-       left_child_->GenericSearch(query, MaxLeavesToVisit);
+       left_child_->GenericSearch(query, MaxLeavesToVisit, level + 1);
 
     /* 
      * After potentially visiting the left child, we need to reclassify the node,
@@ -281,11 +288,11 @@ void VPTree<dist_t, SearchOracle>::VPNode::GenericSearch(QueryType* query,
 
     // after that outside
     if (right_child_ != NULL && oracle_.Classify(distQC, query->Radius(), mediandist_) != kVisitLeft)
-       right_child_->GenericSearch(query, MaxLeavesToVisit);
+       right_child_->GenericSearch(query, MaxLeavesToVisit, level + 1);
   } else {                         // the query is outside
     // then first check outside
     if (right_child_ != NULL && oracle_.Classify(distQC, query->Radius(), mediandist_) != kVisitLeft)
-       right_child_->GenericSearch(query, MaxLeavesToVisit);
+       right_child_->GenericSearch(query, MaxLeavesToVisit, level + 1);
 
     /* 
      * After potentially visiting the left child, we need to reclassify the node,
@@ -294,7 +301,7 @@ void VPTree<dist_t, SearchOracle>::VPNode::GenericSearch(QueryType* query,
 
     // after that inside
     if (left_child_ != NULL && oracle_.Classify(distQC, query->Radius(), mediandist_) != kVisitRight)
-      left_child_->GenericSearch(query, MaxLeavesToVisit);
+      left_child_->GenericSearch(query, MaxLeavesToVisit, level + 1);
   }
 }
 
@@ -0,0 +1,182 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#include <algorithm>
+#include <limits>
+#include <random>
+
+#include "pq.h"
+#include "logging.h"
+#include "thread_pool.h"
+#include "utils.h"
+
+namespace similarity {
+
+using std::min;
+using std::numeric_limits;
+
+// Training is deterministic: the same data produce the same centroids
+const unsigned PQ_TRAIN_SEED = 0;
+
+static float SubL2Sqr(const float* pVect1, const float* pVect2, size_t qty) {
+  float res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    float diff = pVect1[i] - pVect2[i];
+    res += diff * diff;
+  }
+  return res;
+}
+
+ProductQuantizer::ProductQuantizer(size_t subQty, size_t centroidQty, size_t trainQty, size_t iterQty) :
+    subQty_(subQty), centroidQty_(centroidQty), trainQty_(trainQty), iterQty_(iterQty) {
+  CHECK_MSG(subQty_ > 0, "The number of PQ subvectors should be positive");
+  CHECK_MSG(centroidQty_ > 0 && centroidQty_ <= 256,
+            "The number of PQ centroids should be from 1 to 256 (one byte per subvector)");
+  CHECK_MSG(trainQty_ > 0, "The number of PQ training vectors should be positive");
+}
+
+void ProductQuantizer::Train(const vector<const float*>& data, size_t dim) {
+  CHECK_MSG(!data.empty(), "Can't train PQ without data");
+  CHECK_MSG(dim >= subQty_, "The number of PQ subvectors (" + ConvertToString(subQty_) +
+                            ") is larger than the dimensionality (" + ConvertToString(dim) + ")");
+  dim_ = dim;
+  subOffset_.resize(subQty_ + 1);
+  for (size_t i = 0; i <= subQty_; ++i) {
+    subOffset_[i] = i * dim / subQty_;
+  }
+
+  std::mt19937 rng(PQ_TRAIN_SEED);
+  // A random sample (without replacement) of training vectors
+  vector<const float*> sample(data);
+  size_t sampleQty = min(trainQty_, sample.size());
+  for (size_t i = 0; i < sampleQty; ++i) {
+    std::uniform_int_distribution<size_t> distr(i, sample.size() - 1);
+    std::swap(sample[i], sample[distr(rng)]);
+  }
+  sample.resize(sampleQty);
+  LOG(LIB_INFO) << "Training PQ: " << subQty_ << " subvectors, " << centroidQty_ << " centroids, "
+                << sampleQty << " training vectors";
+
+  // Centroids are initialized by training vectors (repeated if there are fewer vectors than centroids)
+  centroids_.resize(centroidQty_ * dim_);
+  vector<unsigned> seeds(subQty_);
+  for (size_t sub = 0; sub < subQty_; ++sub) {
+    seeds[sub] = rng();
+    float* c = &centroids_[centroidQty_ * subOffset_[sub]];
+    for (size_t k = 0; k < centroidQty_; ++k, c += subDim(sub)) {
+      const float* pSubVect = sample[k % sampleQty] + subOffset_[sub];
+      std::copy(pSubVect, pSubVect + subDim(sub), c);
+    }
+  }
+
+  // Subspaces are clustered independently (by Lloyd's algorithm)
+  ParallelFor(0, subQty_, 0, [&](size_t sub, size_t threadId) {
+    std::mt19937 subRng(seeds[sub]);
+    const size_t d = subDim(sub);
+    float* centroids = &centroids_[centroidQty_ * subOffset_[sub]];
+    vector<size_t> assign(sampleQty);
+    vector<double> sums(centroidQty_ * d);
+    vector<size_t> counts(centroidQty_);
+
+    for (size_t iter = 0; iter < iterQty_; ++iter) {
+      bool changed = false;
+      for (size_t i = 0; i < sampleQty; ++i) {
+        size_t k = closestCentroid(sub, sample[i] + subOffset_[sub]);
+        changed = changed || k != assign[i];
+        assign[i] = k;
+      }
+      if (!changed && iter > 0) break;
+
+      std::fill(sums.begin(), sums.end(), 0);
+      std::fill(counts.begin(), counts.end(), 0);
+      for (size_t i = 0; i < sampleQty; ++i) {
+        const float* pSubVect = sample[i] + subOffset_[sub];
+        double* s = &sums[assign[i] * d];
+        for (size_t j = 0; j < d; ++j) s[j] += pSubVect[j];
+        counts[assign[i]]++;
+      }
+      std::uniform_int_distribution<size_t> distr(0, sampleQty - 1);
+      for (size_t k = 0; k < centroidQty_; ++k) {
+        float* c = centroids + k * d;
+        if (counts[k]) {
+          for (size_t j = 0; j < d; ++j) c[j] = static_cast<float>(sums[k * d + j] / counts[k]);
+        } else {
+          // An empty cluster gets a new (random) centroid
+          const float* pSubVect = sample[distr(subRng)] + subOffset_[sub];
+          std::copy(pSubVect, pSubVect + d, c);
+        }
+      }
+    }
+  });
+}
+
+size_t ProductQuantizer::closestCentroid(size_t sub, const float* pSubVect) const {
+  const size_t d = subDim(sub);
+  const float* c = &centroids_[centroidQty_ * subOffset_[sub]];
+  size_t best = 0;
+  float bestDist = numeric_limits<float>::max();
+  for (size_t k = 0; k < centroidQty_; ++k, c += d) {
+    float dist = SubL2Sqr(pSubVect, c, d);
+    if (dist < bestDist) {
+      bestDist = dist;
+      best = k;
+    }
+  }
+  return best;
+}
+
+void ProductQuantizer::Encode(const float* pVect, uint8_t* code) const {
+  CHECK_MSG(IsTrained(), "PQ isn't trained");
+  for (size_t sub = 0; sub < subQty_; ++sub) {
+    code[sub] = static_cast<uint8_t>(closestCentroid(sub, pVect + subOffset_[sub]));
+  }
+}
+
+void ProductQuantizer::ComputeDistanceTable(const float* pQuery, vector<float>& table) const {
+  CHECK_MSG(IsTrained(), "PQ isn't trained");
+  table.resize(subQty_ * centroidQty_);
+  float* t = &table[0];
+  for (size_t sub = 0; sub < subQty_; ++sub) {
+    const size_t d = subDim(sub);
+    const float* pSubQuery = pQuery + subOffset_[sub];
+    const float* c = &centroids_[centroidQty_ * subOffset_[sub]];
+    for (size_t k = 0; k < centroidQty_; ++k, c += d) {
+      *t++ = SubL2Sqr(pSubQuery, c, d);
+    }
+  }
+}
+
+void ProductQuantizer::Save(std::ostream& output) const {
+  CHECK_MSG(IsTrained(), "PQ isn't trained");
+  writeBinaryPOD(output, subQty_);
+  writeBinaryPOD(output, centroidQty_);
+  writeBinaryPOD(output, dim_);
+  output.write(reinterpret_cast<const char*>(centroids_.data()), sizeof(float) * centroids_.size());
+}
+
+void ProductQuantizer::Load(std::istream& input) {
+  readBinaryPOD(input, subQty_);
+  readBinaryPOD(input, centroidQty_);
+  readBinaryPOD(input, dim_);
+  CHECK_MSG(subQty_ > 0 && subQty_ <= dim_ && centroidQty_ > 0 && centroidQty_ <= 256,
+            "Invalid PQ parameters");
+  subOffset_.resize(subQty_ + 1);
+  for (size_t i = 0; i <= subQty_; ++i) {
+    subOffset_[i] = i * dim_ / subQty_;
+  }
+  centroids_.resize(centroidQty_ * dim_);
+  input.read(reinterpret_cast<char*>(centroids_.data()), sizeof(float) * centroids_.size());
+}
+
+}  // namespace similarity
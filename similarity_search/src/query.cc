@@ -22,6 +22,26 @@
 
 namespace similarity {
 
+QueryTimeParams QueryTimeParams::FromAnyParams(const AnyParams& params) {
+  AnyParamManager pmgr(params);
+  QueryTimeParams res;
+
+  if (pmgr.hasParam("ef") && pmgr.hasParam("efSearch")) {
+    throw runtime_error("The user shouldn't specify parameters ef and efSearch at the same time (they are synonyms)");
+  }
+  pmgr.GetParamOptional("ef", res.efSearch, 0);
+  pmgr.GetParamOptional("efSearch", res.efSearch, res.efSearch);
+
+  pmgr.GetParamOptional("algoType", res.algoType, "");
+  ToLower(res.algoType);
+  if (!res.algoType.empty() && res.algoType != "old" && res.algoType != "v1merge" && res.algoType != "hybrid") {
+    throw runtime_error("algoType should be one of the following: old, v1merge, hybrid");
+  }
+
+  pmgr.CheckUnused();
+  return res;
+}
+
 template <typename dist_t>
 Query<dist_t>::Query(const Space<dist_t>& space, const Object* query_object)
     : space_(space),
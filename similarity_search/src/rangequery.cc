@@ -67,6 +67,7 @@ void RangeQuery<dist_t>::Reset() {
 template <typename dist_t>
 bool RangeQuery<dist_t>::CheckAndAddToResult(const dist_t distance,
                                              const Object* object) {
+  if (!this->IsAllowed(object)) return false;
   if (distance <= radius_) {
     result_.push_back(object);
     resultDists_.push_back(distance);
@@ -77,6 +78,8 @@ bool RangeQuery<dist_t>::CheckAndAddToResult(const dist_t distance,
 
 template <typename dist_t>
 bool RangeQuery<dist_t>::CheckAndAddToResult(const Object* object) {
+  // there is no need to compute the distance to objects that are filtered out
+  if (!this->IsAllowed(object)) return false;
   // Distance can be asymmetric, but query is on the left side here
   return CheckAndAddToResult(this->DistanceObjLeft(object), object);
 }
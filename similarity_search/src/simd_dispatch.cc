@@ -0,0 +1,1086 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#include <cstdlib>
+#include <cmath>
+#include <string>
+#include <algorithm>
+
+#include "simd_dispatch.h"
+#include "float16.h"
+#include "logging.h"
+
+/*
+ * Kernels for instruction sets that aren't enabled for the whole library are
+ * compiled using target attributes (GCC and Clang) or simply by using the intrinsics
+ * (MSVC permits this). On other platforms, only the plain C++ kernels are available.
+ */
+#if (defined(__x86_64__) || defined(__i386__)) && (defined(__GNUC__) || defined(__clang__))
+#define SIMD_DISPATCH_X86
+#define SIMD_TARGET(t) __attribute__((target(t)))
+#include <immintrin.h>
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_IX86))
+#define SIMD_DISPATCH_X86
+#define SIMD_TARGET(t)
+#include <intrin.h>
+#include <immintrin.h>
+#endif
+
+#define SIMD_TARGET_SSE42   SIMD_TARGET("sse4.2")
+#define SIMD_TARGET_AVX2    SIMD_TARGET("avx2,fma,f16c")
+#define SIMD_TARGET_AVX512  SIMD_TARGET("avx512f,avx512bw")
+
+namespace similarity {
+
+using namespace std;
+
+/*
+ * Plain C++ kernels
+ */
+
+static float L2SqrGeneric(const float* pVect1, const float* pVect2, size_t qty) {
+  float res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    float diff = pVect1[i] - pVect2[i];
+    res += diff * diff;
+  }
+  return res;
+}
+
+static float L1Generic(const float* pVect1, const float* pVect2, size_t qty) {
+  float res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    res += fabs(pVect1[i] - pVect2[i]);
+  }
+  return res;
+}
+
+static float DotGeneric(const float* pVect1, const float* pVect2, size_t qty) {
+  float res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    res += pVect1[i] * pVect2[i];
+  }
+  return res;
+}
+
+static void DotNormsGeneric(const float* pVect1, const float* pVect2, size_t qty,
+                            float& prod, float& sqr1, float& sqr2) {
+  prod = sqr1 = sqr2 = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    prod += pVect1[i] * pVect2[i];
+    sqr1 += pVect1[i] * pVect1[i];
+    sqr2 += pVect2[i] * pVect2[i];
+  }
+}
+
+static int32_t DotUInt8Generic(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  int32_t res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    res += int32_t(pVect1[i]) * int32_t(pVect2[i]);
+  }
+  return res;
+}
+
+static int32_t L2SqrUInt8Generic(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  int32_t res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    int32_t diff = int32_t(pVect1[i]) - int32_t(pVect2[i]);
+    res += diff * diff;
+  }
+  return res;
+}
+
+static float L2SqrFloat16Generic(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty) {
+  float res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    float diff = Float16ToFloat(pVect1[i]) - Float16ToFloat(pVect2[i]);
+    res += diff * diff;
+  }
+  return res;
+}
+
+static float DotFloat16Generic(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty) {
+  float res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    res += Float16ToFloat(pVect1[i]) * Float16ToFloat(pVect2[i]);
+  }
+  return res;
+}
+
+static void DotNormsFloat16Generic(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty,
+                                   float& prod, float& sqr1, float& sqr2) {
+  prod = sqr1 = sqr2 = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    float v1 = Float16ToFloat(pVect1[i]);
+    float v2 = Float16ToFloat(pVect2[i]);
+    prod += v1 * v2;
+    sqr1 += v1 * v1;
+    sqr2 += v2 * v2;
+  }
+}
+
+static int32_t L2SqrInt8Generic(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  int32_t res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    int32_t diff = int32_t(pVect1[i]) - int32_t(pVect2[i]);
+    res += diff * diff;
+  }
+  return res;
+}
+
+static int32_t DotInt8Generic(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  int32_t res = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    res += int32_t(pVect1[i]) * int32_t(pVect2[i]);
+  }
+  return res;
+}
+
+static void DotNormsInt8Generic(const int8_t* pVect1, const int8_t* pVect2, size_t qty,
+                                int32_t& prod, int32_t& sqr1, int32_t& sqr2) {
+  prod = sqr1 = sqr2 = 0;
+  for (size_t i = 0; i < qty; ++i) {
+    int32_t v1 = pVect1[i], v2 = pVect2[i];
+    prod += v1 * v2;
+    sqr1 += v1 * v1;
+    sqr2 += v2 * v2;
+  }
+}
+
+#ifdef SIMD_DISPATCH_X86
+
+/*
+ * SSE kernels (there are no SSE kernels for half-precision numbers,
+ * because converting them requires F16C)
+ */
+
+SIMD_TARGET_SSE42
+static inline float HorizontalSum128(__m128 v) {
+  v = _mm_add_ps(v, _mm_movehl_ps(v, v));
+  v = _mm_add_ss(v, _mm_shuffle_ps(v, v, 1));
+  return _mm_cvtss_f32(v);
+}
+
+SIMD_TARGET_SSE42
+static inline int32_t HorizontalSum128i(__m128i v) {
+  v = _mm_add_epi32(v, _mm_shuffle_epi32(v, _MM_SHUFFLE(1, 0, 3, 2)));
+  v = _mm_add_epi32(v, _mm_shuffle_epi32(v, _MM_SHUFFLE(2, 3, 0, 1)));
+  return _mm_cvtsi128_si32(v);
+}
+
+SIMD_TARGET_SSE42
+static float L2SqrSSE(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(7));
+  const float* pEnd2 = pVect1 + qty;
+
+  __m128 sum1 = _mm_setzero_ps();
+  __m128 sum2 = _mm_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m128 diff1 = _mm_sub_ps(_mm_loadu_ps(pVect1), _mm_loadu_ps(pVect2));
+    __m128 diff2 = _mm_sub_ps(_mm_loadu_ps(pVect1 + 4), _mm_loadu_ps(pVect2 + 4));
+    sum1 = _mm_add_ps(sum1, _mm_mul_ps(diff1, diff1));
+    sum2 = _mm_add_ps(sum2, _mm_mul_ps(diff2, diff2));
+    pVect1 += 8; pVect2 += 8;
+  }
+  float res = HorizontalSum128(_mm_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    float diff = *pVect1++ - *pVect2++;
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_SSE42
+static float L1SSE(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(7));
+  const float* pEnd2 = pVect1 + qty;
+
+  // A hack to quickly unset the sign flag
+  const __m128 mask_sign = _mm_castsi128_ps(_mm_set1_epi32(0x7fffffff));
+  __m128 sum1 = _mm_setzero_ps();
+  __m128 sum2 = _mm_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m128 diff1 = _mm_sub_ps(_mm_loadu_ps(pVect1), _mm_loadu_ps(pVect2));
+    __m128 diff2 = _mm_sub_ps(_mm_loadu_ps(pVect1 + 4), _mm_loadu_ps(pVect2 + 4));
+    sum1 = _mm_add_ps(sum1, _mm_and_ps(diff1, mask_sign));
+    sum2 = _mm_add_ps(sum2, _mm_and_ps(diff2, mask_sign));
+    pVect1 += 8; pVect2 += 8;
+  }
+  float res = HorizontalSum128(_mm_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    res += fabs(*pVect1++ - *pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_SSE42
+static float DotSSE(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(7));
+  const float* pEnd2 = pVect1 + qty;
+
+  __m128 sum1 = _mm_setzero_ps();
+  __m128 sum2 = _mm_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    sum1 = _mm_add_ps(sum1, _mm_mul_ps(_mm_loadu_ps(pVect1), _mm_loadu_ps(pVect2)));
+    sum2 = _mm_add_ps(sum2, _mm_mul_ps(_mm_loadu_ps(pVect1 + 4), _mm_loadu_ps(pVect2 + 4)));
+    pVect1 += 8; pVect2 += 8;
+  }
+  float res = HorizontalSum128(_mm_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    res += (*pVect1++) * (*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_SSE42
+static void DotNormsSSE(const float* pVect1, const float* pVect2, size_t qty,
+                        float& prod, float& sqr1, float& sqr2) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(3));
+  const float* pEnd2 = pVect1 + qty;
+
+  __m128 sum_prod = _mm_setzero_ps();
+  __m128 sum_square1 = _mm_setzero_ps();
+  __m128 sum_square2 = _mm_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m128 v1 = _mm_loadu_ps(pVect1);
+    __m128 v2 = _mm_loadu_ps(pVect2);
+    sum_prod = _mm_add_ps(sum_prod, _mm_mul_ps(v1, v2));
+    sum_square1 = _mm_add_ps(sum_square1, _mm_mul_ps(v1, v1));
+    sum_square2 = _mm_add_ps(sum_square2, _mm_mul_ps(v2, v2));
+    pVect1 += 4; pVect2 += 4;
+  }
+  prod = HorizontalSum128(sum_prod);
+  sqr1 = HorizontalSum128(sum_square1);
+  sqr2 = HorizontalSum128(sum_square2);
+  while (pVect1 < pEnd2) {
+    prod += (*pVect1) * (*pVect2);
+    sqr1 += (*pVect1) * (*pVect1);
+    sqr2 += (*pVect2) * (*pVect2);
+    ++pVect1; ++pVect2;
+  }
+}
+
+SIMD_TARGET_SSE42
+static int32_t DotUInt8SSE(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  const uint8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint8_t* pEnd2 = pVect1 + qty;
+
+  const __m128i zero = _mm_setzero_si128();
+  __m128i sum = zero;
+
+  while (pVect1 < pEnd1) {
+    const __m128i x = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1));
+    const __m128i y = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(_mm_unpackhi_epi8(x, zero), _mm_unpackhi_epi8(y, zero)));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(_mm_unpacklo_epi8(x, zero), _mm_unpacklo_epi8(y, zero)));
+    pVect1 += 16; pVect2 += 16;
+  }
+  int32_t res = HorizontalSum128i(sum);
+  while (pVect1 < pEnd2) {
+    res += int32_t(*pVect1++) * int32_t(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_SSE42
+static int32_t L2SqrUInt8SSE(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  const uint8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint8_t* pEnd2 = pVect1 + qty;
+
+  const __m128i zero = _mm_setzero_si128();
+  __m128i sum = zero;
+
+  while (pVect1 < pEnd1) {
+    const __m128i x = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1));
+    const __m128i y = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2));
+    const __m128i diffHi = _mm_sub_epi16(_mm_unpackhi_epi8(x, zero), _mm_unpackhi_epi8(y, zero));
+    const __m128i diffLo = _mm_sub_epi16(_mm_unpacklo_epi8(x, zero), _mm_unpacklo_epi8(y, zero));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(diffHi, diffHi));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(diffLo, diffLo));
+    pVect1 += 16; pVect2 += 16;
+  }
+  int32_t res = HorizontalSum128i(sum);
+  while (pVect1 < pEnd2) {
+    int32_t diff = int32_t(*pVect1++) - int32_t(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_SSE42
+static int32_t L2SqrInt8SSE(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m128i sum = _mm_setzero_si128();
+
+  while (pVect1 < pEnd1) {
+    const __m128i x = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1));
+    const __m128i y = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2));
+    const __m128i diffLo = _mm_sub_epi16(_mm_cvtepi8_epi16(x), _mm_cvtepi8_epi16(y));
+    const __m128i diffHi = _mm_sub_epi16(_mm_cvtepi8_epi16(_mm_srli_si128(x, 8)),
+                                         _mm_cvtepi8_epi16(_mm_srli_si128(y, 8)));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(diffLo, diffLo));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(diffHi, diffHi));
+    pVect1 += 16; pVect2 += 16;
+  }
+  int32_t res = HorizontalSum128i(sum);
+  while (pVect1 < pEnd2) {
+    int32_t diff = int32_t(*pVect1++) - int32_t(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_SSE42
+static int32_t DotInt8SSE(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m128i sum = _mm_setzero_si128();
+
+  while (pVect1 < pEnd1) {
+    const __m128i x = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1));
+    const __m128i y = _mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(_mm_cvtepi8_epi16(x), _mm_cvtepi8_epi16(y)));
+    sum = _mm_add_epi32(sum, _mm_madd_epi16(_mm_cvtepi8_epi16(_mm_srli_si128(x, 8)),
+                                            _mm_cvtepi8_epi16(_mm_srli_si128(y, 8))));
+    pVect1 += 16; pVect2 += 16;
+  }
+  int32_t res = HorizontalSum128i(sum);
+  while (pVect1 < pEnd2) {
+    res += int32_t(*pVect1++) * int32_t(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_SSE42
+static void DotNormsInt8SSE(const int8_t* pVect1, const int8_t* pVect2, size_t qty,
+                            int32_t& prod, int32_t& sqr1, int32_t& sqr2) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(7));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m128i sum_prod = _mm_setzero_si128();
+  __m128i sum_square1 = _mm_setzero_si128();
+  __m128i sum_square2 = _mm_setzero_si128();
+
+  while (pVect1 < pEnd1) {
+    const __m128i x = _mm_cvtepi8_epi16(_mm_loadl_epi64(reinterpret_cast<const __m128i*>(pVect1)));
+    const __m128i y = _mm_cvtepi8_epi16(_mm_loadl_epi64(reinterpret_cast<const __m128i*>(pVect2)));
+    sum_prod = _mm_add_epi32(sum_prod, _mm_madd_epi16(x, y));
+    sum_square1 = _mm_add_epi32(sum_square1, _mm_madd_epi16(x, x));
+    sum_square2 = _mm_add_epi32(sum_square2, _mm_madd_epi16(y, y));
+    pVect1 += 8; pVect2 += 8;
+  }
+  prod = HorizontalSum128i(sum_prod);
+  sqr1 = HorizontalSum128i(sum_square1);
+  sqr2 = HorizontalSum128i(sum_square2);
+  while (pVect1 < pEnd2) {
+    int32_t v1 = *pVect1++, v2 = *pVect2++;
+    prod += v1 * v2;
+    sqr1 += v1 * v1;
+    sqr2 += v2 * v2;
+  }
+}
+
+/*
+ * AVX2 kernels
+ */
+
+SIMD_TARGET_AVX2
+static inline float HorizontalSum256(__m256 v) {
+  __m128 s = _mm_add_ps(_mm256_castps256_ps128(v), _mm256_extractf128_ps(v, 1));
+  s = _mm_add_ps(s, _mm_movehl_ps(s, s));
+  s = _mm_add_ss(s, _mm_shuffle_ps(s, s, 1));
+  return _mm_cvtss_f32(s);
+}
+
+SIMD_TARGET_AVX2
+static float L2SqrAVX2(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const float* pEnd2 = pVect1 + qty;
+
+  __m256 sum1 = _mm256_setzero_ps();
+  __m256 sum2 = _mm256_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m256 diff1 = _mm256_sub_ps(_mm256_loadu_ps(pVect1), _mm256_loadu_ps(pVect2));
+    __m256 diff2 = _mm256_sub_ps(_mm256_loadu_ps(pVect1 + 8), _mm256_loadu_ps(pVect2 + 8));
+    sum1 = _mm256_fmadd_ps(diff1, diff1, sum1);
+    sum2 = _mm256_fmadd_ps(diff2, diff2, sum2);
+    pVect1 += 16; pVect2 += 16;
+  }
+  float res = HorizontalSum256(_mm256_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    float diff = *pVect1++ - *pVect2++;
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static float L1AVX2(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const float* pEnd2 = pVect1 + qty;
+
+  const __m256 mask_sign = _mm256_castsi256_ps(_mm256_set1_epi32(0x7fffffff));
+  __m256 sum1 = _mm256_setzero_ps();
+  __m256 sum2 = _mm256_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m256 diff1 = _mm256_sub_ps(_mm256_loadu_ps(pVect1), _mm256_loadu_ps(pVect2));
+    __m256 diff2 = _mm256_sub_ps(_mm256_loadu_ps(pVect1 + 8), _mm256_loadu_ps(pVect2 + 8));
+    sum1 = _mm256_add_ps(sum1, _mm256_and_ps(diff1, mask_sign));
+    sum2 = _mm256_add_ps(sum2, _mm256_and_ps(diff2, mask_sign));
+    pVect1 += 16; pVect2 += 16;
+  }
+  float res = HorizontalSum256(_mm256_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    res += fabs(*pVect1++ - *pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static float DotAVX2(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const float* pEnd2 = pVect1 + qty;
+
+  __m256 sum1 = _mm256_setzero_ps();
+  __m256 sum2 = _mm256_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    sum1 = _mm256_fmadd_ps(_mm256_loadu_ps(pVect1), _mm256_loadu_ps(pVect2), sum1);
+    sum2 = _mm256_fmadd_ps(_mm256_loadu_ps(pVect1 + 8), _mm256_loadu_ps(pVect2 + 8), sum2);
+    pVect1 += 16; pVect2 += 16;
+  }
+  float res = HorizontalSum256(_mm256_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    res += (*pVect1++) * (*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static void DotNormsAVX2(const float* pVect1, const float* pVect2, size_t qty,
+                         float& prod, float& sqr1, float& sqr2) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(7));
+  const float* pEnd2 = pVect1 + qty;
+
+  __m256 sum_prod = _mm256_setzero_ps();
+  __m256 sum_square1 = _mm256_setzero_ps();
+  __m256 sum_square2 = _mm256_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m256 v1 = _mm256_loadu_ps(pVect1);
+    __m256 v2 = _mm256_loadu_ps(pVect2);
+    sum_prod = _mm256_fmadd_ps(v1, v2, sum_prod);
+    sum_square1 = _mm256_fmadd_ps(v1, v1, sum_square1);
+    sum_square2 = _mm256_fmadd_ps(v2, v2, sum_square2);
+    pVect1 += 8; pVect2 += 8;
+  }
+  prod = HorizontalSum256(sum_prod);
+  sqr1 = HorizontalSum256(sum_square1);
+  sqr2 = HorizontalSum256(sum_square2);
+  while (pVect1 < pEnd2) {
+    prod += (*pVect1) * (*pVect2);
+    sqr1 += (*pVect1) * (*pVect1);
+    sqr2 += (*pVect2) * (*pVect2);
+    ++pVect1; ++pVect2;
+  }
+}
+
+SIMD_TARGET_AVX2
+static int32_t DotUInt8AVX2(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  const uint8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint8_t* pEnd2 = pVect1 + qty;
+
+  __m256i sum = _mm256_setzero_si256();
+
+  while (pVect1 < pEnd1) {
+    const __m256i x = _mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1)));
+    const __m256i y = _mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2)));
+    sum = _mm256_add_epi32(sum, _mm256_madd_epi16(x, y));
+    pVect1 += 16; pVect2 += 16;
+  }
+  __m128i sum128 = _mm_add_epi32(_mm256_castsi256_si128(sum), _mm256_extracti128_si256(sum, 1));
+  sum128 = _mm_add_epi32(sum128, _mm_shuffle_epi32(sum128, _MM_SHUFFLE(1, 0, 3, 2)));
+  sum128 = _mm_add_epi32(sum128, _mm_shuffle_epi32(sum128, _MM_SHUFFLE(2, 3, 0, 1)));
+  int32_t res = _mm_cvtsi128_si32(sum128);
+  while (pVect1 < pEnd2) {
+    res += int32_t(*pVect1++) * int32_t(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static int32_t L2SqrUInt8AVX2(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  const uint8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint8_t* pEnd2 = pVect1 + qty;
+
+  __m256i sum = _mm256_setzero_si256();
+
+  while (pVect1 < pEnd1) {
+    const __m256i x = _mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1)));
+    const __m256i y = _mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2)));
+    const __m256i diff = _mm256_sub_epi16(x, y);
+    sum = _mm256_add_epi32(sum, _mm256_madd_epi16(diff, diff));
+    pVect1 += 16; pVect2 += 16;
+  }
+  __m128i sum128 = _mm_add_epi32(_mm256_castsi256_si128(sum), _mm256_extracti128_si256(sum, 1));
+  sum128 = _mm_add_epi32(sum128, _mm_shuffle_epi32(sum128, _MM_SHUFFLE(1, 0, 3, 2)));
+  sum128 = _mm_add_epi32(sum128, _mm_shuffle_epi32(sum128, _MM_SHUFFLE(2, 3, 0, 1)));
+  int32_t res = _mm_cvtsi128_si32(sum128);
+  while (pVect1 < pEnd2) {
+    int32_t diff = int32_t(*pVect1++) - int32_t(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static inline int32_t HorizontalSum256i(__m256i v) {
+  return HorizontalSum128i(_mm_add_epi32(_mm256_castsi256_si128(v), _mm256_extracti128_si256(v, 1)));
+}
+
+SIMD_TARGET_AVX2
+static inline __m256 LoadFloat16AVX2(const uint16_t* p) {
+  return _mm256_cvtph_ps(_mm_loadu_si128(reinterpret_cast<const __m128i*>(p)));
+}
+
+SIMD_TARGET_AVX2
+static float L2SqrFloat16AVX2(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty) {
+  const uint16_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint16_t* pEnd2 = pVect1 + qty;
+
+  __m256 sum1 = _mm256_setzero_ps();
+  __m256 sum2 = _mm256_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m256 diff1 = _mm256_sub_ps(LoadFloat16AVX2(pVect1), LoadFloat16AVX2(pVect2));
+    __m256 diff2 = _mm256_sub_ps(LoadFloat16AVX2(pVect1 + 8), LoadFloat16AVX2(pVect2 + 8));
+    sum1 = _mm256_fmadd_ps(diff1, diff1, sum1);
+    sum2 = _mm256_fmadd_ps(diff2, diff2, sum2);
+    pVect1 += 16; pVect2 += 16;
+  }
+  float res = HorizontalSum256(_mm256_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    float diff = Float16ToFloat(*pVect1++) - Float16ToFloat(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static float DotFloat16AVX2(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty) {
+  const uint16_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint16_t* pEnd2 = pVect1 + qty;
+
+  __m256 sum1 = _mm256_setzero_ps();
+  __m256 sum2 = _mm256_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    sum1 = _mm256_fmadd_ps(LoadFloat16AVX2(pVect1), LoadFloat16AVX2(pVect2), sum1);
+    sum2 = _mm256_fmadd_ps(LoadFloat16AVX2(pVect1 + 8), LoadFloat16AVX2(pVect2 + 8), sum2);
+    pVect1 += 16; pVect2 += 16;
+  }
+  float res = HorizontalSum256(_mm256_add_ps(sum1, sum2));
+  while (pVect1 < pEnd2) {
+    res += Float16ToFloat(*pVect1++) * Float16ToFloat(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static void DotNormsFloat16AVX2(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty,
+                                float& prod, float& sqr1, float& sqr2) {
+  const uint16_t* pEnd1 = pVect1 + (qty & ~size_t(7));
+  const uint16_t* pEnd2 = pVect1 + qty;
+
+  __m256 sum_prod = _mm256_setzero_ps();
+  __m256 sum_square1 = _mm256_setzero_ps();
+  __m256 sum_square2 = _mm256_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m256 v1 = LoadFloat16AVX2(pVect1);
+    __m256 v2 = LoadFloat16AVX2(pVect2);
+    sum_prod = _mm256_fmadd_ps(v1, v2, sum_prod);
+    sum_square1 = _mm256_fmadd_ps(v1, v1, sum_square1);
+    sum_square2 = _mm256_fmadd_ps(v2, v2, sum_square2);
+    pVect1 += 8; pVect2 += 8;
+  }
+  prod = HorizontalSum256(sum_prod);
+  sqr1 = HorizontalSum256(sum_square1);
+  sqr2 = HorizontalSum256(sum_square2);
+  while (pVect1 < pEnd2) {
+    float v1 = Float16ToFloat(*pVect1++);
+    float v2 = Float16ToFloat(*pVect2++);
+    prod += v1 * v2;
+    sqr1 += v1 * v1;
+    sqr2 += v2 * v2;
+  }
+}
+
+SIMD_TARGET_AVX2
+static int32_t L2SqrInt8AVX2(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m256i sum = _mm256_setzero_si256();
+
+  while (pVect1 < pEnd1) {
+    const __m256i x = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1)));
+    const __m256i y = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2)));
+    const __m256i diff = _mm256_sub_epi16(x, y);
+    sum = _mm256_add_epi32(sum, _mm256_madd_epi16(diff, diff));
+    pVect1 += 16; pVect2 += 16;
+  }
+  int32_t res = HorizontalSum256i(sum);
+  while (pVect1 < pEnd2) {
+    int32_t diff = int32_t(*pVect1++) - int32_t(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static int32_t DotInt8AVX2(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m256i sum = _mm256_setzero_si256();
+
+  while (pVect1 < pEnd1) {
+    const __m256i x = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1)));
+    const __m256i y = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2)));
+    sum = _mm256_add_epi32(sum, _mm256_madd_epi16(x, y));
+    pVect1 += 16; pVect2 += 16;
+  }
+  int32_t res = HorizontalSum256i(sum);
+  while (pVect1 < pEnd2) {
+    res += int32_t(*pVect1++) * int32_t(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX2
+static void DotNormsInt8AVX2(const int8_t* pVect1, const int8_t* pVect2, size_t qty,
+                             int32_t& prod, int32_t& sqr1, int32_t& sqr2) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m256i sum_prod = _mm256_setzero_si256();
+  __m256i sum_square1 = _mm256_setzero_si256();
+  __m256i sum_square2 = _mm256_setzero_si256();
+
+  while (pVect1 < pEnd1) {
+    const __m256i x = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect1)));
+    const __m256i y = _mm256_cvtepi8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(pVect2)));
+    sum_prod = _mm256_add_epi32(sum_prod, _mm256_madd_epi16(x, y));
+    sum_square1 = _mm256_add_epi32(sum_square1, _mm256_madd_epi16(x, x));
+    sum_square2 = _mm256_add_epi32(sum_square2, _mm256_madd_epi16(y, y));
+    pVect1 += 16; pVect2 += 16;
+  }
+  prod = HorizontalSum256i(sum_prod);
+  sqr1 = HorizontalSum256i(sum_square1);
+  sqr2 = HorizontalSum256i(sum_square2);
+  while (pVect1 < pEnd2) {
+    int32_t v1 = *pVect1++, v2 = *pVect2++;
+    prod += v1 * v2;
+    sqr1 += v1 * v1;
+    sqr2 += v2 * v2;
+  }
+}
+
+/*
+ * AVX-512 kernels: tails of float vectors are processed using masked loads.
+ */
+
+SIMD_TARGET_AVX512
+static float L2SqrAVX512(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(15));
+
+  __m512 sum = _mm512_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m512 diff = _mm512_sub_ps(_mm512_loadu_ps(pVect1), _mm512_loadu_ps(pVect2));
+    sum = _mm512_fmadd_ps(diff, diff, sum);
+    pVect1 += 16; pVect2 += 16;
+  }
+  if (qty & 15) {
+    __mmask16 mask = (__mmask16)((1u << (qty & 15)) - 1);
+    __m512 diff = _mm512_sub_ps(_mm512_maskz_loadu_ps(mask, pVect1), _mm512_maskz_loadu_ps(mask, pVect2));
+    sum = _mm512_fmadd_ps(diff, diff, sum);
+  }
+  return _mm512_reduce_add_ps(sum);
+}
+
+SIMD_TARGET_AVX512
+static float L1AVX512(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(15));
+
+  const __m512i mask_sign = _mm512_set1_epi32(0x7fffffff);
+  __m512 sum = _mm512_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m512 diff = _mm512_sub_ps(_mm512_loadu_ps(pVect1), _mm512_loadu_ps(pVect2));
+    sum = _mm512_add_ps(sum, _mm512_castsi512_ps(_mm512_and_si512(_mm512_castps_si512(diff), mask_sign)));
+    pVect1 += 16; pVect2 += 16;
+  }
+  if (qty & 15) {
+    __mmask16 mask = (__mmask16)((1u << (qty & 15)) - 1);
+    __m512 diff = _mm512_sub_ps(_mm512_maskz_loadu_ps(mask, pVect1), _mm512_maskz_loadu_ps(mask, pVect2));
+    sum = _mm512_add_ps(sum, _mm512_castsi512_ps(_mm512_and_si512(_mm512_castps_si512(diff), mask_sign)));
+  }
+  return _mm512_reduce_add_ps(sum);
+}
+
+SIMD_TARGET_AVX512
+static float DotAVX512(const float* pVect1, const float* pVect2, size_t qty) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(15));
+
+  __m512 sum = _mm512_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    sum = _mm512_fmadd_ps(_mm512_loadu_ps(pVect1), _mm512_loadu_ps(pVect2), sum);
+    pVect1 += 16; pVect2 += 16;
+  }
+  if (qty & 15) {
+    __mmask16 mask = (__mmask16)((1u << (qty & 15)) - 1);
+    sum = _mm512_fmadd_ps(_mm512_maskz_loadu_ps(mask, pVect1), _mm512_maskz_loadu_ps(mask, pVect2), sum);
+  }
+  return _mm512_reduce_add_ps(sum);
+}
+
+SIMD_TARGET_AVX512
+static void DotNormsAVX512(const float* pVect1, const float* pVect2, size_t qty,
+                           float& prod, float& sqr1, float& sqr2) {
+  const float* pEnd1 = pVect1 + (qty & ~size_t(15));
+
+  __m512 sum_prod = _mm512_setzero_ps();
+  __m512 sum_square1 = _mm512_setzero_ps();
+  __m512 sum_square2 = _mm512_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m512 v1 = _mm512_loadu_ps(pVect1);
+    __m512 v2 = _mm512_loadu_ps(pVect2);
+    sum_prod = _mm512_fmadd_ps(v1, v2, sum_prod);
+    sum_square1 = _mm512_fmadd_ps(v1, v1, sum_square1);
+    sum_square2 = _mm512_fmadd_ps(v2, v2, sum_square2);
+    pVect1 += 16; pVect2 += 16;
+  }
+  if (qty & 15) {
+    __mmask16 mask = (__mmask16)((1u << (qty & 15)) - 1);
+    __m512 v1 = _mm512_maskz_loadu_ps(mask, pVect1);
+    __m512 v2 = _mm512_maskz_loadu_ps(mask, pVect2);
+    sum_prod = _mm512_fmadd_ps(v1, v2, sum_prod);
+    sum_square1 = _mm512_fmadd_ps(v1, v1, sum_square1);
+    sum_square2 = _mm512_fmadd_ps(v2, v2, sum_square2);
+  }
+  prod = _mm512_reduce_add_ps(sum_prod);
+  sqr1 = _mm512_reduce_add_ps(sum_square1);
+  sqr2 = _mm512_reduce_add_ps(sum_square2);
+}
+
+SIMD_TARGET_AVX512
+static int32_t DotUInt8AVX512(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  const uint8_t* pEnd1 = pVect1 + (qty & ~size_t(31));
+  const uint8_t* pEnd2 = pVect1 + qty;
+
+  __m512i sum = _mm512_setzero_si512();
+
+  while (pVect1 < pEnd1) {
+    const __m512i x = _mm512_cvtepu8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect1)));
+    const __m512i y = _mm512_cvtepu8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect2)));
+    sum = _mm512_add_epi32(sum, _mm512_madd_epi16(x, y));
+    pVect1 += 32; pVect2 += 32;
+  }
+  int32_t res = _mm512_reduce_add_epi32(sum);
+  while (pVect1 < pEnd2) {
+    res += int32_t(*pVect1++) * int32_t(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX512
+static int32_t L2SqrUInt8AVX512(const uint8_t* pVect1, const uint8_t* pVect2, size_t qty) {
+  const uint8_t* pEnd1 = pVect1 + (qty & ~size_t(31));
+  const uint8_t* pEnd2 = pVect1 + qty;
+
+  __m512i sum = _mm512_setzero_si512();
+
+  while (pVect1 < pEnd1) {
+    const __m512i x = _mm512_cvtepu8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect1)));
+    const __m512i y = _mm512_cvtepu8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect2)));
+    const __m512i diff = _mm512_sub_epi16(x, y);
+    sum = _mm512_add_epi32(sum, _mm512_madd_epi16(diff, diff));
+    pVect1 += 32; pVect2 += 32;
+  }
+  int32_t res = _mm512_reduce_add_epi32(sum);
+  while (pVect1 < pEnd2) {
+    int32_t diff = int32_t(*pVect1++) - int32_t(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX512
+static inline __m512 LoadFloat16AVX512(const uint16_t* p) {
+  return _mm512_cvtph_ps(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(p)));
+}
+
+SIMD_TARGET_AVX512
+static float L2SqrFloat16AVX512(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty) {
+  const uint16_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint16_t* pEnd2 = pVect1 + qty;
+
+  __m512 sum = _mm512_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m512 diff = _mm512_sub_ps(LoadFloat16AVX512(pVect1), LoadFloat16AVX512(pVect2));
+    sum = _mm512_fmadd_ps(diff, diff, sum);
+    pVect1 += 16; pVect2 += 16;
+  }
+  float res = _mm512_reduce_add_ps(sum);
+  while (pVect1 < pEnd2) {
+    float diff = Float16ToFloat(*pVect1++) - Float16ToFloat(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX512
+static float DotFloat16AVX512(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty) {
+  const uint16_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint16_t* pEnd2 = pVect1 + qty;
+
+  __m512 sum = _mm512_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    sum = _mm512_fmadd_ps(LoadFloat16AVX512(pVect1), LoadFloat16AVX512(pVect2), sum);
+    pVect1 += 16; pVect2 += 16;
+  }
+  float res = _mm512_reduce_add_ps(sum);
+  while (pVect1 < pEnd2) {
+    res += Float16ToFloat(*pVect1++) * Float16ToFloat(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX512
+static void DotNormsFloat16AVX512(const uint16_t* pVect1, const uint16_t* pVect2, size_t qty,
+                                  float& prod, float& sqr1, float& sqr2) {
+  const uint16_t* pEnd1 = pVect1 + (qty & ~size_t(15));
+  const uint16_t* pEnd2 = pVect1 + qty;
+
+  __m512 sum_prod = _mm512_setzero_ps();
+  __m512 sum_square1 = _mm512_setzero_ps();
+  __m512 sum_square2 = _mm512_setzero_ps();
+
+  while (pVect1 < pEnd1) {
+    __m512 v1 = LoadFloat16AVX512(pVect1);
+    __m512 v2 = LoadFloat16AVX512(pVect2);
+    sum_prod = _mm512_fmadd_ps(v1, v2, sum_prod);
+    sum_square1 = _mm512_fmadd_ps(v1, v1, sum_square1);
+    sum_square2 = _mm512_fmadd_ps(v2, v2, sum_square2);
+    pVect1 += 16; pVect2 += 16;
+  }
+  prod = _mm512_reduce_add_ps(sum_prod);
+  sqr1 = _mm512_reduce_add_ps(sum_square1);
+  sqr2 = _mm512_reduce_add_ps(sum_square2);
+  while (pVect1 < pEnd2) {
+    float v1 = Float16ToFloat(*pVect1++);
+    float v2 = Float16ToFloat(*pVect2++);
+    prod += v1 * v2;
+    sqr1 += v1 * v1;
+    sqr2 += v2 * v2;
+  }
+}
+
+SIMD_TARGET_AVX512
+static int32_t L2SqrInt8AVX512(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(31));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m512i sum = _mm512_setzero_si512();
+
+  while (pVect1 < pEnd1) {
+    const __m512i x = _mm512_cvtepi8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect1)));
+    const __m512i y = _mm512_cvtepi8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect2)));
+    const __m512i diff = _mm512_sub_epi16(x, y);
+    sum = _mm512_add_epi32(sum, _mm512_madd_epi16(diff, diff));
+    pVect1 += 32; pVect2 += 32;
+  }
+  int32_t res = _mm512_reduce_add_epi32(sum);
+  while (pVect1 < pEnd2) {
+    int32_t diff = int32_t(*pVect1++) - int32_t(*pVect2++);
+    res += diff * diff;
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX512
+static int32_t DotInt8AVX512(const int8_t* pVect1, const int8_t* pVect2, size_t qty) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(31));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m512i sum = _mm512_setzero_si512();
+
+  while (pVect1 < pEnd1) {
+    const __m512i x = _mm512_cvtepi8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect1)));
+    const __m512i y = _mm512_cvtepi8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect2)));
+    sum = _mm512_add_epi32(sum, _mm512_madd_epi16(x, y));
+    pVect1 += 32; pVect2 += 32;
+  }
+  int32_t res = _mm512_reduce_add_epi32(sum);
+  while (pVect1 < pEnd2) {
+    res += int32_t(*pVect1++) * int32_t(*pVect2++);
+  }
+  return res;
+}
+
+SIMD_TARGET_AVX512
+static void DotNormsInt8AVX512(const int8_t* pVect1, const int8_t* pVect2, size_t qty,
+                               int32_t& prod, int32_t& sqr1, int32_t& sqr2) {
+  const int8_t* pEnd1 = pVect1 + (qty & ~size_t(31));
+  const int8_t* pEnd2 = pVect1 + qty;
+
+  __m512i sum_prod = _mm512_setzero_si512();
+  __m512i sum_square1 = _mm512_setzero_si512();
+  __m512i sum_square2 = _mm512_setzero_si512();
+
+  while (pVect1 < pEnd1) {
+    const __m512i x = _mm512_cvtepi8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect1)));
+    const __m512i y = _mm512_cvtepi8_epi16(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(pVect2)));
+    sum_prod = _mm512_add_epi32(sum_prod, _mm512_madd_epi16(x, y));
+    sum_square1 = _mm512_add_epi32(sum_square1, _mm512_madd_epi16(x, x));
+    sum_square2 = _mm512_add_epi32(sum_square2, _mm512_madd_epi16(y, y));
+    pVect1 += 32; pVect2 += 32;
+  }
+  prod = _mm512_reduce_add_epi32(sum_prod);
+  sqr1 = _mm512_reduce_add_epi32(sum_square1);
+  sqr2 = _mm512_reduce_add_epi32(sum_square2);
+  while (pVect1 < pEnd2) {
+    int32_t v1 = *pVect1++, v2 = *pVect2++;
+    prod += v1 * v2;
+    sqr1 += v1 * v1;
+    sqr2 += v2 * v2;
+  }
+}
+
+#endif
+
+/*
+ * Detecting the CPU features
+ */
+
+SIMDLevel GetSupportedSIMDLevel() {
+#if defined(SIMD_DISPATCH_X86) && defined(_MSC_VER)
+  int info[4];
+  __cpuid(info, 0);
+  const int maxLeaf = info[0];
+  __cpuid(info, 1);
+  const bool sse42   = (info[2] & (1 << 20)) != 0;
+  const bool fma     = (info[2] & (1 << 12)) != 0;
+  const bool osxsave = (info[2] & (1 << 27)) != 0;
+  const bool avx     = (info[2] & (1 << 28)) != 0;
+  const bool f16c    = (info[2] & (1 << 29)) != 0;
+  // The OS must save the upper parts of YMM (and ZMM) registers on context switches
+  const unsigned long long xcr0 = osxsave ? _xgetbv(0) : 0;
+  bool avx2 = false, avx512 = false;
+  if (maxLeaf >= 7) {
+    __cpuidex(info, 7, 0);
+    avx2   = avx && fma && f16c && (info[1] & (1 << 5)) != 0 && (xcr0 & 0x6) == 0x6;
+    avx512 = (info[1] & (1 << 16)) != 0 && (info[1] & (1 << 30)) != 0 && (xcr0 & 0xe6) == 0xe6;
+  }
+  if (avx512 && avx2) return kSIMDAVX512;
+  if (avx2) return kSIMDAVX2;
+  if (sse42) return kSIMDSSE42;
+  return kSIMDGeneric;
+#elif defined(SIMD_DISPATCH_X86)
+  __builtin_cpu_init();
+  // This also checks that the OS saves the upper parts of YMM (and ZMM) registers
+  const bool avx2 = __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma") &&
+                    __builtin_cpu_supports("f16c");
+  if (__builtin_cpu_supports("avx512f") && __builtin_cpu_supports("avx512bw") && avx2) return kSIMDAVX512;
+  if (avx2) return kSIMDAVX2;
+  if (__builtin_cpu_supports("sse4.2")) return kSIMDSSE42;
+  return kSIMDGeneric;
+#else
+  return kSIMDGeneric;
+#endif
+}
+
+const char* GetSIMDLevelName(SIMDLevel level) {
+  switch (level) {
+    case kSIMDSSE42:  return "sse4.2";
+    case kSIMDAVX2:   return "avx2";
+    case kSIMDAVX512: return "avx512";
+    default:          return "generic";
+  }
+}
+
+static const DistKernels kDistKernels[] = {
+  {kSIMDGeneric, L2SqrGeneric, L1Generic, DotGeneric, DotNormsGeneric, DotUInt8Generic, L2SqrUInt8Generic,
+                 L2SqrFloat16Generic, DotFloat16Generic, DotNormsFloat16Generic,
+                 L2SqrInt8Generic, DotInt8Generic, DotNormsInt8Generic},
+#ifdef SIMD_DISPATCH_X86
+  {kSIMDSSE42,   L2SqrSSE,     L1SSE,     DotSSE,     DotNormsSSE,     DotUInt8SSE,     L2SqrUInt8SSE,
+                 L2SqrFloat16Generic, DotFloat16Generic, DotNormsFloat16Generic,
+                 L2SqrInt8SSE, DotInt8SSE, DotNormsInt8SSE},
+  {kSIMDAVX2,    L2SqrAVX2,    L1AVX2,    DotAVX2,    DotNormsAVX2,    DotUInt8AVX2,    L2SqrUInt8AVX2,
+                 L2SqrFloat16AVX2, DotFloat16AVX2, DotNormsFloat16AVX2,
+                 L2SqrInt8AVX2, DotInt8AVX2, DotNormsInt8AVX2},
+  {kSIMDAVX512,  L2SqrAVX512,  L1AVX512,  DotAVX512,  DotNormsAVX512,  DotUInt8AVX512,  L2SqrUInt8AVX512,
+                 L2SqrFloat16AVX512, DotFloat16AVX512, DotNormsFloat16AVX512,
+                 L2SqrInt8AVX512, DotInt8AVX512, DotNormsInt8AVX512},
+#endif
+};
+
+const DistKernels& GetDistKernels(SIMDLevel level) {
+  level = min(level, GetSupportedSIMDLevel());
+  return kDistKernels[level];
+}
+
+static SIMDLevel SelectSIMDLevel() {
+  SIMDLevel level = GetSupportedSIMDLevel();
+  const char* pEnv = getenv("NMSLIB_SIMD");
+  if (pEnv != nullptr && *pEnv) {
+    string name(pEnv);
+    transform(name.begin(), name.end(), name.begin(), ::tolower);
+    bool found = false;
+    for (int l = kSIMDGeneric; l <= kSIMDAVX512; ++l) {
+      if (name == GetSIMDLevelName(SIMDLevel(l))) {
+        level = min(level, SIMDLevel(l));
+        found = true;
+      }
+    }
+    if (!found) {
+      LOG(LIB_WARNING) << "Ignoring unknown value of NMSLIB_SIMD: '" << pEnv << "'";
+    }
+  }
+  return level;
+}
+
+const DistKernels& GetDistKernels() {
+  // Thread-safe in C++11
+  static const DistKernels& kernels = GetDistKernels(SelectSIMDLevel());
+  return kernels;
+}
+
+}  // namespace similarity
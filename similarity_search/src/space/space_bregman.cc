@@ -151,6 +151,14 @@ Object* KLDivGenFast<dist_t>::CreateObjFromVect(IdType id, LabelType label, cons
   return new Object(id, label, temp.size() * sizeof(dist_t), &temp[0]);
 }
 
+template <typename dist_t>
+void KLDivGenFast<dist_t>::CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const {
+  dist_t* pDst = reinterpret_cast<dist_t*>(pData);
+  memcpy(pDst, pVect, elemQty * sizeof(dist_t));
+  // Compute logarithms
+  PrecompLogarithms(pDst, elemQty);
+}
+
 
 //=============================================================
 
@@ -235,6 +243,14 @@ Object* ItakuraSaitoFast<dist_t>::CreateObjFromVect(IdType id, LabelType label,
   return new Object(id, label, temp.size() * sizeof(dist_t), &temp[0]);
 }
 
+template <typename dist_t>
+void ItakuraSaitoFast<dist_t>::CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const {
+  dist_t* pDst = reinterpret_cast<dist_t*>(pData);
+  memcpy(pDst, pVect, elemQty * sizeof(dist_t));
+  // Compute logarithms
+  PrecompLogarithms(pDst, elemQty);
+}
+
 //=============================================================
 
 template <typename dist_t>
@@ -277,6 +293,14 @@ Object* KLDivGenFastRightQuery<dist_t>::CreateObjFromVect(IdType id, LabelType l
   return new Object(id, label, temp.size() * sizeof(dist_t), &temp[0]);
 }
 
+template <typename dist_t>
+void KLDivGenFastRightQuery<dist_t>::CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const {
+  dist_t* pDst = reinterpret_cast<dist_t*>(pData);
+  memcpy(pDst, pVect, elemQty * sizeof(dist_t));
+  // Compute logarithms
+  PrecompLogarithms(pDst, elemQty);
+}
+
 //=============================================================
 
 template <typename dist_t>
@@ -302,6 +326,14 @@ Object* KLDivFast<dist_t>::CreateObjFromVect(IdType id, LabelType label, const s
   return new Object(id, label, temp.size() * sizeof(dist_t), &temp[0]);
 }
 
+template <typename dist_t>
+void KLDivFast<dist_t>::CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const {
+  dist_t* pDst = reinterpret_cast<dist_t*>(pData);
+  memcpy(pDst, pVect, elemQty * sizeof(dist_t));
+  // Compute logarithms
+  PrecompLogarithms(pDst, elemQty);
+}
+
 //=============================================================
 
 template <typename dist_t>
@@ -327,6 +359,14 @@ Object* KLDivFastRightQuery<dist_t>::CreateObjFromVect(IdType id, LabelType labe
   return new Object(id, label, temp.size() * sizeof(dist_t), &temp[0]);
 }
 
+template <typename dist_t>
+void KLDivFastRightQuery<dist_t>::CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const {
+  dist_t* pDst = reinterpret_cast<dist_t*>(pData);
+  memcpy(pDst, pVect, elemQty * sizeof(dist_t));
+  // Compute logarithms
+  PrecompLogarithms(pDst, elemQty);
+}
+
 template class BregmanDiv<float>;
 template class BregmanDiv<double>;
 template class KLDivAbstract<float>;
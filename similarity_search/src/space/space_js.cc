@@ -38,6 +38,16 @@ Object* SpaceJSBase<dist_t>::CreateObjFromVect(IdType id, LabelType label, const
   return new Object(id, label, temp.size() * sizeof(dist_t), &temp[0]);
 }
 
+template <typename dist_t>
+void SpaceJSBase<dist_t>::CreateObjDataFromVect(const dist_t* pVect, size_t elemQty, char* pData) const {
+  dist_t* pDst = reinterpret_cast<dist_t*>(pData);
+  memcpy(pDst, pVect, elemQty * sizeof(dist_t));
+  if (type_ != kJSSlow) {
+    // Compute logarithms
+    PrecompLogarithms(pDst, elemQty);
+  }
+}
+
 
 template <typename dist_t>
 dist_t SpaceJSBase<dist_t>::JensenShannonFunc(const Object* obj1, const Object* obj2) const {
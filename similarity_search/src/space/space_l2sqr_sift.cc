@@ -138,15 +138,19 @@ SpaceL2SqrSift::CreateObjFromUint8Vect(IdType id, LabelType label, const vector<
   CHECK_MSG(InpVect.size() == SIFT_DIM, 
            "Bug or internal error, SIFT vectors dim " + ConvertToString(InpVect.size()) + 
            " isn't == " + ConvertToString(SIFT_DIM));
+  unique_ptr<Object> res(new Object(id, label, GetObjDataLength(), NULL));
+  CreateObjDataFromUint8Vect(&InpVect[0], res->data());
+  return res.release();
+}
+
+void
+SpaceL2SqrSift::CreateObjDataFromUint8Vect(const uint8_t* pVect, char* pData) const {
   DistTypeSIFT sum = 0;
   // We precompute and memorize the sum
-  for (DistTypeSIFT e : InpVect) 
-    sum += e * e;
-  unique_ptr<Object> res(new Object(id, label, SIFT_DIM + sizeof(DistTypeSIFT), 
-                                               &InpVect[0]));
-
-  *reinterpret_cast<DistTypeSIFT*>(res->data() + SIFT_DIM) = sum;
-  return res.release();
+  for (unsigned i = 0; i < SIFT_DIM; ++i)
+    sum += DistTypeSIFT(pVect[i]) * pVect[i];
+  memcpy(pData, pVect, SIFT_DIM);
+  *reinterpret_cast<DistTypeSIFT*>(pData + SIFT_DIM) = sum;
 }
 
 void 
@@ -41,6 +41,37 @@ std::string SpaceLp<dist_t>::StrDesc() const {
   return stream.str();
 }
 
+template <typename dist_t>
+static dist_t FlatL1Distance(const char* pData1, const char* pData2, size_t dataLength) {
+  return L1NormSIMD(reinterpret_cast<const dist_t*>(pData1), reinterpret_cast<const dist_t*>(pData2),
+                    dataLength / sizeof(dist_t));
+}
+
+template <typename dist_t>
+static dist_t FlatL2Distance(const char* pData1, const char* pData2, size_t dataLength) {
+  return L2NormSIMD(reinterpret_cast<const dist_t*>(pData1), reinterpret_cast<const dist_t*>(pData2),
+                    dataLength / sizeof(dist_t));
+}
+
+template <typename dist_t>
+static dist_t FlatLInfDistance(const char* pData1, const char* pData2, size_t dataLength) {
+  return LInfNormSIMD(reinterpret_cast<const dist_t*>(pData1), reinterpret_cast<const dist_t*>(pData2),
+                      dataLength / sizeof(dist_t));
+}
+
+template <typename dist_t>
+FlatDistFunc<dist_t> SpaceLp<dist_t>::GetFlatDistFunc() const {
+  // Only distances with custom implementations are computed by simple functions
+  if (distObj_.getCustom()) {
+    switch (static_cast<int>(distObj_.getP())) {
+      case 1:  return FlatDistFunc<dist_t>(kFlatDistL1, FlatL1Distance<dist_t>);
+      case 2:  return FlatDistFunc<dist_t>(kFlatDistL2, FlatL2Distance<dist_t>);
+      case -1: return FlatDistFunc<dist_t>(kFlatDistLInf, FlatLInfDistance<dist_t>);
+    }
+  }
+  return FlatDistFunc<dist_t>();
+}
+
 template class SpaceLp<float>;
 template class SpaceLp<double>;
 
@@ -38,6 +38,17 @@ dist_t SpaceCosineSimilarity<dist_t>::HiddenDistance(const Object* obj1, const O
   return val;
 }
 
+template <typename dist_t>
+static dist_t FlatCosineDistance(const char* pData1, const char* pData2, size_t dataLength) {
+  return CosineSimilarity(reinterpret_cast<const dist_t*>(pData1), reinterpret_cast<const dist_t*>(pData2),
+                          dataLength / sizeof(dist_t));
+}
+
+template <typename dist_t>
+FlatDistFunc<dist_t> SpaceCosineSimilarity<dist_t>::GetFlatDistFunc() const {
+  return FlatDistFunc<dist_t>(kFlatDistCosine, FlatCosineDistance<dist_t>);
+}
+
 template class SpaceCosineSimilarity<float>;
 template class SpaceCosineSimilarity<double>;
 
@@ -69,6 +80,17 @@ dist_t SpaceNegativeScalarProduct<dist_t>::HiddenDistance(const Object* obj1, co
   return -ScalarProductSIMD(x, y, length);
 }
 
+template <typename dist_t>
+static dist_t FlatNegativeScalarProduct(const char* pData1, const char* pData2, size_t dataLength) {
+  return -ScalarProductSIMD(reinterpret_cast<const dist_t*>(pData1), reinterpret_cast<const dist_t*>(pData2),
+                            dataLength / sizeof(dist_t));
+}
+
+template <typename dist_t>
+FlatDistFunc<dist_t> SpaceNegativeScalarProduct<dist_t>::GetFlatDistFunc() const {
+  return FlatDistFunc<dist_t>(kFlatDistNegDotProd, FlatNegativeScalarProduct<dist_t>);
+}
+
 template class SpaceNegativeScalarProduct<float>;
 template class SpaceNegativeScalarProduct<double>;
 
@@ -0,0 +1,94 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#include <sstream>
+#include <string>
+#include <memory>
+#include <iomanip>
+#include <limits>
+
+#include "object.h"
+#include "utils.h"
+#include "logging.h"
+#include "space/space_vector_lowprec.h"
+
+namespace similarity {
+
+using namespace std;
+
+template <typename ElemType>
+string SpaceLowPrecVector<ElemType>::StrDesc() const {
+  static const char* distNames[] = {"l2", "cosinesimil", "negdotprod"};
+  return string(distNames[distKind_]) + "_" + LowPrecTraits<ElemType>::Name();
+}
+
+template <typename ElemType>
+bool SpaceLowPrecVector<ElemType>::ApproxEqual(const Object& obj1, const Object& obj2) const {
+  const size_t len1 = GetElemQty(&obj1);
+  const size_t len2 = GetElemQty(&obj2);
+  if (len1 != len2) {
+    PREPARE_RUNTIME_ERR(err) << "Bug: comparing vectors of different lengths: " << len1 << " and " << len2;
+    THROW_RUNTIME_ERR(err);
+  }
+  // Elements are compared exactly
+  return memcmp(obj1.data(), obj2.data(), len1 * sizeof(ElemType)) == 0;
+}
+
+template <typename ElemType>
+string SpaceLowPrecVector<ElemType>::CreateStrFromObj(const Object* pObj, const string& externId /* ignored */) const {
+  stringstream out;
+  const ElemType* p = reinterpret_cast<const ElemType*>(pObj->data());
+  const size_t length = GetElemQty(pObj);
+  for (size_t i = 0; i < length; ++i) {
+    if (i) out << " ";
+    out.unsetf(ios_base::floatfield);
+    out << setprecision(numeric_limits<float>::max_digits10) << noshowpoint << Traits::ToFloat(p[i]);
+  }
+
+  return out.str();
+}
+
+template <typename ElemType>
+Object* SpaceLowPrecVector<ElemType>::CreateObjFromVect(IdType id, LabelType label, const vector<float>& InpVect) const {
+  unique_ptr<Object> res(new Object(id, label, GetObjDataLength(InpVect.size()), NULL));
+  CreateObjDataFromVect(InpVect.data(), InpVect.size(), res->data());
+  return res.release();
+}
+
+template <typename ElemType>
+void SpaceLowPrecVector<ElemType>::CreateObjDataFromVect(const float* pVect, size_t elemQty, char* pData) const {
+  ElemType* pDst = reinterpret_cast<ElemType*>(pData);
+  for (size_t i = 0; i < elemQty; ++i) {
+    pDst[i] = Traits::FromFloat(pVect[i]);
+  }
+}
+
+template <typename ElemType>
+void SpaceLowPrecVector<ElemType>::CreateDenseVectFromObj(const Object* obj, float* pVect, size_t nElem) const {
+  const ElemType* pSrc = reinterpret_cast<const ElemType*>(obj->data());
+  const size_t len = GetElemQty(obj);
+  if (nElem > len) {
+    PREPARE_RUNTIME_ERR(err) << __func__ << " The number of requested elements "
+                             << nElem << " is larger than the actual number of elements " << len;
+    THROW_RUNTIME_ERR(err);
+  }
+  for (size_t i = 0; i < nElem; ++i) {
+    pVect[i] = Traits::ToFloat(pSrc[i]);
+  }
+}
+
+template class SpaceLowPrecVector<Float16>;
+template class SpaceLowPrecVector<int8_t>;
+
+}  // namespace similarity
@@ -32,6 +32,8 @@
 #include "space/space_scalar.h"
 #include "testdataset.h"
 #include "distcomp.h"
+#include "simd_dispatch.h"
+#include "float16.h"
 #include "genrand_vect.h"
 #include "permutation_utils.h"
 #include "ztimer.h"
@@ -291,6 +293,80 @@ bool TestL1Agree(size_t N, size_t dim, size_t Rep) {
     return true;
 }
 
+// Kernels for all SIMD levels supported by the CPU should agree with the plain C++ ones
+bool TestSIMDDispatchAgree(size_t N, size_t dim, size_t Rep) {
+    vector<float> vect1(dim), vect2(dim);
+    vector<uint8_t> vectByte1(dim), vectByte2(dim);
+    vector<int8_t> vectInt81(dim), vectInt82(dim);
+    vector<Float16> vectHalf1(dim), vectHalf2(dim);
+    float* pVect1 = &vect1[0];
+    float* pVect2 = &vect2[0];
+
+    const DistKernels& generic = GetDistKernels(kSIMDGeneric);
+
+    for (size_t i = 0; i < Rep; ++i) {
+        for (size_t j = 1; j < N; ++j) {
+            GenRandVect(pVect1, dim, -RANGE, RANGE);
+            GenRandVect(pVect2, dim, -RANGE, RANGE);
+            for (size_t k = 0; k < dim; ++k) {
+                vectByte1[k] = RandomInt() % 256;
+                vectByte2[k] = RandomInt() % 256;
+                vectInt81[k] = static_cast<int8_t>(RandomInt() % 256 - 128);
+                vectInt82[k] = static_cast<int8_t>(RandomInt() % 256 - 128);
+                vectHalf1[k] = FloatToFloat16(vect1[k]);
+                vectHalf2[k] = FloatToFloat16(vect2[k]);
+            }
+
+            for (int level = kSIMDSSE42; level <= GetSupportedSIMDLevel(); ++level) {
+                const DistKernels& kernels = GetDistKernels(SIMDLevel(level));
+                float prod1, sqr11, sqr21, prod2, sqr12, sqr22;
+                generic.DotNorms(pVect1, pVect2, dim, prod1, sqr11, sqr21);
+                kernels.DotNorms(pVect1, pVect2, dim, prod2, sqr12, sqr22);
+
+                float hprod1, hsqr11, hsqr21, hprod2, hsqr12, hsqr22;
+                generic.DotNormsFloat16(&vectHalf1[0], &vectHalf2[0], dim, hprod1, hsqr11, hsqr21);
+                kernels.DotNormsFloat16(&vectHalf1[0], &vectHalf2[0], dim, hprod2, hsqr12, hsqr22);
+
+                vector<pair<float, float>> vals = {
+                  {generic.L2Sqr(pVect1, pVect2, dim), kernels.L2Sqr(pVect1, pVect2, dim)},
+                  {generic.L1(pVect1, pVect2, dim), kernels.L1(pVect1, pVect2, dim)},
+                  {generic.Dot(pVect1, pVect2, dim), kernels.Dot(pVect1, pVect2, dim)},
+                  {prod1, prod2}, {sqr11, sqr12}, {sqr21, sqr22},
+                  {generic.L2SqrFloat16(&vectHalf1[0], &vectHalf2[0], dim),
+                   kernels.L2SqrFloat16(&vectHalf1[0], &vectHalf2[0], dim)},
+                  {generic.DotFloat16(&vectHalf1[0], &vectHalf2[0], dim),
+                   kernels.DotFloat16(&vectHalf1[0], &vectHalf2[0], dim)},
+                  {hprod1, hprod2}, {hsqr11, hsqr12}, {hsqr21, hsqr22}
+                };
+                bool bug = false;
+                for (const auto& v : vals) {
+                    float diff = fabs(v.first - v.second);
+                    if (diff > 1e-4f * max(fabs(v.first), 1.0f)) bug = true;
+                }
+                if (generic.DotUInt8(&vectByte1[0], &vectByte2[0], dim) !=
+                    kernels.DotUInt8(&vectByte1[0], &vectByte2[0], dim)) bug = true;
+                if (generic.L2SqrUInt8(&vectByte1[0], &vectByte2[0], dim) !=
+                    kernels.L2SqrUInt8(&vectByte1[0], &vectByte2[0], dim)) bug = true;
+                if (generic.DotInt8(&vectInt81[0], &vectInt82[0], dim) !=
+                    kernels.DotInt8(&vectInt81[0], &vectInt82[0], dim)) bug = true;
+                if (generic.L2SqrInt8(&vectInt81[0], &vectInt82[0], dim) !=
+                    kernels.L2SqrInt8(&vectInt81[0], &vectInt82[0], dim)) bug = true;
+                int32_t iprod1, isqr11, isqr21, iprod2, isqr12, isqr22;
+                generic.DotNormsInt8(&vectInt81[0], &vectInt82[0], dim, iprod1, isqr11, isqr21);
+                kernels.DotNormsInt8(&vectInt81[0], &vectInt82[0], dim, iprod2, isqr12, isqr22);
+                if (iprod1 != iprod2 || isqr11 != isqr12 || isqr21 != isqr22) bug = true;
+                if (bug) {
+                    cerr << "Bug SIMD dispatch !!! Dim = " << dim << " level = "
+                         << GetSIMDLevelName(SIMDLevel(level)) << endl;
+                    return false;
+                }
+            }
+        }
+    }
+
+    return true;
+}
+
 template <class T>
 bool TestL2Agree(size_t N, size_t dim, size_t Rep) {
     vector<T> vect1(dim), vect2(dim);
@@ -1198,6 +1274,9 @@ TEST(TestAgree) {
         nTest++;
         nFail += !TestL2Agree<double>(1024, dim, 10);
 
+        nTest++;
+        nFail += !TestSIMDDispatchAgree(1024, dim, 10);
+
         nTest++;
         nFail += !TestKLAgree<float>(1024, dim, 10);
         nTest++;
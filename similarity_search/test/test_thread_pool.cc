@@ -43,4 +43,34 @@ TEST(TestParallelForException) {
   }
   EXPECT_EQ(has_thrown, true);
 }
+
+TEST(TestParallelForNested) {
+  // nested calls must not deadlock even if all pool threads are busy
+  std::vector<std::vector<size_t>> products(64, std::vector<size_t>(64));
+  ParallelFor(0, products.size(), 0, [&](int i, int threadId) {
+    ParallelFor(0, products[i].size(), 0, [&](int j, int threadId) {
+      products[i][j] = i * j;
+    });
+  });
+  for (size_t i = 0; i < products.size(); ++i) {
+    for (size_t j = 0; j < products[i].size(); ++j) {
+      EXPECT_EQ(products[i][j], i * j);
+    }
+  }
+}
+
+TEST(TestParallelForPoolSize) {
+  size_t origSize = GetThreadPoolSize();
+  SetThreadPoolSize(3);
+  EXPECT_EQ(GetThreadPoolSize(), static_cast<size_t>(3));
+
+  std::vector<int> threadIds(1000);
+  ParallelFor(0, threadIds.size(), 0, [&](int id, int threadId) {
+    threadIds[id] = threadId;
+  });
+  for (int threadId : threadIds) {
+    EXPECT_EQ(threadId >= 0 && threadId < 3, true);
+  }
+  SetThreadPoolSize(origSize);
+}
 }  // namespace similarity
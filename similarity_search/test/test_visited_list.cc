@@ -0,0 +1,79 @@
+/**
+ * Non-metric Space Library
+ *
+ * Main developers: Bilegsaikhan Naidan, Leonid Boytsov, Yury Malkov, Ben Frederickson, David Novak
+ *
+ * For the complete list of contributors and further details see:
+ * https://github.com/searchivarius/NonMetricSpaceLib
+ *
+ * Copyright (c) 2013-2018
+ *
+ * This code is released under the
+ * Apache License Version 2.0 http://www.apache.org/licenses/.
+ *
+ */
+#include <atomic>
+#include <thread>
+#include <vector>
+
+#include "logging.h"
+#include "bunit.h"
+#include "method/visited_list.h"
+
+namespace similarity {
+
+TEST(TestVisitedListHash) {
+  VisitedList vl(1000000, 16);
+  EXPECT_EQ(vl.isHash(), true);
+  for (int iter = 0; iter < 3; ++iter) {
+    vl.reset();
+    // Enough elements to make the table grow several times
+    for (IdTypeUnsign id = 0; id < 1000; ++id) {
+      EXPECT_EQ(vl.markVisited(id * 997), true);
+    }
+    for (IdTypeUnsign id = 0; id < 1000; ++id) {
+      EXPECT_EQ(vl.isVisited(id * 997), true);
+      EXPECT_EQ(vl.markVisited(id * 997), false);
+      EXPECT_EQ(vl.isVisited(id * 997 + 1), false);
+    }
+  }
+}
+
+TEST(TestVisitedListPoolBounded) {
+  const size_t maxPoolSize = 2;
+  const size_t threadQty = 4 * maxPoolSize;
+  const int elemQty = 100000;
+
+  VisitedListPool pool(elemQty, maxPoolSize);
+
+  for (int round = 0; round < 5; ++round) {
+    std::atomic<size_t> heldQty(0);
+    std::atomic<size_t> errQty(0);
+    std::vector<std::thread> threads;
+    for (size_t t = 0; t < threadQty; ++t) {
+      threads.emplace_back([&, t]() {
+        VisitedList *vl = pool.getFreeVisitedList();
+        // Make sure that all searches hold their lists at the same time
+        ++heldQty;
+        while (heldQty < threadQty) {
+          std::this_thread::yield();
+        }
+        for (IdTypeUnsign id = t; id < elemQty; id += 1000) {
+          if (!vl->markVisited(id) || !vl->isVisited(id) || vl->isVisited(id + 1)) {
+            ++errQty;
+          }
+        }
+        pool.releaseVisitedList(vl);
+      });
+    }
+    for (auto &thread : threads) {
+      thread.join();
+    }
+    EXPECT_EQ(errQty.load(), static_cast<size_t>(0));
+    // No more arrays than the cap and no new lists after the first round
+    EXPECT_EQ(pool.getArrayQty(), maxPoolSize);
+    EXPECT_EQ(pool.getListQty(), threadQty);
+  }
+}
+
+}  // namespace similarity